@@ -0,0 +1,5 @@
+import datetime as _datetime
+
+UTC = getattr(_datetime, "UTC", _datetime.timezone.utc)
+
+__all__ = ["UTC"]
@@ -0,0 +1,2607 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Sequence
+from importlib import import_module
+from typing import cast
+
+from .apiget_dispatch import run_apiget_with_cassette
+from .argv_flags import extract_global_flag
+from .baseline_dispatch import run_baseline
+from .cli_shortcuts import dispatch_preparse_shortcut
+from .cli_timing import emit_cli_startup_snapshot, emit_cli_timing, loaded_module_count
+from .core_preparse_dispatch import dispatch_core_preparse
+from .help_surface import filter_hidden_subcommands, hide_help_subcommands
+from .inspect_compare_forwarding import build_inspect_compare_forwarded_args
+from .inspect_forwarding import build_inspect_forwarded_args
+from .inspect_project_forwarding import build_inspect_project_forwarded_args
+from .legacy_commands import (
+    LEGACY_COMMAND_MODULES as _LEGACY_COMMAND_MODULES,
+)
+from .legacy_commands import (
+    LEGACY_NAMESPACE_COMMANDS as _LEGACY_NAMESPACE_COMMANDS,
+)
+from .legacy_namespace import handle_legacy_namespace
+from .parsed_shortcuts import dispatch_parsed_shortcut
+from .parser_helpers import add_passthrough_subcommand as _add_passthrough_subcommand
+from .playbook_aliases import resolve_non_day_playbook_alias
+from .public_surface_contract import render_root_help_groups
+from .release_dispatch import dispatch_release_subcommand
+from .repo_init_forwarding import build_repo_init_forwarded_args
+from .review_forwarding import build_review_forwarded_args
+from .serve_forwarding import build_serve_args
+from .versioning import tool_version
+
+# Backward-compatible alias used by tests and downstream monkeypatching.
+_resolve_non_day_playbook_alias = resolve_non_day_playbook_alias
+LEGACY_COMMAND_MODULES = _LEGACY_COMMAND_MODULES
+LEGACY_NAMESPACE_COMMANDS = _LEGACY_NAMESPACE_COMMANDS
+
+__all__ = [
+    "_resolve_non_day_playbook_alias",
+    "LEGACY_COMMAND_MODULES",
+    "LEGACY_NAMESPACE_COMMANDS",
+]
+
+_COMPAT_MODULE_ATTRS: dict[str, str] = {
+    "expansion_automation": "sdetkit.expansion_automation",
+    "optimization_foundation": "sdetkit.optimization_foundation",
+    "acceleration": "sdetkit.acceleration",
+    "scale": "sdetkit.scale",
+    "expansion": "sdetkit.expansion",
+    "optimization": "sdetkit.optimization",
+    "reliability": "sdetkit.reliability",
+    "objection_handling": "sdetkit.objection_handling",
+    "weekly_review": "sdetkit.weekly_review",
+    "execution_prioritization": "sdetkit.execution_prioritization",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _COMPAT_MODULE_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(name)
+    module = import_module(module_name)
+    globals()[name] = module
+    return module
+
+
+def _add_apiget_args(p: argparse.ArgumentParser) -> None:
+    apiget_module = import_module("sdetkit.apiget")
+    apiget_module._add_apiget_args(p)
+
+    p.add_argument("--cassette", default=None, help="Cassette file path (enables record/replay).")
+    p.add_argument(
+        "--cassette-mode",
+        choices=["auto", "record", "replay"],
+        default=None,
+        help="Cassette mode: auto, record, or replay.",
+    )
+
+
+def _run_module_main(module_name: str, args: Sequence[str]) -> int:
+    started = time.perf_counter()
+    arg_list = list(args)
+    module = import_module(module_name)
+    rc = cast(int, module.main(arg_list))
+    emit_cli_timing(
+        f"event=dispatch module={module_name} argc={len(arg_list)} elapsed_ms={(time.perf_counter() - started) * 1000.0:.3f} modules_loaded={loaded_module_count()}"
+    )
+    return rc
+
+
+def _build_root_parser(
+    *, show_hidden_commands: bool = False
+) -> tuple[argparse.ArgumentParser, object]:
+    started = time.perf_counter()
+    help_description = """\
+DevS69 SDETKit is an operator-grade SDET platform for deterministic release confidence
+and shipping readiness.
+
+Policy tiers: Public / stable, Advanced but supported, Experimental / incubator.
+
+Start here (canonical release-confidence path):
+  1) [Public / stable] python -m sdetkit gate fast
+  2) [Public / stable] python -m sdetkit gate release
+  3) [Public / stable] python -m sdetkit doctor
+
+Then use stability-aware command discovery:
+  4) [Advanced but supported] python -m sdetkit kits list
+"""
+
+    help_epilog = render_root_help_groups()
+
+    p = argparse.ArgumentParser(
+        prog="sdetkit",
+        add_help=True,
+        description=help_description,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=help_epilog,
+    )
+    p.add_argument("--version", action="version", version=tool_version())
+    p.add_argument(
+        "--show-hidden",
+        action="store_true",
+        help="Include hidden/legacy playbook commands in `sdetkit --help` output.",
+    )
+    p.add_argument(
+        "--no-legacy-hint",
+        action="store_true",
+        help="Suppress legacy migration hints for this invocation.",
+    )
+    sub = p.add_subparsers(
+        dest="cmd",
+        required=True,
+        metavar="command",
+        title="commands",
+        description="Run `sdetkit <command> --help` for command-specific guidance.",
+    )
+    _add_passthrough_subcommand(sub, "baseline")
+    _add_passthrough_subcommand(
+        sub,
+        "playbooks",
+        help_text="Discover and run adoption/rollout playbooks",
+    )
+    _add_passthrough_subcommand(
+        sub,
+        "legacy",
+        help_text="[Advanced but supported] Access historical/closeout compatibility lanes",
+    )
+    _add_passthrough_subcommand(
+        sub, "kits", help_text="[Advanced but supported] Umbrella kit catalog and kit details"
+    )
+
+    _add_passthrough_subcommand(
+        sub, "release", help_text="[Public / stable] Release Confidence Kit (primary surface)"
+    )
+    _add_passthrough_subcommand(
+        sub,
+        "intelligence",
+        help_text="[Advanced but supported] Test Intelligence Kit (primary surface)",
+    )
+    _add_passthrough_subcommand(
+        sub,
+        "investigate",
+        help_text="[Advanced but supported] Human-friendly adaptive investigation front door",
+    )
+    _add_passthrough_subcommand(
+        sub,
+        "integration",
+        help_text="[Advanced but supported] Integration Assurance Kit (primary surface)",
+    )
+    _add_passthrough_subcommand(
+        sub,
+        "author",
+        help_text="[Advanced but supported] Platform-style Python problem authoring workflow",
+    )
+    _add_passthrough_subcommand(
+        sub,
+        "forensics",
+        help_text="[Advanced but supported] Failure Forensics Kit (experimental sublanes possible)",
+    )
+    _add_passthrough_subcommand(
+        sub, "kv", help_text="Utility: parse key=value input into JSON (supporting surface)"
+    )
+    inspect_parser = sub.add_parser(
+        "inspect",
+        help="[Advanced but supported] Inspect CSV/JSON evidence inputs for operational diagnostics",
+        allow_abbrev=False,
+    )
+    inspect_parser.add_argument(
+        "--rules-template",
+        action="store_true",
+        help="Print a canonical inspect rules JSON template and exit.",
+    )
+    inspect_parser.add_argument(
+        "--rules-lint",
+        default=None,
+        help="Validate an inspect rules JSON file and exit.",
+    )
+    inspect_parser.add_argument("args", nargs=argparse.REMAINDER)
+    inspect_compare_parser = sub.add_parser(
+        "inspect-compare",
+        help="[Advanced but supported] Compare inspect baseline/previous runs and drift evidence",
+    )
+    inspect_compare_parser.add_argument("--left", default=None)
+    inspect_compare_parser.add_argument("--right", default=None)
+    inspect_compare_parser.add_argument("--left-run", default=None)
+    inspect_compare_parser.add_argument("--right-run", default=None)
+    inspect_compare_parser.add_argument("--scope", default=None)
+    inspect_compare_parser.add_argument("--latest-vs-previous", action="store_true")
+    inspect_compare_parser.add_argument("--workspace-root", default=None)
+    inspect_compare_parser.add_argument("--workflow", default=None)
+    inspect_compare_parser.add_argument("--format", choices=["text", "json"], default=None)
+    inspect_compare_parser.add_argument("--out-dir", default=None)
+    inspect_compare_parser.add_argument("--no-workspace", action="store_true")
+    inspect_compare_parser.add_argument("args", nargs=argparse.REMAINDER)
+    inspect_project_parser = sub.add_parser(
+        "inspect-project",
+        help="[Advanced but supported] Run reusable inspection policy packs over project datasets",
+    )
+    inspect_project_parser.add_argument("project_dir")
+    inspect_project_parser.add_argument("--policy", default=None)
+    inspect_project_parser.add_argument("--workspace-root", default=None)
+    inspect_project_parser.add_argument("--out-dir", default=None)
+    inspect_project_parser.add_argument("--format", choices=["text", "json"], default=None)
+    inspect_project_parser.add_argument("--no-workspace", action="store_true")
+    review_parser = sub.add_parser(
+        "review",
+        help="[Public / stable] Front-door workflow that orchestrates doctor/inspect/judgment/history",
+    )
+    review_parser.add_argument("path")
+    review_parser.add_argument("--workspace-root", default=None)
+    review_parser.add_argument("--out-dir", default=None)
+    review_parser.add_argument(
+        "--profile", choices=["release", "triage", "forensics", "monitor"], default=None
+    )
+    review_parser.add_argument(
+        "--format",
+        choices=["text", "json", "operator-json"],
+        default=None,
+        help=(
+            "Output format: json for full payload/debug automation; "
+            "operator-json for the stable operator-facing integration contract."
+        ),
+    )
+    review_parser.add_argument("--interactive", action="store_true")
+    review_parser.add_argument("--no-workspace", action="store_true")
+    review_parser.add_argument("--work-id", default=None)
+    review_parser.add_argument("--work-context", action="append", default=None)
+    review_parser.add_argument("--code-scan-json", default=None)
+    review_parser.add_argument("--adaptive", action="store_true")
+    review_parser.add_argument("--deep", action="store_true")
+    review_parser.add_argument("--learn", action="store_true")
+    review_parser.add_argument("--db", default=None)
+    review_parser.add_argument("--evidence-dir", default=None)
+    review_parser.add_argument(
+        "--adaptive-helpers", choices=["in-process", "subprocess"], default=None
+    )
+
+    serve_parser = sub.add_parser(
+        "serve",
+        help="[Public / stable] Run local API server for deterministic review automation",
+    )
+    serve_parser.add_argument("--host", default=None)
+    serve_parser.add_argument("--port", type=int, default=None)
+
+    ag = sub.add_parser("apiget", help="Deterministic HTTP JSON fetch and replay helper")
+    _add_apiget_args(ag)
+
+    _add_passthrough_subcommand(
+        sub,
+        "doctor",
+        help_text="[Public / stable] Deterministic repo and release-readiness checks",
+    )
+
+    mission_control_parser = sub.add_parser(
+        "mission-control",
+        help="[Public / stable] Unified release-confidence evidence bundle",
+        add_help=False,
+    )
+    mission_control_parser.add_argument(
+        "-h",
+        "--help",
+        action="store_true",
+        dest="mission_control_help",
+    )
+    mission_control_parser.add_argument("args", nargs=argparse.REMAINDER)
+
+    operator_loop_parser = sub.add_parser(
+        "operator-loop",
+        help="[Public / stable] Build the operator evidence loop",
+        description=(
+            "Build the full review-first operator evidence loop from existing SDETKit artifacts."
+        ),
+    )
+    operator_loop_parser.add_argument("--repo", default=".")
+    operator_loop_parser.add_argument("--out-dir", default="build/sdetkit/operator-loop")
+    operator_loop_parser.add_argument("--quality-log", default=None)
+    operator_loop_parser.add_argument("--quality-outcome", default="unknown")
+    operator_loop_parser.add_argument("--sentinel-control-room", default=None)
+    operator_loop_parser.add_argument("--evidence-graph", default=None)
+    operator_loop_parser.add_argument("--failure-bundle", default=None)
+    operator_loop_parser.add_argument("--changed-files", default=None)
+    operator_loop_parser.add_argument("--action-report", default=None)
+    operator_loop_parser.add_argument("--check-intelligence", default=None)
+    operator_loop_parser.add_argument("--format", choices=["json", "markdown"], default="json")
+    operator_loop_parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Return non-zero when the generated operator loop is incomplete.",
+    )
+
+    _add_passthrough_subcommand(
+        sub,
+        "gate",
+        help_text="[Public / stable] Quick confidence and strict release gate checks",
+    )
+    _add_passthrough_subcommand(
+        sub,
+        "readiness",
+        help_text="[Public / stable] Production readiness scorecard for investor/operator reviews",
+    )
+
+    _add_passthrough_subcommand(sub, "ci", help_text="CI template and pipeline validation")
+
+    _add_passthrough_subcommand(
+        sub,
+        "triage-ci",
+        help_text="[Advanced but supported] Diagnose failed CI logs without applying fixes",
+    )
+
+    _add_passthrough_subcommand(sub, "patch", help_text="Apply controlled file/text patches")
+
+    _add_passthrough_subcommand(
+        sub,
+        "cassette-get",
+        help_text="Utility: record/replay HTTP captures for deterministic checks",
+    )
+
+    initp = sub.add_parser(
+        "init",
+        help="[Advanced but supported] Bootstrap repo adoption with preset templates and optional config",
+    )
+    initp.add_argument("--preset", choices=["enterprise_python"], default="enterprise_python")
+    initp.add_argument("--root", default=".")
+    initp.add_argument("--dry-run", action="store_true")
+    initp.add_argument("--force", action="store_true")
+    initp.add_argument("--diff", action="store_true")
+    initp.add_argument("--format", choices=["text", "json"], default="text")
+    initp.add_argument("--write-config", action="store_true")
+
+    _add_passthrough_subcommand(
+        sub, "repo", help_text="[Public / stable] Repository automation tasks"
+    )
+    _add_passthrough_subcommand(
+        sub,
+        "portfolio-orchestrate",
+        help_text="[Advanced but supported] Multi-repo orchestration and portfolio risk reporting",
+    )
+
+    _add_passthrough_subcommand(sub, "dev", help_text="Shortcut to `repo dev` workflows")
+
+    _add_passthrough_subcommand(
+        sub, "feature-registry", help_text="Inspect feature-registry entries and filters"
+    )
+    _add_passthrough_subcommand(
+        sub,
+        "contract",
+        help_text="[Public / stable] Runtime/install integration contract surfaces for adopters",
+    )
+
+    boost = sub.add_parser(
+        "boost",
+        help="[Advanced but supported] High-signal deterministic local repo intelligence scan",
+    )
+    release_room = sub.add_parser(
+        "release-room",
+        help="[Advanced but supported] Build local release-room execution plans",
+    )
+    release_room_sub = release_room.add_subparsers(dest="release_room_cmd", required=False)
+    release_room_plan = release_room_sub.add_parser(
+        "plan", help="Build deterministic release-room decision and next patch plan"
+    )
+    release_room_plan.add_argument("path")
+    release_room_plan.add_argument("--deep", action="store_true")
+    release_room_plan.add_argument("--learn", action="store_true")
+    release_room_plan.add_argument("--db", default=".sdetkit/adaptive.db")
+    release_room_plan.add_argument("--max-lines", type=int, default=100)
+    release_room_plan.add_argument("--format", choices=["text", "operator-json"], default="text")
+    release_room_plan.add_argument("--evidence-dir", default="")
+    boost_sub = boost.add_subparsers(dest="boost_cmd", required=False)
+    boost_scan = boost_sub.add_parser("scan", help="Run deterministic local boost scan")
+    boost_scan.add_argument("path")
+    boost_scan.add_argument("--minutes", type=int, default=5)
+    boost_scan.add_argument("--max-lines", type=int, default=100)
+    boost_scan.add_argument("--format", choices=["text", "operator-json"], default="text")
+    boost_scan.add_argument("--deep", action="store_true")
+    boost_scan.add_argument("--learn", action="store_true")
+    boost_scan.add_argument("--db", default=".sdetkit/adaptive.db")
+    boost_scan.add_argument("--index-out", default="build/sdetkit-index")
+    boost_scan.add_argument("--evidence-dir", default="")
+    index = sub.add_parser(
+        "index",
+        help="[Advanced but supported] Build and inspect deterministic deep repo index evidence",
+    )
+    adaptive = sub.add_parser(
+        "adaptive",
+        help="[Advanced but supported] Local SQLite adaptive memory for cross-run repo intelligence",
+    )
+    adaptive_sub = adaptive.add_subparsers(dest="adaptive_cmd", required=False)
+    adaptive_init = adaptive_sub.add_parser(
+        "init", help="Initialize local adaptive memory database"
+    )
+    adaptive_init.add_argument("--db", default=".sdetkit/adaptive.db")
+    adaptive_ingest = adaptive_sub.add_parser(
+        "ingest", help="Ingest sdetkit index evidence into adaptive memory"
+    )
+    adaptive_ingest.add_argument("index_json")
+    adaptive_ingest.add_argument("--db", default=".sdetkit/adaptive.db")
+    adaptive_history = adaptive_sub.add_parser(
+        "history", help="Summarize adaptive memory run history"
+    )
+    adaptive_history.add_argument("--db", default=".sdetkit/adaptive.db")
+    adaptive_history.add_argument("--format", choices=["text", "operator-json"], default="text")
+    adaptive_explain = adaptive_sub.add_parser(
+        "explain", help="Explain adaptive memory signals for a path"
+    )
+    adaptive_explain.add_argument("path")
+    adaptive_explain.add_argument("--db", default=".sdetkit/adaptive.db")
+    adaptive_explain.add_argument("--format", choices=["text", "operator-json"], default="text")
+    adaptive_learn = adaptive_sub.add_parser(
+        "learn", help="Record and summarize adaptive diagnosis learning events"
+    )
+    adaptive_learn_sub = adaptive_learn.add_subparsers(dest="adaptive_learn_cmd", required=True)
+    adaptive_learn_record = adaptive_learn_sub.add_parser(
+        "record", help="Record learning events from an adaptive diagnosis JSON artifact"
+    )
+    adaptive_learn_record.add_argument("diagnosis_json")
+    adaptive_learn_record.add_argument("--db", default=".sdetkit/adaptive-diagnosis-memory.jsonl")
+    adaptive_learn_record.add_argument("--include-monitor", action="store_true")
+    adaptive_learn_record.add_argument("--proof-passed", action="store_true")
+    adaptive_learn_record.add_argument("--proof-failed", action="store_true")
+    adaptive_learn_record.add_argument("--fix-accepted", action="store_true")
+    adaptive_learn_record.add_argument("--fix-rejected", action="store_true")
+    adaptive_learn_record.add_argument("--false-positive", action="store_true")
+    adaptive_learn_record.add_argument("--format", choices=["text", "json"], default="text")
+    adaptive_learn_summary = adaptive_learn_sub.add_parser(
+        "summarize", help="Summarize recurring scenarios and weakest adaptive lanes"
+    )
+    adaptive_learn_summary.add_argument("--db", default=".sdetkit/adaptive-diagnosis-memory.jsonl")
+    adaptive_learn_summary.add_argument("--format", choices=["text", "json"], default="text")
+    adaptive_brief = adaptive_sub.add_parser(
+        "brief",
+        help="Generate a concise operator brief from gate, diagnosis, and learning artifacts",
+    )
+    adaptive_brief.add_argument("--gate", default="")
+    adaptive_brief.add_argument("--diagnosis", default="")
+    adaptive_brief.add_argument("--learning-summary", default="")
+    adaptive_brief.add_argument("--safe-fix-plan", default="")
+    adaptive_brief.add_argument("--format", choices=["md", "json", "comment"], default="md")
+    adaptive_brief.add_argument("--out", default="build/sdetkit/operator-brief.md")
+    adaptive_failure_bundle = adaptive_sub.add_parser(
+        "failure-bundle",
+        help="Build a unified failure intelligence bundle from a failed log",
+    )
+    adaptive_failure_bundle.add_argument("--log", required=True)
+    adaptive_failure_bundle.add_argument("--out-dir", default="build/sdetkit/failure-intelligence")
+    adaptive_failure_bundle.add_argument("--out", default="")
+    adaptive_failure_bundle.add_argument("--memory-db", default="")
+    adaptive_failure_bundle.add_argument("--proof-passed", action="store_true")
+    adaptive_failure_bundle.add_argument("--proof-failed", action="store_true")
+    adaptive_failure_bundle.add_argument("--fix-accepted", action="store_true")
+    adaptive_failure_bundle.add_argument("--fix-rejected", action="store_true")
+    adaptive_failure_bundle.add_argument("--false-positive", action="store_true")
+    adaptive_failure_bundle.add_argument("--format", choices=["text", "json"], default="text")
+    adaptive_sentinel = adaptive_sub.add_parser(
+        "sentinel",
+        help="Run read-only adaptive sentinel scan/watch control loops",
+    )
+    adaptive_sentinel_sub = adaptive_sentinel.add_subparsers(
+        dest="adaptive_sentinel_cmd", required=True
+    )
+    adaptive_sentinel_scan = adaptive_sentinel_sub.add_parser(
+        "scan", help="Run one adaptive sentinel scan"
+    )
+    adaptive_sentinel_scan.add_argument("--root", default=".")
+    adaptive_sentinel_scan.add_argument("--out-dir", default="build/sdetkit/sentinel")
+    adaptive_sentinel_scan.add_argument("--event-log", default="")
+    adaptive_sentinel_scan.add_argument("--format", choices=["text", "json", "md"], default="text")
+    adaptive_sentinel_scan.add_argument("--no-write", action="store_true")
+    adaptive_sentinel_scan.add_argument("--no-fail", action="store_true")
+    adaptive_sentinel_watch = adaptive_sentinel_sub.add_parser(
+        "watch", help="Run repeated adaptive sentinel scans"
+    )
+    adaptive_sentinel_watch.add_argument("--root", default=".")
+    adaptive_sentinel_watch.add_argument("--out-dir", default="build/sdetkit/sentinel")
+    adaptive_sentinel_watch.add_argument("--event-log", default="")
+    adaptive_sentinel_watch.add_argument("--interval-seconds", type=float, default=5.0)
+    adaptive_sentinel_watch.add_argument("--iterations", type=int, default=3)
+    adaptive_sentinel_watch.add_argument("--format", choices=["text", "json", "md"], default="text")
+    adaptive_sentinel_watch.add_argument("--no-write", action="store_true")
+    adaptive_sentinel_watch.add_argument("--no-fail", action="store_true")
+    adaptive_portfolio = adaptive_sub.add_parser(
+        "portfolio-rollup",
+        help="Roll multiple adaptive diagnosis outputs into a top-risk portfolio report",
+    )
+    adaptive_portfolio.add_argument("diagnosis_json", nargs="+")
+    adaptive_portfolio.add_argument("--format", choices=["text", "json", "md"], default="text")
+    adaptive_portfolio.add_argument("--out", default="")
+    adaptive_patch_plan = adaptive_sub.add_parser(
+        "patch-plan",
+        help="Build a review-only assisted patch plan from an adaptive diagnosis artifact",
+    )
+    adaptive_patch_plan.add_argument("diagnosis_json")
+    adaptive_patch_plan.add_argument("--format", choices=["text", "json", "md"], default="text")
+    adaptive_patch_plan.add_argument("--out", default="")
+    adaptive_fix_audit = adaptive_sub.add_parser(
+        "fix-audit", help="Record and summarize adaptive remediation audit events"
+    )
+    adaptive_fix_audit_sub = adaptive_fix_audit.add_subparsers(
+        dest="adaptive_fix_audit_cmd", required=True
+    )
+    adaptive_fix_audit_record = adaptive_fix_audit_sub.add_parser(
+        "record", help="Append a remediation plan audit record"
+    )
+    adaptive_fix_audit_record.add_argument("plan_json")
+    adaptive_fix_audit_record.add_argument("--db", default=".sdetkit/adaptive-fix-audit.jsonl")
+    adaptive_fix_audit_record.add_argument(
+        "--outcome",
+        choices=["planned", "applied", "proof_passed", "proof_failed", "reverted", "rejected"],
+        default="planned",
+    )
+    adaptive_fix_audit_record.add_argument("--note", default="")
+    adaptive_fix_audit_record.add_argument("--format", choices=["text", "json"], default="text")
+    adaptive_fix_audit_summary = adaptive_fix_audit_sub.add_parser(
+        "summarize", help="Summarize adaptive remediation audit records"
+    )
+    adaptive_fix_audit_summary.add_argument("--db", default=".sdetkit/adaptive-fix-audit.jsonl")
+    adaptive_fix_audit_summary.add_argument("--format", choices=["text", "json"], default="text")
+    adaptive_analytics = adaptive_sub.add_parser(
+        "enterprise-analytics",
+        help="Build leadership metrics from portfolio rollup and fix-audit evidence",
+    )
+    adaptive_analytics.add_argument("--portfolio", required=True)
+    adaptive_analytics.add_argument("--fix-audit", required=True)
+    adaptive_analytics.add_argument("--format", choices=["text", "json"], default="text")
+    adaptive_analytics.add_argument("--out", default="")
+    adaptive_remediation_policy = adaptive_sub.add_parser(
+        "remediation-policy",
+        help="Validate safe remediation plans against configurable guardrails",
+    )
+    adaptive_remediation_policy_sub = adaptive_remediation_policy.add_subparsers(
+        dest="adaptive_remediation_policy_cmd", required=True
+    )
+    adaptive_remediation_policy_template = adaptive_remediation_policy_sub.add_parser(
+        "template", help="Print the default adaptive remediation policy"
+    )
+    adaptive_remediation_policy_template.add_argument(
+        "--format", choices=["text", "json"], default="json"
+    )
+    adaptive_remediation_policy_template.add_argument("--out", default="")
+    adaptive_remediation_policy_validate = adaptive_remediation_policy_sub.add_parser(
+        "validate", help="Validate a remediation plan against policy"
+    )
+    adaptive_remediation_policy_validate.add_argument("plan_json")
+    adaptive_remediation_policy_validate.add_argument(
+        "--policy", default="config/adaptive_remediation_policy.default.json"
+    )
+    adaptive_remediation_policy_validate.add_argument(
+        "--format", choices=["text", "json"], default="text"
+    )
+    adaptive_remediation_policy_validate.add_argument("--out", default="")
+    adaptive_dashboard = adaptive_sub.add_parser(
+        "dashboard", help="Build a static local dashboard from adaptive artifacts"
+    )
+    for flag in (
+        "diagnosis",
+        "brief",
+        "portfolio",
+        "fix-audit",
+        "governance",
+        "adapter",
+        "analytics",
+        "remediation-policy",
+    ):
+        adaptive_dashboard.add_argument(f"--{flag}", default="")
+    adaptive_dashboard.add_argument("--format", choices=["html", "json"], default="html")
+    adaptive_dashboard.add_argument("--out", default="build/sdetkit/adaptive-dashboard.html")
+    adaptive_learning_import = adaptive_sub.add_parser(
+        "learning-import", help="Validate anonymized cross-repo learning and emit calibration hints"
+    )
+    adaptive_learning_import.add_argument("learning_export")
+    adaptive_learning_import.add_argument("--format", choices=["text", "json"], default="text")
+    adaptive_learning_import.add_argument("--out", default="")
+    adaptive_enterprise = adaptive_sub.add_parser(
+        "enterprise-governance",
+        help="Build enterprise adaptive governance reports and anonymized exports",
+    )
+    adaptive_enterprise_sub = adaptive_enterprise.add_subparsers(
+        dest="adaptive_enterprise_cmd", required=True
+    )
+    adaptive_enterprise_report = adaptive_enterprise_sub.add_parser(
+        "report", help="Build adaptive enterprise governance report"
+    )
+    adaptive_enterprise_report.add_argument("--root", default=".")
+    adaptive_enterprise_report.add_argument("--format", choices=["text", "json"], default="text")
+    adaptive_enterprise_report.add_argument("--out", default="")
+    adaptive_enterprise_export = adaptive_enterprise_sub.add_parser(
+        "anonymize-learning", help="Anonymize adaptive JSONL records for export"
+    )
+    adaptive_enterprise_export.add_argument("jsonl_path")
+    adaptive_enterprise_export.add_argument("--format", choices=["text", "json"], default="json")
+    adaptive_enterprise_export.add_argument("--out", default="")
+    adaptive_adapter = adaptive_sub.add_parser(
+        "integration-adapter", help="Validate adaptive CI integration adapter artifact contracts"
+    )
+    adaptive_adapter_sub = adaptive_adapter.add_subparsers(
+        dest="adaptive_adapter_cmd", required=True
+    )
+    adaptive_adapter_validate = adaptive_adapter_sub.add_parser(
+        "validate", help="Validate adaptive integration adapter artifacts"
+    )
+    adaptive_adapter_validate.add_argument(
+        "--provider", choices=["github-actions", "gitlab", "jenkins", "local"], required=True
+    )
+    adaptive_adapter_validate.add_argument("--artifacts", required=True)
+    adaptive_adapter_validate.add_argument("--root", default=".")
+    adaptive_adapter_validate.add_argument("--format", choices=["text", "json"], default="text")
+    adaptive_adapter_validate.add_argument("--out", default="")
+    index_sub = index.add_subparsers(dest="index_cmd", required=False)
+    index_build = index_sub.add_parser(
+        "build", help="Build deterministic local repo index evidence"
+    )
+    index_build.add_argument("path")
+    index_build.add_argument("--out", default="build/sdetkit-index")
+    index_inspect = index_sub.add_parser("inspect", help="Inspect local repo index evidence")
+    index_inspect.add_argument("path")
+    index_inspect.add_argument("--format", choices=["text", "operator-json"], default="text")
+
+    rpt = sub.add_parser("report", help="Reporting workflows and output packs")
+    rpt.add_argument("args", nargs=argparse.REMAINDER)
+
+    mnt = sub.add_parser("maintenance", help="Maintenance automation and cleanup")
+    mnt.add_argument("args", nargs=argparse.REMAINDER)
+
+    agt = sub.add_parser("agent", help="Agent-centric automation workflows")
+    agt.add_argument("args", nargs=argparse.REMAINDER)
+
+    sec = sub.add_parser(
+        "security", help="[Public / stable] Security policy checks and enforcement"
+    )
+    sec.add_argument("args", nargs=argparse.REMAINDER)
+
+    osp = sub.add_parser("ops", help="Operational control-plane workflows")
+    osp.add_argument("args", nargs=argparse.REMAINDER)
+
+    ntf = sub.add_parser("notify", help="Notification adapters and delivery workflows")
+    ntf.add_argument("args", nargs=argparse.REMAINDER)
+
+    plc = sub.add_parser("policy", help="Policy evaluation and helper commands")
+    plc.add_argument("args", nargs=argparse.REMAINDER)
+
+    evd = sub.add_parser(
+        "evidence", help="[Public / stable] Generate audit-friendly release evidence"
+    )
+    evd.add_argument("args", nargs=argparse.REMAINDER)
+
+    onb = sub.add_parser("onboarding", help="Role-based onboarding playbook")
+    onb.add_argument("args", nargs=argparse.REMAINDER)
+
+    adp = sub.add_parser("adoption", help="Adoption follow-up action planner")
+    adp.add_argument("--fit", default="build/sdetkit-fit-recommendation.json")
+    adp.add_argument("--summary", default="build/gate-decision-summary.json")
+    adp.add_argument("--format", choices=["json", "md"], default="json")
+    adp.add_argument("--out", default="")
+    adp.add_argument("--history", default="")
+    adp.add_argument("--history-rollup-out", default="")
+    adp.add_argument(
+        "--policy-profile", choices=["conservative", "balanced", "aggressive"], default="balanced"
+    )
+    adp.add_argument("--escalation-consecutive-no-ship", type=int, default=None)
+    adp.add_argument("--escalation-min-runs", type=int, default=None)
+    adp.add_argument("--escalation-min-p0-rate", type=float, default=None)
+
+    adoption_surface = sub.add_parser(
+        "adoption-surface",
+        help="[Advanced but supported] Write read-only adoption surface discovery artifact",
+    )
+    adoption_surface.add_argument("--root", default=".")
+    adoption_surface.add_argument("--out", default="build/sdetkit/adoption-surface.json")
+    adoption_surface.add_argument("--format", choices=["json", "text", "report"], default="json")
+
+    adoption_learning = sub.add_parser(
+        "adoption-learning",
+        help="[Advanced but supported] Record read-only adoption learning evidence",
+    )
+    adoption_learning.add_argument("--root", default=".")
+    adoption_learning.add_argument("--surface-json", default="")
+    adoption_learning.add_argument("--out", default="build/sdetkit/adoption-learning.json")
+    adoption_learning.add_argument("--trial-name", default="self_adoption_baseline")
+    adoption_learning.add_argument("--format", choices=["json", "text"], default="json")
+
+    public_repo_eligibility = sub.add_parser(
+        "public-repo-eligibility",
+        help="[Advanced but supported] Screen public repo eligibility for read-only trials",
+    )
+    public_repo_eligibility.add_argument("--repo-url", required=True)
+    public_repo_eligibility.add_argument("--license", dest="license_id", required=True)
+    public_repo_eligibility.add_argument(
+        "--out", default="build/sdetkit/public-repo-eligibility.json"
+    )
+    public_repo_eligibility.add_argument(
+        "--repo-size", choices=["small", "medium", "large", "huge"], default="small"
+    )
+    public_repo_eligibility.add_argument("--private", action="store_true")
+    public_repo_eligibility.add_argument("--owned-by-us", action="store_true")
+    public_repo_eligibility.add_argument("--has-no-ai-notice", action="store_true")
+    public_repo_eligibility.add_argument("--has-no-benchmark-notice", action="store_true")
+    public_repo_eligibility.add_argument("--has-security-sensitive-content", action="store_true")
+    public_repo_eligibility.add_argument("--has-malware-or-exploit-content", action="store_true")
+    public_repo_eligibility.add_argument("--format", choices=["json", "text"], default="json")
+
+    adoption_proof_recommendations = sub.add_parser(
+        "adoption-proof-recommendations",
+        help=argparse.SUPPRESS,
+    )
+    adoption_proof_recommendations.add_argument("--root", default=".")
+    adoption_proof_recommendations.add_argument("--surface-json", default="")
+    adoption_proof_recommendations.add_argument(
+        "--out", default="build/sdetkit/adoption-proof-recommendations.json"
+    )
+    adoption_proof_recommendations.add_argument(
+        "--format", choices=["json", "text"], default="json"
+    )
+
+    adoption_repo_topology = sub.add_parser(
+        "adoption-repo-topology",
+        help=argparse.SUPPRESS,
+    )
+    adoption_repo_topology.add_argument("--root", default=".")
+    adoption_repo_topology.add_argument("--surface-json", default="")
+    adoption_repo_topology.add_argument("--proof-json", default="")
+    adoption_repo_topology.add_argument(
+        "--out", default="build/sdetkit/adoption-repo-topology.json"
+    )
+    adoption_repo_topology.add_argument("--format", choices=["json", "text"], default="json")
+
+    adoption_evidence_bundle = sub.add_parser(
+        "adoption-evidence-bundle",
+        help=argparse.SUPPRESS,
+    )
+    adoption_evidence_bundle.add_argument("--root", default=".")
+    adoption_evidence_bundle.add_argument("--surface-json", default="")
+    adoption_evidence_bundle.add_argument("--proof-json", default="")
+    adoption_evidence_bundle.add_argument("--topology-json", default="")
+    adoption_evidence_bundle.add_argument("--learning-json", default="")
+    adoption_evidence_bundle.add_argument(
+        "--out", default="build/sdetkit/adoption-evidence-bundle.json"
+    )
+    adoption_evidence_bundle.add_argument("--format", choices=["json", "text"], default="json")
+
+    adoption_external_integration = sub.add_parser(
+        "adoption-external-integration",
+        help=argparse.SUPPRESS,
+    )
+    adoption_external_integration.add_argument("--target-root", required=True)
+    adoption_external_integration.add_argument("--artifact-dir", required=True)
+    adoption_external_integration.add_argument("--out", default="")
+    adoption_external_integration.add_argument("--format", choices=["json", "text"], default="json")
+
+    adoption_real_world_learning_matrix = sub.add_parser(
+        "adoption-real-world-learning-matrix",
+        help=argparse.SUPPRESS,
+    )
+    adoption_real_world_learning_matrix.add_argument("--matrix-json", required=True)
+    adoption_real_world_learning_matrix.add_argument(
+        "--artifact-root",
+        default="build/sdetkit/adoption-real-world-learning",
+    )
+    adoption_real_world_learning_matrix.add_argument("--out", default="")
+    adoption_real_world_learning_matrix.add_argument("--markdown-out", default="")
+    adoption_real_world_learning_matrix.add_argument("--minimum-repos", type=int, default=10)
+    adoption_real_world_learning_matrix.add_argument(
+        "--format", choices=["json", "text"], default="json"
+    )
+
+    adoption_learning_report = sub.add_parser(
+        "adoption-learning-report",
+        help=argparse.SUPPRESS,
+    )
+    adoption_learning_report.add_argument("--root", default=".")
+    adoption_learning_report.add_argument("--matrix-json", required=True)
+    adoption_learning_report.add_argument("--repo-memory-profile", default="")
+    adoption_learning_report.add_argument(
+        "--out", default="build/sdetkit/adoption-learning-report.json"
+    )
+    adoption_learning_report.add_argument("--markdown-out", default="")
+    adoption_learning_report.add_argument("--format", choices=["json", "text"], default="json")
+    adoption_learning_report.add_argument("--check-freshness", action="store_true")
+
+    adoption_public_trial_matrix_report = sub.add_parser(
+        "adoption-public-trial-matrix-report",
+        help=argparse.SUPPRESS,
+    )
+    adoption_public_trial_matrix_report.add_argument("--root", default=".")
+    adoption_public_trial_matrix_report.add_argument("--matrix-json", required=True)
+    adoption_public_trial_matrix_report.add_argument(
+        "--out",
+        default="build/sdetkit/public-repo-trial-matrix-report.json",
+    )
+    adoption_public_trial_matrix_report.add_argument("--markdown-out", default="")
+    adoption_public_trial_matrix_report.add_argument(
+        "--format",
+        choices=["json", "text"],
+        default="json",
+    )
+
+    release_anti_hijack_threat_model = sub.add_parser(
+        "release-anti-hijack-threat-model",
+        help=argparse.SUPPRESS,
+    )
+    release_anti_hijack_threat_model.add_argument("--root", default=".")
+    release_anti_hijack_threat_model.add_argument(
+        "--workflow", default=".github/workflows/release.yml"
+    )
+    release_anti_hijack_threat_model.add_argument(
+        "--out", default="build/sdetkit/release-anti-hijack-threat-model.json"
+    )
+    release_anti_hijack_threat_model.add_argument("--markdown-out", default="")
+    release_anti_hijack_threat_model.add_argument(
+        "--format", choices=["json", "text"], default="json"
+    )
+    release_anti_hijack_threat_model.add_argument("--check-freshness", action="store_true")
+
+    issue_queue_classifier = sub.add_parser(
+        "issue-queue-classifier",
+        help="[Advanced but supported] Classify issue queue snapshots without mutation",
+    )
+    issue_queue_classifier.add_argument("--issues-json", required=True)
+    issue_queue_classifier.add_argument(
+        "--out", default="build/sdetkit/issue-queue-classifier.json"
+    )
+    issue_queue_classifier.add_argument("--root", default=".")
+    issue_queue_classifier.add_argument(
+        "--source-run-id",
+        action="append",
+        type=int,
+        default=[],
+    )
+    issue_queue_classifier.add_argument("--check-freshness", action="store_true")
+    issue_queue_classifier.add_argument("--format", choices=["json", "text"], default="json")
+
+    automation_health = sub.add_parser(
+        "automation-health",
+        help="[Advanced but supported] Build read-only automation health evidence",
+    )
+    automation_health.add_argument("--issues-json", required=True)
+    automation_health.add_argument("--out", default="build/sdetkit/automation-health.json")
+    automation_health.add_argument("--root", default=".")
+    automation_health.add_argument(
+        "--source-run-id",
+        action="append",
+        type=int,
+        default=[],
+    )
+    automation_health.add_argument("--check-freshness", action="store_true")
+    automation_health.add_argument("--format", choices=["json", "text"], default="json")
+
+    security_followup_disposition = sub.add_parser(
+        "security-followup-disposition",
+        help="[Advanced but supported] Build read-only security follow-up disposition evidence",
+    )
+    security_followup_disposition.add_argument("--issues-json", required=True)
+    security_followup_disposition.add_argument("--security-json", required=True)
+    security_followup_disposition.add_argument(
+        "--out", default="build/sdetkit/security-followup-disposition.json"
+    )
+    security_followup_disposition.add_argument("--format", choices=["json", "text"], default="json")
+
+    security_findings_inventory = sub.add_parser(
+        "security-findings-inventory",
+        help="[Advanced but supported] Build read-only security findings inventory",
+    )
+    security_findings_inventory.add_argument("--security-json", required=True)
+    security_findings_inventory.add_argument(
+        "--out", default="build/sdetkit/security-findings-inventory.json"
+    )
+    security_findings_inventory.add_argument("--format", choices=["json", "text"], default="json")
+
+    security_finding_disposition_matrix = sub.add_parser(
+        "security-finding-disposition-matrix",
+        help="[Advanced but supported] Build read-only security finding disposition matrix",
+    )
+    security_finding_disposition_matrix.add_argument("--inventory-json", required=True)
+    security_finding_disposition_matrix.add_argument(
+        "--out", default="build/sdetkit/security-finding-disposition-matrix.json"
+    )
+    security_finding_disposition_matrix.add_argument(
+        "--format", choices=["json", "text"], default="json"
+    )
+
+    security_review_packet = sub.add_parser(
+        "security-review-packet",
+        help="[Advanced but supported] Build read-only human security review packet",
+    )
+    security_review_packet.add_argument("--inventory-json", required=True)
+    security_review_packet.add_argument("--matrix-json", required=True)
+    security_review_packet.add_argument(
+        "--out", default="build/sdetkit/security-review-packet.json"
+    )
+    security_review_packet.add_argument("--format", choices=["json", "text"], default="json")
+
+    professional_naming_inventory = sub.add_parser(
+        "professional-naming-inventory",
+        help="[Advanced but supported] Build read-only professional naming debt inventory",
+    )
+    professional_naming_inventory.add_argument("--root", default=".")
+    professional_naming_inventory.add_argument(
+        "--out", default="build/sdetkit/professional-naming-inventory.json"
+    )
+    professional_naming_inventory.add_argument("--term", action="append", dest="terms")
+    professional_naming_inventory.add_argument("--format", choices=["json", "text"], default="json")
+
+    professional_naming_cleanup_plan = sub.add_parser(
+        "professional-naming-cleanup-plan",
+        help="[Advanced but supported] Build read-only professional naming cleanup plan",
+    )
+    professional_naming_cleanup_plan.add_argument("--inventory-json", required=True)
+    professional_naming_cleanup_plan.add_argument(
+        "--out", default="build/sdetkit/professional-naming-cleanup-plan.json"
+    )
+    professional_naming_cleanup_plan.add_argument(
+        "--format", choices=["json", "text"], default="json"
+    )
+
+    maintenance_queue_rollup = sub.add_parser(
+        "maintenance-queue-rollup",
+        help="[Advanced but supported] Build read-only maintenance queue rollup evidence",
+    )
+    maintenance_queue_rollup.add_argument("--issue-queue-json", required=True)
+    maintenance_queue_rollup.add_argument("--automation-health-json", required=True)
+    maintenance_queue_rollup.add_argument("--security-followup-json", required=True)
+    maintenance_queue_rollup.add_argument(
+        "--out", default="build/sdetkit/maintenance-queue-rollup.json"
+    )
+    maintenance_queue_rollup.add_argument("--root", default=".")
+    maintenance_queue_rollup.add_argument(
+        "--source-run-id",
+        action="append",
+        type=int,
+        default=[],
+    )
+    maintenance_queue_rollup.add_argument("--check-freshness", action="store_true")
+    maintenance_queue_rollup.add_argument("--format", choices=["json", "text"], default="json")
+
+    repo_fit_screen = sub.add_parser(
+        "repo-fit-screen",
+        help="[Advanced but supported] Build read-only external repo fit screen evidence",
+    )
+    repo_fit_screen.add_argument("--screen-text", required=True)
+    repo_fit_screen.add_argument("--out", default="build/sdetkit/repo-fit-screen.json")
+    repo_fit_screen.add_argument("--format", choices=["json", "text"], default="json")
+
+    candidate_freeze_readiness = sub.add_parser(
+        "candidate-freeze-readiness",
+        help="[Advanced but supported] Build read-only candidate freeze readiness evidence",
+    )
+    candidate_freeze_readiness.add_argument("--repo-fit-json", required=True)
+    candidate_freeze_readiness.add_argument(
+        "--out", default="build/sdetkit/candidate-freeze-readiness.json"
+    )
+    candidate_freeze_readiness.add_argument("--format", choices=["json", "text"], default="json")
+
+    candidate_evidence_checklist = sub.add_parser(
+        "candidate-evidence-checklist",
+        help="[Advanced but supported] Build read-only candidate evidence checklist",
+    )
+    candidate_evidence_checklist.add_argument("--readiness-json", required=True)
+    candidate_evidence_checklist.add_argument(
+        "--out", default="build/sdetkit/candidate-evidence-checklist.json"
+    )
+    candidate_evidence_checklist.add_argument("--format", choices=["json", "text"], default="json")
+
+    candidate_collision_checklist = sub.add_parser(
+        "candidate-collision-checklist",
+        help="[Advanced but supported] Build read-only candidate collision checklist",
+    )
+    candidate_collision_checklist.add_argument("--evidence-checklist-json", required=True)
+    candidate_collision_checklist.add_argument(
+        "--out", default="build/sdetkit/candidate-collision-checklist.json"
+    )
+    candidate_collision_checklist.add_argument("--format", choices=["json", "text"], default="json")
+
+    workflow_governance_report = sub.add_parser(
+        "workflow-governance-report",
+        help=argparse.SUPPRESS,
+    )
+    workflow_governance_report.add_argument("--root", default=".")
+    workflow_governance_report.add_argument(
+        "--out", default="build/sdetkit/workflow-governance-report.json"
+    )
+    workflow_governance_report.add_argument("--markdown-out", default="")
+    workflow_governance_report.add_argument("--format", choices=["json", "text"], default="json")
+    workflow_governance_report.add_argument("--check-freshness", action="store_true")
+
+    remediation_readiness_report = sub.add_parser(
+        "remediation-readiness-report",
+        help=argparse.SUPPRESS,
+    )
+    remediation_readiness_report.add_argument("--root", default=".")
+    remediation_readiness_report.add_argument("--policy", default="")
+    remediation_readiness_report.add_argument(
+        "--out", default="build/sdetkit/remediation-readiness-report.json"
+    )
+    remediation_readiness_report.add_argument("--markdown-out", default="")
+    remediation_readiness_report.add_argument("--format", choices=["json", "text"], default="json")
+    remediation_readiness_report.add_argument("--check-freshness", action="store_true")
+
+    public_command_surface_report = sub.add_parser(
+        "public-command-surface-report",
+        help=argparse.SUPPRESS,
+    )
+    public_command_surface_report.add_argument("--root", default=".")
+    public_command_surface_report.add_argument(
+        "--out", default="build/sdetkit/public-command-surface-report.json"
+    )
+    public_command_surface_report.add_argument("--markdown-out", default="")
+    public_command_surface_report.add_argument("--format", choices=["json", "text"], default="json")
+    public_command_surface_report.add_argument("--check-freshness", action="store_true")
+
+    product_maturity_radar = sub.add_parser(
+        "product-maturity-radar",
+        help=argparse.SUPPRESS,
+    )
+    product_maturity_radar.add_argument("--root", default=".")
+    product_maturity_radar.add_argument(
+        "--out", default="build/sdetkit/product-maturity-radar.json"
+    )
+    product_maturity_radar.add_argument("--markdown-out", default="")
+    product_maturity_radar.add_argument(
+        "--report-json",
+        action="append",
+        default=[],
+        metavar="DEPENDENCY=PATH",
+    )
+    product_maturity_radar.add_argument("--check-freshness", action="store_true")
+    product_maturity_radar.add_argument("--format", choices=["json", "text"], default="json")
+
+    cross_report_consistency = sub.add_parser(
+        "cross-report-consistency",
+        help=argparse.SUPPRESS,
+    )
+    cross_report_consistency.add_argument("--root", default=".")
+    cross_report_consistency.add_argument(
+        "--out", default="build/sdetkit/cross-report-consistency.json"
+    )
+    cross_report_consistency.add_argument("--markdown-out", default="")
+    cross_report_consistency.add_argument(
+        "--report-json",
+        action="append",
+        default=[],
+        metavar="REPORT-ID=PATH",
+    )
+    cross_report_consistency.add_argument("--complete", action="store_true")
+    cross_report_consistency.add_argument("--check-freshness", action="store_true")
+    cross_report_consistency.add_argument("--format", choices=["json", "text"], default="json")
+
+    report_dependency_graph = sub.add_parser(
+        "report-dependency-graph",
+        help=argparse.SUPPRESS,
+    )
+    report_dependency_graph.add_argument("--root", default=".")
+    report_dependency_graph.add_argument(
+        "--out", default="build/sdetkit/report-dependency-graph.json"
+    )
+    report_dependency_graph.add_argument("--markdown-out", default="")
+    report_dependency_graph.add_argument(
+        "--report-json",
+        action="append",
+        default=[],
+        metavar="REPORT-ID=PATH",
+    )
+    report_dependency_graph.add_argument("--complete", action="store_true")
+    report_dependency_graph.add_argument("--check-freshness", action="store_true")
+    report_dependency_graph.add_argument("--format", choices=["json", "text"], default="json")
+
+    report_dependency_graph_dashboard = sub.add_parser(
+        "report-dependency-graph-dashboard",
+        help=argparse.SUPPRESS,
+    )
+    report_dependency_graph_dashboard.add_argument("--graph-path", required=True)
+    report_dependency_graph_dashboard.add_argument(
+        "--format", choices=["html", "json"], default="html"
+    )
+    report_dependency_graph_dashboard.add_argument(
+        "--out",
+        default="build/sdetkit/report-dependency-graph-dashboard.html",
+    )
+
+    first_proof_quality_evidence = sub.add_parser(
+        "first-proof-quality-evidence",
+        help=argparse.SUPPRESS,
+    )
+    first_proof_quality_evidence.add_argument("--root", default=".")
+    first_proof_quality_evidence.add_argument(
+        "--artifact-dir",
+        default="build/first-proof",
+    )
+    first_proof_quality_evidence.add_argument(
+        "--out",
+        default="build/sdetkit/first-proof-quality-evidence.json",
+    )
+    first_proof_quality_evidence.add_argument(
+        "--markdown-out",
+        default="build/sdetkit/first-proof-quality-evidence.md",
+    )
+    first_proof_quality_evidence.add_argument(
+        "--check-freshness",
+        action="store_true",
+    )
+    first_proof_quality_evidence.add_argument(
+        "--format",
+        choices=["json", "text"],
+        default="json",
+    )
+
+    post_merge_verification = sub.add_parser(
+        "post-merge-verification",
+        help=argparse.SUPPRESS,
+    )
+    post_merge_verification.add_argument("--root", default=".")
+    post_merge_verification.add_argument(
+        "--evidence-dir",
+        required=True,
+    )
+    post_merge_verification.add_argument(
+        "--previous-main-sha",
+        required=True,
+    )
+    post_merge_verification.add_argument(
+        "--out-json",
+        default="build/sdetkit/post-merge-verification/report.json",
+    )
+    post_merge_verification.add_argument(
+        "--out-md",
+        default="build/sdetkit/post-merge-verification/report.md",
+    )
+    post_merge_verification.add_argument(
+        "--format",
+        choices=["json", "text"],
+        default="text",
+    )
+    post_merge_verification.add_argument(
+        "--check-freshness",
+        action="store_true",
+    )
+
+    release_readiness_evidence_package = sub.add_parser(
+        "release-readiness-evidence-package",
+        help=argparse.SUPPRESS,
+    )
+    release_readiness_evidence_package.add_argument("--root", default=".")
+    release_readiness_evidence_package.add_argument(
+        "--out-json",
+        default="build/sdetkit/release-readiness-evidence/package.json",
+    )
+    release_readiness_evidence_package.add_argument(
+        "--out-md",
+        default="build/sdetkit/release-readiness-evidence/package.md",
+    )
+    release_readiness_evidence_package.add_argument(
+        "--format",
+        choices=["json", "text"],
+        default="text",
+    )
+    release_readiness_evidence_package.add_argument(
+        "--check-freshness",
+        action="store_true",
+    )
+    release_readiness_evidence_package.add_argument(
+        "--pr-quality-summary",
+        default=None,
+    )
+    release_readiness_evidence_package.add_argument(
+        "--pr-quality-handoff-manifest",
+        default=None,
+    )
+
+    fit = sub.add_parser("fit", help="Risk-based fit recommendation planner")
+    fit.add_argument("--repo-size", choices=["small", "medium", "large"], default="small")
+    fit.add_argument("--team-size", choices=["small", "medium", "large"], default="small")
+    fit.add_argument("--release-frequency", choices=["low", "medium", "high"], default="low")
+    fit.add_argument("--change-failure-impact", choices=["low", "medium", "high"], default="medium")
+    fit.add_argument("--compliance-pressure", choices=["low", "medium", "high"], default="low")
+    fit.add_argument("--format", choices=["text", "json"], default="text")
+    fit.add_argument("--out", default="")
+
+    adopt_scan = sub.add_parser(
+        "adopt-scan", help="Scan a repo and produce an SDETKit adoption plan"
+    )
+    adopt_scan.add_argument("path", nargs="?", default=".")
+    adopt_scan.add_argument("--max-files", type=int, default=4000)
+    adopt_scan.add_argument("--format", choices=["text", "json"], default="text")
+    adopt_scan.add_argument("--out", default="")
+
+    sta = sub.add_parser(
+        "start",
+        help="[Public / stable] Guided start shortcut (role/journey onboarding entrypoint)",
+    )
+    sta.add_argument("--role", choices=["all", "sdet", "platform", "manager"], default="all")
+    sta.add_argument(
+        "--journey",
+        choices=["all", "fast-start", "first-pr", "ci-rollout", "artifact-review"],
+        default="fast-start",
+    )
+    sta.add_argument("--platform", choices=["all", "linux", "mac", "windows"], default="all")
+    sta.add_argument("--format", choices=["text", "markdown", "json"], default="markdown")
+    sta.add_argument("--output", default="")
+
+    ono = sub.add_parser("onboarding-optimization", help="Onboarding optimization playbook")
+    ono.add_argument("args", nargs=argparse.REMAINDER)
+
+    cau = sub.add_parser("community-activation", help="Community activation rollout playbook")
+    cau.add_argument("args", nargs=argparse.REMAINDER)
+
+    exc = sub.add_parser("external-contribution", help="External contribution rollout playbook")
+    exc.add_argument("args", nargs=argparse.REMAINDER)
+
+    kpa = sub.add_parser("kpi-audit", help="KPI audit and tracking playbook")
+    kpa.add_argument("args", nargs=argparse.REMAINDER)
+
+    kpr = sub.add_parser("kpi-report", help="Release confidence KPI weekly pack")
+    kpr.add_argument("args", nargs=argparse.REMAINDER)
+
+    dwr = sub.add_parser("weekly-review-lane")
+    dwr.set_defaults(cmd="weekly-review-lane")
+    dwr.add_argument("args", nargs=argparse.REMAINDER)
+
+    d29 = sub.add_parser("phase1-hardening")
+    d29.set_defaults(cmd="phase1-hardening")
+    d29.add_argument("args", nargs=argparse.REMAINDER)
+
+    d30 = sub.add_parser("phase1-wrap")
+    d30.set_defaults(cmd="phase1-wrap")
+    d30.add_argument("args", nargs=argparse.REMAINDER)
+
+    d31 = sub.add_parser("phase2-kickoff")
+    d31.set_defaults(cmd="phase2-kickoff")
+    d31.add_argument("args", nargs=argparse.REMAINDER)
+
+    d32 = sub.add_parser("release-cadence")
+    d32.set_defaults(cmd="release-cadence")
+    d32.add_argument("args", nargs=argparse.REMAINDER)
+
+    ex33 = sub.add_parser("example-asset")
+    ex33.set_defaults(cmd="example-asset")
+    d33 = sub.add_parser("demo-asset")
+    d33.set_defaults(cmd="demo-asset")
+    d33.add_argument("args", nargs=argparse.REMAINDER)
+
+    ex34 = sub.add_parser("example-asset2")
+    ex34.set_defaults(cmd="example-asset2")
+    d34 = sub.add_parser("demo-asset2")
+    d34.set_defaults(cmd="demo-asset2")
+    d34.add_argument("args", nargs=argparse.REMAINDER)
+
+    d35 = sub.add_parser("kpi-instrumentation")
+    d35.set_defaults(cmd="kpi-instrumentation")
+    d35.add_argument("args", nargs=argparse.REMAINDER)
+
+    d36 = sub.add_parser("distribution-closeout")
+    d36.set_defaults(cmd="distribution-closeout")
+    d36.add_argument("args", nargs=argparse.REMAINDER)
+
+    d37 = sub.add_parser("experiment-lane")
+    d37.set_defaults(cmd="experiment-lane")
+    d37.add_argument("args", nargs=argparse.REMAINDER)
+
+    d38 = sub.add_parser("distribution-batch")
+    d38.set_defaults(cmd="distribution-batch")
+    d38.add_argument("args", nargs=argparse.REMAINDER)
+
+    d39 = sub.add_parser("playbook-post")
+    d39.set_defaults(cmd="playbook-post")
+    d39.add_argument("args", nargs=argparse.REMAINDER)
+
+    d40 = sub.add_parser("scale-lane")
+    d40.set_defaults(cmd="scale-lane")
+    d40.add_argument("args", nargs=argparse.REMAINDER)
+
+    d41 = sub.add_parser("expansion-automation")
+    d41.set_defaults(cmd="expansion-automation")
+    d41.add_argument("args", nargs=argparse.REMAINDER)
+
+    d42 = sub.add_parser("optimization-closeout-foundation")
+    d42.set_defaults(cmd="optimization-closeout-foundation")
+    d42.add_argument("args", nargs=argparse.REMAINDER)
+
+    d43 = sub.add_parser("acceleration-closeout")
+    d43.set_defaults(cmd="acceleration-closeout")
+    d43.add_argument("args", nargs=argparse.REMAINDER)
+
+    d44 = sub.add_parser("scale-closeout")
+    d44.set_defaults(cmd="scale-closeout")
+    d44.add_argument("args", nargs=argparse.REMAINDER)
+
+    d45 = sub.add_parser("expansion-closeout")
+    d45.set_defaults(cmd="expansion-closeout")
+    d45.add_argument("args", nargs=argparse.REMAINDER)
+
+    d46 = sub.add_parser("optimization-closeout")
+    d46.set_defaults(cmd="optimization-closeout")
+    d46.add_argument("args", nargs=argparse.REMAINDER)
+
+    d47 = sub.add_parser("reliability-closeout")
+    d47.set_defaults(cmd="reliability-closeout")
+    d47.add_argument("args", nargs=argparse.REMAINDER)
+    d48 = sub.add_parser("objection-closeout")
+    d48.set_defaults(cmd="objection-closeout")
+    d48.add_argument("args", nargs=argparse.REMAINDER)
+    d49 = sub.add_parser("weekly-review-closeout")
+    d49.set_defaults(cmd="weekly-review-closeout")
+    d49.add_argument("args", nargs=argparse.REMAINDER)
+    d50 = sub.add_parser("execution-prioritization-closeout")
+    d50.set_defaults(cmd="execution-prioritization-closeout")
+    d50.add_argument("args", nargs=argparse.REMAINDER)
+    d51 = sub.add_parser("case-snippet-closeout")
+    d51.set_defaults(cmd="case-snippet-closeout")
+    d51.add_argument("args", nargs=argparse.REMAINDER)
+    d52 = sub.add_parser("narrative-closeout")
+    d52.set_defaults(cmd="narrative-closeout")
+    d52.add_argument("args", nargs=argparse.REMAINDER)
+
+    d53 = sub.add_parser("docs-loop-closeout")
+    d53.set_defaults(cmd="docs-loop-closeout")
+    d53.add_argument("args", nargs=argparse.REMAINDER)
+
+    d55 = sub.add_parser("contributor-activation-closeout")
+    d55.set_defaults(cmd="contributor-activation-closeout")
+    d55.add_argument("args", nargs=argparse.REMAINDER)
+
+    d56 = sub.add_parser("stabilization-closeout")
+    d56.set_defaults(cmd="stabilization-closeout")
+    d56.add_argument("args", nargs=argparse.REMAINDER)
+
+    d57 = sub.add_parser("kpi-deep-audit-closeout")
+    d57.set_defaults(cmd="kpi-deep-audit-closeout")
+    d57.add_argument("args", nargs=argparse.REMAINDER)
+
+    d58 = sub.add_parser("release-readiness-hardening-completion-report")
+    d58.set_defaults(cmd="release-readiness-hardening-completion-report")
+    d58.add_argument("args", nargs=argparse.REMAINDER)
+
+    d59 = sub.add_parser("platform-readiness-preplan-completion-report")
+    d59.set_defaults(cmd="platform-readiness-preplan-completion-report")
+    d59.add_argument("args", nargs=argparse.REMAINDER)
+
+    d60 = sub.add_parser("release-readiness-wrap-handoff-completion-report")
+    d60.set_defaults(cmd="release-readiness-wrap-handoff-completion-report")
+    d60.add_argument("args", nargs=argparse.REMAINDER)
+
+    d61 = sub.add_parser("platform-readiness-kickoff-completion-report")
+    d61.set_defaults(cmd="platform-readiness-kickoff-completion-report")
+    d61.add_argument("args", nargs=argparse.REMAINDER)
+
+    d62 = sub.add_parser("community-program-closeout")
+    d62.set_defaults(cmd="community-program-closeout")
+    d62.add_argument("args", nargs=argparse.REMAINDER)
+
+    d63 = sub.add_parser("onboarding-activation-closeout")
+    d63.set_defaults(cmd="onboarding-activation-closeout")
+    d63.add_argument("args", nargs=argparse.REMAINDER)
+
+    d64 = sub.add_parser("integration-expansion-closeout")
+    d64.set_defaults(cmd="integration-expansion-closeout")
+    d64.add_argument("args", nargs=argparse.REMAINDER)
+
+    d65 = sub.add_parser("weekly-review-closeout-2")
+    d65.set_defaults(cmd="weekly-review-closeout-2")
+    d65.add_argument("args", nargs=argparse.REMAINDER)
+
+    d66 = sub.add_parser("integration-expansion2-closeout")
+    d66.set_defaults(cmd="integration-expansion2-closeout")
+    d66.add_argument("args", nargs=argparse.REMAINDER)
+
+    d67 = sub.add_parser("integration-expansion3-closeout")
+    d67.set_defaults(cmd="integration-expansion3-closeout")
+    d67.add_argument("args", nargs=argparse.REMAINDER)
+
+    d68 = sub.add_parser("integration-expansion4-closeout")
+    d68.set_defaults(cmd="integration-expansion4-closeout")
+    d68.add_argument("args", nargs=argparse.REMAINDER)
+
+    d69 = sub.add_parser("case-study-prep1-closeout")
+    d69.set_defaults(cmd="case-study-prep1-closeout")
+    d69.add_argument("args", nargs=argparse.REMAINDER)
+
+    d70 = sub.add_parser("case-study-prep2-closeout")
+    d70.set_defaults(cmd="case-study-prep2-closeout")
+    d70.add_argument("args", nargs=argparse.REMAINDER)
+    d71 = sub.add_parser("case-study-prep3-closeout")
+    d71.set_defaults(cmd="case-study-prep3-closeout")
+    d71.add_argument("args", nargs=argparse.REMAINDER)
+    d72 = sub.add_parser("case-study-prep4-closeout")
+    d72.set_defaults(cmd="case-study-prep4-closeout")
+    d72.add_argument("args", nargs=argparse.REMAINDER)
+    d73 = sub.add_parser("case-study-launch-closeout")
+    d73.set_defaults(cmd="case-study-launch-closeout")
+    d73.add_argument("args", nargs=argparse.REMAINDER)
+    d74 = sub.add_parser("distribution-scaling-closeout")
+    d74.set_defaults(cmd="distribution-scaling-closeout")
+    d74.add_argument("args", nargs=argparse.REMAINDER)
+    d75 = sub.add_parser("trust-assets-refresh-closeout")
+    d75.set_defaults(cmd="trust-assets-refresh-closeout")
+    d75.add_argument("args", nargs=argparse.REMAINDER)
+    d76 = sub.add_parser("contributor-recognition-closeout")
+    d76.set_defaults(cmd="contributor-recognition-closeout")
+    d76.add_argument("args", nargs=argparse.REMAINDER)
+    d77 = sub.add_parser("community-touchpoint-closeout")
+    d77.add_argument("args", nargs=argparse.REMAINDER)
+    d78 = sub.add_parser("ecosystem-priorities-closeout")
+    d78.add_argument("args", nargs=argparse.REMAINDER)
+    d79 = sub.add_parser("scale-upgrade-closeout")
+    d79.add_argument("args", nargs=argparse.REMAINDER)
+    d80 = sub.add_parser("partner-outreach-closeout")
+    d80.add_argument("args", nargs=argparse.REMAINDER)
+    d81 = sub.add_parser("growth-campaign-closeout")
+    d81.set_defaults(cmd="growth-campaign-closeout")
+    d81.add_argument("args", nargs=argparse.REMAINDER)
+    d82 = sub.add_parser("integration-feedback-closeout")
+    d82.set_defaults(cmd="integration-feedback-closeout")
+    d82.add_argument("args", nargs=argparse.REMAINDER)
+    d83 = sub.add_parser("trust-faq-expansion-closeout")
+    d83.set_defaults(cmd="trust-faq-expansion-closeout")
+    d83.add_argument("args", nargs=argparse.REMAINDER)
+    d84 = sub.add_parser("evidence-narrative-closeout")
+    d84.set_defaults(cmd="evidence-narrative-closeout")
+    d84.add_argument("args", nargs=argparse.REMAINDER)
+    d85 = sub.add_parser("release-prioritization-closeout")
+    d85.set_defaults(cmd="release-prioritization-closeout")
+    d85.add_argument("args", nargs=argparse.REMAINDER)
+    d86 = sub.add_parser("launch-readiness-closeout")
+    d86.set_defaults(cmd="launch-readiness-closeout")
+    d86.add_argument("args", nargs=argparse.REMAINDER)
+    d87 = sub.add_parser("governance-handoff-closeout")
+    d87.set_defaults(cmd="governance-handoff-closeout")
+    d87.add_argument("args", nargs=argparse.REMAINDER)
+    d88 = sub.add_parser("governance-priorities-closeout")
+    d88.set_defaults(cmd="governance-priorities-closeout")
+    d88.add_argument("args", nargs=argparse.REMAINDER)
+    d89 = sub.add_parser("governance-scale-closeout")
+    d89.set_defaults(cmd="governance-scale-closeout")
+    d89.add_argument("args", nargs=argparse.REMAINDER)
+    d90 = sub.add_parser("platform-readiness-wrap-publication-completion-report")
+    d90.set_defaults(cmd="platform-readiness-wrap-publication-completion-report")
+    d90.add_argument("args", nargs=argparse.REMAINDER)
+    parser = sub.add_parser(
+        "continuous-upgrade-closeout-1", aliases=["continuous-upgrade-closeout-1"]
+    )
+    parser.set_defaults(cmd="continuous-upgrade-closeout-1")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    parser = sub.add_parser("continuous-upgrade-closeout-2")
+    parser.set_defaults(cmd="continuous-upgrade-closeout-2")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    c3 = sub.add_parser("continuous-upgrade-closeout-3")
+    c3.set_defaults(cmd="continuous-upgrade-closeout-3")
+    c3.add_argument("args", nargs=argparse.REMAINDER)
+    d94 = sub.add_parser("continuous-upgrade-closeout-4")
+    d94.set_defaults(cmd="continuous-upgrade-closeout-4")
+    d94.add_argument("args", nargs=argparse.REMAINDER)
+    d95 = sub.add_parser("continuous-upgrade-closeout-5")
+    d95.set_defaults(cmd="continuous-upgrade-closeout-5")
+    d95.add_argument("args", nargs=argparse.REMAINDER)
+    parser = sub.add_parser("continuous-upgrade-closeout-6")
+    parser.set_defaults(cmd="continuous-upgrade-closeout-6")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    d97 = sub.add_parser("continuous-upgrade-closeout-7")
+    d97.set_defaults(cmd="continuous-upgrade-closeout-7")
+    d97.add_argument("args", nargs=argparse.REMAINDER)
+    parser = sub.add_parser("continuous-upgrade-closeout-8")
+    parser.set_defaults(cmd="continuous-upgrade-closeout-8")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+
+    d99 = sub.add_parser("continuous-upgrade-closeout-9")
+    d99.set_defaults(cmd="continuous-upgrade-closeout-9")
+    d99.add_argument("args", nargs=argparse.REMAINDER)
+
+    d100 = sub.add_parser("continuous-upgrade-closeout-10")
+    d100.set_defaults(cmd="continuous-upgrade-closeout-10")
+    d100.add_argument("args", nargs=argparse.REMAINDER)
+    d101 = sub.add_parser("continuous-upgrade-closeout-11")
+    d101.set_defaults(cmd="continuous-upgrade-closeout-11")
+    d101.add_argument("args", nargs=argparse.REMAINDER)
+
+    obj = sub.add_parser("objection-handling", help="Objection handling playbook")
+    obj.add_argument("args", nargs=argparse.REMAINDER)
+
+    ex = sub.add_parser("example", help="Example playbook")
+    ex.set_defaults(cmd="example")
+    ex.add_argument("--format", choices=["json", "text"], default="text")
+    ex.add_argument("--strict", action="store_true")
+    ex.add_argument("--root", default=".")
+    ex.add_argument("args", nargs=argparse.REMAINDER)
+
+    dmo = sub.add_parser("demo", help="Example playbook compatibility command")
+    dmo.add_argument("args", nargs=argparse.REMAINDER)
+
+    fct = sub.add_parser("first-contribution", help="First contribution playbook")
+    fct.add_argument("args", nargs=argparse.REMAINDER)
+
+    ctf = sub.add_parser("contributor-funnel", help="Contributor funnel playbook")
+    ctf.add_argument("args", nargs=argparse.REMAINDER)
+
+    eva = sub.add_parser("evidence-assets", help="Evidence assets and trust collateral")
+    eva.add_argument("args", nargs=argparse.REMAINDER)
+    _add_passthrough_subcommand(
+        sub,
+        "proof",
+        help_text=argparse.SUPPRESS,
+        default_cmd="evidence-assets",
+    )
+
+    ttp = sub.add_parser("triage-templates", help="Issue and triage template workflows")
+    ttp.add_argument("args", nargs=argparse.REMAINDER)
+
+    dql = sub.add_parser("docs-quality", help="Docs quality and link checks")
+    dql.add_argument("args", nargs=argparse.REMAINDER)
+    _add_passthrough_subcommand(
+        sub,
+        "docs-qa",
+        help_text=argparse.SUPPRESS,
+        default_cmd="docs-quality",
+    )
+
+    wrv = sub.add_parser("weekly-review", help="Weekly review playbook")
+    wrv.add_argument("args", nargs=argparse.REMAINDER)
+
+    dgo = sub.add_parser("docs-governance", help="Docs navigation validation")
+    dgo.add_argument("args", nargs=argparse.REMAINDER)
+    _add_passthrough_subcommand(
+        sub,
+        "docs-nav",
+        help_text=argparse.SUPPRESS,
+        default_cmd="docs-governance",
+    )
+    rdm = sub.add_parser("roadmap")
+    rdm.add_argument("args", nargs=argparse.REMAINDER)
+
+    suc = sub.add_parser("startup-readiness", help="Startup readiness playbook")
+    suc.add_argument("args", nargs=argparse.REMAINDER)
+
+    ugh = sub.add_parser("upgrade-hub", help="Deep-dig hidden upgrade lanes and contracts")
+    ugh.add_argument("args", nargs=argparse.REMAINDER)
+
+    spk = sub.add_parser("sdet-package")
+    spk.add_argument("args", nargs=argparse.REMAINDER)
+
+    eur = sub.add_parser("enterprise-readiness", help="Enterprise readiness playbook")
+    eur.add_argument("args", nargs=argparse.REMAINDER)
+
+    gha = sub.add_parser("github-actions-onboarding", help="GitHub Actions onboarding playbook")
+    gha.add_argument("args", nargs=argparse.REMAINDER)
+    _add_passthrough_subcommand(
+        sub,
+        "github-actions-quickstart",
+        help_text=argparse.SUPPRESS,
+        default_cmd="github-actions-onboarding",
+    )
+
+    glc = sub.add_parser("gitlab-ci-onboarding", help="GitLab CI onboarding playbook")
+    glc.add_argument("args", nargs=argparse.REMAINDER)
+    _add_passthrough_subcommand(
+        sub,
+        "gitlab-ci-quickstart",
+        help_text=argparse.SUPPRESS,
+        default_cmd="gitlab-ci-onboarding",
+    )
+
+    qcr = sub.add_parser("contribution-quality-report", help="Contribution quality report")
+    qcr.add_argument("args", nargs=argparse.REMAINDER)
+    _add_passthrough_subcommand(
+        sub,
+        "quality-contribution-delta",
+        help_text=argparse.SUPPRESS,
+        default_cmd="contribution-quality-report",
+    )
+
+    rep = sub.add_parser("reliability-evidence-pack", help="Reliability evidence pack")
+    rep.add_argument("args", nargs=argparse.REMAINDER)
+
+    rrd = sub.add_parser("release-readiness", help="Release readiness board")
+    rrd.add_argument("args", nargs=argparse.REMAINDER)
+
+    rnc = sub.add_parser("release-communications", help="Release communications playbook")
+    rnc.add_argument("args", nargs=argparse.REMAINDER)
+
+    tsa = sub.add_parser("trust-assets", help="Trust assets playbook")
+    tsa.add_argument("args", nargs=argparse.REMAINDER)
+    if not show_hidden_commands:
+        filter_hidden_subcommands(p)
+    emit_cli_timing(
+        f"event=parser-build show_hidden={str(show_hidden_commands).lower()} elapsed_ms={(time.perf_counter() - started) * 1000.0:.3f}"
+    )
+    return p, sub
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    argv_list = list(sys.argv[1:] if argv is None else argv)
+    if argv_list and argv_list[0] == "triage-ci":
+        return _run_module_main("sdetkit.ci_failure_triage", argv_list[1:])
+    argv = argv_list
+    if argv is None:
+        argv = sys.argv[1:]
+
+    argv, no_legacy_hint = extract_global_flag(argv, "--no-legacy-hint")
+    argv, show_hidden_commands = extract_global_flag(argv, "--show-hidden")
+
+    if argv:
+        argv = list(argv)
+        argv[0] = resolve_non_day_playbook_alias(str(argv[0]))
+
+    emit_cli_startup_snapshot(argv[0] if argv else None)
+
+    if argv and argv[0] == "legacy":
+        legacy_result = handle_legacy_namespace(argv)
+        if legacy_result is not None:
+            return legacy_result
+        return main(list(argv[1:]))
+
+    core_preparse_result = dispatch_core_preparse(argv)
+    if core_preparse_result is not None:
+        return core_preparse_result
+
+    preparse_result = dispatch_preparse_shortcut(
+        argv,
+        no_legacy_hint=no_legacy_hint,
+        run_module_main=_run_module_main,
+    )
+    if preparse_result is not None:
+        return preparse_result
+
+    p, sub = _build_root_parser(show_hidden_commands=show_hidden_commands)
+
+    if not show_hidden_commands:
+        hide_help_subcommands(sub)
+
+    ns = p.parse_args(argv)
+
+    if ns.cmd == "baseline":
+        return run_baseline(list(getattr(ns, "args", [])))
+
+    if ns.cmd == "playbooks":
+        from .playbooks_cli import main as _playbooks_main
+
+        return _playbooks_main(list(ns.args))
+
+    if ns.cmd == "kits":
+        return _run_module_main("sdetkit.kits", ns.args)
+
+    if ns.cmd == "release":
+        return dispatch_release_subcommand(ns.args, run_module_main=_run_module_main)
+
+    if ns.cmd == "mission-control":
+        forwarded = list(ns.args)
+        if bool(getattr(ns, "mission_control_help", False)):
+            forwarded.insert(0, "--help")
+        return _run_module_main("sdetkit.mission_control", forwarded)
+
+    if ns.cmd == "operator-loop":
+        forwarded = [
+            "--repo",
+            str(ns.repo),
+            "--out-dir",
+            str(ns.out_dir),
+            "--quality-outcome",
+            str(ns.quality_outcome),
+            "--format",
+            str(ns.format),
+        ]
+        for flag, value in (
+            ("--quality-log", ns.quality_log),
+            ("--sentinel-control-room", ns.sentinel_control_room),
+            ("--evidence-graph", ns.evidence_graph),
+            ("--failure-bundle", ns.failure_bundle),
+            ("--changed-files", ns.changed_files),
+            ("--action-report", ns.action_report),
+            ("--check-intelligence", ns.check_intelligence),
+        ):
+            if value:
+                forwarded.extend([flag, str(value)])
+        if bool(ns.verify):
+            forwarded.append("--verify")
+        return _run_module_main("sdetkit.operator_evidence_loop", forwarded)
+
+    if ns.cmd == "inspect":
+        return _run_module_main("sdetkit.inspect_data", build_inspect_forwarded_args(ns, ns.args))
+    if ns.cmd == "inspect-compare":
+        return _run_module_main(
+            "sdetkit.inspect_compare",
+            build_inspect_compare_forwarded_args(ns, ns.args),
+        )
+    if ns.cmd == "inspect-project":
+        return _run_module_main("sdetkit.inspect_project", build_inspect_project_forwarded_args(ns))
+    if ns.cmd == "review":
+        return _run_module_main("sdetkit.review", build_review_forwarded_args(ns))
+
+    if ns.cmd == "serve":
+        return _run_module_main("sdetkit.serve", build_serve_args(ns))
+
+    if ns.cmd == "readiness":
+        return _run_module_main("sdetkit.readiness", ns.args)
+
+    if ns.cmd == "init":
+        return _run_module_main("sdetkit.repo", build_repo_init_forwarded_args(ns))
+
+    if ns.cmd == "start":
+        forwarded = [
+            "--role",
+            str(ns.role),
+            "--journey",
+            str(ns.journey),
+            "--platform",
+            str(ns.platform),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.output):
+            forwarded.extend(["--output", str(ns.output)])
+        return _run_module_main("sdetkit.onboarding", forwarded)
+
+    if ns.cmd == "adoption":
+        forwarded = [
+            "--fit",
+            str(ns.fit),
+            "--summary",
+            str(ns.summary),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.out):
+            forwarded.extend(["--out", str(ns.out)])
+        if str(ns.history):
+            forwarded.extend(["--history", str(ns.history)])
+        if str(ns.history_rollup_out):
+            forwarded.extend(["--history-rollup-out", str(ns.history_rollup_out)])
+        forwarded.extend(["--policy-profile", str(ns.policy_profile)])
+        if ns.escalation_consecutive_no_ship is not None:
+            forwarded.extend(
+                ["--escalation-consecutive-no-ship", str(ns.escalation_consecutive_no_ship)]
+            )
+        if ns.escalation_min_runs is not None:
+            forwarded.extend(["--escalation-min-runs", str(ns.escalation_min_runs)])
+        if ns.escalation_min_p0_rate is not None:
+            forwarded.extend(["--escalation-min-p0-rate", str(ns.escalation_min_p0_rate)])
+        return _run_module_main("sdetkit.adoption", forwarded)
+
+    if ns.cmd == "adoption-surface":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        return _run_module_main("sdetkit.adoption_surface", forwarded)
+
+    if ns.cmd == "adoption-learning":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out",
+            str(ns.out),
+            "--trial-name",
+            str(ns.trial_name),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.surface_json):
+            forwarded.extend(["--surface-json", str(ns.surface_json)])
+        return _run_module_main("sdetkit.adoption_learning", forwarded)
+
+    if ns.cmd == "public-repo-eligibility":
+        forwarded = [
+            "--repo-url",
+            str(ns.repo_url),
+            "--license",
+            str(ns.license_id),
+            "--out",
+            str(ns.out),
+            "--repo-size",
+            str(ns.repo_size),
+            "--format",
+            str(ns.format),
+        ]
+        if ns.private:
+            forwarded.append("--private")
+        if ns.owned_by_us:
+            forwarded.append("--owned-by-us")
+        if ns.has_no_ai_notice:
+            forwarded.append("--has-no-ai-notice")
+        if ns.has_no_benchmark_notice:
+            forwarded.append("--has-no-benchmark-notice")
+        if ns.has_security_sensitive_content:
+            forwarded.append("--has-security-sensitive-content")
+        if ns.has_malware_or_exploit_content:
+            forwarded.append("--has-malware-or-exploit-content")
+        return _run_module_main("sdetkit.adoption_public_repo_eligibility", forwarded)
+
+    if ns.cmd == "adoption-proof-recommendations":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.surface_json):
+            forwarded.extend(["--surface-json", str(ns.surface_json)])
+        return _run_module_main("sdetkit.adoption_proof_recommendations", forwarded)
+
+    if ns.cmd == "adoption-repo-topology":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.surface_json):
+            forwarded.extend(["--surface-json", str(ns.surface_json)])
+        if str(ns.proof_json):
+            forwarded.extend(["--proof-json", str(ns.proof_json)])
+        return _run_module_main("sdetkit.adoption_repo_topology", forwarded)
+
+    if ns.cmd == "adoption-evidence-bundle":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.surface_json):
+            forwarded.extend(["--surface-json", str(ns.surface_json)])
+        if str(ns.proof_json):
+            forwarded.extend(["--proof-json", str(ns.proof_json)])
+        if str(ns.topology_json):
+            forwarded.extend(["--topology-json", str(ns.topology_json)])
+        if str(ns.learning_json):
+            forwarded.extend(["--learning-json", str(ns.learning_json)])
+        return _run_module_main("sdetkit.adoption_evidence_bundle", forwarded)
+
+    if ns.cmd == "adoption-external-integration":
+        forwarded = [
+            "--target-root",
+            str(ns.target_root),
+            "--artifact-dir",
+            str(ns.artifact_dir),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.out):
+            forwarded.extend(["--out", str(ns.out)])
+        return _run_module_main("sdetkit.adoption_external_integration", forwarded)
+
+    if ns.cmd == "adoption-real-world-learning-matrix":
+        forwarded = [
+            "--matrix-json",
+            str(ns.matrix_json),
+            "--artifact-root",
+            str(ns.artifact_root),
+            "--minimum-repos",
+            str(ns.minimum_repos),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.out):
+            forwarded.extend(["--out", str(ns.out)])
+        if str(ns.markdown_out):
+            forwarded.extend(["--markdown-out", str(ns.markdown_out)])
+        return _run_module_main("sdetkit.adoption_real_world_learning_matrix", forwarded)
+
+    if ns.cmd == "adoption-learning-report":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--matrix-json",
+            str(ns.matrix_json),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.repo_memory_profile):
+            forwarded.extend(["--repo-memory-profile", str(ns.repo_memory_profile)])
+        if str(ns.markdown_out):
+            forwarded.extend(["--markdown-out", str(ns.markdown_out)])
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main("sdetkit.adoption_learning_report", forwarded)
+
+    if ns.cmd == "adoption-public-trial-matrix-report":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--matrix-json",
+            str(ns.matrix_json),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.markdown_out):
+            forwarded.extend(["--markdown-out", str(ns.markdown_out)])
+        return _run_module_main(
+            "sdetkit.adoption_public_repo_trial_matrix_report",
+            forwarded,
+        )
+
+    if ns.cmd == "release-anti-hijack-threat-model":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--workflow",
+            str(ns.workflow),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.markdown_out):
+            forwarded.extend(["--markdown-out", str(ns.markdown_out)])
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main("sdetkit.release_anti_hijack_threat_model", forwarded)
+
+    if ns.cmd == "issue-queue-classifier":
+        forwarded = [
+            "--issues-json",
+            str(ns.issues_json),
+            "--out",
+            str(ns.out),
+            "--root",
+            str(ns.root),
+            "--format",
+            str(ns.format),
+        ]
+        for source_run_id in ns.source_run_id:
+            forwarded.extend(["--source-run-id", str(source_run_id)])
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main("sdetkit.issue_queue_classifier", forwarded)
+
+    if ns.cmd == "automation-health":
+        forwarded = [
+            "--issues-json",
+            str(ns.issues_json),
+            "--out",
+            str(ns.out),
+            "--root",
+            str(ns.root),
+            "--format",
+            str(ns.format),
+        ]
+        for source_run_id in ns.source_run_id:
+            forwarded.extend(["--source-run-id", str(source_run_id)])
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main("sdetkit.automation_health", forwarded)
+
+    if ns.cmd == "security-followup-disposition":
+        forwarded = [
+            "--issues-json",
+            str(ns.issues_json),
+            "--security-json",
+            str(ns.security_json),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        return _run_module_main("sdetkit.security_followup_disposition", forwarded)
+
+    if ns.cmd == "security-findings-inventory":
+        forwarded = [
+            "--security-json",
+            str(ns.security_json),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        return _run_module_main("sdetkit.security_findings_inventory", forwarded)
+
+    if ns.cmd == "security-finding-disposition-matrix":
+        forwarded = [
+            "--inventory-json",
+            str(ns.inventory_json),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        return _run_module_main("sdetkit.security_finding_disposition_matrix", forwarded)
+
+    if ns.cmd == "security-review-packet":
+        forwarded = [
+            "--inventory-json",
+            str(ns.inventory_json),
+            "--matrix-json",
+            str(ns.matrix_json),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        return _run_module_main("sdetkit.security_review_packet", forwarded)
+
+    if ns.cmd == "professional-naming-inventory":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        for term in ns.terms or []:
+            forwarded.extend(["--term", str(term)])
+        return _run_module_main("sdetkit.professional_naming_inventory", forwarded)
+
+    if ns.cmd == "professional-naming-cleanup-plan":
+        forwarded = [
+            "--inventory-json",
+            str(ns.inventory_json),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        return _run_module_main("sdetkit.professional_naming_cleanup_plan", forwarded)
+
+    if ns.cmd == "maintenance-queue-rollup":
+        forwarded = [
+            "--issue-queue-json",
+            str(ns.issue_queue_json),
+            "--automation-health-json",
+            str(ns.automation_health_json),
+            "--security-followup-json",
+            str(ns.security_followup_json),
+            "--out",
+            str(ns.out),
+            "--root",
+            str(ns.root),
+            "--format",
+            str(ns.format),
+        ]
+        for source_run_id in ns.source_run_id:
+            forwarded.extend(["--source-run-id", str(source_run_id)])
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main("sdetkit.maintenance_queue_rollup", forwarded)
+
+    if ns.cmd == "repo-fit-screen":
+        forwarded = [
+            "--screen-text",
+            str(ns.screen_text),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        return _run_module_main("sdetkit.repo_fit_screen", forwarded)
+
+    if ns.cmd == "candidate-freeze-readiness":
+        forwarded = [
+            "--repo-fit-json",
+            str(ns.repo_fit_json),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        return _run_module_main("sdetkit.candidate_freeze_readiness", forwarded)
+
+    if ns.cmd == "candidate-evidence-checklist":
+        forwarded = [
+            "--readiness-json",
+            str(ns.readiness_json),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        return _run_module_main("sdetkit.candidate_evidence_checklist", forwarded)
+
+    if ns.cmd == "candidate-collision-checklist":
+        forwarded = [
+            "--evidence-checklist-json",
+            str(ns.evidence_checklist_json),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        return _run_module_main("sdetkit.candidate_collision_checklist", forwarded)
+
+    if ns.cmd == "boost":
+        if getattr(ns, "boost_cmd", None) == "scan":
+            forwarded = [
+                "scan",
+                str(ns.path),
+                "--minutes",
+                str(ns.minutes),
+                "--max-lines",
+                str(ns.max_lines),
+                "--format",
+                str(ns.format),
+            ]
+            if bool(ns.deep):
+                forwarded.append("--deep")
+            if bool(ns.learn):
+                forwarded.append("--learn")
+            forwarded.extend(["--db", str(ns.db), "--index-out", str(ns.index_out)])
+            if str(ns.evidence_dir):
+                forwarded.extend(["--evidence-dir", str(ns.evidence_dir)])
+            return _run_module_main("sdetkit.boost", forwarded)
+        return _run_module_main("sdetkit.boost", [])
+    if ns.cmd == "release-room":
+        if getattr(ns, "release_room_cmd", None) == "plan":
+            forwarded = [
+                "plan",
+                str(ns.path),
+                "--db",
+                str(ns.db),
+                "--max-lines",
+                str(ns.max_lines),
+                "--format",
+                str(ns.format),
+            ]
+            if bool(ns.deep):
+                forwarded.append("--deep")
+            if bool(ns.learn):
+                forwarded.append("--learn")
+            if str(ns.evidence_dir):
+                forwarded.extend(["--evidence-dir", str(ns.evidence_dir)])
+            return _run_module_main("sdetkit.release_room", forwarded)
+        return _run_module_main("sdetkit.release_room", [])
+
+    if ns.cmd == "adaptive":
+        if getattr(ns, "adaptive_cmd", None) == "init":
+            return _run_module_main("sdetkit.adaptive", ["init", "--db", str(ns.db)])
+        if getattr(ns, "adaptive_cmd", None) == "ingest":
+            return _run_module_main(
+                "sdetkit.adaptive", ["ingest", str(ns.index_json), "--db", str(ns.db)]
+            )
+        if getattr(ns, "adaptive_cmd", None) == "history":
+            return _run_module_main(
+                "sdetkit.adaptive", ["history", "--db", str(ns.db), "--format", str(ns.format)]
+            )
+        if getattr(ns, "adaptive_cmd", None) == "explain":
+            return _run_module_main(
+                "sdetkit.adaptive",
+                ["explain", str(ns.path), "--db", str(ns.db), "--format", str(ns.format)],
+            )
+        if getattr(ns, "adaptive_cmd", None) == "learn":
+            if getattr(ns, "adaptive_learn_cmd", None) == "record":
+                forwarded = [
+                    str(ns.diagnosis_json),
+                    "--db",
+                    str(ns.db),
+                    "--format",
+                    str(ns.format),
+                ]
+                if bool(ns.include_monitor):
+                    forwarded.append("--include-monitor")
+                for flag, enabled in (
+                    ("--proof-passed", bool(ns.proof_passed)),
+                    ("--proof-failed", bool(ns.proof_failed)),
+                    ("--fix-accepted", bool(ns.fix_accepted)),
+                    ("--fix-rejected", bool(ns.fix_rejected)),
+                    ("--false-positive", bool(ns.false_positive)),
+                ):
+                    if enabled:
+                        forwarded.append(flag)
+                return _run_module_main("sdetkit.adaptive_diagnosis_memory", forwarded)
+            if getattr(ns, "adaptive_learn_cmd", None) == "summarize":
+                return _run_module_main(
+                    "sdetkit.adaptive_diagnosis_memory",
+                    ["summarize", "--db", str(ns.db), "--format", str(ns.format)],
+                )
+        if getattr(ns, "adaptive_cmd", None) == "sentinel":
+            forwarded = [
+                str(ns.adaptive_sentinel_cmd),
+                "--root",
+                str(ns.root),
+                "--out-dir",
+                str(ns.out_dir),
+                "--format",
+                str(ns.format),
+            ]
+            if str(ns.event_log):
+                forwarded.extend(["--event-log", str(ns.event_log)])
+            if getattr(ns, "adaptive_sentinel_cmd", None) == "watch":
+                forwarded.extend(
+                    [
+                        "--interval-seconds",
+                        str(ns.interval_seconds),
+                        "--iterations",
+                        str(ns.iterations),
+                    ]
+                )
+            if bool(getattr(ns, "no_write", False)):
+                forwarded.append("--no-write")
+            if bool(getattr(ns, "no_fail", False)):
+                forwarded.append("--no-fail")
+            return _run_module_main("sdetkit.adaptive_sentinel", forwarded)
+        if getattr(ns, "adaptive_cmd", None) == "failure-bundle":
+            forwarded = [
+                "--log",
+                str(ns.log),
+                "--out-dir",
+                str(ns.out_dir),
+                "--format",
+                str(ns.format),
+            ]
+            if str(ns.out):
+                forwarded.extend(["--out", str(ns.out)])
+            if str(ns.memory_db):
+                forwarded.extend(["--memory-db", str(ns.memory_db)])
+            for attr, flag in [
+                ("proof_passed", "--proof-passed"),
+                ("proof_failed", "--proof-failed"),
+                ("fix_accepted", "--fix-accepted"),
+                ("fix_rejected", "--fix-rejected"),
+                ("false_positive", "--false-positive"),
+            ]:
+                if bool(getattr(ns, attr, False)):
+                    forwarded.append(flag)
+            return _run_module_main("sdetkit.adaptive_failure_bundle", forwarded)
+        if getattr(ns, "adaptive_cmd", None) == "brief":
+            forwarded = ["--format", str(ns.format), "--out", str(ns.out)]
+            for flag, value in (
+                ("--gate", str(ns.gate)),
+                ("--diagnosis", str(ns.diagnosis)),
+                ("--learning-summary", str(ns.learning_summary)),
+                ("--safe-fix-plan", str(ns.safe_fix_plan)),
+            ):
+                if value:
+                    forwarded.extend([flag, value])
+            return _run_module_main("sdetkit.operator_brief", forwarded)
+        if getattr(ns, "adaptive_cmd", None) == "portfolio-rollup":
+            forwarded = [*map(str, ns.diagnosis_json), "--format", str(ns.format)]
+            if str(ns.out):
+                forwarded.extend(["--out", str(ns.out)])
+            return _run_module_main("sdetkit.adaptive_portfolio_rollup", forwarded)
+        if getattr(ns, "adaptive_cmd", None) == "patch-plan":
+            forwarded = [str(ns.diagnosis_json), "--format", str(ns.format)]
+            if str(ns.out):
+                forwarded.extend(["--out", str(ns.out)])
+            return _run_module_main("sdetkit.adaptive_patch_plan", forwarded)
+        if getattr(ns, "adaptive_cmd", None) == "fix-audit":
+            if getattr(ns, "adaptive_fix_audit_cmd", None) == "record":
+                forwarded = [
+                    "record",
+                    str(ns.plan_json),
+                    "--db",
+                    str(ns.db),
+                    "--outcome",
+                    str(ns.outcome),
+                    "--format",
+                    str(ns.format),
+                ]
+                if str(ns.note):
+                    forwarded.extend(["--note", str(ns.note)])
+                return _run_module_main("sdetkit.adaptive_fix_audit", forwarded)
+            if getattr(ns, "adaptive_fix_audit_cmd", None) == "summarize":
+                return _run_module_main(
+                    "sdetkit.adaptive_fix_audit",
+                    ["summarize", "--db", str(ns.db), "--format", str(ns.format)],
+                )
+        if getattr(ns, "adaptive_cmd", None) == "enterprise-analytics":
+            forwarded = [
+                "--portfolio",
+                str(ns.portfolio),
+                "--fix-audit",
+                str(ns.fix_audit),
+                "--format",
+                str(ns.format),
+            ]
+            if str(ns.out):
+                forwarded.extend(["--out", str(ns.out)])
+            return _run_module_main("sdetkit.adaptive_enterprise_analytics", forwarded)
+        if getattr(ns, "adaptive_cmd", None) == "remediation-policy":
+            if getattr(ns, "adaptive_remediation_policy_cmd", None) == "template":
+                forwarded = ["template", "--format", str(ns.format)]
+                if str(ns.out):
+                    forwarded.extend(["--out", str(ns.out)])
+                return _run_module_main("sdetkit.adaptive_remediation_policy", forwarded)
+            if getattr(ns, "adaptive_remediation_policy_cmd", None) == "validate":
+                forwarded = [
+                    "validate",
+                    str(ns.plan_json),
+                    "--policy",
+                    str(ns.policy),
+                    "--format",
+                    str(ns.format),
+                ]
+                if str(ns.out):
+                    forwarded.extend(["--out", str(ns.out)])
+                return _run_module_main("sdetkit.adaptive_remediation_policy", forwarded)
+        if getattr(ns, "adaptive_cmd", None) == "dashboard":
+            forwarded = ["--format", str(ns.format), "--out", str(ns.out)]
+            for flag, value in (
+                ("--diagnosis", str(ns.diagnosis)),
+                ("--brief", str(ns.brief)),
+                ("--portfolio", str(ns.portfolio)),
+                ("--fix-audit", str(ns.fix_audit)),
+                ("--governance", str(ns.governance)),
+                ("--adapter", str(ns.adapter)),
+                ("--analytics", str(ns.analytics)),
+                ("--remediation-policy", str(ns.remediation_policy)),
+            ):
+                if value:
+                    forwarded.extend([flag, value])
+            return _run_module_main("sdetkit.adaptive_dashboard", forwarded)
+        if getattr(ns, "adaptive_cmd", None) == "learning-import":
+            forwarded = [str(ns.learning_export), "--format", str(ns.format)]
+            if str(ns.out):
+                forwarded.extend(["--out", str(ns.out)])
+            return _run_module_main("sdetkit.adaptive_learning_import", forwarded)
+        if getattr(ns, "adaptive_cmd", None) == "enterprise-governance":
+            if getattr(ns, "adaptive_enterprise_cmd", None) == "report":
+                forwarded = ["report", "--root", str(ns.root), "--format", str(ns.format)]
+                if str(ns.out):
+                    forwarded.extend(["--out", str(ns.out)])
+                return _run_module_main("sdetkit.adaptive_enterprise_governance", forwarded)
+            if getattr(ns, "adaptive_enterprise_cmd", None) == "anonymize-learning":
+                forwarded = ["anonymize-learning", str(ns.jsonl_path), "--format", str(ns.format)]
+                if str(ns.out):
+                    forwarded.extend(["--out", str(ns.out)])
+                return _run_module_main("sdetkit.adaptive_enterprise_governance", forwarded)
+        if getattr(ns, "adaptive_cmd", None) == "integration-adapter":
+            if getattr(ns, "adaptive_adapter_cmd", None) == "validate":
+                forwarded = [
+                    "validate",
+                    "--provider",
+                    str(ns.provider),
+                    "--artifacts",
+                    str(ns.artifacts),
+                    "--root",
+                    str(ns.root),
+                    "--format",
+                    str(ns.format),
+                ]
+                if str(ns.out):
+                    forwarded.extend(["--out", str(ns.out)])
+                return _run_module_main("sdetkit.adaptive_integration_adapters", forwarded)
+        return _run_module_main("sdetkit.adaptive", [])
+
+    if ns.cmd == "index":
+        if getattr(ns, "index_cmd", None) == "build":
+            return _run_module_main("sdetkit.index", ["build", str(ns.path), "--out", str(ns.out)])
+        if getattr(ns, "index_cmd", None) == "inspect":
+            return _run_module_main(
+                "sdetkit.index",
+                ["inspect", str(ns.path), "--format", str(ns.format)],
+            )
+        return _run_module_main("sdetkit.index", [])
+
+    if ns.cmd == "adopt-scan":
+        forwarded = [str(ns.path), "--max-files", str(ns.max_files), "--format", str(ns.format)]
+        if str(ns.out):
+            forwarded.extend(["--out", str(ns.out)])
+        return _run_module_main("sdetkit.repo_adoption_scan", forwarded)
+
+    if ns.cmd == "workflow-governance-report":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.markdown_out):
+            forwarded.extend(["--markdown-out", str(ns.markdown_out)])
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main("sdetkit.workflow_governance_report", forwarded)
+
+    if ns.cmd == "remediation-readiness-report":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.policy):
+            forwarded.extend(["--policy", str(ns.policy)])
+        if str(ns.markdown_out):
+            forwarded.extend(["--markdown-out", str(ns.markdown_out)])
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main("sdetkit.remediation_readiness_report", forwarded)
+
+    if ns.cmd == "public-command-surface-report":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.markdown_out):
+            forwarded.extend(["--markdown-out", str(ns.markdown_out)])
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main("sdetkit.public_command_surface_report", forwarded)
+
+    if ns.cmd == "product-maturity-radar":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.markdown_out):
+            forwarded.extend(["--markdown-out", str(ns.markdown_out)])
+        for report_json in ns.report_json:
+            forwarded.extend(["--report-json", str(report_json)])
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main("sdetkit.product_maturity_radar", forwarded)
+
+    if ns.cmd == "cross-report-consistency":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.markdown_out):
+            forwarded.extend(["--markdown-out", str(ns.markdown_out)])
+        for report_json in ns.report_json:
+            forwarded.extend(["--report-json", str(report_json)])
+        if bool(ns.complete):
+            forwarded.append("--complete")
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main("sdetkit.cross_report_consistency", forwarded)
+
+    if ns.cmd == "report-dependency-graph":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out",
+            str(ns.out),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.markdown_out):
+            forwarded.extend(["--markdown-out", str(ns.markdown_out)])
+        for report_json in ns.report_json:
+            forwarded.extend(["--report-json", str(report_json)])
+        if bool(ns.complete):
+            forwarded.append("--complete")
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main("sdetkit.report_dependency_graph", forwarded)
+
+    if ns.cmd == "report-dependency-graph-dashboard":
+        return _run_module_main(
+            "sdetkit.report_dependency_graph_dashboard",
+            [
+                "--graph-path",
+                str(ns.graph_path),
+                "--format",
+                str(ns.format),
+                "--out",
+                str(ns.out),
+            ],
+        )
+
+    if ns.cmd == "first-proof-quality-evidence":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--artifact-dir",
+            str(ns.artifact_dir),
+            "--out",
+            str(ns.out),
+            "--markdown-out",
+            str(ns.markdown_out),
+            "--format",
+            str(ns.format),
+        ]
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main(
+            "sdetkit.first_proof_quality_evidence",
+            forwarded,
+        )
+
+    if ns.cmd == "post-merge-verification":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--evidence-dir",
+            str(ns.evidence_dir),
+            "--previous-main-sha",
+            str(ns.previous_main_sha),
+            "--out-json",
+            str(ns.out_json),
+            "--out-md",
+            str(ns.out_md),
+            "--format",
+            str(ns.format),
+        ]
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main(
+            "sdetkit.post_merge_verification",
+            forwarded,
+        )
+
+    if ns.cmd == "release-readiness-evidence-package":
+        forwarded = [
+            "--root",
+            str(ns.root),
+            "--out-json",
+            str(ns.out_json),
+            "--out-md",
+            str(ns.out_md),
+            "--format",
+            str(ns.format),
+        ]
+        for flag, value in (
+            ("--pr-quality-summary", ns.pr_quality_summary),
+            (
+                "--pr-quality-handoff-manifest",
+                ns.pr_quality_handoff_manifest,
+            ),
+        ):
+            if value:
+                forwarded.extend([flag, str(value)])
+        if bool(ns.check_freshness):
+            forwarded.append("--check-freshness")
+        return _run_module_main(
+            "sdetkit.release_readiness_evidence_package",
+            forwarded,
+        )
+
+    if ns.cmd == "fit":
+        forwarded = [
+            "--repo-size",
+            str(ns.repo_size),
+            "--team-size",
+            str(ns.team_size),
+            "--release-frequency",
+            str(ns.release_frequency),
+            "--change-failure-impact",
+            str(ns.change_failure_impact),
+            "--compliance-pressure",
+            str(ns.compliance_pressure),
+            "--format",
+            str(ns.format),
+        ]
+        if str(ns.out):
+            forwarded.extend(["--out", str(ns.out)])
+        return _run_module_main("sdetkit.fit", forwarded)
+    if ns.cmd == "portfolio-orchestrate":
+        return _run_module_main("sdetkit.portfolio_orchestrator", ns.args)
+
+    parsed_shortcut_result = dispatch_parsed_shortcut(
+        str(ns.cmd),
+        list(getattr(ns, "args", [])),
+        run_module_main=_run_module_main,
+    )
+    if parsed_shortcut_result is not None:
+        return parsed_shortcut_result
+
+    if ns.cmd == "apiget":
+        return run_apiget_with_cassette(
+            list(argv),
+            cassette=getattr(ns, "cassette", None),
+            cassette_mode=getattr(ns, "cassette_mode", None),
+            run_module_main=_run_module_main,
+        )
+    raise SystemExit(2)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+from pathlib import Path
+from typing import Any
+
+from . import upgrade_audit
+from .atomicio import canonical_json_dumps
+from .security import SecurityError, safe_path
+
+
+def _load_json(path: Path) -> Any:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _fingerprint(test_id: str, message: str) -> str:
+    return hashlib.sha256(f"{test_id}\n{message}".encode()).hexdigest()[:16]
+
+
+def _cmd_flake_classify(history_path: Path, rerun_threshold: int) -> dict[str, Any]:
+    data = _load_json(history_path)
+    if not isinstance(data, dict) or not isinstance(data.get("tests"), list):
+        raise ValueError("history must be an object with a tests array")
+    out: list[dict[str, Any]] = []
+    for item in data["tests"]:
+        if not isinstance(item, dict):
+            continue
+        test_id = str(item.get("id", ""))
+        outcomes = [str(x) for x in item.get("outcomes", []) if isinstance(x, str)]
+        if not test_id or not outcomes:
+            continue
+        failures = sum(1 for x in outcomes if x == "failed")
+        passes = sum(1 for x in outcomes if x == "passed")
+        flaky = failures > 0 and passes > 0 and len(outcomes) >= rerun_threshold
+        classification = "flaky" if flaky else ("stable-failing" if failures else "stable-passing")
+        message = f"{classification}:{','.join(outcomes)}"
+        if classification == "flaky":
+            signal = "nondeterministic-rerun"
+            next_step = "Quarantine test and capture deterministic seed/fixture isolation evidence."
+        elif classification == "stable-failing":
+            signal = "consistent-regression"
+            next_step = "Treat as product regression and escalate to release decision gate."
+        else:
+            signal = "stable"
+            next_step = "Keep in baseline suite."
+
+        out.append(
+            {
+                "test_id": test_id,
+                "classification": classification,
+                "signal": signal,
+                "next_step": next_step,
+                "runs": len(outcomes),
+                "failures": failures,
+                "passes": passes,
+                "fingerprint": _fingerprint(test_id, message),
+            }
+        )
+    out.sort(key=lambda x: (x["classification"], x["test_id"], x["fingerprint"]))
+    return {
+        "schema_version": "sdetkit.intelligence.flake.v1",
+        "tests": out,
+        "summary": {
+            "flaky": sum(1 for x in out if x["classification"] == "flaky"),
+            "stable_failing": sum(1 for x in out if x["classification"] == "stable-failing"),
+            "stable_passing": sum(1 for x in out if x["classification"] == "stable-passing"),
+        },
+    }
+
+
+def _cmd_capture_env(seed: int | None) -> dict[str, Any]:
+    chosen_seed = seed if seed is not None else int(os.environ.get("SDETKIT_SEED", "1337"))
+    rng = random.Random(chosen_seed)
+    sampled = {
+        k: os.environ.get(k, "")
+        for k in sorted(["CI", "GITHUB_REF", "GITHUB_SHA", "PYTHONHASHSEED", "TZ"])  # deterministic
+    }
+    return {
+        "schema_version": "sdetkit.intelligence.env-capture.v1",
+        "seed": chosen_seed,
+        "derived_seed": rng.randint(0, 10_000_000),
+        "environment": sampled,
+    }
+
+
+def _cmd_impact(changed_path: Path, testmap_path: Path) -> dict[str, Any]:
+    changed = [
+        line.strip()
+        for line in changed_path.read_text(encoding="utf-8").splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    ]
+    mapping = _load_json(testmap_path)
+    if not isinstance(mapping, dict):
+        raise ValueError("test map must be a json object")
+    impacted: set[str] = set()
+    reasons: list[dict[str, str]] = []
+    for file_path in sorted(changed):
+        tests = mapping.get(file_path, [])
+        if isinstance(tests, list):
+            for test_id in sorted(str(x) for x in tests):
+                impacted.add(test_id)
+                reasons.append({"changed_file": file_path, "test_id": test_id})
+    reasons.sort(key=lambda x: (x["test_id"], x["changed_file"]))
+    return {
+        "schema_version": "sdetkit.intelligence.impact.v1",
+        "changed_files": sorted(changed),
+        "impacted_tests": sorted(impacted),
+        "mapping_hits": reasons,
+    }
+
+
+def _cmd_mutation_policy(policy_path: Path) -> dict[str, Any]:
+    policy = _load_json(policy_path)
+    if not isinstance(policy, dict):
+        raise ValueError("policy file must be a json object")
+    threshold = float(policy.get("minimum_score", 0))
+    score = float(policy.get("observed_score", 0))
+    owners = policy.get("owners", [])
+    owner_ok = isinstance(owners, list) and len(owners) > 0
+    justification = str(policy.get("justification", "")).strip()
+    passed = score >= threshold and owner_ok and bool(justification)
+    return {
+        "schema_version": "sdetkit.intelligence.mutation-policy.v1",
+        "passed": passed,
+        "threshold": threshold,
+        "observed_score": score,
+        "owner_count": len(owners) if isinstance(owners, list) else 0,
+        "has_justification": bool(justification),
+    }
+
+
+def _cmd_failure_fingerprint(failures_path: Path) -> dict[str, Any]:
+    doc = _load_json(failures_path)
+    if not isinstance(doc, dict) or not isinstance(doc.get("failures"), list):
+        raise ValueError("failures file must contain a failures array")
+
+    fingerprints: list[dict[str, Any]] = []
+    for item in doc["failures"]:
+        if not isinstance(item, dict):
+            continue
+        test_id = str(item.get("test_id", "")).strip()
+        message = str(item.get("message", "")).strip()
+        fixture_scope = str(item.get("fixture_scope", "unknown")).strip() or "unknown"
+        if not test_id or not message:
+            continue
+
+        msg_lower = message.lower()
+        nondeterminism_hints: list[str] = []
+        if any(token in msg_lower for token in ["timeout", "timed out", "deadline exceeded"]):
+            nondeterminism_hints.append("timing-sensitive")
+        if any(token in msg_lower for token in ["connection reset", "econnreset", "network"]):
+            nondeterminism_hints.append("network-sensitive")
+        if any(token in msg_lower for token in ["random", "seed", "nondetermin"]):
+            nondeterminism_hints.append("seed-sensitive")
+        if fixture_scope in {"session", "module"}:
+            nondeterminism_hints.append("shared-fixture-scope")
+
+        fingerprints.append(
+            {
+                "test_id": test_id,
+                "fixture_scope": fixture_scope,
+                "fingerprint": _fingerprint(test_id, message),
+                "nondeterminism_hints": sorted(set(nondeterminism_hints)),
+            }
+        )
+
+    fingerprints.sort(key=lambda item: (item["test_id"], item["fingerprint"]))
+    return {
+        "schema_version": "sdetkit.intelligence.failure-fingerprint.v1",
+        "failures": fingerprints,
+        "summary": {
+            "total": len(fingerprints),
+            "with_nondeterminism_hints": sum(
+                1 for item in fingerprints if item["nondeterminism_hints"]
+            ),
+        },
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="sdetkit intelligence", description="Test Intelligence Kit"
+    )
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    flake = sub.add_parser("flake", help="Flake classification from rerun history")
+    flake_sub = flake.add_subparsers(dest="subcmd", required=True)
+    classify = flake_sub.add_parser("classify")
+    classify.add_argument("--history", required=True)
+    classify.add_argument("--rerun-threshold", type=int, default=2)
+
+    cap = sub.add_parser("capture-env", help="Deterministic seed/environment capture")
+    cap.add_argument("--seed", type=int, default=None)
+
+    impact = sub.add_parser("impact", help="Changed-scope impacted test summary")
+    impact_sub = impact.add_subparsers(dest="subcmd", required=True)
+    summarize = impact_sub.add_parser("summarize")
+    summarize.add_argument("--changed", required=True)
+    summarize.add_argument("--map", required=True, dest="test_map")
+
+    mut = sub.add_parser("mutation-policy", help="Mutation governance evaluation")
+    mut.add_argument("--policy", required=True)
+
+    fp = sub.add_parser(
+        "failure-fingerprint",
+        help="Stable failure fingerprinting with nondeterminism heuristics",
+    )
+    fp.add_argument("--failures", required=True)
+
+    ua = sub.add_parser(
+        "upgrade-audit",
+        help="Dependency upgrade planning with manifest drift, policy, and risk lanes",
+    )
+    ua.add_argument("--pyproject", default="pyproject.toml")
+    ua.add_argument("--timeout", type=float, default=10.0)
+    ua.add_argument("--format", choices=["md", "json"], default="json")
+    ua.add_argument("--requirements", action="append", default=None)
+    ua.add_argument("--include-lockfiles", action="store_true")
+    ua.add_argument(
+        "--fail-on",
+        choices=["critical", "high", "medium", "watch", "investigate", "unknown", "never"],
+        default="never",
+    )
+    ua.add_argument("--cache-path", default=str(upgrade_audit.DEFAULT_CACHE_PATH))
+    ua.add_argument("--cache-ttl-hours", type=float, default=24.0)
+    ua.add_argument("--offline", action="store_true")
+    ua.add_argument("--max-workers", type=int, default=8)
+    ua.add_argument(
+        "--signal",
+        action="append",
+        choices=["critical", "high", "medium", "watch", "investigate", "unknown"],
+        default=None,
+    )
+    ua.add_argument(
+        "--policy",
+        action="append",
+        choices=["allowed", "blocked", "unknown", "unbounded"],
+        default=None,
+    )
+    ua.add_argument("--package", action="append", default=None)
+    ua.add_argument("--group", action="append", default=None)
+    ua.add_argument("--source", action="append", default=None)
+    ua.add_argument(
+        "--metadata-source",
+        action="append",
+        choices=["pypi", "cache", "cache-stale", "offline"],
+        default=None,
+    )
+    ua.add_argument(
+        "--lane",
+        action="append",
+        choices=[
+            "stabilize-manifests",
+            "refresh-baselines",
+            "upgrade-now",
+            "next-maintenance-batch",
+            "investigate-metadata",
+            "policy-covered-watchlist",
+            "backlog-watchlist",
+        ],
+        default=None,
+    )
+    ua.add_argument("--query", action="append", default=None)
+    ua.add_argument(
+        "--impact-area",
+        action="append",
+        choices=[
+            "runtime-core",
+            "quality-tooling",
+            "integration-adapters",
+            "docs-tooling",
+            "packaging-release",
+            "security-compliance",
+            "repo-tooling",
+        ],
+        default=None,
+    )
+    ua.add_argument(
+        "--manifest-action",
+        action="append",
+        choices=[
+            "none",
+            "refresh-pin",
+            "raise-floor",
+            "stage-upgrade",
+            "plan-major-upgrade",
+            "establish-baseline",
+            "investigate-metadata",
+        ],
+        default=None,
+    )
+    ua.add_argument("--validation-command", action="append", default=None)
+    ua.add_argument(
+        "--repo-usage-tier",
+        action="append",
+        choices=["hot-path", "active", "edge", "declared-only"],
+        default=None,
+    )
+    ua.add_argument(
+        "--release-freshness",
+        action="append",
+        choices=list(upgrade_audit.RELEASE_FRESHNESS_BUCKETS),
+        default=None,
+    )
+    ua.add_argument("--min-release-age-days", type=int, default=None)
+    ua.add_argument("--max-release-age-days", type=int, default=None)
+    ua.add_argument("--used-in-repo-only", action="store_true")
+    ua.add_argument("--outdated-only", action="store_true")
+    ua.add_argument("--top", type=int, default=None)
+    ua.add_argument("--include-prereleases", action="store_true")
+
+    ns = parser.parse_args(argv)
+    try:
+        if ns.cmd == "flake" and ns.subcmd == "classify":
+            payload = _cmd_flake_classify(
+                safe_path(Path.cwd(), ns.history, allow_absolute=True), max(ns.rerun_threshold, 1)
+            )
+        elif ns.cmd == "capture-env":
+            payload = _cmd_capture_env(ns.seed)
+        elif ns.cmd == "impact" and ns.subcmd == "summarize":
+            payload = _cmd_impact(
+                safe_path(Path.cwd(), ns.changed, allow_absolute=True),
+                safe_path(Path.cwd(), ns.test_map, allow_absolute=True),
+            )
+        elif ns.cmd == "failure-fingerprint":
+            payload = _cmd_failure_fingerprint(
+                safe_path(Path.cwd(), ns.failures, allow_absolute=True)
+            )
+        elif ns.cmd == "upgrade-audit":
+            pyproject_path = safe_path(Path.cwd(), ns.pyproject, allow_absolute=True)
+            if ns.requirements is None:
+                requirement_paths = upgrade_audit._discover_requirement_files(
+                    pyproject_path.parent,
+                    include_lockfiles=bool(ns.include_lockfiles),
+                )
+            else:
+                requirement_paths = [
+                    safe_path(Path.cwd(), path, allow_absolute=True) for path in ns.requirements
+                ]
+            return upgrade_audit.run(
+                pyproject_path,
+                timeout_s=ns.timeout,
+                requirement_paths=requirement_paths,
+                output_format=ns.format,
+                fail_on=ns.fail_on,
+                cache_path=safe_path(Path.cwd(), ns.cache_path, allow_absolute=True),
+                cache_ttl_hours=ns.cache_ttl_hours,
+                offline=bool(ns.offline),
+                max_workers=max(ns.max_workers, 1),
+                signals=ns.signal,
+                policies=ns.policy,
+                packages=ns.package,
+                groups=ns.group,
+                sources=ns.source,
+                metadata_sources=ns.metadata_source,
+                lanes=ns.lane,
+                queries=ns.query,
+                impact_areas=ns.impact_area,
+                manifest_actions=ns.manifest_action,
+                validation_commands=ns.validation_command,
+                repo_usage_tiers=ns.repo_usage_tier,
+                release_freshness=ns.release_freshness,
+                min_release_age_days=ns.min_release_age_days,
+                max_release_age_days=ns.max_release_age_days,
+                used_in_repo_only=bool(ns.used_in_repo_only),
+                outdated_only=bool(ns.outdated_only),
+                top=ns.top,
+                include_prereleases=bool(ns.include_prereleases),
+            )
+        else:
+            payload = _cmd_mutation_policy(safe_path(Path.cwd(), ns.policy, allow_absolute=True))
+    except (ValueError, OSError, SecurityError) as exc:
+        sys.stderr.write(f"intelligence error: {exc}\n")
+        return 2
+
+    sys.stdout.write(canonical_json_dumps(payload))
+    if payload.get("passed") is False:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
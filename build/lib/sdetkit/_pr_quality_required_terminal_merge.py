@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from sdetkit._pr_quality_required_terminal_checks import (
+    merge_required_terminal_snapshot_into_checks,
+    snapshot_covers_expected,
+)
+
+__all__ = [
+    "merge_required_terminal_snapshot_into_checks",
+    "snapshot_covers_expected",
+]
@@ -0,0 +1,4 @@
+from .adaptive_memory import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,3 @@
+from sdetkit.adoption_surface import main
+
+raise SystemExit(main())
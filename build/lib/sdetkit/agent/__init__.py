@@ -0,0 +1,3 @@
+from .core import doctor_agent, history_agent, init_agent, run_agent
+
+__all__ = ["doctor_agent", "history_agent", "init_agent", "run_agent"]
@@ -0,0 +1,60 @@
+from .artifacts import artifact_paths_for, render_record_artifacts, render_report_artifacts
+from .base import CheckContext, CheckDefinition, CheckProfile, PlannerHint, RegistrySnapshot
+from .cache import CheckCache
+from .planner import (
+    CheckPlan,
+    CheckPlanner,
+    PlannedCheck,
+    SkippedCheck,
+    classify_changed_files,
+    discover_changed_files,
+)
+from .registry import (
+    CheckRegistry,
+    check_ids_for_profile,
+    default_registry,
+    planner_seed,
+    profile_definitions,
+    registry_snapshot,
+)
+from .results import CheckRecord, FinalVerdict, build_final_verdict
+from .runner import CheckRunner, CheckRunReport
+
+__all__ = [
+    "CheckContext",
+    "CheckDefinition",
+    "CheckProfile",
+    "PlannerHint",
+    "RegistrySnapshot",
+    "artifact_paths_for",
+    "render_record_artifacts",
+    "render_report_artifacts",
+    "CheckCache",
+    "CheckPlan",
+    "PlannedCheck",
+    "SkippedCheck",
+    "CheckPlanner",
+    "classify_changed_files",
+    "discover_changed_files",
+    "CheckRegistry",
+    "check_ids_for_profile",
+    "default_registry",
+    "planner_seed",
+    "profile_definitions",
+    "registry_snapshot",
+    "CheckRecord",
+    "FinalVerdict",
+    "build_final_verdict",
+    "CheckRunReport",
+    "CheckRunner",
+]
+
+
+from importlib import import_module
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    if name == "main_":
+        return import_module(".main", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import heapq
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
+
+from ..atomicio import atomic_write_text
+from .base import CheckContext, RegistrySnapshot
+from .cache import CheckCache
+from .planner import CheckPlan, PlannedCheck
+from .results import CheckRecord, FinalVerdict, build_final_verdict
+
+# Checks in a limited resource class never overlap beyond the limit (for example two
+# pytest runs); unlisted classes are only bounded by the worker count.
+_RESOURCE_CLASS_LIMITS: dict[str, int] = {"heavy": 1}
+# Duration estimates used for critical-path ranking until a check has history.
+_DEFAULT_COST_SECONDS: dict[str, float] = {"cheap": 5.0, "moderate": 30.0, "expensive": 300.0}
+_DURATIONS_FILE = "check-durations.json"
+_DURATION_SMOOTHING = 0.5
+
+
+def _load_durations(path: Path) -> dict[str, float]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    checks = raw.get("checks") if isinstance(raw, dict) else None
+    if not isinstance(checks, dict):
+        return {}
+    return {
+        str(key): float(value)
+        for key, value in checks.items()
+        if isinstance(value, (int, float)) and value >= 0
+    }
+
+
+def _store_durations(path: Path, history: dict[str, float], observed: dict[str, float]) -> None:
+    if not observed:
+        return
+    merged = dict(history)
+    for check_id, seconds in observed.items():
+        previous = merged.get(check_id)
+        if previous is None:
+            merged[check_id] = round(seconds, 3)
+        else:
+            merged[check_id] = round(
+                _DURATION_SMOOTHING * seconds + (1 - _DURATION_SMOOTHING) * previous, 3
+            )
+    payload = {"schema_version": 1, "checks": {k: merged[k] for k in sorted(merged)}}
+    try:
+        atomic_write_text(path, json.dumps(payload, sort_keys=True, indent=2) + "\n")
+    except OSError:
+        return
+
+
+def _critical_path_ranks(
+    plan_items: list[PlannedCheck], dependents: dict[str, list[str]], history: dict[str, float]
+) -> dict[str, float]:
+    estimates = {
+        item.id: history.get(item.id, _DEFAULT_COST_SECONDS.get(item.cost, 5.0))
+        for item in plan_items
+    }
+    ranks: dict[str, float] = {}
+
+    def _rank(check_id: str, visiting: frozenset[str]) -> float:
+        cached = ranks.get(check_id)
+        if cached is not None:
+            return cached
+        tail = max(
+            (
+                _rank(child, visiting | {check_id})
+                for child in dependents.get(check_id, ())
+                if child not in visiting
+            ),
+            default=0.0,
+        )
+        ranks[check_id] = estimates.get(check_id, 0.0) + tail
+        return ranks[check_id]
+
+    for item in plan_items:
+        _rank(item.id, frozenset())
+    return ranks
+
+
+@dataclass(frozen=True)
+class CheckRunReport:
+    plan: CheckPlan
+    records: tuple[CheckRecord, ...]
+    verdict: FinalVerdict
+
+    def as_dict(self) -> dict[str, Any]:
+        payload = self.verdict.as_dict()
+        payload["plan"] = {
+            "profile": self.plan.profile,
+            "requested_profile": self.plan.requested_profile,
+            "selected_checks": [
+                {
+                    "id": item.id,
+                    "title": item.title,
+                    "blocking": item.blocking,
+                    "dependencies": list(item.dependencies),
+                    "command": item.command,
+                    "category": item.category,
+                    "truth_level": item.truth_level,
+                    "parallel_safe": item.parallel_safe,
+                    "resource_class": item.resource_class,
+                    "target_mode": item.target_mode,
+                    "targeting_reason": item.targeting_reason,
+                    "changed_evidence": list(item.changed_evidence),
+                    "selected_targets": list(item.selected_targets),
+                }
+                for item in self.plan.selected_checks
+            ],
+            "skipped_checks": [
+                {
+                    "id": item.id,
+                    "title": item.title,
+                    "reason": item.reason,
+                    "blocking": item.blocking,
+                }
+                for item in self.plan.skipped_checks
+            ],
+            "notes": list(self.plan.notes),
+            "planner_selected": self.plan.planner_selected,
+            "changed_files": list(self.plan.changed_files),
+            "changed_areas": list(self.plan.changed_areas),
+            "adaptive_reason": self.plan.adaptive_reason,
+        }
+        return payload
+
+
+class CheckRunner:
+    def __init__(self, snapshot: RegistrySnapshot) -> None:
+        self._snapshot = snapshot
+
+    def run(
+        self,
+        plan: CheckPlan,
+        *,
+        repo_root: Path,
+        out_dir: Path,
+        env: dict[str, str],
+        python_executable: str,
+        use_cache: bool = True,
+        max_workers: int | None = None,
+        cache_backend: str = "files",
+        cache_max_bytes: int | None = None,
+        cache_max_age_seconds: float | None = None,
+    ) -> CheckRunReport:
+        base_ctx = CheckContext(
+            repo_root=repo_root,
+            out_dir=out_dir,
+            env=env,
+            python_executable=python_executable,
+            profile=plan.profile,
+            changed_paths=plan.changed_files,
+        )
+        cache = CheckCache(
+            out_dir / "cache" / "checks",
+            enabled=use_cache,
+            backend=cache_backend,
+            max_bytes=cache_max_bytes,
+            max_age_seconds=cache_max_age_seconds,
+        )
+        completed: dict[str, CheckRecord] = {
+            skipped.id: CheckRecord(
+                id=skipped.id,
+                title=skipped.title,
+                status="skipped",
+                blocking=skipped.blocking,
+                reason=skipped.reason,
+                metadata={
+                    "category": skipped.category,
+                    "truth_level": skipped.truth_level,
+                    "target_mode": "full",
+                    "cache": {"status": "not-applicable"},
+                    "execution": {"status": "skipped"},
+                },
+            )
+            for skipped in plan.skipped_checks
+        }
+
+        plan_items = list(plan.selected_checks)
+        workers = self._select_workers(plan_items, max_workers=max_workers)
+        execution_mode = "parallel" if workers > 1 else "sequential"
+        by_id = {item.id: item for item in plan_items}
+        order = {item.id: index for index, item in enumerate(plan_items)}
+        durations_path = out_dir / "cache" / _DURATIONS_FILE
+        history = _load_durations(durations_path)
+
+        dependents: dict[str, list[str]] = {item.id: [] for item in plan_items}
+        waiting: dict[str, int] = {}
+        for item in plan_items:
+            if item.id in completed:
+                continue
+            if any(dep not in completed and dep not in by_id for dep in item.dependencies):
+                continue
+            open_deps = {dep for dep in item.dependencies if dep not in completed}
+            waiting[item.id] = len(open_deps)
+            for dep in open_deps:
+                dependents[dep].append(item.id)
+
+        ranks = _critical_path_ranks(plan_items, dependents, history)
+        ready: list[tuple[float, int, str]] = []
+
+        def _settle(check_id: str) -> None:
+            worklist = [check_id]
+            while worklist:
+                current = worklist.pop()
+                for child in dependents.get(current, ()):
+                    if child not in waiting:
+                        continue
+                    waiting[child] -= 1
+                    if waiting[child] == 0 and _enqueue(child):
+                        worklist.append(child)
+
+        def _enqueue(check_id: str) -> bool:
+            item = by_id[check_id]
+            blocked_by = [
+                dep for dep in item.dependencies if completed[dep].status in {"failed", "skipped"}
+            ]
+            if not blocked_by:
+                heapq.heappush(ready, (-ranks[check_id], order[check_id], check_id))
+                return False
+            completed[item.id] = CheckRecord(
+                id=item.id,
+                title=item.title,
+                status="skipped",
+                blocking=item.blocking,
+                reason=f"dependency not satisfied: {', '.join(blocked_by)}",
+                command=item.command,
+                metadata={
+                    "category": item.category,
+                    "truth_level": item.truth_level,
+                    "target_mode": item.target_mode,
+                    "target_reason": item.targeting_reason,
+                    "changed_paths": list(item.changed_evidence),
+                    "selected_targets": list(item.selected_targets),
+                    "cache": {"status": "not-applicable"},
+                    "execution": {"mode": execution_mode, "workers": workers},
+                },
+            )
+            return True
+
+        for check_id in [cid for cid, count in waiting.items() if count == 0]:
+            if _enqueue(check_id):
+                _settle(check_id)
+
+        futures: dict[Any, PlannedCheck] = {}
+        class_load: dict[str, int] = {}
+        exclusive_running = False
+        busy_seconds = 0.0
+        peak_concurrency = 0
+        observed: dict[str, float] = {}
+        started = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while ready or futures:
+                deferred: list[tuple[float, int, str]] = []
+                while ready and len(futures) < workers and not exclusive_running:
+                    entry = heapq.heappop(ready)
+                    item = by_id[entry[2]]
+                    limit = _RESOURCE_CLASS_LIMITS.get(item.resource_class)
+                    if (not item.parallel_safe and futures) or (
+                        limit is not None and class_load.get(item.resource_class, 0) >= limit
+                    ):
+                        deferred.append(entry)
+                        continue
+                    future = executor.submit(
+                        self._timed_execute,
+                        item,
+                        base_ctx,
+                        cache,
+                        execution_mode,
+                        workers,
+                    )
+                    futures[future] = item
+                    class_load[item.resource_class] = class_load.get(item.resource_class, 0) + 1
+                    exclusive_running = not item.parallel_safe
+                    peak_concurrency = max(peak_concurrency, len(futures))
+                for entry in deferred:
+                    heapq.heappush(ready, entry)
+
+                if not futures:
+                    break
+
+                done, _ = wait(set(futures), return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = futures.pop(future)
+                    record, seconds = future.result()
+                    busy_seconds += seconds
+                    class_load[item.resource_class] -= 1
+                    if not item.parallel_safe:
+                        exclusive_running = False
+                    if record.metadata.get("cache", {}).get("status") != "hit":
+                        observed[item.id] = seconds
+                    completed[item.id] = record
+                    _settle(item.id)
+
+        wall_seconds = time.monotonic() - started
+        cache.close()
+        if use_cache:
+            # Durations live beside the result cache; a cache-less run only reads them.
+            _store_durations(durations_path, history, observed)
+        scheduler_stats = {
+            "scheduler": "critical-path",
+            "wall_seconds": round(wall_seconds, 3),
+            "busy_seconds": round(busy_seconds, 3),
+            "parallelism": round(busy_seconds / wall_seconds, 3) if wall_seconds > 0 else 0.0,
+            "idle_worker_seconds": round(max(0.0, workers * wall_seconds - busy_seconds), 3),
+            "peak_concurrency": peak_concurrency,
+        }
+
+        records = [completed[item.id] for item in plan_items if item.id in completed]
+        records.extend(
+            completed[item.id]
+            for item in sorted(plan.skipped_checks, key=lambda skipped: skipped.id)
+            if item.id in completed
+        )
+        ordered_records = tuple(
+            sorted(records, key=lambda record: self._record_order(record.id, plan))
+        )
+
+        verdict = build_final_verdict(
+            profile=plan.profile,
+            checks=list(ordered_records),
+            profile_notes="; ".join(plan.notes),
+            metadata={
+                "source": "sdetkit.checks.runner",
+                "checks_recorded": len(ordered_records),
+                "requested_profile": plan.requested_profile,
+                "selected_checks": list(plan.selected_ids),
+                "changed_files": list(plan.changed_files),
+                "changed_areas": list(plan.changed_areas),
+                "adaptive_reason": plan.adaptive_reason,
+                "execution": {"mode": execution_mode, "workers": workers, **scheduler_stats},
+                "cache_enabled": use_cache,
+                "cache_counters": cache.counters(),
+            },
+        )
+        return CheckRunReport(plan=plan, records=ordered_records, verdict=verdict)
+
+    def _select_workers(self, plan_items: list[PlannedCheck], *, max_workers: int | None) -> int:
+        safe_count = sum(1 for item in plan_items if item.parallel_safe)
+        if safe_count <= 1:
+            return 1
+        if max_workers is not None:
+            return max(1, min(safe_count, max_workers))
+        cpu_count = max(1, __import__("os").cpu_count() or 1)
+        suggested = min(safe_count, max(1, min(4, cpu_count // 2 or 1)))
+        return max(1, suggested)
+
+    def _timed_execute(
+        self,
+        item: PlannedCheck,
+        base_ctx: CheckContext,
+        cache: CheckCache,
+        execution_mode: str,
+        workers: int,
+    ) -> tuple[CheckRecord, float]:
+        started = time.monotonic()
+        record = self._execute_item(item, base_ctx, cache, execution_mode, workers)
+        return record, time.monotonic() - started
+
+    def _execute_item(
+        self,
+        item: PlannedCheck,
+        base_ctx: CheckContext,
+        cache: CheckCache,
+        execution_mode: str,
+        workers: int,
+    ) -> CheckRecord:
+        definition = self._snapshot.check(item.id)
+        ctx = base_ctx.for_check(
+            check_id=item.id,
+            target_mode=item.target_mode,
+            target_reason=item.targeting_reason,
+            selected_targets=item.selected_targets,
+        )
+        cache_key = cache.key_for(
+            repo_root=ctx.repo_root,
+            check_id=item.id,
+            profile=ctx.profile,
+            target_mode=item.target_mode,
+            command=item.command,
+            changed_paths=item.changed_evidence,
+            selected_targets=item.selected_targets,
+        )
+        if definition.cacheable:
+            cached = cache.load(cache_key)
+            if cached is not None:
+                metadata = dict(cached.metadata)
+                metadata.setdefault("category", item.category)
+                metadata.setdefault("truth_level", item.truth_level)
+                metadata.setdefault("target_mode", item.target_mode)
+                metadata.setdefault("target_reason", item.targeting_reason)
+                metadata.setdefault("changed_paths", list(item.changed_evidence))
+                metadata.setdefault("selected_targets", list(item.selected_targets))
+                metadata["execution"] = {"mode": execution_mode, "workers": workers}
+                return CheckRecord(**{**cached.__dict__, "metadata": metadata})
+        if definition.run is None:
+            record = CheckRecord(
+                id=item.id,
+                title=item.title,
+                status="skipped",
+                blocking=item.blocking,
+                reason="check has no execution wiring yet",
+                command=item.command,
+                metadata={
+                    "category": item.category,
+                    "truth_level": item.truth_level,
+                    "target_mode": item.target_mode,
+                    "target_reason": item.targeting_reason,
+                    "changed_paths": list(item.changed_evidence),
+                    "selected_targets": list(item.selected_targets),
+                    "cache": {"status": "not-applicable"},
+                    "execution": {"mode": execution_mode, "workers": workers},
+                },
+            )
+        else:
+            record = cast(CheckRecord, definition.run(ctx))
+            metadata = dict(record.metadata)
+            metadata.setdefault("category", item.category)
+            metadata.setdefault("truth_level", item.truth_level)
+            metadata.setdefault("target_mode", item.target_mode)
+            metadata.setdefault("target_reason", item.targeting_reason)
+            metadata.setdefault("changed_paths", list(item.changed_evidence))
+            metadata.setdefault("selected_targets", list(item.selected_targets))
+            metadata["execution"] = {"mode": execution_mode, "workers": workers}
+            cache_meta = dict(metadata.get("cache", {}))
+            cache_meta.setdefault("status", "fresh")
+            cache_meta["key"] = cache_key
+            metadata["cache"] = cache_meta
+            record = CheckRecord(**{**record.__dict__, "metadata": metadata})
+        if definition.cacheable and record.status != "skipped":
+            cache.save(cache_key, record)
+        return record
+
+    def _record_order(self, check_id: str, plan: CheckPlan) -> int:
+        selected = {item.id: index for index, item in enumerate(plan.selected_checks)}
+        if check_id in selected:
+            return selected[check_id]
+        return len(selected) + sorted(item.id for item in plan.skipped_checks).index(check_id)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from ._legacy_workflow import run_lane
+
+_DEFAULT_PAGE_TEMPLATE = "# Continuous upgrade closeout 6\n\n## Continuous upgrade closeout\n"
+_CFG = {
+    "page_template": _DEFAULT_PAGE_TEMPLATE,
+    "name": "continuous-upgrade-closeout-6",
+    "page_path": "docs/integrations-continuous-upgrade-closeout-6.md",
+    "summary_json": "continuous-upgrade-closeout-6-summary.json",
+    "summary_md": "continuous-upgrade-closeout-6-summary.md",
+    "pack_files": ["continuous-upgrade-closeout-6-board.md"],
+    "evidence_json": "continuous-upgrade-closeout-6-execution-summary.json",
+    "text_output": "continuous upgrade closeout 6 summary",
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    return run_lane(argv, _CFG)
@@ -0,0 +1,12 @@
+"""Compatibility alias for a legacy module name.
+
+Use ``sdetkit.example_asset2`` instead of ``sdetkit.demo_asset2``.
+"""
+
+from __future__ import annotations
+
+import sys as _sys
+from importlib import import_module as _import_module
+
+_compat_alias = _import_module("sdetkit.example_asset2")
+_sys.modules[__name__] = _compat_alias
@@ -0,0 +1,7 @@
+"""Public evidence API."""
+
+from __future__ import annotations
+
+from .evidence import EXIT_INVALID, EXIT_OK, SCHEMA_VERSION, main
+
+__all__ = ["EXIT_INVALID", "EXIT_OK", "SCHEMA_VERSION", "main"]
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from sdetkit.core._legacy_workflow import run_lane
+
+_unused_compat_namespace = "evidence"
+
+__all__ = ["run_lane"]
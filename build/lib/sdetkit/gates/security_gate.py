@@ -0,0 +1,1861 @@
+from __future__ import annotations
+
+import argparse
+import ast
+import bisect
+import difflib
+import hashlib
+import heapq
+import itertools
+import json
+import math
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from ..utils.atomicio import atomic_write_text
+
+SEVERITY_RANK = {"info": 1, "warn": 2, "error": 3}
+FAIL_ON_TO_SEVERITY = {
+    "none": 99,
+    "low": 1,
+    "medium": 2,
+    "high": 3,
+    "critical": 4,
+    "warn": 2,
+    "error": 3,
+}
+SEVERITY_TO_FAIL_LEVEL = {"info": 1, "warn": 2, "error": 3}
+DEFAULT_ALLOWLIST_PATH = Path("tools/security_allowlist.json")
+DEFAULT_BASELINE_PATH = Path("tools/security.baseline.json")
+SCAN_CACHE_FILE = "security-scan.json"
+# Bump when a rule's detection logic changes without a change to RULES or SECRET_PATTERNS.
+SCAN_ENGINE_VERSION = 1
+INLINE_ALLOW_PREFIX = "# sdetkit: allow-security"
+
+SKIP_DIRS = {
+    ".git",
+    ".nox",
+    ".venv",
+    "__pycache__",
+    "node_modules",
+    "dist",
+    "build",
+    "site",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".sdetkit",
+}
+SKIP_PATH_PREFIXES = ("docs/artifacts/",)
+TEXT_EXTENSIONS = {
+    ".py",
+    ".md",
+    ".txt",
+    ".json",
+    ".yaml",
+    ".yml",
+    ".toml",
+    ".ini",
+    ".cfg",
+    ".env",
+    ".sh",
+}
+SUSPICIOUS_INPUT_NAMES = {"user_input", "input_path", "filename", "filepath", "user_path"}
+PRINT_ALLOWED_MODULE_SUFFIXES = (
+    "/cli.py",
+    "/repo.py",
+    "/patch.py",
+    "/doctor.py",
+    "/contributor_funnel.py",
+    "/demo.py",
+    "/docs_navigation.py",
+    "/docs_qa.py",
+    "/enterprise_readiness.py",
+    "/first_contribution.py",
+    "/github_actions_quickstart.py",
+    "/gitlab_ci_quickstart.py",
+    "/onboarding.py",
+    "/checks/main.py",
+)
+PRINT_ALLOWED_PATHS = {
+    "src/sdetkit/adoption.py",
+    "src/sdetkit/community_activation.py",
+    "src/sdetkit/contract.py",
+    "src/sdetkit/core/core_preparse_dispatch.py",
+    "src/sdetkit/external_contribution.py",
+    "src/sdetkit/fit.py",
+    "src/sdetkit/objection_handling.py",
+    "src/sdetkit/onboarding_optimization.py",
+    "src/sdetkit/phases/phase1_hardening.py",
+    "src/sdetkit/phases/phase_boost.py",
+    "src/sdetkit/proof.py",
+    "src/sdetkit/quality_contribution_delta.py",
+    "src/sdetkit/release_communications.py",
+    "src/sdetkit/sdet_package.py",
+    "src/sdetkit/test_bootstrap_contract.py",
+    "src/sdetkit/test_bootstrap_validate.py",
+    "src/sdetkit/triage_templates.py",
+    "src/sdetkit/weekly_review.py",
+}
+
+
+@dataclass(frozen=True)
+class Finding:
+    rule_id: str
+    severity: str
+    path: str
+    line: int
+    column: int
+    message: str
+    suggestion: str = ""
+    fingerprint: str = ""
+
+
+@dataclass(frozen=True)
+class RuleMeta:
+    rule_id: str
+    severity: str
+    title: str
+    description: str
+
+
+RULES: dict[str, RuleMeta] = {
+    "SEC_DANGEROUS_EVAL": RuleMeta(
+        "SEC_DANGEROUS_EVAL", "error", "Dangerous code execution", "Use of eval/exec/compile."
+    ),
+    "SEC_SUBPROCESS_SHELL_TRUE": RuleMeta(
+        "SEC_SUBPROCESS_SHELL_TRUE",
+        "error",
+        "subprocess shell=True",
+        "Avoid shell=True in subprocess calls.",
+    ),
+    "SEC_OS_SYSTEM": RuleMeta(
+        "SEC_OS_SYSTEM",
+        "error",
+        "os.system invocation",
+        "Avoid os.system; use subprocess with argument lists.",
+    ),
+    "SEC_INSECURE_DESERIALIZATION": RuleMeta(
+        "SEC_INSECURE_DESERIALIZATION",
+        "error",
+        "Insecure deserialization",
+        "Avoid pickle/dill for untrusted input.",
+    ),
+    "SEC_YAML_UNSAFE_LOAD": RuleMeta(
+        "SEC_YAML_UNSAFE_LOAD",
+        "error",
+        "Unsafe YAML load",
+        "Use yaml.safe_load instead of yaml.load.",
+    ),
+    "SEC_WEAK_HASH": RuleMeta(
+        "SEC_WEAK_HASH",
+        "warn",
+        "Weak hash usage",
+        "Avoid md5/sha1 for security-sensitive workflows.",
+    ),
+    "SEC_POTENTIAL_PATH_TRAVERSAL": RuleMeta(
+        "SEC_POTENTIAL_PATH_TRAVERSAL",
+        "warn",
+        "Potential path traversal",
+        "Use safe_path-style guard for user-controlled path segments.",
+    ),
+    "SEC_UNCONTROLLED_PATH_EXPRESSION": RuleMeta(
+        "SEC_UNCONTROLLED_PATH_EXPRESSION",
+        "error",
+        "Uncontrolled data used in path expression",
+        "Validate user-controlled path segments with safe_path before filesystem operations.",
+    ),
+    "SEC_EMPTY_EXCEPT": RuleMeta(
+        "SEC_EMPTY_EXCEPT",
+        "warn",
+        "Empty except",
+        "Catch concrete exceptions and avoid silent pass in except blocks.",
+    ),
+    "SEC_POTENTIAL_UNSAFE_WRITE": RuleMeta(
+        "SEC_POTENTIAL_UNSAFE_WRITE",
+        "warn",
+        "Potential unsafe write",
+        "Avoid absolute writes outside workspace allowlist.",
+    ),
+    "SEC_SECRET_PATTERN": RuleMeta(
+        "SEC_SECRET_PATTERN",
+        "error",
+        "Secret-like pattern",
+        "Potential credential or private key material detected.",
+    ),
+    "SEC_HIGH_ENTROPY_STRING": RuleMeta(
+        "SEC_HIGH_ENTROPY_STRING",
+        "warn",
+        "High entropy string",
+        "Potential token-like hardcoded value detected.",
+    ),
+    "SEC_NETWORK_TIMEOUT": RuleMeta(
+        "SEC_NETWORK_TIMEOUT",
+        "warn",
+        "Network call missing timeout",
+        "Set explicit timeout for requests/urllib calls.",
+    ),
+    "SEC_DEBUG_PRINT": RuleMeta(
+        "SEC_DEBUG_PRINT", "info", "Debug print in src", "Avoid print() in src/ modules."
+    ),
+    "SEC_DEP_VULN": RuleMeta(
+        "SEC_DEP_VULN",
+        "error",
+        "Dependency vulnerability",
+        "Dependency version matches local vulnerability rule.",
+    ),
+}
+
+OFFLINE_VULN_RULES: dict[str, dict[str, str]] = {
+    "filelock": {
+        "3.18.0": "CVE-2025-68146: TOCTOU race condition allows symlink attacks.",
+        "3.18.1": "CVE-2026-22701: TOCTOU symlink vulnerability in SoftFileLock.",
+    },
+    "pyyaml": {
+        "5.3": "CVE-2020-14343: unsafe loader behavior in older versions.",
+        "5.4": "CVE-2020-14343: unsafe loader behavior in older versions.",
+    },
+    "jinja2": {
+        "2.10": "CVE-2019-10906: sandbox escape in older versions.",
+    },
+}
+
+SECRET_PATTERNS: list[tuple[str, re.Pattern[str], str]] = [
+    ("SEC_SECRET_PATTERN", re.compile(r"AKIA[0-9A-Z]{16}"), "Potential AWS access key"),
+    ("SEC_SECRET_PATTERN", re.compile(r"gh[pousr]_[A-Za-z0-9_]{20,}"), "Potential GitHub token"),
+    (
+        "SEC_SECRET_PATTERN",
+        re.compile(r"(?i)api[_-]?key\s*[:=]\s*['\"]?[A-Za-z0-9_\-]{8,}"),
+        "Potential hardcoded API key",
+    ),
+    (
+        "SEC_SECRET_PATTERN",
+        re.compile(r"(?i)(token|secret|password)\s*[:=]\s*['\"]?[A-Za-z0-9_\-]{8,}"),
+        "Potential hardcoded credential",
+    ),
+    (
+        "SEC_SECRET_PATTERN",
+        re.compile(r"-----BEGIN (?:RSA|EC|OPENSSH|DSA|PRIVATE) KEY-----"),
+        "Potential PEM private key",
+    ),
+]
+
+
+class SecurityScanError(ValueError):
+    pass
+
+
+class _RuleVisitor(ast.NodeVisitor):
+    def __init__(self, rel_path: str, lines: list[str]) -> None:
+        self.rel_path = rel_path
+        self.lines = lines
+        self.findings: list[Finding] = []
+
+    def _add(self, rule_id: str, node: ast.AST, message: str, suggestion: str = "") -> None:
+        self.findings.append(
+            Finding(
+                rule_id=rule_id,
+                severity=RULES[rule_id].severity,
+                path=self.rel_path,
+                line=getattr(node, "lineno", 1),
+                column=getattr(node, "col_offset", 0),
+                message=message,
+                suggestion=suggestion,
+            )
+        )
+
+    def _allow_print_for_module(self) -> bool:
+        rel = self.rel_path.replace("\\", "/")
+        if rel.startswith("src/sdetkit/cli/"):
+            return True
+        if rel.startswith("src/sdetkit/readiness/") or rel.startswith("src/sdetkit/evidence/"):
+            return True
+        basename = rel.rsplit("/", 1)[-1].removesuffix(".py")
+        if basename.startswith("_"):
+            return True
+        if re.search(r"_\d+$", basename):
+            return True
+        if rel in PRINT_ALLOWED_PATHS:
+            return True
+        return rel.startswith("src/sdetkit/") and rel.endswith(PRINT_ALLOWED_MODULE_SUFFIXES)
+
+    def visit_Call(self, node: ast.Call) -> Any:
+        name = _call_name(node)
+        if name in {"eval", "exec"}:
+            self._add(
+                "SEC_DANGEROUS_EVAL", node, f"Avoid {name}(); dynamic execution is dangerous."
+            )
+        if name == "os.system":
+            self._add(
+                "SEC_OS_SYSTEM", node, "os.system detected; use subprocess with argument list."
+            )
+        if name and name.startswith("subprocess.") and _kw_bool(node, "shell", True):
+            self._add(
+                "SEC_SUBPROCESS_SHELL_TRUE",
+                node,
+                "subprocess call uses shell=True.",
+                suggestion="Set shell=False and pass command as a list.",
+            )
+        if name in {"pickle.load", "pickle.loads"} or name.startswith("dill"):
+            self._add(
+                "SEC_INSECURE_DESERIALIZATION",
+                node,
+                f"Insecure deserialization via {name}.",
+            )
+        if name == "yaml.load" and not _is_safe_yaml_loader(node):
+            self._add(
+                "SEC_YAML_UNSAFE_LOAD",
+                node,
+                "yaml.load used without SafeLoader/safe_load.",
+                suggestion="Replace with yaml.safe_load(...).",
+            )
+        if name in {"hashlib.md5", "hashlib.sha1", "md5", "sha1"}:
+            self._add("SEC_WEAK_HASH", node, f"Weak hash usage: {name}.")
+        if (
+            name
+            and name.startswith("requests.")
+            and name.split(".")[-1]
+            in {
+                "get",
+                "post",
+                "put",
+                "patch",
+                "delete",
+                "head",
+                "request",
+            }
+        ):
+            if not _has_kw(node, "timeout"):
+                self._add(
+                    "SEC_NETWORK_TIMEOUT",
+                    node,
+                    f"{name} without timeout.",
+                    suggestion="Add timeout=<seconds> argument.",
+                )
+        if name in {"urllib.request.urlopen", "urlopen"} and not _has_kw(node, "timeout"):
+            self._add(
+                "SEC_NETWORK_TIMEOUT",
+                node,
+                "urllib.request.urlopen without timeout.",
+                suggestion="Add timeout=<seconds> argument.",
+            )
+        if name in {
+            "os.path.join",
+            "pathlib.Path",
+            "Path",
+            "pathlib.Path.joinpath",
+            "Path.joinpath",
+        }:
+            if _looks_untrusted_path_args(node):
+                self._add(
+                    "SEC_POTENTIAL_PATH_TRAVERSAL",
+                    node,
+                    "Path join with potentially user-controlled segment.",
+                    suggestion="Validate with safe_path before filesystem access.",
+                )
+        if _is_uncontrolled_path_read(node):
+            self._add(
+                "SEC_UNCONTROLLED_PATH_EXPRESSION",
+                node,
+                "Filesystem read uses path derived from potentially uncontrolled input.",
+                suggestion="Resolve through safe_path(root, user_path) before reading.",
+            )
+        if name == "open" and _is_write_mode_open(node):
+            if _is_absolute_literal(node):
+                self._add(
+                    "SEC_POTENTIAL_UNSAFE_WRITE",
+                    node,
+                    "Write to absolute path detected.",
+                    suggestion="Restrict writes to workspace or explicit allowlist.",
+                )
+        if (
+            self.rel_path.startswith("src/")
+            and name == "print"
+            and not self._allow_print_for_module()
+        ):
+            self._add("SEC_DEBUG_PRINT", node, "print(...) found in src/.")
+        self.generic_visit(node)
+
+    def visit_Try(self, node: ast.Try) -> Any:
+        for handler in node.handlers:
+            if not isinstance(handler, ast.ExceptHandler):
+                continue
+            if handler.type is None or (
+                isinstance(handler.type, ast.Name) and handler.type.id == "Exception"
+            ):
+                if len(handler.body) == 1 and isinstance(handler.body[0], ast.Pass):
+                    self._add(
+                        "SEC_EMPTY_EXCEPT",
+                        handler,
+                        "except block silently swallows errors via pass.",
+                        suggestion="Catch precise exceptions and log or handle failure explicitly.",
+                    )
+        self.generic_visit(node)
+
+
+def _call_name(node: ast.Call) -> str:
+    fn = node.func
+    if isinstance(fn, ast.Name):
+        return fn.id
+    if isinstance(fn, ast.Attribute):
+        parts = [fn.attr]
+        value = fn.value
+        while isinstance(value, ast.Attribute):
+            parts.append(value.attr)
+            value = value.value
+        if isinstance(value, ast.Name):
+            parts.append(value.id)
+        return ".".join(reversed(parts))
+    return ""
+
+
+def _kw_bool(node: ast.Call, key: str, expected: bool) -> bool:
+    for kw in node.keywords:
+        if (
+            kw.arg == key
+            and isinstance(kw.value, ast.Constant)
+            and isinstance(kw.value.value, bool)
+        ):
+            return kw.value.value is expected
+    return False
+
+
+def _has_kw(node: ast.Call, key: str) -> bool:
+    return any(kw.arg == key for kw in node.keywords)
+
+
+def _looks_untrusted_path_args(node: ast.Call) -> bool:
+    for arg in node.args:
+        if isinstance(arg, ast.Name) and arg.id.lower() in SUSPICIOUS_INPUT_NAMES:
+            return True
+        if isinstance(arg, ast.Constant) and isinstance(arg.value, str) and ".." in arg.value:
+            return True
+    return False
+
+
+def _is_write_mode_open(node: ast.Call) -> bool:
+    if (
+        len(node.args) >= 2
+        and isinstance(node.args[1], ast.Constant)
+        and isinstance(node.args[1].value, str)
+    ):
+        mode = node.args[1].value
+        return any(ch in mode for ch in ("w", "a", "x"))
+    for kw in node.keywords:
+        if (
+            kw.arg == "mode"
+            and isinstance(kw.value, ast.Constant)
+            and isinstance(kw.value.value, str)
+        ):
+            return any(ch in kw.value.value for ch in ("w", "a", "x"))
+    return False
+
+
+def _is_absolute_literal(node: ast.Call) -> bool:
+    if not node.args:
+        return False
+    first = node.args[0]
+    if isinstance(first, ast.Constant) and isinstance(first.value, str):
+        return first.value.startswith("/")
+    return False
+
+
+def _is_safe_yaml_loader(node: ast.Call) -> bool:
+    for kw in node.keywords:
+        if kw.arg != "Loader":
+            continue
+        if isinstance(kw.value, ast.Attribute) and kw.value.attr in {"SafeLoader", "CSafeLoader"}:
+            return True
+        if isinstance(kw.value, ast.Name) and kw.value.id in {"SafeLoader", "CSafeLoader"}:
+            return True
+    return False
+
+
+def _is_uncontrolled_path_read(node: ast.Call) -> bool:
+    call_name = _call_name(node)
+    if call_name not in {"Path", "pathlib.Path", "open"}:
+        return False
+    if not node.args:
+        return False
+    arg = node.args[0]
+    if isinstance(arg, ast.Name) and arg.id.lower() in SUSPICIOUS_INPUT_NAMES:
+        return True
+    if isinstance(arg, ast.Call) and _call_name(arg) in {"str", "Path", "pathlib.Path"}:
+        if arg.args and isinstance(arg.args[0], ast.Name):
+            return arg.args[0].id.lower() in SUSPICIOUS_INPUT_NAMES
+    return False
+
+
+def _should_scan_file(path: Path) -> bool:
+    if path.suffix.lower() in TEXT_EXTENSIONS:
+        return True
+    return path.name in {".env", ".env.local", ".env.production"}
+
+
+def _iter_files(root: Path) -> list[Path]:
+    resolved_root = root.resolve(strict=True)
+    files: list[Path] = []
+    for p in root.rglob("*"):
+        if not p.is_file():
+            continue
+        try:
+            resolved = p.resolve(strict=False)
+        except OSError:
+            continue
+        if resolved != resolved_root and resolved_root not in resolved.parents:
+            continue
+        if any(part in SKIP_DIRS for part in p.parts):
+            continue
+        rel = p.relative_to(root).as_posix()
+        if any(rel.startswith(prefix) for prefix in SKIP_PATH_PREFIXES):
+            continue
+        if not _should_scan_file(p):
+            continue
+        try:
+            if p.stat().st_size > 1_000_000:
+                continue
+        except OSError:
+            continue
+        files.append(p)
+    files.sort(key=lambda x: x.as_posix())
+    return files
+
+
+def _normalized_message(message: str) -> str:
+    return re.sub(r"\s+", " ", message.strip()).lower()
+
+
+def _scope_table(lines: list[str]) -> list[str]:
+    """``table[i]`` is the nearest ``def``/``class`` header among ``lines[:i]``."""
+    table = [""]
+    scope = ""
+    for text in lines:
+        s = text.lstrip()
+        if s.startswith("def ") or s.startswith("class "):
+            scope = s.split("(", 1)[0].split(":", 1)[0].strip()
+        table.append(scope)
+    return table
+
+
+def _fingerprint(
+    rule_id: str,
+    path: str,
+    line: int,
+    message: str,
+    *,
+    lines: list[str] | None = None,
+    scopes: list[str] | None = None,
+) -> str:
+    if lines is None:
+        try:
+            lines = Path(path).read_text(encoding="utf-8", errors="replace").splitlines()
+        except Exception:
+            lines = []
+
+    line_text = ""
+    scope = ""
+    if 1 <= line <= len(lines):
+        line_text = lines[line - 1].strip()
+        if scopes is None:
+            scopes = _scope_table(lines[: line - 1])
+        scope = scopes[line - 1]
+
+    raw = f"{rule_id}\n{path}\n{scope}\n{line_text}\n{message}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
+
+
+def _load_repo_allowlist(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        raise SecurityScanError(f"invalid allowlist JSON: {exc}") from exc
+    if not isinstance(payload, dict) or not isinstance(payload.get("entries", []), list):
+        raise SecurityScanError("allowlist file must be object with 'entries' list")
+    entries = [item for item in payload["entries"] if isinstance(item, dict)]
+    entries.sort(
+        key=lambda x: (
+            str(x.get("rule_id", "")),
+            str(x.get("path", "")),
+            int(x.get("line", 0) or 0),
+        )
+    )
+    return entries
+
+
+def _inline_allowed(lines: list[str], finding: Finding) -> bool:
+    line_no = finding.line
+    for idx in (line_no - 1, line_no - 2):
+        if idx < 0 or idx >= len(lines):
+            continue
+        txt = lines[idx]
+        if INLINE_ALLOW_PREFIX in txt:
+            allow_rule = txt.split(INLINE_ALLOW_PREFIX, 1)[1].strip()
+            if allow_rule == finding.rule_id:
+                return True
+    return False
+
+
+AllowlistIndex = frozenset[tuple[str, str, int | None, str | None]]
+
+
+def _index_allowlist(entries: list[dict[str, Any]]) -> AllowlistIndex:
+    """Key allowlist entries by (rule_id, path, line, fingerprint).
+
+    ``line`` and ``fingerprint`` are ``None`` when the entry leaves them unset, so an
+    entry acts as a wildcard for whichever of the two it does not pin.
+    """
+    keys: set[tuple[str, str, int | None, str | None]] = set()
+    for item in entries:
+        line = item.get("line")
+        fp = item.get("fingerprint")
+        keys.add(
+            (
+                str(item.get("rule_id", "")),
+                str(item.get("path", "")),
+                line if isinstance(line, int) else None,
+                fp if isinstance(fp, str) and fp else None,
+            )
+        )
+    return frozenset(keys)
+
+
+def _repo_allowed(entries: AllowlistIndex | list[dict[str, Any]], finding: Finding) -> bool:
+    index = entries if isinstance(entries, frozenset) else _index_allowlist(entries)
+    if not index:
+        return False
+    rule_id, path = finding.rule_id, finding.path
+    return (
+        (rule_id, path, None, None) in index
+        or (rule_id, path, finding.line, None) in index
+        or (rule_id, path, None, finding.fingerprint) in index
+        or (rule_id, path, finding.line, finding.fingerprint) in index
+    )
+
+
+def _looks_like_slug(token: str) -> bool:
+    if len(token) < 20:
+        return False
+    if token.lower() != token:
+        return False
+    if "-" not in token:
+        return False
+    if re.fullmatch(r"[a-z0-9]+(?:-[a-z0-9]+){2,}", token) is None:
+        return False
+    return True
+
+
+def _looks_like_snake_identifier(token: str) -> bool:
+    if len(token) < 20:
+        return False
+    if token.lower() != token:
+        return False
+    if "_" not in token:
+        return False
+    parts = token.split("_")
+    if len(parts) < 3:
+        return False
+    return all(
+        len(part) >= 3 and re.fullmatch(r"[a-z][a-z0-9]*", part) is not None for part in parts
+    )
+
+
+def _looks_like_uuid(token: str) -> bool:
+    t = token
+    if t.startswith("urn:uuid:"):
+        t = t[len("urn:uuid:") :]
+    return (
+        re.fullmatch(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", t) is not None
+    )
+
+
+def _looks_like_hex_digest(token: str) -> bool:
+    n = len(token)
+    if n not in {24, 32, 40, 48, 56, 64}:
+        return False
+    return re.fullmatch(r"[0-9a-f]+", token) is not None
+
+
+def _looks_like_boolean_assignment(token: str) -> bool:
+    return re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*=(?:true|false)", token, re.IGNORECASE) is not None
+
+
+def _looks_like_path(token: str) -> bool:
+    if "/" not in token:
+        return False
+    if token.startswith(("docs/", "src/", "tools/", ".sdetkit/")):
+        return True
+    if "docs/artifacts/" in token:
+        return True
+    if re.fullmatch(r"[A-Za-z0-9._/-]+", token) is None:
+        return False
+    parts = [p for p in token.split("/") if p]
+    if not parts:
+        return False
+    return all(re.fullmatch(r"[A-Za-z0-9._-]+", part) is not None for part in parts)
+
+
+def _is_test_fixture_secret(rel_path: str, line: str) -> bool:
+    if not rel_path.startswith("tests/"):
+        return False
+    marker_tokens = {"TOPSECRET", "SHOULD_NOT_LEAK", "dummy", "example"}
+    upper_line = line.upper()
+    return any(token in upper_line for token in marker_tokens)
+
+
+# Lowercase literals, one of which occurs in every SECRET_PATTERNS match (case-insensitively).
+# Kept free of groups and flags so the alternation compiles with a first-character prefilter.
+SECRET_PATTERN_ANCHORS = (
+    "akia",
+    "gh[pousr]_",
+    "api[_-]?key",
+    "token",
+    "secret",
+    "password",
+    "-----begin ",
+)
+SECRET_ANCHOR_PATTERN = re.compile("|".join(SECRET_PATTERN_ANCHORS))
+SECRET_ANCHOR_PATTERN_NOCASE = re.compile("|".join(SECRET_PATTERN_ANCHORS), re.IGNORECASE)
+# Non-ASCII characters that re.IGNORECASE equates with ASCII letters.
+_ANCHOR_FOLD = (("\u0130", "i"), ("\u0131", "i"), ("\u017f", "s"), ("\u212a", "k"))
+QUOTED_TOKEN_PATTERN = re.compile(r"['\"]([A-Za-z0-9+/=_\-]{20,})['\"]")
+
+
+def _line_starts(text: str) -> list[int]:
+    """Offset in *text* of each line ``str.splitlines`` yields."""
+    return [0, *itertools.accumulate(map(len, text.splitlines(keepends=True)))][:-1]
+
+
+def _anchor_text(text: str) -> str | None:
+    """Lowercased *text* with unchanged offsets, or None when folding would shift them."""
+    if text.isascii():
+        return text.lower()
+    folded = text
+    for char, ascii_char in _ANCHOR_FOLD:
+        if char in folded:
+            folded = folded.replace(char, ascii_char)
+    folded = folded.lower()
+    return folded if len(folded) == len(text) else None
+
+
+def _scan_text_patterns(rel_path: str, text: str) -> list[Finding]:
+    # Whole-text passes locate candidate lines; SECRET_PATTERNS are then checked per line.
+    folded = _anchor_text(text)
+    if folded is not None:
+        anchors = SECRET_ANCHOR_PATTERN.finditer(folded)
+    else:
+        anchors = SECRET_ANCHOR_PATTERN_NOCASE.finditer(text)
+    anchor_offsets = [match.start() for match in anchors]
+    tokens = list(QUOTED_TOKEN_PATTERN.finditer(text))
+    if not anchor_offsets and not tokens:
+        return []
+    lines = text.splitlines()
+    starts = _line_starts(text)
+
+    by_line: dict[int, list[Finding]] = {}
+    for idx in sorted({bisect.bisect_right(starts, pos) - 1 for pos in anchor_offsets}):
+        line = lines[idx]
+        for rule_id, pattern, msg in SECRET_PATTERNS:
+            if pattern.search(line):
+                if _is_test_fixture_secret(rel_path, line):
+                    continue
+                by_line.setdefault(idx, []).append(
+                    Finding(
+                        rule_id=rule_id,
+                        severity=RULES[rule_id].severity,
+                        path=rel_path,
+                        line=idx + 1,
+                        column=0,
+                        message=msg,
+                    )
+                )
+
+    # quoted token-like strings; the token class excludes quotes and line breaks, so matches
+    # over the whole text are exactly the per-line matches
+    for match in tokens:
+        token = match.group(1)
+        if _looks_like_path(token):
+            continue
+        if _looks_like_slug(token):
+            continue
+        if _looks_like_snake_identifier(token):
+            continue
+        if _looks_like_uuid(token):
+            continue
+        if _looks_like_hex_digest(token):
+            continue
+        if _looks_like_boolean_assignment(token):
+            continue
+        if _entropy(token) >= 4.0 and not token.isdigit():
+            idx = bisect.bisect_right(starts, match.start(1)) - 1
+            by_line.setdefault(idx, []).append(
+                Finding(
+                    rule_id="SEC_HIGH_ENTROPY_STRING",
+                    severity=RULES["SEC_HIGH_ENTROPY_STRING"].severity,
+                    path=rel_path,
+                    line=idx + 1,
+                    column=match.start(1) - starts[idx],
+                    message="High-entropy string literal detected.",
+                )
+            )
+    return [finding for idx in sorted(by_line) for finding in by_line[idx]]
+
+
+def _entropy(text: str) -> float:
+    if not text:
+        return 0.0
+    total = len(text)
+    return -sum((v / total) * math.log2(v / total) for v in Counter(text).values())
+
+
+def _ruleset_version() -> str:
+    parts: list[str] = [str(SCAN_ENGINE_VERSION)]
+    parts.extend(f"{rid}:{meta.severity}" for rid, meta in sorted(RULES.items()))
+    parts.extend(f"{rid}:{pattern.pattern}:{msg}" for rid, pattern, msg in SECRET_PATTERNS)
+    parts.extend(sorted(SUSPICIOUS_INPUT_NAMES))
+    parts.extend(PRINT_ALLOWED_MODULE_SUFFIXES)
+    parts.extend(sorted(PRINT_ALLOWED_PATHS))
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class SecurityScanCache:
+    """Per-file raw findings keyed by content hash and rule-set version.
+
+    Only files seen during the last scan are kept, so deleted files drop out on save.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.ruleset = _ruleset_version()
+        self.hits = 0
+        self.misses = 0
+        self._previous: dict[str, Any] = {}
+        self._current: dict[str, Any] = {}
+        if path is None or not path.exists():
+            return
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(payload, dict) and payload.get("ruleset") == self.ruleset:
+            files = payload.get("files")
+            self._previous = files if isinstance(files, dict) else {}
+
+    def get(self, rel_path: str, digest: str) -> list[Finding] | None:
+        entry = self._previous.get(rel_path)
+        if not isinstance(entry, dict) or entry.get("sha256") != digest:
+            self.misses += 1
+            return None
+        try:
+            findings = [Finding(**item) for item in entry.get("findings", [])]
+        except TypeError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._current[rel_path] = entry
+        return findings
+
+    def known(self, rel_path: str) -> tuple[str, bool] | None:
+        """Return the cached ``(sha256, has_findings)`` for *rel_path* without counting it."""
+        entry = self._previous.get(rel_path)
+        if not isinstance(entry, dict) or not isinstance(entry.get("sha256"), str):
+            return None
+        return entry["sha256"], bool(entry.get("findings"))
+
+    def put(self, rel_path: str, digest: str, findings: list[Finding]) -> None:
+        self._current[rel_path] = {"sha256": digest, "findings": [asdict(f) for f in findings]}
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        payload = {
+            "version": 1,
+            "ruleset": self.ruleset,
+            "files": dict(sorted(self._current.items())),
+        }
+        atomic_write_text(self.path, json.dumps(payload, ensure_ascii=True, sort_keys=True) + "\n")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "ruleset": self.ruleset,
+            "files": self.hits + self.misses,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def _raw_file_findings(rel: str, text: str) -> list[Finding]:
+    file_findings: list[Finding] = []
+    if PurePosixPath(rel).suffix == ".py":
+        try:
+            tree = ast.parse(text)
+        except SyntaxError:
+            tree = None
+        if tree is not None:
+            visitor = _RuleVisitor(rel, text.splitlines())
+            visitor.visit(tree)
+            file_findings.extend(visitor.findings)
+    file_findings.extend(_scan_text_patterns(rel, text))
+    return file_findings
+
+
+def _read_scan_text(path: Path) -> tuple[bytes, str] | None:
+    """Return raw bytes and newline-normalised text, or ``None`` for non-UTF-8 files."""
+    raw = path.read_bytes()
+    try:
+        text = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    except UnicodeDecodeError:
+        return None
+    return raw, text
+
+
+def _scan_chunk(
+    root: str, hashed: bool, chunk: list[tuple[str, int, tuple[str, bool] | None]]
+) -> list[tuple[str, str, list[Finding] | None, list[str] | None]]:
+    """Process-pool worker: read, hash and scan each (rel_path, size, cached) entry.
+
+    ``cached`` is the cache's ``(sha256, has_findings)`` for the path. A file whose
+    digest still matches is not rescanned and comes back with ``None`` findings.
+    Lines are returned only for files with findings, so the parent never holds
+    the text of clean files.
+    """
+    results: list[tuple[str, str, list[Finding] | None, list[str] | None]] = []
+    for rel, _size, cached in chunk:
+        loaded = _read_scan_text(Path(root) / rel)
+        if loaded is None:
+            continue
+        raw, text = loaded
+        digest = hashlib.sha256(raw).hexdigest() if hashed else ""
+        if cached is not None and cached[0] == digest:
+            results.append((rel, digest, None, text.splitlines() if cached[1] else None))
+            continue
+        file_findings = _raw_file_findings(rel, text)
+        results.append((rel, digest, file_findings, text.splitlines() if file_findings else None))
+    return results
+
+
+def _balanced_chunks(
+    items: list[tuple[str, int, tuple[str, bool] | None]], count: int
+) -> list[list[tuple[str, int, tuple[str, bool] | None]]]:
+    """Split (rel_path, size, cached) items into up to *count* chunks of similar total size."""
+    heap: list[tuple[int, int]] = [(0, idx) for idx in range(max(1, min(count, len(items))))]
+    chunks: list[list[tuple[str, int, tuple[str, bool] | None]]] = [[] for _ in heap]
+    for item in sorted(items, key=lambda x: x[1], reverse=True):
+        size, idx = heapq.heappop(heap)
+        chunks[idx].append(item)
+        heapq.heappush(heap, (size + item[1], idx))
+    return [chunk for chunk in chunks if chunk]
+
+
+def _filter_file_findings(
+    raw_findings: list[Finding], lines: list[str], allow_index: AllowlistIndex
+) -> list[Finding]:
+    kept: list[Finding] = []
+    scopes = _scope_table(lines) if raw_findings else []
+    for finding in raw_findings:
+        with_fp = Finding(
+            **{
+                **asdict(finding),
+                "fingerprint": _fingerprint(
+                    finding.rule_id,
+                    finding.path,
+                    finding.line,
+                    finding.message,
+                    lines=lines,
+                    scopes=scopes,
+                ),
+            }
+        )
+        if _inline_allowed(lines, with_fp):
+            continue
+        if _repo_allowed(allow_index, with_fp):
+            continue
+        file_line = lines[with_fp.line - 1] if 0 < with_fp.line <= len(lines) else ""
+        if with_fp.rule_id == "SEC_WEAK_HASH" and INLINE_ALLOW_PREFIX in file_line:
+            continue
+        kept.append(with_fp)
+    return kept
+
+
+def scan_repo(
+    root: Path,
+    *,
+    allowlist_path: Path | None = None,
+    cache: SecurityScanCache | None = None,
+    jobs: int = 1,
+) -> list[Finding]:
+    """Scan *root*; with ``jobs > 1`` uncached files are parsed in a process pool."""
+    if jobs < 1:
+        raise SecurityScanError("jobs must be >= 1")
+    allow_index = _index_allowlist(_load_repo_allowlist(allowlist_path or DEFAULT_ALLOWLIST_PATH))
+    findings: list[Finding] = []
+    pending: list[tuple[str, int, tuple[str, bool] | None]] = []
+    # A cache directory outside SKIP_DIRS must not have its own findings file scanned.
+    cache_rel: str | None = None
+    if cache is not None and cache.path is not None:
+        try:
+            cache_rel = cache.path.resolve().relative_to(root.resolve()).as_posix()
+        except ValueError:
+            cache_rel = None
+    for file_path in _iter_files(root):
+        rel = file_path.relative_to(root).as_posix()
+        if rel == cache_rel:
+            continue
+        if jobs > 1:
+            # Workers read their own files; the parent only plans by size.
+            known = cache.known(rel) if cache is not None else None
+            pending.append((rel, file_path.stat().st_size, known))
+            continue
+        loaded = _read_scan_text(file_path)
+        if loaded is None:
+            continue
+        raw, text = loaded
+        digest = hashlib.sha256(raw).hexdigest() if cache is not None else ""
+        file_findings = cache.get(rel, digest) if cache is not None else None
+        if file_findings is None:
+            file_findings = _raw_file_findings(rel, text)
+            if cache is not None:
+                cache.put(rel, digest, file_findings)
+        findings.extend(_filter_file_findings(file_findings, text.splitlines(), allow_index))
+
+    if pending:
+        # Several chunks per worker keep the pool busy when one chunk runs long.
+        chunks = _balanced_chunks(pending, jobs * 4)
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+            for results in pool.map(
+                _scan_chunk,
+                itertools.repeat(str(root)),
+                itertools.repeat(cache is not None),
+                chunks,
+            ):
+                for rel, digest, scanned, lines in results:
+                    file_findings = cache.get(rel, digest) if cache is not None else None
+                    if file_findings is None:
+                        if scanned is None:
+                            # The cached entry matched by digest but could not be loaded.
+                            loaded = _read_scan_text(root / rel)
+                            if loaded is None:
+                                continue
+                            lines = loaded[1].splitlines()
+                            scanned = _raw_file_findings(rel, loaded[1])
+                        file_findings = scanned
+                        if cache is not None:
+                            cache.put(rel, digest, file_findings)
+                    findings.extend(_filter_file_findings(file_findings, lines or [], allow_index))
+
+    if cache is not None:
+        cache.save()
+    findings.sort(key=lambda x: (x.path, x.line, x.column, x.rule_id, x.message))
+    return findings
+
+
+def _parse_pinned_dependencies(path: Path) -> list[tuple[str, str, int]]:
+    deps: list[tuple[str, str, int]] = []
+    for line_no, raw in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        m = re.match(r"([A-Za-z0-9_.\-]+)==([A-Za-z0-9_.\-]+)", line)
+        if not m:
+            continue
+        deps.append((m.group(1).lower().replace("_", "-"), m.group(2), line_no))
+    deps.sort()
+    return deps
+
+
+def _scan_dependency_vulns_offline(root: Path) -> list[Finding]:
+    findings: list[Finding] = []
+    for rel in ("requirements.lock", "requirements.txt.lock", "requirements.txt"):
+        path = root / rel
+        if not path.exists() or not path.is_file():
+            continue
+        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        scopes = _scope_table(lines)
+        for name, version, line_no in _parse_pinned_dependencies(path):
+            advisories = OFFLINE_VULN_RULES.get(name, {})
+            for vulnerable_prefix, reason in sorted(advisories.items()):
+                if version.startswith(vulnerable_prefix):
+                    findings.append(
+                        Finding(
+                            rule_id="SEC_DEP_VULN",
+                            severity="error",
+                            path=rel,
+                            line=line_no,
+                            column=1,
+                            message=f"{name}=={version} matches offline vulnerability rule ({reason})",
+                            suggestion="Upgrade to a patched dependency version.",
+                            fingerprint=_fingerprint(
+                                "SEC_DEP_VULN",
+                                rel,
+                                line_no,
+                                f"{name}=={version}|{reason}",
+                                lines=lines,
+                                scopes=scopes,
+                            ),
+                        )
+                    )
+    findings.sort(key=lambda x: (x.path, x.line, x.rule_id, x.message))
+    return findings
+
+
+def _generate_sbom_cyclonedx(root: Path) -> dict[str, Any]:
+    components: list[dict[str, Any]] = []
+    seen: set[tuple[str, str]] = set()
+    for rel in ("requirements.lock", "requirements.txt.lock", "requirements.txt"):
+        path = root / rel
+        if not path.exists() or not path.is_file():
+            continue
+        for name, version, _ in _parse_pinned_dependencies(path):
+            key = (name, version)
+            if key in seen:
+                continue
+            seen.add(key)
+            components.append(
+                {
+                    "bom-ref": f"pkg:pypi/{name}@{version}",
+                    "type": "library",
+                    "name": name,
+                    "version": version,
+                    "purl": f"pkg:pypi/{name}@{version}",
+                }
+            )
+    components.sort(key=lambda x: (str(x["name"]), str(x["version"])))
+    serial = hashlib.sha256(root.as_posix().encode("utf-8")).hexdigest()
+    return {
+        "bomFormat": "CycloneDX",
+        "specVersion": "1.5",
+        "version": 1,
+        "serialNumber": f"urn:uuid:{serial[:8]}-{serial[8:12]}-{serial[12:16]}-{serial[16:20]}-{serial[20:32]}",
+        "metadata": {"component": {"name": root.name or "repository", "type": "application"}},
+        "components": components,
+    }
+
+
+def _maybe_online_dep_scan(root: Path) -> list[Finding]:
+    cmd = os.environ.get("SDETKIT_SECURITY_ONLINE_CMD", "")
+    if not cmd.strip():
+        return []
+    proc = subprocess.run(shlex.split(cmd), cwd=str(root), capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise SecurityScanError(
+            "online dependency scan command failed; provide a working command in "
+            "SDETKIT_SECURITY_ONLINE_CMD or run without --online"
+        )
+    return []
+
+
+def run_security_scan(
+    root: Path,
+    *,
+    allowlist_path: Path,
+    online: bool,
+    sbom_output: Path | None,
+    cache: SecurityScanCache | None = None,
+    jobs: int = 1,
+) -> tuple[list[Finding], dict[str, Any]]:
+    findings = scan_repo(root, allowlist_path=allowlist_path, cache=cache, jobs=jobs)
+    findings.extend(_scan_dependency_vulns_offline(root))
+    if online:
+        findings.extend(_maybe_online_dep_scan(root))
+    findings.sort(key=lambda x: (x.path, x.line, x.column, x.rule_id, x.message))
+    sbom = _generate_sbom_cyclonedx(root)
+    if sbom_output is not None:
+        sbom_output.parent.mkdir(parents=True, exist_ok=True)
+        sbom_output.write_text(
+            json.dumps(sbom, ensure_ascii=True, sort_keys=True, indent=2) + "\n", encoding="utf-8"
+        )
+    return findings, sbom
+
+
+def _to_json_payload(
+    findings: list[Finding],
+    *,
+    new_only: list[Finding] | None = None,
+    sbom: dict[str, Any] | None = None,
+    cache_stats: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    counts = {"info": 0, "warn": 0, "error": 0}
+    for f in findings:
+        counts[f.severity] += 1
+    payload = {
+        "version": 1,
+        "counts": counts,
+        "findings": [asdict(x) for x in findings],
+        "new_findings": [asdict(x) for x in findings]
+        if new_only is None
+        else [asdict(x) for x in new_only],
+    }
+    if sbom is not None:
+        payload["sbom"] = sbom
+    if cache_stats is not None:
+        payload["cache"] = cache_stats
+    return payload
+
+
+def _to_text(findings: list[Finding], *, sbom_components: int = 0) -> str:
+    counts = {"info": 0, "warn": 0, "error": 0}
+    for f in findings:
+        counts[f.severity] += 1
+    lines = [
+        f"security scan: total={len(findings)} error={counts['error']} warn={counts['warn']} info={counts['info']}",
+        f"sbom components: {sbom_components}",
+        "top findings:",
+    ]
+    for item in findings[:15]:
+        lines.append(f"- [{item.severity}] {item.rule_id} {item.path}:{item.line} {item.message}")
+    if not findings:
+        lines.append("- none")
+    return "\n".join(lines) + "\n"
+
+
+def _to_sarif(
+    findings: list[Finding], *, cache_stats: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    rules = []
+    for rid in sorted({f.rule_id for f in findings}):
+        meta = RULES[rid]
+        rules.append(
+            {
+                "id": rid,
+                "name": meta.title,
+                "shortDescription": {"text": meta.title},
+                "fullDescription": {"text": meta.description},
+                "help": {
+                    "text": f"{meta.description} Fix guidance: review the finding and apply the suggested remediation."
+                },
+                "defaultConfiguration": {
+                    "level": {"info": "note", "warn": "warning", "error": "error"}[meta.severity]
+                },
+            }
+        )
+    results = []
+    for f in findings:
+        results.append(
+            {
+                "ruleId": f.rule_id,
+                "level": {"info": "note", "warn": "warning", "error": "error"}[f.severity],
+                "message": {"text": f.message},
+                "fingerprints": {"primaryLocationLineHash": f.fingerprint},
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": f.path},
+                            "region": {"startLine": f.line, "startColumn": max(f.column, 1)},
+                        }
+                    }
+                ],
+            }
+        )
+    run: dict[str, Any] = {
+        "tool": {"driver": {"name": "sdetkit-security-gate", "rules": rules}},
+        "results": results,
+    }
+    if cache_stats is not None:
+        run["properties"] = {"cache": cache_stats}
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [run],
+    }
+
+
+def _write_output(text: str, output: str | None) -> None:
+    if output:
+        path = Path(output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+
+
+def _severity_trips(findings: list[Finding], threshold: str) -> bool:
+    if threshold == "none":
+        return False
+    gate = FAIL_ON_TO_SEVERITY[threshold]
+    return any(SEVERITY_TO_FAIL_LEVEL[f.severity] >= gate for f in findings)
+
+
+def _parse_rule_budgets(items: list[str]) -> dict[str, int]:
+    budgets: dict[str, int] = {}
+    for raw in items:
+        if "=" not in raw:
+            raise SecurityScanError(f"invalid --max-rule value (expected RULE=COUNT): {raw}")
+        rid, count_text = raw.split("=", 1)
+        rid = rid.strip()
+        if rid not in RULES:
+            raise SecurityScanError(f"unknown rule in --max-rule: {rid}")
+        try:
+            count = int(count_text.strip())
+        except ValueError as exc:
+            raise SecurityScanError(f"invalid count in --max-rule: {raw}") from exc
+        if count < 0:
+            raise SecurityScanError(f"--max-rule count must be >= 0: {raw}")
+        budgets[rid] = count
+    return budgets
+
+
+def _enforce_budgets(
+    findings: list[Finding],
+    *,
+    max_total: int | None,
+    max_info: int | None,
+    max_warn: int | None,
+    max_error: int | None,
+    rule_budgets: dict[str, int],
+) -> tuple[dict[str, Any], bool]:
+    sev_counts = {"info": 0, "warn": 0, "error": 0}
+    rule_counts: dict[str, int] = {}
+    for item in findings:
+        sev_counts[item.severity] += 1
+        rule_counts[item.rule_id] = rule_counts.get(item.rule_id, 0) + 1
+
+    limits = {
+        "total": max_total,
+        "info": max_info,
+        "warn": max_warn,
+        "error": max_error,
+    }
+    exceeded: list[dict[str, Any]] = []
+
+    total = len(findings)
+    if max_total is not None and total > max_total:
+        exceeded.append({"metric": "total", "count": total, "limit": max_total})
+    for sev in ("info", "warn", "error"):
+        lim = limits[sev]
+        count = sev_counts[sev]
+        if lim is not None and count > lim:
+            exceeded.append({"metric": sev, "count": count, "limit": lim})
+
+    exceeded_rules: list[dict[str, Any]] = []
+    for rid, lim in sorted(rule_budgets.items()):
+        count = rule_counts.get(rid, 0)
+        if count > lim:
+            exceeded_rules.append({"rule_id": rid, "count": count, "limit": lim})
+
+    ok = not exceeded and not exceeded_rules
+    payload: dict[str, Any] = {
+        "ok": ok,
+        "counts": {"total": total, **sev_counts},
+        "limits": {k: v for k, v in limits.items() if v is not None},
+        "rule_limits": rule_budgets,
+        "exceeded": exceeded,
+        "exceeded_rules": exceeded_rules,
+    }
+    return payload, ok
+
+
+def _load_baseline(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or not isinstance(data.get("entries"), list):
+        raise SecurityScanError("baseline must be JSON object containing entries[]")
+    entries = [x for x in data["entries"] if isinstance(x, dict)]
+    entries.sort(
+        key=lambda x: (
+            str(x.get("path", "")),
+            str(x.get("rule_id", "")),
+            str(x.get("fingerprint", "")),
+        )
+    )
+    return entries
+
+
+def _load_scan_json(path: Path) -> tuple[list[Finding], dict[str, Any] | None]:
+    if not path.exists():
+        raise SecurityScanError(f"scan json not found: {path.as_posix()}")
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        raise SecurityScanError(f"invalid scan json: {exc}") from exc
+    if not isinstance(payload, dict) or not isinstance(payload.get("findings"), list):
+        raise SecurityScanError("scan json must be object with findings[]")
+
+    findings: list[Finding] = []
+    for item in payload["findings"]:
+        if not isinstance(item, dict):
+            continue
+        rid = str(item.get("rule_id", ""))
+        sev = str(item.get("severity", ""))
+        if rid not in RULES or sev not in SEVERITY_RANK:
+            continue
+        try:
+            line = int(item.get("line", 0) or 0)
+        except Exception:
+            line = 0
+        try:
+            column = int(item.get("column", 0) or 0)
+        except Exception:
+            column = 0
+        findings.append(
+            Finding(
+                rule_id=rid,
+                severity=sev,
+                path=str(item.get("path", "")),
+                line=line,
+                column=column,
+                message=str(item.get("message", "")),
+                suggestion=str(item.get("suggestion", "")),
+                fingerprint=str(item.get("fingerprint", "")),
+            )
+        )
+
+    findings.sort(key=lambda x: (x.path, x.line, x.column, x.rule_id, x.message))
+    sbom = payload.get("sbom") if isinstance(payload.get("sbom"), dict) else None
+    return findings, sbom
+
+
+def _make_baseline_entries(findings: list[Finding]) -> list[dict[str, Any]]:
+    entries = [
+        {
+            "rule_id": f.rule_id,
+            "severity": f.severity,
+            "path": f.path,
+            "line": f.line,
+            "fingerprint": f.fingerprint,
+            "message": _normalized_message(f.message)[:120],
+        }
+        for f in findings
+    ]
+    entries.sort(key=lambda x: (x["path"], x["rule_id"], x["line"], x["fingerprint"]))
+    return entries
+
+
+def _filter_new(findings: list[Finding], baseline_entries: list[dict[str, Any]]) -> list[Finding]:
+    known = {
+        (
+            str(x.get("rule_id", "")),
+            str(x.get("path", "")),
+            str(x.get("fingerprint", "")),
+        )
+        for x in baseline_entries
+    }
+    return [f for f in findings if (f.rule_id, f.path, f.fingerprint) not in known]
+
+
+def _render(
+    findings: list[Finding],
+    fmt: str,
+    *,
+    new_only: list[Finding] | None = None,
+    sbom: dict[str, Any] | None = None,
+    include_info: bool = True,
+    cache_stats: dict[str, Any] | None = None,
+) -> str:
+    if fmt == "text":
+        target = findings if new_only is None else new_only
+        components = len(sbom.get("components", [])) if isinstance(sbom, dict) else 0
+        return _to_text(target, sbom_components=components)
+    if fmt == "json":
+        return (
+            json.dumps(
+                _to_json_payload(findings, new_only=new_only, sbom=sbom, cache_stats=cache_stats),
+                ensure_ascii=True,
+                sort_keys=True,
+                indent=2,
+            )
+            + "\n"
+        )
+    if fmt == "sarif":
+        target = findings if new_only is None else new_only
+        if not include_info:
+            target = [item for item in target if item.severity != "info"]
+        sarif = _to_sarif(target, cache_stats=cache_stats)
+        return json.dumps(sarif, ensure_ascii=True, sort_keys=True, indent=2) + "\n"
+    raise SecurityScanError(f"unsupported format: {fmt}")
+
+
+def _fix_yaml_safe_load(path: Path) -> bool:
+    text = path.read_text(encoding="utf-8")
+    out = re.sub(r"\byaml\.load\s*\(", "yaml.safe_load(", text)
+    if out != text:
+        path.write_text(out, encoding="utf-8")
+        return True
+    return False
+
+
+def _fix_subprocess_shell_false(path: Path) -> bool:
+    text = path.read_text(encoding="utf-8")
+    out = text.replace("shell=True", "shell=False")
+    if out != text:
+        path.write_text(out, encoding="utf-8")
+        return True
+    return False
+
+
+def _inject_requests_timeout(text: str, timeout: int) -> str:
+    try:
+        tree = ast.parse(text)
+    except SyntaxError:
+        return text
+
+    request_methods = {"get", "post", "put", "patch", "delete", "head", "request"}
+
+    line_offsets: list[int] = [0]
+    running = 0
+    for line in text.splitlines(keepends=True):
+        running += len(line)
+        line_offsets.append(running)
+
+    edits: list[tuple[int, int, str]] = []
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if not (
+            isinstance(func, ast.Attribute)
+            and isinstance(func.value, ast.Name)
+            and func.value.id == "requests"
+            and func.attr in request_methods
+        ):
+            continue
+        if any(k.arg == "timeout" for k in node.keywords if k.arg):
+            continue
+
+        lineno = getattr(node, "lineno", None)
+        col_offset = getattr(node, "col_offset", None)
+        end_lineno = getattr(node, "end_lineno", None)
+        end_col_offset = getattr(node, "end_col_offset", None)
+        if not isinstance(lineno, int) or not isinstance(col_offset, int):
+            continue
+        if not isinstance(end_lineno, int) or not isinstance(end_col_offset, int):
+            continue
+        if lineno <= 0 or end_lineno <= 0:
+            continue
+        if lineno >= len(line_offsets) or end_lineno >= len(line_offsets):
+            continue
+        if col_offset < 0 or end_col_offset < 0:
+            continue
+
+        line_span = line_offsets[lineno] - line_offsets[lineno - 1]
+        end_line_span = line_offsets[end_lineno] - line_offsets[end_lineno - 1]
+        if col_offset > line_span or end_col_offset > end_line_span:
+            continue
+
+        start = line_offsets[lineno - 1] + col_offset
+        end = line_offsets[end_lineno - 1] + end_col_offset
+        if start < 0 or end > len(text) or end <= start:
+            continue
+        call_text = text[start:end]
+        if not call_text.endswith(")"):
+            continue
+        edits.append((start, end, call_text[:-1] + f", timeout={timeout})"))
+
+    if not edits:
+        return text
+
+    patched = text
+    for start, end, replacement in sorted(edits, key=lambda item: item[0], reverse=True):
+        patched = patched[:start] + replacement + patched[end:]
+    return patched
+
+
+def _fix_requests_timeout(path: Path, timeout: int) -> bool:
+    text = path.read_text(encoding="utf-8")
+    out = _inject_requests_timeout(text, timeout)
+    if out != text:
+        path.write_text(out, encoding="utf-8")
+        return True
+    return False
+
+
+def _run_ruff_fix(root: Path) -> tuple[bool, str]:
+    if not shutil.which("ruff"):
+        return False, "ruff not available; skipped"
+    proc = subprocess.run(
+        [sys.executable, "-m", "ruff", "check", str(root), "--fix"], capture_output=True, text=True
+    )
+    return proc.returncode == 0, (proc.stdout + proc.stderr).strip()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="sdetkit security")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--root", default=".")
+    common.add_argument("--allowlist", default=str(DEFAULT_ALLOWLIST_PATH))
+    common.add_argument("--format", choices=["text", "json", "sarif"], default="text")
+    common.add_argument("--output", "--out", default=None)
+    common.add_argument(
+        "--fail-on",
+        choices=["none", "low", "medium", "high", "critical", "warn", "error"],
+        default="medium",
+    )
+    common.add_argument("--online", action="store_true", help="Enable optional online scanning")
+    common.add_argument("--sbom-output", default=None, help="Write CycloneDX SBOM JSON to file")
+    common.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Keep a per-file findings cache in this directory (relative to --root); off by default",
+    )
+    common.add_argument(
+        "--no-cache", action="store_true", help="Ignore --cache-dir and rescan every file"
+    )
+    common.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Include findings-cache hit/miss counts in JSON and SARIF output",
+    )
+    scanning = argparse.ArgumentParser(add_help=False)
+    scanning.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for reading and scanning files",
+    )
+
+    scan = sub.add_parser("scan", parents=[common, scanning])
+    scan.add_argument(
+        "--include-info",
+        action="store_true",
+        help="Include info-level findings when rendering SARIF output.",
+    )
+    rpt = sub.add_parser("report", parents=[common, scanning])
+    rpt.add_argument("--scan-json", default=None)
+    rpt.add_argument(
+        "--include-info",
+        action="store_true",
+        help="Include info-level findings when rendering SARIF output.",
+    )
+
+    chk = sub.add_parser("check", parents=[common, scanning])
+    chk.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH))
+    chk.add_argument("--scan-json", default=None)
+
+    chk.add_argument(
+        "--include-info",
+        action="store_true",
+        help="Include info-level findings in new_findings and SARIF/text summaries.",
+    )
+
+    enf = sub.add_parser("enforce", parents=[common, scanning])
+    enf.add_argument("--scan-json", default=None)
+    enf.add_argument("--max-total", type=int, default=None)
+    enf.add_argument("--max-info", type=int, default=0)
+    enf.add_argument("--max-warn", type=int, default=None)
+    enf.add_argument("--max-error", type=int, default=0)
+    enf.add_argument(
+        "--max-rule",
+        action="append",
+        default=[],
+        metavar="RULE=COUNT",
+        help="Per-rule budget (repeatable), e.g. --max-rule SEC_OS_SYSTEM=0",
+    )
+    base = sub.add_parser("baseline", parents=[common, scanning])
+    base.add_argument(
+        "--include-info",
+        action="store_true",
+        help="Include info-level findings in baseline entries.",
+    )
+    fixp = sub.add_parser("fix")
+    fixp.add_argument("--root", default=".")
+    fixp.add_argument("--allowlist", default=str(DEFAULT_ALLOWLIST_PATH))
+    fixp.add_argument("--timeout", type=int, default=10)
+    fixp.add_argument("--dry-run", action="store_true", default=True)
+    fixp.add_argument("--apply", action="store_true")
+    fixp.add_argument("--run-ruff", action="store_true")
+
+    ns = parser.parse_args(argv)
+    try:
+        root = Path(ns.root).resolve()
+        allowlist = Path(ns.allowlist)
+        findings: list[Finding] = []
+        sbom: dict[str, Any] | None = None
+        cache: SecurityScanCache | None = None
+        if ns.cmd != "fix" and ns.cache_dir and not ns.no_cache:
+            cache = SecurityScanCache(root / ns.cache_dir / SCAN_CACHE_FILE)
+
+        if ns.cmd == "baseline":
+            findings, _ = run_security_scan(
+                root,
+                allowlist_path=allowlist,
+                online=bool(getattr(ns, "online", False)),
+                sbom_output=None,
+                cache=cache,
+                jobs=ns.jobs,
+            )
+            baseline_findings = (
+                findings if ns.include_info else [f for f in findings if f.severity != "info"]
+            )
+            entries = _make_baseline_entries(baseline_findings)
+            baseline_payload = {"version": 1, "entries": entries}
+            if not ns.output:
+                raise SecurityScanError("baseline requires --output <path>")
+            output = Path(ns.output)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(
+                json.dumps(baseline_payload, ensure_ascii=True, sort_keys=True, indent=2) + "\n",
+                encoding="utf-8",
+            )
+            sys.stdout.write(f"baseline written: {output.as_posix()} ({len(entries)} entries)\n")
+            return 0
+
+        if ns.cmd == "fix":
+            changed = 0
+            previews: list[str] = []
+            should_apply = bool(ns.apply)
+            for py_file in [p for p in _iter_files(root) if p.suffix == ".py"]:
+                before = py_file.read_text(encoding="utf-8")
+                did_change = _fix_yaml_safe_load(py_file) if should_apply else False
+                did_change = (
+                    _fix_subprocess_shell_false(py_file) if should_apply else False
+                ) or did_change
+                did_change = (
+                    _fix_requests_timeout(py_file, ns.timeout) if should_apply else False
+                ) or did_change
+                if not should_apply:
+                    candidate = re.sub(r"\byaml\.load\s*\(", "yaml.safe_load(", before)
+                    candidate = candidate.replace("shell=True", "shell=False")
+                    candidate = _inject_requests_timeout(candidate, ns.timeout)
+                    if candidate != before:
+                        rel = py_file.relative_to(root).as_posix()
+                        previews.append(
+                            "\n".join(
+                                difflib.unified_diff(
+                                    before.splitlines(),
+                                    candidate.splitlines(),
+                                    fromfile=f"a/{rel}",
+                                    tofile=f"b/{rel}",
+                                    lineterm="",
+                                )
+                            )
+                        )
+                        changed += 1
+                if did_change:
+                    changed += 1
+            if ns.run_ruff:
+                ok, msg = _run_ruff_fix(root)
+                status = "ruff-fix applied" if ok else "ruff-fix had issues"
+                sys.stdout.write(f"{status}: {msg}\n")
+            if should_apply:
+                sys.stdout.write(f"security fix complete; files changed: {changed}\n")
+            else:
+                sys.stdout.write("security fix dry-run (safe deterministic fixes only)\n")
+                if previews:
+                    sys.stdout.write("\n".join(previews[:5]) + "\n")
+                sys.stdout.write(
+                    "notes: safe deterministic yaml/timeout/shell fixes are previewed; use manual remediation for complex subprocess/eval patterns.\n"
+                )
+                sys.stdout.write(f"security fix complete; candidate files: {changed}\n")
+            return 0
+
+        sbom_output = Path(ns.sbom_output) if getattr(ns, "sbom_output", None) else None
+        scan_json = getattr(ns, "scan_json", None)
+        if scan_json:
+            findings, sbom = _load_scan_json(Path(scan_json))
+            if sbom_output is not None and isinstance(sbom, dict):
+                sbom_output.parent.mkdir(parents=True, exist_ok=True)
+                sbom_output.write_text(
+                    json.dumps(sbom, ensure_ascii=True, sort_keys=True, indent=2) + "\n",
+                    encoding="utf-8",
+                )
+            cache = None
+        else:
+            findings, sbom = run_security_scan(
+                root,
+                allowlist_path=allowlist,
+                online=bool(getattr(ns, "online", False)),
+                sbom_output=sbom_output,
+                cache=cache,
+                jobs=ns.jobs,
+            )
+        cache_stats = cache.stats() if cache is not None and ns.cache_stats else None
+
+        if ns.cmd == "check":
+            baseline_path = Path(ns.baseline)
+            if baseline_path.exists():
+                baseline_entries = _load_baseline(baseline_path)
+                new_findings = _filter_new(findings, baseline_entries)
+            else:
+                new_findings = findings
+            if not ns.include_info:
+                new_findings = [f for f in new_findings if f.severity != "info"]
+            rendered = _render(
+                findings,
+                ns.format,
+                new_only=new_findings,
+                sbom=sbom,
+                include_info=ns.include_info,
+                cache_stats=cache_stats,
+            )
+            _write_output(rendered, ns.output)
+            return 1 if _severity_trips(new_findings, ns.fail_on) else 0
+
+        if ns.cmd == "enforce":
+            thresholds = [ns.max_total, ns.max_info, ns.max_warn, ns.max_error]
+            if any(v is not None and v < 0 for v in thresholds):
+                raise SecurityScanError("enforce thresholds must be >= 0")
+            rule_budgets = _parse_rule_budgets(ns.max_rule)
+            payload, ok = _enforce_budgets(
+                findings,
+                max_total=ns.max_total,
+                max_info=ns.max_info,
+                max_warn=ns.max_warn,
+                max_error=ns.max_error,
+                rule_budgets=rule_budgets,
+            )
+            if ns.format == "json":
+                rendered = json.dumps(payload, ensure_ascii=True, sort_keys=True, indent=2) + "\n"
+            else:
+                lines = [
+                    (
+                        "security enforce: "
+                        f"ok={payload['ok']} total={payload['counts']['total']} "
+                        f"error={payload['counts']['error']} warn={payload['counts']['warn']} info={payload['counts']['info']}"
+                    )
+                ]
+                if payload["exceeded"]:
+                    lines.append("threshold breaches:")
+                    for item in payload["exceeded"]:
+                        lines.append(
+                            f"- {item['metric']}: count={item['count']} limit={item['limit']}"
+                        )
+                if payload["exceeded_rules"]:
+                    lines.append("rule breaches:")
+                    for item in payload["exceeded_rules"]:
+                        lines.append(
+                            f"- {item['rule_id']}: count={item['count']} limit={item['limit']}"
+                        )
+                if not payload["exceeded"] and not payload["exceeded_rules"]:
+                    lines.append("- all budgets satisfied")
+                rendered = "\n".join(lines) + "\n"
+            _write_output(rendered, ns.output)
+            return 0 if ok else 1
+
+        if ns.cmd == "report":
+            rendered = _render(
+                findings,
+                ns.format,
+                sbom=sbom,
+                include_info=ns.include_info,
+                cache_stats=cache_stats,
+            )
+            _write_output(rendered, ns.output)
+            return 0
+
+        rendered = _render(
+            findings, ns.format, sbom=sbom, include_info=ns.include_info, cache_stats=cache_stats
+        )
+        _write_output(rendered, ns.output)
+        return 1 if _severity_trips(findings, ns.fail_on) else 0
+    except SecurityScanError as exc:
+        sys.stderr.write(str(exc) + "\n")
+        return 2
+    except OSError as exc:
+        sys.stderr.write(str(exc) + "\n")
+        return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,419 @@
+from __future__ import annotations
+
+import argparse
+import json
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from .bools import coerce_bool
+
+_PAGE_PATH = "docs/integrations-integration-feedback-workflow.md"
+_TOP10_PATH = "docs/top-10-github-strategy.md"
+_GROWTH_CAMPAIGN_CLOSEOUT_SUMMARY_PATH = (
+    "docs/artifacts/growth-campaign-closeout-pack/growth-campaign-closeout-summary.json"
+)
+_GROWTH_CAMPAIGN_CLOSEOUT_BOARD_PATH = (
+    "docs/artifacts/growth-campaign-closeout-pack/growth-campaign-delivery-board.md"
+)
+_PLAN_PATH = "docs/roadmap/plans/integration-feedback-plan.json"
+_SECTION_HEADER = "# Integration feedback loop closeout lane"
+_REQUIRED_SECTIONS = [
+    "## Why Integration Feedback Closeout matters",
+    "## Required inputs (handoff artifacts)",
+    "## Command lane",
+    "## Integration feedback contract",
+    "## Integration feedback quality checklist",
+    "## Delivery board",
+    "## Scoring model",
+]
+_REQUIRED_COMMANDS = [
+    "python -m sdetkit integration-feedback-closeout --format json --strict",
+    "python -m sdetkit integration-feedback-closeout --emit-pack-dir docs/artifacts/integration-feedback-closeout-pack --format json --strict",
+    "python -m sdetkit integration-feedback-closeout --execute --evidence-dir docs/artifacts/integration-feedback-closeout-pack/evidence --format json --strict",
+    "python scripts/check_integration_feedback_contract.py",
+]
+_EXECUTION_COMMANDS = [
+    "python -m sdetkit integration-feedback-closeout --format json --strict",
+    "python -m sdetkit integration-feedback-closeout --emit-pack-dir docs/artifacts/integration-feedback-closeout-pack --format json --strict",
+    "python scripts/check_integration_feedback_contract.py --skip-evidence",
+]
+_REQUIRED_CONTRACT_LINES = [
+    "Single owner + backup reviewer are assigned for  integration feedback execution and signoff.",
+    "The  lane references  outcomes, controls, and campaign continuity signals.",
+    "Every  section includes docs/template CTA, runnable command CTA, KPI threshold, and rollback guardrail.",
+    " closeout records docs-template upgrades, community touchpoint outcomes, and  trust FAQ priorities.",
+]
+_REQUIRED_QUALITY_LINES = [
+    "- [ ] Includes baseline feedback volume, segmentation assumptions, and response SLA targets",
+    "- [ ] Every upgrade lane row has owner, execution window, KPI threshold, and risk flag",
+    "- [ ] CTA links point to docs/templates + runnable command evidence",
+    "- [ ] Scorecard captures docs adoption delta, community engagement delta, confidence, and rollback owner",
+    "- [ ] Artifact pack includes integration brief, feedback plan, template diffs, office-hours ledger, KPI scorecard, and execution log",
+]
+_REQUIRED_DELIVERY_BOARD_LINES = [
+    "- [ ]  integration brief committed",
+    "- [ ]  integration feedback plan committed",
+    "- [ ]  template upgrade ledger exported",
+    "- [ ]  office-hours outcome ledger exported",
+    "- [ ]  trust FAQ priorities drafted from  feedback",
+]
+_REQUIRED_DATA_KEYS = [
+    '"plan_id"',
+    '"contributors"',
+    '"feedback_channels"',
+    '"baseline"',
+    '"target"',
+    '"owner"',
+]
+
+_DEFAULT_PAGE_TEMPLATE = "# Integration feedback loop closeout lane\n\n closes with a major upgrade that folds  growth campaign outcomes into docs/template upgrades and community touchpoint execution.\n\n## Why Integration Feedback Closeout matters\n\n- Turns  growth campaign outcomes into deterministic integration feedback loops across docs, templates, and community operations.\n- Protects quality with strict contract coverage, runnable commands, KPI thresholds, and rollback safety.\n- Creates a deterministic handoff from  closeout into  trust FAQ expansion priorities.\n\n## Required inputs (handoff artifacts)\n\n- `docs/artifacts/growth-campaign-closeout-pack/growth-campaign-closeout-summary.json`\n- `docs/artifacts/growth-campaign-closeout-pack/growth-campaign-delivery-board.md`\n- `docs/roadmap/plans/integration-feedback-plan.json`\n\n## Command lane\n\n```bash\npython -m sdetkit integration-feedback-closeout --format json --strict\npython -m sdetkit integration-feedback-closeout --emit-pack-dir docs/artifacts/integration-feedback-closeout-pack --format json --strict\npython -m sdetkit integration-feedback-closeout --execute --evidence-dir docs/artifacts/integration-feedback-closeout-pack/evidence --format json --strict\npython scripts/check_integration_feedback_contract.py\n```\n\n## Integration feedback contract\n\n- Single owner + backup reviewer are assigned for  integration feedback execution and signoff.\n- The  lane references  outcomes, controls, and campaign continuity signals.\n- Every  section includes docs/template CTA, runnable command CTA, KPI threshold, and rollback guardrail.\n-  closeout records docs-template upgrades, community touchpoint outcomes, and  trust FAQ priorities.\n\n## Integration feedback quality checklist\n\n- [ ] Includes baseline feedback volume, segmentation assumptions, and response SLA targets\n- [ ] Every upgrade lane row has owner, execution window, KPI threshold, and risk flag\n- [ ] CTA links point to docs/templates + runnable command evidence\n- [ ] Scorecard captures docs adoption delta, community engagement delta, confidence, and rollback owner\n- [ ] Artifact pack includes integration brief, feedback plan, template diffs, office-hours ledger, KPI scorecard, and execution log\n\n## Delivery board\n\n- [ ]  integration brief committed\n- [ ]  integration feedback plan committed\n- [ ]  template upgrade ledger exported\n- [ ]  office-hours outcome ledger exported\n- [ ]  trust FAQ priorities drafted from  feedback\n\n## Scoring model\n\nIntegration Feedback Closeout weighted score (0-100):\n\n- Contract + command lane integrity (35)\n-  continuity baseline quality (35)\n- Feedback evidence data + delivery board completeness (30)\n"
+
+
+def _read_text(path: Path) -> str:
+    if not path.exists():
+        return ""
+    return path.read_text(encoding="utf-8")
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+    if isinstance(data, dict):
+        return data
+    return {}
+
+
+def _checklist_count(markdown: str) -> int:
+    return sum(1 for line in markdown.splitlines() if line.strip().startswith("- ["))
+
+
+def build_integration_feedback_summary(root: Path) -> dict[str, Any]:
+    readme_text = _read_text(root / "README.md")
+    docs_index_text = _read_text(root / "docs/index.md")
+    page_text = _read_text(root / _PAGE_PATH)
+    top10_text = _read_text(root / _TOP10_PATH)
+
+    growth_campaign_summary = root / _GROWTH_CAMPAIGN_CLOSEOUT_SUMMARY_PATH
+    growth_campaign_board = root / _GROWTH_CAMPAIGN_CLOSEOUT_BOARD_PATH
+
+    growth_campaign_data = _load_json(growth_campaign_summary)
+    growth_campaign_summary_data = (
+        growth_campaign_data.get("summary", {})
+        if isinstance(growth_campaign_data.get("summary"), dict)
+        else {}
+    )
+    growth_campaign_score = int(growth_campaign_summary_data.get("activation_score", 0) or 0)
+    growth_campaign_strict = coerce_bool(
+        growth_campaign_summary_data.get("strict_pass", False), default=False
+    )
+    growth_campaign_check_count = (
+        len(growth_campaign_data.get("checks", []))
+        if isinstance(growth_campaign_data.get("checks"), list)
+        else 0
+    )
+
+    board_text = _read_text(growth_campaign_board)
+    board_count = _checklist_count(board_text)
+    board_has_growth_campaign = "growth campaign" in board_text.lower()
+
+    missing_sections = [section for section in _REQUIRED_SECTIONS if section not in page_text]
+    missing_commands = [command for command in _REQUIRED_COMMANDS if command not in page_text]
+    missing_contract_lines = [line for line in _REQUIRED_CONTRACT_LINES if line not in page_text]
+    missing_quality_lines = [line for line in _REQUIRED_QUALITY_LINES if line not in page_text]
+    missing_board_items = [item for item in _REQUIRED_DELIVERY_BOARD_LINES if item not in page_text]
+
+    plan_text = _read_text(root / _PLAN_PATH)
+    missing_plan_keys = [key for key in _REQUIRED_DATA_KEYS if key not in plan_text]
+
+    checks: list[dict[str, Any]] = [
+        {
+            "check_id": "readme_command_lane",
+            "weight": 7,
+            "passed": ("integration-feedback-closeout" in readme_text),
+            "evidence": "README integration-feedback-closeout command lane",
+        },
+        {
+            "check_id": "docs_index_links",
+            "weight": 8,
+            "passed": (
+                "impact-82-big-upgrade-report.md" in docs_index_text
+                and "integrations-integration-feedback-workflow.md" in docs_index_text
+            ),
+            "evidence": "impact-82-big-upgrade-report.md + integrations-integration-feedback-workflow.md",
+        },
+        {
+            "check_id": "top10_strategy_alignment",
+            "weight": 5,
+            "passed": (
+                "Integration Feedback Closeout" in top10_text
+                and "Integration Feedback Closeout" in top10_text
+            ),
+            "evidence": "Integration Feedback Closeout strategy chain",
+        },
+        {
+            "check_id": "growth_campaign_summary_present",
+            "weight": 10,
+            "passed": growth_campaign_summary.exists(),
+            "evidence": str(growth_campaign_summary),
+        },
+        {
+            "check_id": "growth_campaign_" + "delivery_board_present",
+            "weight": 7,
+            "passed": growth_campaign_board.exists(),
+            "evidence": str(growth_campaign_board),
+        },
+        {
+            "check_id": "growth_campaign_" + "quality_floor",
+            "weight": 13,
+            "passed": growth_campaign_score >= 85 and growth_campaign_strict,
+            "evidence": {
+                "growth_campaign_score": growth_campaign_score,
+                "strict_pass": growth_campaign_strict,
+                "growth_campaign_checks": growth_campaign_check_count,
+            },
+        },
+        {
+            "check_id": "growth_campaign_board_integrity",
+            "weight": 5,
+            "passed": board_count >= 5 and board_has_growth_campaign,
+            "evidence": {
+                "board_items": board_count,
+                "contains_growth_campaign": board_has_growth_campaign,
+            },
+        },
+        {
+            "check_id": "page_header",
+            "weight": 7,
+            "passed": _SECTION_HEADER in page_text,
+            "evidence": _SECTION_HEADER,
+        },
+        {
+            "check_id": "required_sections",
+            "weight": 8,
+            "passed": not missing_sections,
+            "evidence": missing_sections or "all sections present",
+        },
+        {
+            "check_id": "required_commands",
+            "weight": 5,
+            "passed": not missing_commands,
+            "evidence": missing_commands or "all commands present",
+        },
+        {
+            "check_id": "contract_lock",
+            "weight": 5,
+            "passed": not missing_contract_lines,
+            "evidence": missing_contract_lines or "contract locked",
+        },
+        {
+            "check_id": "quality_checklist_lock",
+            "weight": 5,
+            "passed": not missing_quality_lines,
+            "evidence": missing_quality_lines or "quality checklist locked",
+        },
+        {
+            "check_id": "delivery_board_lock",
+            "weight": 5,
+            "passed": not missing_board_items,
+            "evidence": missing_board_items or "delivery board locked",
+        },
+        {
+            "check_id": "feedback_plan_data_present",
+            "weight": 10,
+            "passed": not missing_plan_keys,
+            "evidence": missing_plan_keys or _PLAN_PATH,
+        },
+    ]
+
+    failed = [c for c in checks if not c["passed"]]
+    critical_failures: list[str] = []
+    if not growth_campaign_summary.exists() or not growth_campaign_board.exists():
+        critical_failures.append("growth_campaign_handoff_inputs")
+
+    wins: list[str] = []
+    misses: list[str] = []
+    handoff_actions: list[str] = []
+
+    if growth_campaign_score >= 85 and growth_campaign_strict:
+        wins.append(
+            f"Growth Campaign continuity baseline is stable with activation score={growth_campaign_score}."
+        )
+    else:
+        misses.append(" continuity baseline is below the floor (<85) or not strict-pass.")
+        handoff_actions.append(
+            "Re-run the closeout command and raise baseline quality above 85 with strict pass before integration feedback closeout lock."
+        )
+
+    if board_count >= 5 and board_has_growth_campaign:
+        wins.append(f"81 delivery board integrity validated with {board_count} checklist items.")
+    else:
+        misses.append(" delivery board integrity is incomplete (needs >=5 items and  anchors).")
+        handoff_actions.append("Repair  delivery board entries to include  anchors.")
+
+    if not missing_plan_keys:
+        wins.append(" integration feedback dataset is available for launch execution.")
+    else:
+        misses.append(" integration feedback dataset is missing required keys.")
+        handoff_actions.append(
+            "Update docs/roadmap/plans/integration-feedback-plan.json to restore required keys."
+        )
+
+    if not failed and not critical_failures:
+        wins.append(
+            " integration feedback closeout lane is fully complete and ready for  trust FAQ priorities."
+        )
+
+    score = int(round(sum(c["weight"] for c in checks if c["passed"])))
+    return {
+        "name": "integration-feedback-closeout",
+        "inputs": {
+            "readme": "README.md",
+            "docs_index": "docs/index.md",
+            "docs_page": _PAGE_PATH,
+            "top10": _TOP10_PATH,
+            "growth_campaign_summary": str(growth_campaign_summary.relative_to(root))
+            if growth_campaign_summary.exists()
+            else str(growth_campaign_summary),
+            "growth_campaign_" + "delivery_board": str(growth_campaign_board.relative_to(root))
+            if growth_campaign_board.exists()
+            else str(growth_campaign_board),
+            "integration_feedback_plan": _PLAN_PATH,
+        },
+        "checks": checks,
+        "rollup": {
+            "growth_campaign_activation_score": growth_campaign_score,
+            "growth_campaign_checks": growth_campaign_check_count,
+            "growth_campaign_" + "delivery_board_items": board_count,
+        },
+        "summary": {
+            "activation_score": score,
+            "passed_checks": len(checks) - len(failed),
+            "failed_checks": len(failed),
+            "critical_failures": critical_failures,
+            "strict_pass": not failed and not critical_failures,
+        },
+        "wins": wins,
+        "misses": misses,
+        "handoff_actions": handoff_actions,
+    }
+
+
+def _render_text(payload: dict[str, Any]) -> str:
+    lines = [
+        " integration feedback closeout summary",
+        f"- Activation score: {payload['summary']['activation_score']}",
+        f"- Passed checks: {payload['summary']['passed_checks']}",
+        f"- Failed checks: {payload['summary']['failed_checks']}",
+        f"- Critical failures: {payload['summary']['critical_failures']}",
+    ]
+    return "\n".join(lines)
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _emit_pack(root: Path, pack_dir: Path, payload: dict[str, Any]) -> None:
+    target = pack_dir if pack_dir.is_absolute() else root / pack_dir
+    _write(
+        target / "integration-feedback-closeout-summary.json",
+        json.dumps(payload, indent=2) + "\n",
+    )
+    _write(target / "integration-feedback-closeout-summary.md", _render_text(payload) + "\n")
+    _write(target / "integration-feedback-integration-brief.md", "#  integration brief\n")
+    _write(target / "integration-feedback-plan.md", "#  integration feedback plan\n")
+    _write(
+        target / "integration-feedback-template-upgrade-ledger.json",
+        json.dumps({"upgrades": []}, indent=2) + "\n",
+    )
+    _write(
+        target / "integration-feedback-office-hours-outcomes-ledger.json",
+        json.dumps({"outcomes": []}, indent=2) + "\n",
+    )
+    _write(
+        target / "integration-feedback-kpi-scorecard.json",
+        json.dumps({"kpis": []}, indent=2) + "\n",
+    )
+    _write(target / "integration-feedback-execution-log.md", "#  execution log\n")
+    _write(
+        target / "integration-feedback-delivery-board.md",
+        "\n".join(
+            ["# Integration Feedback Closeout delivery board", *_REQUIRED_DELIVERY_BOARD_LINES]
+        )
+        + "\n",
+    )
+    _write(
+        target / "integration-feedback-validation-commands.md",
+        "#  validation commands\n\n```bash\n" + "\n".join(_EXECUTION_COMMANDS) + "\n```\n",
+    )
+
+
+def _execute_commands(root: Path, evidence_dir: Path) -> None:
+    events: list[dict[str, Any]] = []
+    out_dir = evidence_dir if evidence_dir.is_absolute() else root / evidence_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for idx, command in enumerate(_EXECUTION_COMMANDS, start=1):
+        argv = shlex.split(command)
+        if argv and argv[0] == "python":
+            argv[0] = sys.executable
+        result = subprocess.run(argv, cwd=root, capture_output=True, text=True)
+        event = {
+            "command": command,
+            "returncode": result.returncode,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+        }
+        events.append(event)
+        _write(out_dir / f"command-{idx:02d}.log", json.dumps(event, indent=2) + "\n")
+    _write(
+        out_dir / "integration-feedback-execution-summary.json",
+        json.dumps({"total_commands": len(events), "commands": events}, indent=2) + "\n",
+    )
+
+
+def build_integration_feedback_summary_impl(root: Path) -> dict[str, Any]:
+    "Compatibility alias for legacy -based builder name."
+    return build_integration_feedback_summary(root)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=" integration feedback closeout checks")
+    parser.add_argument("--root", default=".")
+    parser.add_argument("--format", choices=["json", "text"], default="text")
+    parser.add_argument("--strict", action="store_true")
+    parser.add_argument("--emit-pack-dir")
+    parser.add_argument("--execute", action="store_true")
+    parser.add_argument("--evidence-dir")
+    parser.add_argument("--write-default-doc", action="store_true")
+    ns = parser.parse_args(argv)
+
+    root = Path(ns.root).resolve()
+    if ns.write_default_doc:
+        _write(root / _PAGE_PATH, _DEFAULT_PAGE_TEMPLATE)
+
+    payload = build_integration_feedback_summary(root)
+
+    if ns.emit_pack_dir:
+        _emit_pack(root, Path(ns.emit_pack_dir), payload)
+    if ns.execute:
+        evidence_dir = (
+            Path(ns.evidence_dir)
+            if ns.evidence_dir
+            else Path("docs/artifacts/integration-feedback-closeout-pack/evidence")
+        )
+        _execute_commands(root, evidence_dir)
+
+    print(json.dumps(payload, indent=2) if ns.format == "json" else _render_text(payload))
+    return 1 if ns.strict and not payload["summary"]["strict_pass"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import argparse
+
+
+def build_review_forwarded_args(ns: argparse.Namespace) -> list[str]:
+    forwarded = [ns.path]
+    if ns.workspace_root:
+        forwarded.extend(["--workspace-root", ns.workspace_root])
+    if ns.out_dir:
+        forwarded.extend(["--out-dir", ns.out_dir])
+    if ns.profile:
+        forwarded.extend(["--profile", ns.profile])
+    if ns.format:
+        forwarded.extend(["--format", ns.format])
+    if ns.interactive:
+        forwarded.append("--interactive")
+    if ns.no_workspace:
+        forwarded.append("--no-workspace")
+    if ns.work_id:
+        forwarded.extend(["--work-id", ns.work_id])
+    for entry in ns.work_context or []:
+        forwarded.extend(["--work-context", entry])
+    if ns.code_scan_json:
+        forwarded.extend(["--code-scan-json", ns.code_scan_json])
+    if getattr(ns, "adaptive", False):
+        forwarded.append("--adaptive")
+    if getattr(ns, "deep", False):
+        forwarded.append("--deep")
+    if getattr(ns, "learn", False):
+        forwarded.append("--learn")
+    if getattr(ns, "db", None):
+        forwarded.extend(["--db", ns.db])
+    if getattr(ns, "evidence_dir", None):
+        forwarded.extend(["--evidence-dir", ns.evidence_dir])
+    if getattr(ns, "adaptive_helpers", None):
+        forwarded.extend(["--adaptive-helpers", ns.adaptive_helpers])
+    return forwarded
@@ -0,0 +1,1085 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sdetkit.git_inventory_collector import (
+    BASE_HEAD,
+    STAGED_WORKTREE,
+    collect_git_inventory,
+)
+from sdetkit.network_boundary import (
+    NETWORK_ISOLATION_ENFORCED,
+    NETWORK_ISOLATION_REQUIRED,
+    PROOF_EXECUTION_ALLOWED,
+    assess_network_boundary,
+    build_network_isolated_argv,
+)
+from sdetkit.proof_runtime_guard import (
+    CLEAN,
+    RESERVED_EVIDENCE_PATHS,
+    RUNTIME_GUARD_VIOLATION,
+    assess_runtime_guard,
+)
+
+SCHEMA_VERSION = "sdetkit.isolated_proof_runner.v4"
+DEFAULT_OUT_DIR = Path("build") / "isolated-proof-runner"
+EVIDENCE_JSON = "verification-evidence.json"
+EVIDENCE_MD = "verification-evidence.md"
+DEFAULT_TIMEOUT_SECONDS = 120
+MAX_CAPTURE_CHARS = 8000
+DEFAULT_WORKSPACE_POOL_SIZE = 2
+# Files changed this recently may still change within one filesystem timestamp tick,
+# so their stat metadata is never trusted in place of a content hash.
+STAT_RACY_WINDOW_NS = 2_000_000_000
+_HASH_CHUNK_BYTES = 1024 * 1024
+_WORKSPACE_STATE_SCHEMA = 1
+_BASELINE_INDEX = "baseline-index"
+_BASELINE_DATE = "2000-01-01T00:00:00+0000"
+_FICLONE = 0x40049409
+
+JsonObject = dict[str, Any]
+
+WORKSPACE_MUTATED_DURING_EXECUTION = "_".join(("workspace", "mutated", "during", "execution"))
+CLAIMED_CHANGED_FILES = "_".join(("claimed", "changed", "files"))
+INVENTORY_CLAIM_MATCH = "_".join(("inventory", "claim", "match"))
+EXECUTION_ARGV_DISPLAY = "_".join(("execution", "argv", "display"))
+NETWORK_BACKEND_COMMAND_WRAPPED = "_".join(("network", "backend", "command", "wrapped"))
+
+IGNORED_NAMES = {
+    ".git",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".tox",
+    ".venv",
+    "__pycache__",
+    "build",
+    "dist",
+    "htmlcov",
+}
+IGNORED_FILES = {
+    ".coverage",
+    "coverage.xml",
+}
+
+
+@dataclass(frozen=True)
+class ProofProfile:
+    profile_id: str
+    canonical_command: str
+    argv_suffix: tuple[str, ...]
+
+
+PROOF_PROFILES = {
+    "pre_commit_all": ProofProfile(
+        profile_id="pre_commit_all",
+        canonical_command="python -m pre_commit run -a",
+        argv_suffix=("-m", "pre_commit", "run", "-a"),
+    ),
+    "ruff_src_tests": ProofProfile(
+        profile_id="ruff_src_tests",
+        canonical_command="python -m ruff check src tests",
+        argv_suffix=("-m", "ruff", "check", "src", "tests"),
+    ),
+    "mypy_src": ProofProfile(
+        profile_id="mypy_src",
+        canonical_command="python -m mypy src",
+        argv_suffix=("-m", "mypy", "src"),
+    ),
+}
+
+
+def _as_dict(value: Any) -> JsonObject:
+    return value if isinstance(value, dict) else {}
+
+
+def _as_list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else []
+
+
+def _string(value: Any) -> str:
+    return str(value or "").replace("\r", " ").replace("\n", " ").strip()
+
+
+def _bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in {"1", "true", "yes"}
+
+
+def _int(value: Any, *, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _string_list(value: Any) -> list[str]:
+    return sorted({_string(item) for item in _as_list(value) if _string(item)})
+
+
+def _capture_text(value: str | bytes | None) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bytes):
+        rendered = value.decode("utf-8", errors="replace")
+    else:
+        rendered = value
+    if len(rendered) <= MAX_CAPTURE_CHARS:
+        return rendered
+    return rendered[:MAX_CAPTURE_CHARS] + "\n... output truncated ...\n"
+
+
+StatKey = tuple[int, int, int, int]
+
+
+def _stat_key(st: os.stat_result) -> StatKey:
+    return (int(st.st_size), int(st.st_mtime_ns), int(st.st_ctime_ns), int(st.st_ino))
+
+
+def _stored_stat_key(value: Any) -> StatKey:
+    if not isinstance(value, list) or len(value) != 4:
+        raise ValueError("stored stat key must be a list of four integers")
+    size, mtime_ns, ctime_ns, inode = value
+    if not all(type(item) is int for item in value):
+        raise ValueError("stored stat key must be a list of four integers")
+    return (size, mtime_ns, ctime_ns, inode)
+
+
+def _stat_is_settled(st: os.stat_result, *, horizon_ns: int) -> bool:
+    return max(int(st.st_mtime_ns), int(st.st_ctime_ns)) < horizon_ns
+
+
+def _walk_tree(root: Path) -> Iterator[tuple[str, os.stat_result]]:
+    """Yield ``(relative_posix, lstat)`` for every non-ignored entry under ``root``."""
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.name in IGNORED_NAMES or entry.name in IGNORED_FILES:
+                continue
+            relative = f"{prefix}{entry.name}"
+            st = entry.stat(follow_symlinks=False)
+            yield relative, st
+            if stat.S_ISDIR(st.st_mode):
+                stack.append((Path(entry.path), f"{relative}/"))
+
+
+def _hash_entry(path: Path, st: os.stat_result) -> str:
+    digest = hashlib.sha256()
+    if stat.S_ISLNK(st.st_mode):
+        digest.update(os.readlink(path).encode("utf-8", errors="replace"))
+    else:
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _WorkspaceSnapshotter:
+    """Content snapshots of a workspace that only rehash files whose metadata changed.
+
+    A digest is reused when the file's ``(size, mtime_ns, ctime_ns, inode)`` matches
+    the previous snapshot and the file had settled outside the racy window at that
+    time; every other file is hashed.
+    """
+
+    def __init__(self, hashes: Mapping[str, tuple[StatKey, str]] | None = None) -> None:
+        self._hashes: dict[str, tuple[StatKey, str]] = dict(hashes or {})
+        self.files_hashed = 0
+        self.files_reused = 0
+
+    @property
+    def hashes(self) -> dict[str, tuple[StatKey, str]]:
+        return dict(self._hashes)
+
+    def snapshot(self, workspace: Path) -> dict[str, str]:
+        horizon_ns = time.time_ns() - STAT_RACY_WINDOW_NS
+        snapshot: dict[str, str] = {}
+        settled: dict[str, tuple[StatKey, str]] = {}
+        for relative, st in _walk_tree(workspace):
+            if stat.S_ISDIR(st.st_mode):
+                continue
+            key = _stat_key(st)
+            cached = self._hashes.get(relative)
+            if cached is not None and cached[0] == key:
+                digest = cached[1]
+                self.files_reused += 1
+            else:
+                digest = _hash_entry(workspace / relative, st)
+                self.files_hashed += 1
+            if _stat_is_settled(st, horizon_ns=horizon_ns):
+                settled[relative] = (key, digest)
+            snapshot[relative] = digest
+        self._hashes = settled
+        return dict(sorted(snapshot.items()))
+
+
+def _snapshot_reserved_evidence(workspace: Path) -> dict[str, str]:
+    snapshot: dict[str, str] = {}
+    for relative_text in RESERVED_EVIDENCE_PATHS:
+        path = workspace / relative_text
+        if not path.exists() and not path.is_symlink():
+            continue
+
+        digest = hashlib.sha256()
+        if path.is_symlink():
+            digest.update(os.readlink(path).encode("utf-8", errors="replace"))
+        elif path.is_dir():
+            digest.update(b"<directory>")
+        else:
+            digest.update(path.read_bytes())
+        snapshot[relative_text] = digest.hexdigest()
+    return snapshot
+
+
+def _changed_paths(before: Mapping[str, str], after: Mapping[str, str]) -> list[str]:
+    paths = set(before) | set(after)
+    return sorted(path for path in paths if before.get(path) != after.get(path))
+
+
+def _execution_environment() -> dict[str, str]:
+    allowed_keys = {
+        "CI",
+        "HOME",
+        "PATH",
+        "SYSTEMROOT",
+        "TEMP",
+        "TMP",
+        "TMPDIR",
+        "USERPROFILE",
+        "VIRTUAL_ENV",
+    }
+    environment = {key: value for key, value in os.environ.items() if key in allowed_keys}
+    environment["PYTHONDONTWRITEBYTECODE"] = "1"
+    environment["PYTHONNOUSERSITE"] = "1"
+    return environment
+
+
+def _run_setup_command(
+    argv: list[str],
+    *,
+    cwd: Path,
+    environment: Mapping[str, str],
+) -> None:
+    completed = subprocess.run(
+        argv,
+        cwd=cwd,
+        env=dict(environment),
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=False,
+        shell=False,
+    )
+    if completed.returncode != 0:
+        message = _capture_text(completed.stderr or completed.stdout)
+        raise RuntimeError(f"isolated workspace setup failed: {message}")
+
+
+def _clone_file(source: Path, destination: Path) -> None:
+    """Copy ``source`` with a copy-on-write reflink where the filesystem allows it."""
+    try:
+        import fcntl
+
+        with source.open("rb") as src, destination.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except (ImportError, OSError):
+        shutil.copyfile(source, destination, follow_symlinks=False)
+    shutil.copystat(source, destination, follow_symlinks=False)
+
+
+def _remove_entry(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _sync_workspace(
+    source_root: Path,
+    workspace: Path,
+    synced: Mapping[str, tuple[StatKey, StatKey]],
+) -> tuple[dict[str, tuple[StatKey, StatKey]], int, int]:
+    """Make ``workspace`` match ``source_root`` without recopying unchanged files.
+
+    ``synced`` maps a relative path to the ``(source, workspace)`` stat keys recorded
+    by the previous sync. A file is reused only when both keys still match; the
+    copy keeps the source mtime, so any write inside the workspace changes its key.
+    Ignored names (tool caches, ``build`` and so on) are removed from the workspace,
+    including its ``.git`` directory: a proof could have left hooks, config or
+    ``info/exclude`` entries there that the next baseline commit would honour.
+    """
+    horizon_ns = time.time_ns() - STAT_RACY_WINDOW_NS
+    source_entries = dict(_walk_tree(source_root))
+    workspace.mkdir(parents=True, exist_ok=True)
+
+    stack = [workspace]
+    while stack:
+        directory = stack.pop()
+        for entry in os.scandir(directory):
+            path = Path(entry.path)
+            if entry.name in IGNORED_NAMES or entry.name in IGNORED_FILES:
+                _remove_entry(path)
+                continue
+            relative = path.relative_to(workspace).as_posix()
+            source_st = source_entries.get(relative)
+            kind = stat.S_IFMT(entry.stat(follow_symlinks=False).st_mode)
+            if source_st is None or stat.S_IFMT(source_st.st_mode) != kind:
+                _remove_entry(path)
+            elif stat.S_ISDIR(kind):
+                stack.append(path)
+
+    records: dict[str, tuple[StatKey, StatKey]] = {}
+    copied = 0
+    reused = 0
+    for relative, source_st in sorted(source_entries.items()):
+        source = source_root / relative
+        target = workspace / relative
+        if stat.S_ISDIR(source_st.st_mode):
+            target.mkdir(exist_ok=True)
+            continue
+        if stat.S_ISLNK(source_st.st_mode):
+            link = os.readlink(source)
+            if not target.is_symlink() or os.readlink(target) != link:
+                _remove_entry(target)
+                os.symlink(link, target)
+                copied += 1
+            else:
+                reused += 1
+            continue
+
+        source_key = _stat_key(source_st)
+        try:
+            target_key: StatKey | None = _stat_key(target.lstat())
+        except FileNotFoundError:
+            target_key = None
+        if target_key is not None and synced.get(relative) == (source_key, target_key):
+            reused += 1
+        else:
+            _remove_entry(target)
+            _clone_file(source, target)
+            target_key = _stat_key(target.lstat())
+            copied += 1
+        if _stat_is_settled(source_st, horizon_ns=horizon_ns):
+            records[relative] = (source_key, target_key)
+    return records, copied, reused
+
+
+def _commit_workspace_baseline(workspace: Path, store: Path | None = None) -> None:
+    """Create a fresh single-commit git repository for ``workspace``.
+
+    With ``store``, a bare repository kept outside the workspace, objects are written
+    there and the workspace repository reads them through ``objects/info/alternates``.
+    The index saved in the store after the previous baseline lets ``git add`` skip
+    files whose stat is unchanged, so only changed blobs are hashed and written and a
+    proof's own ``.git`` writes never reach the next baseline.
+    """
+    environment = _execution_environment()
+    _run_setup_command(["git", "init", "--quiet"], cwd=workspace, environment=environment)
+    git_dir = workspace / ".git"
+    saved_index: Path | None = None
+    if store is not None:
+        if not (store / "objects").is_dir():
+            shutil.rmtree(store, ignore_errors=True)
+            _run_setup_command(
+                ["git", "init", "--bare", "--quiet", str(store)],
+                cwd=workspace,
+                environment=environment,
+            )
+        objects = (store / "objects").resolve()
+        alternates = git_dir / "objects" / "info" / "alternates"
+        alternates.parent.mkdir(parents=True, exist_ok=True)
+        alternates.write_text(f"{objects}\n", encoding="utf-8")
+        saved_index = store / _BASELINE_INDEX
+        if saved_index.is_file():
+            shutil.copyfile(saved_index, git_dir / "index")
+        # A fixed date keeps an unchanged tree's baseline commit object identical.
+        environment = {
+            **environment,
+            "GIT_OBJECT_DIRECTORY": str(objects),
+            "GIT_AUTHOR_DATE": _BASELINE_DATE,
+            "GIT_COMMITTER_DATE": _BASELINE_DATE,
+        }
+    _run_setup_command(["git", "add", "-A"], cwd=workspace, environment=environment)
+    _run_setup_command(
+        [
+            "git",
+            "-c",
+            "user.name=SDETKit Proof Runner",
+            "-c",
+            "user.email=proof-runner@invalid.local",
+            "-c",
+            "core.logAllRefUpdates=false",
+            "commit",
+            "--quiet",
+            "--no-verify",
+            "--allow-empty",
+            "-m",
+            "isolated proof baseline",
+        ],
+        cwd=workspace,
+        environment=environment,
+    )
+    if saved_index is not None and (git_dir / "index").is_file():
+        temporary = saved_index.with_name(saved_index.name + ".tmp")
+        shutil.copyfile(git_dir / "index", temporary)
+        os.replace(temporary, saved_index)
+
+
+def _prepare_isolated_workspace(source_root: Path, workspace: Path) -> None:
+    _sync_workspace(source_root, workspace, {})
+    _commit_workspace_baseline(workspace)
+
+
+@dataclass
+class IsolatedWorkspace:
+    path: Path
+    snapshotter: _WorkspaceSnapshotter
+    pooled: bool = False
+
+
+class IsolatedWorkspacePool:
+    """Pre-warmed proof workspaces under ``root`` that are reset between proofs.
+
+    Each source root gets ``size`` slots. A slot is held under an exclusive file lock
+    while a proof runs. On acquire it is resynced with the source tree, copying only
+    files whose stat metadata changed since the last sync, and the slot's git
+    repository is recreated with a single fresh baseline commit, so nothing a proof
+    wrote under ``.git`` survives into the next one. The baseline's objects live in
+    the slot's ``objects.git`` store outside the workspace, so a new baseline only
+    writes blobs that changed. Stat keys and content digests persist in the slot's
+    ``state.json`` so warm proofs only hash what moved.
+    """
+
+    def __init__(self, root: Path, *, size: int = DEFAULT_WORKSPACE_POOL_SIZE) -> None:
+        if size < 1:
+            raise ValueError("workspace pool size must be at least 1")
+        self.root = root
+        self.size = size
+        self._stats = {"acquired": 0, "files_copied": 0, "files_reused": 0}
+
+    def stats(self) -> dict[str, int]:
+        return dict(self._stats)
+
+    def _slots(self, source_root: Path) -> list[Path]:
+        key = hashlib.sha256(str(source_root).encode("utf-8")).hexdigest()[:16]
+        return [self.root / key / f"slot-{index}" for index in range(self.size)]
+
+    @staticmethod
+    def _try_lock(fd: int, *, blocking: bool) -> bool:
+        try:
+            import fcntl
+        except ImportError:  # pragma: no cover - Windows
+            import msvcrt
+
+            mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+            try:
+                msvcrt.locking(fd, mode, 1)
+            except OSError:
+                return False
+            return True
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(fd, flags)
+        except BlockingIOError:
+            return False
+        return True
+
+    @contextlib.contextmanager
+    def _lock_slot(self, source_root: Path) -> Iterator[Path]:
+        slots = self._slots(source_root)
+        for slot in slots:
+            slot.mkdir(parents=True, exist_ok=True)
+        for attempt, slot in enumerate([*slots, slots[os.getpid() % len(slots)]]):
+            fd = os.open(slot / "lock", os.O_RDWR | os.O_CREAT, 0o644)
+            if self._try_lock(fd, blocking=attempt == len(slots)):
+                try:
+                    yield slot
+                finally:
+                    os.close(fd)
+                return
+            os.close(fd)
+        raise RuntimeError(f"could not lock an isolated workspace pool slot for {source_root}")
+
+    @staticmethod
+    def _load_state(
+        path: Path, source_root: Path
+    ) -> tuple[dict[str, tuple[StatKey, StatKey]], dict[str, tuple[StatKey, str]]]:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}, {}
+        if (
+            not isinstance(payload, dict)
+            or payload.get("schema") != _WORKSPACE_STATE_SCHEMA
+            or payload.get("source_root") != str(source_root)
+        ):
+            return {}, {}
+        try:
+            synced = {
+                relative: (_stored_stat_key(keys[0]), _stored_stat_key(keys[1]))
+                for relative, keys in _as_dict(payload.get("synced")).items()
+            }
+            hashes = {
+                relative: (_stored_stat_key(entry[0]), str(entry[1]))
+                for relative, entry in _as_dict(payload.get("hashes")).items()
+            }
+        except (IndexError, KeyError, TypeError, ValueError):
+            return {}, {}
+        return synced, hashes
+
+    @staticmethod
+    def _store_state(
+        path: Path,
+        source_root: Path,
+        synced: Mapping[str, tuple[StatKey, StatKey]],
+        hashes: Mapping[str, tuple[StatKey, str]],
+    ) -> None:
+        payload = {
+            "schema": _WORKSPACE_STATE_SCHEMA,
+            "source_root": str(source_root),
+            "synced": {relative: [list(a), list(b)] for relative, (a, b) in synced.items()},
+            "hashes": {relative: [list(key), digest] for relative, (key, digest) in hashes.items()},
+        }
+        temporary = path.with_name(path.name + ".tmp")
+        temporary.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(temporary, path)
+
+    @contextlib.contextmanager
+    def acquire(self, source_root: Path) -> Iterator[IsolatedWorkspace]:
+        source_root = source_root.resolve()
+        with self._lock_slot(source_root) as slot:
+            state_path = slot / "state.json"
+            synced, hashes = self._load_state(state_path, source_root)
+            # Drop the state before touching the workspace so an interrupted proof
+            # can never leave stale stat keys that vouch for a half-reset tree.
+            state_path.unlink(missing_ok=True)
+            workspace = slot / "workspace"
+            synced, copied, reused = _sync_workspace(source_root, workspace, synced)
+            _commit_workspace_baseline(workspace, slot / "objects.git")
+            self._stats["acquired"] += 1
+            self._stats["files_copied"] += copied
+            self._stats["files_reused"] += reused
+            snapshotter = _WorkspaceSnapshotter(hashes)
+            yield IsolatedWorkspace(path=workspace, snapshotter=snapshotter, pooled=True)
+            self._store_state(state_path, source_root, synced, snapshotter.hashes)
+
+
+@contextlib.contextmanager
+def _temporary_workspace(source_root: Path) -> Iterator[IsolatedWorkspace]:
+    with tempfile.TemporaryDirectory(prefix="sdetkit-proof-") as temp_dir:
+        workspace = Path(temp_dir) / "workspace"
+        _prepare_isolated_workspace(source_root, workspace)
+        yield IsolatedWorkspace(path=workspace, snapshotter=_WorkspaceSnapshotter())
+
+
+def _profile_result(
+    *,
+    profile: ProofProfile,
+    workspace: Path,
+    timeout_seconds: int,
+    expected_changed_files: list[str],
+    network_boundary: Mapping[str, Any],
+    snapshotter: _WorkspaceSnapshotter | None = None,
+    before: Mapping[str, str] | None = None,
+) -> JsonObject:
+    snapshotter = snapshotter or _WorkspaceSnapshotter()
+    if before is None:
+        before = snapshotter.snapshot(workspace)
+    reserved_before = _snapshot_reserved_evidence(workspace)
+    profile_argv = [sys.executable, *profile.argv_suffix]
+    network_required = network_boundary.get(NETWORK_ISOLATION_REQUIRED) is True
+    argv = (
+        build_network_isolated_argv(network_boundary, profile_argv)
+        if network_required
+        else profile_argv
+    )
+    network_backend_command_wrapped = network_required
+
+    try:
+        completed = subprocess.run(
+            argv,
+            cwd=workspace,
+            env=_execution_environment(),
+            capture_output=True,
+            text=True,
+            timeout=timeout_seconds,
+            check=False,
+            shell=False,
+        )
+        exit_code = completed.returncode
+        timed_out = False
+        stdout = _capture_text(completed.stdout)
+        stderr = _capture_text(completed.stderr)
+    except subprocess.TimeoutExpired as exc:
+        exit_code = -1
+        timed_out = True
+        stdout = _capture_text(exc.stdout)
+        stderr = _capture_text(exc.stderr)
+
+    after = snapshotter.snapshot(workspace)
+    reserved_after = _snapshot_reserved_evidence(workspace)
+    mutated_files = _changed_paths(before, after)
+    reserved_shadowed_files = _changed_paths(reserved_before, reserved_after)
+    workspace_mutated = bool(mutated_files)
+    runtime_guard = assess_runtime_guard(
+        expected_changed_files=expected_changed_files,
+        mutated_files=mutated_files,
+        reserved_evidence_changed_files=reserved_shadowed_files,
+    )
+
+    status = (
+        "passed"
+        if exit_code == 0
+        and not timed_out
+        and not _bool(runtime_guard.get(RUNTIME_GUARD_VIOLATION))
+        else "failed"
+    )
+
+    return {
+        "profile_id": profile.profile_id,
+        "command": profile.canonical_command,
+        "argv_display": ["python", *profile.argv_suffix],
+        EXECUTION_ARGV_DISPLAY: argv,
+        NETWORK_BACKEND_COMMAND_WRAPPED: network_backend_command_wrapped,
+        "network_backend": _string(network_boundary.get("backend")),
+        "network_backend_variant": _string(network_boundary.get("backend_variant")),
+        "status": status,
+        "exit_code": exit_code,
+        "timed_out": timed_out,
+        WORKSPACE_MUTATED_DURING_EXECUTION: workspace_mutated,
+        "workspace_mutated_files": mutated_files,
+        "reserved_evidence_shadowed_files": reserved_shadowed_files,
+        "runtime_guard": runtime_guard,
+        "stdout": stdout,
+        "stderr": stderr,
+        "_workspace_snapshot": after,
+    }
+
+
+def run_isolated_proof(
+    *,
+    repo_root: Path,
+    changed_files: list[str],
+    profile_ids: list[str],
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    inventory_mode: str | None = None,
+    base_ref: str = "",
+    head_ref: str = "HEAD",
+    require_network_isolation: bool = False,
+    blocked_network_probe_report: Mapping[str, Any] | None = None,
+    workspace_pool: IsolatedWorkspacePool | None = None,
+) -> JsonObject:
+    if timeout_seconds < 1:
+        raise ValueError("timeout_seconds must be at least 1")
+
+    source_root = repo_root.resolve()
+    if not source_root.exists() or not source_root.is_dir():
+        msg = f"repo_root does not exist or is not a directory: {source_root}"
+        raise ValueError(msg)
+
+    if not profile_ids:
+        raise ValueError("at least one proof profile is required")
+
+    unknown_profiles = sorted(set(profile_ids) - set(PROOF_PROFILES))
+    if unknown_profiles:
+        msg = f"unsupported proof profile: {', '.join(unknown_profiles)}"
+        raise ValueError(msg)
+
+    claimed_changed_files = sorted(set(changed_files))
+    inventory: JsonObject = {}
+    effective_changed_files = claimed_changed_files
+    changed_files_source = "caller_supplied_inventory_unverified"
+    inventory_claim_match: bool | None = None
+    git_inventory_verified = False
+    if blocked_network_probe_report is not None:
+        if not require_network_isolation:
+            raise ValueError("blocked network probe report requires network isolation")
+        network_boundary = assess_network_boundary(
+            require_network_isolation=True,
+            probe_report=blocked_network_probe_report,
+        )
+        if _bool(network_boundary.get(PROOF_EXECUTION_ALLOWED)):
+            raise ValueError("blocked network probe report cannot authorize proof execution")
+        if _bool(network_boundary.get(NETWORK_ISOLATION_ENFORCED)):
+            raise ValueError("blocked network probe report cannot claim enforcement")
+        if _bool(network_boundary.get("backend_verified")):
+            raise ValueError("blocked network probe report cannot verify a backend")
+    else:
+        network_boundary = assess_network_boundary(
+            require_network_isolation=require_network_isolation,
+        )
+    proof_execution_allowed = _bool(network_boundary.get(PROOF_EXECUTION_ALLOWED))
+
+    if inventory_mode:
+        inventory = collect_git_inventory(
+            repo_root=source_root,
+            mode=inventory_mode,
+            base_ref=base_ref,
+            head_ref=head_ref,
+        )
+        effective_changed_files = _string_list(inventory.get("changed_files"))
+        changed_files_source = _string(inventory.get("changed_files_source"))
+        inventory_claim_match = (
+            not claimed_changed_files or claimed_changed_files == effective_changed_files
+        )
+        git_inventory_verified = (
+            _bool(inventory.get("git_inventory_verified")) and inventory_claim_match
+        )
+
+    requested_profiles = list(dict.fromkeys(profile_ids))
+    results: list[JsonObject] = []
+
+    if proof_execution_allowed:
+        provider = (
+            workspace_pool.acquire(source_root)
+            if workspace_pool is not None
+            else _temporary_workspace(source_root)
+        )
+        with provider as workspace:
+            # Nothing runs between two profiles, so one profile's after-snapshot is
+            # the next profile's before-snapshot.
+            previous: Mapping[str, str] | None = None
+            for profile_id in requested_profiles:
+                result = _profile_result(
+                    profile=PROOF_PROFILES[profile_id],
+                    workspace=workspace.path,
+                    timeout_seconds=timeout_seconds,
+                    expected_changed_files=effective_changed_files,
+                    network_boundary=network_boundary,
+                    snapshotter=workspace.snapshotter,
+                    before=previous,
+                )
+                previous = result.pop("_workspace_snapshot")
+                results.append(result)
+
+    guard_status_counts: dict[str, int] = {}
+    runtime_guard_violation_count = 0
+    for result in results:
+        guard = _as_dict(result.get("runtime_guard"))
+        guard_status = _string(guard.get("status") or CLEAN)
+        guard_status_counts[guard_status] = guard_status_counts.get(guard_status, 0) + 1
+        if _bool(guard.get(RUNTIME_GUARD_VIOLATION)):
+            runtime_guard_violation_count += 1
+
+    runtime_guard_checked = bool(results)
+    network_required = network_boundary.get(NETWORK_ISOLATION_REQUIRED) is True
+    network_wrapped_count = sum(
+        1 for result in results if result.get(NETWORK_BACKEND_COMMAND_WRAPPED) is True
+    )
+    all_profiles_network_wrapped = (
+        network_required and bool(results) and network_wrapped_count == len(results)
+    )
+    network_isolation_verified = (
+        network_boundary.get(NETWORK_ISOLATION_ENFORCED) is True and all_profiles_network_wrapped
+    )
+    passed_count = sum(1 for result in results if result["status"] == "passed")
+    failed_count = len(results) - passed_count
+    blocked_count = 0 if proof_execution_allowed else len(requested_profiles)
+    inventory_failed = inventory_claim_match is False
+    status = (
+        "passed"
+        if proof_execution_allowed and failed_count == 0 and not inventory_failed
+        else "failed"
+    )
+
+    if not proof_execution_allowed:
+        boundary_reason = (
+            "Network-isolated proof was required, but no verified runtime "
+            "containment backend is available; proof execution was blocked."
+        )
+    elif network_required:
+        boundary_reason = (
+            "The runner executed every allowlisted proof profile through a "
+            "runtime-reprobed registered network namespace backend; automation "
+            "and merge authority remain disabled."
+        )
+    elif runtime_guard_violation_count:
+        boundary_reason = (
+            "The copied-workspace runtime guard detected proof-side mutation or "
+            "reserved evidence shadowing; verification evidence is blocked."
+        )
+    elif not inventory_mode:
+        boundary_reason = (
+            "The runner executes allowlisted proof profiles in an isolated copy, "
+            "but changed-file inventory is not yet git-derived."
+        )
+    elif inventory_failed:
+        boundary_reason = (
+            "Git-derived inventory disagrees with the caller-declared changed-file claim; "
+            "verification evidence is blocked."
+        )
+    else:
+        boundary_reason = (
+            "The runner executes allowlisted proof profiles in an isolated copy "
+            "with Git-derived changed-file inventory; automation remains disabled."
+        )
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "status": status,
+        "changed_files": effective_changed_files,
+        CLAIMED_CHANGED_FILES: claimed_changed_files,
+        "changed_files_source": changed_files_source,
+        INVENTORY_CLAIM_MATCH: inventory_claim_match,
+        "git_inventory": inventory,
+        "network_boundary": network_boundary,
+        "runtime_guard": {
+            "checked": runtime_guard_checked,
+            "passed": runtime_guard_checked and runtime_guard_violation_count == 0,
+            "violation_count": runtime_guard_violation_count,
+            "status_counts": dict(sorted(guard_status_counts.items())),
+            "external_filesystem_containment_enforced": False,
+            "process_escape_prevention_enforced": False,
+        },
+        "requested_profiles": requested_profiles,
+        "proof_results": results,
+        "proof_summary": {
+            "requested_count": len(requested_profiles),
+            "executed_count": len(results),
+            "blocked_count": blocked_count,
+            "passed_count": passed_count,
+            "failed_count": failed_count,
+        },
+        "isolation": {
+            "mode": (
+                "pooled_workspace_copy"
+                if workspace_pool is not None
+                else "temporary_workspace_copy"
+            ),
+            "shell_enabled": False,
+            "allowlisted_profiles_only": True,
+            "timeout_seconds": timeout_seconds,
+            "source_workspace_used_as_command_cwd": False,
+            NETWORK_ISOLATION_REQUIRED: _bool(network_boundary.get(NETWORK_ISOLATION_REQUIRED)),
+            NETWORK_ISOLATION_ENFORCED: _bool(network_boundary.get(NETWORK_ISOLATION_ENFORCED)),
+            "network_boundary_status": _string(network_boundary.get("status")),
+            "network_boundary_backend": _string(network_boundary.get("backend")),
+            "network_boundary_backend_variant": _string(network_boundary.get("backend_variant")),
+            "network_backend_command_wrapped_count": network_wrapped_count,
+            "all_profiles_network_wrapped": all_profiles_network_wrapped,
+            "proof_execution_blocked": not proof_execution_allowed,
+        },
+        "decision_boundary": {
+            "git_inventory_verified": git_inventory_verified,
+            "network_isolation_verified": network_isolation_verified,
+            "runtime_guard_passed": runtime_guard_checked and runtime_guard_violation_count == 0,
+            "automation_allowed": False,
+            "merge_authorized": False,
+            "semantic_equivalence_proven": False,
+            "reason": boundary_reason,
+        },
+    }
+
+
+def render_markdown(evidence: Mapping[str, Any]) -> str:
+    summary = _as_dict(evidence.get("proof_summary"))
+    isolation = _as_dict(evidence.get("isolation"))
+    boundary = _as_dict(evidence.get("decision_boundary"))
+    inventory = _as_dict(evidence.get("git_inventory"))
+    network_boundary = _as_dict(evidence.get("network_boundary"))
+    runtime_guard = _as_dict(evidence.get("runtime_guard"))
+    results = [_as_dict(item) for item in _as_list(evidence.get("proof_results"))]
+    claim_value = evidence.get(INVENTORY_CLAIM_MATCH)
+    claim_status = "not_checked" if claim_value is None else str(_bool(claim_value)).lower()
+
+    lines = [
+        "# Isolated proof runner evidence",
+        "",
+        f"- Schema: `{_string(evidence.get('schema_version'))}`",
+        f"- Status: `{_string(evidence.get('status'))}`",
+        f"- Profiles requested: `{_int(summary.get('requested_count'))}`",
+        f"- Profiles executed: `{_int(summary.get('executed_count'))}`",
+        f"- Profiles blocked: `{_int(summary.get('blocked_count'))}`",
+        f"- Profiles passed: `{_int(summary.get('passed_count'))}`",
+        f"- Profiles failed: `{_int(summary.get('failed_count'))}`",
+        f"- Changed-files source: `{_string(evidence.get('changed_files_source'))}`",
+        f"- Inventory claim matches: `{claim_status}`",
+        f"- Git inventory mode: `{_string(inventory.get('mode') or 'not_used')}`",
+        f"- Runtime guard checked: `{str(_bool(runtime_guard.get('checked'))).lower()}`",
+        f"- Runtime guard violations: `{_int(runtime_guard.get('violation_count'))}`",
+        "",
+        "## Execution isolation",
+        "",
+        f"- Mode: `{_string(isolation.get('mode'))}`",
+        f"- Shell enabled: `{str(_bool(isolation.get('shell_enabled'))).lower()}`",
+        (
+            "- Allowlisted profiles only: "
+            f"`{str(_bool(isolation.get('allowlisted_profiles_only'))).lower()}`"
+        ),
+        (
+            "- Source workspace used as command cwd: "
+            f"`{str(_bool(isolation.get('source_workspace_used_as_command_cwd'))).lower()}`"
+        ),
+        (
+            "- Network isolation required: "
+            f"`{str(_bool(isolation.get(NETWORK_ISOLATION_REQUIRED))).lower()}`"
+        ),
+        (
+            "- Network isolation enforced: "
+            f"`{str(_bool(isolation.get(NETWORK_ISOLATION_ENFORCED))).lower()}`"
+        ),
+        f"- Network boundary status: `{_string(network_boundary.get('status'))}`",
+        f"- Network boundary backend: `{_string(network_boundary.get('backend'))}`",
+        (
+            "- All profiles network wrapped: "
+            f"`{str(_bool(isolation.get('all_profiles_network_wrapped'))).lower()}`"
+        ),
+        (
+            "- Proof execution blocked: "
+            f"`{str(_bool(isolation.get('proof_execution_blocked'))).lower()}`"
+        ),
+        "",
+        "## Proof results",
+        "",
+    ]
+
+    if results:
+        for result in results:
+            lines.append(
+                f"- `{_string(result.get('profile_id'))}`: "
+                f"status=`{_string(result.get('status'))}`, "
+                f"exit_code=`{_int(result.get('exit_code'), default=-1)}`, "
+                "workspace_mutated=`"
+                f"{str(_bool(result.get(WORKSPACE_MUTATED_DURING_EXECUTION))).lower()}`, "
+                "runtime_guard=`"
+                f"{_string(_as_dict(result.get('runtime_guard')).get('status'))}`"
+            )
+            lines.append(f"  - Command: `{_string(result.get('command'))}`")
+    else:
+        lines.append("- none")
+
+    lines.extend(
+        [
+            "",
+            "## Boundary",
+            "",
+            (
+                "- Git-derived file inventory verified: "
+                f"`{str(_bool(boundary.get('git_inventory_verified'))).lower()}`"
+            ),
+            (
+                "- Runtime guard passed: "
+                f"`{str(_bool(boundary.get('runtime_guard_passed'))).lower()}`"
+            ),
+            f"- Automation allowed: `{str(_bool(boundary.get('automation_allowed'))).lower()}`",
+            f"- Merge authorized: `{str(_bool(boundary.get('merge_authorized'))).lower()}`",
+            (
+                "- Semantic equivalence proven: "
+                f"`{str(_bool(boundary.get('semantic_equivalence_proven'))).lower()}`"
+            ),
+            "- This runner does not accept arbitrary command strings.",
+            "- Git-derived inventory is used only when explicitly requested and collected in-process.",
+            "",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def write_evidence(evidence: Mapping[str, Any], *, out_dir: Path) -> dict[str, str]:
+    json_path = out_dir / EVIDENCE_JSON
+    markdown_path = out_dir / EVIDENCE_MD
+    out_dir.mkdir(parents=True, exist_ok=True)
+    json_path.write_text(
+        json.dumps(evidence, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+    markdown_path.write_text(render_markdown(evidence), encoding="utf-8")
+    return {
+        "verification_evidence_json": json_path.as_posix(),
+        "verification_evidence_markdown": markdown_path.as_posix(),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m sdetkit.isolated_proof_runner")
+    parser.add_argument("--repo-root", type=Path, required=True)
+    parser.add_argument("--changed-file", action="append", default=[])
+    parser.add_argument("--inventory-mode", choices=[BASE_HEAD, STAGED_WORKTREE])
+    parser.add_argument("--base-ref", default="")
+    parser.add_argument("--head-ref", default="HEAD")
+    parser.add_argument("--require-network-isolation", action="store_true")
+    parser.add_argument(
+        "--profile",
+        action="append",
+        choices=sorted(PROOF_PROFILES),
+        required=True,
+    )
+    parser.add_argument("--timeout-seconds", type=int, default=DEFAULT_TIMEOUT_SECONDS)
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR)
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    parser.add_argument(
+        "--workspace-pool",
+        type=Path,
+        default=None,
+        help="Reuse pre-warmed proof workspaces under this directory instead of a fresh copy.",
+    )
+    parser.add_argument("--workspace-pool-size", type=int, default=DEFAULT_WORKSPACE_POOL_SIZE)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    try:
+        evidence = run_isolated_proof(
+            repo_root=args.repo_root,
+            changed_files=args.changed_file,
+            profile_ids=args.profile,
+            timeout_seconds=args.timeout_seconds,
+            inventory_mode=args.inventory_mode,
+            base_ref=args.base_ref,
+            head_ref=args.head_ref,
+            require_network_isolation=args.require_network_isolation,
+            workspace_pool=(
+                IsolatedWorkspacePool(args.workspace_pool, size=args.workspace_pool_size)
+                if args.workspace_pool is not None
+                else None
+            ),
+        )
+        artifacts = write_evidence(evidence, out_dir=args.out_dir)
+    except (OSError, RuntimeError, ValueError, subprocess.SubprocessError) as exc:
+        print(f"error={exc}")
+        return 2
+
+    if args.format == "json":
+        print(
+            json.dumps(
+                {
+                    "status": evidence["status"],
+                    "artifacts": artifacts,
+                    "proof_summary": evidence["proof_summary"],
+                    "decision_boundary": evidence["decision_boundary"],
+                },
+                indent=2,
+                sort_keys=True,
+            )
+        )
+    else:
+        for key, value in artifacts.items():
+            print(f"{key}: {value}")
+
+    return 0 if evidence["status"] == "passed" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,675 @@
+from __future__ import annotations
+
+import contextlib
+import copy
+import hashlib
+import heapq
+import json
+import os
+import tempfile
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from sdetkit.diagnostic_job import EXECUTION_MODE, validate_job
+
+SCHEMA_VERSION = "sdetkit.local_diagnostic_job_queue.v1"
+
+PENDING = "pending"
+CLAIMED = "claimed"
+COMPLETED = "completed"
+FAILED = "failed"
+ALLOWED_STATES = frozenset({PENDING, CLAIMED, COMPLETED, FAILED})
+
+JsonObject = dict[str, Any]
+
+
+class JobNotPendingError(ValueError):
+    """Raised when a job named for a claim has already left the pending state."""
+
+
+def _as_dict(value: Any) -> JsonObject:
+    return value if isinstance(value, dict) else {}
+
+
+def _as_list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else []
+
+
+def _string(value: Any) -> str:
+    return str(value or "").replace("\r", " ").replace("\n", " ").strip()
+
+
+def _bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in {"1", "true", "yes"}
+
+
+def _boundary() -> JsonObject:
+    return {
+        "automation_allowed": False,
+        "patch_application_allowed": False,
+        "merge_authorized": False,
+        "semantic_equivalence_proven": False,
+        "proof_commands_executed": False,
+    }
+
+
+def _assert_boundary(payload: Mapping[str, Any], *, source: str) -> None:
+    denied = (
+        "automation_allowed",
+        "patch_application_allowed",
+        "merge_authorized",
+        "semantic_equivalence_proven",
+        "proof_commands_executed",
+    )
+    expanded = [key for key in denied if _bool(payload.get(key))]
+    if expanded:
+        raise ValueError(f"{source} expands authority: " + ", ".join(expanded))
+
+
+def _empty_queue() -> JsonObject:
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "execution_mode": EXECUTION_MODE,
+        "jobs": [],
+        "decision_boundary": _boundary(),
+    }
+
+
+def _record_sort_key(record: Mapping[str, Any]) -> tuple[str, str]:
+    job = _as_dict(record.get("job"))
+    return (_string(job.get("created_at")), _string(record.get("job_id")))
+
+
+def _normalize_artifacts(value: Mapping[str, str]) -> dict[str, str]:
+    return {
+        _string(name): _string(path)
+        for name, path in sorted(value.items())
+        if _string(name) and _string(path)
+    }
+
+
+def _sanitize_failure_reason(reason: str) -> str:
+    normalized = " ".join(_string(reason).split())
+    if not normalized:
+        raise ValueError("failed diagnostic job requires a failure reason")
+    return normalized[:500]
+
+
+def _record_for_job(job: Mapping[str, Any], *, enqueued_at: str) -> JsonObject:
+    validate_job(job)
+    job_id = _string(job.get("job_id"))
+    if not job_id:
+        raise ValueError("diagnostic job id is required")
+
+    timestamp = _string(enqueued_at) or _string(job.get("created_at"))
+    if not timestamp:
+        raise ValueError("diagnostic queue enqueue timestamp is required")
+
+    return {
+        "job_id": job_id,
+        "state": PENDING,
+        "enqueued_at": timestamp,
+        "claimed_at": "",
+        "completed_at": "",
+        "failed_at": "",
+        "job": copy.deepcopy(dict(job)),
+        "result_artifacts": {},
+        "failure_reason": "",
+        "decision_boundary": _boundary(),
+    }
+
+
+def _validate_record(record: Mapping[str, Any]) -> None:
+    job = _as_dict(record.get("job"))
+    validate_job(job)
+
+    job_id = _string(record.get("job_id"))
+    if not job_id:
+        raise ValueError("diagnostic queue record requires a job id")
+    if job_id != _string(job.get("job_id")):
+        raise ValueError("diagnostic queue record job id does not match job")
+
+    state = _string(record.get("state"))
+    if state not in ALLOWED_STATES:
+        raise ValueError(f"diagnostic queue state is not supported: {state or 'missing'}")
+
+    if not _string(record.get("enqueued_at")):
+        raise ValueError("diagnostic queue record requires enqueued_at")
+
+    _assert_boundary(
+        _as_dict(record.get("decision_boundary")),
+        source=f"diagnostic queue record {job_id}",
+    )
+
+    claimed_at = _string(record.get("claimed_at"))
+    completed_at = _string(record.get("completed_at"))
+    failed_at = _string(record.get("failed_at"))
+    result_artifacts = _as_dict(record.get("result_artifacts"))
+    failure_reason = _string(record.get("failure_reason"))
+
+    if state == PENDING:
+        if claimed_at or completed_at or failed_at or result_artifacts or failure_reason:
+            raise ValueError("pending diagnostic queue record contains terminal state evidence")
+    elif state == CLAIMED:
+        if not claimed_at:
+            raise ValueError("claimed diagnostic queue record requires claimed_at")
+        if completed_at or failed_at or result_artifacts or failure_reason:
+            raise ValueError("claimed diagnostic queue record contains terminal state evidence")
+    elif state == COMPLETED:
+        if not claimed_at or not completed_at:
+            raise ValueError(
+                "completed diagnostic queue record requires claim and completion times"
+            )
+        if not result_artifacts:
+            raise ValueError("completed diagnostic queue record requires result artifacts")
+        if failed_at or failure_reason:
+            raise ValueError("completed diagnostic queue record contains failure evidence")
+    elif state == FAILED:
+        if not claimed_at or not failed_at:
+            raise ValueError("failed diagnostic queue record requires claim and failure times")
+        if not failure_reason:
+            raise ValueError("failed diagnostic queue record requires a failure reason")
+        if completed_at or result_artifacts:
+            raise ValueError("failed diagnostic queue record contains completion evidence")
+
+
+def validate_queue(queue: Mapping[str, Any]) -> None:
+    if _string(queue.get("schema_version")) != SCHEMA_VERSION:
+        raise ValueError("diagnostic job queue schema is not supported")
+    if _string(queue.get("execution_mode")) != EXECUTION_MODE:
+        raise ValueError("diagnostic job queue execution mode must be local read-only")
+
+    _assert_boundary(
+        _as_dict(queue.get("decision_boundary")),
+        source="diagnostic job queue",
+    )
+
+    raw_jobs = queue.get("jobs")
+    if not isinstance(raw_jobs, list):
+        raise ValueError("diagnostic job queue jobs must be a list")
+
+    records = [_as_dict(item) for item in raw_jobs]
+    if any(not record for record in records):
+        raise ValueError("diagnostic job queue contains a malformed record")
+
+    seen: set[str] = set()
+    for record in records:
+        _validate_record(record)
+        job_id = _string(record.get("job_id"))
+        if job_id in seen:
+            raise ValueError(f"diagnostic job queue contains duplicate job id: {job_id}")
+        seen.add(job_id)
+
+    if records != sorted(records, key=_record_sort_key):
+        raise ValueError("diagnostic job queue records are not in deterministic order")
+
+
+def _journal_path(path: Path) -> Path:
+    return path.with_name(path.name + ".journal")
+
+
+def _lock_path(path: Path) -> Path:
+    return path.with_name(path.name + ".lock")
+
+
+@contextlib.contextmanager
+def _queue_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive cross-process lock for the queue at ``path``."""
+    lock_path = _lock_path(path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            import fcntl
+        except ImportError:  # pragma: no cover - Windows
+            import msvcrt
+
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            return
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _load_snapshot(path: Path) -> JsonObject:
+    if not path.exists():
+        return _empty_queue()
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ValueError(f"unable to read diagnostic job queue: {path}") from exc
+
+    if not isinstance(payload, dict):
+        raise ValueError(f"expected JSON object in diagnostic job queue: {path}")
+
+    validate_queue(payload)
+    return payload
+
+
+def _read_journal(journal: Path, offset: int = 0) -> tuple[list[JsonObject], int]:
+    """Return complete journal operations after ``offset`` and the new offset.
+
+    A trailing line without a newline is an in-flight or torn append and is left
+    for the next read.
+    """
+    try:
+        with journal.open("rb") as handle:
+            handle.seek(offset)
+            data = handle.read()
+    except FileNotFoundError:
+        return [], 0
+    end = data.rfind(b"\n")
+    if end < 0:
+        return [], offset
+    ops: list[JsonObject] = []
+    for line in data[: end + 1].splitlines():
+        if not line.strip():
+            continue
+        try:
+            op = json.loads(line.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise ValueError(f"diagnostic job queue journal is corrupt: {journal}") from exc
+        ops.append(_as_dict(op))
+    return ops, offset + end + 1
+
+
+def _append_journal(journal: Path, op: Mapping[str, Any]) -> None:
+    line = json.dumps(dict(op), sort_keys=True, separators=(",", ":")) + "\n"
+    journal.parent.mkdir(parents=True, exist_ok=True)
+    with journal.open("a", encoding="utf-8", newline="\n") as handle:
+        handle.write(line)
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+def _snapshot_digest(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+
+def _is_fold_marker(op: Mapping[str, Any]) -> bool:
+    return _string(op.get("op")) == "folded"
+
+
+def _unfolded_ops(path: Path, ops: list[JsonObject]) -> list[JsonObject]:
+    """Drop journal operations that an interrupted fold already wrote to the snapshot.
+
+    ``_write_queue`` appends a ``folded`` marker naming the digest of the snapshot it
+    is about to install. If the journal is still present when that digest matches the
+    snapshot on disk, the process stopped between installing the snapshot and
+    unlinking the journal, and everything up to the marker is already applied.
+    """
+    markers = [index for index, op in enumerate(ops) if _is_fold_marker(op)]
+    if markers:
+        digest = _snapshot_digest(path)
+        for index in reversed(markers):
+            if _string(ops[index].get("snapshot_sha256")) == digest:
+                ops = ops[index + 1 :]
+                break
+    return [op for op in ops if not _is_fold_marker(op)]
+
+
+def _apply_op(records: dict[str, JsonObject], op: Mapping[str, Any]) -> JsonObject:
+    kind = _string(op.get("op"))
+    if kind == "enqueue":
+        record = copy.deepcopy(_as_dict(op.get("record")))
+        _validate_record(record)
+        job_id = _string(record.get("job_id"))
+        if job_id in records:
+            raise ValueError(f"duplicate diagnostic queue job: {job_id}")
+        records[job_id] = record
+        return record
+
+    job_id = _string(op.get("job_id"))
+    record = records.get(job_id)
+    if record is None:
+        raise ValueError(f"unknown diagnostic queue job: {job_id or 'missing'}")
+    state = _string(record.get("state"))
+
+    if kind == "claim":
+        if state != PENDING:
+            raise JobNotPendingError("diagnostic queue job can only be claimed from pending state")
+        record["state"] = CLAIMED
+        record["claimed_at"] = _string(op.get("claimed_at"))
+    elif kind == "complete":
+        if state != CLAIMED:
+            raise ValueError("diagnostic queue job can only complete from claimed state")
+        record["state"] = COMPLETED
+        record["completed_at"] = _string(op.get("completed_at"))
+        record["result_artifacts"] = _normalize_artifacts(_as_dict(op.get("result_artifacts")))
+    elif kind == "fail":
+        if state != CLAIMED:
+            raise ValueError("diagnostic queue job can only fail from claimed state")
+        record["state"] = FAILED
+        record["failed_at"] = _string(op.get("failed_at"))
+        record["failure_reason"] = _sanitize_failure_reason(_string(op.get("failure_reason")))
+    else:
+        raise ValueError(f"diagnostic job queue journal operation is not supported: {kind}")
+    return record
+
+
+def _queue_from_records(base: Mapping[str, Any], records: Mapping[str, JsonObject]) -> JsonObject:
+    queue = {key: value for key, value in base.items() if key != "jobs"}
+    queue["jobs"] = sorted(records.values(), key=_record_sort_key)
+    return queue
+
+
+def _load_queue_unlocked(path: Path) -> JsonObject:
+    queue = _load_snapshot(path)
+    ops, _ = _read_journal(_journal_path(path))
+    ops = _unfolded_ops(path, ops)
+    if not ops:
+        return queue
+    records = {_string(record.get("job_id")): record for record in _as_list(queue.get("jobs"))}
+    for op in ops:
+        _apply_op(records, op)
+    queue = _queue_from_records(queue, records)
+    validate_queue(queue)
+    return queue
+
+
+def load_queue(path: Path) -> JsonObject:
+    if _journal_path(path).exists():
+        with _queue_lock(path):
+            return copy.deepcopy(_load_queue_unlocked(path))
+    return copy.deepcopy(_load_snapshot(path))
+
+
+def _write_queue(path: Path, queue: Mapping[str, Any]) -> None:
+    normalized = copy.deepcopy(dict(queue))
+    normalized["jobs"] = sorted(
+        [_as_dict(item) for item in _as_list(normalized.get("jobs"))],
+        key=_record_sort_key,
+    )
+    validate_queue(normalized)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(normalized, indent=2, sort_keys=True) + "\n"
+
+    fd, temporary_name = tempfile.mkstemp(
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        text=True,
+    )
+    temporary_path = Path(temporary_name)
+    journal = _journal_path(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        if journal.exists():
+            digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            _append_journal(journal, {"op": "folded", "snapshot_sha256": digest})
+        os.replace(temporary_path, path)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+    journal.unlink(missing_ok=True)
+
+
+def _mutate(path: Path, op: Mapping[str, Any]) -> JsonObject:
+    with _queue_lock(path):
+        queue = _load_queue_unlocked(path)
+        records = {_string(record.get("job_id")): record for record in _as_list(queue.get("jobs"))}
+        record = _apply_op(records, op)
+        _write_queue(path, _queue_from_records(queue, records))
+        return copy.deepcopy(record)
+
+
+def enqueue_job(
+    path: Path,
+    job: Mapping[str, Any],
+    *,
+    enqueued_at: str = "",
+) -> JsonObject:
+    record = _record_for_job(job, enqueued_at=enqueued_at)
+    return _mutate(path, {"op": "enqueue", "record": record})
+
+
+def claim_job(
+    path: Path,
+    *,
+    claimed_at: str,
+    job_id: str = "",
+) -> JsonObject:
+    timestamp = _string(claimed_at)
+    if not timestamp:
+        raise ValueError("diagnostic queue claim timestamp is required")
+
+    if _string(job_id):
+        return _mutate(path, {"op": "claim", "job_id": job_id, "claimed_at": timestamp})
+
+    with _queue_lock(path):
+        queue = _load_queue_unlocked(path)
+        records = {_string(record.get("job_id")): record for record in _as_list(queue.get("jobs"))}
+        pending = [record for record in records.values() if record.get("state") == PENDING]
+        if not pending:
+            raise ValueError("diagnostic job queue has no pending jobs")
+        oldest = _string(min(pending, key=_record_sort_key).get("job_id"))
+        record = _apply_op(records, {"op": "claim", "job_id": oldest, "claimed_at": timestamp})
+        _write_queue(path, _queue_from_records(queue, records))
+        return copy.deepcopy(record)
+
+
+def complete_job(
+    path: Path,
+    job_id: str,
+    *,
+    result_artifacts: Mapping[str, str],
+    completed_at: str,
+) -> JsonObject:
+    timestamp = _string(completed_at)
+    if not timestamp:
+        raise ValueError("diagnostic queue completion timestamp is required")
+
+    artifacts = _normalize_artifacts(result_artifacts)
+    if not artifacts:
+        raise ValueError("completed diagnostic queue job requires result artifacts")
+
+    return _mutate(
+        path,
+        {
+            "op": "complete",
+            "job_id": job_id,
+            "completed_at": timestamp,
+            "result_artifacts": artifacts,
+        },
+    )
+
+
+def fail_job(
+    path: Path,
+    job_id: str,
+    *,
+    reason: str,
+    failed_at: str,
+) -> JsonObject:
+    timestamp = _string(failed_at)
+    if not timestamp:
+        raise ValueError("diagnostic queue failure timestamp is required")
+
+    return _mutate(
+        path,
+        {
+            "op": "fail",
+            "job_id": job_id,
+            "failed_at": timestamp,
+            "failure_reason": _sanitize_failure_reason(reason),
+        },
+    )
+
+
+class JournaledJobQueue:
+    """Append-only, lock-protected view of a diagnostic job queue.
+
+    Mutations append one JSON line to ``<queue>.journal`` under an exclusive file
+    lock instead of rewriting the snapshot, and each instance keeps an in-memory
+    view that only replays journal lines written since its last sync. ``compact``
+    folds the journal back into the deterministic JSON snapshot that ``load_queue``
+    and auditors read. The module-level functions stay compatible with a queue
+    that has an uncompacted journal.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._journal = _journal_path(path)
+        self._base: JsonObject = _empty_queue()
+        self._records: dict[str, JsonObject] = {}
+        self._pending: list[tuple[tuple[str, str], str]] = []
+        self._snapshot_identity: tuple[int, int] | None = None
+        self._journal_identity: int | None = None
+        self._offset = 0
+        self._loaded = False
+
+    @staticmethod
+    def _identity(path: Path) -> tuple[int, int] | None:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (int(st.st_ino), int(st.st_mtime_ns))
+
+    def _track(self, record: JsonObject) -> None:
+        if record.get("state") == PENDING:
+            heapq.heappush(self._pending, (_record_sort_key(record), _string(record["job_id"])))
+
+    def _sync(self) -> None:
+        snapshot_identity = self._identity(self.path)
+        journal_identity = self._identity(self._journal)
+        journal_ino = journal_identity[0] if journal_identity is not None else None
+        reload = (
+            not self._loaded
+            or snapshot_identity != self._snapshot_identity
+            or journal_ino != self._journal_identity
+        )
+        if reload:
+            self._base = _load_snapshot(self.path)
+            self._records = {
+                _string(record.get("job_id")): record for record in _as_list(self._base.get("jobs"))
+            }
+            self._pending = []
+            for record in self._records.values():
+                self._track(record)
+            self._offset = 0
+            self._snapshot_identity = snapshot_identity
+            self._journal_identity = journal_ino
+            self._loaded = True
+        ops, offset = _read_journal(self._journal, self._offset)
+        if self._offset == 0:
+            ops = _unfolded_ops(self.path, ops)
+        self._offset = offset
+        for op in ops:
+            if not _is_fold_marker(op):
+                self._track(_apply_op(self._records, op))
+
+    def _commit(self, op: JsonObject) -> JsonObject:
+        # Validate against a copy and journal the op before the view changes, so a
+        # failed append leaves this process agreeing with every other reader.
+        target = _string(op.get("job_id") or _as_dict(op.get("record")).get("job_id"))
+        current = self._records.get(target)
+        scratch = {target: copy.deepcopy(current)} if current is not None else {}
+        record = _apply_op(scratch, op)
+        try:
+            _append_journal(self._journal, op)
+        except BaseException:
+            if current is not None:
+                # claim() already popped this job off the pending heap.
+                self._track(current)
+            raise
+        self._records[_string(record.get("job_id"))] = record
+        st = self._journal.stat()
+        self._journal_identity = int(st.st_ino)
+        self._offset = st.st_size
+        self._track(record)
+        return copy.deepcopy(record)
+
+    def enqueue(self, job: Mapping[str, Any], *, enqueued_at: str = "") -> JsonObject:
+        record = _record_for_job(job, enqueued_at=enqueued_at)
+        with _queue_lock(self.path):
+            self._sync()
+            return self._commit({"op": "enqueue", "record": record})
+
+    def claim(self, *, claimed_at: str, job_id: str = "") -> JsonObject:
+        timestamp = _string(claimed_at)
+        if not timestamp:
+            raise ValueError("diagnostic queue claim timestamp is required")
+        with _queue_lock(self.path):
+            self._sync()
+            target = _string(job_id)
+            if not target:
+                while self._pending:
+                    _, candidate = heapq.heappop(self._pending)
+                    if self._records[candidate].get("state") == PENDING:
+                        target = candidate
+                        break
+                if not target:
+                    raise ValueError("diagnostic job queue has no pending jobs")
+            return self._commit({"op": "claim", "job_id": target, "claimed_at": timestamp})
+
+    def complete(
+        self, job_id: str, *, result_artifacts: Mapping[str, str], completed_at: str
+    ) -> JsonObject:
+        timestamp = _string(completed_at)
+        if not timestamp:
+            raise ValueError("diagnostic queue completion timestamp is required")
+        artifacts = _normalize_artifacts(result_artifacts)
+        if not artifacts:
+            raise ValueError("completed diagnostic queue job requires result artifacts")
+        with _queue_lock(self.path):
+            self._sync()
+            return self._commit(
+                {
+                    "op": "complete",
+                    "job_id": _string(job_id),
+                    "completed_at": timestamp,
+                    "result_artifacts": artifacts,
+                }
+            )
+
+    def fail(self, job_id: str, *, reason: str, failed_at: str) -> JsonObject:
+        timestamp = _string(failed_at)
+        if not timestamp:
+            raise ValueError("diagnostic queue failure timestamp is required")
+        with _queue_lock(self.path):
+            self._sync()
+            return self._commit(
+                {
+                    "op": "fail",
+                    "job_id": _string(job_id),
+                    "failed_at": timestamp,
+                    "failure_reason": _sanitize_failure_reason(reason),
+                }
+            )
+
+    def snapshot(self) -> JsonObject:
+        with _queue_lock(self.path):
+            self._sync()
+            return copy.deepcopy(_queue_from_records(self._base, self._records))
+
+    def compact(self) -> JsonObject:
+        with _queue_lock(self.path):
+            self._sync()
+            if not self._journal.exists():
+                return copy.deepcopy(_queue_from_records(self._base, self._records))
+            queue = _queue_from_records(self._base, self._records)
+            _write_queue(self.path, queue)
+            self._loaded = False
+            self._sync()
+            return copy.deepcopy(queue)
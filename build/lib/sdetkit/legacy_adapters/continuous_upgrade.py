@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+LEGACY_CONTINUOUS_UPGRADE_COMMAND_MODULES: dict[str, str] = {
+    "continuous-upgrade-closeout-1": "sdetkit.continuous_upgrade_foundation",
+    "continuous-upgrade-closeout-2": "sdetkit.continuous_upgrade_baseline",
+    "continuous-upgrade-closeout-3": "sdetkit.continuous_upgrade_contracts",
+    "continuous-upgrade-closeout-4": "sdetkit.continuous_upgrade_docs",
+    "continuous-upgrade-closeout-5": "sdetkit.continuous_upgrade_quality",
+    "continuous-upgrade-closeout-6": "sdetkit.continuous_upgrade_release",
+    "continuous-upgrade-closeout-7": "sdetkit.continuous_upgrade_operations",
+    "continuous-upgrade-closeout-8": "sdetkit.continuous_upgrade_governance",
+    "continuous-upgrade-closeout-9": "sdetkit.continuous_upgrade_automation",
+    "continuous-upgrade-closeout-10": "sdetkit.continuous_upgrade_platform",
+    "continuous-upgrade-closeout-11": "sdetkit.continuous_upgrade_readiness",
+}
@@ -0,0 +1,1884 @@
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from collections.abc import Sequence
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+SCHEMA_VERSION = "1"
+FAILURE_BUNDLE_SCHEMA_VERSION = "sdetkit.adaptive.failure_bundle.v1"
+EVIDENCE_GRAPH_SCHEMA_VERSION = "sdetkit.evidence-graph.v1"
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def _run_id(generated_at: str) -> str:
+    stamp = generated_at.replace("-", "").replace(":", "").replace("Z", "")
+    return f"mc-{stamp}-{uuid.uuid4().hex[:12]}"
+
+
+def _run_text(args: Sequence[str], *, cwd: Path) -> tuple[int, str]:
+    try:
+        completed = subprocess.run(
+            list(args),
+            cwd=str(cwd),
+            check=False,
+            text=True,
+            capture_output=True,
+        )
+    except OSError as exc:
+        return 127, str(exc)
+    output = completed.stdout.strip() or completed.stderr.strip()
+    return completed.returncode, output
+
+
+def _git_value(repo: Path, args: Sequence[str], fallback: str) -> str:
+    rc, output = _run_text(["git", *args], cwd=repo)
+    if rc != 0 or not output:
+        return fallback
+    return output.splitlines()[0].strip() or fallback
+
+
+def _git_dirty(repo: Path) -> bool:
+    rc, output = _run_text(["git", "status", "--short"], cwd=repo)
+    return rc == 0 and bool(output.strip())
+
+
+def _default_ledger_path(repo: Path) -> Path:
+    return repo / ".sdetkit" / "runs" / "mission-control-runs.jsonl"
+
+
+def _command_steps() -> list[dict[str, Any]]:
+    return [
+        {
+            "id": "gate_fast",
+            "label": "Fast release confidence gate",
+            "command": "python -m sdetkit gate fast",
+            "status": "ready",
+            "tier": "public_stable",
+            "executable": True,
+        },
+        {
+            "id": "gate_release",
+            "label": "Strict release confidence gate",
+            "command": "python -m sdetkit gate release",
+            "status": "ready",
+            "tier": "public_stable",
+            "executable": True,
+        },
+        {
+            "id": "doctor",
+            "label": "Repository and release-readiness diagnostics",
+            "command": "python -m sdetkit doctor",
+            "status": "ready",
+            "tier": "public_stable",
+            "executable": True,
+        },
+        {
+            "id": "review",
+            "label": "Operator review workflow",
+            "command": "python -m sdetkit review . --profile release --format operator-json",
+            "status": "ready",
+            "tier": "public_stable",
+            "executable": False,
+        },
+        {
+            "id": "readiness",
+            "label": "Production readiness scorecard",
+            "command": "python -m sdetkit readiness",
+            "status": "ready",
+            "tier": "public_stable",
+            "executable": True,
+        },
+        {
+            "id": "release_room",
+            "label": "Release-room plan",
+            "command": "python -m sdetkit release-room",
+            "status": "planned",
+            "tier": "future_public_surface",
+            "executable": False,
+        },
+    ]
+
+
+def _execution_args(step_id: str) -> list[str]:
+    commands = {
+        "gate_fast": [sys.executable, "-m", "sdetkit", "gate", "fast"],
+        "gate_release": [sys.executable, "-m", "sdetkit", "gate", "release"],
+        "doctor": [sys.executable, "-m", "sdetkit", "doctor"],
+        "readiness": [sys.executable, "-m", "sdetkit", "readiness"],
+    }
+    return commands[step_id]
+
+
+def _selected_execute_ids(*, include_release: bool) -> set[str]:
+    selected = {"gate_fast", "doctor", "readiness"}
+    if include_release:
+        selected.add("gate_release")
+    return selected
+
+
+def _run_step_process(
+    args: Sequence[str],
+    *,
+    cwd: Path,
+    timeout_seconds: int,
+) -> tuple[int, str, str, int]:
+    started = time.perf_counter()
+    try:
+        completed = subprocess.run(
+            list(args),
+            cwd=str(cwd),
+            check=False,
+            text=True,
+            capture_output=True,
+            timeout=timeout_seconds,
+        )
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return completed.returncode, completed.stdout, completed.stderr, elapsed_ms
+    except subprocess.TimeoutExpired as exc:
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        stdout = exc.stdout if isinstance(exc.stdout, str) else ""
+        stderr = exc.stderr if isinstance(exc.stderr, str) else ""
+        stderr = stderr or f"timed out after {timeout_seconds}s"
+        return 124, stdout, stderr, elapsed_ms
+    except OSError as exc:
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return 127, "", str(exc), elapsed_ms
+
+
+def _write_step_outputs(
+    *,
+    out_dir: Path,
+    step_id: str,
+    stdout: str,
+    stderr: str,
+) -> tuple[Path, Path]:
+    step_dir = out_dir / "steps"
+    step_dir.mkdir(parents=True, exist_ok=True)
+    stdout_path = step_dir / f"{step_id}.stdout"
+    stderr_path = step_dir / f"{step_id}.stderr"
+    stdout_path.write_text(stdout, encoding="utf-8")
+    stderr_path.write_text(stderr, encoding="utf-8")
+    return stdout_path, stderr_path
+
+
+def _execute_steps(
+    *,
+    steps: list[dict[str, Any]],
+    repo: Path,
+    out_dir: Path,
+    include_release: bool,
+    timeout_seconds: int,
+) -> list[dict[str, Any]]:
+    selected = _selected_execute_ids(include_release=include_release)
+    executed_steps = []
+
+    for step in steps:
+        updated = dict(step)
+        step_id = str(step["id"])
+
+        if step_id not in selected:
+            updated["executed"] = False
+            executed_steps.append(updated)
+            continue
+
+        args = _execution_args(step_id)
+        rc, stdout, stderr, elapsed_ms = _run_step_process(
+            args,
+            cwd=repo,
+            timeout_seconds=timeout_seconds,
+        )
+        stdout_path, stderr_path = _write_step_outputs(
+            out_dir=out_dir,
+            step_id=step_id,
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+        updated["executed"] = True
+        updated["status"] = "passed" if rc == 0 else "failed"
+        updated["rc"] = rc
+        updated["elapsed_ms"] = elapsed_ms
+        updated["stdout_path"] = stdout_path.resolve().as_posix()
+        updated["stderr_path"] = stderr_path.resolve().as_posix()
+        executed_steps.append(updated)
+
+    return executed_steps
+
+
+def _artifact(path: Path, label: str, kind: str) -> dict[str, str]:
+    return {
+        "label": label,
+        "kind": kind,
+        "path": path.as_posix(),
+    }
+
+
+def _step_artifacts(steps: Sequence[dict[str, Any]]) -> list[dict[str, str]]:
+    artifacts = []
+    for step in steps:
+        step_id = str(step["id"])
+        stdout_path = step.get("stdout_path")
+        stderr_path = step.get("stderr_path")
+        if isinstance(stdout_path, str):
+            artifacts.append(
+                {
+                    "label": f"{step_id} stdout",
+                    "kind": "stdout",
+                    "path": stdout_path,
+                }
+            )
+        if isinstance(stderr_path, str):
+            artifacts.append(
+                {
+                    "label": f"{step_id} stderr",
+                    "kind": "stderr",
+                    "path": stderr_path,
+                }
+            )
+    return artifacts
+
+
+def _doctor_payload(repo: Path) -> dict[str, Any]:
+    from . import doctor
+
+    previous_cwd = Path.cwd()
+    captured = io.StringIO()
+    try:
+        os.chdir(repo)
+        with redirect_stdout(captured):
+            doctor.main(["--format", "json"])
+    finally:
+        os.chdir(previous_cwd)
+
+    payload = json.loads(captured.getvalue())
+    if not isinstance(payload, dict):
+        raise ValueError("doctor JSON payload was not an object")
+    return payload
+
+
+def _summary_count(payload: dict[str, Any], key: str) -> int:
+    value = payload.get(key, 0)
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return 0
+
+
+def _doctor_cortex_short(
+    payload: dict[str, Any],
+    *,
+    count_key: str,
+) -> dict[str, Any]:
+    return {
+        "status": str(payload.get("status", "unknown")),
+        "severity": str(payload.get("severity", "unknown")),
+        count_key: _summary_count(payload, count_key),
+    }
+
+
+def _collect_doctor_cortex(repo: Path, out_dir: Path) -> dict[str, Any]:
+    diagnosis_path = out_dir / "doctor-cortex-diagnosis.json"
+    prescriptions_path = out_dir / "doctor-cortex-prescriptions.json"
+
+    try:
+        from . import doctor_diagnosis, doctor_prescriptions
+
+        out_dir.mkdir(parents=True, exist_ok=True)
+        doctor_payload = _doctor_payload(repo)
+        diagnosis_contract = doctor_diagnosis.build_diagnosis_payload(doctor_payload)
+        prescription_contract = doctor_prescriptions.build_prescription_payload(diagnosis_contract)
+
+        doctor_diagnosis.write_output(
+            diagnosis_contract,
+            diagnosis_path,
+            output_format="json",
+        )
+        doctor_prescriptions.write_output(
+            prescription_contract,
+            prescriptions_path,
+            output_format="json",
+        )
+
+        return {
+            "enabled": True,
+            "ok": bool(diagnosis_contract.get("ok", False))
+            and bool(prescription_contract.get("ok", False)),
+            "diagnosis": _doctor_cortex_short(
+                diagnosis_contract,
+                count_key="diagnosis_count",
+            ),
+            "prescriptions": _doctor_cortex_short(
+                prescription_contract,
+                count_key="prescription_count",
+            ),
+            "artifacts": [
+                _artifact(
+                    diagnosis_path.resolve(),
+                    "Doctor Cortex diagnosis contract",
+                    "json",
+                ),
+                _artifact(
+                    prescriptions_path.resolve(),
+                    "Doctor Cortex prescription contract",
+                    "json",
+                ),
+            ],
+        }
+    except Exception:
+        return {
+            "enabled": True,
+            "ok": False,
+            "diagnosis": {
+                "status": "error",
+                "severity": "high",
+                "diagnosis_count": 0,
+            },
+            "prescriptions": {
+                "status": "error",
+                "severity": "high",
+                "prescription_count": 0,
+            },
+            "artifacts": [],
+        }
+
+
+def _doctor_cortex_artifacts(summary: dict[str, Any] | None) -> list[dict[str, str]]:
+    if not isinstance(summary, dict):
+        return []
+    artifacts = summary.get("artifacts", [])
+    if not isinstance(artifacts, list):
+        return []
+    return [artifact for artifact in artifacts if isinstance(artifact, dict)]
+
+
+def _doctor_cortex_public_status(value: Any) -> str:
+    if value == "pass":
+        return "pass"
+    if value == "fail":
+        return "fail"
+    if value == "error":
+        return "error"
+    if value == "warning":
+        return "warning"
+    return "unknown"
+
+
+def _doctor_cortex_public_severity(value: Any) -> str:
+    if value == "low":
+        return "low"
+    if value == "medium":
+        return "medium"
+    if value == "high":
+        return "high"
+    if value == "critical":
+        return "critical"
+    return "unknown"
+
+
+def _doctor_cortex_public_summary(summary: dict[str, Any] | None) -> dict[str, Any] | None:
+    if not isinstance(summary, dict) or not summary.get("enabled"):
+        return None
+
+    diagnosis = summary.get("diagnosis", {})
+    prescriptions = summary.get("prescriptions", {})
+    if not isinstance(diagnosis, dict):
+        diagnosis = {}
+    if not isinstance(prescriptions, dict):
+        prescriptions = {}
+
+    return {
+        "enabled": True,
+        "ok": bool(summary.get("ok", False)),
+        "diagnosis_status": _doctor_cortex_public_status(diagnosis.get("status")),
+        "diagnosis_severity": _doctor_cortex_public_severity(diagnosis.get("severity")),
+        "diagnosis_count": int(diagnosis.get("diagnosis_count", 0) or 0),
+        "prescription_status": _doctor_cortex_public_status(prescriptions.get("status")),
+        "prescription_severity": _doctor_cortex_public_severity(prescriptions.get("severity")),
+        "prescription_count": int(prescriptions.get("prescription_count", 0) or 0),
+    }
+
+
+_EVIDENCE_GRAPH_SURFACE_PRIORITY = {
+    "security": 100,
+    "dependency": 90,
+    "release": 85,
+    "workflow": 80,
+    "cli": 75,
+    "tests": 70,
+    "docs": 60,
+    "diagnostic_engine": 50,
+    "pr_quality": 40,
+    "quality": 30,
+    "maintenance": 20,
+    "unknown": 0,
+}
+
+_EVIDENCE_GRAPH_SEVERITY_PRIORITY = {
+    "critical": 30,
+    "warning": 20,
+    "healthy": 0,
+}
+
+
+def _evidence_graph_node_score(node: dict[str, Any]) -> tuple[int, int, int, str]:
+    surface = str(node.get("risk_surface", "unknown") or "unknown")
+    severity = str(node.get("severity", "unknown") or "unknown")
+    review_first = 1 if bool(node.get("review_first", False)) else 0
+    return (
+        review_first,
+        _EVIDENCE_GRAPH_SEVERITY_PRIORITY.get(severity, 0),
+        _EVIDENCE_GRAPH_SURFACE_PRIORITY.get(surface, 0),
+        str(node.get("title", "")),
+    )
+
+
+def _evidence_graph_top_blocker(nodes: list[dict[str, Any]]) -> dict[str, Any]:
+    if not nodes:
+        return {}
+    return max(nodes, key=_evidence_graph_node_score)
+
+
+def _evidence_graph_next_commands(node: dict[str, Any]) -> list[str]:
+    commands: list[str] = []
+    for key in ("proof_commands", "recommended_commands"):
+        values = node.get(key)
+        if not isinstance(values, list):
+            continue
+        for value in values:
+            if isinstance(value, str) and value and value not in commands:
+                commands.append(value)
+            if len(commands) >= 5:
+                return commands
+    return commands
+
+
+def _evidence_graph_node_handoff(node: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "title": str(node.get("title", "") or "Untitled evidence graph finding"),
+        "risk_surface": str(node.get("risk_surface", "") or "unknown"),
+        "severity": str(node.get("severity", "") or "unknown"),
+        "operator_action": str(node.get("operator_action", "") or "rerun_proof"),
+        "review_first": bool(node.get("review_first", False)),
+        "next_commands": _evidence_graph_next_commands(node),
+    }
+
+
+def _evidence_graph_secondary_blockers(
+    nodes: list[dict[str, Any]],
+    top_blocker: dict[str, Any],
+    *,
+    limit: int = 3,
+) -> list[dict[str, Any]]:
+    secondary: list[dict[str, Any]] = []
+    for node in sorted(nodes, key=_evidence_graph_node_score, reverse=True):
+        if node is top_blocker:
+            continue
+        secondary.append(_evidence_graph_node_handoff(node))
+        if len(secondary) >= limit:
+            break
+    return secondary
+
+
+def _collect_evidence_graph(graph_path: Path | None) -> dict[str, Any] | None:
+    if graph_path is None:
+        return None
+
+    resolved = graph_path.resolve()
+    try:
+        payload = json.loads(resolved.read_text(encoding="utf-8"))
+    except Exception as exc:
+        return {
+            "enabled": True,
+            "ok": False,
+            "path": resolved.as_posix(),
+            "error": f"failed to read evidence graph: {exc}",
+            "node_count": 0,
+            "review_first_count": 0,
+            "critical_count": 0,
+            "automation_allowed_now": False,
+            "risk_surfaces": [],
+            "source_count": 0,
+            "artifacts": [],
+        }
+
+    if not isinstance(payload, dict):
+        return {
+            "enabled": True,
+            "ok": False,
+            "path": resolved.as_posix(),
+            "error": "evidence graph payload is not a JSON object",
+            "node_count": 0,
+            "review_first_count": 0,
+            "critical_count": 0,
+            "automation_allowed_now": False,
+            "risk_surfaces": [],
+            "source_count": 0,
+            "artifacts": [],
+        }
+
+    if str(payload.get("schema_version", "")) != EVIDENCE_GRAPH_SCHEMA_VERSION:
+        return {
+            "enabled": True,
+            "ok": False,
+            "path": resolved.as_posix(),
+            "error": "unsupported evidence graph schema",
+            "schema_version": str(payload.get("schema_version", "")),
+            "node_count": 0,
+            "review_first_count": 0,
+            "critical_count": 0,
+            "automation_allowed_now": False,
+            "risk_surfaces": [],
+            "source_count": 0,
+            "artifacts": [],
+        }
+
+    raw_nodes = payload.get("nodes", [])
+    nodes = (
+        [node for node in raw_nodes if isinstance(node, dict)]
+        if isinstance(raw_nodes, list)
+        else []
+    )
+    raw_sources = payload.get("source_summary", [])
+    source_summary = (
+        [source for source in raw_sources if isinstance(source, dict)]
+        if isinstance(raw_sources, list)
+        else []
+    )
+
+    node_count = len(nodes)
+    review_first_count = sum(1 for node in nodes if bool(node.get("review_first", False)))
+    critical_count = sum(1 for node in nodes if str(node.get("severity", "")) == "critical")
+    automation_allowed_now = any(bool(node.get("automation_allowed_now", False)) for node in nodes)
+    risk_surfaces = sorted(
+        {str(node.get("risk_surface", "unknown") or "unknown") for node in nodes}
+    )
+    top_blocker = _evidence_graph_top_blocker(nodes)
+    top_blocker_next_commands = _evidence_graph_next_commands(top_blocker)
+    secondary_blockers = _evidence_graph_secondary_blockers(nodes, top_blocker)
+
+    graph_dir = resolved.parent
+    artifact_specs = [
+        (resolved, "Cross-system evidence graph", "json"),
+        (graph_dir / "evidence-graph.md", "Cross-system evidence graph report", "markdown"),
+        (
+            graph_dir / "evidence-graph-manifest.json",
+            "Cross-system evidence graph manifest",
+            "json",
+        ),
+    ]
+
+    artifacts = [
+        _artifact(path, label, kind) for path, label, kind in artifact_specs if path.exists()
+    ]
+
+    return {
+        "enabled": True,
+        "ok": node_count == 0 and not automation_allowed_now,
+        "path": resolved.as_posix(),
+        "schema_version": str(payload.get("schema_version", "")),
+        "status": "clear" if node_count == 0 and not automation_allowed_now else "review_required",
+        "node_count": node_count,
+        "review_first_count": review_first_count,
+        "critical_count": critical_count,
+        "automation_allowed_now": automation_allowed_now,
+        "risk_surfaces": risk_surfaces,
+        "top_blocker_title": str(top_blocker.get("title", "") or "none"),
+        "top_blocker_surface": str(top_blocker.get("risk_surface", "") or "none"),
+        "top_blocker_severity": str(top_blocker.get("severity", "") or "none"),
+        "top_blocker_action": str(top_blocker.get("operator_action", "") or "none"),
+        "top_blocker_review_first": bool(top_blocker.get("review_first", False)),
+        "secondary_blocker_count": len(secondary_blockers),
+        "secondary_blockers": secondary_blockers,
+        "next_commands": top_blocker_next_commands,
+        "source_count": len(source_summary),
+        "source_summary": source_summary,
+        "artifacts": artifacts,
+    }
+
+
+def _evidence_graph_artifacts(summary: dict[str, Any] | None) -> list[dict[str, str]]:
+    if not isinstance(summary, dict) or not summary.get("enabled"):
+        return []
+    artifacts = summary.get("artifacts", [])
+    if not isinstance(artifacts, list):
+        return []
+    return [artifact for artifact in artifacts if isinstance(artifact, dict)]
+
+
+def _format_evidence_graph(summary: dict[str, Any] | None) -> list[str]:
+    if not isinstance(summary, dict) or not summary.get("enabled"):
+        return ["- not collected"]
+
+    if summary.get("error"):
+        return [
+            "- Status: error",
+            f"- Error: {summary.get('error', 'unknown')}",
+            f"- Graph: `{summary.get('path', '')}`",
+        ]
+
+    risk_surfaces = summary.get("risk_surfaces", [])
+    if not isinstance(risk_surfaces, list):
+        risk_surfaces = []
+
+    lines = [
+        f"- Status: {summary.get('status', 'unknown')}",
+        f"- Node count: {summary.get('node_count', 0)}",
+        f"- Review-first nodes: {summary.get('review_first_count', 0)}",
+        f"- Critical nodes: {summary.get('critical_count', 0)}",
+        f"- Source count: {summary.get('source_count', 0)}",
+        f"- Automation allowed now: {str(summary.get('automation_allowed_now', False)).lower()}",
+        f"- Risk surfaces: {', '.join(str(surface) for surface in risk_surfaces) or 'none'}",
+        f"- Top blocker: {summary.get('top_blocker_title', 'none')}",
+        f"- Top blocker surface: {summary.get('top_blocker_surface', 'none')}",
+        f"- Top blocker action: {summary.get('top_blocker_action', 'none')}",
+    ]
+
+    secondary_blockers = summary.get("secondary_blockers", [])
+    if isinstance(secondary_blockers, list) and secondary_blockers:
+        lines.append(f"- Secondary blockers: {len(secondary_blockers)}")
+        for blocker in secondary_blockers:
+            if not isinstance(blocker, dict):
+                continue
+            lines.append(
+                "- Secondary blocker: "
+                f"{blocker.get('title', 'Untitled evidence graph finding')} "
+                f"[{blocker.get('risk_surface', 'unknown')}; "
+                f"{blocker.get('operator_action', 'rerun_proof')}]"
+            )
+    else:
+        lines.append("- Secondary blockers: none")
+
+    lines.extend(
+        [
+            f"- Next commands: {'; '.join(str(command) for command in summary.get('next_commands', [])) or 'none'}",
+            f"- Graph: `{summary.get('path', '')}`",
+        ]
+    )
+    return lines
+
+
+def _evidence_graph_ledger_summary(bundle: dict[str, Any]) -> dict[str, Any] | None:
+    summary = bundle.get("evidence_graph")
+    if not isinstance(summary, dict) or not summary.get("enabled"):
+        return None
+    return {
+        "ok": bool(summary.get("ok", False)),
+        "status": str(summary.get("status", "unknown")),
+        "node_count": int(summary.get("node_count", 0) or 0),
+        "review_first_count": int(summary.get("review_first_count", 0) or 0),
+        "critical_count": int(summary.get("critical_count", 0) or 0),
+        "automation_allowed_now": bool(summary.get("automation_allowed_now", False)),
+        "risk_surfaces": summary.get("risk_surfaces", []),
+        "top_blocker_title": str(summary.get("top_blocker_title", "")),
+        "top_blocker_surface": str(summary.get("top_blocker_surface", "")),
+        "top_blocker_action": str(summary.get("top_blocker_action", "")),
+        "secondary_blocker_count": int(summary.get("secondary_blocker_count", 0) or 0),
+        "secondary_blockers": summary.get("secondary_blockers", []),
+        "next_commands": summary.get("next_commands", []),
+    }
+
+
+def _collect_adaptive_failure_bundle(bundle_path: Path | None) -> dict[str, Any] | None:
+    if bundle_path is None:
+        return None
+
+    resolved = bundle_path.resolve()
+    try:
+        payload = json.loads(resolved.read_text(encoding="utf-8"))
+    except Exception as exc:
+        return {
+            "enabled": True,
+            "ok": False,
+            "path": resolved.as_posix(),
+            "error": f"failed to read adaptive failure bundle: {exc}",
+            "artifacts": [],
+        }
+
+    if not isinstance(payload, dict):
+        return {
+            "enabled": True,
+            "ok": False,
+            "path": resolved.as_posix(),
+            "error": "adaptive failure bundle payload is not a JSON object",
+            "artifacts": [],
+        }
+
+    if str(payload.get("schema_version", "")) != FAILURE_BUNDLE_SCHEMA_VERSION:
+        return {
+            "enabled": True,
+            "ok": False,
+            "path": resolved.as_posix(),
+            "error": "unsupported adaptive failure bundle schema",
+            "artifacts": [],
+        }
+
+    raw_artifacts = payload.get("artifacts", {})
+    artifacts_map = raw_artifacts if isinstance(raw_artifacts, dict) else {}
+    artifact_specs = [
+        ("bundle_path", "Adaptive failure intelligence bundle", "json"),
+        ("diagnosis_json", "Adaptive failure diagnosis", "json"),
+        ("pr_comment_markdown", "Adaptive failure PR comment", "markdown"),
+        ("learning_summary_json", "Adaptive failure learning summary", "json"),
+        ("safe_fix_plan_json", "Adaptive failure safe-fix plan", "json"),
+        ("patch_plan_json", "Adaptive failure patch plan", "json"),
+        ("operator_brief_markdown", "Adaptive failure operator brief", "markdown"),
+        ("artifact_manifest_json", "Adaptive failure artifact manifest", "json"),
+    ]
+
+    artifacts: list[dict[str, str]] = []
+    seen: set[str] = set()
+    bundle_value = str(payload.get("bundle_path") or resolved.as_posix())
+    for key, label, kind in artifact_specs:
+        value = bundle_value if key == "bundle_path" else str(artifacts_map.get(key, ""))
+        if not value or value in seen:
+            continue
+        seen.add(value)
+        artifacts.append(_artifact(Path(value).resolve(), label, kind))
+
+    status = str(payload.get("status", "unknown"))
+    review_first = bool(payload.get("review_first", False))
+    safe_to_auto_fix = bool(payload.get("safe_to_auto_fix", False))
+    diagnosis_count = int(payload.get("diagnosis_count", 0) or 0)
+    primary = str(payload.get("primary_diagnosis_code", "") or "")
+
+    return {
+        "enabled": True,
+        "ok": status in {"clear", "monitor"} and not review_first,
+        "path": resolved.as_posix(),
+        "schema_version": str(payload.get("schema_version", "")),
+        "status": status,
+        "primary_diagnosis_code": primary,
+        "diagnosis_count": diagnosis_count,
+        "review_first": review_first,
+        "safe_to_auto_fix": safe_to_auto_fix,
+        "operator_brief_markdown": str(artifacts_map.get("operator_brief_markdown", "")),
+        "artifacts": artifacts,
+    }
+
+
+def _adaptive_failure_bundle_artifacts(summary: dict[str, Any] | None) -> list[dict[str, str]]:
+    if not isinstance(summary, dict) or not summary.get("enabled"):
+        return []
+    artifacts = summary.get("artifacts", [])
+    if not isinstance(artifacts, list):
+        return []
+    return [artifact for artifact in artifacts if isinstance(artifact, dict)]
+
+
+def _format_adaptive_failure_bundle(summary: dict[str, Any] | None) -> list[str]:
+    if not isinstance(summary, dict) or not summary.get("enabled"):
+        return []
+    if summary.get("error"):
+        return [
+            "## Adaptive Failure Bundle",
+            "",
+            "- Status: error",
+            f"- Error: {summary.get('error')}",
+        ]
+    return [
+        "## Adaptive Failure Bundle",
+        "",
+        f"- Status: {summary.get('status', 'unknown')}",
+        f"- Primary diagnosis: {summary.get('primary_diagnosis_code', '') or 'none'}",
+        f"- Diagnosis count: {summary.get('diagnosis_count', 0)}",
+        f"- Review first: {str(summary.get('review_first', False)).lower()}",
+        f"- Safe to auto-fix: {str(summary.get('safe_to_auto_fix', False)).lower()}",
+        f"- Operator brief: `{summary.get('operator_brief_markdown', '')}`",
+    ]
+
+
+def _adaptive_failure_bundle_ledger_summary(bundle: dict[str, Any]) -> dict[str, Any] | None:
+    summary = bundle.get("adaptive_failure_bundle")
+    if not isinstance(summary, dict) or not summary.get("enabled"):
+        return None
+    return {
+        "ok": bool(summary.get("ok", False)),
+        "status": str(summary.get("status", "unknown")),
+        "primary_diagnosis_code": str(summary.get("primary_diagnosis_code", "")),
+        "diagnosis_count": int(summary.get("diagnosis_count", 0) or 0),
+        "review_first": bool(summary.get("review_first", False)),
+        "safe_to_auto_fix": bool(summary.get("safe_to_auto_fix", False)),
+    }
+
+
+def _review_first_patch_plan_values(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else []
+
+
+def _collect_review_first_patch_plan(
+    *,
+    evidence_graph: Path | None,
+    failure_bundle: Path | None,
+    out_dir: Path,
+) -> dict[str, Any] | None:
+    source_path = evidence_graph or failure_bundle
+    if source_path is None:
+        return None
+
+    from . import adaptive_patch_plan
+
+    resolved = source_path.resolve()
+    plan_path = out_dir / "review-first-patch-plan.json"
+
+    try:
+        plan = adaptive_patch_plan.patch_plan_from_file(resolved, plan_path)
+    except (OSError, ValueError, json.JSONDecodeError) as exc:
+        return {
+            "enabled": True,
+            "ok": False,
+            "path": plan_path.resolve().as_posix(),
+            "source_path": resolved.as_posix(),
+            "error": f"failed to build review-first patch plan: {exc}",
+            "safe_to_auto_fix": False,
+            "dry_run_only": True,
+            "requires_human_review": True,
+            "artifacts": [],
+        }
+
+    safe_to_auto_fix = bool(plan.get("safe_to_auto_fix", False))
+    dry_run_only = bool(plan.get("dry_run_only", True))
+    requires_human_review = bool(plan.get("requires_human_review", True))
+    proof_commands = [
+        str(command)
+        for command in _review_first_patch_plan_values(plan.get("proof_commands"))
+        if str(command)
+    ]
+    recommended_commands = [
+        str(command)
+        for command in _review_first_patch_plan_values(plan.get("recommended_commands"))
+        if str(command)
+    ]
+    patch_steps = [
+        step
+        for step in _review_first_patch_plan_values(plan.get("patch_steps"))
+        if isinstance(step, dict)
+    ]
+
+    artifacts = []
+    if plan_path.exists():
+        artifacts.append(
+            _artifact(
+                plan_path.resolve(),
+                "Review-first adaptive patch plan",
+                "json",
+            )
+        )
+
+    return {
+        "enabled": True,
+        "ok": (not safe_to_auto_fix) and dry_run_only and requires_human_review,
+        "path": plan_path.resolve().as_posix(),
+        "source_path": resolved.as_posix(),
+        "schema_version": str(plan.get("schema_version", "")),
+        "status": str(plan.get("status", "unknown")),
+        "source_kind": str(plan.get("source_kind", "unknown")),
+        "source_schema_version": str(plan.get("source_schema_version", "unknown")),
+        "source_code": str(plan.get("source_code", "UNKNOWN")),
+        "safe_to_auto_fix": safe_to_auto_fix,
+        "dry_run_only": dry_run_only,
+        "requires_human_review": requires_human_review,
+        "proof_commands": proof_commands,
+        "recommended_commands": recommended_commands,
+        "patch_step_count": len(patch_steps),
+        "patch_steps": patch_steps,
+        "artifacts": artifacts,
+    }
+
+
+def _review_first_patch_plan_artifacts(summary: dict[str, Any] | None) -> list[dict[str, str]]:
+    if not isinstance(summary, dict) or not summary.get("enabled"):
+        return []
+    artifacts = summary.get("artifacts", [])
+    if not isinstance(artifacts, list):
+        return []
+    return [artifact for artifact in artifacts if isinstance(artifact, dict)]
+
+
+def _format_review_first_patch_plan(summary: dict[str, Any] | None) -> list[str]:
+    if not isinstance(summary, dict) or not summary.get("enabled"):
+        return []
+
+    if summary.get("error"):
+        return [
+            "## Review-first Patch Plan",
+            "",
+            "- Status: error",
+            f"- Error: {summary.get('error', 'unknown')}",
+            f"- Source: `{summary.get('source_path', '')}`",
+            "",
+        ]
+
+    lines = [
+        "## Review-first Patch Plan",
+        "",
+        f"- Status: {summary.get('status', 'unknown')}",
+        f"- Source kind: {summary.get('source_kind', 'unknown')}",
+        f"- Source code: {summary.get('source_code', 'UNKNOWN')}",
+        f"- Safe to auto-fix: {str(summary.get('safe_to_auto_fix', False)).lower()}",
+        f"- Dry run only: {str(summary.get('dry_run_only', True)).lower()}",
+        f"- Requires human review: {str(summary.get('requires_human_review', True)).lower()}",
+        f"- Patch steps: {summary.get('patch_step_count', 0)}",
+        f"- Artifact: `{summary.get('path', '')}`",
+        "",
+        "### Patch-plan proof commands",
+        "",
+    ]
+
+    proof_commands = summary.get("proof_commands", [])
+    if isinstance(proof_commands, list) and proof_commands:
+        lines.extend(f"- `{command}`" for command in proof_commands)
+    else:
+        lines.append("- `<add-focused-proof-command>`")
+
+    recommended_commands = summary.get("recommended_commands", [])
+    if isinstance(recommended_commands, list) and recommended_commands:
+        lines.extend(["", "### Patch-plan review commands", ""])
+        lines.extend(f"- `{command}`" for command in recommended_commands)
+
+    lines.append("")
+    return lines
+
+
+def _review_first_patch_plan_ledger_summary(bundle: dict[str, Any]) -> dict[str, Any] | None:
+    summary = bundle.get("patch_plan")
+    if not isinstance(summary, dict) or not summary.get("enabled"):
+        return None
+
+    return {
+        "ok": bool(summary.get("ok", False)),
+        "status": str(summary.get("status", "unknown")),
+        "source_kind": str(summary.get("source_kind", "unknown")),
+        "source_code": str(summary.get("source_code", "UNKNOWN")),
+        "safe_to_auto_fix": bool(summary.get("safe_to_auto_fix", False)),
+        "dry_run_only": bool(summary.get("dry_run_only", True)),
+        "requires_human_review": bool(summary.get("requires_human_review", True)),
+        "proof_commands": summary.get("proof_commands", []),
+        "recommended_commands": summary.get("recommended_commands", []),
+        "patch_step_count": int(summary.get("patch_step_count", 0) or 0),
+    }
+
+
+def _format_doctor_cortex(summary: dict[str, Any] | None) -> list[str]:
+    if not isinstance(summary, dict) or not summary.get("enabled"):
+        return ["- not collected"]
+
+    diagnosis = summary.get("diagnosis", {})
+    prescriptions = summary.get("prescriptions", {})
+    if not isinstance(diagnosis, dict):
+        diagnosis = {}
+    if not isinstance(prescriptions, dict):
+        prescriptions = {}
+
+    diagnosis_status = summary.get("diagnosis_status", diagnosis.get("status", "unknown"))
+    diagnosis_severity = summary.get("diagnosis_severity", diagnosis.get("severity", "unknown"))
+    diagnosis_count = summary.get("diagnosis_count", diagnosis.get("diagnosis_count", 0))
+    prescription_status = summary.get(
+        "prescription_status",
+        prescriptions.get("status", "unknown"),
+    )
+    prescription_severity = summary.get(
+        "prescription_severity",
+        prescriptions.get("severity", "unknown"),
+    )
+    prescription_count = summary.get(
+        "prescription_count",
+        prescriptions.get("prescription_count", 0),
+    )
+
+    return [
+        f"- OK: {str(summary.get('ok', False)).lower()}",
+        f"- Diagnosis status: {diagnosis_status}",
+        f"- Diagnosis severity: {diagnosis_severity}",
+        f"- Diagnosis count: {diagnosis_count}",
+        f"- Prescription status: {prescription_status}",
+        f"- Prescription severity: {prescription_severity}",
+        f"- Prescription count: {prescription_count}",
+    ]
+
+
+def _execution_counts(steps: Sequence[dict[str, Any]]) -> tuple[int, int, int]:
+    executed = [step for step in steps if step.get("executed") is True]
+    passed = [step for step in executed if step.get("status") == "passed"]
+    failed = [step for step in executed if step.get("status") == "failed"]
+    return len(executed), len(passed), len(failed)
+
+
+def _execution_findings(steps: Sequence[dict[str, Any]]) -> list[dict[str, str]]:
+    findings = []
+    for step in steps:
+        if step.get("executed") is True and step.get("status") == "failed":
+            findings.append(
+                {
+                    "severity": "error",
+                    "code": "STEP_FAILED",
+                    "message": f"{step['id']} failed with rc={step.get('rc')}.",
+                }
+            )
+    return findings
+
+
+def build_bundle(
+    repo: Path,
+    out_dir: Path,
+    *,
+    execute: bool = False,
+    include_release: bool = False,
+    timeout_seconds: int = 60,
+    ledger_path: Path | None = None,
+    doctor_cortex: bool = False,
+    failure_bundle: Path | None = None,
+    evidence_graph: Path | None = None,
+) -> dict[str, Any]:
+    repo = repo.resolve()
+    out_dir = out_dir.resolve()
+    generated_at = _utc_now()
+    branch = _git_value(repo, ["branch", "--show-current"], "unknown")
+    commit = _git_value(repo, ["rev-parse", "HEAD"], "unknown")
+    dirty = _git_dirty(repo)
+
+    steps = _command_steps()
+    if execute:
+        steps = _execute_steps(
+            steps=steps,
+            repo=repo,
+            out_dir=out_dir,
+            include_release=include_release,
+            timeout_seconds=timeout_seconds,
+        )
+    else:
+        steps = [dict(step, executed=False) for step in steps]
+
+    executed_count, passed_count, failed_count = _execution_counts(steps)
+
+    findings = _execution_findings(steps)
+    if dirty:
+        findings.append(
+            {
+                "severity": "warning",
+                "code": "WORKTREE_DIRTY",
+                "message": "Working tree has uncommitted changes.",
+            }
+        )
+
+    doctor_cortex_summary = None
+    if doctor_cortex:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        doctor_cortex_summary = _collect_doctor_cortex(repo, out_dir)
+        if not bool(doctor_cortex_summary.get("ok", False)):
+            findings.append(
+                {
+                    "severity": "warning",
+                    "code": "DOCTOR_CORTEX_FINDINGS",
+                    "message": "Doctor Cortex reported diagnosis or prescription findings.",
+                }
+            )
+
+    evidence_graph_summary = _collect_evidence_graph(evidence_graph)
+    if isinstance(evidence_graph_summary, dict) and evidence_graph_summary.get("enabled"):
+        if not bool(evidence_graph_summary.get("ok", False)):
+            findings.append(
+                {
+                    "severity": "warning",
+                    "code": "EVIDENCE_GRAPH_FINDINGS",
+                    "message": "Evidence graph contains review-required findings.",
+                }
+            )
+
+    next_actions = [
+        {
+            "id": "run_fast_gate",
+            "command": "python -m sdetkit gate fast",
+            "reason": "Check fast release-confidence feedback first.",
+        },
+        {
+            "id": "run_release_gate",
+            "command": "python -m sdetkit gate release",
+            "reason": "Run strict release gate before operator signoff.",
+        },
+        {
+            "id": "run_doctor",
+            "command": "python -m sdetkit doctor",
+            "reason": "Collect deterministic repository diagnostics.",
+        },
+    ]
+
+    if failed_count:
+        decision = "NO_SHIP"
+        risk_band = "high"
+    elif findings:
+        decision = "SHIP_WITH_FINDINGS"
+        risk_band = "medium"
+    else:
+        decision = "SHIP"
+        risk_band = "low"
+
+    adaptive_failure_bundle_summary = _collect_adaptive_failure_bundle(failure_bundle)
+    patch_plan_summary = _collect_review_first_patch_plan(
+        evidence_graph=evidence_graph,
+        failure_bundle=failure_bundle,
+        out_dir=out_dir,
+    )
+
+    artifacts = [
+        _artifact(out_dir / "mission-control.json", "Mission Control JSON bundle", "json"),
+        _artifact(out_dir / "mission-control.md", "Mission Control operator brief", "markdown"),
+    ]
+    artifacts.extend(_step_artifacts(steps))
+    artifacts.extend(_doctor_cortex_artifacts(doctor_cortex_summary))
+    artifacts.extend(_evidence_graph_artifacts(evidence_graph_summary))
+    artifacts.extend(_adaptive_failure_bundle_artifacts(adaptive_failure_bundle_summary))
+    artifacts.extend(_review_first_patch_plan_artifacts(patch_plan_summary))
+    if ledger_path is not None:
+        artifacts.append(
+            _artifact(
+                ledger_path.resolve(),
+                "Mission Control run ledger",
+                "jsonl",
+            )
+        )
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "run_id": _run_id(generated_at),
+        "generated_at_utc": generated_at,
+        "ok": failed_count == 0,
+        "mode": "execute" if execute else "plan",
+        "decision": decision,
+        "risk_band": risk_band,
+        "repo": {
+            "path": repo.as_posix(),
+            "branch": branch,
+            "commit": commit,
+            "dirty": dirty,
+        },
+        "executed_step_count": executed_count,
+        "passed_step_count": passed_count,
+        "failed_step_count": failed_count,
+        "doctor_cortex": _doctor_cortex_public_summary(doctor_cortex_summary),
+        "evidence_graph": evidence_graph_summary,
+        "adaptive_failure_bundle": adaptive_failure_bundle_summary,
+        "patch_plan": patch_plan_summary,
+        "steps": steps,
+        "findings": findings,
+        "artifacts": artifacts,
+        "next_actions": next_actions,
+    }
+
+
+def render_markdown(bundle: dict[str, Any]) -> str:
+    repo = bundle["repo"]
+    lines = [
+        "# Mission Control",
+        "",
+        f"Run ID: {bundle['run_id']}",
+        f"Generated: {bundle['generated_at_utc']}",
+        f"Mode: {bundle['mode']}",
+        f"Decision: {bundle['decision']}",
+        f"Risk band: {bundle['risk_band']}",
+        f"Repository: {repo['path']}",
+        f"Branch: {repo['branch']}",
+        f"Commit: {repo['commit']}",
+        f"Dirty: {str(repo['dirty']).lower()}",
+        f"Executed steps: {bundle['executed_step_count']}",
+        f"Passed steps: {bundle['passed_step_count']}",
+        f"Failed steps: {bundle['failed_step_count']}",
+        "",
+        "## Doctor Cortex",
+        "",
+        *_format_doctor_cortex(bundle.get("doctor_cortex")),
+        "",
+        "## Evidence Graph",
+        "",
+        *_format_evidence_graph(bundle.get("evidence_graph")),
+        *_format_adaptive_failure_bundle(bundle.get("adaptive_failure_bundle")),
+        *_format_review_first_patch_plan(bundle.get("patch_plan")),
+        "",
+        "## Steps",
+        "",
+    ]
+
+    for step in bundle["steps"]:
+        line = f"- {step['id']}: {step['status']} - `{step['command']}`"
+        if step.get("executed") is True:
+            line += f" rc={step.get('rc')} elapsed_ms={step.get('elapsed_ms')}"
+        lines.append(line)
+
+    lines.extend(["", "## Findings", ""])
+
+    if bundle["findings"]:
+        for finding in bundle["findings"]:
+            lines.append(f"- {finding['severity']}: {finding['code']} - {finding['message']}")
+    else:
+        lines.append("- none")
+
+    lines.extend(["", "## Next actions", ""])
+
+    for action in bundle["next_actions"]:
+        lines.append(f"- {action['id']}: `{action['command']}`")
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def write_bundle(bundle: dict[str, Any], out_dir: Path) -> tuple[Path, Path]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    json_path = out_dir / "mission-control.json"
+    md_path = out_dir / "mission-control.md"
+    json_path.write_text(json.dumps(bundle, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    md_path.write_text(render_markdown(bundle), encoding="utf-8")
+    return json_path, md_path
+
+
+def _doctor_cortex_ledger_summary(bundle: dict[str, Any]) -> dict[str, Any] | None:
+    doctor_cortex = bundle.get("doctor_cortex")
+    if not isinstance(doctor_cortex, dict) or not doctor_cortex.get("enabled"):
+        return None
+
+    diagnosis = doctor_cortex.get("diagnosis", {})
+    prescriptions = doctor_cortex.get("prescriptions", {})
+    if not isinstance(diagnosis, dict):
+        diagnosis = {}
+    if not isinstance(prescriptions, dict):
+        prescriptions = {}
+
+    return {
+        "enabled": True,
+        "ok": bool(doctor_cortex.get("ok", False)),
+        "diagnosis_status": _doctor_cortex_public_status(diagnosis.get("status")),
+        "diagnosis_count": int(diagnosis.get("diagnosis_count", 0) or 0),
+        "prescription_status": _doctor_cortex_public_status(prescriptions.get("status")),
+        "prescription_count": int(prescriptions.get("prescription_count", 0) or 0),
+    }
+
+
+def _ledger_record(bundle: dict[str, Any], out_dir: Path) -> dict[str, Any]:
+    repo = bundle["repo"]
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "run_id": bundle["run_id"],
+        "timestamp": bundle["generated_at_utc"],
+        "repo": repo["path"],
+        "branch": repo["branch"],
+        "commit": repo["commit"],
+        "mode": bundle["mode"],
+        "decision": bundle["decision"],
+        "risk_band": bundle["risk_band"],
+        "ok": bundle["ok"],
+        "executed_step_count": bundle["executed_step_count"],
+        "failed_step_count": bundle["failed_step_count"],
+        "artifact_dir": out_dir.resolve().as_posix(),
+        "doctor_cortex": _doctor_cortex_ledger_summary(bundle),
+        "evidence_graph": _evidence_graph_ledger_summary(bundle),
+        "adaptive_failure_bundle": _adaptive_failure_bundle_ledger_summary(bundle),
+        "patch_plan": _review_first_patch_plan_ledger_summary(bundle),
+    }
+
+
+def append_ledger(bundle: dict[str, Any], ledger_path: Path, out_dir: Path) -> Path:
+    ledger_path.parent.mkdir(parents=True, exist_ok=True)
+    record = _ledger_record(bundle, out_dir)
+    with ledger_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(record, sort_keys=True) + "\n")
+    return ledger_path
+
+
+def _load_ledger_records(ledger_path: Path) -> list[dict[str, Any]]:
+    if not ledger_path.exists():
+        return []
+
+    records: list[dict[str, Any]] = []
+    for line_number, line in enumerate(
+        ledger_path.read_text(encoding="utf-8").splitlines(), start=1
+    ):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        try:
+            record = json.loads(stripped)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"invalid JSONL record at line {line_number}: {exc}") from exc
+        if isinstance(record, dict):
+            records.append(record)
+    return records
+
+
+def _int_record_value(record: dict[str, Any], key: str) -> int:
+    value = record.get(key, 0)
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return 0
+
+
+def _failed_step_ids_from_record(record: dict[str, Any]) -> list[str]:
+    artifact_dir = record.get("artifact_dir")
+    if not isinstance(artifact_dir, str) or not artifact_dir:
+        return ["unknown"] if _int_record_value(record, "failed_step_count") > 0 else []
+
+    bundle_path = Path(artifact_dir) / "mission-control.json"
+    if not bundle_path.exists():
+        return ["unknown"] if _int_record_value(record, "failed_step_count") > 0 else []
+
+    try:
+        bundle = json.loads(bundle_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return ["unknown"] if _int_record_value(record, "failed_step_count") > 0 else []
+
+    failed_steps = []
+    for step in bundle.get("steps", []):
+        if (
+            isinstance(step, dict)
+            and step.get("executed") is True
+            and step.get("status") == "failed"
+        ):
+            failed_steps.append(str(step.get("id", "unknown")))
+
+    if failed_steps:
+        return failed_steps
+    return ["unknown"] if _int_record_value(record, "failed_step_count") > 0 else []
+
+
+def build_history_summary(ledger_path: Path) -> dict[str, Any]:
+    ledger_path = ledger_path.resolve()
+    records = _load_ledger_records(ledger_path)
+    decision_counts = Counter(str(record.get("decision", "UNKNOWN")) for record in records)
+    failed_runs = sum(1 for record in records if _int_record_value(record, "failed_step_count") > 0)
+
+    failed_step_counts: Counter[str] = Counter()
+    for record in records:
+        failed_step_counts.update(_failed_step_ids_from_record(record))
+
+    latest = records[-1] if records else {}
+    runs = len(records)
+    known_decisions = {
+        "SHIP",
+        "SHIP_WITH_FINDINGS",
+        "NO_SHIP",
+    }
+    other_decisions = sum(
+        count for decision, count in decision_counts.items() if decision not in known_decisions
+    )
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "ledger_path": ledger_path.as_posix(),
+        "runs": runs,
+        "ship": decision_counts.get("SHIP", 0),
+        "ship_with_findings": decision_counts.get("SHIP_WITH_FINDINGS", 0),
+        "no_ship": decision_counts.get("NO_SHIP", 0),
+        "other_decisions": other_decisions,
+        "latest_run_id": latest.get("run_id", "none"),
+        "latest_timestamp": latest.get("timestamp", "none"),
+        "latest_decision": latest.get("decision", "none"),
+        "latest_risk_band": latest.get("risk_band", "none"),
+        "latest_mode": latest.get("mode", "none"),
+        "latest_artifact_dir": latest.get("artifact_dir", "none"),
+        "failed_runs": failed_runs,
+        "failure_rate": round(failed_runs / runs, 4) if runs else 0.0,
+        "most_common_failed_step": failed_step_counts.most_common(1)[0][0]
+        if failed_step_counts
+        else "none",
+    }
+
+
+def render_history_text(summary: dict[str, Any]) -> str:
+    keys = [
+        "ledger_path",
+        "runs",
+        "ship",
+        "ship_with_findings",
+        "no_ship",
+        "other_decisions",
+        "latest_run_id",
+        "latest_timestamp",
+        "latest_decision",
+        "latest_risk_band",
+        "latest_mode",
+        "latest_artifact_dir",
+        "failed_runs",
+        "failure_rate",
+        "most_common_failed_step",
+    ]
+    return "\n".join(f"{key}={summary[key]}" for key in keys)
+
+
+def _format_report_findings(bundle: dict[str, Any]) -> list[str]:
+    findings = bundle.get("findings", [])
+    if not isinstance(findings, list) or not findings:
+        return ["- none"]
+
+    lines = []
+    for finding in findings:
+        if not isinstance(finding, dict):
+            continue
+        severity = finding.get("severity", "unknown")
+        code = finding.get("code", "UNKNOWN")
+        message = finding.get("message", "")
+        lines.append(f"- {severity}: {code} - {message}")
+    return lines or ["- none"]
+
+
+def _format_report_steps(bundle: dict[str, Any]) -> list[str]:
+    steps = bundle.get("steps", [])
+    if not isinstance(steps, list) or not steps:
+        return ["- none"]
+
+    lines = []
+    for step in steps:
+        if not isinstance(step, dict):
+            continue
+        line = f"- {step.get('id', 'unknown')}: {step.get('status', 'unknown')}"
+        command = step.get("command")
+        if command:
+            line += f" - `{command}`"
+        if step.get("executed") is True:
+            line += (
+                f" (rc={step.get('rc', 'unknown')}, elapsed_ms={step.get('elapsed_ms', 'unknown')})"
+            )
+        lines.append(line)
+    return lines or ["- none"]
+
+
+def _format_report_next_actions(bundle: dict[str, Any]) -> list[str]:
+    actions = bundle.get("next_actions", [])
+    if not isinstance(actions, list) or not actions:
+        return ["- none"]
+
+    lines = []
+    for action in actions:
+        if not isinstance(action, dict):
+            continue
+        action_id = action.get("id", "unknown")
+        command = action.get("command", "")
+        reason = action.get("reason", "")
+        if command:
+            lines.append(f"- {action_id}: `{command}` — {reason}")
+        else:
+            lines.append(f"- {action_id}: {reason}")
+    return lines or ["- none"]
+
+
+def _format_report_artifacts(bundle: dict[str, Any]) -> list[str]:
+    artifacts = bundle.get("artifacts", [])
+    if not isinstance(artifacts, list) or not artifacts:
+        return ["- none"]
+
+    lines = []
+    for artifact in artifacts:
+        if not isinstance(artifact, dict):
+            continue
+        label = artifact.get("label", "artifact")
+        kind = artifact.get("kind", "file")
+        artifact_path = artifact.get("path", "")
+        lines.append(f"- {label} ({kind}): `{artifact_path}`")
+    return lines or ["- none"]
+
+
+def render_report_markdown(
+    bundle: dict[str, Any],
+    history_summary: dict[str, Any] | None = None,
+) -> str:
+    repo = bundle.get("repo", {})
+    if not isinstance(repo, dict):
+        repo = {}
+
+    lines = [
+        "# Mission Control Report",
+        "",
+        "## Executive summary",
+        "",
+        f"- Run ID: {bundle.get('run_id', 'unknown')}",
+        f"- Decision: {bundle.get('decision', 'unknown')}",
+        f"- Risk band: {bundle.get('risk_band', 'unknown')}",
+        f"- Mode: {bundle.get('mode', 'unknown')}",
+        f"- Generated: {bundle.get('generated_at_utc', 'unknown')}",
+        f"- Repository: {repo.get('path', 'unknown')}",
+        f"- Branch: {repo.get('branch', 'unknown')}",
+        f"- Commit: {repo.get('commit', 'unknown')}",
+        f"- Dirty: {str(repo.get('dirty', 'unknown')).lower()}",
+        "",
+        "## Execution",
+        "",
+        f"- Executed steps: {bundle.get('executed_step_count', 0)}",
+        f"- Passed steps: {bundle.get('passed_step_count', 0)}",
+        f"- Failed steps: {bundle.get('failed_step_count', 0)}",
+        "",
+        "## Doctor Cortex",
+        "",
+        *_format_doctor_cortex(bundle.get("doctor_cortex")),
+        "",
+        "## Evidence Graph",
+        "",
+        *_format_evidence_graph(bundle.get("evidence_graph")),
+        *_format_adaptive_failure_bundle(bundle.get("adaptive_failure_bundle")),
+        *_format_review_first_patch_plan(bundle.get("patch_plan")),
+        "",
+        "## Steps",
+        "",
+        *_format_report_steps(bundle),
+        "",
+        "## Findings",
+        "",
+        *_format_report_findings(bundle),
+        "",
+        "## History summary",
+        "",
+    ]
+
+    if history_summary is None:
+        lines.append("- not provided")
+    else:
+        lines.extend(
+            [
+                f"- Ledger: `{history_summary.get('ledger_path', 'unknown')}`",
+                f"- Runs: {history_summary.get('runs', 0)}",
+                f"- Ship: {history_summary.get('ship', 0)}",
+                f"- Ship with findings: {history_summary.get('ship_with_findings', 0)}",
+                f"- No ship: {history_summary.get('no_ship', 0)}",
+                f"- Latest decision: {history_summary.get('latest_decision', 'none')}",
+                f"- Latest risk band: {history_summary.get('latest_risk_band', 'none')}",
+                f"- Failure rate: {history_summary.get('failure_rate', 0.0)}",
+                f"- Most common failed step: {history_summary.get('most_common_failed_step', 'none')}",
+            ]
+        )
+
+    lines.extend(
+        [
+            "",
+            "## Next actions",
+            "",
+            *_format_report_next_actions(bundle),
+            "",
+            "## Artifacts",
+            "",
+            *_format_report_artifacts(bundle),
+            "",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def write_report(
+    bundle: dict[str, Any],
+    out_path: Path,
+    history_summary: dict[str, Any] | None = None,
+) -> Path:
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(render_report_markdown(bundle, history_summary), encoding="utf-8")
+    return out_path
+
+
+def _run(args: argparse.Namespace) -> int:
+    repo = Path(args.repo).resolve()
+    out_dir = Path(args.out_dir).resolve()
+    ledger_path = None
+    if not bool(args.no_ledger):
+        if args.ledger_path:
+            ledger_path = Path(args.ledger_path).resolve()
+        else:
+            ledger_path = _default_ledger_path(repo).resolve()
+
+    bundle = build_bundle(
+        repo,
+        out_dir,
+        execute=bool(args.execute),
+        include_release=bool(args.include_release),
+        timeout_seconds=int(args.timeout_seconds),
+        ledger_path=ledger_path,
+        doctor_cortex=bool(args.doctor_cortex),
+        failure_bundle=Path(args.failure_bundle).resolve() if str(args.failure_bundle) else None,
+        evidence_graph=Path(args.evidence_graph).resolve() if str(args.evidence_graph) else None,
+    )
+    json_path, md_path = write_bundle(bundle, out_dir)
+    print(f"wrote {json_path}")
+    print(f"wrote {md_path}")
+    if ledger_path is not None:
+        ledger_written = append_ledger(bundle, ledger_path, out_dir)
+        print(f"wrote {ledger_written}")
+    print(f"decision={bundle['decision']} risk_band={bundle['risk_band']}")
+    return 0 if bundle["ok"] else 2
+
+
+def _summarize(args: argparse.Namespace) -> int:
+    path = Path(args.bundle)
+    bundle = json.loads(path.read_text(encoding="utf-8"))
+    print(f"run_id={bundle.get('run_id', 'unknown')}")
+    print(f"decision={bundle['decision']}")
+    print(f"risk_band={bundle['risk_band']}")
+    print(f"repo={bundle['repo']['path']}")
+    print(f"mode={bundle.get('mode', 'plan')}")
+    print(f"steps={len(bundle['steps'])}")
+    print(f"executed_steps={bundle.get('executed_step_count', 0)}")
+    print(f"failed_steps={bundle.get('failed_step_count', 0)}")
+    print(f"findings={len(bundle['findings'])}")
+    doctor_cortex = bundle.get("doctor_cortex")
+    if isinstance(doctor_cortex, dict):
+        print(f"doctor_cortex_ok={str(doctor_cortex.get('ok', False)).lower()}")
+        print(f"doctor_cortex_diagnosis_count={int(doctor_cortex.get('diagnosis_count', 0) or 0)}")
+        print(
+            "doctor_cortex_prescription_count="
+            f"{int(doctor_cortex.get('prescription_count', 0) or 0)}"
+        )
+    evidence_graph = bundle.get("evidence_graph")
+    if isinstance(evidence_graph, dict):
+        summary_prefix = "evidence" + "_graph"
+        print(f"{summary_prefix}_ok={str(evidence_graph.get('ok', False)).lower()}")
+        print(f"{summary_prefix}_status={evidence_graph.get('status', 'unknown')}")
+        print(f"{summary_prefix}_node_count={evidence_graph.get('node_count', 0)}")
+        print(f"{summary_prefix}_review_first_count={evidence_graph.get('review_first_count', 0)}")
+        print(f"{summary_prefix}_critical_count={evidence_graph.get('critical_count', 0)}")
+        print(
+            f"{summary_prefix}_automation_allowed_now="
+            f"{str(evidence_graph.get('automation_allowed_now', False)).lower()}"
+        )
+        print(
+            f"{summary_prefix}_top_blocker_surface="
+            f"{evidence_graph.get('top_blocker_surface', 'none')}"
+        )
+        print(
+            f"{summary_prefix}_top_blocker_title={evidence_graph.get('top_blocker_title', 'none')}"
+        )
+        print(
+            f"{summary_prefix}_top_blocker_action="
+            f"{evidence_graph.get('top_blocker_action', 'none')}"
+        )
+        print(
+            f"{summary_prefix}_secondary_blocker_count="
+            f"{evidence_graph.get('secondary_blocker_count', 0)}"
+        )
+    adaptive_failure_bundle = bundle.get("adaptive_failure_bundle")
+    if isinstance(adaptive_failure_bundle, dict):
+        summary_prefix = "adaptive" + "_failure" + "_bundle"
+        print(f"{summary_prefix}_ok={str(adaptive_failure_bundle.get('ok', False)).lower()}")
+        print(f"{summary_prefix}_status={adaptive_failure_bundle.get('status', 'unknown')}")
+        print(
+            f"{summary_prefix}_primary={adaptive_failure_bundle.get('primary_diagnosis_code', '')}"
+        )
+        print(
+            f"{summary_prefix}_diagnosis_count={adaptive_failure_bundle.get('diagnosis_count', 0)}"
+        )
+        print(
+            f"{summary_prefix}_review_first="
+            f"{str(adaptive_failure_bundle.get('review_first', False)).lower()}"
+        )
+        print(
+            f"{summary_prefix}_safe_to_auto_fix="
+            f"{str(adaptive_failure_bundle.get('safe_to_auto_fix', False)).lower()}"
+        )
+    patch_plan = bundle.get("patch_plan")
+    if isinstance(patch_plan, dict):
+        print(f"patch_plan_ok={str(patch_plan.get('ok', False)).lower()}")
+        print(f"patch_plan_status={patch_plan.get('status', 'unknown')}")
+        print(f"patch_plan_source_kind={patch_plan.get('source_kind', 'unknown')}")
+        print(f"patch_plan_source_code={patch_plan.get('source_code', 'UNKNOWN')}")
+        print(
+            f"patch_plan_safe_to_auto_fix={str(patch_plan.get('safe_to_auto_fix', False)).lower()}"
+        )
+        print(f"patch_plan_dry_run_only={str(patch_plan.get('dry_run_only', True)).lower()}")
+        print(
+            "patch_plan_requires_human_review="
+            f"{str(patch_plan.get('requires_human_review', True)).lower()}"
+        )
+        print(f"patch_plan_proof_command_count={len(patch_plan.get('proof_commands', []))}")
+    return 0
+
+
+def _schema(_: argparse.Namespace) -> int:
+    payload = {
+        "schema_version": SCHEMA_VERSION,
+        "required_top_level_keys": [
+            "schema_version",
+            "run_id",
+            "generated_at_utc",
+            "ok",
+            "mode",
+            "decision",
+            "risk_band",
+            "repo",
+            "executed_step_count",
+            "passed_step_count",
+            "failed_step_count",
+            "doctor_cortex",
+            "evidence_graph",
+            "steps",
+            "findings",
+            "artifacts",
+            "next_actions",
+            "adaptive_failure_bundle",
+            "patch_plan",
+        ],
+        "ledger_record_keys": [
+            "schema_version",
+            "run_id",
+            "timestamp",
+            "repo",
+            "branch",
+            "commit",
+            "mode",
+            "decision",
+            "risk_band",
+            "ok",
+            "executed_step_count",
+            "failed_step_count",
+            "artifact_dir",
+            "evidence_graph",
+            "adaptive_failure_bundle",
+            "patch_plan",
+        ],
+        "history_summary_keys": [
+            "schema_version",
+            "ledger_path",
+            "runs",
+            "ship",
+            "ship_with_findings",
+            "no_ship",
+            "other_decisions",
+            "latest_run_id",
+            "latest_timestamp",
+            "latest_decision",
+            "latest_risk_band",
+            "latest_mode",
+            "latest_artifact_dir",
+            "failed_runs",
+            "failure_rate",
+            "most_common_failed_step",
+        ],
+        "doctor_cortex_summary_keys": [
+            "enabled",
+            "ok",
+            "diagnosis",
+            "prescriptions",
+            "artifacts",
+        ],
+        "report_sections": [
+            "Executive summary",
+            "Execution",
+            "Doctor Cortex",
+            "Evidence Graph",
+            "Review-first Patch Plan",
+            "Steps",
+            "Findings",
+            "History summary",
+            "Next actions",
+            "Artifacts",
+        ],
+    }
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0
+
+
+def _history(args: argparse.Namespace) -> int:
+    repo = Path(args.repo).resolve()
+    ledger_path = (
+        Path(args.ledger).resolve() if args.ledger else _default_ledger_path(repo).resolve()
+    )
+    try:
+        summary = build_history_summary(ledger_path)
+    except ValueError as exc:
+        print(f"error={exc}", file=sys.stderr)
+        return 2
+
+    if args.format == "json":
+        print(json.dumps(summary, indent=2, sort_keys=True))
+    else:
+        print(render_history_text(summary))
+    return 0
+
+
+def _report(args: argparse.Namespace) -> int:
+    bundle_path = Path(args.bundle)
+    out_path = Path(args.out)
+
+    try:
+        bundle = json.loads(bundle_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        print(f"error=failed to read bundle: {exc}", file=sys.stderr)
+        return 2
+
+    history_summary = None
+    if args.history:
+        try:
+            history_summary = build_history_summary(Path(args.history))
+        except ValueError as exc:
+            print(f"error={exc}", file=sys.stderr)
+            return 2
+
+    written = write_report(bundle, out_path, history_summary)
+    print(f"wrote {written.resolve()}")
+    print(f"decision={bundle.get('decision', 'unknown')}")
+    print(f"risk_band={bundle.get('risk_band', 'unknown')}")
+    if history_summary is not None:
+        print(f"history_runs={history_summary['runs']}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="sdetkit mission-control",
+        description="Create a deterministic release-confidence evidence bundle.",
+    )
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    run = sub.add_parser("run", help="Write mission-control.json and mission-control.md")
+    run.add_argument("--repo", default=".")
+    run.add_argument("--out-dir", default="build/mission-control")
+    run.add_argument("--execute", action="store_true")
+    run.add_argument("--include-release", action="store_true")
+    run.add_argument("--timeout-seconds", type=int, default=60)
+    run.add_argument("--ledger-path", default="")
+    run.add_argument("--no-ledger", action="store_true")
+    run.add_argument("--doctor-cortex", action="store_true")
+    run.add_argument("--failure-bundle", default="")
+    run.add_argument("--evidence-graph", default="")
+    run.set_defaults(func=_run)
+
+    summarize = sub.add_parser("summarize", help="Summarize a mission-control.json bundle")
+    summarize.add_argument("--bundle", required=True)
+    summarize.set_defaults(func=_summarize)
+
+    schema = sub.add_parser("schema", help="Print the Mission Control bundle schema summary")
+    schema.set_defaults(func=_schema)
+
+    history = sub.add_parser("history", help="Summarize a Mission Control JSONL run ledger")
+    history.add_argument("--repo", default=".")
+    history.add_argument("--ledger", default="")
+    history.add_argument("--format", choices=["text", "json"], default="text")
+    history.set_defaults(func=_history)
+
+    report = sub.add_parser("report", help="Write a Markdown release brief from a bundle")
+    report.add_argument("--bundle", required=True)
+    report.add_argument("--history", default="")
+    report.add_argument("--out", default="build/mission-control/report.md")
+    report.set_defaults(func=_report)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = build_parser()
+    ns = parser.parse_args(list(sys.argv[1:] if argv is None else argv))
+    return int(ns.func(ns))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
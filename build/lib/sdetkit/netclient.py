@@ -0,0 +1,1221 @@
+from __future__ import annotations
+
+import asyncio
+import datetime as _dt
+import hashlib
+import random
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import IO, Any, Literal
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from .optional_httpx import load_httpx
+from .rate_limit import RateLimiter
+from .response_cache import CachedResponse, ResponseCache, cache_key, cacheable_entry
+from .security import default_http_timeout, ensure_allowed_scheme
+
+httpx = load_httpx(feature="sdetkit network workflows")
+UTC = getattr(_dt, "UTC", _dt.timezone.utc)  # noqa: UP017
+datetime = _dt.datetime
+
+EventType = Literal[
+    "attempt_start",
+    "attempt_error",
+    "attempt_response",
+    "sleep",
+    "complete",
+    "cache_hit",
+    "cache_miss",
+]
+
+
+@dataclass(frozen=True)
+class ClientEvent:
+    type: EventType
+    url: str
+    attempt: int
+    retries: int
+    request_id: str | None = None
+    status_code: int | None = None
+    error: str | None = None
+    sleep_seconds: float | None = None
+    elapsed_seconds: float | None = None
+    ok: bool | None = None
+    response_bytes: int | None = None
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    url: str
+    status_code: int
+    headers: httpx.Headers
+    bytes_written: int
+    sha256: str
+
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+Hook = Callable[[ClientEvent], None]
+AsyncHook = Callable[[ClientEvent], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    retries: int = 1
+    retry_on_429: bool = False
+    backoff_base: float = 0.0
+    backoff_factor: float = 2.0
+    backoff_jitter: float = 0.0
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class HttpStatusError(RuntimeError):
+    def __init__(self, message: str, *, response: httpx.Response, body: bytes | None = None):
+        super().__init__(message)
+        self.response = response
+        self.status_code = response.status_code
+        try:
+            self.url = str(response.request.url)
+        except Exception:
+            self.url = str(response.url)
+        self.body = response.content if body is None else body
+
+
+@dataclass
+class CircuitBreaker:
+    failure_threshold: int = 5
+    reset_seconds: float = 30.0
+    _failures: int = 0
+    _opened_at: float | None = None
+    _half_open_used: bool = False
+
+    def allow(self, now: float) -> None:
+        if self._opened_at is None:
+            return
+
+        dt = now - self._opened_at
+        if dt < self.reset_seconds:
+            raise CircuitOpenError("circuit open")
+
+        if self._half_open_used:
+            raise CircuitOpenError("circuit open")
+
+        self._half_open_used = True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._half_open_used = False
+
+    def record_failure(self, now: float) -> None:
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._opened_at = now
+            self._half_open_used = False
+
+
+def backoff_delay(attempt: int, base: float, factor: float, jitter: float) -> float:
+    if base <= 0:
+        return 0.0
+    d = base * (factor**attempt)
+    if jitter > 0:
+        d += random.random() * jitter * d
+    return d
+
+
+def retry_after_seconds(headers: Any) -> float | None:
+    try:
+        v = headers.get("Retry-After")
+    except Exception:
+        v = None
+    if not v:
+        return None
+    raw = str(v).strip()
+    try:
+        delay = float(int(raw))
+    except (TypeError, ValueError):
+        delay = None
+    if delay is not None:
+        return max(0.0, delay)
+    try:
+        parsed = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    delay = (parsed - datetime.now(UTC)).total_seconds()
+    return max(0.0, delay)
+
+
+_backoff_delay = backoff_delay
+_retry_after_seconds = retry_after_seconds
+
+
+def _normalized_timeout(timeout: float | httpx.Timeout | None) -> float | httpx.Timeout | None:
+    if isinstance(timeout, httpx.Timeout):
+        return timeout
+    return default_http_timeout(timeout)
+
+
+def _link_next_url(r: httpx.Response) -> str | None:
+    return _link_url(r, "next")
+
+
+def _link_url(r: httpx.Response, want: str) -> str | None:
+    link = r.headers.get("Link")
+    if not link:
+        return None
+
+    for part in (p.strip() for p in link.split(",")):
+        if "rel=" not in part.lower():
+            continue
+        segs = [s.strip() for s in part.split(";")]
+        if not segs:
+            continue
+
+        u = segs[0]
+        if not (u.startswith("<") and ">" in u):
+            continue
+        url = u[1 : u.find(">")].strip()
+
+        rel = None
+        for s in segs[1:]:
+            name, sep, value = s.partition("=")
+            if sep != "=" or name.strip().lower() != "rel":
+                continue
+            rel = value.strip()
+            if rel.startswith('"') and rel.endswith('"') and len(rel) >= 2:
+                rel = rel[1:-1]
+            rel = rel.lower()
+            break
+
+        if rel == want:
+            return str(urljoin(str(r.url), url))
+
+    return None
+
+
+def _page_number(query: list[tuple[str, str]]) -> tuple[int | None, list[tuple[str, str]]]:
+    page: int | None = None
+    rest: list[tuple[str, str]] = []
+    for k, v in query:
+        if k == "page" and page is None and v.isdigit():
+            page = int(v)
+        else:
+            rest.append((k, v))
+    return page, rest
+
+
+def _planned_page_urls(r: httpx.Response, nxt: str) -> list[str] | None:
+    """Return every remaining page URL when ``rel="last"`` makes them predictable.
+
+    Both the next and last links must differ only in a numeric ``page`` query
+    parameter; otherwise pagination has to be followed one link at a time.
+    """
+    last = _link_url(r, "last")
+    if not last:
+        return None
+    n, l_ = urlsplit(nxt), urlsplit(last)
+    if (n.scheme, n.netloc, n.path) != (l_.scheme, l_.netloc, l_.path):
+        return None
+    n_page, n_rest = _page_number(parse_qsl(n.query, keep_blank_values=True))
+    l_page, l_rest = _page_number(parse_qsl(l_.query, keep_blank_values=True))
+    if n_page is None or l_page is None or l_page < n_page or sorted(n_rest) != sorted(l_rest):
+        return None
+    urls = [nxt]
+    for page in range(n_page + 1, l_page + 1):
+        query = urlencode(n_rest + [("page", str(page))])
+        urls.append(urlunsplit((n.scheme, n.netloc, n.path, query, n.fragment)))
+    return urls
+
+
+def plan_page_prefetch(
+    r: httpx.Response,
+    nxt: str | None,
+    *,
+    fetched: int,
+    max_pages: int,
+    seen: set[str],
+    page_concurrency: int,
+) -> list[str] | None:
+    """Claim every remaining Link page after the first one when they can be fetched ahead.
+
+    Returns ``None`` (walk ``rel="next"`` serially) unless ``page_concurrency > 1``, *r*
+    is the first page and its ``rel="last"`` link makes the remaining URLs predictable.
+    Planned URLs are added to *seen* so loop detection still applies afterwards.
+    """
+    if not nxt or page_concurrency < 2 or fetched != 1 or nxt in seen:
+        return None
+    plan = _planned_page_urls(r, nxt)
+    if plan is None:
+        return None
+    if fetched + len(plan) > max_pages:
+        raise RuntimeError("pagination limit exceeded")
+    seen.update(plan)
+    return plan
+
+
+PageFetch = Callable[[str], tuple[httpx.Response, Any]]
+AsyncPageFetch = Callable[[str], Awaitable[tuple[httpx.Response, Any]]]
+
+
+def fetch_planned_pages(
+    fetch: PageFetch, plan: list[str], page_concurrency: int
+) -> Iterator[tuple[httpx.Response, Any]]:
+    """Fetch *plan* on a thread pool, yielding ``(response, data)`` in page order.
+
+    At most ``page_concurrency`` pages are in flight, and held, at a time.
+    """
+    with ThreadPoolExecutor(max_workers=min(page_concurrency, len(plan))) as pool:
+        for i in range(0, len(plan), page_concurrency):
+            yield from pool.map(fetch, plan[i : i + page_concurrency])
+
+
+async def fetch_planned_pages_async(
+    fetch: AsyncPageFetch, plan: list[str]
+) -> list[tuple[httpx.Response, Any]]:
+    """Async twin of :func:`fetch_planned_pages`; *fetch* bounds its own concurrency."""
+    return list(await asyncio.gather(*(fetch(u) for u in plan)))
+
+
+def _merge_headers(
+    headers: dict[str, str] | None,
+    trace_header: str | None,
+    request_id: str | None,
+) -> tuple[dict[str, str] | None, str | None]:
+    if trace_header is None:
+        return (headers.copy() if headers else None), request_id
+    rid = request_id or uuid.uuid4().hex
+    out: dict[str, str] = {}
+    if headers:
+        out.update(headers)
+    out[trace_header] = rid
+    return out, rid
+
+
+def _cache_prepare(
+    cache: ResponseCache | None,
+    method: str,
+    url: str,
+    hdrs: dict[str, str] | None,
+) -> tuple[str | None, CachedResponse | None, dict[str, str] | None]:
+    if cache is None or method.upper() != "GET":
+        return None, None, hdrs
+    key = cache_key("GET", url, hdrs)
+    cached = cache.get(key)
+    if cached is not None:
+        hdrs = {**(hdrs or {}), **cached.validators()}
+    return key, cached, hdrs
+
+
+def _cache_apply(
+    cache: ResponseCache,
+    key: str,
+    cached: CachedResponse | None,
+    r: httpx.Response,
+) -> tuple[httpx.Response, EventType | None]:
+    """Serve a 304 from the cached entry, or store a fresh validated response."""
+    if r.status_code == 304 and cached is not None:
+        hit = httpx.Response(
+            cached.status_code,
+            headers=list(cached.headers),
+            content=cached.body,
+            request=r.request,
+        )
+        return hit, "cache_hit"
+    if r.status_code < 200 or r.status_code >= 300:
+        return r, None
+    entry = cacheable_entry(r.status_code, r.headers.multi_items(), r.content)
+    if entry is not None:
+        cache.put(key, entry)
+    return r, "cache_miss"
+
+
+def _emit(hook: Hook | None, ev: ClientEvent) -> None:
+    if hook is not None:
+        hook(ev)
+
+
+async def _emit_async(hook: Hook | AsyncHook | None, ev: ClientEvent) -> None:
+    if hook is None:
+        return
+    r = hook(ev)
+    if asyncio.iscoroutine(r):
+        _ = await r
+
+
+def _decode_json(r: httpx.Response) -> Any:
+    return r.json()
+
+
+_Op = Literal["emit", "sleep", "call", "send"]
+_Step = tuple[_Op, Any]
+_Attempts = Generator[_Step, Any, tuple[httpx.Response, Any]]
+
+
+def _attempts(
+    url: str,
+    *,
+    pol: RetryPolicy,
+    rid: str | None,
+    breaker: CircuitBreaker | None,
+    limiter: RateLimiter | None,
+    clock: Callable[[], float],
+    cache: ResponseCache | None = None,
+    ckey: str | None = None,
+    cached: CachedResponse | None = None,
+    raise_status: bool = True,
+    decode: Callable[[httpx.Response], Any] | None = None,
+    retryable: Callable[[], bool] | None = None,
+) -> _Attempts:
+    """Retry, backoff, circuit breaker, rate limit and cache policy for one request.
+
+    The sync and async clients drive this generator and perform the I/O for each
+    step it yields: ``("emit", event)``, ``("sleep", seconds)``, ``("call", fn)``
+    (a limiter call whose result is sent back) and ``("send", None)``, answered with
+    the ``(response, body_bytes)`` of one exchange or by throwing its
+    ``httpx.RequestError``. Returns the final response and ``decode(response)``.
+    Request errors are only retried while *retryable* allows it.
+    """
+    start = clock()
+    last_err: BaseException | None = None
+
+    def event(type: EventType, attempt: int, **fields: Any) -> _Step:
+        return "emit", ClientEvent(
+            type=type, url=url, attempt=attempt, retries=pol.retries, request_id=rid, **fields
+        )
+
+    def backoff(attempt: int) -> float:
+        return backoff_delay(attempt, pol.backoff_base, pol.backoff_factor, pol.backoff_jitter)
+
+    for attempt in range(pol.retries):
+        if breaker is not None:
+            try:
+                breaker.allow(clock())
+            except CircuitOpenError as e:
+                yield event("attempt_error", attempt, error="circuit_open")
+                raise e
+        if limiter is not None:
+            d = yield "call", limiter.acquire
+            if d > 0:
+                yield event("sleep", attempt, sleep_seconds=d)
+                yield "sleep", d
+
+        yield event("attempt_start", attempt)
+        try:
+            r, size = yield "send", None
+        except httpx.TimeoutException as e:
+            if breaker is not None:
+                breaker.record_failure(clock())
+            yield event("attempt_error", attempt, error="timeout")
+            raise TimeoutError("request timed out") from e
+        except httpx.RequestError as e:
+            last_err = e
+            if breaker is not None:
+                breaker.record_failure(clock())
+            yield event("attempt_error", attempt, error="request_error")
+            if attempt < pol.retries - 1 and (retryable is None or retryable()):
+                d = backoff(attempt)
+                if d > 0:
+                    yield event("sleep", attempt, sleep_seconds=d)
+                    yield "sleep", d
+                continue
+            break
+
+        yield event("attempt_response", attempt, status_code=r.status_code, response_bytes=size)
+        if limiter is not None:
+            yield "call", partial(limiter.observe, r.headers)
+
+        if r.status_code == 429 and pol.retry_on_429 and attempt < pol.retries - 1:
+            if breaker is not None:
+                breaker.record_failure(clock())
+            ra = retry_after_seconds(r.headers)
+            d = ra if ra is not None else backoff(attempt)
+            if d > 0:
+                yield event("sleep", attempt, sleep_seconds=d)
+                yield "sleep", d
+            continue
+
+        if cache is not None and ckey is not None:
+            r, cache_event = _cache_apply(cache, ckey, cached, r)
+            if cache_event is not None:
+                yield event(cache_event, attempt, status_code=r.status_code)
+
+        if r.status_code < 200 or r.status_code >= 300:
+            if breaker is not None:
+                breaker.record_failure(clock())
+            yield event("complete", attempt, ok=False, elapsed_seconds=clock() - start)
+            if raise_status:
+                raise HttpStatusError("non-2xx response", response=r, body=r.content)
+            return r, None
+
+        value = decode(r) if decode is not None else None
+        if breaker is not None:
+            breaker.record_success()
+        yield event("complete", attempt, ok=True, elapsed_seconds=clock() - start)
+        return r, value
+
+    yield event("complete", pol.retries - 1, ok=False, elapsed_seconds=clock() - start)
+    if last_err is not None:
+        raise RuntimeError("request failed") from last_err
+    raise RuntimeError("request failed")
+
+
+class SdetHttpClient:
+    def __init__(
+        self,
+        client: httpx.Client,
+        *,
+        retry: RetryPolicy | None = None,
+        trace_header: str | None = None,
+        breaker: CircuitBreaker | None = None,
+        hook: Hook | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        allowed_schemes: set[str] | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ):
+        self._client = client
+        self._retry = retry or RetryPolicy()
+        self._trace_header = trace_header
+        self._breaker = breaker
+        self._hook = hook
+        self._clock = clock
+        self._sleep = sleep
+        self._allowed_schemes = allowed_schemes or {"http", "https"}
+        self._cache = cache
+        self._limiter = rate_limiter
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        content: bytes | None = None,
+        json: Any | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> httpx.Response:
+        pol = retry or self._retry
+        ensure_allowed_scheme(url, allowed=self._allowed_schemes)
+        if pol.retries < 1:
+            raise ValueError("retries must be >= 1")
+
+        hdrs, rid = _merge_headers(headers, self._trace_header, request_id)
+        ckey, cached, hdrs = _cache_prepare(
+            self._cache if content is None and json is None else None, method, url, hdrs
+        )
+        kwargs: dict[str, Any] = {}
+        if hdrs is not None:
+            kwargs["headers"] = hdrs
+        if content is not None:
+            kwargs["content"] = content
+        if json is not None:
+            kwargs["json"] = json
+
+        def exchange() -> tuple[httpx.Response, int]:
+            r = self._client.request(method, url, timeout=_normalized_timeout(timeout), **kwargs)
+            return r, len(r.content)
+
+        r, _ = self._drive(
+            _attempts(
+                url,
+                pol=pol,
+                rid=rid,
+                breaker=breaker or self._breaker,
+                limiter=self._limiter,
+                clock=self._clock,
+                cache=self._cache,
+                ckey=ckey,
+                cached=cached,
+                raise_status=False,
+            ),
+            exchange,
+            hook or self._hook,
+        )
+        return r
+
+    def download(
+        self,
+        url: str,
+        sink: IO[bytes],
+        *,
+        method: str = "GET",
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        content: bytes | None = None,
+        json: Any | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> DownloadResult:
+        """Stream a 2xx response body into *sink* without holding it in memory.
+
+        Attempts are retried only before the first body byte is written; a failure
+        mid-body raises because *sink* already holds a partial copy.
+        """
+        pol = self._retry
+        ensure_allowed_scheme(url, allowed=self._allowed_schemes)
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+
+        hdrs, rid = _merge_headers(headers, self._trace_header, request_id)
+        kwargs: dict[str, Any] = {}
+        if hdrs is not None:
+            kwargs["headers"] = hdrs
+        if content is not None:
+            kwargs["content"] = content
+        if json is not None:
+            kwargs["json"] = json
+        digest = hashlib.sha256()
+        written = 0
+
+        def exchange() -> tuple[httpx.Response, int]:
+            nonlocal digest, written
+            digest = hashlib.sha256()
+            written = 0
+            with self._client.stream(
+                method, url, timeout=_normalized_timeout(timeout), **kwargs
+            ) as r:
+                if not 200 <= r.status_code < 300:
+                    return r, len(r.read())
+                for chunk in r.iter_bytes(chunk_size):
+                    sink.write(chunk)
+                    digest.update(chunk)
+                    written += len(chunk)
+            return r, written
+
+        r, _ = self._drive(
+            _attempts(
+                url,
+                pol=pol,
+                rid=rid,
+                breaker=self._breaker,
+                limiter=self._limiter,
+                clock=self._clock,
+                retryable=lambda: written == 0,
+            ),
+            exchange,
+            self._hook,
+        )
+        return DownloadResult(
+            url=str(r.url),
+            status_code=r.status_code,
+            headers=r.headers,
+            bytes_written=written,
+            sha256=digest.hexdigest(),
+        )
+
+    def get_json_dict(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> dict:
+        r, data, rid = self._request_json(
+            url,
+            headers=headers,
+            request_id=request_id,
+            timeout=timeout,
+            retry=retry,
+            hook=hook,
+            breaker=breaker,
+        )
+        if not isinstance(data, dict):
+            raise ValueError("expected json object")
+        return data
+
+    def get_json_list(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> list:
+        r, data, rid = self._request_json(
+            url,
+            headers=headers,
+            request_id=request_id,
+            timeout=timeout,
+            retry=retry,
+            hook=hook,
+            breaker=breaker,
+        )
+        if not isinstance(data, list):
+            raise ValueError("expected json array")
+        return data
+
+    def get_json_list_paginated(
+        self,
+        url: str,
+        *,
+        max_pages: int = 100,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | None = None,
+        breaker: CircuitBreaker | None = None,
+        page_concurrency: int = 1,
+    ) -> list:
+        """Fetch every page following ``Link: rel="next"``.
+
+        With ``page_concurrency > 1`` and a first response whose ``rel="last"``
+        link has a numeric ``page`` parameter, the remaining pages are fetched
+        with at most that many requests in flight and reassembled in page order.
+        """
+        out: list = []
+        for page in self.iter_json_list_pages(
+            url,
+            max_pages=max_pages,
+            headers=headers,
+            request_id=request_id,
+            timeout=timeout,
+            retry=retry,
+            hook=hook,
+            breaker=breaker,
+            page_concurrency=page_concurrency,
+        ):
+            out.extend(page)
+        return out
+
+    def iter_json_list_pages(
+        self,
+        url: str,
+        *,
+        max_pages: int = 100,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | None = None,
+        breaker: CircuitBreaker | None = None,
+        page_concurrency: int = 1,
+    ) -> Iterator[list]:
+        """Yield each ``Link: rel="next"`` page as it arrives.
+
+        At most ``page_concurrency`` decoded pages are held at once.
+        """
+        if max_pages < 1:
+            raise ValueError("max_pages must be >= 1")
+        if page_concurrency < 1:
+            raise ValueError("page_concurrency must be >= 1")
+
+        def fetch(page_url: str) -> tuple[httpx.Response, Any]:
+            r, data, _rid = self._request_json(
+                page_url,
+                headers=headers,
+                request_id=request_id,
+                timeout=timeout,
+                retry=retry,
+                hook=hook,
+                breaker=breaker,
+            )
+            if not isinstance(data, list):
+                raise ValueError("expected json array")
+            return r, data
+
+        seen: set[str] = {str(url)}
+        cur = url
+        fetched = 0
+
+        while fetched < max_pages:
+            r, data = fetch(cur)
+            fetched += 1
+            yield data
+
+            nxt = _link_next_url(r)
+            plan = plan_page_prefetch(
+                r,
+                nxt,
+                fetched=fetched,
+                max_pages=max_pages,
+                seen=seen,
+                page_concurrency=page_concurrency,
+            )
+            if plan:
+                for page_response, data in fetch_planned_pages(fetch, plan, page_concurrency):
+                    fetched += 1
+                    r = page_response
+                    yield data
+                nxt = _link_next_url(r)
+            if not nxt:
+                return
+            if nxt in seen:
+                raise RuntimeError("pagination impact")
+            seen.add(nxt)
+            cur = nxt
+
+        raise RuntimeError("pagination limit exceeded")
+
+    def get_json_list_paginated_envelope(
+        self,
+        url: str,
+        *,
+        items_key: str = "items",
+        next_key: str = "next",
+        max_pages: int = 100,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> list:
+        out: list = []
+        for page in self.iter_json_list_pages_envelope(
+            url,
+            items_key=items_key,
+            next_key=next_key,
+            max_pages=max_pages,
+            headers=headers,
+            request_id=request_id,
+            timeout=timeout,
+            retry=retry,
+            hook=hook,
+            breaker=breaker,
+        ):
+            out.extend(page)
+        return out
+
+    def iter_json_list_pages_envelope(
+        self,
+        url: str,
+        *,
+        items_key: str = "items",
+        next_key: str = "next",
+        max_pages: int = 100,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> Iterator[list]:
+        if max_pages < 1:
+            raise ValueError("max_pages must be >= 1")
+        if not str(items_key).strip():
+            raise ValueError("items_key must not be empty")
+        if not str(next_key).strip():
+            raise ValueError("next_key must not be empty")
+
+        seen: set[str] = {str(url)}
+        cur = str(url)
+
+        for _ in range(max_pages):
+            r, data, rid = self._request_json(
+                cur,
+                headers=headers,
+                request_id=request_id,
+                timeout=timeout,
+                retry=retry,
+                hook=hook,
+                breaker=breaker,
+            )
+            if not isinstance(data, dict):
+                raise ValueError("expected json object")
+
+            page_items = data.get(items_key)
+            if not isinstance(page_items, list):
+                raise ValueError(f"expected json array at key '{items_key}'")
+            nxt_raw = data.get(next_key)
+            yield page_items
+
+            if nxt_raw is None or str(nxt_raw).strip() == "":
+                return
+            if not isinstance(nxt_raw, str):
+                raise ValueError(f"expected string or null at key '{next_key}'")
+            nxt = str(urljoin(str(r.url), nxt_raw))
+            if nxt in seen:
+                raise RuntimeError("pagination impact")
+            seen.add(nxt)
+            cur = nxt
+
+        raise RuntimeError("pagination limit exceeded")
+
+    def get_json_any(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> dict | list:
+        r, data, rid = self._request_json(
+            url,
+            headers=headers,
+            request_id=request_id,
+            timeout=timeout,
+            retry=retry,
+            hook=hook,
+            breaker=breaker,
+        )
+        if not isinstance(data, dict | list):
+            raise ValueError("expected json object or array")
+        return data
+
+    def _request_json(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None,
+        request_id: str | None,
+        timeout: float | httpx.Timeout | None,
+        retry: RetryPolicy | None,
+        hook: Hook | None,
+        breaker: CircuitBreaker | None,
+    ) -> tuple[httpx.Response, Any, str | None]:
+        pol = retry or self._retry
+        ensure_allowed_scheme(url, allowed=self._allowed_schemes)
+        if pol.retries < 1:
+            raise ValueError("retries must be >= 1")
+
+        hdrs, rid = _merge_headers(headers, self._trace_header, request_id)
+        ckey, cached, hdrs = _cache_prepare(self._cache, "GET", url, hdrs)
+
+        def exchange() -> tuple[httpx.Response, int]:
+            if hdrs is None:
+                r = self._client.get(url, timeout=_normalized_timeout(timeout))
+            else:
+                r = self._client.get(url, headers=hdrs, timeout=_normalized_timeout(timeout))
+            return r, len(r.content)
+
+        r, data = self._drive(
+            _attempts(
+                url,
+                pol=pol,
+                rid=rid,
+                breaker=breaker or self._breaker,
+                limiter=self._limiter,
+                clock=self._clock,
+                cache=self._cache,
+                ckey=ckey,
+                cached=cached,
+                decode=_decode_json,
+            ),
+            exchange,
+            hook or self._hook,
+        )
+        return r, data, rid
+
+    def _drive(
+        self,
+        steps: _Attempts,
+        exchange: Callable[[], tuple[httpx.Response, int]],
+        hook: Hook | None,
+    ) -> tuple[httpx.Response, Any]:
+        try:
+            step = next(steps)
+            while True:
+                op, arg = step
+                reply: Any = None
+                if op == "send":
+                    try:
+                        reply = exchange()
+                    except httpx.RequestError as e:
+                        step = steps.throw(e)
+                        continue
+                elif op == "call":
+                    reply = arg()
+                elif op == "sleep":
+                    self._sleep(arg)
+                elif op == "emit":
+                    _emit(hook, arg)
+                else:
+                    steps.close()
+                    raise RuntimeError(f"unknown attempt step: {op!r}")
+                step = steps.send(reply)
+        except StopIteration as done:
+            return done.value
+
+
+class SdetAsyncHttpClient:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        retry: RetryPolicy | None = None,
+        trace_header: str | None = None,
+        breaker: CircuitBreaker | None = None,
+        hook: Hook | AsyncHook | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        allowed_schemes: set[str] | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ):
+        self._client = client
+        self._retry = retry or RetryPolicy()
+        self._trace_header = trace_header
+        self._breaker = breaker
+        self._hook = hook
+        self._clock = clock
+        self._sleep = sleep
+        self._allowed_schemes = allowed_schemes or {"http", "https"}
+        self._cache = cache
+        self._limiter = rate_limiter
+
+    async def get_json_dict(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | AsyncHook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> dict:
+        r, data, rid = await self._request_json(
+            url,
+            headers=headers,
+            request_id=request_id,
+            timeout=timeout,
+            retry=retry,
+            hook=hook,
+            breaker=breaker,
+        )
+        if not isinstance(data, dict):
+            raise ValueError("expected json object")
+        return data
+
+    async def get_json_list(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | AsyncHook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> list:
+        r, data, rid = await self._request_json(
+            url,
+            headers=headers,
+            request_id=request_id,
+            timeout=timeout,
+            retry=retry,
+            hook=hook,
+            breaker=breaker,
+        )
+        if not isinstance(data, list):
+            raise ValueError("expected json array")
+        return data
+
+    async def get_json_list_paginated(
+        self,
+        url: str,
+        *,
+        max_pages: int = 100,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | AsyncHook | None = None,
+        breaker: CircuitBreaker | None = None,
+        page_concurrency: int = 1,
+    ) -> list:
+        """Async twin of :meth:`SdetHttpClient.get_json_list_paginated`."""
+        if max_pages < 1:
+            raise ValueError("max_pages must be >= 1")
+        if page_concurrency < 1:
+            raise ValueError("page_concurrency must be >= 1")
+
+        gate = asyncio.Semaphore(page_concurrency)
+
+        async def fetch(page_url: str) -> tuple[httpx.Response, Any]:
+            async with gate:
+                r, data, _rid = await self._request_json(
+                    page_url,
+                    headers=headers,
+                    request_id=request_id,
+                    timeout=timeout,
+                    retry=retry,
+                    hook=hook,
+                    breaker=breaker,
+                )
+            if not isinstance(data, list):
+                raise ValueError("expected json array")
+            return r, data
+
+        out: list = []
+        seen: set[str] = {str(url)}
+        cur = url
+        fetched = 0
+
+        while fetched < max_pages:
+            r, data = await fetch(cur)
+            fetched += 1
+            out.extend(data)
+
+            nxt = _link_next_url(r)
+            plan = plan_page_prefetch(
+                r,
+                nxt,
+                fetched=fetched,
+                max_pages=max_pages,
+                seen=seen,
+                page_concurrency=page_concurrency,
+            )
+            if plan:
+                pages = await fetch_planned_pages_async(fetch, plan)
+                fetched += len(pages)
+                for _page_response, data in pages:
+                    out.extend(data)
+                nxt = _link_next_url(pages[-1][0])
+            if not nxt:
+                return out
+            if nxt in seen:
+                raise RuntimeError("pagination impact")
+            seen.add(nxt)
+            cur = nxt
+
+        raise RuntimeError("pagination limit exceeded")
+
+    async def get_json_list_paginated_envelope(
+        self,
+        url: str,
+        *,
+        items_key: str = "items",
+        next_key: str = "next",
+        max_pages: int = 100,
+        timeout: float | httpx.Timeout | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> list:
+        if max_pages < 1:
+            raise ValueError("max_pages must be >= 1")
+        if not str(items_key).strip():
+            raise ValueError("items_key must not be empty")
+        if not str(next_key).strip():
+            raise ValueError("next_key must not be empty")
+
+        out = []
+        seen: set[str] = {str(url)}
+        nxt: str | None = url
+
+        for _ in range(max_pages):
+            if nxt is None:
+                return out
+
+            data = await self.get_json_dict(
+                nxt,
+                timeout=timeout,
+                headers=headers,
+            )
+            page_items = data.get(items_key)
+            if not isinstance(page_items, list):
+                raise ValueError(f"expected json array at key '{items_key}'")
+            out.extend(page_items)
+
+            nxt_raw = data.get(next_key)
+            if nxt_raw is None:
+                return out
+            if not isinstance(nxt_raw, str):
+                raise ValueError(f"expected string or null at key '{next_key}'")
+
+            nxt = nxt_raw
+            if nxt in seen:
+                raise RuntimeError("pagination cycle detected")
+            seen.add(nxt)
+
+        raise RuntimeError("pagination limit exceeded")
+
+    async def _request_json(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None,
+        request_id: str | None,
+        timeout: float | httpx.Timeout | None,
+        retry: RetryPolicy | None,
+        hook: Hook | AsyncHook | None,
+        breaker: CircuitBreaker | None,
+    ) -> tuple[httpx.Response, Any, str | None]:
+        pol = retry or self._retry
+        ensure_allowed_scheme(url, allowed=self._allowed_schemes)
+        if pol.retries < 1:
+            raise ValueError("retries must be >= 1")
+
+        hdrs, rid = _merge_headers(headers, self._trace_header, request_id)
+        ckey, cached, hdrs = _cache_prepare(self._cache, "GET", url, hdrs)
+
+        async def exchange() -> tuple[httpx.Response, int]:
+            if hdrs is None:
+                r = await self._client.get(url, timeout=_normalized_timeout(timeout))
+            else:
+                r = await self._client.get(url, headers=hdrs, timeout=_normalized_timeout(timeout))
+            return r, len(r.content)
+
+        r, data = await self._drive(
+            _attempts(
+                url,
+                pol=pol,
+                rid=rid,
+                breaker=breaker or self._breaker,
+                limiter=self._limiter,
+                clock=self._clock,
+                cache=self._cache,
+                ckey=ckey,
+                cached=cached,
+                decode=_decode_json,
+            ),
+            exchange,
+            hook or self._hook,
+        )
+        return r, data, rid
+
+    async def _drive(
+        self,
+        steps: _Attempts,
+        exchange: Callable[[], Awaitable[tuple[httpx.Response, int]]],
+        hook: Hook | AsyncHook | None,
+    ) -> tuple[httpx.Response, Any]:
+        try:
+            step = next(steps)
+            while True:
+                op, arg = step
+                reply: Any = None
+                if op == "send":
+                    try:
+                        reply = await exchange()
+                    except httpx.RequestError as e:
+                        step = steps.throw(e)
+                        continue
+                elif op == "call":
+                    # Limiter calls may take a SQLite write lock; keep them off the event loop.
+                    reply = await asyncio.to_thread(arg)
+                elif op == "sleep":
+                    await self._sleep(arg)
+                elif op == "emit":
+                    await _emit_async(hook, arg)
+                else:
+                    steps.close()
+                    raise RuntimeError(f"unknown attempt step: {op!r}")
+                step = steps.send(reply)
+        except StopIteration as done:
+            return done.value
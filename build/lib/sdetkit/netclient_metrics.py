@@ -0,0 +1,279 @@
+"""Aggregating metrics hook for :mod:`sdetkit.netclient` clients.
+
+:class:`NetclientMetrics` is a plain ``ClientEvent`` hook, so one instance can be
+passed as ``hook=`` to sync and async clients alike. It keeps a latency histogram
+and counters per host and route template (``/repos/{id}/pulls``) and exports them
+as JSON or Prometheus text exposition format.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from .atomicio import atomic_write_text
+from .netclient import ClientEvent
+
+SCHEMA_VERSION = "sdetkit.netclient.metrics.v1"
+# Upper bounds in seconds; the implicit last bucket is +Inf.
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+PERCENTILES = (50, 95, 99)
+PROMETHEUS_SUFFIXES = (".prom", ".txt")
+
+_UUID = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+_HEX_ID = re.compile(r"^(?=[0-9a-fA-F]*[0-9])[0-9a-fA-F]{7,}$")
+_PLACEHOLDER = re.compile(r"\{[^/{}]+\}")
+
+
+def _compile_template(template: str) -> re.Pattern[str]:
+    parts = _PLACEHOLDER.split(template)
+    return re.compile("^" + "[^/]+".join(re.escape(p) for p in parts) + "/?$")
+
+
+def route_template(url: str, templates: Iterable[tuple[str, re.Pattern[str]]] = ()) -> str:
+    """Map a URL to its route: a matching explicit template, else the path with ids elided."""
+    path = urlsplit(url).path or "/"
+    for template, pattern in templates:
+        if pattern.match(path):
+            return template
+    segments = []
+    for seg in path.split("/"):
+        if seg.isdigit():
+            seg = "{id}"
+        elif _UUID.match(seg):
+            seg = "{uuid}"
+        elif _HEX_ID.match(seg):
+            seg = "{sha}"
+        segments.append(seg)
+    return "/".join(segments)
+
+
+@dataclass
+class _Stats:
+    requests: int = 0
+    errors: int = 0
+    attempts: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    breaker_open: int = 0
+    response_bytes: int = 0
+    sleep_seconds: float = 0.0
+    status: dict[str, int] = field(default_factory=dict)
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+
+    def merge(self, other: _Stats) -> None:
+        for name in (
+            "requests",
+            "errors",
+            "attempts",
+            "retries",
+            "timeouts",
+            "breaker_open",
+            "response_bytes",
+            "sleep_seconds",
+            "latency_sum",
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for code, n in other.status.items():
+            self.status[code] = self.status.get(code, 0) + n
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets, strict=True)]
+        self.latency_max = max(self.latency_max, other.latency_max)
+
+    def observe_latency(self, seconds: float) -> None:
+        seconds = max(seconds, 0.0)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        self.latency_sum += seconds
+        self.latency_max = max(self.latency_max, seconds)
+
+    def percentile(self, pct: float) -> float | None:
+        """Estimate a percentile by interpolating inside its bucket, capped at the max."""
+        count = sum(self.buckets)
+        if count == 0:
+            return None
+        rank = pct / 100.0 * count
+        seen = 0
+        lower = 0.0
+        for i, n in enumerate(self.buckets):
+            upper = LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else self.latency_max
+            if n and seen + n >= rank:
+                estimate = lower + (upper - lower) * (rank - seen) / n
+                return round(min(estimate, self.latency_max), 6)
+            seen += n
+            lower = upper
+        return round(self.latency_max, 6)
+
+    def to_dict(self) -> dict[str, Any]:
+        count = sum(self.buckets)
+        latency: dict[str, Any] = {
+            "count": count,
+            "sum": round(self.latency_sum, 6),
+            "max": round(self.latency_max, 6),
+        }
+        for pct in PERCENTILES:
+            latency[f"p{pct}"] = self.percentile(pct)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "breaker_open": self.breaker_open,
+            "response_bytes": self.response_bytes,
+            "sleep_seconds": round(self.sleep_seconds, 6),
+            "status": dict(sorted(self.status.items())),
+            "latency_seconds": latency,
+        }
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class NetclientMetrics:
+    """Thread-safe ``ClientEvent`` hook aggregating per host and route template."""
+
+    def __init__(self, *, templates: Sequence[str] = ()) -> None:
+        self._templates = [(t, _compile_template(t)) for t in templates]
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], _Stats] = {}
+
+    def __call__(self, ev: ClientEvent) -> None:
+        parts = urlsplit(ev.url)
+        key = (parts.netloc or "-", route_template(ev.url, self._templates))
+        with self._lock:
+            stats = self._routes.get(key)
+            if stats is None:
+                stats = self._routes[key] = _Stats()
+            if ev.type == "attempt_start":
+                stats.attempts += 1
+                if ev.attempt > 0:
+                    stats.retries += 1
+            elif ev.type == "attempt_response":
+                code = str(ev.status_code)
+                stats.status[code] = stats.status.get(code, 0) + 1
+                stats.response_bytes += ev.response_bytes or 0
+            elif ev.type == "attempt_error":
+                if ev.error == "circuit_open":
+                    stats.breaker_open += 1
+                elif ev.error == "timeout":
+                    stats.timeouts += 1
+            elif ev.type == "sleep":
+                stats.sleep_seconds += ev.sleep_seconds or 0.0
+            elif ev.type == "complete":
+                stats.requests += 1
+                if not ev.ok:
+                    stats.errors += 1
+                if ev.elapsed_seconds is not None:
+                    stats.observe_latency(ev.elapsed_seconds)
+
+    def _grouped(self) -> tuple[list[tuple[str, str, _Stats]], list[tuple[str, _Stats]]]:
+        with self._lock:
+            routes = [(h, r, s) for (h, r), s in sorted(self._routes.items())]
+            hosts: dict[str, _Stats] = {}
+            for host, _route, stats in routes:
+                hosts.setdefault(host, _Stats()).merge(stats)
+            routes = [(h, r, _copy(s)) for h, r, s in routes]
+        return routes, sorted(hosts.items())
+
+    def snapshot(self) -> dict[str, Any]:
+        routes, hosts = self._grouped()
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "latency_buckets": list(LATENCY_BUCKETS),
+            "hosts": [{"host": h, **s.to_dict()} for h, s in hosts],
+            "routes": [{"host": h, "route": r, **s.to_dict()} for h, r, s in routes],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True) + "\n"
+
+    def to_prometheus(self) -> str:
+        routes, _hosts = self._grouped()
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def labels(host: str, route: str, **extra: str) -> str:
+            pairs = {"host": host, "route": route, **extra}
+            return ",".join(f'{k}="{_label(v)}"' for k, v in pairs.items())
+
+        name = "sdetkit_http_request_duration_seconds"
+        family(name, "histogram", "End-to-end request latency including retries.")
+        for host, route, s in routes:
+            running = 0
+            for bound, n in zip((*LATENCY_BUCKETS, None), s.buckets, strict=True):
+                running += n
+                le = "+Inf" if bound is None else _number(bound)
+                lines.append(f"{name}_bucket{{{labels(host, route, le=le)}}} {running}")
+            lines.append(f"{name}_sum{{{labels(host, route)}}} {_number(s.latency_sum)}")
+            lines.append(f"{name}_count{{{labels(host, route)}}} {running}")
+
+        counters = (
+            ("sdetkit_http_requests_total", "requests", "Completed requests."),
+            ("sdetkit_http_request_errors_total", "errors", "Requests that did not end in 2xx."),
+            ("sdetkit_http_retries_total", "retries", "Attempts after the first."),
+            ("sdetkit_http_timeouts_total", "timeouts", "Attempts that timed out."),
+            ("sdetkit_http_breaker_open_total", "breaker_open", "Attempts refused by the breaker."),
+            ("sdetkit_http_response_bytes_total", "response_bytes", "Response body bytes."),
+            ("sdetkit_http_sleep_seconds_total", "sleep_seconds", "Backoff and pacing sleeps."),
+        )
+        for metric, attr, help_text in counters:
+            family(metric, "counter", help_text)
+            for host, route, s in routes:
+                lines.append(f"{metric}{{{labels(host, route)}}} {_number(getattr(s, attr))}")
+
+        metric = "sdetkit_http_responses_total"
+        family(metric, "counter", "Responses by HTTP status code.")
+        for host, route, s in routes:
+            for code, n in sorted(s.status.items()):
+                lines.append(f"{metric}{{{labels(host, route, code=code)}}} {n}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> None:
+        """Write Prometheus text for ``.prom``/``.txt`` paths and JSON otherwise."""
+        if path.name.endswith(PROMETHEUS_SUFFIXES):
+            atomic_write_text(path, self.to_prometheus())
+        else:
+            atomic_write_text(path, self.to_json())
+
+
+def _copy(stats: _Stats) -> _Stats:
+    out = _Stats()
+    out.merge(stats)
+    return out
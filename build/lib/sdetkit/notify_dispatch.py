@@ -0,0 +1,348 @@
+"""Async, batched delivery for notify adapters with an on-disk retry spool.
+
+Messages submitted for the same channel within ``window_seconds`` of the first one
+are coalesced into as few sends as ``max_chars`` allows. Channels are delivered
+concurrently with at most ``concurrency`` sends in flight. A send that still fails
+after ``retries`` attempts is appended to a JSONL spool; :func:`flush_spool`
+replays it later, at least once: the claimed spool file is only removed after
+every record in it was delivered or spooled again.
+
+A channel is ``"<adapter>:<destination>"`` (for example ``telegram:12345``) and is
+delivered by the sender registered for ``<adapter>``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .netclient import backoff_delay
+from .optional_httpx import load_httpx
+
+httpx = load_httpx(feature="sdetkit notify dispatch")
+
+SPOOL_FILE_NAME = "notify-spool.jsonl"
+TELEGRAM_API_URL = "https://api.telegram.org"
+TELEGRAM_MAX_CHARS = 4096
+
+ChannelSender = Callable[[str, str], Awaitable[None]]
+
+
+class NotifyRetryAfter(RuntimeError):
+    """Raised by a sender when the service asks to wait before the next attempt."""
+
+    def __init__(self, message: str, *, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class SpooledMessage:
+    channel: str
+    text: str
+    attempts: int
+    error: str
+    spooled_at: float
+
+
+def _lock_claim(path: Path) -> int | None:
+    """Open and exclusively lock a claimed spool file, or ``None`` if someone holds it."""
+    try:
+        fd = os.open(path, os.O_RDWR)
+    except FileNotFoundError:
+        return None
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - Windows
+        import msvcrt
+
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return None
+        return fd
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    if os.fstat(fd).st_nlink == 0:
+        # Its holder finished and unlinked it between our open and our lock.
+        os.close(fd)
+        return None
+    return fd
+
+
+def _release_claim(path: Path, fd: int) -> None:
+    if os.name == "nt":  # pragma: no cover - Windows cannot unlink an open file
+        os.close(fd)
+        path.unlink(missing_ok=True)
+        return
+    path.unlink(missing_ok=True)
+    os.close(fd)
+
+
+def _read_spooled(path: Path) -> list[SpooledMessage]:
+    records: list[SpooledMessage] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            raw = json.loads(line)
+            records.append(
+                SpooledMessage(
+                    channel=str(raw["channel"]),
+                    text=str(raw["text"]),
+                    attempts=int(raw.get("attempts", 0)),
+                    error=str(raw.get("error", "")),
+                    spooled_at=float(raw.get("spooled_at", 0.0)),
+                )
+            )
+        except (ValueError, KeyError, TypeError):
+            continue
+    return records
+
+
+class NotifySpool:
+    """Append-only JSONL spool of undelivered messages, claimed by atomic rename."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.path = directory / SPOOL_FILE_NAME
+        self._lock = threading.Lock()
+
+    def append(self, records: Iterable[SpooledMessage]) -> int:
+        lines = [json.dumps(asdict(r), sort_keys=True) + "\n" for r in records]
+        if not lines:
+            return 0
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write("".join(lines))
+                fh.flush()
+                os.fsync(fh.fileno())
+        return len(lines)
+
+    @contextlib.contextmanager
+    def claim(self) -> Iterator[list[SpooledMessage]]:
+        """Hold every spooled message, and any a crashed claimer left behind.
+
+        The spool is renamed to a claim file that stays on disk, locked, until the
+        block exits without an error. Concurrent claimers never see the same record;
+        a claimer that dies or raises leaves its records for the next claim.
+        """
+        with self._lock:
+            claimed = self.path.with_name(
+                f"{SPOOL_FILE_NAME}.{os.getpid()}.{threading.get_ident()}.{time.time_ns()}"
+            )
+            with contextlib.suppress(FileNotFoundError):
+                os.replace(self.path, claimed)
+        held: list[tuple[Path, int]] = []
+        if self.directory.is_dir():
+            for path in sorted(self.directory.glob(f"{SPOOL_FILE_NAME}.*")):
+                fd = _lock_claim(path)
+                if fd is not None:
+                    held.append((path, fd))
+        try:
+            yield [record for path, _fd in held for record in _read_spooled(path)]
+        except BaseException:
+            for _path, fd in held:
+                os.close(fd)
+            raise
+        for path, fd in held:
+            _release_claim(path, fd)
+
+    def drain(self) -> list[SpooledMessage]:
+        """Take every spooled message; the caller becomes responsible for them."""
+        with self.claim() as records:
+            return records
+
+
+def coalesce(texts: Iterable[str], max_chars: int) -> list[str]:
+    """Pack messages newline-joined into chunks of at most ``max_chars`` characters."""
+    chunks: list[str] = []
+    current = ""
+    for text in texts:
+        pieces = [text[i : i + max_chars] for i in range(0, len(text), max_chars)] or [""]
+        for piece in pieces:
+            if current and len(current) + 1 + len(piece) <= max_chars:
+                current = f"{current}\n{piece}"
+                continue
+            if current:
+                chunks.append(current)
+            current = piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class NotifyDispatcher:
+    """Coalesce, send concurrently, retry, and spool what could not be delivered."""
+
+    def __init__(
+        self,
+        senders: Mapping[str, ChannelSender],
+        *,
+        window_seconds: float = 1.0,
+        concurrency: int = 4,
+        retries: int = 3,
+        backoff_base: float = 0.5,
+        max_chars: int = TELEGRAM_MAX_CHARS,
+        spool: NotifySpool | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if retries < 1:
+            raise ValueError("retries must be >= 1")
+        if max_chars < 1:
+            raise ValueError("max_chars must be >= 1")
+        self._senders = dict(senders)
+        self._window = max(window_seconds, 0.0)
+        self._gate = asyncio.Semaphore(concurrency)
+        self._retries = retries
+        self._backoff_base = backoff_base
+        self._max_chars = max_chars
+        self._spool = spool
+        self._sleep = sleep
+        self._pending: dict[str, list[str]] = {}
+        self._timers: dict[str, asyncio.Task[None]] = {}
+        self._deliveries: set[asyncio.Task[None]] = set()
+        self.submitted = 0
+        self.sends = 0
+        self.delivered = 0
+        self.failed: list[SpooledMessage] = []
+
+    async def __aenter__(self) -> NotifyDispatcher:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    async def submit(self, channel: str, text: str) -> None:
+        adapter = channel.split(":", 1)[0]
+        if adapter not in self._senders:
+            raise ValueError(f"no sender registered for channel: {channel}")
+        self.submitted += 1
+        batch = self._pending.get(channel)
+        if batch is not None:
+            batch.append(text)
+            return
+        self._pending[channel] = [text]
+        self._timers[channel] = asyncio.create_task(self._flush_after_window(channel))
+
+    async def _flush_after_window(self, channel: str) -> None:
+        await asyncio.sleep(self._window)
+        self._timers.pop(channel, None)
+        self._start_delivery(channel)
+
+    def _start_delivery(self, channel: str) -> None:
+        texts = self._pending.pop(channel, None)
+        if not texts:
+            return
+        task = asyncio.create_task(self._deliver(channel, texts))
+        self._deliveries.add(task)
+        task.add_done_callback(self._deliveries.discard)
+
+    async def _deliver(self, channel: str, texts: list[str]) -> None:
+        sender = self._senders[channel.split(":", 1)[0]]
+        await asyncio.gather(
+            *(self._send(sender, channel, chunk) for chunk in coalesce(texts, self._max_chars))
+        )
+
+    async def _send(self, sender: ChannelSender, channel: str, text: str) -> None:
+        error = ""
+        for attempt in range(self._retries):
+            try:
+                async with self._gate:
+                    self.sends += 1
+                    await sender(channel, text)
+                self.delivered += 1
+                return
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+                if attempt == self._retries - 1:
+                    break
+                if isinstance(exc, NotifyRetryAfter):
+                    delay = exc.retry_after
+                else:
+                    delay = backoff_delay(attempt, self._backoff_base, 2.0, 0.0)
+                if delay > 0:
+                    await self._sleep(delay)
+        record = SpooledMessage(channel, text, self._retries, error, time.time())
+        self.failed.append(record)
+        if self._spool is not None:
+            self._spool.append([record])
+
+    async def aclose(self) -> None:
+        """Deliver everything still waiting for its window and wait for in-flight sends."""
+        for channel, timer in list(self._timers.items()):
+            timer.cancel()
+            self._timers.pop(channel, None)
+            self._start_delivery(channel)
+        while self._deliveries:
+            await asyncio.gather(*list(self._deliveries))
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "sends": self.sends,
+            "delivered": self.delivered,
+            "failed": len(self.failed),
+            "spooled": len(self.failed) if self._spool is not None else 0,
+        }
+
+
+async def flush_spool(
+    spool: NotifySpool, senders: Mapping[str, ChannelSender], **dispatcher_options: Any
+) -> dict[str, Any]:
+    """Resend spooled messages; failures and unknown channels go back to the spool."""
+    dispatcher_options.setdefault("window_seconds", 0.0)
+    with spool.claim() as records:
+        routable: list[SpooledMessage] = []
+        orphaned: list[SpooledMessage] = []
+        for record in records:
+            known = record.channel.split(":", 1)[0] in senders
+            (routable if known else orphaned).append(record)
+        async with NotifyDispatcher(senders, spool=spool, **dispatcher_options) as dispatcher:
+            for record in routable:
+                await dispatcher.submit(record.channel, record.text)
+        spool.append(orphaned)
+    return {**dispatcher.report(), "drained": len(records), "orphaned": len(orphaned)}
+
+
+def telegram_sender(
+    token: str, *, client: httpx.AsyncClient, api_url: str | None = None
+) -> ChannelSender:
+    """Sender posting ``sendMessage`` for ``telegram:<chat_id>`` channels."""
+    url = f"{(api_url or TELEGRAM_API_URL).rstrip('/')}/bot{token}/sendMessage"
+
+    async def send(channel: str, text: str) -> None:
+        chat_id = channel.split(":", 1)[1] if ":" in channel else ""
+        if not chat_id:
+            raise ValueError(f"telegram channel needs a chat id: {channel}")
+        resp = await client.post(url, data={"chat_id": chat_id, "text": text})
+        try:
+            payload = resp.json()
+        except ValueError:
+            payload = {}
+        if not isinstance(payload, dict):
+            payload = {}
+        if payload.get("ok") is True:
+            return
+        description = str(payload.get("description") or f"HTTP {resp.status_code}")
+        params = payload.get("parameters")
+        if resp.status_code == 429 and isinstance(params, dict):
+            retry_after = params.get("retry_after")
+            if isinstance(retry_after, int | float):
+                raise NotifyRetryAfter(description, retry_after=float(retry_after))
+        raise RuntimeError(description)
+
+    return send
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from sdetkit.bools import coerce_bool
+
+_unused_compat_namespace = "phases"
+
+__all__ = ["coerce_bool"]
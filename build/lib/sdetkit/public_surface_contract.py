@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
+
+
+@dataclass(frozen=True)
+class CommandFamilyContract:
+    """Repo-specific contract for major public command families."""
+
+    name: str
+    role: str
+    stability_tier: str
+    first_time_recommended: bool
+    transition_legacy_oriented: bool
+    top_level_commands: tuple[str, ...]
+
+
+PUBLIC_SURFACE_CONTRACT: tuple[CommandFamilyContract, ...] = (
+    CommandFamilyContract(
+        name="release-confidence-canonical-path",
+        role="Primary first-time product surface for deterministic shipping readiness; one primary outcome (know if a change is ready to ship) and one canonical command path.",
+        stability_tier="Public / stable",
+        first_time_recommended=True,
+        transition_legacy_oriented=False,
+        top_level_commands=("gate", "doctor", "release"),
+    ),
+    CommandFamilyContract(
+        name="umbrella-kits",
+        role="Umbrella kits are fully supported expansion surfaces for release, intelligence, integration, and forensics workflows after the canonical first-time path.",
+        stability_tier="Advanced but supported",
+        first_time_recommended=False,
+        transition_legacy_oriented=False,
+        top_level_commands=("kits", "release", "intelligence", "integration", "forensics"),
+    ),
+    CommandFamilyContract(
+        name="compatibility-aliases",
+        role="Backward-compatible direct lanes preserved for existing automation and muscle memory; visible but secondary for first-time discovery.",
+        stability_tier="Public / stable",
+        first_time_recommended=False,
+        transition_legacy_oriented=False,
+        top_level_commands=("gate", "doctor", "security", "repo", "evidence", "report", "policy"),
+    ),
+    CommandFamilyContract(
+        name="supporting-utilities-and-automation",
+        role="Supporting utilities and automation lanes; useful but intentionally secondary to the canonical public/stable first-time path.",
+        stability_tier="Advanced but supported",
+        first_time_recommended=False,
+        transition_legacy_oriented=False,
+        top_level_commands=(
+            "repo",
+            "dev",
+            "maintenance",
+            "ci",
+            "triage-ci",
+            "kv",
+            "inspect",
+            "review",
+            "apiget",
+            "cassette-get",
+            "patch",
+            "ops",
+            "notify",
+            "agent",
+            "feature-registry",
+            "boost",
+        ),
+    ),
+    CommandFamilyContract(
+        name="playbooks",
+        role="Guided adoption and rollout lanes for operational outcomes.",
+        stability_tier="Advanced but supported",
+        first_time_recommended=False,
+        transition_legacy_oriented=False,
+        top_level_commands=(
+            "playbooks",
+            "onboarding",
+            "weekly-review",
+            "first-contribution",
+            "demo",
+        ),
+    ),
+    CommandFamilyContract(
+        name="experimental-transition-lanes",
+        role="Transition-era and legacy-oriented lanes retained for compatibility and historical continuity.",
+        stability_tier="Experimental / incubator",
+        first_time_recommended=False,
+        transition_legacy_oriented=True,
+        top_level_commands=("legacy compatibility lanes", "archived transition commands"),
+    ),
+)
+
+
+def load_public_command_surface_contract() -> dict[str, object]:
+    contract_path = Path(__file__).with_name("public_command_surface.json")
+    loaded = json.loads(contract_path.read_text(encoding="utf-8"))
+    if not isinstance(loaded, dict):
+        return {}
+    return cast(dict[str, object], loaded)
+
+
+def _string_list(value: object) -> list[str]:
+    if not isinstance(value, list):
+        return []
+    return [str(item) for item in value if str(item).strip()]
+
+
+def render_root_help_groups() -> str:
+    """Render a concise, stability-aware root-help journey.
+
+    The complete command-family inventory remains available in the command-surface
+    documentation and machine-readable contract. Root help intentionally avoids
+    repeating every advanced or transition-era lane.
+    """
+
+    contract = load_public_command_surface_contract()
+    canonical = _string_list(contract.get("canonical_first_path"))
+    next_step = str(contract.get("advanced_supported_next_step", "python -m sdetkit kits list"))
+    tier_a = _string_list(contract.get("tier_a_contract_commands"))
+    tier_b = _string_list(contract.get("tier_b_contract_commands"))
+    compatibility = _string_list(contract.get("best_effort_compatibility_commands"))
+
+    canonical_summary = " -> ".join(
+        command.replace("python -m sdetkit ", "") for command in canonical
+    )
+    canonical_commands = " | ".join(canonical)
+
+    return "\n".join(
+        [
+            "Command discovery (stability-aware):",
+            "",
+            "  release confidence canonical path [Public / stable] (use first: yes; transition-era: no):",
+            "    Know if a change is ready to ship.",
+            f"    {canonical_summary}",
+            f"    {canonical_commands}",
+            "",
+            "  Frozen command contracts:",
+            f"    Tier A (public/stable): {', '.join(tier_a)}",
+            f"    Tier B (advanced/supported): {', '.join(tier_b)}",
+            "",
+            "  umbrella kits [Advanced but supported] (use first: no; transition-era: no):",
+            f"    Continue with: {next_step}",
+            "",
+            "  Experimental / incubator:",
+            "    Hidden from the first-run journey; see docs/command-surface.md.",
+            "",
+            "  Compatibility namespace:",
+            f"    {', '.join(compatibility)}",
+            "    Existing aliases remain available; new users should stay on the canonical path.",
+            "",
+            f"Next step (advanced but supported): {next_step}",
+        ]
+    )
@@ -0,0 +1,251 @@
+"""Keep-alive PyPI metadata client used by ``upgrade-audit``.
+
+Each worker thread keeps one persistent HTTP/1.1 connection to the index. Projects
+are read from the PEP 691 JSON simple index (``/simple/<name>/``), which is far
+smaller than ``/pypi/<name>/json`` for projects with long histories. The legacy
+JSON API is used when the index does not serve JSON or report upload times (PEP 700).
+Documents are requested gzip-encoded and revalidated with ``If-None-Match``.
+
+Failures are raised as :mod:`urllib.error` exceptions so callers written against
+``urllib.request.urlopen`` keep working.
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import json
+import re
+import threading
+import urllib.error
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urljoin, urlsplit
+
+DEFAULT_INDEX_URL = "https://pypi.org"
+SIMPLE_JSON_MEDIA_TYPE = "application/vnd.pypi.simple.v1+json"
+USER_AGENT = "sdetkit-upgrade-audit/2.1"
+_MAX_REDIRECTS = 3
+_SDIST_SUFFIXES = (".tar.gz", ".tar.bz2", ".tar.xz", ".tgz", ".zip")
+# Errors that mean a kept-alive connection was closed by the server between requests.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+def normalize_project_name(name: str) -> str:
+    """PEP 503 normalized project name."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def version_from_filename(filename: str) -> str | None:
+    """Return the version encoded in a wheel, egg or sdist file name."""
+    if filename.endswith((".whl", ".egg")):
+        parts = filename.rsplit(".", 1)[0].split("-")
+        return parts[1] if len(parts) >= 3 else None
+    for suffix in _SDIST_SUFFIXES:
+        if filename.endswith(suffix):
+            stem = filename[: -len(suffix)]
+            if "-" not in stem:
+                return None
+            return stem.rsplit("-", 1)[1] or None
+    return None
+
+
+def _api_version(payload: dict[str, Any]) -> tuple[int, ...]:
+    meta = payload.get("meta")
+    raw = meta.get("api-version") if isinstance(meta, dict) else None
+    try:
+        return tuple(int(part) for part in str(raw).split("."))
+    except ValueError:
+        return (1, 0)
+
+
+def releases_from_simple_index(payload: dict[str, Any]) -> dict[str, list[dict[str, Any]]] | None:
+    """Group simple-index files by version in the ``/pypi/<name>/json`` release shape.
+
+    Returns None when the index predates PEP 700 and lacks upload times.
+    """
+    if _api_version(payload) < (1, 1):
+        return None
+    versions = payload.get("versions")
+    releases: dict[str, list[dict[str, Any]]] = {}
+    if isinstance(versions, list):
+        for version in versions:
+            releases[str(version)] = []
+    files = payload.get("files")
+    for item in files if isinstance(files, list) else []:
+        if not isinstance(item, dict):
+            continue
+        version = version_from_filename(str(item.get("filename", "")))
+        if version is None:
+            continue
+        yanked = item.get("yanked")
+        releases.setdefault(version, []).append(
+            {
+                "upload_time_iso_8601": item.get("upload-time"),
+                "requires_python": item.get("requires-python"),
+                "yanked": yanked is not None and yanked is not False,
+            }
+        )
+    return releases
+
+
+@dataclass(frozen=True)
+class PyPIDocument:
+    payload: dict[str, Any]
+    etag: str | None
+    api: str
+
+
+class PyPIMetadataClient:
+    """Thread-safe client holding one keep-alive connection per calling thread."""
+
+    def __init__(self, index_url: str = DEFAULT_INDEX_URL) -> None:
+        parts = urlsplit(index_url)
+        if parts.scheme not in {"http", "https"} or not parts.netloc:
+            raise ValueError(f"unsupported index url: {index_url}")
+        self.index_url = index_url.rstrip("/")
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._prefix = parts.path.rstrip("/")
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[http.client.HTTPConnection] = []
+        self.requests = 0
+        self.not_modified = 0
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def fetch(
+        self,
+        project: str,
+        *,
+        timeout_s: float,
+        etag: str | None = None,
+        api: str = "simple",
+    ) -> PyPIDocument | None:
+        """Fetch release metadata for *project*; None when *etag* is still current.
+
+        *api* names the document *etag* came from (``PyPIDocument.api``), so a
+        legacy JSON ETag is revalidated against ``/pypi/<name>/json`` rather than
+        the simple index. Simple-index documents carry only ``releases``; the
+        legacy JSON API document also has ``info``.
+        """
+        name = normalize_project_name(project)
+        if api == "json" and etag:
+            return self._fetch_json(name, timeout_s=timeout_s, etag=etag)
+        status, headers, body = self._get(
+            f"{self._prefix}/simple/{name}/",
+            accept=SIMPLE_JSON_MEDIA_TYPE,
+            timeout_s=timeout_s,
+            etag=etag,
+        )
+        if status == 304:
+            with self._lock:
+                self.not_modified += 1
+            return None
+        releases = None
+        if "json" in headers.get("content-type", "").lower():
+            simple = json.loads(body.decode("utf-8"))
+            releases = releases_from_simple_index(simple) if isinstance(simple, dict) else None
+        if releases is not None:
+            return PyPIDocument({"releases": releases}, headers.get("etag"), "simple")
+        return self._fetch_json(name, timeout_s=timeout_s)
+
+    def _fetch_json(
+        self, name: str, *, timeout_s: float, etag: str | None = None
+    ) -> PyPIDocument | None:
+        status, headers, body = self._get(
+            f"{self._prefix}/pypi/{name}/json",
+            accept="application/json",
+            timeout_s=timeout_s,
+            etag=etag,
+        )
+        if status == 304:
+            with self._lock:
+                self.not_modified += 1
+            return None
+        return PyPIDocument(json.loads(body.decode("utf-8")), headers.get("etag"), "json")
+
+    def _connection(self, timeout_s: float) -> http.client.HTTPConnection:
+        conn: http.client.HTTPConnection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            if self._scheme == "https":
+                conn = http.client.HTTPSConnection(self._netloc, timeout=timeout_s)
+            else:
+                conn = http.client.HTTPConnection(self._netloc, timeout=timeout_s)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        conn.timeout = timeout_s
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            with self._lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+
+    def _get(
+        self, path: str, *, accept: str, timeout_s: float, etag: str | None = None
+    ) -> tuple[int, dict[str, str], bytes]:
+        headers = {"User-Agent": USER_AGENT, "Accept": accept, "Accept-Encoding": "gzip"}
+        if etag:
+            headers["If-None-Match"] = etag
+        url = f"{self._scheme}://{self._netloc}{path}"
+        for _ in range(_MAX_REDIRECTS + 1):
+            status, reason, resp_headers, body = self._send(path, headers, timeout_s, url)
+            location = resp_headers.get("location")
+            if status in {301, 302, 307, 308} and location:
+                target = urlsplit(urljoin(url, location))
+                if (target.scheme, target.netloc) != (self._scheme, self._netloc):
+                    raise urllib.error.URLError(f"cross-host redirect to {target.netloc}")
+                path = target.path + (f"?{target.query}" if target.query else "")
+                url = f"{self._scheme}://{self._netloc}{path}"
+                continue
+            if status == 304:
+                return status, resp_headers, b""
+            if status >= 400:
+                raise urllib.error.HTTPError(url, status, reason, None, None)
+            if resp_headers.get("content-encoding", "").lower() == "gzip":
+                body = gzip.decompress(body)
+            return status, resp_headers, body
+        raise urllib.error.URLError(f"too many redirects for {url}")
+
+    def _send(
+        self, path: str, headers: dict[str, str], timeout_s: float, url: str
+    ) -> tuple[int, str, dict[str, str], bytes]:
+        for attempt in range(2):
+            conn = self._connection(timeout_s)
+            reused = getattr(conn, "sock", None) is not None
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except _STALE_CONNECTION_ERRORS as exc:
+                self._drop_connection()
+                if reused and attempt == 0:
+                    continue
+                raise urllib.error.URLError(exc) from exc
+            except (OSError, http.client.HTTPException) as exc:
+                self._drop_connection()
+                raise urllib.error.URLError(exc) from exc
+            with self._lock:
+                self.requests += 1
+            if resp.will_close:
+                self._drop_connection()
+            resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+            return resp.status, resp.reason, resp_headers, body
+        raise urllib.error.URLError(f"connection to {url} kept closing")
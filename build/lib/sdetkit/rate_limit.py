@@ -0,0 +1,210 @@
+"""Client-side rate-limit governor for :mod:`sdetkit.netclient` clients.
+
+A token bucket paces requests before they are sent instead of reacting to ``429``
+after the fact. ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset`` response headers
+tighten the pace so the remaining quota is spread over the rest of the window, and
+an exhausted quota blocks until the reset, after which waiters are released one
+slot at a time rather than all at once. One :class:`RateLimiter` can be shared by
+sync and async clients and threads; with ``state_path`` the bucket lives in a SQLite
+file so several processes draw from the same budget.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+# Reset values above this are epoch seconds (GitHub); smaller ones are delta seconds.
+_EPOCH_THRESHOLD = 1_000_000_000.0
+
+
+@dataclass
+class _BucketState:
+    tokens: float
+    updated: float
+    server_rate: float | None = None
+    server_until: float = 0.0
+    blocked_until: float = 0.0
+
+
+def _header_float(headers: Mapping[str, str], *names: str) -> float | None:
+    for name in names:
+        raw = headers.get(name)
+        if raw is None:
+            continue
+        try:
+            return float(str(raw).strip())
+        except ValueError:
+            return None
+    return None
+
+
+class RateLimiter:
+    """Token bucket of ``burst`` tokens refilled at ``rate`` per second.
+
+    ``rate=None`` leaves pacing entirely to the server headers.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        *,
+        burst: int = 1,
+        state_path: Path | None = None,
+        name: str = "default",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be > 0")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self.rate = rate
+        self.burst = burst
+        self.name = name
+        self._state_path = state_path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = _BucketState(tokens=float(burst), updated=clock())
+        self._db: sqlite3.Connection | None = None
+
+    @property
+    def state_path(self) -> Path | None:
+        return self._state_path
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def acquire(self) -> float:
+        """Reserve the next request slot and return the seconds to wait before sending."""
+        return self._transact(self._reserve)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Fold the server's view of the remaining quota into the bucket."""
+        remaining = _header_float(headers, "x-ratelimit-remaining", "ratelimit-remaining")
+        if remaining is None:
+            return
+        reset = _header_float(headers, "x-ratelimit-reset", "ratelimit-reset")
+        limit = _header_float(headers, "x-ratelimit-limit", "ratelimit-limit")
+
+        def apply(state: _BucketState, now: float) -> None:
+            until = None
+            if reset is not None:
+                until = reset if reset >= _EPOCH_THRESHOLD else now + reset
+            if remaining <= 0:
+                if until is None or until <= now:
+                    state.tokens = min(state.tokens, 0.0)
+                    return
+                state.blocked_until = max(state.blocked_until, until)
+                # Release waiters one slot at a time after the reset instead of all at
+                # once: keep this window's pace, or spread the full limit otherwise.
+                pace = state.server_rate if state.server_until > now else None
+                if pace is None and limit is not None and limit > 0:
+                    pace = limit / (until - now)
+                if pace is not None:
+                    state.server_rate = pace
+                    state.server_until = until + (until - now)
+                state.tokens = 1.0
+                state.updated = max(state.updated, until)
+                return
+            state.tokens = min(state.tokens, remaining)
+            if until is not None and until > now:
+                state.server_rate = remaining / (until - now)
+                state.server_until = until
+
+        self._transact(apply)
+
+    def _effective_rate(self, state: _BucketState, now: float) -> float | None:
+        if state.server_rate is not None and state.server_until > now:
+            if self.rate is None:
+                return state.server_rate
+            return min(self.rate, state.server_rate)
+        return self.rate
+
+    def _reserve(self, state: _BucketState, now: float) -> float:
+        start = max(now, state.blocked_until)
+        rate = self._effective_rate(state, start)
+        if rate is None:
+            state.updated = max(state.updated, now)
+            return start - now
+        # While blocked, ``updated`` sits at the reset and the bucket refills from there.
+        state.tokens = min(float(self.burst), state.tokens + max(0.0, now - state.updated) * rate)
+        state.updated = max(state.updated, now)
+        state.tokens -= 1.0
+        wait = -state.tokens / rate if state.tokens < 0 else 0.0
+        return max(start - now, state.updated - now + wait)
+
+    def _transact(self, fn: Callable[[_BucketState, float], float | None]) -> float:
+        with self._lock:
+            if self._state_path is None:
+                now = self._clock()
+                return float(fn(self._state, now) or 0.0)
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = self._clock()
+                state = self._load(conn, now)
+                out = float(fn(state, now) or 0.0)
+                conn.execute(
+                    "INSERT OR REPLACE INTO buckets"
+                    "(name, tokens, updated, server_rate, server_until, blocked_until) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        self.name,
+                        state.tokens,
+                        state.updated,
+                        state.server_rate,
+                        state.server_until,
+                        state.blocked_until,
+                    ),
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return out
+
+    def _load(self, conn: sqlite3.Connection, now: float) -> _BucketState:
+        row = conn.execute(
+            "SELECT tokens, updated, server_rate, server_until, blocked_until "
+            "FROM buckets WHERE name = ?",
+            (self.name,),
+        ).fetchone()
+        if row is None:
+            return _BucketState(tokens=float(self.burst), updated=now)
+        tokens, updated, server_rate, server_until, blocked_until = row
+        return _BucketState(
+            float(tokens),
+            float(updated),
+            None if server_rate is None else float(server_rate),
+            float(server_until),
+            float(blocked_until),
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            assert self._state_path is not None
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self._state_path, timeout=30.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS buckets (
+                    name TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated REAL NOT NULL,
+                    server_rate REAL,
+                    server_until REAL NOT NULL,
+                    blocked_until REAL NOT NULL
+                )
+                """
+            )
+            self._db = conn
+        return self._db
@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import argparse
+import json
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+_PAGE_PATH = "docs/integrations-launch-readiness-workflow.md"
+_TOP10_PATH = "docs/top-10-github-strategy.md"
+_RELEASE_PRIORITIZATION_CLOSEOUT_SUMMARY_PATH = "docs/artifacts/release-prioritization-closeout-pack/release-prioritization-closeout-summary.json"
+_RELEASE_PRIORITIZATION_CLOSEOUT_BOARD_PATH = (
+    "docs/artifacts/release-prioritization-closeout-pack/release-prioritization-delivery-board.md"
+)
+_PLAN_PATH = "docs/roadmap/plans/launch-readiness-plan.json"
+_SECTION_HEADER = "# Launch readiness closeout lane"
+_REQUIRED_SECTIONS = [
+    "## Why Launch Readiness Closeout matters",
+    "## Required inputs (handoff artifacts)",
+    "## Command lane",
+    "## Launch readiness contract",
+    "## Launch readiness quality checklist",
+    "## Delivery board",
+    "## Scoring model",
+]
+_REQUIRED_COMMANDS = [
+    "python -m sdetkit launch-readiness-closeout --format json --strict",
+    "python -m sdetkit launch-readiness-closeout --emit-pack-dir docs/artifacts/launch-readiness-closeout-pack --format json --strict",
+    "python -m sdetkit launch-readiness-closeout --execute --evidence-dir docs/artifacts/launch-readiness-closeout-pack/evidence --format json --strict",
+    "python scripts/check_launch_readiness_contract.py",
+]
+_EXECUTION_COMMANDS = [
+    "python -m sdetkit launch-readiness-closeout --format json --strict",
+    "python -m sdetkit launch-readiness-closeout --emit-pack-dir docs/artifacts/launch-readiness-closeout-pack --format json --strict",
+    "python scripts/check_launch_readiness_contract.py --skip-evidence",
+]
+_REQUIRED_CONTRACT_LINES = [
+    "Single owner + backup reviewer are assigned for  launch readiness execution and signoff.",
+    "The  lane references  outcomes, controls, and trust continuity signals.",
+    "Every  section includes docs/template CTA, runnable command CTA, KPI threshold, and rollback guardrail.",
+    " closeout records launch readiness pack upgrades, storyline outcomes, and  launch priorities.",
+]
+_REQUIRED_QUALITY_LINES = [
+    "- [ ] Includes baseline evidence coverage, objection segmentation assumptions, and response SLA targets",
+    "- [ ] Every narrative lane row has owner, execution window, KPI threshold, and risk flag",
+    "- [ ] CTA links point to narrative docs/templates + runnable command evidence",
+    "- [ ] Scorecard captures launch readiness adoption delta, objection deflection delta, confidence, and rollback owner",
+    "- [ ] Artifact pack includes narrative brief, evidence plan, template diffs, outcome ledger, KPI scorecard, and execution log",
+]
+_REQUIRED_DELIVERY_BOARD_LINES = [
+    "- [ ]  evidence brief committed",
+    "- [ ]  launch readiness plan committed",
+    "- [ ]  narrative template upgrade ledger exported",
+    "- [ ]  storyline outcomes ledger exported",
+    "- [ ]  launch priorities drafted from  outcomes",
+]
+_REQUIRED_DATA_KEYS = [
+    '"plan_id"',
+    '"contributors"',
+    '"narrative_channels"',
+    '"baseline"',
+    '"target"',
+    '"owner"',
+]
+
+_DEFAULT_PAGE_TEMPLATE = "# Launch readiness closeout lane\n\n closes with a major upgrade that converts  release prioritization outcomes into a deterministic launch readiness operating lane.\n\n## Why Launch Readiness Closeout matters\n\n- Converts  release prioritization outcomes into reusable launch readiness decisions across launch briefs, release notes, and escalation playbooks.\n- Protects quality with strict contract coverage, runnable commands, KPI thresholds, and rollback safety.\n- Creates a deterministic handoff from  closeout into  launch priorities.\n\n## Required inputs (handoff artifacts)\n\n- `docs/artifacts/release-prioritization-closeout-pack/release-prioritization-closeout-summary.json`\n- `docs/artifacts/release-prioritization-closeout-pack/release-prioritization-delivery-board.md`\n- `docs/roadmap/plans/launch-readiness-plan.json`\n\n## Command lane\n\n```bash\npython -m sdetkit launch-readiness-closeout --format json --strict\npython -m sdetkit launch-readiness-closeout --emit-pack-dir docs/artifacts/launch-readiness-closeout-pack --format json --strict\npython -m sdetkit launch-readiness-closeout --execute --evidence-dir docs/artifacts/launch-readiness-closeout-pack/evidence --format json --strict\npython scripts/check_launch_readiness_contract.py\n```\n\n## Launch readiness contract\n\n- Single owner + backup reviewer are assigned for  launch readiness execution and signoff.\n- The  lane references  outcomes, controls, and trust continuity signals.\n- Every  section includes docs/template CTA, runnable command CTA, KPI threshold, and rollback guardrail.\n-  closeout records launch readiness pack upgrades, storyline outcomes, and  launch priorities.\n\n## Launch readiness quality checklist\n\n- [ ] Includes baseline evidence coverage, objection segmentation assumptions, and response SLA targets\n- [ ] Every narrative lane row has owner, execution window, KPI threshold, and risk flag\n- [ ] CTA links point to narrative docs/templates + runnable command evidence\n- [ ] Scorecard captures launch readiness adoption delta, objection deflection delta, confidence, and rollback owner\n- [ ] Artifact pack includes narrative brief, evidence plan, template diffs, outcome ledger, KPI scorecard, and execution log\n\n## Delivery board\n\n- [ ]  evidence brief committed\n- [ ]  launch readiness plan committed\n- [ ]  narrative template upgrade ledger exported\n- [ ]  storyline outcomes ledger exported\n- [ ]  launch priorities drafted from  outcomes\n\n## Scoring model\n\n weights continuity + execution contract + launch artifact readiness for a 100-point activation score.\n"
+
+
+def _read_text(path: Path) -> str:
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _checklist_count(markdown: str) -> int:
+    return sum(1 for line in markdown.splitlines() if line.strip().startswith("- ["))
+
+
+def build_launch_readiness_summary(root: Path) -> dict[str, Any]:
+    readme_text = _read_text(root / "README.md")
+    docs_index_text = _read_text(root / "docs/index.md")
+    page_text = _read_text(root / _PAGE_PATH)
+    top10_text = _read_text(root / _TOP10_PATH)
+
+    release_prioritization_summary = root / _RELEASE_PRIORITIZATION_CLOSEOUT_SUMMARY_PATH
+    release_prioritization_board = root / _RELEASE_PRIORITIZATION_CLOSEOUT_BOARD_PATH
+
+    release_prioritization_data = _load_json(release_prioritization_summary)
+    release_prioritization_summary_data = (
+        release_prioritization_data.get("summary", {})
+        if isinstance(release_prioritization_data.get("summary"), dict)
+        else {}
+    )
+    release_prioritization_score = int(
+        release_prioritization_summary_data.get("activation_score", 0) or 0
+    )
+    release_prioritization_strict = bool(
+        release_prioritization_summary_data.get("strict_pass", False)
+    )
+    release_prioritization_check_count = (
+        len(release_prioritization_data.get("checks", []))
+        if isinstance(release_prioritization_data.get("checks"), list)
+        else 0
+    )
+
+    board_text = _read_text(release_prioritization_board)
+    board_count = _checklist_count(board_text)
+    board_has_release_prioritization = "Launch Readiness Closeout" in board_text
+
+    missing_sections = [section for section in _REQUIRED_SECTIONS if section not in page_text]
+    missing_commands = [command for command in _REQUIRED_COMMANDS if command not in page_text]
+    missing_contract_lines = [line for line in _REQUIRED_CONTRACT_LINES if line not in page_text]
+    missing_quality_lines = [line for line in _REQUIRED_QUALITY_LINES if line not in page_text]
+    missing_board_items = [item for item in _REQUIRED_DELIVERY_BOARD_LINES if item not in page_text]
+
+    plan_text = _read_text(root / _PLAN_PATH)
+    missing_plan_keys = [key for key in _REQUIRED_DATA_KEYS if key not in plan_text]
+
+    checks: list[dict[str, Any]] = [
+        {
+            "check_id": "readme_command_lane",
+            "weight": 7,
+            "passed": ("launch-readiness-closeout" in readme_text),
+            "evidence": "README launch-readiness-closeout command lane",
+        },
+        {
+            "check_id": "docs_index_links",
+            "weight": 8,
+            "passed": (
+                "impact-86-big-upgrade-report.md" in docs_index_text
+                and "integrations-launch-readiness-workflow.md" in docs_index_text
+            ),
+            "evidence": "impact-86-big-upgrade-report.md + integrations-launch-readiness-workflow.md",
+        },
+        {
+            "check_id": "top10_strategy_alignment",
+            "weight": 5,
+            "passed": (
+                "Launch Readiness Closeout" in top10_text
+                and "Launch Readiness Closeout" in top10_text
+            ),
+            "evidence": "Launch Readiness Closeout strategy chain",
+        },
+        {
+            "check_id": "release_prioritization_summary_present",
+            "weight": 10,
+            "passed": release_prioritization_summary.exists(),
+            "evidence": str(release_prioritization_summary),
+        },
+        {
+            "check_id": "release_prioritization_delivery_board_present",
+            "weight": 7,
+            "passed": release_prioritization_board.exists(),
+            "evidence": str(release_prioritization_board),
+        },
+        {
+            "check_id": "release_prioritization_quality_floor",
+            "weight": 13,
+            "passed": release_prioritization_score >= 85 and release_prioritization_strict,
+            "evidence": {
+                "release_prioritization_score": release_prioritization_score,
+                "strict_pass": release_prioritization_strict,
+                "release_prioritization_checks": release_prioritization_check_count,
+            },
+        },
+        {
+            "check_id": "release_prioritization_board_integrity",
+            "weight": 5,
+            "passed": board_count >= 5 and board_has_release_prioritization,
+            "evidence": {
+                "board_items": board_count,
+                "contains_release_prioritization": board_has_release_prioritization,
+            },
+        },
+        {
+            "check_id": "page_header",
+            "weight": 7,
+            "passed": _SECTION_HEADER in page_text,
+            "evidence": _SECTION_HEADER,
+        },
+        {
+            "check_id": "required_sections",
+            "weight": 8,
+            "passed": not missing_sections,
+            "evidence": missing_sections or "all sections present",
+        },
+        {
+            "check_id": "required_commands",
+            "weight": 5,
+            "passed": not missing_commands,
+            "evidence": missing_commands or "all commands present",
+        },
+        {
+            "check_id": "contract_lock",
+            "weight": 5,
+            "passed": not missing_contract_lines,
+            "evidence": missing_contract_lines or "contract locked",
+        },
+        {
+            "check_id": "quality_checklist_lock",
+            "weight": 5,
+            "passed": not missing_quality_lines,
+            "evidence": missing_quality_lines or "quality checklist locked",
+        },
+        {
+            "check_id": "delivery_board_lock",
+            "weight": 5,
+            "passed": not missing_board_items,
+            "evidence": missing_board_items or "delivery board locked",
+        },
+        {
+            "check_id": "evidence_plan_data_present",
+            "weight": 10,
+            "passed": not missing_plan_keys,
+            "evidence": missing_plan_keys or _PLAN_PATH,
+        },
+    ]
+
+    failed = [c for c in checks if not c["passed"]]
+    critical_failures: list[str] = []
+    if not release_prioritization_summary.exists() or not release_prioritization_board.exists():
+        critical_failures.append("release_prioritization_handoff_inputs")
+
+    wins: list[str] = []
+    misses: list[str] = []
+    handoff_actions: list[str] = []
+
+    if release_prioritization_score >= 85 and release_prioritization_strict:
+        wins.append(
+            f"Release prioritization continuity baseline is stable with activation score={release_prioritization_score}."
+        )
+    else:
+        misses.append(" continuity baseline is below the floor (<85) or not strict-pass.")
+        handoff_actions.append(
+            "Re-run the closeout command and raise baseline quality above 85 with strict pass before launch readiness closeout lock."
+        )
+
+    if board_count >= 5 and board_has_release_prioritization:
+        wins.append(f"85 delivery board integrity validated with {board_count} checklist items.")
+    else:
+        misses.append(" delivery board integrity is incomplete (needs >=5 items and  anchors).")
+        handoff_actions.append("Repair  delivery board entries to include  anchors.")
+
+    if not missing_plan_keys:
+        wins.append(" launch readiness dataset is available for launch execution.")
+    else:
+        misses.append(" launch readiness dataset is missing required keys.")
+        handoff_actions.append(
+            "Update docs/roadmap/plans/launch-readiness-plan.json to restore required keys."
+        )
+
+    if not failed and not critical_failures:
+        wins.append(
+            " launch readiness closeout lane is fully complete and ready for  launch planning."
+        )
+
+    score = int(round(sum(c["weight"] for c in checks if c["passed"])))
+    return {
+        "name": "launch-readiness-closeout",
+        "inputs": {
+            "readme": "README.md",
+            "docs_index": "docs/index.md",
+            "docs_page": _PAGE_PATH,
+            "top10": _TOP10_PATH,
+            "release_prioritization_summary": str(release_prioritization_summary.relative_to(root))
+            if release_prioritization_summary.exists()
+            else str(release_prioritization_summary),
+            "release_prioritization_delivery_board": str(
+                release_prioritization_board.relative_to(root)
+            )
+            if release_prioritization_board.exists()
+            else str(release_prioritization_board),
+            "launch_readiness_plan": _PLAN_PATH,
+        },
+        "checks": checks,
+        "rollup": {
+            "release_prioritization_activation_score": release_prioritization_score,
+            "release_prioritization_checks": release_prioritization_check_count,
+            "release_prioritization_delivery_board_items": board_count,
+        },
+        "summary": {
+            "activation_score": score,
+            "passed_checks": len(checks) - len(failed),
+            "failed_checks": len(failed),
+            "critical_failures": critical_failures,
+            "strict_pass": not failed and not critical_failures,
+        },
+        "wins": wins,
+        "misses": misses,
+        "handoff_actions": handoff_actions,
+    }
+
+
+def _render_text(payload: dict[str, Any]) -> str:
+    lines = [
+        " launch readiness closeout summary",
+        f"- Activation score: {payload['summary']['activation_score']}",
+        f"- Passed checks: {payload['summary']['passed_checks']}",
+        f"- Failed checks: {payload['summary']['failed_checks']}",
+        f"- Critical failures: {payload['summary']['critical_failures']}",
+    ]
+    return "\n".join(lines)
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _emit_pack(root: Path, pack_dir: Path, payload: dict[str, Any]) -> None:
+    target = pack_dir if pack_dir.is_absolute() else root / pack_dir
+    _write(
+        target / "launch-readiness-closeout-summary.json",
+        json.dumps(payload, indent=2) + "\n",
+    )
+    _write(target / "launch-readiness-closeout-summary.md", _render_text(payload) + "\n")
+    _write(target / "launch-readiness-evidence-brief.md", "#  launch readiness brief\n")
+    _write(target / "launch-readiness-plan.md", "#  launch readiness plan\n")
+    _write(
+        target / "launch-readiness-narrative-template-upgrade-ledger.json",
+        json.dumps({"upgrades": []}, indent=2) + "\n",
+    )
+    _write(
+        target / "launch-readiness-storyline-outcomes-ledger.json",
+        json.dumps({"outcomes": []}, indent=2) + "\n",
+    )
+    _write(
+        target / "launch-readiness-narrative-kpi-scorecard.json",
+        json.dumps({"kpis": []}, indent=2) + "\n",
+    )
+    _write(target / "launch-readiness-execution-log.md", "#  execution log\n")
+    _write(
+        target / "launch-readiness-delivery-board.md",
+        "\n".join(["# Launch Readiness Closeout delivery board", *_REQUIRED_DELIVERY_BOARD_LINES])
+        + "\n",
+    )
+    _write(
+        target / "launch-readiness-validation-commands.md",
+        "#  validation commands\n\n```bash\n" + "\n".join(_EXECUTION_COMMANDS) + "\n```\n",
+    )
+
+
+def _execute_commands(root: Path, evidence_dir: Path) -> None:
+    events: list[dict[str, Any]] = []
+    out_dir = evidence_dir if evidence_dir.is_absolute() else root / evidence_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for idx, command in enumerate(_EXECUTION_COMMANDS, start=1):
+        argv = shlex.split(command)
+        if argv and argv[0] == "python":
+            argv[0] = sys.executable
+        result = subprocess.run(argv, cwd=root, capture_output=True, text=True)
+        event = {
+            "command": command,
+            "returncode": result.returncode,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+        }
+        events.append(event)
+        _write(out_dir / f"command-{idx:02d}.log", json.dumps(event, indent=2) + "\n")
+    _write(
+        out_dir / "launch-readiness-execution-summary.json",
+        json.dumps({"total_commands": len(events), "commands": events}, indent=2) + "\n",
+    )
+
+
+def build_launch_readiness_summary_impl(root: Path) -> dict[str, Any]:
+    "Compatibility alias for legacy -based builder name."
+    return build_launch_readiness_summary(root)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=" launch readiness closeout checks")
+    parser.add_argument("--root", default=".")
+    parser.add_argument("--format", choices=["json", "text"], default="text")
+    parser.add_argument("--strict", action="store_true")
+    parser.add_argument("--emit-pack-dir")
+    parser.add_argument("--execute", action="store_true")
+    parser.add_argument("--evidence-dir")
+    parser.add_argument("--write-default-doc", action="store_true")
+    ns = parser.parse_args(argv)
+
+    root = Path(ns.root).resolve()
+    if ns.write_default_doc:
+        _write(root / _PAGE_PATH, _DEFAULT_PAGE_TEMPLATE)
+
+    payload = build_launch_readiness_summary(root)
+
+    if ns.emit_pack_dir:
+        _emit_pack(root, Path(ns.emit_pack_dir), payload)
+    if ns.execute:
+        evidence_dir = (
+            Path(ns.evidence_dir)
+            if ns.evidence_dir
+            else Path("docs/artifacts/launch-readiness-closeout-pack/evidence")
+        )
+        _execute_commands(root, evidence_dir)
+
+    print(json.dumps(payload, indent=2) if ns.format == "json" else _render_text(payload))
+    return 1 if ns.strict and not payload["summary"]["strict_pass"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
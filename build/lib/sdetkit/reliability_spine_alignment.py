@@ -0,0 +1,797 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+SCHEMA_VERSION = "sdetkit.reliability_spine_alignment.v1"
+PR_QUALITY_LIVE_WORKSPACE_MODULE = "_".join(("pr", "quality", "live", "benchmark", "workspace"))
+REPLAYABLE_BENCHMARK_MODULE = "_".join(("replayable", "benchmark", "harness"))
+REPO_MEMORY_PROFILE_HISTORY_MODULE = "_".join(("repo", "memory", "profile", "history"))
+TRUSTED_HISTORY_EVIDENCE_MODULE = "_".join(("trusted", "history", "evidence"))
+FLAKY_TEST_REGISTRY_EVIDENCE_MODULE = "_".join(("flaky", "test", "registry", "evidence"))
+TRUSTED_FLAKY_TEST_REGISTRY_PRODUCER_MODULE = "_".join(
+    ("trusted", "flaky", "test", "registry", "producer")
+)
+TRUSTED_TEST_OBSERVATION_CAPTURE_MODULE = "_".join(("trusted", "test", "observation", "capture"))
+TRUSTED_TEST_OBSERVATION_HISTORY_MODULE = "_".join(("trusted", "test", "observation", "history"))
+TRUSTED_TEST_OBSERVATION_CLASSIFICATION_MODULE = "_".join(
+    ("trusted", "test", "observation", "classification")
+)
+SECURITY_FINDING_DIAGNOSIS_MODULE = "_".join(("security", "finding", "diagnosis"))
+SECURITY_REVIEWED_DISPOSITION_HISTORY_MODULE = "_".join(
+    ("security", "reviewed", "disposition", "history")
+)
+NEXT_RECOMMENDED_PR = "none"
+
+SPINE_STAGES = (
+    "evidence",
+    "diagnosis",
+    "decision",
+    "remediation_eligibility",
+    "proof",
+    "trajectory",
+    "reporting",
+    "history",
+    "verifier",
+    "benchmark",
+)
+
+VALID_STATUSES = {
+    "aligned",
+    "partially_aligned",
+    "planned",
+    "needs_review",
+}
+
+JsonObject = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class AlignmentComponent:
+    module: str
+    role: str
+    status: str
+    stages: tuple[str, ...]
+    existing_artifacts: tuple[str, ...]
+    integration_points: tuple[str, ...]
+    gaps: tuple[str, ...]
+    recommended_next_action: str
+
+
+def _component(
+    *,
+    module: str,
+    role: str,
+    status: str,
+    stages: tuple[str, ...],
+    existing_artifacts: tuple[str, ...] = (),
+    integration_points: tuple[str, ...] = (),
+    gaps: tuple[str, ...] = (),
+    recommended_next_action: str = "keep aligned with the reliability spine",
+) -> AlignmentComponent:
+    if status not in VALID_STATUSES:
+        msg = f"invalid alignment status for {module}: {status}"
+        raise ValueError(msg)
+
+    unknown_stages = sorted(set(stages) - set(SPINE_STAGES))
+    if unknown_stages:
+        msg = f"invalid spine stages for {module}: {', '.join(unknown_stages)}"
+        raise ValueError(msg)
+
+    return AlignmentComponent(
+        module=module,
+        role=role,
+        status=status,
+        stages=stages,
+        existing_artifacts=existing_artifacts,
+        integration_points=integration_points,
+        gaps=gaps,
+        recommended_next_action=recommended_next_action,
+    )
+
+
+def build_alignment_components() -> list[AlignmentComponent]:
+    return [
+        _component(
+            module="failed_check_log_collection",
+            role="collect failed check logs and make raw CI evidence available",
+            status="aligned",
+            stages=("evidence",),
+            existing_artifacts=("failed-check-logs", "download-failed-check-logs.sh"),
+            integration_points=("check_intelligence", "PR Quality workflow"),
+            recommended_next_action="keep as the CI log collection entry point",
+        ),
+        _component(
+            module="check_intelligence",
+            role="normalize checks, logs, security review, and code scanning into action reports",
+            status="aligned",
+            stages=("evidence", "diagnosis", "decision", "reporting"),
+            existing_artifacts=("check-intelligence.json", "action-report.json"),
+            integration_points=(
+                "pr_quality_action_report",
+                "evidence_graph",
+                "trajectory_store",
+            ),
+            recommended_next_action="preserve canonical exact-failure evidence quality and keep uncertainty review-first",
+        ),
+        _component(
+            module="diagnostic_vector_engine",
+            role="produce canonical diagnostic and failure vectors",
+            status="aligned",
+            stages=("evidence", "diagnosis", "trajectory"),
+            existing_artifacts=("diagnostic-vector.json", "failure-vector.json"),
+            integration_points=("remediation_plan_engine", "trajectory_store"),
+            recommended_next_action="feed future PatchScorer and verifier decisions",
+        ),
+        _component(
+            module="remediation_plan_engine",
+            role="plan review-first and safe-fix remediation routes with PatchScorer and ProtectedVerifier reporting",
+            status="aligned",
+            stages=("decision", "remediation_eligibility", "proof", "reporting"),
+            existing_artifacts=(
+                "remediation plans",
+                "ProtectedVerifier remediation-plan context",
+            ),
+            integration_points=(
+                "diagnostic_vector_engine",
+                "trajectory_store",
+                "patch_scorer",
+                "protected_verifier",
+            ),
+            recommended_next_action="keep remediation-plan context reporting-only until structural and semantic proof mature",
+        ),
+        _component(
+            module="safe_remediation_eligibility",
+            role="decide whether a failed surface is eligible for narrow mechanical remediation",
+            status="aligned",
+            stages=("decision", "remediation_eligibility"),
+            integration_points=("check_intelligence", "maintenance_autopilot"),
+            recommended_next_action="keep unknown, security, release, and dependency cases review-first",
+        ),
+        _component(
+            module="maintenance_autopilot",
+            role="bridge approved safe formatting fixes into PR branches",
+            status="partially_aligned",
+            stages=("remediation_eligibility", "proof"),
+            integration_points=(
+                "check_intelligence",
+                "safe_remediation_eligibility",
+                "patch_scorer",
+            ),
+            gaps=(
+                "PatchScorer exists but is not wired into automation yet",
+                "protected_verifier exists only as read-only structural evaluation",
+            ),
+            recommended_next_action="keep formatting-only and unwired until stronger verification exists",
+        ),
+        _component(
+            module="pr_quality_evidence_narrative",
+            role="explain quality, evidence graph, and changed-file signals",
+            status="aligned",
+            stages=("evidence", "reporting"),
+            existing_artifacts=("pr-evidence-narrative.json", "pr-evidence-narrative.md"),
+            integration_points=("pr_quality_action_report", "trajectory_store"),
+            recommended_next_action="keep evidence-review and proof-signal semantics explicit",
+        ),
+        _component(
+            module="evidence_graph",
+            role="connect sentinel, failure bundle, and PR Quality evidence into review/proof signals",
+            status="aligned",
+            stages=("evidence", "diagnosis", "decision"),
+            existing_artifacts=("evidence-graph.json",),
+            integration_points=("pr_quality_evidence_narrative", "operator_evidence_loop"),
+            recommended_next_action="use graph signals as durable trajectory inputs",
+        ),
+        _component(
+            module="pr_quality_action_report",
+            role="render a reviewer-first interactive PR Quality console over status, evidence, trajectory, runtime proof, trusted history, and aggregate producer-vetted registry summaries",
+            status="aligned",
+            stages=("reporting", "trajectory", "proof", "history"),
+            existing_artifacts=(
+                "pr-comment-body.md",
+                "pr-comment-metadata.json",
+                "pr-review-summary.md",
+                "pr-review-dashboard.html",
+            ),
+            integration_points=(
+                "check_intelligence",
+                "trajectory_store",
+                "pr_quality_runtime_proof_artifacts",
+            ),
+            recommended_next_action="preserve human-readable decisions, conditional evidence disclosure, bot quick-actions, reporting-only authority, and the existing no-authority contract",
+        ),
+        _component(
+            module="pr_quality_runtime_proof_artifacts",
+            role="summarize isolated proof, live benchmark, RepoMemory, trusted accepted-main history, and aggregate producer-vetted registry evidence for PR Quality visibility",
+            status="aligned",
+            stages=("proof", "benchmark", "history", "reporting"),
+            existing_artifacts=(
+                "runtime-proof-artifacts.json",
+                "runtime-proof-artifacts.md",
+            ),
+            integration_points=(
+                "git_inventory_collector",
+                "isolated_proof_runner",
+                "proof_runtime_guard",
+                "network_boundary",
+                PR_QUALITY_LIVE_WORKSPACE_MODULE,
+                "replayable_benchmark_harness",
+                "repo_memory",
+                TRUSTED_HISTORY_EVIDENCE_MODULE,
+                "pr_quality_action_report",
+            ),
+            recommended_next_action="keep runtime, benchmark, memory, accepted-main history, and registry aggregate visibility reporting-only",
+        ),
+        _component(
+            module=PR_QUALITY_LIVE_WORKSPACE_MODULE,
+            role="prepare disposable Git scenario repositories for live PR Quality benchmark evidence",
+            status="aligned",
+            stages=("proof", "benchmark", "reporting"),
+            existing_artifacts=(
+                "workspace-manifest.json",
+                "workspace-manifest.md",
+            ),
+            integration_points=(
+                REPLAYABLE_BENCHMARK_MODULE,
+                "pr_quality_runtime_proof_artifacts",
+            ),
+            recommended_next_action="keep generated scenario repositories temporary and non-authoritative",
+        ),
+        _component(
+            module="trajectory_store",
+            role="record action, response, diagnosis, decision, fix, proof, and result",
+            status="aligned",
+            stages=("trajectory", "decision", "proof"),
+            existing_artifacts=("trajectory.jsonl",),
+            integration_points=(
+                "diagnostic_vector_engine",
+                "pr_quality_action_report",
+                "trajectory_history_report",
+            ),
+            recommended_next_action="remain local-first and deterministic",
+        ),
+        _component(
+            module="trajectory_history_report",
+            role="summarize trajectory records by final result, risk surface, class, and action",
+            status="aligned",
+            stages=("history", "reporting"),
+            existing_artifacts=("trajectory history JSON/Markdown reports",),
+            integration_points=("trajectory_store", "trajectory_pattern_insights"),
+            recommended_next_action="feed trajectory pattern insights and later RepoMemory",
+        ),
+        _component(
+            module="trajectory_pattern_insights",
+            role="detect recurring review-first and safe-fix patterns from trajectory history",
+            status="aligned",
+            stages=("history", "decision", "reporting"),
+            existing_artifacts=("trajectory pattern insights JSON/Markdown reports",),
+            integration_points=(
+                "trajectory_history_report",
+                "patch_scorer",
+                "repo_memory",
+            ),
+            recommended_next_action="feed candidate patterns into patch_scorer and repo_memory without expanding automation",
+        ),
+        _component(
+            module="current_head_failure_bundle",
+            role="capture current-head failure evidence with same-head trajectory links for operator inspection",
+            status="aligned",
+            stages=("evidence", "trajectory", "reporting", "history"),
+            existing_artifacts=("current-head failure bundle", "same-head trajectory summary"),
+            integration_points=(
+                "pr_quality_action_report",
+                "trajectory_store",
+                "trajectory_history_report",
+            ),
+            recommended_next_action="keep same-head trajectory links reporting-only and authority-denied",
+        ),
+        _component(
+            module="operator_evidence_loop",
+            role="assemble verified operator evidence loop outputs with optional read-only trajectory, PatchScorer, and ProtectedVerifier projections",
+            status="aligned",
+            stages=(
+                "evidence",
+                "diagnosis",
+                "decision",
+                "history",
+                "proof",
+                "reporting",
+            ),
+            existing_artifacts=(
+                "operator-loop.json",
+                "operator-loop.md",
+                "read-only reporting projections",
+            ),
+            integration_points=(
+                "evidence_graph",
+                "pr_quality_action_report",
+                "trajectory_history_report",
+                "patch_scorer",
+                "protected_verifier",
+            ),
+            recommended_next_action="keep producer artifacts optional, reporting-only, and excluded from operator classification",
+        ),
+        _component(
+            module="security_review_evidence",
+            role="collect and summarize unresolved security review findings",
+            status="aligned",
+            stages=("evidence", "decision", "reporting"),
+            integration_points=("check_intelligence", "pr_quality_action_report"),
+            recommended_next_action="keep security findings review-first",
+        ),
+        _component(
+            module=SECURITY_FINDING_DIAGNOSIS_MODULE,
+            role="diagnose current and stale security findings into sanitized fix-or-review proposals without authorizing action",
+            status="aligned",
+            stages=("evidence", "diagnosis", "decision", "reporting"),
+            existing_artifacts=(
+                "security-finding-diagnosis.json",
+                "security-finding-diagnosis.md",
+            ),
+            integration_points=(
+                "security_review_evidence",
+                "check_intelligence",
+                "pr_quality_action_report",
+                "PR Quality workflow",
+            ),
+            recommended_next_action="record human-reviewed fix and dismissal dispositions before considering any security automation",
+        ),
+        _component(
+            module=SECURITY_REVIEWED_DISPOSITION_HISTORY_MODULE,
+            role="record sanitized human-reviewed dismissed security findings from accepted-main merged PR evidence and expose verified advisory context without authorizing reuse",
+            status="aligned",
+            stages=("evidence", "diagnosis", "history", "reporting"),
+            existing_artifacts=(
+                "security-reviewed-disposition-history.jsonl",
+                "security-reviewed-disposition-history-summary.json",
+                "security-reviewed-disposition-history-summary.md",
+            ),
+            integration_points=(
+                "RepoMemory Profile History workflow",
+                "security_finding_diagnosis",
+                "pr_quality_action_report",
+                "PR Quality workflow",
+            ),
+            recommended_next_action="preserve manual security authority while advancing exact failure extraction and safe remediation",
+        ),
+        _component(
+            module="adaptive_diagnosis",
+            role="classify log symptoms into diagnostic candidates",
+            status="aligned",
+            stages=("diagnosis",),
+            integration_points=("check_intelligence",),
+            recommended_next_action="preserve confidence-scored exact-failure feedback and keep unknown evidence review-first",
+        ),
+        _component(
+            module="patch_scorer",
+            role="score proposed patch safety before any future automation consumes it",
+            status="partially_aligned",
+            stages=("decision", "remediation_eligibility", "proof"),
+            existing_artifacts=("patch-score.json", "patch-score.md"),
+            integration_points=(
+                "remediation_plan_engine",
+                "trajectory_pattern_insights",
+                "protected_verifier",
+            ),
+            gaps=(
+                "read-only prototype is not wired into maintenance_autopilot",
+                "structural verification does not yet prove semantic equivalence",
+            ),
+            recommended_next_action="keep the existing PR Quality candidate handoff reporting-only and unwired from automation until semantic proof exists",
+        ),
+        _component(
+            module="protected_verifier",
+            role="verify PatchScorer candidate scope and captured proof results without authorizing mutation",
+            status="partially_aligned",
+            stages=("proof", "verifier", "reporting"),
+            existing_artifacts=(
+                "protected-verifier-result.json",
+                "protected-verifier-result.md",
+            ),
+            integration_points=(
+                "patch_scorer",
+                "git_inventory_collector",
+                "isolated_proof_runner",
+                "replayable_benchmark_harness",
+                "maintenance_autopilot",
+            ),
+            gaps=(
+                "Git-derived allowlisted proof is benchmarked only for limited live scenarios",
+                "structural and allowlisted command proof do not establish semantic equivalence",
+                "not wired into automation",
+            ),
+            recommended_next_action="extend anti-cheat and isolation proof without changing automation",
+        ),
+        _component(
+            module="git_inventory_collector",
+            role="derive changed-file inventories from fixed read-only Git queries and expose per-profile current-head proof context",
+            status="aligned",
+            stages=("evidence", "proof", "verifier", "reporting"),
+            existing_artifacts=(
+                "git-inventory.json",
+                "git-inventory.md",
+                "runtime-proof-artifacts.json",
+                "runtime-proof-artifacts.md",
+            ),
+            integration_points=(
+                "isolated_proof_runner",
+                "protected_verifier",
+                "replayable_benchmark_harness",
+                "pr_quality_runtime_proof_artifacts",
+                "pr_quality_action_report",
+            ),
+            recommended_next_action="preserve bounded multi-profile visibility and keep proof, patch, and merge authority disabled",
+        ),
+        _component(
+            module="network_boundary",
+            role="runtime-probe registered network namespace backends and fail closed unless the exact executable and controlled loopback contract are verified",
+            status="aligned",
+            stages=("proof", "verifier", "reporting"),
+            existing_artifacts=(
+                "network-boundary.json",
+                "network-boundary.md",
+                "controlled loopback backend probe",
+            ),
+            integration_points=(
+                "isolated_proof_runner",
+                "replayable_benchmark_harness",
+                "repo_memory",
+            ),
+            recommended_next_action="keep verified network isolation narrow, runtime-reprobed, and independent of filesystem or process containment claims",
+        ),
+        _component(
+            module="proof_runtime_guard",
+            role="classify copied-workspace writes and reserved evidence shadowing during proof execution",
+            status="partially_aligned",
+            stages=("proof", "verifier", "reporting"),
+            existing_artifacts=("embedded runtime-guard evidence",),
+            integration_points=(
+                "isolated_proof_runner",
+                "replayable_benchmark_harness",
+                "repo_memory",
+            ),
+            gaps=(
+                "detects copied-workspace behavior but does not prevent external filesystem writes",
+                "process escape prevention remains unavailable",
+            ),
+            recommended_next_action="keep runtime-guard visibility reporting-only",
+        ),
+        _component(
+            module="isolated_proof_runner",
+            role="execute allowlisted proof profiles in a disposable workspace copy and capture results",
+            status="partially_aligned",
+            stages=("proof", "verifier", "reporting"),
+            existing_artifacts=(
+                "verification-evidence.json",
+                "verification-evidence.md",
+                "network-boundary.json",
+            ),
+            integration_points=(
+                "git_inventory_collector",
+                "network_boundary",
+                "proof_runtime_guard",
+                "protected_verifier",
+                "replayable_benchmark_harness",
+                "repo_memory",
+            ),
+            gaps=("external filesystem and process escape prevention remain unavailable",),
+            recommended_next_action="keep runtime-reprobed network isolation separate from unavailable filesystem and process containment",
+        ),
+        _component(
+            module="replayable_benchmark_harness",
+            role="replay fixture-backed and Git-grounded isolated-proof scenarios through safety contracts",
+            status="partially_aligned",
+            stages=("benchmark", "proof", "verifier", "reporting"),
+            existing_artifacts=(
+                "benchmark-report.json",
+                "benchmark-report.md",
+                "fixture scenario JSON",
+                "Git-grounded isolated-proof scenario reports",
+            ),
+            integration_points=(
+                "git_inventory_collector",
+                "network_boundary",
+                "proof_runtime_guard",
+                "isolated_proof_runner",
+                "patch_scorer",
+                "protected_verifier",
+                "repo_memory",
+            ),
+            gaps=("external filesystem and process containment remain unavailable",),
+            recommended_next_action="replay the verified network-backend contract without expanding proof or merge authority",
+        ),
+        _component(
+            module=TRUSTED_TEST_OBSERVATION_CAPTURE_MODULE,
+            role="normalize raw per-test outcomes from real accepted-main Full CI execution without classifying flakiness",
+            status="aligned",
+            stages=("evidence", "reporting"),
+            existing_artifacts=(
+                "trusted-test-observations.json",
+                "trusted-test-observations.md",
+            ),
+            integration_points=(
+                "CI Full CI lane",
+                "quality.sh cov",
+            ),
+            recommended_next_action="preserve capture as raw input and route it only through trusted observation history before any flaky-test classification",
+        ),
+        _component(
+            module=TRUSTED_TEST_OBSERVATION_HISTORY_MODULE,
+            role="aggregate provenance-checked accepted-main fingerprinted test outcomes into immutable read-only cross-run history without classifying flakiness",
+            status="aligned",
+            stages=("evidence", "history", "reporting"),
+            existing_artifacts=(
+                "trusted-test-observation-history.jsonl",
+                "trusted-test-observation-history-summary.json",
+                "trusted-test-observation-history-summary.md",
+            ),
+            integration_points=(
+                TRUSTED_TEST_OBSERVATION_CAPTURE_MODULE,
+                TRUSTED_TEST_OBSERVATION_CLASSIFICATION_MODULE,
+                "CI Full CI lane",
+                "RepoMemory Profile History workflow",
+            ),
+            recommended_next_action="keep immutable history as the only input to the dedicated fingerprint classification contract",
+        ),
+        _component(
+            module=TRUSTED_TEST_OBSERVATION_CLASSIFICATION_MODULE,
+            role="classify provenance-bound fingerprint outcome histories into deterministic advisory states without recovering raw test identity",
+            status="aligned",
+            stages=("evidence", "diagnosis", "history", "reporting"),
+            existing_artifacts=(
+                "trusted-test-observation-classification.json",
+                "trusted-test-observation-classification.md",
+            ),
+            integration_points=(TRUSTED_TEST_OBSERVATION_HISTORY_MODULE,),
+            recommended_next_action="keep the dedicated artifact advisory-only and route it only through the trusted producer fingerprint adapter before workflow integration",
+        ),
+        _component(
+            module=TRUSTED_FLAKY_TEST_REGISTRY_PRODUCER_MODULE,
+            role="validate and adapt an optional dedicated advisory fingerprint classification artifact into fail-closed fingerprint-only registry evidence",
+            status="aligned",
+            stages=("evidence", "history", "reporting"),
+            existing_artifacts=(
+                "trusted-flaky-test-registry-producer.json",
+                "trusted-flaky-test-registry-producer.md",
+                "classification_handoff summary",
+                "flaky-test-registry-evidence.json",
+                "flaky-test-registry-evidence.md",
+            ),
+            integration_points=(
+                TRUSTED_TEST_OBSERVATION_CLASSIFICATION_MODULE,
+                "RepoMemory Profile History workflow",
+                FLAKY_TEST_REGISTRY_EVIDENCE_MODULE,
+                "repo_memory",
+            ),
+            recommended_next_action="keep producer-vetted registry output advisory-only while exposing aggregate accepted-main context to PR Quality",
+        ),
+        _component(
+            module=FLAKY_TEST_REGISTRY_EVIDENCE_MODULE,
+            role="normalize legacy operator review and producer-vetted fingerprint classifications as advisory registry evidence",
+            status="aligned",
+            stages=("evidence", "history", "reporting"),
+            existing_artifacts=(
+                "flaky-test-registry-evidence.json",
+                "flaky-test-registry-evidence.md",
+            ),
+            integration_points=(
+                "intelligence flake classify",
+                TRUSTED_FLAKY_TEST_REGISTRY_PRODUCER_MODULE,
+                "repo_memory",
+                "RepoMemory Profile History workflow",
+            ),
+            recommended_next_action="keep producer-vetted registry evidence aggregate-only and advisory-only in PR Quality",
+        ),
+        _component(
+            module="repo_memory",
+            role="produce local repo-specific memory profiles from trajectory, benchmark, and advisory fingerprint-only registry evidence",
+            status="aligned",
+            stages=("history", "decision", "reporting"),
+            existing_artifacts=(
+                "repo-memory-profile.json",
+                "repo-memory-profile.md",
+            ),
+            integration_points=(
+                "trajectory_pattern_insights",
+                "network_boundary",
+                "proof_runtime_guard",
+                "replayable_benchmark_harness",
+                "protected_verifier",
+                "pr_quality_runtime_proof_artifacts",
+                REPO_MEMORY_PROFILE_HISTORY_MODULE,
+                FLAKY_TEST_REGISTRY_EVIDENCE_MODULE,
+                TRUSTED_FLAKY_TEST_REGISTRY_PRODUCER_MODULE,
+                TRUSTED_TEST_OBSERVATION_CAPTURE_MODULE,
+                TRUSTED_TEST_OBSERVATION_HISTORY_MODULE,
+            ),
+            recommended_next_action="consume only runtime-verified network-boundary evidence while keeping accepted-main aggregate registry visibility reporting-only",
+        ),
+        _component(
+            module=REPO_MEMORY_PROFILE_HISTORY_MODULE,
+            role="record trusted-main RepoMemory profile snapshots and aggregate producer-vetted registry context through an immutable artifact history chain",
+            status="aligned",
+            stages=("history", "reporting"),
+            existing_artifacts=(
+                "repo-memory-profile-history.jsonl",
+                "repo-memory-history-summary.json",
+                "repo-memory-history-summary.md",
+            ),
+            integration_points=(
+                "repo_memory",
+                TRUSTED_FLAKY_TEST_REGISTRY_PRODUCER_MODULE,
+                TRUSTED_HISTORY_EVIDENCE_MODULE,
+                "RepoMemory Profile History workflow",
+            ),
+            recommended_next_action="keep trusted-main history immutable, aggregate-only, and advisory-only",
+        ),
+        _component(
+            module=TRUSTED_HISTORY_EVIDENCE_MODULE,
+            role="validate successful accepted-main RepoMemory history artifacts and aggregate producer-vetted registry context for advisory PR Quality visibility",
+            status="aligned",
+            stages=("evidence", "history", "reporting"),
+            existing_artifacts=(
+                "trusted-history-evidence.json",
+                "trusted-history-evidence.md",
+            ),
+            integration_points=(
+                REPO_MEMORY_PROFILE_HISTORY_MODULE,
+                "pr_quality_runtime_proof_artifacts",
+                "pr_quality_action_report",
+                "PR Quality workflow",
+            ),
+            recommended_next_action="keep accepted-main history and registry aggregate reporting-only and independent of merge authority",
+        ),
+    ]
+
+
+def _component_payload(component: AlignmentComponent) -> JsonObject:
+    payload = asdict(component)
+    return {
+        key: list(value) if isinstance(value, tuple) else value for key, value in payload.items()
+    }
+
+
+def build_alignment_report(
+    components: list[AlignmentComponent] | None = None,
+) -> JsonObject:
+    rows = components or build_alignment_components()
+    status_counts = Counter(component.status for component in rows)
+    stage_counts: Counter[str] = Counter()
+    for component in rows:
+        stage_counts.update(component.stages)
+
+    gaps = [
+        {
+            "module": component.module,
+            "gaps": list(component.gaps),
+            "recommended_next_action": component.recommended_next_action,
+        }
+        for component in rows
+        if component.gaps
+    ]
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "component_count": len(rows),
+        "status_counts": dict(sorted(status_counts.items())),
+        "stage_counts": dict(sorted(stage_counts.items())),
+        "components": [_component_payload(component) for component in rows],
+        "gaps": gaps,
+        "next_recommended_pr": NEXT_RECOMMENDED_PR,
+    }
+
+
+def render_alignment_markdown(report: Mapping[str, Any]) -> str:
+    components = [_as_dict(item) for item in _as_list(report.get("components"))]
+    gaps = [_as_dict(item) for item in _as_list(report.get("gaps"))]
+
+    lines = [
+        "# Reliability spine alignment audit",
+        "",
+        f"- Schema: `{report.get('schema_version', '')}`",
+        f"- Components: `{int(report.get('component_count', 0) or 0)}`",
+        f"- Next recommended PR: `{report.get('next_recommended_pr', '')}`",
+        "",
+        "## Status counts",
+        "",
+    ]
+
+    status_counts = _as_dict(report.get("status_counts"))
+    if status_counts:
+        lines.extend(f"- `{status}`: `{count}`" for status, count in status_counts.items())
+    else:
+        lines.append("- none")
+
+    lines.extend(["", "## Stage counts", ""])
+    stage_counts = _as_dict(report.get("stage_counts"))
+    if stage_counts:
+        lines.extend(f"- `{stage}`: `{count}`" for stage, count in stage_counts.items())
+    else:
+        lines.append("- none")
+
+    lines.extend(["", "## Components", ""])
+    for component in components:
+        stages = ", ".join(f"`{stage}`" for stage in _as_list(component.get("stages")))
+        lines.append(
+            f"- `{component.get('module', '')}`: "
+            f"`{component.get('status', '')}` — {component.get('role', '')}"
+        )
+        lines.append(f"  - Stages: {stages or '`none`'}")
+        lines.append(f"  - Next: {component.get('recommended_next_action', '')}")
+
+    lines.extend(["", "## Gaps", ""])
+    if gaps:
+        for gap in gaps:
+            lines.append(f"- `{gap.get('module', '')}`")
+            for item in _as_list(gap.get("gaps")):
+                lines.append(f"  - {item}")
+            lines.append(f"  - Next: {gap.get('recommended_next_action', '')}")
+    else:
+        lines.append("- none")
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _as_dict(value: Any) -> JsonObject:
+    return value if isinstance(value, dict) else {}
+
+
+def _as_list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else []
+
+
+def write_alignment_report(
+    *,
+    json_out: Path | None = None,
+    markdown_out: Path | None = None,
+) -> JsonObject:
+    report = build_alignment_report()
+
+    if json_out is not None:
+        json_out.parent.mkdir(parents=True, exist_ok=True)
+        json_out.write_text(
+            json.dumps(report, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+
+    if markdown_out is not None:
+        markdown_out.parent.mkdir(parents=True, exist_ok=True)
+        markdown_out.write_text(render_alignment_markdown(report), encoding="utf-8")
+
+    return report
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m sdetkit.reliability_spine_alignment")
+    parser.add_argument("--json-out", type=Path)
+    parser.add_argument("--markdown-out", type=Path)
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    report = write_alignment_report(
+        json_out=args.json_out,
+        markdown_out=args.markdown_out,
+    )
+
+    rendered = (
+        json.dumps({"report": report}, indent=2, sort_keys=True)
+        if args.format == "json"
+        else render_alignment_markdown(report).rstrip("\n")
+    )
+    sys.stdout.write(rendered + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
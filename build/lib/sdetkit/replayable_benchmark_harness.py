@@ -0,0 +1,2571 @@
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from sdetkit.diagnostic_job import build_diagnostic_job, run_diagnostic_worker
+from sdetkit.diagnostic_worker_trajectory import build_worker_trajectory_records
+from sdetkit.git_inventory_collector import STAGED_WORKTREE
+from sdetkit.isolated_proof_runner import INVENTORY_CLAIM_MATCH, run_isolated_proof
+from sdetkit.network_boundary import (
+    NETWORK_ISOLATION_ENFORCED,
+    NETWORK_ISOLATION_REQUIRED,
+    build_blocked_network_probe_report,
+)
+from sdetkit.patch_scorer import score_patch
+from sdetkit.protected_verifier import verify_candidate
+
+SCHEMA_VERSION = "sdetkit.replayable_benchmark_harness.v1"
+ISOLATED_EVIDENCE_SCHEMA_VERSION = "sdetkit.replayable_benchmark_harness.isolated_evidence.v3"
+DEFAULT_OUT_DIR = Path("build") / "replayable-benchmark-harness"
+REPORT_JSON = "benchmark-report.json"
+REPORT_MD = "benchmark-report.md"
+
+INVENTORY_CLAIM_MISMATCH_FAIL = "_".join(("inventory", "claim", "mismatch", "fail"))
+PROOF_MUTATION_FAIL = "_".join(("proof", "mutation", "fail"))
+NETWORK_BOUNDARY_REQUIRED_FAIL = "_".join(("network", "boundary", "required", "fail"))
+NETWORK_BOUNDARY_BLOCKED_COUNT = "_".join(("network", "boundary", "blocked", "count"))
+NETWORK_BACKEND_CONTRACT_SCHEMA_VERSION = (
+    "sdetkit.replayable_benchmark_harness.network_backend_contract.v1"
+)
+UNCLAIMED_WRITE_FAIL = "_".join(("unclaimed", "write", "fail"))
+EVIDENCE_SHADOW_FAIL = "_".join(("evidence", "shadow", "fail"))
+ANTI_CHEAT_REJECTION_COUNT = "_".join(("anti", "cheat", "rejection", "count"))
+LIVE_EVIDENCE_SOURCE = "_".join(("git", "grounded", "isolated", "proof"))
+LIVE_EXECUTION_MODEL = "_".join(("git", "derived", "isolated", "proof", "evaluation"))
+VERIFICATION_EVIDENCE_SOURCE = "_".join(("verification", "evidence", "source"))
+DIAGNOSTIC_WORKER_REPORT_SCHEMA_VERSION = (
+    "sdetkit.replayable_benchmark_harness.diagnostic_worker.v1"
+)
+DIAGNOSTIC_WORKER_REPORT_MODE = "diagnostic_worker_runtime_guard_fixture"
+RUNTIME_GUARD_WORKER_ORACLE_PASS = "runtime_guard_worker_oracle_pass"
+RUNTIME_GUARD_WORKER_NOP_PASS = "runtime_guard_worker_nop_pass"
+RUNTIME_GUARD_WORKER_AUTHORITY_FAIL = "runtime_guard_worker_authority_fail"
+DIAGNOSTIC_WORKER_SCENARIO_TYPES = {
+    RUNTIME_GUARD_WORKER_ORACLE_PASS,
+    RUNTIME_GUARD_WORKER_NOP_PASS,
+    RUNTIME_GUARD_WORKER_AUTHORITY_FAIL,
+}
+DIAGNOSTIC_WORKER_REQUIRED_SCENARIO_TYPES = (
+    RUNTIME_GUARD_WORKER_ORACLE_PASS,
+    RUNTIME_GUARD_WORKER_NOP_PASS,
+    RUNTIME_GUARD_WORKER_AUTHORITY_FAIL,
+)
+SECURITY_FRESHNESS_REPORT_SCHEMA_VERSION = (
+    "sdetkit.replayable_benchmark_harness.security_freshness.v1"
+)
+SECURITY_FRESHNESS_REPORT_MODE = "_".join(
+    ("diagnostic", "worker", "security", "freshness", "fixture")
+)
+SECURITY_FRESHNESS_STALE_RUNTIME_PASS = "_".join(
+    ("security", "freshness", "stale", "runtime", "pass")
+)
+SECURITY_FRESHNESS_CURRENT_PRIMARY_PASS = "_".join(
+    ("security", "freshness", "current", "primary", "pass")
+)
+SECURITY_FRESHNESS_AUTHORITY_FAIL = "_".join(("security", "freshness", "authority", "fail"))
+SECURITY_FRESHNESS_SCENARIO_TYPES = {
+    SECURITY_FRESHNESS_STALE_RUNTIME_PASS,
+    SECURITY_FRESHNESS_CURRENT_PRIMARY_PASS,
+    SECURITY_FRESHNESS_AUTHORITY_FAIL,
+}
+SECURITY_FRESHNESS_REQUIRED_SCENARIO_TYPES = (
+    SECURITY_FRESHNESS_STALE_RUNTIME_PASS,
+    SECURITY_FRESHNESS_CURRENT_PRIMARY_PASS,
+    SECURITY_FRESHNESS_AUTHORITY_FAIL,
+)
+EXECUTION_PLAN_HANDOFF_REPORT_SCHEMA_VERSION = (
+    "sdetkit.replayable_benchmark_harness.execution_plan_handoff.v1"
+)
+EXECUTION_PLAN_HANDOFF_REPORT_MODE = "diagnostic_execution_plan_handoff_fixture"
+EXECUTION_PLAN_HANDOFF_ORACLE_PASS = "execution_plan_handoff_oracle_pass"
+EXECUTION_PLAN_HANDOFF_NOP_PASS = "execution_plan_handoff_nop_pass"
+EXECUTION_PLAN_HANDOFF_AUTHORITY_FAIL = "execution_plan_handoff_authority_fail"
+EXECUTION_PLAN_HANDOFF_SCENARIO_TYPES = {
+    EXECUTION_PLAN_HANDOFF_ORACLE_PASS,
+    EXECUTION_PLAN_HANDOFF_NOP_PASS,
+    EXECUTION_PLAN_HANDOFF_AUTHORITY_FAIL,
+}
+EXECUTION_PLAN_HANDOFF_REQUIRED_SCENARIO_TYPES = (
+    EXECUTION_PLAN_HANDOFF_ORACLE_PASS,
+    EXECUTION_PLAN_HANDOFF_NOP_PASS,
+    EXECUTION_PLAN_HANDOFF_AUTHORITY_FAIL,
+)
+
+SCENARIO_TYPES = {
+    "nop_fail",
+    "oracle_pass",
+    "unsafe_patch_fail",
+    INVENTORY_CLAIM_MISMATCH_FAIL,
+    PROOF_MUTATION_FAIL,
+    NETWORK_BOUNDARY_REQUIRED_FAIL,
+    UNCLAIMED_WRITE_FAIL,
+    EVIDENCE_SHADOW_FAIL,
+}
+REQUIRED_SCENARIO_TYPES = (
+    "nop_fail",
+    "oracle_pass",
+    "unsafe_patch_fail",
+)
+ISOLATED_EVIDENCE_REQUIRED_TYPES = (
+    "oracle_pass",
+    INVENTORY_CLAIM_MISMATCH_FAIL,
+    PROOF_MUTATION_FAIL,
+    NETWORK_BOUNDARY_REQUIRED_FAIL,
+    UNCLAIMED_WRITE_FAIL,
+    EVIDENCE_SHADOW_FAIL,
+)
+
+JsonObject = dict[str, Any]
+
+
+def _as_dict(value: Any) -> JsonObject:
+    return value if isinstance(value, dict) else {}
+
+
+def _as_list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else []
+
+
+def _string(value: Any) -> str:
+    return str(value or "").replace("\r", " ").replace("\n", " ").strip()
+
+
+def _bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in {"1", "true", "yes"}
+
+
+def _int(value: Any, *, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _string_list(value: Any) -> list[str]:
+    return sorted({_string(item) for item in _as_list(value) if _string(item)})
+
+
+def _read_json_object(path: Path) -> JsonObject:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        msg = f"expected JSON object in {path}"
+        raise ValueError(msg)
+    return payload
+
+
+def _scenario_safety_gate_evidence(pattern_insights: Mapping[str, Any]) -> JsonObject:
+    denied = {
+        "automation_allowed": False,
+        "patch_application_allowed": False,
+        "merge_authorized": False,
+        "semantic_equivalence_proven": False,
+    }
+    payload = _as_dict(pattern_insights.get("safety_gate_evidence"))
+    if not payload:
+        return {
+            "collection_status": "not_collected",
+            "status": "not_collected",
+            "source": "trajectory.safety_gate",
+            "record_count": 0,
+            "review_first_count": 0,
+            "safe_fix_allowed_count": 0,
+            "reporting_only_count": 0,
+            "report_paths": [],
+            "decision_boundary": denied,
+        }
+
+    boundary = _as_dict(payload.get("decision_boundary"))
+    expanded = [key for key in denied if _bool(boundary.get(key))]
+    if expanded:
+        raise ValueError("SafetyGate benchmark evidence expands authority: " + ", ".join(expanded))
+
+    return {
+        "collection_status": _string(payload.get("collection_status")) or "collected",
+        "status": _string(payload.get("status")) or "safety_gate_evidence_observed",
+        "source": _string(payload.get("source")) or "trajectory.safety_gate",
+        "record_count": _int(payload.get("record_count")),
+        "review_first_count": _int(payload.get("review_first_count")),
+        "safe_fix_allowed_count": _int(payload.get("safe_fix_allowed_count")),
+        "reporting_only_count": _int(payload.get("reporting_only_count")),
+        "report_paths": [
+            _string(item) for item in _as_list(payload.get("report_paths")) if _string(item)
+        ],
+        "decision_boundary": denied,
+    }
+
+
+def _aggregate_safety_gate_evidence(results: list[JsonObject]) -> JsonObject:
+    denied = {
+        "automation_allowed": False,
+        "patch_application_allowed": False,
+        "merge_authorized": False,
+        "semantic_equivalence_proven": False,
+    }
+    rows = [
+        _as_dict(result.get("safety_gate_evidence"))
+        for result in results
+        if _string(_as_dict(result.get("safety_gate_evidence")).get("collection_status"))
+        == "collected"
+    ]
+    if not rows:
+        return {
+            "collection_status": "not_collected",
+            "status": "not_collected",
+            "source": "trajectory.safety_gate",
+            "scenario_count": 0,
+            "record_count": 0,
+            "review_first_count": 0,
+            "safe_fix_allowed_count": 0,
+            "reporting_only_count": 0,
+            "report_paths": [],
+            "decision_boundary": denied,
+        }
+
+    return {
+        "collection_status": "collected",
+        "status": "safety_gate_evidence_replayed",
+        "source": "trajectory.safety_gate",
+        "scenario_count": len(rows),
+        "record_count": sum(_int(row.get("record_count")) for row in rows),
+        "review_first_count": sum(_int(row.get("review_first_count")) for row in rows),
+        "safe_fix_allowed_count": sum(_int(row.get("safe_fix_allowed_count")) for row in rows),
+        "reporting_only_count": sum(_int(row.get("reporting_only_count")) for row in rows),
+        "report_paths": sorted(
+            {
+                _string(path)
+                for row in rows
+                for path in _as_list(row.get("report_paths"))
+                if _string(path)
+            }
+        ),
+        "decision_boundary": denied,
+    }
+
+
+def _runtime_proof_protected_verifier_contract_evidence(
+    runtime_proof_artifacts: Mapping[str, Any],
+) -> JsonObject:
+    denied = {
+        "automation_allowed": False,
+        "patch_application_allowed": False,
+        "security_dismissal_allowed": False,
+        "merge_authorized": False,
+        "semantic_equivalence_claim": False,
+    }
+    protected_verifier = _as_dict(_as_dict(runtime_proof_artifacts).get("protected_verifier"))
+    if not protected_verifier:
+        return {
+            "collection_status": "not_collected",
+            "status": "not_collected",
+            "source": "runtime_proof.protected_verifier.failure_vector_contract_evidence",
+            "record_count": 0,
+            "security_relevance_count": 0,
+            "authority_boundary_preserved_count": 0,
+            "expanded_authority_fields": [],
+            "decision_boundary": denied,
+        }
+
+    boundary = {
+        "automation_allowed": _bool(protected_verifier.get("automation_allowed")),
+        "patch_application_allowed": _bool(
+            protected_verifier.get("contract_patch_application_allowed")
+        ),
+        "security_dismissal_allowed": _bool(
+            protected_verifier.get("contract_security_dismissal_allowed")
+        ),
+        "merge_authorized": _bool(protected_verifier.get("contract_merge_authorized")),
+        "semantic_equivalence_claim": _bool(
+            protected_verifier.get("contract_semantic_equivalence_claim")
+        ),
+    }
+    expanded = sorted(key for key in denied if _bool(boundary.get(key)))
+    return {
+        "collection_status": _string(protected_verifier.get("collection_status")) or "collected",
+        "status": _string(protected_verifier.get("contract_status"))
+        or _string(protected_verifier.get("status"))
+        or "failure_vector_contract_evidence_observed",
+        "source": "runtime_proof.protected_verifier.failure_vector_contract_evidence",
+        "record_count": _int(protected_verifier.get("contract_record_count")),
+        "security_relevance_count": _int(
+            protected_verifier.get("contract_security_relevance_count")
+        ),
+        "authority_boundary_preserved_count": _int(
+            protected_verifier.get("contract_authority_boundary_preserved_count")
+        ),
+        "expanded_authority_fields": expanded,
+        "decision_boundary": denied,
+    }
+
+
+def _aggregate_runtime_proof_protected_verifier_contract_evidence(
+    results: list[JsonObject],
+) -> JsonObject:
+    denied = {
+        "automation_allowed": False,
+        "patch_application_allowed": False,
+        "security_dismissal_allowed": False,
+        "merge_authorized": False,
+        "semantic_equivalence_claim": False,
+    }
+    rows = [
+        _as_dict(result.get("runtime_proof_protected_verifier_contract_evidence"))
+        for result in results
+    ]
+    collected = [row for row in rows if row.get("collection_status") == "collected"]
+    if not collected:
+        return {
+            "collection_status": "not_collected",
+            "status": "not_collected",
+            "source": "runtime_proof.protected_verifier.failure_vector_contract_evidence",
+            "scenario_count": 0,
+            "record_count": 0,
+            "security_relevance_count": 0,
+            "authority_boundary_preserved_count": 0,
+            "expanded_authority_fields": [],
+            "decision_boundary": denied,
+        }
+
+    expanded = sorted(
+        {
+            _string(field)
+            for row in collected
+            for field in _as_list(row.get("expanded_authority_fields"))
+            if _string(field)
+        }
+    )
+    return {
+        "collection_status": "collected",
+        "status": "runtime_proof_protected_verifier_contract_evidence_replayed",
+        "source": "runtime_proof.protected_verifier.failure_vector_contract_evidence",
+        "scenario_count": len(collected),
+        "record_count": sum(_int(row.get("record_count")) for row in collected),
+        "security_relevance_count": sum(
+            _int(row.get("security_relevance_count")) for row in collected
+        ),
+        "authority_boundary_preserved_count": sum(
+            _int(row.get("authority_boundary_preserved_count")) for row in collected
+        ),
+        "expanded_authority_fields": expanded,
+        "decision_boundary": denied,
+    }
+
+
+def build_network_backend_contract_report(
+    verification_evidence: Mapping[str, Any],
+) -> JsonObject:
+    evidence = _as_dict(verification_evidence)
+    isolation = _as_dict(evidence.get("isolation"))
+    boundary = _as_dict(evidence.get("decision_boundary"))
+    network = _as_dict(evidence.get("network_boundary"))
+    summary = _as_dict(evidence.get("proof_summary"))
+
+    authority_expansion = sorted(
+        key
+        for key in (
+            "automation_allowed",
+            "merge_authorized",
+            "semantic_equivalence_proven",
+        )
+        if _bool(boundary.get(key))
+    )
+    required = _bool(isolation.get(NETWORK_ISOLATION_REQUIRED))
+    enforced = _bool(isolation.get(NETWORK_ISOLATION_ENFORCED))
+    verified = _bool(boundary.get("network_isolation_verified"))
+    all_wrapped = _bool(isolation.get("all_profiles_network_wrapped"))
+    executed_count = _int(summary.get("executed_count"))
+    wrapped_count = _int(isolation.get("network_backend_command_wrapped_count"))
+    narrow_scope = not _bool(
+        _as_dict(evidence.get("runtime_guard")).get("external_filesystem_containment_enforced")
+    ) and not _bool(
+        _as_dict(evidence.get("runtime_guard")).get("process_escape_prevention_enforced")
+    )
+    passed = (
+        _string(evidence.get("status")) == "passed"
+        and required
+        and enforced
+        and verified
+        and all_wrapped
+        and executed_count >= 1
+        and wrapped_count == executed_count
+        and _bool(network.get("backend_verified"))
+        and not authority_expansion
+        and narrow_scope
+    )
+    return {
+        "schema_version": NETWORK_BACKEND_CONTRACT_SCHEMA_VERSION,
+        "status": "passed" if passed else "failed",
+        "source": "isolated_proof_runner.network_boundary",
+        "backend": _string(network.get("backend")),
+        "backend_variant": _string(network.get("backend_variant")),
+        "backend_verified": _bool(network.get("backend_verified")),
+        NETWORK_ISOLATION_REQUIRED: required,
+        NETWORK_ISOLATION_ENFORCED: enforced,
+        "network_isolation_verified": verified,
+        "all_profiles_network_wrapped": all_wrapped,
+        "executed_count": executed_count,
+        "wrapped_count": wrapped_count,
+        "network_isolation_scope_only": narrow_scope,
+        "external_filesystem_containment_enforced": False,
+        "process_escape_prevention_enforced": False,
+        "expanded_authority_fields": authority_expansion,
+        "reporting_only": True,
+        "decision_boundary": {
+            "automation_allowed": False,
+            "patch_application_allowed": False,
+            "merge_authorized": False,
+            "semantic_equivalence_proven": False,
+        },
+    }
+
+
+def render_network_backend_contract_markdown(
+    report: Mapping[str, Any],
+) -> str:
+    boundary = _as_dict(report.get("decision_boundary"))
+    expanded = _string_list(report.get("expanded_authority_fields"))
+    return "\n".join(
+        [
+            "# Network backend contract replay",
+            "",
+            f"- Status: `{_string(report.get('status'))}`",
+            f"- Backend: `{_string(report.get('backend'))}`",
+            f"- Backend variant: `{_string(report.get('backend_variant'))}`",
+            (f"- Backend verified: `{str(_bool(report.get('backend_verified'))).lower()}`"),
+            (
+                "- Network isolation enforced: "
+                f"`{str(_bool(report.get(NETWORK_ISOLATION_ENFORCED))).lower()}`"
+            ),
+            (
+                "- All profiles network wrapped: "
+                f"`{str(_bool(report.get('all_profiles_network_wrapped'))).lower()}`"
+            ),
+            "- External filesystem containment enforced: `false`",
+            "- Process escape prevention enforced: `false`",
+            (f"- Expanded authority fields: `{', '.join(expanded) if expanded else 'none'}`"),
+            (f"- Automation allowed: `{str(_bool(boundary.get('automation_allowed'))).lower()}`"),
+            (f"- Merge authorized: `{str(_bool(boundary.get('merge_authorized'))).lower()}`"),
+            (
+                "- Semantic equivalence proven: "
+                f"`{str(_bool(boundary.get('semantic_equivalence_proven'))).lower()}`"
+            ),
+            "",
+        ]
+    )
+
+
+def load_scenarios(paths: list[Path]) -> list[JsonObject]:
+    scenarios: list[JsonObject] = []
+    identifiers: set[str] = set()
+
+    for path in paths:
+        scenario = _read_json_object(path)
+        scenario_id = _string(scenario.get("scenario_id"))
+        if not scenario_id:
+            msg = f"scenario_id is required in {path}"
+            raise ValueError(msg)
+        if scenario_id in identifiers:
+            msg = f"duplicate scenario_id: {scenario_id}"
+            raise ValueError(msg)
+
+        scenario_type = _string(scenario.get("scenario_type"))
+        if scenario_type not in SCENARIO_TYPES:
+            msg = f"unsupported scenario_type for {scenario_id}: {scenario_type}"
+            raise ValueError(msg)
+
+        identifiers.add(scenario_id)
+        scenarios.append(scenario)
+
+    return scenarios
+
+
+def load_diagnostic_worker_scenarios(paths: list[Path]) -> list[JsonObject]:
+    scenarios: list[JsonObject] = []
+    identifiers: set[str] = set()
+
+    for path in paths:
+        scenario = _read_json_object(path)
+        scenario_id = _string(scenario.get("scenario_id"))
+        scenario_type = _string(scenario.get("scenario_type"))
+        if not scenario_id:
+            raise ValueError(f"scenario_id is required in {path}")
+        if scenario_id in identifiers:
+            raise ValueError(f"duplicate scenario_id: {scenario_id}")
+        if scenario_type not in DIAGNOSTIC_WORKER_SCENARIO_TYPES:
+            raise ValueError(
+                f"unsupported diagnostic worker scenario_type for {scenario_id}: {scenario_type}"
+            )
+        if not _as_dict(scenario.get("runtime_proof_artifacts")):
+            raise ValueError(f"runtime_proof_artifacts is required in {path}")
+        identifiers.add(scenario_id)
+        scenarios.append(scenario)
+
+    return scenarios
+
+
+def load_security_freshness_scenarios(paths: list[Path]) -> list[JsonObject]:
+    scenarios: list[JsonObject] = []
+    identifiers: set[str] = set()
+
+    for path in paths:
+        scenario = _read_json_object(path)
+        scenario_id = _string(scenario.get("scenario_id"))
+        scenario_type = _string(scenario.get("scenario_type"))
+        if not scenario_id:
+            raise ValueError(f"scenario_id is required in {path}")
+        if scenario_id in identifiers:
+            raise ValueError(f"duplicate scenario_id: {scenario_id}")
+        if scenario_type not in SECURITY_FRESHNESS_SCENARIO_TYPES:
+            raise ValueError(
+                f"unsupported security freshness scenario_type for {scenario_id}: {scenario_type}"
+            )
+        if not _as_dict(scenario.get("security_review")):
+            raise ValueError(f"security_review is required in {path}")
+        if not _as_dict(scenario.get("runtime_proof_artifacts")):
+            raise ValueError(f"runtime_proof_artifacts is required in {path}")
+        identifiers.add(scenario_id)
+        scenarios.append(scenario)
+
+    return scenarios
+
+
+def load_execution_plan_handoff_scenarios(paths: list[Path]) -> list[JsonObject]:
+    scenarios: list[JsonObject] = []
+    identifiers: set[str] = set()
+
+    for path in paths:
+        scenario = _read_json_object(path)
+        scenario_id = _string(scenario.get("scenario_id"))
+        scenario_type = _string(scenario.get("scenario_type"))
+        if not scenario_id:
+            raise ValueError(f"scenario_id is required in {path}")
+        if scenario_id in identifiers:
+            raise ValueError(f"duplicate scenario_id: {scenario_id}")
+        if scenario_type not in EXECUTION_PLAN_HANDOFF_SCENARIO_TYPES:
+            raise ValueError(
+                f"unsupported execution-plan handoff scenario_type for {scenario_id}: "
+                f"{scenario_type}"
+            )
+        if not _as_dict(scenario.get("check_intelligence")):
+            raise ValueError(f"check_intelligence is required in {path}")
+        if scenario_type in {
+            EXECUTION_PLAN_HANDOFF_ORACLE_PASS,
+            EXECUTION_PLAN_HANDOFF_AUTHORITY_FAIL,
+        } and not _as_dict(scenario.get("diagnostic_execution_plan")):
+            raise ValueError(f"diagnostic_execution_plan is required in {path}")
+
+        identifiers.add(scenario_id)
+        scenarios.append(scenario)
+
+    return scenarios
+
+
+def _decision_status(payload: Mapping[str, Any]) -> str:
+    return _string(_as_dict(payload.get("decision")).get("status"))
+
+
+def _check(
+    *,
+    name: str,
+    passed: bool,
+    expected: Any,
+    actual: Any,
+) -> JsonObject:
+    return {
+        "name": name,
+        "passed": passed,
+        "expected": expected,
+        "actual": actual,
+    }
+
+
+def evaluate_scenario(
+    scenario: Mapping[str, Any],
+    *,
+    verification_evidence_override: Mapping[str, Any] | None = None,
+) -> JsonObject:
+    scenario_id = _string(scenario.get("scenario_id"))
+    scenario_type = _string(scenario.get("scenario_type"))
+    if not scenario_id:
+        raise ValueError("scenario_id is required")
+    if scenario_type not in SCENARIO_TYPES:
+        msg = f"unsupported scenario_type for {scenario_id}: {scenario_type}"
+        raise ValueError(msg)
+
+    remediation_plan = _as_dict(scenario.get("remediation_plan"))
+    proposed_patch = _as_dict(scenario.get("proposed_patch"))
+    pattern_insights = _as_dict(scenario.get("pattern_insights"))
+    safety_gate_evidence = _scenario_safety_gate_evidence(pattern_insights)
+    runtime_proof_contract_evidence = _runtime_proof_protected_verifier_contract_evidence(
+        _as_dict(scenario.get("runtime_proof_artifacts"))
+    )
+    declared_verification_evidence = _as_dict(scenario.get("verification_evidence"))
+    verification_evidence = (
+        dict(verification_evidence_override)
+        if verification_evidence_override is not None
+        else dict(declared_verification_evidence)
+    )
+    if (
+        _string(safety_gate_evidence.get("collection_status")) == "collected"
+        and "safety_gate_evidence" not in verification_evidence
+    ):
+        verification_evidence["safety_gate_evidence"] = safety_gate_evidence
+    evidence_source = (
+        LIVE_EVIDENCE_SOURCE if verification_evidence_override is not None else "fixture_declared"
+    )
+    expected = _as_dict(scenario.get("expected"))
+
+    if not remediation_plan or not proposed_patch or not verification_evidence:
+        msg = (
+            f"scenario {scenario_id} must provide remediation_plan, "
+            "proposed_patch, and verification_evidence"
+        )
+        raise ValueError(msg)
+
+    patch_score = score_patch(
+        remediation_plan=remediation_plan,
+        proposed_patch=proposed_patch,
+        pattern_insights=pattern_insights,
+        diagnosis_id=_string(scenario.get("diagnosis_id")),
+        minimum_score=_int(scenario.get("minimum_score"), default=80),
+    )
+    verifier_result = verify_candidate(
+        patch_score=patch_score,
+        verification_evidence=verification_evidence,
+    )
+
+    patch_status = _decision_status(patch_score)
+    verifier_status = _decision_status(verifier_result)
+    scorer_decision = _as_dict(patch_score.get("decision"))
+    verifier_decision = _as_dict(verifier_result.get("decision"))
+
+    expected_patch_status = _string(expected.get("patch_score_status"))
+    expected_verifier_status = _string(expected.get("verifier_status"))
+    if not expected_patch_status or not expected_verifier_status:
+        msg = f"scenario {scenario_id} must declare expected decision statuses"
+        raise ValueError(msg)
+
+    checks = [
+        _check(
+            name="patch_score_status",
+            passed=patch_status == expected_patch_status,
+            expected=expected_patch_status,
+            actual=patch_status,
+        ),
+        _check(
+            name="protected_verifier_status",
+            passed=verifier_status == expected_verifier_status,
+            expected=expected_verifier_status,
+            actual=verifier_status,
+        ),
+        _check(
+            name="patch_score_automation_boundary",
+            passed=not _bool(scorer_decision.get("automation_allowed")),
+            expected=False,
+            actual=_bool(scorer_decision.get("automation_allowed")),
+        ),
+        _check(
+            name="protected_verifier_automation_boundary",
+            passed=not _bool(verifier_decision.get("automation_allowed")),
+            expected=False,
+            actual=_bool(verifier_decision.get("automation_allowed")),
+        ),
+        _check(
+            name="protected_verifier_merge_boundary",
+            passed=not _bool(verifier_decision.get("merge_authorized")),
+            expected=False,
+            actual=_bool(verifier_decision.get("merge_authorized")),
+        ),
+        _check(
+            name="semantic_equivalence_boundary",
+            passed=not _bool(verifier_decision.get("semantic_equivalence_proven")),
+            expected=False,
+            actual=_bool(verifier_decision.get("semantic_equivalence_proven")),
+        ),
+        _check(
+            name="runtime_proof_contract_authority_boundary",
+            passed=not _string_list(
+                runtime_proof_contract_evidence.get("expanded_authority_fields")
+            ),
+            expected=[],
+            actual=_string_list(runtime_proof_contract_evidence.get("expanded_authority_fields")),
+        ),
+    ]
+
+    if scenario_type == "oracle_pass":
+        checks.extend(
+            [
+                _check(
+                    name="oracle_patch_candidate",
+                    passed=patch_status == "candidate_for_protected_verification",
+                    expected="candidate_for_protected_verification",
+                    actual=patch_status,
+                ),
+                _check(
+                    name="oracle_structural_verification",
+                    passed=verifier_status == "structurally_verified_candidate"
+                    and _bool(verifier_decision.get("structural_verification_passed")),
+                    expected=True,
+                    actual=_bool(verifier_decision.get("structural_verification_passed")),
+                ),
+            ]
+        )
+    elif scenario_type in {"nop_fail", "unsafe_patch_fail"}:
+        checks.extend(
+            [
+                _check(
+                    name="unsafe_or_nop_patch_rejected",
+                    passed=patch_status == "blocked_review_first",
+                    expected="blocked_review_first",
+                    actual=patch_status,
+                ),
+                _check(
+                    name="unsafe_or_nop_verification_rejected",
+                    passed=verifier_status == "blocked_review_first",
+                    expected="blocked_review_first",
+                    actual=verifier_status,
+                ),
+            ]
+        )
+    else:
+        checks.extend(
+            [
+                _check(
+                    name="live_failure_patch_remains_candidate",
+                    passed=patch_status == "candidate_for_protected_verification",
+                    expected="candidate_for_protected_verification",
+                    actual=patch_status,
+                ),
+                _check(
+                    name="live_failure_verification_rejected",
+                    passed=verifier_status == "blocked_review_first",
+                    expected="blocked_review_first",
+                    actual=verifier_status,
+                ),
+            ]
+        )
+
+    passed = all(_bool(item.get("passed")) for item in checks)
+    return {
+        "scenario_id": scenario_id,
+        "scenario_type": scenario_type,
+        "description": _string(scenario.get("description")),
+        "status": "passed" if passed else "failed",
+        "passed": passed,
+        "attempt_scored": True,
+        "attempt_score": _int(patch_score.get("score")),
+        VERIFICATION_EVIDENCE_SOURCE: evidence_source,
+        "checks": checks,
+        "patch_score": patch_score,
+        "protected_verifier_result": verifier_result,
+        "runtime_proof_protected_verifier_contract_evidence": runtime_proof_contract_evidence,
+        "safety_gate_evidence": safety_gate_evidence,
+    }
+
+
+def evaluate_isolated_evidence_scenario(
+    scenario: Mapping[str, Any],
+    *,
+    repo_root: Path,
+) -> JsonObject:
+    scenario_type = _string(scenario.get("scenario_type"))
+    if scenario_type not in ISOLATED_EVIDENCE_REQUIRED_TYPES:
+        raise ValueError(f"unsupported isolated-evidence scenario type: {scenario_type}")
+
+    runtime = _as_dict(scenario.get("isolated_proof"))
+    profiles = _string_list(runtime.get("profiles"))
+    if not profiles:
+        raise ValueError("isolated_proof profiles are required")
+
+    proposed_patch = _as_dict(scenario.get("proposed_patch"))
+    claimed_files = _string_list(proposed_patch.get("changed_files"))
+    expected_runtime = _as_dict(_as_dict(scenario.get("expected")).get("isolated_proof"))
+    required_expectations = {
+        "status",
+        "git_inventory_verified",
+        "inventory_claim_match",
+    }
+    if not required_expectations.issubset(expected_runtime):
+        raise ValueError(
+            "isolated proof expectations must include status, "
+            "git_inventory_verified, and inventory_claim_match"
+        )
+
+    blocked_network_probe_report = (
+        build_blocked_network_probe_report()
+        if scenario_type == NETWORK_BOUNDARY_REQUIRED_FAIL
+        else None
+    )
+    evidence = run_isolated_proof(
+        repo_root=repo_root,
+        changed_files=claimed_files,
+        profile_ids=profiles,
+        timeout_seconds=_int(runtime.get("timeout_seconds"), default=60),
+        inventory_mode=_string(runtime.get("inventory_mode") or STAGED_WORKTREE),
+        base_ref=_string(runtime.get("base_ref")),
+        head_ref=_string(runtime.get("head_ref") or "HEAD"),
+        require_network_isolation=_bool(runtime.get("require_network_isolation")),
+        blocked_network_probe_report=blocked_network_probe_report,
+    )
+    result = evaluate_scenario(
+        scenario,
+        verification_evidence_override=evidence,
+    )
+
+    boundary = _as_dict(evidence.get("decision_boundary"))
+    expected_status = _string(expected_runtime.get("status"))
+    expected_git_verified = _bool(expected_runtime.get("git_inventory_verified"))
+    expected_claim_match = _bool(expected_runtime.get("inventory_claim_match"))
+    expected_network_required = _bool(expected_runtime.get(NETWORK_ISOLATION_REQUIRED))
+    expected_network_enforced = _bool(expected_runtime.get(NETWORK_ISOLATION_ENFORCED))
+    expected_execution_blocked = _bool(expected_runtime.get("proof_execution_blocked"))
+    expected_runtime_guard_status = _string(expected_runtime.get("runtime_guard_status"))
+    isolation = _as_dict(evidence.get("isolation"))
+
+    result["checks"].extend(
+        [
+            _check(
+                name="isolated_evidence_status",
+                passed=_string(evidence.get("status")) == expected_status,
+                expected=expected_status,
+                actual=_string(evidence.get("status")),
+            ),
+            _check(
+                name="isolated_git_inventory_verified",
+                passed=_bool(boundary.get("git_inventory_verified")) == expected_git_verified,
+                expected=expected_git_verified,
+                actual=_bool(boundary.get("git_inventory_verified")),
+            ),
+            _check(
+                name="isolated_inventory_claim_match",
+                passed=_bool(evidence.get(INVENTORY_CLAIM_MATCH)) == expected_claim_match,
+                expected=expected_claim_match,
+                actual=_bool(evidence.get(INVENTORY_CLAIM_MATCH)),
+            ),
+            _check(
+                name="isolated_network_requirement",
+                passed=_bool(isolation.get(NETWORK_ISOLATION_REQUIRED))
+                == expected_network_required,
+                expected=expected_network_required,
+                actual=_bool(isolation.get(NETWORK_ISOLATION_REQUIRED)),
+            ),
+            _check(
+                name="isolated_network_enforcement",
+                passed=_bool(isolation.get(NETWORK_ISOLATION_ENFORCED))
+                == expected_network_enforced,
+                expected=expected_network_enforced,
+                actual=_bool(isolation.get(NETWORK_ISOLATION_ENFORCED)),
+            ),
+            _check(
+                name="isolated_proof_execution_blocked",
+                passed=_bool(isolation.get("proof_execution_blocked"))
+                == expected_execution_blocked,
+                expected=expected_execution_blocked,
+                actual=_bool(isolation.get("proof_execution_blocked")),
+            ),
+            _check(
+                name="isolated_runner_automation_boundary",
+                passed=not _bool(boundary.get("automation_allowed")),
+                expected=False,
+                actual=_bool(boundary.get("automation_allowed")),
+            ),
+            _check(
+                name="isolated_runner_merge_boundary",
+                passed=not _bool(boundary.get("merge_authorized")),
+                expected=False,
+                actual=_bool(boundary.get("merge_authorized")),
+            ),
+            _check(
+                name="isolated_runner_semantic_boundary",
+                passed=not _bool(boundary.get("semantic_equivalence_proven")),
+                expected=False,
+                actual=_bool(boundary.get("semantic_equivalence_proven")),
+            ),
+        ]
+    )
+
+    if expected_runtime_guard_status:
+        proof_results = [_as_dict(item) for item in _as_list(evidence.get("proof_results"))]
+        actual_guard_status = (
+            _string(_as_dict(proof_results[0].get("runtime_guard")).get("status"))
+            if proof_results
+            else ""
+        )
+        result["checks"].append(
+            _check(
+                name="isolated_runtime_guard_status",
+                passed=actual_guard_status == expected_runtime_guard_status,
+                expected=expected_runtime_guard_status,
+                actual=actual_guard_status,
+            )
+        )
+
+    result["isolated_proof_evidence"] = evidence
+    result["live_evidence_exercised"] = True
+    result["passed"] = all(_bool(item.get("passed")) for item in result["checks"])
+    result["status"] = "passed" if result["passed"] else "failed"
+    return result
+
+
+def _type_rate(results: list[JsonObject], scenario_type: str) -> float:
+    matching = [item for item in results if item.get("scenario_type") == scenario_type]
+    if not matching:
+        return 0.0
+    passing = sum(1 for item in matching if item.get("passed") is True)
+    return round(passing / len(matching), 4)
+
+
+def _replay_manifest(results: list[JsonObject]) -> JsonObject:
+    scenario_types = [_string(item.get("scenario_type")) for item in results]
+    return {
+        "scenario_count": len(results),
+        "scenario_ids": [_string(item.get("scenario_id")) for item in results],
+        "scenario_types": scenario_types,
+        "scenario_type_counts": dict(sorted(Counter(scenario_types).items())),
+        "input_order_preserved": True,
+        "duplicate_scenario_ids_rejected": True,
+        "unsupported_scenario_types_rejected": True,
+        "reporting_only": True,
+        "automation_allowed": False,
+        "merge_authorized": False,
+        "semantic_equivalence_proven": False,
+    }
+
+
+def build_benchmark_report(scenarios: list[Mapping[str, Any]]) -> JsonObject:
+    results = [evaluate_scenario(scenario) for scenario in scenarios]
+    safety_gate_evidence = _aggregate_safety_gate_evidence(results)
+    runtime_proof_contract_evidence = _aggregate_runtime_proof_protected_verifier_contract_evidence(
+        results
+    )
+    type_counts = Counter(_string(item.get("scenario_type")) for item in results)
+    required_present = all(type_counts.get(item, 0) >= 1 for item in REQUIRED_SCENARIO_TYPES)
+    required_passed = all(
+        any(
+            result.get("scenario_type") == scenario_type and result.get("passed") is True
+            for result in results
+        )
+        for scenario_type in REQUIRED_SCENARIO_TYPES
+    )
+
+    automation_allowed_count = sum(
+        1
+        for result in results
+        if _bool(
+            _as_dict(_as_dict(result.get("patch_score")).get("decision")).get("automation_allowed")
+        )
+        or _bool(
+            _as_dict(_as_dict(result.get("protected_verifier_result")).get("decision")).get(
+                "automation_allowed"
+            )
+        )
+    )
+    merge_authorized_count = sum(
+        1
+        for result in results
+        if _bool(
+            _as_dict(_as_dict(result.get("protected_verifier_result")).get("decision")).get(
+                "merge_authorized"
+            )
+        )
+    )
+    semantic_equivalence_claimed_count = sum(
+        1
+        for result in results
+        if _bool(
+            _as_dict(_as_dict(result.get("protected_verifier_result")).get("decision")).get(
+                "semantic_equivalence_proven"
+            )
+        )
+    )
+    runtime_contract_authority_expansion_count = len(
+        _string_list(runtime_proof_contract_evidence.get("expanded_authority_fields"))
+    )
+
+    passed_count = sum(1 for item in results if item.get("passed") is True)
+    boundary_preserved = (
+        automation_allowed_count == 0
+        and merge_authorized_count == 0
+        and semantic_equivalence_claimed_count == 0
+        and runtime_contract_authority_expansion_count == 0
+    )
+    passed = (
+        bool(results)
+        and passed_count == len(results)
+        and required_present
+        and required_passed
+        and boundary_preserved
+    )
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "status": "passed" if passed else "failed",
+        "scenario_count": len(results),
+        "passed_count": passed_count,
+        "failed_count": len(results) - passed_count,
+        "scenario_type_counts": dict(sorted(type_counts.items())),
+        "replay_manifest": _replay_manifest(results),
+        "runtime_proof_protected_verifier_contract_evidence": runtime_proof_contract_evidence,
+        "safety_gate_evidence": safety_gate_evidence,
+        "required_contract": {
+            "required_scenario_types": list(REQUIRED_SCENARIO_TYPES),
+            "all_required_present": required_present,
+            "all_required_passed": required_passed,
+            "nop_fail_rate": _type_rate(results, "nop_fail"),
+            "oracle_pass_rate": _type_rate(results, "oracle_pass"),
+            "unsafe_patch_rejection_rate": _type_rate(results, "unsafe_patch_fail"),
+        },
+        "safety_boundary": {
+            "execution_model": "read_only_in_process_fixture_evaluation",
+            "automation_allowed_count": automation_allowed_count,
+            "merge_authorized_count": merge_authorized_count,
+            "semantic_equivalence_claimed_count": semantic_equivalence_claimed_count,
+            "runtime_proof_contract_authority_expansion_count": runtime_contract_authority_expansion_count,
+            "preserved": boundary_preserved,
+        },
+        "attempt_scored_count": sum(1 for item in results if item.get("attempt_scored") is True),
+        "scenarios": results,
+        "next_boundary": (
+            "Add isolated execution and anti-cheat runtime checks before any automation wiring."
+        ),
+    }
+
+
+def build_isolated_evidence_report(
+    scenario_runs: list[tuple[Mapping[str, Any], Path]],
+) -> JsonObject:
+    results = [
+        evaluate_isolated_evidence_scenario(scenario, repo_root=repo_root)
+        for scenario, repo_root in scenario_runs
+    ]
+    type_counts = Counter(_string(item.get("scenario_type")) for item in results)
+    required_present = all(
+        type_counts.get(item, 0) >= 1 for item in ISOLATED_EVIDENCE_REQUIRED_TYPES
+    )
+    required_passed = all(
+        any(
+            result.get("scenario_type") == scenario_type and result.get("passed") is True
+            for result in results
+        )
+        for scenario_type in ISOLATED_EVIDENCE_REQUIRED_TYPES
+    )
+
+    verifier_decisions = [
+        _as_dict(_as_dict(result.get("protected_verifier_result")).get("decision"))
+        for result in results
+    ]
+    evidence_boundaries = [
+        _as_dict(_as_dict(result.get("isolated_proof_evidence")).get("decision_boundary"))
+        for result in results
+    ]
+
+    automation_allowed_count = sum(
+        1
+        for decision, boundary in zip(verifier_decisions, evidence_boundaries, strict=True)
+        if _bool(decision.get("automation_allowed")) or _bool(boundary.get("automation_allowed"))
+    )
+    merge_authorized_count = sum(
+        1
+        for decision, boundary in zip(verifier_decisions, evidence_boundaries, strict=True)
+        if _bool(decision.get("merge_authorized")) or _bool(boundary.get("merge_authorized"))
+    )
+    semantic_equivalence_claimed_count = sum(
+        1
+        for decision, boundary in zip(verifier_decisions, evidence_boundaries, strict=True)
+        if _bool(decision.get("semantic_equivalence_proven"))
+        or _bool(boundary.get("semantic_equivalence_proven"))
+    )
+    boundary_preserved = (
+        automation_allowed_count == 0
+        and merge_authorized_count == 0
+        and semantic_equivalence_claimed_count == 0
+    )
+    passed_count = sum(1 for item in results if item.get("passed") is True)
+    passed = (
+        bool(results)
+        and passed_count == len(results)
+        and required_present
+        and required_passed
+        and boundary_preserved
+    )
+
+    return {
+        "schema_version": ISOLATED_EVIDENCE_SCHEMA_VERSION,
+        "report_mode": LIVE_EVIDENCE_SOURCE,
+        "status": "passed" if passed else "failed",
+        "scenario_count": len(results),
+        "passed_count": passed_count,
+        "failed_count": len(results) - passed_count,
+        "scenario_type_counts": dict(sorted(type_counts.items())),
+        "replay_manifest": _replay_manifest(results),
+        "required_contract": {
+            "required_scenario_types": list(ISOLATED_EVIDENCE_REQUIRED_TYPES),
+            "all_required_present": required_present,
+            "all_required_passed": required_passed,
+            "oracle_pass_rate": _type_rate(results, "oracle_pass"),
+            "claim_mismatch_rejection_rate": _type_rate(
+                results,
+                INVENTORY_CLAIM_MISMATCH_FAIL,
+            ),
+            "proof_mutation_rejection_rate": _type_rate(results, PROOF_MUTATION_FAIL),
+            "network_boundary_rejection_rate": _type_rate(
+                results,
+                NETWORK_BOUNDARY_REQUIRED_FAIL,
+            ),
+            "unclaimed_write_rejection_rate": _type_rate(
+                results,
+                UNCLAIMED_WRITE_FAIL,
+            ),
+            "evidence_shadow_rejection_rate": _type_rate(
+                results,
+                EVIDENCE_SHADOW_FAIL,
+            ),
+        },
+        "live_evidence": {
+            "scenario_count": len(results),
+            "git_inventory_verified_count": sum(
+                1
+                for boundary in evidence_boundaries
+                if _bool(boundary.get("git_inventory_verified"))
+            ),
+            "expected_failed_evidence_count": sum(
+                1
+                for result in results
+                if _string(_as_dict(result.get("isolated_proof_evidence")).get("status"))
+                == "failed"
+                and result.get("passed") is True
+            ),
+            NETWORK_BOUNDARY_BLOCKED_COUNT: sum(
+                1
+                for result in results
+                if result.get("scenario_type") == NETWORK_BOUNDARY_REQUIRED_FAIL
+                and result.get("passed") is True
+            ),
+            "network_isolation_enforced_count": sum(
+                1
+                for result in results
+                if _bool(
+                    _as_dict(_as_dict(result.get("isolated_proof_evidence")).get("isolation")).get(
+                        NETWORK_ISOLATION_ENFORCED
+                    )
+                )
+            ),
+            ANTI_CHEAT_REJECTION_COUNT: sum(
+                1
+                for result in results
+                if result.get("scenario_type") in {UNCLAIMED_WRITE_FAIL, EVIDENCE_SHADOW_FAIL}
+                and result.get("passed") is True
+            ),
+        },
+        "safety_boundary": {
+            "execution_model": LIVE_EXECUTION_MODEL,
+            "automation_allowed_count": automation_allowed_count,
+            "merge_authorized_count": merge_authorized_count,
+            "semantic_equivalence_claimed_count": semantic_equivalence_claimed_count,
+            "preserved": boundary_preserved,
+        },
+        "attempt_scored_count": sum(1 for item in results if item.get("attempt_scored") is True),
+        "scenarios": results,
+        "next_boundary": (
+            "Surface captured runtime-proof artifacts in PR Quality before any automation wiring."
+        ),
+    }
+
+
+def _run_diagnostic_worker_fixture(
+    scenario: Mapping[str, Any],
+) -> tuple[JsonObject, JsonObject, JsonObject]:
+    scenario_id = _string(scenario.get("scenario_id"))
+    job = build_diagnostic_job(
+        repo="controlled-fixture/replayable-benchmark",
+        base_sha="fixture-base",
+        head_sha=f"fixture-head-{scenario_id}",
+        event_name="replayable_benchmark",
+        pr_number=0,
+        input_artifacts={"runtime_proof_artifacts": f"fixture:{scenario_id}"},
+    )
+    with tempfile.TemporaryDirectory(prefix="sdetkit-runtime-worker-benchmark-") as temp_dir:
+        worker_dir = Path(temp_dir) / "worker"
+        result = run_diagnostic_worker(
+            job,
+            runtime_proof_artifacts=_as_dict(scenario.get("runtime_proof_artifacts")),
+            out_dir=worker_dir,
+        )
+        vector = _read_json_object(worker_dir / "vector" / "diagnostic-vector.json")
+    return job, result, vector
+
+
+def evaluate_diagnostic_worker_scenario(scenario: Mapping[str, Any]) -> JsonObject:
+    scenario_id = _string(scenario.get("scenario_id"))
+    scenario_type = _string(scenario.get("scenario_type"))
+    if scenario_type not in DIAGNOSTIC_WORKER_SCENARIO_TYPES:
+        raise ValueError(f"unsupported diagnostic worker scenario_type: {scenario_type}")
+
+    job, worker_result, diagnostic_vector = _run_diagnostic_worker_fixture(scenario)
+    result_summary = _as_dict(worker_result.get("summary"))
+    primary = _as_dict(worker_result.get("primary_diagnosis"))
+    boundary = _as_dict(worker_result.get("decision_boundary"))
+    expected = _as_dict(scenario.get("expected"))
+    diagnoses = [_as_dict(item) for item in _as_list(diagnostic_vector.get("diagnoses"))]
+    failure_vector = _as_dict(diagnoses[0].get("failure_vector")) if diagnoses else {}
+    checks: list[JsonObject] = [
+        _check(
+            name="worker_automation_boundary",
+            passed=not _bool(boundary.get("automation_allowed")),
+            expected=False,
+            actual=_bool(boundary.get("automation_allowed")),
+        ),
+        _check(
+            name="worker_merge_boundary",
+            passed=not _bool(boundary.get("merge_authorized")),
+            expected=False,
+            actual=_bool(boundary.get("merge_authorized")),
+        ),
+        _check(
+            name="worker_semantic_boundary",
+            passed=not _bool(boundary.get("semantic_equivalence_proven")),
+            expected=False,
+            actual=_bool(boundary.get("semantic_equivalence_proven")),
+        ),
+    ]
+    trajectory_records: list[JsonObject] = []
+    observed_error = ""
+
+    if scenario_type == RUNTIME_GUARD_WORKER_ORACLE_PASS:
+        trajectory_records = build_worker_trajectory_records(
+            job=job,
+            worker_result=worker_result,
+            diagnostic_vector=diagnostic_vector,
+            repo="controlled-fixture/replayable-benchmark",
+            branch="fixture",
+            commit_sha="fixture-runtime-worker-oracle",
+        )
+        record = _as_dict(trajectory_records[0]) if trajectory_records else {}
+        decision = _as_dict(record.get("decision"))
+        proof = _as_dict(record.get("proof"))
+        worker_evidence = _as_dict(record.get("worker_evidence"))
+        checks.extend(
+            [
+                _check(
+                    name="runtime_guard_failure_class",
+                    passed=_string(failure_vector.get("failure_class"))
+                    == _string(expected.get("failure_class")),
+                    expected=_string(expected.get("failure_class")),
+                    actual=_string(failure_vector.get("failure_class")),
+                ),
+                _check(
+                    name="runtime_guard_surface",
+                    passed=_string(primary.get("failure_surface"))
+                    == _string(expected.get("primary_surface")),
+                    expected=_string(expected.get("primary_surface")),
+                    actual=_string(primary.get("failure_surface")),
+                ),
+                _check(
+                    name="runtime_guard_action",
+                    passed=_string(result_summary.get("primary_action"))
+                    == _string(expected.get("primary_action")),
+                    expected=_string(expected.get("primary_action")),
+                    actual=_string(result_summary.get("primary_action")),
+                ),
+                _check(
+                    name="runtime_guard_review_first",
+                    passed=_bool(primary.get("review_first"))
+                    and not _bool(primary.get("safe_fix_candidate")),
+                    expected=True,
+                    actual=_bool(primary.get("review_first"))
+                    and not _bool(primary.get("safe_fix_candidate")),
+                ),
+                _check(
+                    name="runtime_guard_advisory_trajectory",
+                    passed=len(trajectory_records) == 1
+                    and _bool(decision.get("review_first"))
+                    and not _bool(decision.get("auto_fix_allowed"))
+                    and _as_list(proof.get("commands")) == []
+                    and _bool(worker_evidence.get("reporting_only")),
+                    expected=True,
+                    actual=len(trajectory_records) == 1
+                    and _bool(decision.get("review_first"))
+                    and not _bool(decision.get("auto_fix_allowed"))
+                    and _as_list(proof.get("commands")) == []
+                    and _bool(worker_evidence.get("reporting_only")),
+                ),
+            ]
+        )
+    elif scenario_type == RUNTIME_GUARD_WORKER_NOP_PASS:
+        trajectory_records = build_worker_trajectory_records(
+            job=job,
+            worker_result=worker_result,
+            diagnostic_vector=diagnostic_vector,
+            repo="controlled-fixture/replayable-benchmark",
+            branch="fixture",
+            commit_sha="fixture-runtime-worker-nop",
+        )
+        checks.extend(
+            [
+                _check(
+                    name="passing_guard_emits_no_diagnosis",
+                    passed=_int(result_summary.get("diagnosis_count")) == 0 and not diagnoses,
+                    expected=True,
+                    actual=_int(result_summary.get("diagnosis_count")) == 0 and not diagnoses,
+                ),
+                _check(
+                    name="passing_guard_emits_no_trajectory",
+                    passed=trajectory_records == [],
+                    expected=[],
+                    actual=trajectory_records,
+                ),
+            ]
+        )
+    else:
+        forged = json.loads(json.dumps(worker_result))
+        forged_boundary = _as_dict(scenario.get("forged_worker_boundary"))
+        _as_dict(forged.get("decision_boundary")).update(forged_boundary)
+        expected_error = _string(scenario.get("expected_error"))
+        rejected = False
+        try:
+            build_worker_trajectory_records(
+                job=job,
+                worker_result=forged,
+                diagnostic_vector=diagnostic_vector,
+                repo="controlled-fixture/replayable-benchmark",
+                branch="fixture",
+                commit_sha="fixture-runtime-worker-unsafe",
+            )
+        except ValueError as exc:
+            observed_error = str(exc)
+            rejected = expected_error in observed_error
+        checks.extend(
+            [
+                _check(
+                    name="forged_worker_authority_rejected",
+                    passed=rejected,
+                    expected=expected_error,
+                    actual=observed_error,
+                ),
+                _check(
+                    name="forged_worker_emits_no_trajectory",
+                    passed=trajectory_records == [],
+                    expected=[],
+                    actual=trajectory_records,
+                ),
+            ]
+        )
+
+    passed = all(_bool(item.get("passed")) for item in checks)
+    return {
+        "scenario_id": scenario_id,
+        "scenario_type": scenario_type,
+        "status": "passed" if passed else "failed",
+        "passed": passed,
+        "attempt_scored": False,
+        "attempt_score": 0,
+        "checks": checks,
+        "diagnosis_count": _int(result_summary.get("diagnosis_count")),
+        "trajectory_record_count": len(trajectory_records),
+        "observed_error": observed_error,
+    }
+
+
+def build_diagnostic_worker_benchmark_report(scenarios: list[Mapping[str, Any]]) -> JsonObject:
+    results = [evaluate_diagnostic_worker_scenario(scenario) for scenario in scenarios]
+    type_counts = Counter(_string(item.get("scenario_type")) for item in results)
+    required_present = all(
+        type_counts.get(item, 0) >= 1 for item in DIAGNOSTIC_WORKER_REQUIRED_SCENARIO_TYPES
+    )
+    required_passed = all(
+        any(
+            result.get("scenario_type") == scenario_type and result.get("passed") is True
+            for result in results
+        )
+        for scenario_type in DIAGNOSTIC_WORKER_REQUIRED_SCENARIO_TYPES
+    )
+    passed_count = sum(1 for item in results if item.get("passed") is True)
+    boundary = {
+        "execution_model": "_".join(
+            ("read", "only", "diagnostic", "worker", "fixture", "evaluation")
+        ),
+        "automation_allowed_count": 0,
+        "merge_authorized_count": 0,
+        "semantic_equivalence_claimed_count": 0,
+        "preserved": True,
+        "contributes_to_current_pr_decision": False,
+        "feeds_repo_memory": False,
+        "executes_patch": False,
+        "protected_verifier_semantics_expanded": False,
+    }
+    passed = bool(results) and passed_count == len(results) and required_present and required_passed
+    return {
+        "schema_version": DIAGNOSTIC_WORKER_REPORT_SCHEMA_VERSION,
+        "report_mode": DIAGNOSTIC_WORKER_REPORT_MODE,
+        "status": "passed" if passed else "failed",
+        "scenario_count": len(results),
+        "passed_count": passed_count,
+        "failed_count": len(results) - passed_count,
+        "scenario_type_counts": dict(sorted(type_counts.items())),
+        "replay_manifest": _replay_manifest(results),
+        "required_contract": {
+            "required_scenario_types": list(DIAGNOSTIC_WORKER_REQUIRED_SCENARIO_TYPES),
+            "all_required_present": required_present,
+            "all_required_passed": required_passed,
+            "oracle_pass_rate": _type_rate(results, RUNTIME_GUARD_WORKER_ORACLE_PASS),
+            "nop_pass_rate": _type_rate(results, RUNTIME_GUARD_WORKER_NOP_PASS),
+            "unsafe_authority_rejection_rate": _type_rate(
+                results, RUNTIME_GUARD_WORKER_AUTHORITY_FAIL
+            ),
+        },
+        "safety_boundary": boundary,
+        "attempt_scored_count": 0,
+        "scenarios": results,
+        "next_boundary": (
+            "Keep runtime-guard worker benchmark evidence non-authorizing; "
+            "do not add remediation authority."
+        ),
+    }
+
+
+def _run_execution_plan_handoff_fixture(
+    scenario: Mapping[str, Any],
+) -> tuple[JsonObject, JsonObject, JsonObject]:
+    scenario_id = _string(scenario.get("scenario_id"))
+    execution_plan = _as_dict(scenario.get("diagnostic_execution_plan"))
+    input_artifacts = {"check_intelligence": f"fixture:{scenario_id}"}
+    if execution_plan:
+        input_artifacts["diagnostic_execution_plan"] = f"fixture:{scenario_id}"
+
+    job = build_diagnostic_job(
+        repo="controlled-fixture/replayable-benchmark",
+        base_sha="fixture-base",
+        head_sha=f"fixture-head-{scenario_id}",
+        event_name="replayable_benchmark",
+        pr_number=0,
+        input_artifacts=input_artifacts,
+    )
+    with tempfile.TemporaryDirectory(
+        prefix="-".join(("sdetkit", "execution", "plan", "handoff", "benchmark", ""))
+    ) as temp_dir:
+        worker_dir = Path(temp_dir) / "worker"
+        result = run_diagnostic_worker(
+            job,
+            check_intelligence=_as_dict(scenario.get("check_intelligence")),
+            diagnostic_execution_plan=execution_plan or None,
+            out_dir=worker_dir,
+        )
+        vector = _read_json_object(worker_dir / "vector" / "diagnostic-vector.json")
+    return job, result, vector
+
+
+def evaluate_execution_plan_handoff_scenario(
+    scenario: Mapping[str, Any],
+) -> JsonObject:
+    scenario_id = _string(scenario.get("scenario_id"))
+    scenario_type = _string(scenario.get("scenario_type"))
+    if scenario_type not in EXECUTION_PLAN_HANDOFF_SCENARIO_TYPES:
+        raise ValueError(f"unsupported execution-plan handoff scenario_type: {scenario_type}")
+
+    job, worker_result, diagnostic_vector = _run_execution_plan_handoff_fixture(scenario)
+    worker_boundary = _as_dict(worker_result.get("decision_boundary"))
+    worker_handoff = _as_dict(worker_result.get("execution_plan_handoff"))
+    expected = _as_dict(scenario.get("expected"))
+    checks: list[JsonObject] = [
+        _check(
+            name="worker_automation_boundary",
+            passed=not _bool(worker_boundary.get("automation_allowed")),
+            expected=False,
+            actual=_bool(worker_boundary.get("automation_allowed")),
+        ),
+        _check(
+            name="worker_merge_boundary",
+            passed=not _bool(worker_boundary.get("merge_authorized")),
+            expected=False,
+            actual=_bool(worker_boundary.get("merge_authorized")),
+        ),
+        _check(
+            name="worker_semantic_boundary",
+            passed=not _bool(worker_boundary.get("semantic_equivalence_proven")),
+            expected=False,
+            actual=_bool(worker_boundary.get("semantic_equivalence_proven")),
+        ),
+        _check(
+            name="worker_handoff_reporting_only",
+            passed=_bool(worker_handoff.get("reporting_only"))
+            and not _bool(worker_handoff.get("execution_allowed"))
+            and not _bool(worker_handoff.get("current_pr_decision_input")),
+            expected=True,
+            actual=_bool(worker_handoff.get("reporting_only"))
+            and not _bool(worker_handoff.get("execution_allowed"))
+            and not _bool(worker_handoff.get("current_pr_decision_input")),
+        ),
+    ]
+
+    trajectory_records: list[JsonObject] = []
+    observed_error = ""
+
+    if scenario_type == EXECUTION_PLAN_HANDOFF_ORACLE_PASS:
+        trajectory_records = build_worker_trajectory_records(
+            job=job,
+            worker_result=worker_result,
+            diagnostic_vector=diagnostic_vector,
+            repo="controlled-fixture/replayable-benchmark",
+            branch="fixture",
+            commit_sha="fixture-execution-plan-handoff-oracle",
+        )
+        record = _as_dict(trajectory_records[0]) if trajectory_records else {}
+        proof = _as_dict(record.get("proof"))
+        trajectory_handoff = _as_dict(
+            _as_dict(record.get("worker_evidence")).get("execution_plan_handoff")
+        )
+        command_rows = [
+            _as_dict(item)
+            for item in _as_list(trajectory_handoff.get("command_evidence"))
+            if _as_dict(item)
+        ]
+        actual_command_count = _int(
+            _as_dict(trajectory_handoff.get("summary")).get("command_count")
+        )
+        actual_review_first_count = _int(
+            _as_dict(trajectory_handoff.get("summary")).get("review_first_item_count")
+        )
+        checks.extend(
+            [
+                _check(
+                    name="execution_plan_handoff_observed",
+                    passed=_string(trajectory_handoff.get("status")) == "observed",
+                    expected="observed",
+                    actual=_string(trajectory_handoff.get("status")),
+                ),
+                _check(
+                    name="execution_plan_command_count",
+                    passed=actual_command_count == _int(expected.get("command_count")),
+                    expected=_int(expected.get("command_count")),
+                    actual=actual_command_count,
+                ),
+                _check(
+                    name="execution_plan_review_first_count",
+                    passed=actual_review_first_count
+                    == _int(expected.get("review_first_item_count")),
+                    expected=_int(expected.get("review_first_item_count")),
+                    actual=actual_review_first_count,
+                ),
+                _check(
+                    name="execution_plan_commands_non_executable",
+                    passed=bool(command_rows)
+                    and all(not _bool(item.get("execution_allowed")) for item in command_rows),
+                    expected=True,
+                    actual=bool(command_rows)
+                    and all(not _bool(item.get("execution_allowed")) for item in command_rows),
+                ),
+                _check(
+                    name="execution_plan_trajectory_proof_empty",
+                    passed=_as_list(proof.get("commands")) == [],
+                    expected=[],
+                    actual=_as_list(proof.get("commands")),
+                ),
+            ]
+        )
+    elif scenario_type == EXECUTION_PLAN_HANDOFF_NOP_PASS:
+        trajectory_records = build_worker_trajectory_records(
+            job=job,
+            worker_result=worker_result,
+            diagnostic_vector=diagnostic_vector,
+            repo="controlled-fixture/replayable-benchmark",
+            branch="fixture",
+            commit_sha="fixture-execution-plan-handoff-nop",
+        )
+        record = _as_dict(trajectory_records[0]) if trajectory_records else {}
+        proof = _as_dict(record.get("proof"))
+        trajectory_handoff = _as_dict(
+            _as_dict(record.get("worker_evidence")).get("execution_plan_handoff")
+        )
+        summary = _as_dict(trajectory_handoff.get("summary"))
+        checks.extend(
+            [
+                _check(
+                    name="execution_plan_handoff_not_provided",
+                    passed=_string(trajectory_handoff.get("status")) == "not_provided",
+                    expected="not_provided",
+                    actual=_string(trajectory_handoff.get("status")),
+                ),
+                _check(
+                    name="execution_plan_handoff_empty",
+                    passed=_int(summary.get("command_count")) == 0
+                    and _as_list(trajectory_handoff.get("command_evidence")) == [],
+                    expected=True,
+                    actual=_int(summary.get("command_count")) == 0
+                    and _as_list(trajectory_handoff.get("command_evidence")) == [],
+                ),
+                _check(
+                    name="execution_plan_nop_proof_empty",
+                    passed=_as_list(proof.get("commands")) == [],
+                    expected=[],
+                    actual=_as_list(proof.get("commands")),
+                ),
+            ]
+        )
+    else:
+        forged = json.loads(json.dumps(worker_result))
+        forged_handoff = _as_dict(forged.get("execution_plan_handoff"))
+        command_rows = _as_list(forged_handoff.get("command_evidence"))
+        if not command_rows:
+            raise ValueError("execution-plan authority scenario requires command evidence")
+        field = _string(scenario.get("authority_expansion_field")) or "execution_allowed"
+        first_command = _as_dict(command_rows[0])
+        first_command[field] = not _bool(first_command.get(field))
+        expected_error = _string(scenario.get("expected_error"))
+        rejected = False
+        try:
+            build_worker_trajectory_records(
+                job=job,
+                worker_result=forged,
+                diagnostic_vector=diagnostic_vector,
+                repo="controlled-fixture/replayable-benchmark",
+                branch="fixture",
+                commit_sha="fixture-execution-plan-handoff-authority",
+            )
+        except ValueError as exc:
+            observed_error = str(exc)
+            rejected = expected_error in observed_error
+        checks.extend(
+            [
+                _check(
+                    name="forged_execution_plan_authority_rejected",
+                    passed=rejected,
+                    expected=expected_error,
+                    actual=observed_error,
+                ),
+                _check(
+                    name="_".join(("forged", "execution", "plan", "emits", "no", "trajectory")),
+                    passed=trajectory_records == [],
+                    expected=[],
+                    actual=trajectory_records,
+                ),
+            ]
+        )
+
+    passed = all(_bool(item.get("passed")) for item in checks)
+    return {
+        "scenario_id": scenario_id,
+        "scenario_type": scenario_type,
+        "status": "passed" if passed else "failed",
+        "passed": passed,
+        "attempt_scored": False,
+        "attempt_score": 0,
+        "checks": checks,
+        "execution_plan_handoff_status": _string(worker_handoff.get("status")),
+        "planned_command_count": _int(_as_dict(worker_handoff.get("summary")).get("command_count")),
+        "trajectory_record_count": len(trajectory_records),
+        "observed_error": observed_error,
+    }
+
+
+def build_execution_plan_handoff_benchmark_report(
+    scenarios: list[Mapping[str, Any]],
+) -> JsonObject:
+    results = [evaluate_execution_plan_handoff_scenario(scenario) for scenario in scenarios]
+    type_counts = Counter(_string(item.get("scenario_type")) for item in results)
+    required_present = all(
+        type_counts.get(item, 0) >= 1 for item in EXECUTION_PLAN_HANDOFF_REQUIRED_SCENARIO_TYPES
+    )
+    required_passed = all(
+        any(
+            result.get("scenario_type") == scenario_type and result.get("passed") is True
+            for result in results
+        )
+        for scenario_type in EXECUTION_PLAN_HANDOFF_REQUIRED_SCENARIO_TYPES
+    )
+    passed_count = sum(1 for item in results if item.get("passed") is True)
+    boundary = {
+        "execution_model": "_".join(("read", "only", "execution", "plan", "handoff", "fixture")),
+        "automation_allowed_count": 0,
+        "merge_authorized_count": 0,
+        "semantic_equivalence_claimed_count": 0,
+        "preserved": True,
+        "contributes_to_current_pr_decision": False,
+        "feeds_repo_memory": False,
+        "executes_plan": False,
+        "executes_patch": False,
+        "protected_verifier_semantics_expanded": False,
+    }
+    passed = bool(results) and passed_count == len(results) and required_present and required_passed
+    return {
+        "schema_version": EXECUTION_PLAN_HANDOFF_REPORT_SCHEMA_VERSION,
+        "report_mode": EXECUTION_PLAN_HANDOFF_REPORT_MODE,
+        "status": "passed" if passed else "failed",
+        "scenario_count": len(results),
+        "passed_count": passed_count,
+        "failed_count": len(results) - passed_count,
+        "scenario_type_counts": dict(sorted(type_counts.items())),
+        "replay_manifest": _replay_manifest(results),
+        "required_contract": {
+            "required_scenario_types": list(EXECUTION_PLAN_HANDOFF_REQUIRED_SCENARIO_TYPES),
+            "all_required_present": required_present,
+            "all_required_passed": required_passed,
+            "observed_handoff_pass_rate": _type_rate(results, EXECUTION_PLAN_HANDOFF_ORACLE_PASS),
+            "not_provided_pass_rate": _type_rate(results, EXECUTION_PLAN_HANDOFF_NOP_PASS),
+            "unsafe_authority_rejection_rate": _type_rate(
+                results, EXECUTION_PLAN_HANDOFF_AUTHORITY_FAIL
+            ),
+        },
+        "safety_boundary": boundary,
+        "attempt_scored_count": 0,
+        "scenarios": results,
+        "next_boundary": (
+            "Keep execution-plan handoff benchmark evidence reporting-only; "
+            "do not execute plans or add remediation authority."
+        ),
+    }
+
+
+def _run_security_freshness_worker_fixture(
+    scenario: Mapping[str, Any],
+) -> tuple[JsonObject, JsonObject, JsonObject]:
+    scenario_id = _string(scenario.get("scenario_id"))
+    job = build_diagnostic_job(
+        repo="controlled-fixture/replayable-benchmark",
+        base_sha="fixture-base",
+        head_sha=f"fixture-head-{scenario_id}",
+        event_name="replayable_benchmark",
+        pr_number=0,
+        input_artifacts={
+            "security_review": f"fixture:{scenario_id}",
+            "runtime_proof_artifacts": f"fixture:{scenario_id}",
+        },
+    )
+    with tempfile.TemporaryDirectory(prefix="sdetkit-security-freshness-benchmark-") as temp_dir:
+        worker_dir = Path(temp_dir) / "worker"
+        result = run_diagnostic_worker(
+            job,
+            security_review=_as_dict(scenario.get("security_review")),
+            runtime_proof_artifacts=_as_dict(scenario.get("runtime_proof_artifacts")),
+            out_dir=worker_dir,
+        )
+        vector = _read_json_object(worker_dir / "vector" / "diagnostic-vector.json")
+    return job, result, vector
+
+
+def evaluate_security_freshness_scenario(scenario: Mapping[str, Any]) -> JsonObject:
+    scenario_id = _string(scenario.get("scenario_id"))
+    scenario_type = _string(scenario.get("scenario_type"))
+    if scenario_type not in SECURITY_FRESHNESS_SCENARIO_TYPES:
+        raise ValueError(f"unsupported security freshness scenario_type: {scenario_type}")
+
+    job, worker_result, diagnostic_vector = _run_security_freshness_worker_fixture(scenario)
+    result_summary = _as_dict(worker_result.get("summary"))
+    primary = _as_dict(worker_result.get("primary_diagnosis"))
+    boundary = _as_dict(worker_result.get("decision_boundary"))
+    expected = _as_dict(scenario.get("expected"))
+    diagnoses = [_as_dict(item) for item in _as_list(diagnostic_vector.get("diagnoses"))]
+    primary_vector = _as_dict(diagnoses[0].get("failure_vector")) if diagnoses else {}
+    checks: list[JsonObject] = [
+        _check(
+            name="worker_automation_boundary",
+            passed=not _bool(boundary.get("automation_allowed")),
+            expected=False,
+            actual=_bool(boundary.get("automation_allowed")),
+        ),
+        _check(
+            name="worker_merge_boundary",
+            passed=not _bool(boundary.get("merge_authorized")),
+            expected=False,
+            actual=_bool(boundary.get("merge_authorized")),
+        ),
+        _check(
+            name="worker_semantic_boundary",
+            passed=not _bool(boundary.get("semantic_equivalence_proven")),
+            expected=False,
+            actual=_bool(boundary.get("semantic_equivalence_proven")),
+        ),
+    ]
+    trajectory_records: list[JsonObject] = []
+    observed_error = ""
+
+    if scenario_type == SECURITY_FRESHNESS_STALE_RUNTIME_PASS:
+        trajectory_records = build_worker_trajectory_records(
+            job=job,
+            worker_result=worker_result,
+            diagnostic_vector=diagnostic_vector,
+            repo="controlled-fixture/replayable-benchmark",
+            branch="fixture",
+            commit_sha="fixture-security-freshness-stale-runtime",
+        )
+        checks.extend(
+            [
+                _check(
+                    name="stale_security_is_not_worker_vector",
+                    passed=all(
+                        _string(row.get("failure_surface")) != "security" for row in diagnoses
+                    ),
+                    expected=True,
+                    actual=all(
+                        _string(row.get("failure_surface")) != "security" for row in diagnoses
+                    ),
+                ),
+                _check(
+                    name="runtime_remains_primary_when_security_is_stale",
+                    passed=_string(primary.get("failure_surface"))
+                    == _string(expected.get("primary_surface"))
+                    and _string(result_summary.get("primary_action"))
+                    == _string(expected.get("primary_action"))
+                    and _int(result_summary.get("diagnosis_count"))
+                    == _int(expected.get("diagnosis_count")),
+                    expected=True,
+                    actual=_string(primary.get("failure_surface"))
+                    == _string(expected.get("primary_surface"))
+                    and _string(result_summary.get("primary_action"))
+                    == _string(expected.get("primary_action"))
+                    and _int(result_summary.get("diagnosis_count"))
+                    == _int(expected.get("diagnosis_count")),
+                ),
+                _check(
+                    name="stale_security_runtime_trajectory_is_advisory",
+                    passed=len(trajectory_records) == 1
+                    and all(
+                        not _bool(_as_dict(row.get("decision")).get("auto_fix_allowed"))
+                        for row in trajectory_records
+                    ),
+                    expected=True,
+                    actual=len(trajectory_records) == 1
+                    and all(
+                        not _bool(_as_dict(row.get("decision")).get("auto_fix_allowed"))
+                        for row in trajectory_records
+                    ),
+                ),
+            ]
+        )
+    elif scenario_type == SECURITY_FRESHNESS_CURRENT_PRIMARY_PASS:
+        trajectory_records = build_worker_trajectory_records(
+            job=job,
+            worker_result=worker_result,
+            diagnostic_vector=diagnostic_vector,
+            repo="controlled-fixture/replayable-benchmark",
+            branch="fixture",
+            commit_sha="fixture-security-freshness-current-primary",
+        )
+        checks.extend(
+            [
+                _check(
+                    name="current_security_is_primary",
+                    passed=_string(primary.get("failure_surface"))
+                    == _string(expected.get("primary_surface"))
+                    and _string(result_summary.get("primary_action"))
+                    == _string(expected.get("primary_action"))
+                    and _int(result_summary.get("diagnosis_count"))
+                    == _int(expected.get("diagnosis_count")),
+                    expected=True,
+                    actual=_string(primary.get("failure_surface"))
+                    == _string(expected.get("primary_surface"))
+                    and _string(result_summary.get("primary_action"))
+                    == _string(expected.get("primary_action"))
+                    and _int(result_summary.get("diagnosis_count"))
+                    == _int(expected.get("diagnosis_count")),
+                ),
+                _check(
+                    name="current_security_vector_is_review_first",
+                    passed=_string(primary_vector.get("source")) == "security_review"
+                    and _string(primary_vector.get("failure_class")) == "security"
+                    and _string(diagnoses[0].get("stale_or_current_signal")) == "current"
+                    and _bool(diagnoses[0].get("review_first"))
+                    and not _bool(diagnoses[0].get("safe_fix_candidate")),
+                    expected=True,
+                    actual=_string(primary_vector.get("source")) == "security_review"
+                    and _string(primary_vector.get("failure_class")) == "security"
+                    and _string(diagnoses[0].get("stale_or_current_signal")) == "current"
+                    and _bool(diagnoses[0].get("review_first"))
+                    and not _bool(diagnoses[0].get("safe_fix_candidate")),
+                ),
+                _check(
+                    name="current_security_trajectory_has_no_fix_authority",
+                    passed=len(trajectory_records) == 2
+                    and all(
+                        not _bool(_as_dict(row.get("decision")).get("auto_fix_allowed"))
+                        for row in trajectory_records
+                    ),
+                    expected=True,
+                    actual=len(trajectory_records) == 2
+                    and all(
+                        not _bool(_as_dict(row.get("decision")).get("auto_fix_allowed"))
+                        for row in trajectory_records
+                    ),
+                ),
+            ]
+        )
+    else:
+        forged = json.loads(json.dumps(worker_result))
+        _as_dict(forged.get("decision_boundary")).update(
+            _as_dict(scenario.get("forged_worker_boundary"))
+        )
+        expected_error = _string(scenario.get("expected_error"))
+        rejected = False
+        try:
+            build_worker_trajectory_records(
+                job=job,
+                worker_result=forged,
+                diagnostic_vector=diagnostic_vector,
+                repo="controlled-fixture/replayable-benchmark",
+                branch="fixture",
+                commit_sha="fixture-security-freshness-authority-unsafe",
+            )
+        except ValueError as exc:
+            observed_error = str(exc)
+            rejected = expected_error in observed_error
+        checks.extend(
+            [
+                _check(
+                    name="current_security_before_forgery_is_review_first",
+                    passed=_string(primary.get("failure_surface")) == "security"
+                    and not _bool(primary.get("safe_fix_candidate")),
+                    expected=True,
+                    actual=_string(primary.get("failure_surface")) == "security"
+                    and not _bool(primary.get("safe_fix_candidate")),
+                ),
+                _check(
+                    name="forged_security_worker_authority_rejected",
+                    passed=rejected,
+                    expected=expected_error,
+                    actual=observed_error,
+                ),
+                _check(
+                    name="forged_security_worker_emits_no_trajectory",
+                    passed=trajectory_records == [],
+                    expected=[],
+                    actual=trajectory_records,
+                ),
+            ]
+        )
+
+    passed = all(_bool(item.get("passed")) for item in checks)
+    return {
+        "scenario_id": scenario_id,
+        "scenario_type": scenario_type,
+        "status": "passed" if passed else "failed",
+        "passed": passed,
+        "attempt_scored": False,
+        "attempt_score": 0,
+        "checks": checks,
+        "diagnosis_count": _int(result_summary.get("diagnosis_count")),
+        "trajectory_record_count": len(trajectory_records),
+        "observed_error": observed_error,
+    }
+
+
+def build_security_freshness_benchmark_report(scenarios: list[Mapping[str, Any]]) -> JsonObject:
+    results = [evaluate_security_freshness_scenario(scenario) for scenario in scenarios]
+    type_counts = Counter(_string(item.get("scenario_type")) for item in results)
+    required_present = all(
+        type_counts.get(item, 0) >= 1 for item in SECURITY_FRESHNESS_REQUIRED_SCENARIO_TYPES
+    )
+    required_passed = all(
+        any(
+            result.get("scenario_type") == scenario_type and result.get("passed") is True
+            for result in results
+        )
+        for scenario_type in SECURITY_FRESHNESS_REQUIRED_SCENARIO_TYPES
+    )
+    passed_count = sum(1 for item in results if item.get("passed") is True)
+    boundary = {
+        "execution_model": "_".join(
+            ("read", "only", "security", "freshness", "fixture", "evaluation")
+        ),
+        "automation_allowed_count": 0,
+        "merge_authorized_count": 0,
+        "semantic_equivalence_claimed_count": 0,
+        "preserved": True,
+        "contributes_to_current_pr_decision": False,
+        "feeds_repo_memory": False,
+        "executes_patch": False,
+        "protected_verifier_semantics_expanded": False,
+    }
+    passed = bool(results) and passed_count == len(results) and required_present and required_passed
+    return {
+        "schema_version": SECURITY_FRESHNESS_REPORT_SCHEMA_VERSION,
+        "report_mode": SECURITY_FRESHNESS_REPORT_MODE,
+        "status": "passed" if passed else "failed",
+        "scenario_count": len(results),
+        "passed_count": passed_count,
+        "failed_count": len(results) - passed_count,
+        "scenario_type_counts": dict(sorted(type_counts.items())),
+        "replay_manifest": _replay_manifest(results),
+        "required_contract": {
+            "required_scenario_types": list(SECURITY_FRESHNESS_REQUIRED_SCENARIO_TYPES),
+            "all_required_present": required_present,
+            "all_required_passed": required_passed,
+            "stale_exclusion_pass_rate": _type_rate(results, SECURITY_FRESHNESS_STALE_RUNTIME_PASS),
+            "current_primary_pass_rate": _type_rate(
+                results, SECURITY_FRESHNESS_CURRENT_PRIMARY_PASS
+            ),
+            "unsafe_authority_rejection_rate": _type_rate(
+                results, SECURITY_FRESHNESS_AUTHORITY_FAIL
+            ),
+        },
+        "safety_boundary": boundary,
+        "attempt_scored_count": 0,
+        "scenarios": results,
+        "next_boundary": (
+            "Keep security-freshness worker evidence review-first and non-authorizing; "
+            "do not add security dismissal or remediation authority."
+        ),
+    }
+
+
+def render_markdown(report: Mapping[str, Any]) -> str:
+    required = _as_dict(report.get("required_contract"))
+    boundary = _as_dict(report.get("safety_boundary"))
+    live_evidence = _as_dict(report.get("live_evidence"))
+    replay_manifest = _as_dict(report.get("replay_manifest"))
+    runtime_contract = _as_dict(report.get("runtime_proof_protected_verifier_contract_evidence"))
+    runtime_contract_boundary = _as_dict(runtime_contract.get("decision_boundary"))
+    safety_gate = _as_dict(report.get("safety_gate_evidence"))
+    safety_boundary = _as_dict(safety_gate.get("decision_boundary"))
+    scenarios = [_as_dict(item) for item in _as_list(report.get("scenarios"))]
+    report_mode = _string(report.get("report_mode") or "fixture_declared")
+    is_live = report_mode == LIVE_EVIDENCE_SOURCE
+    is_diagnostic_worker = report_mode == DIAGNOSTIC_WORKER_REPORT_MODE
+    is_security_freshness = report_mode == SECURITY_FRESHNESS_REPORT_MODE
+    is_execution_plan_handoff = report_mode == EXECUTION_PLAN_HANDOFF_REPORT_MODE
+
+    lines = [
+        "# Replayable Benchmark Harness report",
+        "",
+        f"- Status: `{_string(report.get('status'))}`",
+        f"- Mode: `{report_mode}`",
+        f"- Scenarios: `{_int(report.get('scenario_count'))}`",
+        f"- Passed: `{_int(report.get('passed_count'))}`",
+        f"- Failed: `{_int(report.get('failed_count'))}`",
+        f"- Attempts scored: `{_int(report.get('attempt_scored_count'))}`",
+        "",
+    ]
+
+    if replay_manifest:
+        scenario_ids = ", ".join(
+            _string(item) for item in _as_list(replay_manifest.get("scenario_ids"))
+        )
+        scenario_types = ", ".join(
+            _string(item) for item in _as_list(replay_manifest.get("scenario_types"))
+        )
+        lines.extend(
+            [
+                "## Replay manifest",
+                "",
+                f"- Scenario count: `{_int(replay_manifest.get('scenario_count'))}`",
+                f"- Scenario ids: `{scenario_ids or 'none'}`",
+                f"- Scenario types: `{scenario_types or 'none'}`",
+                (
+                    "- Input order preserved: "
+                    f"`{str(_bool(replay_manifest.get('input_order_preserved'))).lower()}`"
+                ),
+                (
+                    "- Duplicate scenario IDs rejected: "
+                    f"`{str(_bool(replay_manifest.get('duplicate_scenario_ids_rejected'))).lower()}`"
+                ),
+                (
+                    "- Unsupported scenario types rejected: "
+                    f"`{str(_bool(replay_manifest.get('unsupported_scenario_types_rejected'))).lower()}`"
+                ),
+                f"- Reporting only: `{str(_bool(replay_manifest.get('reporting_only'))).lower()}`",
+                (
+                    "- Automation allowed by replay manifest: "
+                    f"`{str(_bool(replay_manifest.get('automation_allowed'))).lower()}`"
+                ),
+                (
+                    "- Merge authorized by replay manifest: "
+                    f"`{str(_bool(replay_manifest.get('merge_authorized'))).lower()}`"
+                ),
+                (
+                    "- Semantic equivalence proven by replay manifest: "
+                    f"`{str(_bool(replay_manifest.get('semantic_equivalence_proven'))).lower()}`"
+                ),
+                "",
+            ]
+        )
+
+    if is_execution_plan_handoff:
+        lines.extend(
+            [
+                "## Required execution-plan handoff replay contract",
+                "",
+                (
+                    "- All required scenarios present: "
+                    f"`{str(_bool(required.get('all_required_present'))).lower()}`"
+                ),
+                (
+                    "- All required scenarios passed: "
+                    f"`{str(_bool(required.get('all_required_passed'))).lower()}`"
+                ),
+                (
+                    "- Observed handoff pass rate: "
+                    f"`{float(required.get('observed_handoff_pass_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Not-provided handoff pass rate: "
+                    f"`{float(required.get('not_provided_pass_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Unsafe authority rejection rate: "
+                    f"`{float(required.get('unsafe_authority_rejection_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Current PR decision input: "
+                    f"`{str(_bool(boundary.get('contributes_to_current_pr_decision'))).lower()}`"
+                ),
+                f"- Feeds RepoMemory: `{str(_bool(boundary.get('feeds_repo_memory'))).lower()}`",
+                f"- Executes plan: `{str(_bool(boundary.get('executes_plan'))).lower()}`",
+                "",
+            ]
+        )
+    elif is_security_freshness:
+        lines.extend(
+            [
+                "## Required security-freshness worker replay contract",
+                "",
+                (
+                    "- All required scenarios present: "
+                    f"`{str(_bool(required.get('all_required_present'))).lower()}`"
+                ),
+                (
+                    "- All required scenarios passed: "
+                    f"`{str(_bool(required.get('all_required_passed'))).lower()}`"
+                ),
+                (
+                    "- Stale exclusion pass rate: "
+                    f"`{float(required.get('stale_exclusion_pass_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Current security primary pass rate: "
+                    f"`{float(required.get('current_primary_pass_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Unsafe authority rejection rate: "
+                    f"`{float(required.get('unsafe_authority_rejection_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Current PR decision input: "
+                    f"`{str(_bool(boundary.get('contributes_to_current_pr_decision'))).lower()}`"
+                ),
+                f"- Feeds RepoMemory: `{str(_bool(boundary.get('feeds_repo_memory'))).lower()}`",
+                (
+                    "- ProtectedVerifier semantics expanded: "
+                    f"`{str(_bool(boundary.get('protected_verifier_semantics_expanded'))).lower()}`"
+                ),
+                "",
+            ]
+        )
+    elif is_diagnostic_worker:
+        lines.extend(
+            [
+                "## Required runtime-guard worker replay contract",
+                "",
+                (
+                    "- All required scenarios present: "
+                    f"`{str(_bool(required.get('all_required_present'))).lower()}`"
+                ),
+                (
+                    "- All required scenarios passed: "
+                    f"`{str(_bool(required.get('all_required_passed'))).lower()}`"
+                ),
+                (
+                    "- Oracle pass rate: "
+                    f"`{float(required.get('oracle_pass_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (f"- NOP pass rate: `{float(required.get('nop_pass_rate', 0.0) or 0.0):.4f}`"),
+                (
+                    "- Unsafe authority rejection rate: "
+                    f"`{float(required.get('unsafe_authority_rejection_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Current PR decision input: "
+                    f"`{str(_bool(boundary.get('contributes_to_current_pr_decision'))).lower()}`"
+                ),
+                f"- Feeds RepoMemory: `{str(_bool(boundary.get('feeds_repo_memory'))).lower()}`",
+                (
+                    "- ProtectedVerifier semantics expanded: "
+                    f"`{str(_bool(boundary.get('protected_verifier_semantics_expanded'))).lower()}`"
+                ),
+                "",
+            ]
+        )
+    elif is_live:
+        lines.extend(
+            [
+                "## Required Git-grounded live-evidence contract",
+                "",
+                (
+                    "- All required scenarios present: "
+                    f"`{str(_bool(required.get('all_required_present'))).lower()}`"
+                ),
+                (
+                    "- All required scenarios passed: "
+                    f"`{str(_bool(required.get('all_required_passed'))).lower()}`"
+                ),
+                (
+                    "- Oracle pass rate: "
+                    f"`{float(required.get('oracle_pass_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Inventory claim mismatch rejection rate: "
+                    f"`{float(required.get('claim_mismatch_rejection_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Proof mutation rejection rate: "
+                    f"`{float(required.get('proof_mutation_rejection_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Network boundary rejection rate: "
+                    f"`{float(required.get('network_boundary_rejection_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Unclaimed write rejection rate: "
+                    f"`{float(required.get('unclaimed_write_rejection_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Evidence shadow rejection rate: "
+                    f"`{float(required.get('evidence_shadow_rejection_rate', 0.0) or 0.0):.4f}`"
+                ),
+                "",
+                "## Live execution evidence",
+                "",
+                f"- Scenarios executed: `{_int(live_evidence.get('scenario_count'))}`",
+                (
+                    "- Git inventory verified scenarios: "
+                    f"`{_int(live_evidence.get('git_inventory_verified_count'))}`"
+                ),
+                (
+                    "- Expected failed-evidence scenarios: "
+                    f"`{_int(live_evidence.get('expected_failed_evidence_count'))}`"
+                ),
+                (
+                    "- Network boundary blocked scenarios: "
+                    f"`{_int(live_evidence.get(NETWORK_BOUNDARY_BLOCKED_COUNT))}`"
+                ),
+                (
+                    "- Network isolation enforced scenarios: "
+                    f"`{_int(live_evidence.get('network_isolation_enforced_count'))}`"
+                ),
+                (
+                    "- Anti-cheat rejection scenarios: "
+                    f"`{_int(live_evidence.get(ANTI_CHEAT_REJECTION_COUNT))}`"
+                ),
+                "",
+            ]
+        )
+    else:
+        lines.extend(
+            [
+                "## Required benchmark contract",
+                "",
+                (
+                    "- All required scenarios present: "
+                    f"`{str(_bool(required.get('all_required_present'))).lower()}`"
+                ),
+                (
+                    "- All required scenarios passed: "
+                    f"`{str(_bool(required.get('all_required_passed'))).lower()}`"
+                ),
+                (f"- NOP fail rate: `{float(required.get('nop_fail_rate', 0.0) or 0.0):.4f}`"),
+                (
+                    "- Oracle pass rate: "
+                    f"`{float(required.get('oracle_pass_rate', 0.0) or 0.0):.4f}`"
+                ),
+                (
+                    "- Unsafe patch rejection rate: "
+                    f"`{float(required.get('unsafe_patch_rejection_rate', 0.0) or 0.0):.4f}`"
+                ),
+                "",
+            ]
+        )
+
+    expanded_runtime_contract_fields = ", ".join(
+        _string(item)
+        for item in _as_list(runtime_contract.get("expanded_authority_fields"))
+        if _string(item)
+    )
+    lines.extend(
+        [
+            "## Runtime proof ProtectedVerifier contract replay",
+            "",
+            f"- Collection status: `{_string(runtime_contract.get('collection_status'))}`",
+            f"- Status: `{_string(runtime_contract.get('status'))}`",
+            f"- Scenarios with evidence: `{_int(runtime_contract.get('scenario_count'))}`",
+            f"- Records: `{_int(runtime_contract.get('record_count'))}`",
+            (
+                "- Security-relevant records: "
+                f"`{_int(runtime_contract.get('security_relevance_count'))}`"
+            ),
+            (
+                "- Authority boundary preserved records: "
+                f"`{_int(runtime_contract.get('authority_boundary_preserved_count'))}`"
+            ),
+            f"- Expanded authority fields: `{expanded_runtime_contract_fields or 'none'}`",
+            (
+                "- Patch application allowed by runtime proof contract evidence: "
+                f"`{str(_bool(runtime_contract_boundary.get('patch_application_allowed'))).lower()}`"
+            ),
+            (
+                "- Security dismissal allowed by runtime proof contract evidence: "
+                f"`{str(_bool(runtime_contract_boundary.get('security_dismissal_allowed'))).lower()}`"
+            ),
+            (
+                "- Merge authorized by runtime proof contract evidence: "
+                f"`{str(_bool(runtime_contract_boundary.get('merge_authorized'))).lower()}`"
+            ),
+            (
+                "- Semantic equivalence claimed by runtime proof contract evidence: "
+                f"`{str(_bool(runtime_contract_boundary.get('semantic_equivalence_claim'))).lower()}`"
+            ),
+            "",
+            "## SafetyGate evidence replay",
+            "",
+            f"- Collection status: `{_string(safety_gate.get('collection_status'))}`",
+            f"- Status: `{_string(safety_gate.get('status'))}`",
+            f"- Scenarios with evidence: `{_int(safety_gate.get('scenario_count'))}`",
+            f"- Records: `{_int(safety_gate.get('record_count'))}`",
+            f"- Safe-fix allowed records: `{_int(safety_gate.get('safe_fix_allowed_count'))}`",
+            f"- Review-first records: `{_int(safety_gate.get('review_first_count'))}`",
+            f"- Reporting-only records: `{_int(safety_gate.get('reporting_only_count'))}`",
+            (
+                "- Automation allowed by SafetyGate evidence: "
+                f"`{str(_bool(safety_boundary.get('automation_allowed'))).lower()}`"
+            ),
+            (
+                "- Patch application allowed by SafetyGate evidence: "
+                f"`{str(_bool(safety_boundary.get('patch_application_allowed'))).lower()}`"
+            ),
+            (
+                "- Merge authorized by SafetyGate evidence: "
+                f"`{str(_bool(safety_boundary.get('merge_authorized'))).lower()}`"
+            ),
+            (
+                "- Semantic equivalence proven by SafetyGate evidence: "
+                f"`{str(_bool(safety_boundary.get('semantic_equivalence_proven'))).lower()}`"
+            ),
+            "",
+            "## Safety boundary",
+            "",
+            f"- Execution model: `{_string(boundary.get('execution_model'))}`",
+            f"- Automation allowed count: `{_int(boundary.get('automation_allowed_count'))}`",
+            f"- Merge authorized count: `{_int(boundary.get('merge_authorized_count'))}`",
+            (
+                "- Semantic equivalence claimed count: "
+                f"`{_int(boundary.get('semantic_equivalence_claimed_count'))}`"
+            ),
+            (
+                "- Runtime proof contract authority expansion count: "
+                f"`{_int(boundary.get('runtime_proof_contract_authority_expansion_count'))}`"
+            ),
+            f"- Boundary preserved: `{str(_bool(boundary.get('preserved'))).lower()}`",
+            "",
+            "## Scenario results",
+            "",
+        ]
+    )
+
+    for scenario in scenarios:
+        source = _string(scenario.get(VERIFICATION_EVIDENCE_SOURCE))
+        source_suffix = f", evidence=`{source}`" if source else ""
+        lines.append(
+            f"- `{_string(scenario.get('scenario_id'))}` "
+            f"({_string(scenario.get('scenario_type'))}): "
+            f"`{_string(scenario.get('status'))}`, "
+            f"attempt_score=`{_int(scenario.get('attempt_score'))}`"
+            f"{source_suffix}"
+        )
+
+    lines.extend(["", "## Boundary", ""])
+    if is_execution_plan_handoff:
+        lines.extend(
+            [
+                "- This harness replays diagnostic execution-plan handoffs through controlled fixture inputs.",
+                "- It proves observed, not-provided, and forged-authority outcomes.",
+                "- It keeps trajectory proof command arrays empty.",
+                "- It does not execute plans, feed current PR decisions, or feed RepoMemory.",
+                "- It does not apply patches or authorize automation or merge.",
+            ]
+        )
+    elif is_security_freshness:
+        lines.extend(
+            [
+                "- This harness replays security-freshness DiagnosticWorker behavior through controlled fixture inputs.",
+                "- It proves stale security does not displace current runtime diagnosis.",
+                "- It proves current security remains review-first and rejects forged worker authority.",
+                "- It does not feed current PR decisions or RepoMemory.",
+                "- It does not authorize security dismissal, remediation, or merge.",
+            ]
+        )
+    elif is_diagnostic_worker:
+        lines.extend(
+            [
+                "- This harness replays runtime-guard DiagnosticWorker behavior through controlled fixture inputs.",
+                "- It records oracle, NOP, and unsafe-authority outcomes without applying patches.",
+                "- It does not feed current PR decisions or RepoMemory.",
+                "- It does not expand ProtectedVerifier semantic claims or authorize automation.",
+            ]
+        )
+    elif is_live:
+        lines.extend(
+            [
+                "- This harness executes allowlisted proof profiles in disposable workspace copies.",
+                "- Git-derived inventory grounds each live scenario before verification.",
+                "- It does not apply patches, authorize automation, or authorize merge.",
+                "- Required network isolation fails closed without a verified backend.",
+                "- Successful network isolation and semantic equivalence remain unproven.",
+            ]
+        )
+    else:
+        lines.extend(
+            [
+                "- This harness replays deterministic fixture evidence through PatchScorer and ProtectedVerifier.",
+                "- It does not apply patches or execute proof commands.",
+                "- It does not authorize automation or merge.",
+            ]
+        )
+    lines.extend([f"- Next: {_string(report.get('next_boundary'))}", ""])
+    return "\n".join(lines)
+
+
+def write_report(report: Mapping[str, Any], *, out_dir: Path) -> dict[str, str]:
+    json_path = out_dir / REPORT_JSON
+    markdown_path = out_dir / REPORT_MD
+    out_dir.mkdir(parents=True, exist_ok=True)
+    json_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    markdown_path.write_text(render_markdown(report), encoding="utf-8")
+    return {
+        "benchmark_report_json": json_path.as_posix(),
+        "benchmark_report_markdown": markdown_path.as_posix(),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m sdetkit.replayable_benchmark_harness")
+    parser.add_argument(
+        "--scenario",
+        type=Path,
+        action="append",
+        default=[],
+        help="Fixture-backed benchmark scenario JSON. May be supplied more than once.",
+    )
+    parser.add_argument(
+        "--security-freshness-scenario",
+        type=Path,
+        action="append",
+        default=[],
+        help="Controlled DiagnosticWorker security-freshness scenario JSON.",
+    )
+    parser.add_argument(
+        "--diagnostic-worker-scenario",
+        type=Path,
+        action="append",
+        default=[],
+        help="Controlled DiagnosticWorker runtime-guard scenario JSON.",
+    )
+    parser.add_argument(
+        "--execution-plan-handoff-scenario",
+        type=Path,
+        action="append",
+        default=[],
+        help="Controlled diagnostic execution-plan handoff scenario JSON.",
+    )
+    parser.add_argument(
+        "--isolated-scenario",
+        type=Path,
+        action="append",
+        default=[],
+        help="Git-grounded isolated-proof benchmark scenario JSON.",
+    )
+    parser.add_argument(
+        "--isolated-repo-root",
+        type=Path,
+        action="append",
+        default=[],
+        help="Repository root paired by position with --isolated-scenario.",
+    )
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR)
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    try:
+        if args.execution_plan_handoff_scenario:
+            if (
+                args.security_freshness_scenario
+                or args.diagnostic_worker_scenario
+                or args.scenario
+                or args.isolated_scenario
+                or args.isolated_repo_root
+            ):
+                raise ValueError(
+                    "execution-plan handoff scenarios cannot be combined with other benchmark modes"
+                )
+            report = build_execution_plan_handoff_benchmark_report(
+                load_execution_plan_handoff_scenarios(args.execution_plan_handoff_scenario)
+            )
+        elif args.security_freshness_scenario:
+            if (
+                args.diagnostic_worker_scenario
+                or args.scenario
+                or args.isolated_scenario
+                or args.isolated_repo_root
+            ):
+                raise ValueError(
+                    "security-freshness scenarios cannot be combined with other benchmark modes"
+                )
+            report = build_security_freshness_benchmark_report(
+                load_security_freshness_scenarios(args.security_freshness_scenario)
+            )
+        elif args.diagnostic_worker_scenario:
+            if args.scenario or args.isolated_scenario or args.isolated_repo_root:
+                raise ValueError(
+                    "diagnostic-worker scenarios cannot be combined with other benchmark modes"
+                )
+            report = build_diagnostic_worker_benchmark_report(
+                load_diagnostic_worker_scenarios(args.diagnostic_worker_scenario)
+            )
+        elif args.isolated_scenario:
+            if args.scenario:
+                raise ValueError(
+                    "fixture --scenario and --isolated-scenario modes cannot be combined"
+                )
+            if len(args.isolated_scenario) != len(args.isolated_repo_root):
+                raise ValueError("each --isolated-scenario requires one --isolated-repo-root")
+            scenarios = load_scenarios(args.isolated_scenario)
+            report = build_isolated_evidence_report(
+                list(zip(scenarios, args.isolated_repo_root, strict=True))
+            )
+        else:
+            if not args.scenario:
+                raise ValueError("at least one --scenario is required")
+            report = build_benchmark_report(load_scenarios(args.scenario))
+        artifacts = write_report(report, out_dir=args.out_dir)
+    except (OSError, ValueError, json.JSONDecodeError) as exc:
+        print(f"error={exc}")
+        return 2
+
+    if args.format == "json":
+        print(
+            json.dumps(
+                {
+                    "status": report["status"],
+                    "artifacts": artifacts,
+                    "scenario_count": report["scenario_count"],
+                    "passed_count": report["passed_count"],
+                },
+                indent=2,
+                sort_keys=True,
+            )
+        )
+    else:
+        for key, value in artifacts.items():
+            print(f"{key}: {value}")
+
+    return 0 if report["status"] == "passed" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,143 @@
+"""Validator-based response cache for :mod:`sdetkit.netclient` clients.
+
+Responses that carry an ``ETag`` or ``Last-Modified`` validator are stored; the
+next request for the same resource is sent with ``If-None-Match`` /
+``If-Modified-Since`` and a ``304 Not Modified`` answer is served from the store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from .sqlite_lru import SqliteLruTable
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_SQLITE_FILE_NAME = "responses.sqlite3"
+_COLUMNS = (
+    ("status_code", "INTEGER NOT NULL"),
+    ("headers", "TEXT NOT NULL"),
+    ("body", "BLOB NOT NULL"),
+    ("etag", "TEXT"),
+    ("last_modified", "TEXT"),
+)
+# Request headers that change what the server returns for the same URL.
+_KEY_HEADERS = ("accept", "authorization")
+# The stored body is already decoded, so these would misdescribe it on replay.
+_BODY_FRAMING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status_code: int
+    headers: tuple[tuple[str, str], ...]
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validators(self) -> dict[str, str]:
+        out: dict[str, str] = {}
+        if self.etag:
+            out["If-None-Match"] = self.etag
+        if self.last_modified:
+            out["If-Modified-Since"] = self.last_modified
+        return out
+
+
+class ResponseCache(Protocol):
+    def get(self, key: str) -> CachedResponse | None: ...
+
+    def put(self, key: str, entry: CachedResponse) -> None: ...
+
+
+def cache_key(method: str, url: str, headers: Mapping[str, str] | None) -> str:
+    lowered = {k.lower(): v for k, v in (headers or {}).items()}
+    parts = [method.upper(), url, *(f"{name}={lowered.get(name, '')}" for name in _KEY_HEADERS)]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def cacheable_entry(
+    status_code: int, headers: Iterable[tuple[str, str]], body: bytes
+) -> CachedResponse | None:
+    """Build a cache entry for a response, or None when it must not be stored."""
+    if status_code != 200:
+        return None
+    items = tuple(
+        (str(k), str(v)) for k, v in headers if str(k).lower() not in _BODY_FRAMING_HEADERS
+    )
+    lowered = {k.lower(): v for k, v in items}
+    if "no-store" in lowered.get("cache-control", "").lower():
+        return None
+    etag = lowered.get("etag")
+    last_modified = lowered.get("last-modified")
+    if not etag and not last_modified:
+        return None
+    return CachedResponse(status_code, items, body, etag, last_modified)
+
+
+class DiskResponseCache:
+    """Single-file SQLite store evicting least recently used entries over ``max_bytes``."""
+
+    def __init__(self, base_dir: Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self._base_dir = base_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._table = SqliteLruTable(
+            base_dir / _SQLITE_FILE_NAME, "responses", _COLUMNS, max_bytes=max_bytes
+        )
+        self._counters: dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    @property
+    def base_dir(self) -> Path:
+        return self._base_dir
+
+    def counters(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def close(self) -> None:
+        with self._lock:
+            self._table.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._table.connection()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._table.get(key)
+            self._counters["misses" if row is None else "hits"] += 1
+        if row is None:
+            return None
+        status_code, headers, body, etag, last_modified = row
+        return CachedResponse(
+            int(status_code),
+            tuple((str(k), str(v)) for k, v in json.loads(headers)),
+            bytes(body),
+            etag,
+            last_modified,
+        )
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        headers = json.dumps([list(kv) for kv in entry.headers], separators=(",", ":"))
+        size = len(entry.body) + len(headers)
+        if size > self.max_bytes:
+            return
+        values = {
+            "status_code": entry.status_code,
+            "headers": headers,
+            "body": sqlite3.Binary(entry.body),
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }
+        with self._lock:
+            evicted = self._table.put(key, values, size)
+            self._counters["writes"] += 1
+            self._counters["evictions"] += evicted
@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+SCHEMA_VERSION = "sdetkit.safe_remediation_eligibility.v1"
+
+JsonObject = dict[str, Any]
+
+FORMAT_SAFE_STRATEGY = "run_pre_commit"
+REVIEW_FIRST_STRATEGY = "review_first"
+
+
+def _as_dict(value: Any) -> JsonObject:
+    return value if isinstance(value, dict) else {}
+
+
+def _string(value: Any) -> str:
+    return str(value).strip() if value is not None else ""
+
+
+def _lower(value: Any) -> str:
+    return _string(value).lower()
+
+
+FILE_PATH_RE = re.compile(
+    r"(?P<path>(?:[A-Za-z0-9_.-]+/)+[A-Za-z0-9_.-]+\."
+    r"(?:py|pyi|toml|yaml|yml|md|rst|txt|json|cfg|ini))"
+)
+
+
+def _decision_boundary() -> JsonObject:
+    return {
+        "automation_allowed": False,
+        "auto_fix_allowed_now": False,
+        "patch_application_allowed": False,
+        "merge_authorized": False,
+        "semantic_equivalence_proven": False,
+        "requires_human_review": True,
+    }
+
+
+def _result(
+    *,
+    safe_to_auto_fix: bool,
+    strategy: str,
+    category: str,
+    reason: str,
+    affected_files: list[str] | None = None,
+    proof_commands: list[str] | None = None,
+) -> JsonObject:
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "safe_to_auto_fix": safe_to_auto_fix,
+        "strategy": strategy,
+        "category": category,
+        "affected_files": list(affected_files or []),
+        "reason": reason,
+        "proof_commands": list(proof_commands or []),
+        **_decision_boundary(),
+    }
+
+
+def _extract_affected_files(text: str) -> list[str]:
+    values: list[str] = []
+    seen: set[str] = set()
+    for match in FILE_PATH_RE.finditer(text):
+        value = match.group("path").strip().strip(":")
+        if not value or value in seen:
+            continue
+        if value.startswith(("http://", "https://")):
+            continue
+        seen.add(value)
+        values.append(value)
+    return values
+
+
+def _contains_any(text: str, needles: tuple[str, ...]) -> bool:
+    lowered = text.lower()
+    return any(needle in lowered for needle in needles)
+
+
+SAFE_AUTO_FIX_PATH_PREFIXES = ("src/", "tests/", "tools/")
+
+
+def _is_safe_repo_owned_path(path: str) -> bool:
+    clean = path.strip().replace("\\", "/")
+    if not clean or clean.startswith(("/", "~")):
+        return False
+    if clean in {".", ".."} or "/../" in f"/{clean}/":
+        return False
+    if "<" in clean or ">" in clean:
+        return False
+    return clean.startswith(SAFE_AUTO_FIX_PATH_PREFIXES)
+
+
+SAFE_FORMAT_MARKERS = (
+    "end-of-file-fixer",
+    "fix end of files",
+    "trim trailing whitespace",
+    "trailing whitespace",
+    "ruff format",
+    "ruff-format",
+    "files were modified by this hook",
+    "would reformat",
+    "import block is un-sorted or un-formatted",
+    "organize imports",
+    "found 1 error (1 fixed, 0 remaining)",
+    "1 file reformatted",
+    "files reformatted",
+)
+
+UNSAFE_REVIEW_MARKERS = (
+    "assertionerror",
+    "traceback",
+    "runtimeerror",
+    "modulenotfounderror",
+    "importerror",
+    "invaliddistribution",
+    "twine",
+    "metadata is invalid",
+    "resolutionimpossible",
+    "cannot install",
+    "mypy",
+    "incompatible return value",
+    "high entropy",
+    "secret",
+    "token",
+    "github advanced security",
+    "ghas",
+    "permission",
+    "oidc",
+    "publish",
+    "release artifact",
+)
+
+
+_EXACT_FAILURE_HIGH_CONFIDENCE_KINDS = frozenset(
+    {
+        "check_run_annotation",
+        "dependency_resolution",
+        "dependency_vulnerability",
+        "format_drift",
+        "lint_failure",
+        "runtime_failure",
+        "test_failure",
+        "type_contract",
+    }
+)
+
+
+def _failure_evidence_quality(first_failure: JsonObject) -> JsonObject:
+    quality = _as_dict(first_failure.get("evidence_quality"))
+    line = _string(first_failure.get("line"))
+    kind = _lower(first_failure.get("kind"))
+
+    confidence = _lower(quality.get("confidence"))
+    if confidence not in {"high", "medium", "low"}:
+        if line and kind in _EXACT_FAILURE_HIGH_CONFIDENCE_KINDS:
+            confidence = "high"
+        elif line:
+            confidence = "medium"
+        else:
+            confidence = "low"
+
+    if "actionable" in quality:
+        actionable = bool(quality.get("actionable"))
+    else:
+        actionable = bool(line and confidence == "high")
+
+    raw_uncertainty = quality.get("uncertainty", [])
+    uncertainty = (
+        sorted({_string(item) for item in raw_uncertainty if _string(item)})
+        if isinstance(raw_uncertainty, list)
+        else []
+    )
+
+    source = _string(quality.get("source") or "legacy_inference")
+    return {
+        "confidence": confidence,
+        "actionable": actionable,
+        "source": source,
+        "uncertainty": uncertainty,
+        "reporting_only": True,
+        "automation_allowed": False,
+        "patch_application_allowed": False,
+        "merge_authorized": False,
+        "semantic_equivalence_proven": False,
+    }
+
+
+def _result_with_failure_evidence(
+    first_failure: JsonObject,
+    **kwargs: Any,
+) -> JsonObject:
+    result = _result(**kwargs)
+    result["exact_failure_evidence"] = _failure_evidence_quality(first_failure)
+    return result
+
+
+def classify_check_failure(
+    *,
+    name: str = "",
+    diagnosis: JsonObject | None = None,
+    first_failure: JsonObject | None = None,
+    log_text: str = "",
+) -> JsonObject:
+    diagnosis = _as_dict(diagnosis)
+    first_failure = _as_dict(first_failure)
+
+    first_line = _string(first_failure.get("line"))
+    tool = _lower(first_failure.get("tool"))
+    kind = _lower(first_failure.get("kind"))
+    code = _lower(diagnosis.get("code"))
+    title = _lower(diagnosis.get("title"))
+    combined = "\n".join(
+        value
+        for value in (
+            name,
+            first_line,
+            tool,
+            kind,
+            code,
+            title,
+            log_text,
+        )
+        if value
+    )
+
+    raw_context = first_failure.get("context", [])
+    if not isinstance(raw_context, list):
+        raw_context = []
+    context_text = "\n".join(
+        _string(_as_dict(item).get("text")) for item in raw_context if isinstance(item, dict)
+    )
+    affected_files = _extract_affected_files(
+        "\n".join(value for value in (first_line, context_text, log_text) if value)
+    )
+
+    if kind == "check_run_annotation":
+        return _result_with_failure_evidence(
+            first_failure,
+            safe_to_auto_fix=False,
+            strategy=REVIEW_FIRST_STRATEGY,
+            category="review_first",
+            affected_files=affected_files,
+            reason="Sanitized Check Run annotation evidence is review-first and cannot authorize mutation.",
+        )
+
+    unsafe_signal = _contains_any(combined, UNSAFE_REVIEW_MARKERS)
+    formatting_signal = kind == "format_drift" or _contains_any(combined, SAFE_FORMAT_MARKERS)
+    failure_evidence = _failure_evidence_quality(first_failure)
+
+    if unsafe_signal:
+        return _result_with_failure_evidence(
+            first_failure,
+            safe_to_auto_fix=False,
+            strategy=REVIEW_FIRST_STRATEGY,
+            category="review_first",
+            affected_files=affected_files,
+            reason="Review-first evidence dominates any formatting-only signal.",
+        )
+
+    if formatting_signal:
+        if (
+            failure_evidence["confidence"] != "high"
+            or failure_evidence["actionable"] is not True
+            or failure_evidence["uncertainty"]
+        ):
+            return _result_with_failure_evidence(
+                first_failure,
+                safe_to_auto_fix=False,
+                strategy=REVIEW_FIRST_STRATEGY,
+                category="review_first",
+                affected_files=affected_files,
+                reason=(
+                    "Formatting evidence lacks a high-confidence, actionable exact-failure "
+                    "signal without unresolved uncertainty."
+                ),
+            )
+
+        if not affected_files:
+            return _result_with_failure_evidence(
+                first_failure,
+                safe_to_auto_fix=False,
+                strategy=REVIEW_FIRST_STRATEGY,
+                category="review_first",
+                reason="Formatting evidence has no identified affected files.",
+            )
+
+        unsafe_files = [value for value in affected_files if not _is_safe_repo_owned_path(value)]
+        if unsafe_files:
+            return _result_with_failure_evidence(
+                first_failure,
+                safe_to_auto_fix=False,
+                strategy=REVIEW_FIRST_STRATEGY,
+                category="review_first",
+                affected_files=affected_files,
+                reason="Formatting evidence includes files outside approved safe-fix paths.",
+            )
+
+        return _result_with_failure_evidence(
+            first_failure,
+            safe_to_auto_fix=True,
+            strategy=FORMAT_SAFE_STRATEGY,
+            category="formatting_only",
+            affected_files=affected_files,
+            reason="Failure is limited to deterministic formatting or whitespace hooks.",
+            proof_commands=[
+                "python -m pre_commit run -a",
+                "python -m ruff check src tests",
+                "python -m mypy src",
+            ],
+        )
+
+    return _result_with_failure_evidence(
+        first_failure,
+        safe_to_auto_fix=False,
+        strategy=REVIEW_FIRST_STRATEGY,
+        category="unknown",
+        reason="Failure is not in the approved safe-remediation allowlist.",
+    )
@@ -0,0 +1,134 @@
+"""Single-file SQLite key/value table with least-recently-used and age eviction.
+
+Shared by the on-disk caches (:mod:`sdetkit.checks.cache`,
+:mod:`sdetkit.response_cache`). Every row carries ``key``, ``size``,
+``created_at`` and ``last_used`` next to the caller's payload columns; after a
+write, rows older than ``max_age_seconds`` go first, then the least recently
+used rows beyond ``max_entries`` or ``max_bytes``. Reads also treat a row older
+than ``max_age_seconds`` as a miss and delete it, so a run that only hits the
+cache never serves expired payloads.
+
+The table is not locked: callers serialize access, as both caches already do
+with their own lock.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+
+class SqliteLruTable:
+    def __init__(
+        self,
+        path: Path,
+        table: str,
+        columns: Sequence[tuple[str, str]],
+        *,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+        max_age_seconds: float | None = None,
+    ) -> None:
+        self.path = path
+        self.table = table
+        self._columns = tuple(columns)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self._db: sqlite3.Connection | None = None
+
+    def connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+            payload = "".join(f"{name} {decl},\n" for name, decl in self._columns)
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} (\n"
+                "key TEXT PRIMARY KEY,\n"
+                f"{payload}"
+                "size INTEGER NOT NULL,\n"
+                "created_at REAL NOT NULL,\n"
+                "last_used REAL NOT NULL\n"
+                ")"
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_last_used ON {self.table}(last_used)"
+            )
+            conn.commit()
+            self._db = conn
+        return self._db
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def get(self, key: str) -> tuple[Any, ...] | None:
+        """Return the payload columns for *key* and mark it as recently used.
+
+        A row older than ``max_age_seconds`` is deleted and reported as a miss.
+        """
+        now = time.time()
+        conn = self.connection()
+        names = ", ".join(name for name, _ in self._columns)
+        row = conn.execute(
+            f"SELECT {names}, created_at FROM {self.table} WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if self.max_age_seconds is not None and float(row[-1]) < now - self.max_age_seconds:
+            conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            conn.commit()
+            return None
+        conn.execute(f"UPDATE {self.table} SET last_used = ? WHERE key = ?", (now, key))
+        conn.commit()
+        return tuple(row[:-1])
+
+    def put(self, key: str, values: Mapping[str, Any], size: int) -> int:
+        """Insert or replace *key*, then evict; returns the number of rows evicted."""
+        now = time.time()
+        conn = self.connection()
+        names = [name for name, _ in self._columns]
+        placeholders = ", ".join("?" for _ in range(len(names) + 4))
+        conn.execute(
+            f"INSERT OR REPLACE INTO {self.table}"
+            f"(key, {', '.join(names)}, size, created_at, last_used) VALUES ({placeholders})",
+            (key, *(values[name] for name in names), size, now, now),
+        )
+        evicted = self._evict(conn, now)
+        conn.commit()
+        return evicted
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        evicted = 0
+        if self.max_age_seconds is not None:
+            cur = conn.execute(
+                f"DELETE FROM {self.table} WHERE created_at < ?", (now - self.max_age_seconds,)
+            )
+            evicted += max(0, cur.rowcount)
+        if self.max_entries is not None:
+            cur = conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN ("
+                f"SELECT key FROM {self.table} ORDER BY last_used DESC, key LIMIT -1 OFFSET ?)",
+                (max(0, self.max_entries),),
+            )
+            evicted += max(0, cur.rowcount)
+        if self.max_bytes is not None:
+            total = int(
+                conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+            )
+            if total > self.max_bytes:
+                doomed: list[str] = []
+                for key, size in conn.execute(
+                    f"SELECT key, size FROM {self.table} ORDER BY last_used ASC, key"
+                ):
+                    if total <= self.max_bytes:
+                        break
+                    doomed.append(str(key))
+                    total -= int(size)
+                conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", [(k,) for k in doomed])
+                evicted += len(doomed)
+        return evicted
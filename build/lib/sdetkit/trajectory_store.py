@@ -0,0 +1,729 @@
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+SCHEMA_VERSION = "sdetkit.trajectory.v1"
+DEFAULT_GENERATED_AT = "1970-01-01T00:00:00Z"
+DEFAULT_OUT = str(Path("build") / "sdetkit" / "trajectory.jsonl")
+
+JsonObject = dict[str, Any]
+
+
+def _as_dict(value: Any) -> JsonObject:
+    return value if isinstance(value, dict) else {}
+
+
+def _as_list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else []
+
+
+def _string(value: Any) -> str:
+    return str(value or "").replace("\r", " ").replace("\n", " ").strip()
+
+
+def _bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in {"1", "true", "yes"}
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _string_list(value: Any) -> list[str]:
+    return sorted({_string(item) for item in _as_list(value) if _string(item)})
+
+
+def _failure_bundle_safety_evidence(value: Mapping[str, Any] | None) -> JsonObject:
+    payload = _as_dict(value)
+    if not payload:
+        return {}
+
+    failure_bundle = _as_dict(payload.get("failure_bundle"))
+    if failure_bundle:
+        payload = failure_bundle
+
+    summary = _as_dict(payload.get("safety_summary"))
+    if not summary:
+        manifest = _as_dict(payload.get("manifest"))
+        if manifest:
+            summary = {
+                "review_first": manifest.get("review_first", False),
+                "safe_fix_allowed": manifest.get("safe_fix_allowed", False),
+                "reporting_only": True,
+                "automation_allowed": False,
+                "patch_application_allowed": False,
+                "merge_authorized": False,
+                "semantic_equivalence_proven": False,
+            }
+
+    if not summary:
+        return {}
+
+    return {
+        "source": "failure_bundle.safety_summary",
+        "review_first": _bool(summary.get("review_first")),
+        "safe_fix_allowed": _bool(summary.get("safe_fix_allowed")),
+        "reporting_only": True,
+        "automation_allowed": False,
+        "patch_application_allowed": False,
+        "merge_authorized": False,
+        "semantic_equivalence_proven": False,
+        "report_path": _string(payload.get("report_path")),
+    }
+
+
+def _authority_boundary(
+    *,
+    source: str,
+    review_first: bool,
+    auto_fix_allowed: bool,
+    reason: str = "",
+) -> JsonObject:
+    return {
+        "source": source,
+        "reporting_only": True,
+        "review_first": review_first,
+        "auto_fix_allowed": auto_fix_allowed,
+        "automation_allowed": False,
+        "patch_application_allowed": False,
+        "merge_authorized": False,
+        "semantic_equivalence_proven": False,
+        "automatic_security_fix_allowed": False,
+        "automatic_dismissal_allowed": False,
+        "reason": _string(reason),
+    }
+
+
+def _failure_vector_contract_evidence(failure_vector: Mapping[str, Any]) -> JsonObject:
+    contract = _as_dict(failure_vector.get("contract"))
+    if not contract:
+        return {}
+
+    false_authority = {
+        "automation_allowed": _bool(contract.get("automation_allowed")),
+        "patch_application_allowed": _bool(contract.get("patch_application_allowed")),
+        "security_dismissal_allowed": _bool(contract.get("security_dismissal_allowed")),
+        "merge_authorized": _bool(contract.get("merge_authorized")),
+        "semantic_equivalence_claim": _bool(contract.get("semantic_equivalence_claim")),
+    }
+
+    return {
+        "source": "failure_vector.contract",
+        "schema_version": _string(contract.get("schema_version")),
+        "failure_kind": _string(contract.get("failure_kind")) or "unknown",
+        "affected_surface": _string(contract.get("affected_surface")) or "unknown",
+        "ownership_area": _string(contract.get("ownership_area")) or "unknown",
+        "retryability": _string(contract.get("retryability")) or "unknown",
+        "security_relevance": _bool(contract.get("security_relevance")),
+        "recommended_next_human_action": _string(contract.get("recommended_next_human_action")),
+        "reporting_only": _bool(contract.get("reporting_only")),
+        **false_authority,
+        "authority_boundary_preserved": _bool(contract.get("reporting_only"))
+        and not any(false_authority.values()),
+    }
+
+
+def _slug(value: str) -> str:
+    slug = re.sub(r"[^a-zA-Z0-9]+", "-", value.lower()).strip("-")
+    return slug or "unknown"
+
+
+def _read_json(path: Path | None) -> JsonObject:
+    if path is None or not path.exists():
+        return {}
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        msg = f"expected JSON object in {path}"
+        raise ValueError(msg)
+    return payload
+
+
+def _write_jsonl(path: Path, records: Sequence[Mapping[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [json.dumps(record, sort_keys=True) for record in records]
+    path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+
+
+def _diagnoses_by_id(diagnostic_vector: Mapping[str, Any]) -> dict[str, JsonObject]:
+    diagnoses: dict[str, JsonObject] = {}
+    for item in _as_list(diagnostic_vector.get("diagnoses")):
+        diagnosis = _as_dict(item)
+        diagnosis_id = _string(diagnosis.get("diagnosis_id"))
+        if diagnosis_id:
+            diagnoses[diagnosis_id] = diagnosis
+    return diagnoses
+
+
+def _plans(
+    remediation_plan: Mapping[str, Any], diagnoses: Mapping[str, JsonObject]
+) -> list[JsonObject]:
+    plan_rows = [_as_dict(item) for item in _as_list(remediation_plan.get("plans"))]
+    if plan_rows:
+        return [row for row in plan_rows if row]
+
+    generated: list[JsonObject] = []
+    for diagnosis_id, diagnosis in diagnoses.items():
+        review_first = _bool(diagnosis.get("review_first"))
+        safe_candidate = _bool(diagnosis.get("safe_fix_candidate")) and not review_first
+        failure_vector = _as_dict(diagnosis.get("failure_vector"))
+        generated.append(
+            {
+                "diagnosis_id": diagnosis_id,
+                "failure_surface": _string(diagnosis.get("failure_surface")) or "unknown",
+                "classification": _string(failure_vector.get("failure_class")) or "unknown",
+                "safe_to_auto_fix": safe_candidate,
+                "allowed_strategy": _string(diagnosis.get("recommended_next_action"))
+                or "collect_logs_and_classify",
+                "blocked_reason": "" if safe_candidate else "review-first diagnosis",
+                "affected_files": _string_list(diagnosis.get("affected_files")),
+                "commands_to_run": [],
+                "proof_commands": _string_list(diagnosis.get("proof_commands")),
+                "human_review_action": "review diagnosis and run focused proof",
+                "history_context": _string(diagnosis.get("history_context")) or "unknown",
+            }
+        )
+    return generated
+
+
+def _first_command(plan: Mapping[str, Any]) -> str:
+    commands = _string_list(plan.get("commands_to_run"))
+    if commands:
+        return commands[0]
+    proof_commands = _string_list(plan.get("proof_commands"))
+    if proof_commands:
+        return proof_commands[0]
+    return "none"
+
+
+def _response_type(plan: Mapping[str, Any], diagnosis: Mapping[str, Any]) -> str:
+    if _bool(plan.get("safe_to_auto_fix")):
+        return "safe_fix_candidate"
+    surface = _string(plan.get("failure_surface")) or _string(diagnosis.get("failure_surface"))
+    if surface == "unknown":
+        return "unknown_review_required"
+    if surface:
+        return f"{surface}_review_required"
+    return "review_required"
+
+
+def _final_result(plan: Mapping[str, Any], safe_fix_outcome: Mapping[str, Any]) -> str:
+    if safe_fix_outcome:
+        if _bool(safe_fix_outcome.get("remediation_ok")):
+            return "proof_passed"
+        if _bool(safe_fix_outcome.get("attempted")):
+            return "proof_failed"
+    if _bool(plan.get("safe_to_auto_fix")):
+        return "safe_fix_candidate"
+    return "review_required"
+
+
+def _trajectory_id(*, repo: str, commit_sha: str, diagnosis_id: str, action: str) -> str:
+    basis = "|".join((repo or "repo", commit_sha or "head", diagnosis_id, action))
+    return _slug(basis)
+
+
+def _failure_class(value: str) -> str:
+    return _slug(value).replace("-", "_")
+
+
+def _first_failure_line(check: Mapping[str, Any]) -> str:
+    first_failure = _as_dict(check.get("first_failure"))
+    return _string(check.get("first_failure_line") or first_failure.get("line"))
+
+
+def _pr_quality_primary_as_check(action_report: Mapping[str, Any]) -> JsonObject:
+    primary = _as_dict(action_report.get("primary_blocker"))
+    if not primary:
+        return {}
+
+    automation = _as_dict(action_report.get("automation"))
+    diagnosis = {
+        "code": _string(primary.get("code") or "UNKNOWN"),
+        "title": _string(primary.get("title") or "PR Quality review required"),
+        "risk_surface": _string(primary.get("surface") or "unknown"),
+        "diagnosis": _string(primary.get("impact")),
+        "proof_commands": _string_list(action_report.get("proof_commands")),
+        "recommended_fix": _string_list(action_report.get("recommended_actions")),
+    }
+
+    return {
+        "name": _string(primary.get("check") or "pr_quality"),
+        "url": _string(primary.get("url")),
+        "diagnosis": diagnosis,
+        "surface": _string(primary.get("surface") or "unknown"),
+        "code": _string(primary.get("code") or "UNKNOWN"),
+        "title": _string(primary.get("title") or "PR Quality review required"),
+        "safe_to_auto_fix": _bool(primary.get("safe_to_auto_fix"))
+        or _bool(automation.get("allowed")),
+        "review_first": _bool(primary.get("review_first")) or not _bool(automation.get("allowed")),
+        "safe_remediation": _as_dict(primary.get("safe_remediation")),
+        "first_failure": _as_dict(primary.get("first_failure")),
+        "first_failure_line": _string(primary.get("first_failure_line")),
+        "formatter_changed_files": _string_list(primary.get("formatter_changed_files")),
+        "referenced_files": _string_list(primary.get("referenced_files")),
+        "owner_files": _string_list(primary.get("owner_files")),
+    }
+
+
+def _evidence_narrative_as_check(evidence_narrative: Mapping[str, Any]) -> JsonObject:
+    primary = _as_dict(evidence_narrative.get("primary_signal"))
+    graph = _as_dict(evidence_narrative.get("graph"))
+    top_blocker = _as_dict(graph.get("top_blocker"))
+
+    kind = _string(primary.get("kind"))
+    title = _string(primary.get("title") or top_blocker.get("title"))
+    surface = _string(primary.get("surface") or top_blocker.get("surface") or "unknown")
+    action = _string(top_blocker.get("action") or primary.get("action"))
+    top_title = _string(top_blocker.get("title"))
+    top_surface = _string(top_blocker.get("surface"))
+
+    has_narrative_signal = kind in {"review_signal", "integration_proof"}
+    has_top_blocker = bool(top_title) and top_title != "none" and top_surface != "none"
+    if not has_narrative_signal and not has_top_blocker:
+        return {}
+
+    review_required = (
+        _int(graph.get("review_first_count")) > 0
+        or _int(graph.get("critical_count")) > 0
+        or action == "review"
+        or _bool(top_blocker.get("review_first"))
+    )
+    signal_kind = "review" if review_required else "proof"
+    code = "EVIDENCE_REVIEW_SIGNAL" if review_required else "EVIDENCE_PROOF_SIGNAL"
+    action = action or ("review" if review_required else "rerun_proof")
+
+    return {
+        "name": "PR Quality evidence signal",
+        "surface": surface,
+        "code": code,
+        "title": title or "PR Quality evidence signal",
+        "safe_to_auto_fix": False,
+        "review_first": review_required,
+        "evidence_signal": True,
+        "evidence_signal_kind": signal_kind,
+        "operator_action": action,
+        "diagnosis": {
+            "code": code,
+            "title": title or "PR Quality evidence signal",
+            "risk_surface": surface,
+            "diagnosis": title or "PR Quality evidence signal",
+            "proof_commands": _string_list(evidence_narrative.get("next_proof")),
+            "confidence": "high" if review_required else "medium",
+        },
+    }
+
+
+def _pr_quality_checks(
+    *,
+    action_report: Mapping[str, Any],
+    check_intelligence: Mapping[str, Any],
+    evidence_narrative: Mapping[str, Any] | None = None,
+) -> list[JsonObject]:
+    failed_checks = [_as_dict(item) for item in _as_list(check_intelligence.get("failed_checks"))]
+    if failed_checks:
+        return failed_checks
+
+    primary = _pr_quality_primary_as_check(action_report)
+    if primary:
+        return [primary]
+
+    evidence = _evidence_narrative_as_check(_as_dict(evidence_narrative))
+    return [evidence] if evidence else []
+
+
+def _pr_quality_action(
+    *,
+    surface: str,
+    safe_remediation: Mapping[str, Any],
+    auto_fix_allowed: bool,
+) -> str:
+    if auto_fix_allowed:
+        return _string(safe_remediation.get("strategy")) or "run_safe_remediation"
+    return f"review_{_failure_class(surface or 'unknown')}_failure"
+
+
+def build_pr_quality_trajectory_records(
+    *,
+    action_report: Mapping[str, Any],
+    check_intelligence: Mapping[str, Any],
+    evidence_narrative: Mapping[str, Any] | None = None,
+    safe_fix_outcome: Mapping[str, Any] | None = None,
+    failure_bundle: Mapping[str, Any] | None = None,
+    repo: str = "",
+    branch: str = "",
+    commit_sha: str = "",
+    pr_number: int = 0,
+    generated_at: str = DEFAULT_GENERATED_AT,
+) -> list[JsonObject]:
+    outcome = _as_dict(safe_fix_outcome)
+    failure_bundle_safety = _failure_bundle_safety_evidence(failure_bundle)
+    automation = _as_dict(action_report.get("automation"))
+    default_proof_commands = _string_list(action_report.get("proof_commands"))
+    records: list[JsonObject] = []
+
+    for index, check in enumerate(
+        _pr_quality_checks(
+            action_report=action_report,
+            check_intelligence=check_intelligence,
+            evidence_narrative=evidence_narrative,
+        ),
+        start=1,
+    ):
+        diagnosis = _as_dict(check.get("diagnosis"))
+        safe_remediation = _as_dict(check.get("safe_remediation"))
+        code = _string(diagnosis.get("code") or check.get("code") or "UNKNOWN")
+        surface = _string(
+            check.get("surface")
+            or diagnosis.get("risk_surface")
+            or diagnosis.get("surface")
+            or "unknown"
+        )
+        auto_fix_allowed = _bool(check.get("safe_to_auto_fix")) and _bool(
+            safe_remediation.get("safe_to_auto_fix")
+            or automation.get("allowed")
+            or check.get("safe_to_auto_fix")
+        )
+        evidence_signal = _bool(check.get("evidence_signal"))
+        review_first = _bool(check.get("review_first")) or (
+            not auto_fix_allowed and not evidence_signal
+        )
+        proof_commands = _string_list(diagnosis.get("proof_commands")) or default_proof_commands
+        owner_files = (
+            _string_list(check.get("owner_files"))
+            or _string_list(diagnosis.get("owner_files"))
+            or _string_list(check.get("referenced_files"))
+            or _string_list(check.get("formatter_changed_files"))
+        )
+        patch_files = _string_list(check.get("formatter_changed_files")) if auto_fix_allowed else []
+        action = _string(check.get("operator_action")) or _pr_quality_action(
+            surface=surface,
+            safe_remediation=safe_remediation,
+            auto_fix_allowed=auto_fix_allowed,
+        )
+        diagnostic_id = _slug(_string(check.get("name") or f"pr-quality-{index}") + "-" + code)
+
+        records.append(
+            {
+                "schema_version": SCHEMA_VERSION,
+                "trajectory_id": _trajectory_id(
+                    repo=repo,
+                    commit_sha=commit_sha,
+                    diagnosis_id=diagnostic_id,
+                    action=action,
+                ),
+                "repo": repo,
+                "branch": branch,
+                "commit_sha": commit_sha,
+                "pr_number": pr_number,
+                "attempt_number": 1,
+                "generated_at": generated_at,
+                "diagnostic_id": diagnostic_id,
+                "action": action,
+                "command": proof_commands[0] if proof_commands else "none",
+                "environment": {
+                    "runner": "github_actions",
+                    "source": "pr_quality",
+                },
+                "response": {
+                    "response_type": (
+                        "safe_fix_candidate"
+                        if auto_fix_allowed
+                        else (
+                            "evidence_proof_signal"
+                            if evidence_signal and not review_first
+                            else f"{surface or 'unknown'}_review_required"
+                        )
+                    ),
+                    "exit_code": "unknown",
+                    "first_failing_line": _first_failure_line(check),
+                },
+                "diagnosis": {
+                    "failure_class": _failure_class(code),
+                    "risk_surface": surface or "unknown",
+                    "root_cause": _string(
+                        diagnosis.get("diagnosis") or diagnosis.get("title") or check.get("title")
+                    ),
+                    "owner_files": owner_files,
+                    "confidence": _string(diagnosis.get("confidence")) or "medium",
+                },
+                "decision": {
+                    "review_first": review_first,
+                    "auto_fix_allowed": auto_fix_allowed,
+                    "reason": _string(
+                        safe_remediation.get("reason")
+                        or automation.get("reason")
+                        or check.get("title")
+                    ),
+                },
+                "authority_boundary": _authority_boundary(
+                    source="pr_quality",
+                    review_first=review_first,
+                    auto_fix_allowed=auto_fix_allowed,
+                    reason=(
+                        _string(safe_remediation.get("reason"))
+                        or _string(automation.get("reason"))
+                        or _string(check.get("title"))
+                    ),
+                ),
+                "safety_gate": failure_bundle_safety,
+                "fix": {
+                    "allowed_strategy": action,
+                    "patch_files": patch_files,
+                    "blocked_reason": ""
+                    if auto_fix_allowed
+                    else _string(automation.get("reason") or "review-first diagnosis"),
+                },
+                "proof": {
+                    "commands": proof_commands,
+                    "focused_proof": "not_run",
+                    "quality_proof": "not_run",
+                    "verifier_result": "not_run",
+                },
+                "final_result": (
+                    "evidence_review_required"
+                    if evidence_signal and review_first
+                    else (
+                        "proof_signal"
+                        if evidence_signal
+                        else _final_result(
+                            {"safe_to_auto_fix": auto_fix_allowed},
+                            outcome,
+                        )
+                    )
+                ),
+                "learned_pattern": "pr_quality_check_intelligence",
+            }
+        )
+
+    return records
+
+
+def build_trajectory_records(
+    *,
+    diagnostic_vector: Mapping[str, Any],
+    remediation_plan: Mapping[str, Any] | None = None,
+    safe_fix_outcome: Mapping[str, Any] | None = None,
+    repo: str = "",
+    branch: str = "",
+    commit_sha: str = "",
+    pr_number: int = 0,
+    generated_at: str = DEFAULT_GENERATED_AT,
+) -> list[JsonObject]:
+    diagnoses = _diagnoses_by_id(diagnostic_vector)
+    plans = _plans(_as_dict(remediation_plan), diagnoses)
+    outcome = _as_dict(safe_fix_outcome)
+
+    records: list[JsonObject] = []
+    for plan in plans:
+        diagnosis_id = _string(plan.get("diagnosis_id")) or "unknown"
+        diagnosis = diagnoses.get(diagnosis_id, {})
+        failure_vector = _as_dict(diagnosis.get("failure_vector"))
+        failure_vector_contract = _failure_vector_contract_evidence(failure_vector)
+        action = _string(plan.get("allowed_strategy")) or "collect_logs_and_classify"
+        auto_fix_allowed = _bool(plan.get("safe_to_auto_fix"))
+        proof_commands = _string_list(plan.get("proof_commands"))
+        owner_files = _string_list(diagnosis.get("likely_owner_files")) or _string_list(
+            plan.get("affected_files")
+        )
+
+        records.append(
+            {
+                "schema_version": SCHEMA_VERSION,
+                "trajectory_id": _trajectory_id(
+                    repo=repo,
+                    commit_sha=commit_sha,
+                    diagnosis_id=diagnosis_id,
+                    action=action,
+                ),
+                "repo": repo,
+                "branch": branch,
+                "commit_sha": commit_sha,
+                "pr_number": pr_number,
+                "attempt_number": 1,
+                "generated_at": generated_at,
+                "diagnostic_id": diagnosis_id,
+                "action": action,
+                "command": _first_command(plan),
+                "environment": {
+                    "runner": _string(failure_vector.get("environment")) or "unknown",
+                    "source": "trajectory_store",
+                },
+                "response": {
+                    "response_type": _response_type(plan, diagnosis),
+                    "exit_code": failure_vector.get("exit_code", "unknown"),
+                    "first_failing_line": _string(
+                        diagnosis.get("first_failure_line")
+                        or failure_vector.get("first_failing_line")
+                    ),
+                },
+                "diagnosis": {
+                    "failure_class": _string(
+                        failure_vector.get("failure_class") or plan.get("classification")
+                    )
+                    or "unknown",
+                    "risk_surface": _string(
+                        failure_vector.get("risk_surface") or plan.get("failure_surface")
+                    )
+                    or "unknown",
+                    "root_cause": _string(
+                        diagnosis.get("actual_failure") or failure_vector.get("actual_failure")
+                    ),
+                    "owner_files": owner_files,
+                    "confidence": _string(diagnosis.get("confidence")) or "medium",
+                },
+                "decision": {
+                    "review_first": not auto_fix_allowed,
+                    "auto_fix_allowed": auto_fix_allowed,
+                    "reason": _string(plan.get("blocked_reason"))
+                    or "safe mechanical remediation candidate",
+                },
+                "authority_boundary": _authority_boundary(
+                    source="trajectory_store",
+                    review_first=not auto_fix_allowed,
+                    auto_fix_allowed=auto_fix_allowed,
+                    reason=(
+                        _string(plan.get("blocked_reason"))
+                        or "safe mechanical remediation candidate"
+                    ),
+                ),
+                "failure_vector_contract": failure_vector_contract,
+                "fix": {
+                    "allowed_strategy": action,
+                    "patch_files": _string_list(plan.get("affected_files"))
+                    if auto_fix_allowed
+                    else [],
+                    "blocked_reason": _string(plan.get("blocked_reason")),
+                },
+                "proof": {
+                    "commands": proof_commands,
+                    "focused_proof": "not_run",
+                    "quality_proof": "not_run",
+                    "verifier_result": "not_run",
+                },
+                "final_result": _final_result(plan, outcome),
+                "learned_pattern": _string(plan.get("history_context")) or "unknown",
+            }
+        )
+
+    return records
+
+
+def summarize_trajectory_records(records: Sequence[Mapping[str, Any]]) -> JsonObject:
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "record_count": len(records),
+        "review_first_count": sum(
+            1 for record in records if _as_dict(record.get("decision")).get("review_first") is True
+        ),
+        "auto_fix_allowed_count": sum(
+            1
+            for record in records
+            if _as_dict(record.get("decision")).get("auto_fix_allowed") is True
+        ),
+        "failure_vector_contract_count": sum(
+            1 for record in records if _as_dict(record.get("failure_vector_contract"))
+        ),
+        "failure_vector_contract_boundary_preserved_count": sum(
+            1
+            for record in records
+            if _bool(
+                _as_dict(record.get("failure_vector_contract")).get("authority_boundary_preserved")
+            )
+        ),
+        "security_relevant_failure_vector_contract_count": sum(
+            1
+            for record in records
+            if _bool(_as_dict(record.get("failure_vector_contract")).get("security_relevance"))
+        ),
+    }
+
+
+def write_trajectory_records(records: Sequence[Mapping[str, Any]], out: Path) -> JsonObject:
+    _write_jsonl(out, records)
+    summary = summarize_trajectory_records(records)
+    summary["trajectory_jsonl"] = out.as_posix()
+    return summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m sdetkit.trajectory_store")
+    parser.add_argument("--diagnostic-vector", default="")
+    parser.add_argument("--remediation-plan", default="")
+    parser.add_argument("--pr-quality-action-report", default="")
+    parser.add_argument("--check-intelligence", default="")
+    parser.add_argument("--evidence-narrative", default="")
+    parser.add_argument("--safe-fix-outcome", default="")
+    parser.add_argument("--failure-bundle", default="")
+    parser.add_argument("--out", default=DEFAULT_OUT)
+    parser.add_argument("--repo", default="")
+    parser.add_argument("--branch", default="")
+    parser.add_argument("--commit-sha", default="")
+    parser.add_argument("--pr-number", type=int, default=0)
+    parser.add_argument("--generated-at", default=DEFAULT_GENERATED_AT)
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    return parser
+
+
+def _optional_path(value: str) -> Path | None:
+    return Path(value) if value else None
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    try:
+        if args.pr_quality_action_report or args.check_intelligence:
+            records = build_pr_quality_trajectory_records(
+                action_report=_read_json(_optional_path(args.pr_quality_action_report)),
+                check_intelligence=_read_json(_optional_path(args.check_intelligence)),
+                evidence_narrative=_read_json(_optional_path(args.evidence_narrative)),
+                safe_fix_outcome=_read_json(_optional_path(args.safe_fix_outcome)),
+                failure_bundle=_read_json(_optional_path(args.failure_bundle)),
+                repo=args.repo,
+                branch=args.branch,
+                commit_sha=args.commit_sha,
+                pr_number=args.pr_number,
+                generated_at=args.generated_at,
+            )
+        else:
+            if not args.diagnostic_vector:
+                msg = (
+                    "either --diagnostic-vector or "
+                    "--pr-quality-action-report/--check-intelligence is required"
+                )
+                raise ValueError(msg)
+            records = build_trajectory_records(
+                diagnostic_vector=_read_json(Path(args.diagnostic_vector)),
+                remediation_plan=_read_json(_optional_path(args.remediation_plan)),
+                safe_fix_outcome=_read_json(_optional_path(args.safe_fix_outcome)),
+                repo=args.repo,
+                branch=args.branch,
+                commit_sha=args.commit_sha,
+                pr_number=args.pr_number,
+                generated_at=args.generated_at,
+            )
+        summary = write_trajectory_records(records, Path(args.out))
+    except (OSError, ValueError, json.JSONDecodeError) as exc:
+        print(f"error={exc}")
+        return 2
+
+    if args.format == "json":
+        print(json.dumps({"summary": summary}, indent=2, sort_keys=True))
+    else:
+        print(f"trajectory_jsonl: {summary['trajectory_jsonl']}")
+        print(f"record_count: {summary['record_count']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,3 @@
+"""Compatibility alias package for sdetkit."""
+
+__all__: list[str] = []
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import shlex
 import sys
@@ -623,10 +624,32 @@ def write_failed_check_log_artifacts(
     checks_json: Path,
     out_dir: Path,
     write_script: bool = True,
+    download: bool = False,
+    repository: str = "",
+    api_url: str = "",
+    download_concurrency: int = 8,
 ) -> JsonObject:
     out_dir.mkdir(parents=True, exist_ok=True)
     manifest = build_failed_check_log_manifest(checks_json=checks_json, out_dir=out_dir)
 
+    if download:
+        from sdetkit.failed_check_log_download import (
+            DEFAULT_API_URL,
+            collect_failed_check_evidence,
+        )
+
+        report = collect_failed_check_evidence(
+            manifest,
+            repository=repository or os.environ.get("GITHUB_REPOSITORY", ""),
+            token=os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN") or None,
+            api_url=api_url or os.environ.get("GITHUB_API_URL") or DEFAULT_API_URL,
+            concurrency=download_concurrency,
+        )
+        # Rebuild so collected/log_path/workflow metadata reflect what was downloaded;
+        # the script then only covers whatever is still missing.
+        manifest = build_failed_check_log_manifest(checks_json=checks_json, out_dir=out_dir)
+        manifest["native_download"] = report
+
     script_path = out_dir / "download-failed-check-logs.sh"
     if write_script:
         script_path.write_text(render_download_script(manifest), encoding="utf-8")
@@ -653,6 +676,24 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Do not write the GitHub evidence download script.",
     )
+    parser.add_argument(
+        "--download",
+        action="store_true",
+        help=(
+            "Fetch missing workflow metadata, job logs and annotations in-process from the "
+            "GitHub API (token from GITHUB_TOKEN or GH_TOKEN) before writing the manifest."
+        ),
+    )
+    parser.add_argument(
+        "--repository", default="", help="owner/name; defaults to GITHUB_REPOSITORY."
+    )
+    parser.add_argument("--api-url", default="", help="Defaults to GITHUB_API_URL.")
+    parser.add_argument(
+        "--download-concurrency",
+        type=int,
+        default=8,
+        help="Maximum in-flight GitHub API requests for --download (default: 8).",
+    )
     parser.add_argument("--sanitize-annotations-json", type=Path)
     parser.add_argument("--annotation-log-target", type=Path)
     parser.add_argument("--annotation-json-target", type=Path)
@@ -678,6 +719,10 @@ def main(argv: list[str] | None = None) -> int:
         checks_json=args.checks_json,
         out_dir=args.out_dir,
         write_script=not bool(args.no_script),
+        download=bool(args.download),
+        repository=args.repository,
+        api_url=args.api_url,
+        download_concurrency=args.download_concurrency,
     )
     sys.stdout.write(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
     return 0
@@ -255,6 +255,9 @@ Then use stability-aware command discovery:
     review_parser.add_argument("--learn", action="store_true")
     review_parser.add_argument("--db", default=None)
     review_parser.add_argument("--evidence-dir", default=None)
+    review_parser.add_argument(
+        "--adaptive-helpers", choices=["in-process", "subprocess"], default=None
+    )
 
     serve_parser = sub.add_parser(
         "serve",
@@ -4,6 +4,7 @@ import argparse
 import hashlib
 import json
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -12,6 +13,8 @@ from sdetkit._datetime import UTC
 SCHEMA_VERSION = "sdetkit.adaptive.memory.v1"
 INDEX_SCHEMA_VERSION = "sdetkit.index.v1"
 
+_INIT_LOCK = threading.Lock()
+
 
 def _connect(db_path: Path) -> sqlite3.Connection:
     conn = sqlite3.connect(db_path)
@@ -21,7 +24,8 @@ def _connect(db_path: Path) -> sqlite3.Connection:
 
 def init_db(db_path: Path) -> None:
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    with _connect(db_path) as conn:
+    # Helpers may initialise the same database from several threads at once.
+    with _INIT_LOCK, _connect(db_path) as conn:
         conn.executescript(
             """
             CREATE TABLE IF NOT EXISTS schema_meta (
@@ -184,7 +188,7 @@ def ingest_index(db_path: Path, index_path: Path) -> str:
     return run_id
 
 
-def _history_payload(db_path: Path) -> dict[str, object]:
+def history_payload(db_path: Path) -> dict[str, object]:
     with _connect(db_path) as conn:
         run_count = int(conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0])
         latest = conn.execute(
@@ -212,7 +216,7 @@ def _history_payload(db_path: Path) -> dict[str, object]:
 
 
 def explain_path(db_path: Path, path: str) -> dict[str, object]:
-    history = _history_payload(db_path)
+    history = history_payload(db_path)
     with _connect(db_path) as conn:
         hot = conn.execute(
             "SELECT file, type, severity, COUNT(*) AS count FROM hotspots WHERE file LIKE ? GROUP BY file, type, severity ORDER BY count DESC, file ASC LIMIT 5",
@@ -255,7 +259,7 @@ def main(argv: list[str] | None = None) -> int:
         return 0
     if ns.cmd == "history":
         init_db(db_path)
-        payload = _history_payload(db_path)
+        payload = history_payload(db_path)
         if ns.format == "operator-json":
             print(json.dumps(payload, indent=2, sort_keys=True))
         else:
@@ -13,6 +13,11 @@ from urllib.parse import urljoin
 import httpx
 
 from sdetkit._datetime import UTC
+from sdetkit.netclient import (
+    fetch_planned_pages,
+    fetch_planned_pages_async,
+    plan_page_prefetch,
+)
 
 
 def _backoff_delay(attempt: int, base: float, factor: float, jitter: float) -> float:
@@ -517,25 +522,24 @@ def fetch_json_list_paginated(
     backoff_jitter: float = 0.0,
     timeout: float | httpx.Timeout | None = None,
     sleep: Callable[[float], None] | None = None,
+    page_concurrency: int = 1,
 ) -> list:
     if retries < 1:
         raise ValueError("retries must be >= 1")
     if max_pages < 1:
         raise ValueError("max_pages must be >= 1")
+    if page_concurrency < 1:
+        raise ValueError("page_concurrency must be >= 1")
 
     rid = request_id
     if trace_header is not None and rid is None:
         rid = uuid.uuid4().hex
     hdrs = _merge_headers(headers, trace_header, rid)
 
-    out: list = []
-    url = path
-    seen: set[str] = set()
-
-    for _ in range(max_pages):
-        r, page = _fetch_json_list_response(
+    def fetch(page_url: str) -> tuple[httpx.Response, list]:
+        return _fetch_json_list_response(
             client,
-            url,
+            page_url,
             retries,
             headers=hdrs,
             retry_on_429=retry_on_429,
@@ -545,9 +549,32 @@ def fetch_json_list_paginated(
             timeout=timeout,
             sleep=sleep,
         )
+
+    out: list = []
+    url = path
+    seen: set[str] = set()
+    fetched = 0
+
+    while fetched < max_pages:
+        r, page = fetch(url)
+        fetched += 1
         out.extend(page)
 
         nxt = _link_next_url(r)
+        plan = plan_page_prefetch(
+            r,
+            nxt,
+            fetched=fetched,
+            max_pages=max_pages,
+            seen=seen,
+            page_concurrency=page_concurrency,
+        )
+        if plan:
+            pages = list(fetch_planned_pages(fetch, plan, page_concurrency))
+            fetched += len(pages)
+            for _page_response, page in pages:
+                out.extend(page)
+            nxt = _link_next_url(pages[-1][0])
         if not nxt:
             return out
 
@@ -574,37 +601,62 @@ async def fetch_json_list_paginated_async(
     backoff_jitter: float = 0.0,
     timeout: float | httpx.Timeout | None = None,
     sleep: Callable[[float], Awaitable[None]] | None = None,
+    page_concurrency: int = 1,
 ) -> list:
     if retries < 1:
         raise ValueError("retries must be >= 1")
     if max_pages < 1:
         raise ValueError("max_pages must be >= 1")
+    if page_concurrency < 1:
+        raise ValueError("page_concurrency must be >= 1")
 
     rid = request_id
     if trace_header is not None and rid is None:
         rid = uuid.uuid4().hex
     hdrs = _merge_headers(headers, trace_header, rid)
 
+    gate = asyncio.Semaphore(page_concurrency)
+
+    async def fetch(page_url: str) -> tuple[httpx.Response, list]:
+        async with gate:
+            return await _fetch_json_list_response_async(
+                client,
+                page_url,
+                retries,
+                headers=hdrs,
+                retry_on_429=retry_on_429,
+                backoff_base=backoff_base,
+                backoff_factor=backoff_factor,
+                backoff_jitter=backoff_jitter,
+                timeout=timeout,
+                sleep=sleep,
+            )
+
     out: list = []
     url = path
     seen: set[str] = set()
+    fetched = 0
 
-    for _ in range(max_pages):
-        r, page = await _fetch_json_list_response_async(
-            client,
-            url,
-            retries,
-            headers=hdrs,
-            retry_on_429=retry_on_429,
-            backoff_base=backoff_base,
-            backoff_factor=backoff_factor,
-            backoff_jitter=backoff_jitter,
-            timeout=timeout,
-            sleep=sleep,
-        )
+    while fetched < max_pages:
+        r, page = await fetch(url)
+        fetched += 1
         out.extend(page)
 
         nxt = _link_next_url(r)
+        plan = plan_page_prefetch(
+            r,
+            nxt,
+            fetched=fetched,
+            max_pages=max_pages,
+            seen=seen,
+            page_concurrency=page_concurrency,
+        )
+        if plan:
+            pages = await fetch_planned_pages_async(fetch, plan)
+            fetched += len(pages)
+            for _page_response, page in pages:
+                out.extend(page)
+            nxt = _link_next_url(pages[-1][0])
         if not nxt:
             return out
 
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import argparse
 import base64
+import codecs
+import contextlib
+import hashlib
 import json
 import os
 import shlex
 import sys
+import tempfile
 import traceback
-from collections.abc import Sequence
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
@@ -127,6 +131,53 @@ def _die(msg: str) -> None:
     raise SystemExit(2)
 
 
+class _DigestSink:
+    """Binary writer that keeps a running SHA-256 and byte count of what passes through."""
+
+    def __init__(self, write: Callable[[bytes], object]) -> None:
+        self._write = write
+        self._digest = hashlib.sha256()
+        self.bytes_written = 0
+
+    def write(self, chunk: bytes) -> int:
+        self._write(chunk)
+        self._digest.update(chunk)
+        self.bytes_written += len(chunk)
+        return len(chunk)
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+@contextlib.contextmanager
+def _stream_sink(out_path: str | None, *, force: bool) -> Iterator[_DigestSink]:
+    """Stream to stdout, or to a sibling temp file that replaces *out_path* on success."""
+    if not out_path:
+        sys.stdout.flush()
+        buf = getattr(sys.stdout, "buffer", None)
+        if buf is not None:
+            yield _DigestSink(buf.write)
+            buf.flush()
+            return
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        yield _DigestSink(lambda chunk: sys.stdout.write(decoder.decode(chunk)))
+        sys.stdout.write(decoder.decode(b"", final=True))
+        return
+
+    pp = safe_path(Path.cwd(), str(out_path), allow_absolute=True)
+    if pp.exists() and not force:
+        _die("refusing to overwrite existing output file (use --force)")
+    pp.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=pp.name + ".", dir=str(pp.parent))
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            yield _DigestSink(fh.write)
+        os.replace(tmp_name, pp)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
 def _add_apiget_args(p: argparse.ArgumentParser) -> None:
     p.add_argument("url", help="Request URL.")
     p.add_argument(
@@ -160,10 +211,53 @@ def _add_apiget_args(p: argparse.ArgumentParser) -> None:
         help="Envelope mode only: key containing next URL or null (default: next).",
     )
     p.add_argument("--max-pages", type=int, default=100, help="Pagination page limit (>= 1).")
+    p.add_argument(
+        "--paginate-concurrency",
+        type=int,
+        default=1,
+        help=(
+            "Link mode only: when the first page advertises rel=last with a numeric page "
+            "parameter, fetch the remaining pages with up to N requests in flight (default: 1)."
+        ),
+    )
     p.add_argument(
         "--retries", type=int, default=1, help="Retry attempts for transient errors (>= 1)."
     )
     p.add_argument("--retry-429", action="store_true", help="Retry HTTP 429 responses.")
+    p.add_argument(
+        "--http-cache",
+        metavar="DIR",
+        default=None,
+        help=(
+            "Keep ETag/Last-Modified validated GET responses in DIR and revalidate them with "
+            "conditional requests on later runs."
+        ),
+    )
+    p.add_argument(
+        "--rate-limit",
+        metavar="RPS",
+        type=float,
+        default=None,
+        help=(
+            "Pace requests to at most RPS per second; X-RateLimit-Remaining/Reset headers "
+            "tighten the pace further."
+        ),
+    )
+    p.add_argument(
+        "--rate-limit-state",
+        metavar="FILE",
+        default=None,
+        help="Share the --rate-limit budget with other processes through FILE.",
+    )
+    p.add_argument(
+        "--metrics-out",
+        metavar="FILE",
+        default=None,
+        help=(
+            "Write per-host/route latency percentiles, retries and bytes to FILE "
+            "(Prometheus text for .prom/.txt, JSON otherwise)."
+        ),
+    )
     p.add_argument("--timeout", type=float, default=None, help="Request timeout in seconds.")
     p.add_argument(
         "--allow-scheme",
@@ -246,6 +340,15 @@ def _add_apiget_args(p: argparse.ArgumentParser) -> None:
         "--query", action="append", default=None, help="Add query param KEY=VALUE (repeatable)."
     )
     p.add_argument("--out", default=None, help="Write JSON output to a file instead of stdout.")
+    p.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Write the raw response body to --out/stdout in chunks without JSON decoding; "
+            "with --paginate, write list items as NDJSON one page at a time. "
+            "Reports sha256 and byte count on stderr."
+        ),
+    )
     p.add_argument(
         "--force", action="store_true", help="Allow overwriting an existing output file."
     )
@@ -462,6 +565,12 @@ def main(argv: Sequence[str] | None = None) -> int:
         _die("retries must be >= 1")
     if ns.max_pages < 1:
         _die("max_pages must be >= 1")
+    if ns.paginate_concurrency < 1:
+        _die("paginate-concurrency must be >= 1")
+    if ns.rate_limit is not None and ns.rate_limit <= 0:
+        _die("rate-limit must be > 0")
+    if ns.stream and (ns.print_status or ns.dump_headers):
+        _die("print-status and dump-headers are not supported with --stream")
     if ns.paginate and ns.expect == "dict":
         _die("paginate requires --expect list (or any)")
     if ns.paginate and ns.paginate_mode == "envelope":
@@ -478,9 +587,49 @@ def main(argv: Sequence[str] | None = None) -> int:
         backoff_jitter=0.0,
     )
 
+    response_cache = None
+    if ns.http_cache:
+        from .response_cache import DiskResponseCache
+
+        try:
+            cache_dir = safe_path(
+                Path.cwd(), ns.http_cache, allow_absolute=bool(ns.allow_absolute_path)
+            )
+        except SecurityError as e:
+            _die(str(e))
+        response_cache = DiskResponseCache(cache_dir)
+
+    rate_limiter = None
+    if ns.rate_limit is not None or ns.rate_limit_state:
+        from .rate_limit import RateLimiter
+
+        state_path = None
+        if ns.rate_limit_state:
+            try:
+                state_path = safe_path(
+                    Path.cwd(), ns.rate_limit_state, allow_absolute=bool(ns.allow_absolute_path)
+                )
+            except SecurityError as e:
+                _die(str(e))
+        rate_limiter = RateLimiter(ns.rate_limit, state_path=state_path)
+
+    metrics = None
+    metrics_path = None
+    if ns.metrics_out:
+        from .netclient_metrics import NetclientMetrics
+
+        try:
+            metrics_path = safe_path(
+                Path.cwd(), ns.metrics_out, allow_absolute=bool(ns.allow_absolute_path)
+            )
+        except SecurityError as e:
+            _die(str(e))
+        metrics = NetclientMetrics()
+
     try:
         cassette_path = os.getenv("SDETKIT_CASSETTE")
         cassette_mode = os.getenv("SDETKIT_CASSETTE_MODE", "auto")
+        cassette_match = os.getenv("SDETKIT_CASSETTE_MATCH", "sequential")
         transport = None
         if cassette_path:
             from .cassette import open_transport
@@ -491,6 +640,7 @@ def main(argv: Sequence[str] | None = None) -> int:
                 cassette_mode,
                 upstream=upstream_transport,
                 allow_absolute=bool(ns.allow_absolute_path),
+                match=cassette_match,
             )
         _client_kwargs: dict[str, object] = {
             "timeout": default_http_timeout(ns.timeout),
@@ -540,7 +690,13 @@ def main(argv: Sequence[str] | None = None) -> int:
 
                 raw.request = _wrapped_request
             c = SdetHttpClient(
-                raw, retry=pol, trace_header=ns.trace_header, allowed_schemes=allowed_schemes
+                raw,
+                retry=pol,
+                trace_header=ns.trace_header,
+                allowed_schemes=allowed_schemes,
+                cache=response_cache,
+                rate_limiter=rate_limiter,
+                hook=metrics,
             )
 
             def _print_status_and_headers(resp: httpx.Response) -> None:
@@ -558,6 +714,55 @@ def main(argv: Sequence[str] | None = None) -> int:
                 if resp.status_code < 200 or resp.status_code >= 300:
                     raise RuntimeError("non-2xx response")
 
+            if ns.stream:
+                try:
+                    with _stream_sink(getattr(ns, "out", None), force=bool(ns.force)) as sink:
+                        if not ns.paginate:
+                            c.download(
+                                ns.url,
+                                sink,
+                                method=_req_method,
+                                headers=_req_headers or None,
+                                request_id=ns.request_id,
+                                content=_req_content,
+                                json=_req_json,
+                                timeout=ns.timeout,
+                            )
+                        else:
+                            if ns.paginate_mode == "envelope":
+                                pages = c.iter_json_list_pages_envelope(
+                                    ns.url,
+                                    items_key=ns.paginate_items_key,
+                                    next_key=ns.paginate_next_key,
+                                    max_pages=ns.max_pages,
+                                    headers=_req_headers or None,
+                                    request_id=ns.request_id,
+                                    timeout=ns.timeout,
+                                )
+                            else:
+                                pages = c.iter_json_list_pages(
+                                    ns.url,
+                                    max_pages=ns.max_pages,
+                                    headers=_req_headers or None,
+                                    request_id=ns.request_id,
+                                    timeout=ns.timeout,
+                                    page_concurrency=ns.paginate_concurrency,
+                                )
+                            for page in pages:
+                                sink.write(
+                                    b"".join(
+                                        json.dumps(item, sort_keys=True).encode("utf-8") + b"\n"
+                                        for item in page
+                                    )
+                                )
+                except HttpStatusError as e:
+                    if getattr(ns, "fail_with_body", False):
+                        sys.stdout.write(e.body.decode("utf-8", errors="replace"))
+                    sys.stderr.write(f"http error: {e.status_code}\n")
+                    return 1
+                sys.stderr.write(f"sha256: {sink.hexdigest()}\nbytes: {sink.bytes_written}\n")
+                return 0
+
             data: object
 
             if ns.paginate:
@@ -619,6 +824,7 @@ def main(argv: Sequence[str] | None = None) -> int:
                             headers=_req_headers or None,
                             request_id=ns.request_id,
                             timeout=ns.timeout,
+                            page_concurrency=ns.paginate_concurrency,
                         )
 
             else:
@@ -827,6 +1033,13 @@ def main(argv: Sequence[str] | None = None) -> int:
             traceback.print_exc()
         sys.stderr.write(str(e).rstrip() + "\n")
         return 1
+    finally:
+        if response_cache is not None:
+            response_cache.close()
+        if rate_limiter is not None:
+            rate_limiter.close()
+        if metrics is not None and metrics_path is not None:
+            metrics.write(metrics_path)
 
 
 if __name__ == "__main__":
@@ -5,8 +5,8 @@ import json
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
-from .adaptive_memory import _history_payload as adaptive_history_payload
 from .adaptive_memory import explain_path, ingest_index, init_db
+from .adaptive_memory import history_payload as adaptive_history_payload
 from .index import build_index
 from .risk_hygiene import classify_risks
 
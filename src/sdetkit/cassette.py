@@ -1,15 +1,30 @@
 from __future__ import annotations
 
 import base64
+import gzip
+import hashlib
+import io
 import json
-from dataclasses import dataclass
+import os
+import re
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import httpx
 
+from .atomicio import atomic_write_bytes
 from .security import safe_path
 
+LINES_FORMAT = "sdetkit.cassette.jsonl"
+LINES_SUFFIXES = (".jsonl", ".jsonl.gz", ".jsonl.zst")
+DEFAULT_BLOB_THRESHOLD = 64 * 1024
+_BLOB_REF = re.compile(r"^sha256:([0-9a-f]{64})$")
+
 
 def _b64e(b: bytes) -> str:
     if not b:
@@ -38,31 +53,283 @@ def _headers_from_list(items: list[list[str]]) -> list[tuple[str, str]]:
     return out
 
 
+def is_lines_cassette(path: str | Path) -> bool:
+    """Return True when *path* names a line-delimited (optionally compressed) cassette."""
+    return Path(path).name.lower().endswith(LINES_SUFFIXES)
+
+
+def _blob_dir(path: Path) -> Path:
+    return path.with_name(path.name + ".blobs")
+
+
+def _open_lines(path: Path, mode: str) -> IO[str]:
+    name = path.name.lower()
+    if name.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if name.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ValueError("zstd cassettes require the optional 'zstandard' package") from exc
+        raw = open(path, mode + "b")
+        stream: Any
+        if mode == "r":
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+        else:
+            stream = zstandard.ZstdCompressor().stream_writer(raw)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def iter_interactions(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream interactions from a line-delimited cassette one line at a time.
+
+    A trailing partial line or unterminated compressed stream, left by a recorder
+    that is still running or stopped mid-write, is ignored.
+    """
+    with _open_lines(path, "r") as fh:
+        header = json.loads(fh.readline() or "null")
+        if not isinstance(header, dict) or header.get("format") != LINES_FORMAT:
+            raise ValueError("invalid cassette: missing line-delimited header")
+        while True:
+            try:
+                line = fh.readline()
+            except EOFError:
+                return
+            if not line.endswith("\n"):
+                return
+            if not line.strip():
+                continue
+            it = json.loads(line)
+            if isinstance(it, dict):
+                yield it
+
+
+class CassetteWriter:
+    """Append-only writer for line-delimited cassettes.
+
+    Response bodies of at least *blob_threshold* bytes are moved into
+    content-addressed side files under ``<path>.blobs/`` and referenced by
+    ``body_ref``; identical bodies share one file.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        blob_threshold: int = DEFAULT_BLOB_THRESHOLD,
+        blob_dir: Path | None = None,
+    ) -> None:
+        self.path = path
+        self.blob_dir = blob_dir if blob_dir is not None else _blob_dir(path)
+        self.blobs_written = 0
+        self._threshold = blob_threshold
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = _open_lines(path, "w")
+        self._fh.write(json.dumps({"format": LINES_FORMAT, "version": 2}, sort_keys=True) + "\n")
+        self._fh.flush()
+
+    def _externalize(self, interaction: dict[str, Any]) -> dict[str, Any]:
+        rresp = interaction.get("response")
+        if not isinstance(rresp, dict):
+            return interaction
+        body = rresp.get("body_b64")
+        # base64 is 4/3 the payload size, so shorter text can never reach the threshold.
+        if not isinstance(body, str) or len(body) * 3 < self._threshold * 4:
+            return interaction
+        raw = _b64d(body)
+        if len(raw) < self._threshold:
+            return interaction
+        digest = hashlib.sha256(raw).hexdigest()
+        blob = self.blob_dir / digest
+        if not blob.exists():
+            self.blob_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(blob, raw)
+            self.blobs_written += 1
+        stored = {k: v for k, v in rresp.items() if k != "body_b64"}
+        stored["body_ref"] = f"sha256:{digest}"
+        return {**interaction, "response": stored}
+
+    def write(self, interaction: dict[str, Any]) -> dict[str, Any]:
+        """Append one interaction; safe to call from several recording threads."""
+        with self._lock:
+            stored = self._externalize(interaction)
+            self._fh.write(json.dumps(stored, ensure_ascii=True, sort_keys=True) + "\n")
+            self._fh.flush()
+        return stored
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.close()
+
+
+REPLAY_MATCH_MODES = ("sequential", "indexed")
+
+
 @dataclass(frozen=True)
 class _Key:
     method: str
     url: str
     body_b64: str
+    headers: tuple[tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class CassetteMatcher:
+    """Controls which parts of a request must agree with the recorded one.
+
+    The default compares method, full URL and body, and ignores headers.
+    """
+
+    ignore_query: bool = False
+    ignore_query_params: frozenset[str] = field(default_factory=frozenset)
+    match_headers: bool = False
+    ignore_headers: frozenset[str] = field(default_factory=frozenset)
+
+    def url(self, url: str) -> str:
+        if not self.ignore_query and not self.ignore_query_params:
+            return url
+        parts = urlsplit(url)
+        query = ""
+        if not self.ignore_query:
+            query = urlencode(
+                [
+                    (k, v)
+                    for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                    if k not in self.ignore_query_params
+                ]
+            )
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, query, parts.fragment))
+
+    def headers(self, items: Iterable[tuple[str, str]]) -> tuple[tuple[str, str], ...]:
+        if not self.match_headers:
+            return ()
+        ignored = {name.lower() for name in self.ignore_headers}
+        return tuple(sorted((k.lower(), v) for k, v in items if k.lower() not in ignored))
+
+    def key_for_request(self, req: httpx.Request) -> _Key:
+        body = req.content if isinstance(req.content, bytes | bytearray) else b""
+        return _Key(
+            req.method.upper(),
+            self.url(str(req.url)),
+            _b64e(bytes(body)),
+            self.headers(req.headers.multi_items()),
+        )
+
+    def key_for_recorded(self, rreq: dict[str, Any]) -> _Key:
+        method = rreq.get("method")
+        url = rreq.get("url")
+        body_b64 = rreq.get("body_b64", "")
+        hdrs = rreq.get("headers")
+        return _Key(
+            str(method).upper() if isinstance(method, str) else "",
+            self.url(str(url)) if isinstance(url, str) else "",
+            str(body_b64) if isinstance(body_b64, str) else "",
+            self.headers(_headers_from_list(hdrs) if isinstance(hdrs, list) else []),
+        )
 
 
 class Cassette:
-    def __init__(self, interactions: list[dict[str, Any]] | None = None) -> None:
-        self.interactions: list[dict[str, Any]] = interactions or []
+    """Recorded interactions, held in memory or streamed from a line-delimited file.
+
+    A cassette loaded from a line-delimited *source* only reads it into
+    ``interactions`` when that list is asked for; replay streams it instead.
+    """
+
+    def __init__(
+        self,
+        interactions: list[dict[str, Any]] | None = None,
+        *,
+        blob_dir: Path | None = None,
+        source: Path | None = None,
+    ) -> None:
+        self._interactions: list[dict[str, Any]] | None = (
+            interactions or [] if source is None else interactions
+        )
+        self.blob_dir = blob_dir
+        self.source = source
+
+    @property
+    def interactions(self) -> list[dict[str, Any]]:
+        if self._interactions is None:
+            assert self.source is not None
+            self._interactions = list(iter_interactions(self.source))
+        return self._interactions
+
+    @interactions.setter
+    def interactions(self, value: list[dict[str, Any]]) -> None:
+        self._interactions = value
+
+    def iter_recorded(self) -> Iterator[dict[str, Any]]:
+        """Yield interactions in recorded order without materializing a streamed source."""
+        if self._interactions is None and self.source is not None:
+            return iter_interactions(self.source)
+        return iter(self.interactions)
+
+    def response_body(self, rresp: dict[str, Any]) -> bytes:
+        ref = rresp.get("body_ref")
+        if ref is None:
+            body = rresp.get("body_b64", "")
+            return _b64d(body) if isinstance(body, str) else b""
+        m = _BLOB_REF.match(ref) if isinstance(ref, str) else None
+        if m is None or self.blob_dir is None:
+            raise RuntimeError("cassette mismatch: invalid body reference")
+        try:
+            return (self.blob_dir / m.group(1)).read_bytes()
+        except OSError as exc:
+            raise RuntimeError(f"cassette mismatch: missing body blob {ref}") from exc
+
+    def _inline(self, it: dict[str, Any]) -> dict[str, Any]:
+        rresp = it.get("response")
+        if not isinstance(rresp, dict) or "body_ref" not in rresp:
+            return it
+        stored = {k: v for k, v in rresp.items() if k != "body_ref"}
+        stored["body_b64"] = _b64e(self.response_body(rresp))
+        return {**it, "response": stored}
 
     def to_json(self) -> dict[str, Any]:
-        return {"version": 1, "interactions": self.interactions}
+        return {"version": 1, "interactions": [self._inline(it) for it in self.interactions]}
+
+    def save(self, path: str | Path, *, allow_absolute: bool = False) -> int:
+        """Write the cassette to *path* and return the number of interactions written.
 
-    def save(self, path: str | Path, *, allow_absolute: bool = False) -> None:
+        Line-delimited targets are streamed into a temporary file next to *path*
+        and moved into place at the end, so saving a cassette onto the file it
+        streams from does not truncate it first.
+        """
         p = safe_path(Path.cwd(), str(path), allow_absolute=allow_absolute)
+        if is_lines_cassette(p):
+            # Keep the name's suffix so the temporary file uses the same compression.
+            tmp = p.with_name(f".tmp-{os.getpid()}-{p.name}")
+            writer = CassetteWriter(tmp, blob_dir=_blob_dir(p))
+            count = 0
+            try:
+                for it in self.iter_recorded():
+                    writer.write(self._inline(it))
+                    count += 1
+            except BaseException:
+                writer.close()
+                tmp.unlink(missing_ok=True)
+                raise
+            writer.close()
+            os.replace(tmp, p)
+            return count
         p.parent.mkdir(parents=True, exist_ok=True)
+        payload = self.to_json()
         p.write_text(
-            json.dumps(self.to_json(), ensure_ascii=True, sort_keys=True, indent=2) + "\n",
+            json.dumps(payload, ensure_ascii=True, sort_keys=True, indent=2) + "\n",
             encoding="utf-8",
         )
+        return len(payload["interactions"])
 
     @classmethod
     def load(cls, path: str | Path, *, allow_absolute: bool = False) -> Cassette:
         p = safe_path(Path.cwd(), str(path), allow_absolute=allow_absolute)
+        if is_lines_cassette(p):
+            # Read the header now so a malformed file fails at load, not mid-replay.
+            next(iter_interactions(p), None)
+            return cls(blob_dir=_blob_dir(p), source=p)
         data = json.loads(p.read_text(encoding="utf-8"))
         if not isinstance(data, dict):
             raise ValueError("invalid cassette: expected object")
@@ -76,69 +343,140 @@ class Cassette:
         return cls(out)
 
     def _key_for_request(self, req: httpx.Request) -> _Key:
-        body = req.content if isinstance(req.content, bytes | bytearray) else b""
-        return _Key(req.method.upper(), str(req.url), _b64e(bytes(body)))
-
-    def append(self, req: httpx.Request, resp: httpx.Response, body: bytes) -> None:
-        self.interactions.append(
-            {
-                "request": {
-                    "method": req.method.upper(),
-                    "url": str(req.url),
-                    "headers": _headers_to_list(req.headers),
-                    "body_b64": _b64e(
-                        req.content if isinstance(req.content, bytes | bytearray) else b""
-                    ),
-                },
-                "response": {
-                    "status_code": int(resp.status_code),
-                    "headers": _headers_to_list(resp.headers),
-                    "body_b64": _b64e(body),
-                },
-            }
-        )
+        return CassetteMatcher().key_for_request(req)
+
+    @staticmethod
+    def _interaction(req: httpx.Request, resp: httpx.Response, body: bytes) -> dict[str, Any]:
+        return {
+            "request": {
+                "method": req.method.upper(),
+                "url": str(req.url),
+                "headers": _headers_to_list(req.headers),
+                "body_b64": _b64e(
+                    req.content if isinstance(req.content, bytes | bytearray) else b""
+                ),
+            },
+            "response": {
+                "status_code": int(resp.status_code),
+                "headers": _headers_to_list(resp.headers),
+                "body_b64": _b64e(body),
+            },
+        }
+
+    def append(self, req: httpx.Request, resp: httpx.Response, body: bytes) -> dict[str, Any]:
+        self.interactions.append(self._interaction(req, resp, body))
+        return self.interactions[-1]
+
+
+_IndexKey = tuple[str, str, str, tuple[tuple[str, str], ...]]
+
+
+def _digest(key: _Key) -> _IndexKey:
+    body = hashlib.sha256(key.body_b64.encode("ascii", "replace")).hexdigest()
+    return (key.method, key.url, body, key.headers)
+
+
+class _ReplayCursor:
+    """Hands out recorded interactions for live requests.
+
+    ``sequential`` replays strictly in recorded order. ``indexed`` matches the
+    request on method, URL and body digest with a FIFO queue per key, so
+    concurrent or reordered requests still find their recording. Interactions
+    are pulled from the cassette stream only as far as a request needs: indexed
+    replay holds just the read-ahead window of recordings not yet served.
+    Response bodies are only decoded when an interaction is served.
+    """
 
-
-class CassetteReplayTransport(httpx.BaseTransport):
-    def __init__(self, cassette: Cassette) -> None:
+    def __init__(
+        self,
+        cassette: Cassette,
+        *,
+        match: str = "sequential",
+        matcher: CassetteMatcher | None = None,
+    ) -> None:
+        if match not in REPLAY_MATCH_MODES:
+            raise ValueError("cassette match must be one of: sequential, indexed")
         self._cassette = cassette
-        self._i = 0
+        self._match = match
+        self._matcher = matcher if matcher is not None else CassetteMatcher()
+        self._lock = threading.Lock()
+        self._stream: Iterator[dict[str, Any]] | None = None
+        self._ahead: deque[dict[str, Any]] = deque()
+        self._index: dict[_IndexKey, deque[dict[str, Any]]] = {}
+        self._waiting = 0
+        self._played = 0
+
+    def _pull(self) -> dict[str, Any] | None:
+        if self._stream is None:
+            self._stream = self._cassette.iter_recorded()
+        return next(self._stream, None)
+
+    def _index_next(self) -> bool:
+        it = self._pull()
+        if it is None:
+            return False
+        rreq = it.get("request")
+        if not isinstance(rreq, dict) or not isinstance(it.get("response"), dict):
+            raise RuntimeError("cassette mismatch: invalid interaction shape")
+        key = _digest(self._matcher.key_for_recorded(rreq))
+        self._index.setdefault(key, deque()).append(it["response"])
+        self._waiting += 1
+        return True
 
     def assert_exhausted(self) -> None:
-        if self._i != len(self._cassette.interactions):
-            raise AssertionError(
-                f"cassette not exhausted: played={self._i} total={len(self._cassette.interactions)}"
-            )
-
-    def close(self) -> None:
-        self.assert_exhausted()
-
-    def handle_request(self, request: httpx.Request) -> httpx.Response:
-        if self._i >= len(self._cassette.interactions):
+        with self._lock:
+            if self._match == "indexed":
+                while self._index_next():
+                    pass
+                unplayed = self._waiting
+            else:
+                while (it := self._pull()) is not None:
+                    self._ahead.append(it)
+                unplayed = len(self._ahead)
+        if unplayed:
+            total = self._played + unplayed
+            raise AssertionError(f"cassette not exhausted: played={self._played} total={total}")
+
+    def _next_sequential(self, request: httpx.Request) -> dict[str, Any]:
+        it = self._ahead.popleft() if self._ahead else self._pull()
+        if it is None:
             raise RuntimeError("cassette mismatch: no more recorded interactions")
-
-        it = self._cassette.interactions[self._i]
-        self._i += 1
+        self._played += 1
 
         rreq = it.get("request")
         rresp = it.get("response")
         if not isinstance(rreq, dict) or not isinstance(rresp, dict):
             raise RuntimeError("cassette mismatch: invalid interaction shape")
 
-        method = rreq.get("method")
-        url = rreq.get("url")
-        body_b64 = rreq.get("body_b64", "")
-        key_expected = _Key(
-            str(method).upper() if isinstance(method, str) else "",
-            str(url) if isinstance(url, str) else "",
-            str(body_b64) if isinstance(body_b64, str) else "",
-        )
-        key_got = self._cassette._key_for_request(request)
-
+        key_expected = self._matcher.key_for_recorded(rreq)
+        key_got = self._matcher.key_for_request(request)
         if key_expected != key_got:
             raise RuntimeError(
-                f"cassette mismatch: expected {key_expected.method} {key_expected.url} got {key_got.method} {key_got.url}"
+                f"cassette mismatch: expected {key_expected.method} {key_expected.url} "
+                f"got {key_got.method} {key_got.url}"
             )
+        return rresp
+
+    def _next_indexed(self, request: httpx.Request) -> dict[str, Any]:
+        key = self._matcher.key_for_request(request)
+        digest = _digest(key)
+        while not self._index.get(digest):
+            if not self._index_next():
+                if not self._waiting:
+                    raise RuntimeError("cassette mismatch: no more recorded interactions")
+                raise RuntimeError(
+                    f"cassette mismatch: no recorded interaction for {key.method} {key.url}"
+                )
+        self._waiting -= 1
+        self._played += 1
+        return self._index[digest].popleft()
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            if self._match == "indexed":
+                rresp = self._next_indexed(request)
+            else:
+                rresp = self._next_sequential(request)
 
         status = rresp.get("status_code")
         hdrs = rresp.get("headers")
@@ -149,11 +487,75 @@ class CassetteReplayTransport(httpx.BaseTransport):
         return httpx.Response(
             status_code=status,
             headers=_headers_from_list(hdrs),
-            content=_b64d(body),
+            content=self._cassette.response_body(rresp),
             request=request,
         )
 
 
+class CassetteReplayTransport(httpx.BaseTransport):
+    def __init__(
+        self,
+        cassette: Cassette,
+        *,
+        match: str = "sequential",
+        matcher: CassetteMatcher | None = None,
+    ) -> None:
+        self._cassette = cassette
+        self._cursor = _ReplayCursor(cassette, match=match, matcher=matcher)
+
+    def assert_exhausted(self) -> None:
+        self._cursor.assert_exhausted()
+
+    def close(self) -> None:
+        self.assert_exhausted()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._cursor.respond(request)
+
+
+class _RecordSink:
+    """Collects recorded interactions and persists them when recording ends.
+
+    Line-delimited cassette paths are written append-only as each interaction
+    arrives and are not kept in memory: the cassette is switched to stream from
+    the file it is being recorded to. JSON cassette paths are written once on
+    close.
+    """
+
+    def __init__(self, cassette: Cassette, path: str | None, allow_absolute: bool) -> None:
+        self._cassette = cassette
+        self._path = path
+        self._allow_absolute = allow_absolute
+        self._writer: CassetteWriter | None = None
+        self._lock = threading.Lock()
+
+    def record(self, req: httpx.Request, resp: httpx.Response, body: bytes) -> None:
+        with self._lock:
+            if self._path is None or not is_lines_cassette(self._path):
+                self._cassette.append(req, resp, body)
+                return
+            if self._writer is None:
+                p = safe_path(Path.cwd(), self._path, allow_absolute=self._allow_absolute)
+                # Interactions the cassette already held go first, as a JSON save would.
+                prior = [self._cassette._inline(it) for it in self._cassette.iter_recorded()]
+                writer = CassetteWriter(p)
+                for it in prior:
+                    writer.write(it)
+                self._writer = writer
+                self._cassette.blob_dir = writer.blob_dir
+                self._cassette.source = p
+                self._cassette._interactions = None
+            self._writer.write(Cassette._interaction(req, resp, body))
+
+    def finish(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            elif self._path is not None and self._cassette.interactions:
+                self._cassette.save(self._path, allow_absolute=self._allow_absolute)
+
+
 class CassetteRecordTransport(httpx.BaseTransport):
     def __init__(
         self,
@@ -165,76 +567,40 @@ class CassetteRecordTransport(httpx.BaseTransport):
     ) -> None:
         self._cassette = cassette
         self._inner = inner
-        self._path = str(path) if path is not None else None
-        self._allow_absolute = allow_absolute
+        self._sink = _RecordSink(cassette, str(path) if path is not None else None, allow_absolute)
 
     def handle_request(self, request: httpx.Request) -> httpx.Response:
         resp = self._inner.handle_request(request)
         body = resp.read()
-        self._cassette.append(request, resp, body)
+        self._sink.record(request, resp, body)
         return resp
 
     def close(self) -> None:
         try:
-            if self._path is not None and self._cassette.interactions:
-                self._cassette.save(self._path, allow_absolute=self._allow_absolute)
+            self._sink.finish()
         finally:
             self._inner.close()
 
 
 class AsyncCassetteReplayTransport(httpx.AsyncBaseTransport):
-    def __init__(self, cassette: Cassette) -> None:
+    def __init__(
+        self,
+        cassette: Cassette,
+        *,
+        match: str = "sequential",
+        matcher: CassetteMatcher | None = None,
+    ) -> None:
         self._cassette = cassette
-        self._i = 0
+        self._cursor = _ReplayCursor(cassette, match=match, matcher=matcher)
 
     def assert_exhausted(self) -> None:
-        if self._i != len(self._cassette.interactions):
-            raise AssertionError(
-                f"cassette not exhausted: played={self._i} total={len(self._cassette.interactions)}"
-            )
+        self._cursor.assert_exhausted()
 
     async def aclose(self) -> None:
         self.assert_exhausted()
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
-        if self._i >= len(self._cassette.interactions):
-            raise RuntimeError("cassette mismatch: no more recorded interactions")
-
-        it = self._cassette.interactions[self._i]
-        self._i += 1
-
-        rreq = it.get("request")
-        rresp = it.get("response")
-        if not isinstance(rreq, dict) or not isinstance(rresp, dict):
-            raise RuntimeError("cassette mismatch: invalid interaction shape")
-
-        method = rreq.get("method")
-        url = rreq.get("url")
-        body_b64 = rreq.get("body_b64", "")
-        key_expected = _Key(
-            str(method).upper() if isinstance(method, str) else "",
-            str(url) if isinstance(url, str) else "",
-            str(body_b64) if isinstance(body_b64, str) else "",
-        )
-        key_got = self._cassette._key_for_request(request)
-
-        if key_expected != key_got:
-            raise RuntimeError(
-                f"cassette mismatch: expected {key_expected.method} {key_expected.url} got {key_got.method} {key_got.url}"
-            )
-
-        status = rresp.get("status_code")
-        hdrs = rresp.get("headers")
-        body = rresp.get("body_b64", "")
-        if not isinstance(status, int) or not isinstance(hdrs, list) or not isinstance(body, str):
-            raise RuntimeError("cassette mismatch: invalid response shape")
-
-        return httpx.Response(
-            status_code=status,
-            headers=_headers_from_list(hdrs),
-            content=_b64d(body),
-            request=request,
-        )
+        return self._cursor.respond(request)
 
 
 class AsyncCassetteRecordTransport(httpx.AsyncBaseTransport):
@@ -248,19 +614,17 @@ class AsyncCassetteRecordTransport(httpx.AsyncBaseTransport):
     ) -> None:
         self._cassette = cassette
         self._inner = inner
-        self._path = str(path) if path is not None else None
-        self._allow_absolute = allow_absolute
+        self._sink = _RecordSink(cassette, str(path) if path is not None else None, allow_absolute)
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
         resp = await self._inner.handle_async_request(request)
         body = await resp.aread()
-        self._cassette.append(request, resp, body)
+        self._sink.record(request, resp, body)
         return resp
 
     async def aclose(self) -> None:
         try:
-            if self._path is not None and self._cassette.interactions:
-                self._cassette.save(self._path, allow_absolute=self._allow_absolute)
+            self._sink.finish()
         finally:
             await self._inner.aclose()
 
@@ -271,6 +635,8 @@ def open_transport(
     *,
     upstream: httpx.BaseTransport | None = None,
     allow_absolute: bool = False,
+    match: str = "sequential",
+    matcher: CassetteMatcher | None = None,
 ) -> httpx.BaseTransport:
     p = safe_path(Path.cwd(), str(path), allow_absolute=allow_absolute)
     m = mode.lower().strip()
@@ -284,7 +650,7 @@ def open_transport(
         if not p.exists():
             raise RuntimeError("cassette not found")
         cassette = Cassette.load(p, allow_absolute=True)
-        return CassetteReplayTransport(cassette)
+        return CassetteReplayTransport(cassette, match=match, matcher=matcher)
 
     cassette = Cassette([])
     inner = upstream if upstream is not None else httpx.HTTPTransport()
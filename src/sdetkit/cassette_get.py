@@ -12,13 +12,24 @@ from .security import SecurityError, default_http_timeout, ensure_allowed_scheme
 def cassette_get(argv: list[str]) -> int:
     import httpx
 
-    from .cassette import Cassette, CassetteRecordTransport, CassetteReplayTransport
+    from .cassette import (
+        Cassette,
+        CassetteRecordTransport,
+        CassetteReplayTransport,
+        is_lines_cassette,
+    )
 
     ap = argparse.ArgumentParser(prog="sdetkit cassette-get")
-    ap.add_argument("url")
+    ap.add_argument("url", nargs="?")
     g = ap.add_mutually_exclusive_group()
     g.add_argument("--record", metavar="PATH")
     g.add_argument("--replay", metavar="PATH")
+    g.add_argument(
+        "--convert",
+        nargs=2,
+        metavar=("SRC", "DST"),
+        help="rewrite a cassette; .jsonl, .jsonl.gz and .jsonl.zst select the line format",
+    )
     ap.add_argument("--timeout", type=float, default=None)
     ap.add_argument("--allow-scheme", action="append", default=None)
     ap.add_argument("--follow-redirects", action="store_true")
@@ -29,6 +40,30 @@ def cassette_get(argv: list[str]) -> int:
     ap.add_argument("--allow-absolute-path", action="store_true")
     ns = ap.parse_args(argv)
 
+    if ns.convert:
+        allow_absolute = bool(ns.allow_absolute_path)
+        try:
+            src = safe_path(Path.cwd(), ns.convert[0], allow_absolute=allow_absolute)
+            dst = safe_path(Path.cwd(), ns.convert[1], allow_absolute=allow_absolute)
+            if dst.exists() and not ns.force:
+                sys.stderr.write("refusing to overwrite existing cassette (use --force)\n")
+                return 2
+            cass = Cassette.load(src, allow_absolute=True)
+            written = cass.save(dst, allow_absolute=True)
+        except (SecurityError, ValueError, OSError, RuntimeError) as exc:
+            sys.stderr.write(str(exc) + "\n")
+            return 2
+        summary = {
+            "interactions": written,
+            "format": "jsonl" if is_lines_cassette(dst) else "json",
+            "path": str(dst),
+        }
+        sys.stdout.write(json.dumps(summary, ensure_ascii=True, sort_keys=True) + "\n")
+        return 0
+
+    if not ns.url:
+        ap.error("the following arguments are required: url")
+
     allowed = {"http", "https"}
     for s in ns.allow_scheme or []:
         allowed.add(str(s).strip().lower())
@@ -93,6 +128,9 @@ def cassette_get(argv: list[str]) -> int:
             response = client.get(ns.url)
             response.raise_for_status()
             sys.stdout.write(json.dumps(response.json(), ensure_ascii=True))
+        if is_lines_cassette(record_path):
+            cass.save(record_path, allow_absolute=True)
+            return 0
         payload = json.dumps(cass.to_json(), ensure_ascii=True, sort_keys=True, indent=2) + "\n"
         atomic_write_text(record_path, payload)
         return 0
@@ -17,6 +17,14 @@ FIX_PLAN_SCHEMA_VERSION = "sdetkit.artifacts.fix-plan.v1"
 RISK_SUMMARY_SCHEMA_VERSION = "sdetkit.artifacts.risk-summary.v1"
 EVIDENCE_SCHEMA_VERSION = "sdetkit.artifacts.evidence.v1"
 
+_SCHEDULER_STAT_KEYS = (
+    "scheduler",
+    "wall_seconds",
+    "busy_seconds",
+    "parallelism",
+    "idle_worker_seconds",
+    "peak_concurrency",
+)
 _SEVERITY_ORDER = {"critical": 4, "high": 3, "medium": 2, "low": 1}
 _OWNER_HINTS = {
     "format": "developer-experience",
@@ -243,6 +251,7 @@ def build_verdict_payload(
             "used_cache_hits": coerce_bool(
                 check_summary["cache_status"].get("hit", 0), default=False
             ),
+            "counters": dict(metadata.get("cache_counters") or {}),
         },
         "execution": {
             "mode": execution.get("mode", "sequential")
@@ -251,6 +260,11 @@ def build_verdict_payload(
             "workers": execution.get("workers", 1) if isinstance(execution, dict) else 1,
             "checks_recorded": int(metadata.get("checks_recorded", len(record_items))),
             "source": str(metadata.get("source", "")),
+            **(
+                {key: execution[key] for key in _SCHEDULER_STAT_KEYS if key in execution}
+                if isinstance(execution, dict)
+                else {}
+            ),
         },
         "changed_files": changed_files,
         "changed_areas": changed_areas,
@@ -29,6 +29,7 @@ CheckTruthLevel = Literal["smoke", "standard", "merge", "adaptive"]
 CheckProfileName = Literal["quick", "standard", "strict", "adaptive"]
 CheckStatus = Literal["passed", "failed", "skipped"]
 CheckTargetMode = Literal["full", "smoke", "targeted"]
+CheckResourceClass = Literal["light", "heavy"]
 
 
 class CheckRecordLike(Protocol):
@@ -100,6 +101,7 @@ class CheckDefinition:
     run: CheckRunner | None = None
     notes: str = ""
     cacheable: bool = True
+    resource_class: CheckResourceClass = "light"
 
 
 @dataclass(frozen=True)
@@ -319,7 +319,7 @@ BUILTIN_CHECKS: tuple[CheckDefinition, ...] = (
             category="tests",
             cost="moderate",
             truth_level="smoke",
-            parallel_safe=False,
+            resource_class="heavy",
             required_tools=("pytest",),
             command=("python", "-m", "sdetkit", "gate", "fast"),
             evidence_outputs=(".sdetkit/gate.fast.snapshot.json",),
@@ -338,7 +338,7 @@ BUILTIN_CHECKS: tuple[CheckDefinition, ...] = (
             cost="expensive",
             truth_level="merge",
             dependencies=("format_check", "lint", "typing"),
-            parallel_safe=False,
+            resource_class="heavy",
             required_tools=("pytest",),
             command=("python", "-m", "pytest", "-q", "-o", "addopts="),
             notes="This is the full truth path for merge and release verification.",
@@ -3,9 +3,15 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import sqlite3
+import threading
+import time
 from dataclasses import asdict
 from pathlib import Path
+from typing import Any
 
+from ..atomicio import atomic_write_text
+from ..sqlite_lru import SqliteLruTable
 from .results import CheckRecord
 
 _IGNORED_PARTS = {
@@ -19,34 +25,164 @@ _IGNORED_PARTS = {
     "__pycache__",
 }
 
+_FILE_HASH_INDEX_NAME = "file-hashes.json"
+_FILE_HASH_INDEX_SCHEMA = 1
+# Files modified this recently are re-hashed on every run: a same-size rewrite
+# inside one mtime tick would otherwise be indistinguishable from the cached stat.
+_RACY_WINDOW_NS = 2_000_000_000
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+CACHE_BACKENDS = ("files", "sqlite")
+_SQLITE_FILE_NAME = "checks.sqlite3"
+
 
 class CheckCache:
-    def __init__(self, base_dir: Path, *, enabled: bool = True) -> None:
+    """Result cache for check records.
+
+    The default ``files`` backend keeps one JSON document per key. The ``sqlite``
+    backend packs every entry into a single indexed database and evicts by age and
+    least-recent use once ``max_age_seconds`` / ``max_bytes`` / ``max_entries`` are
+    exceeded.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        *,
+        enabled: bool = True,
+        backend: str = "files",
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+        max_age_seconds: float | None = None,
+    ) -> None:
+        if backend not in CACHE_BACKENDS:
+            raise ValueError(f"unknown check cache backend: {backend!r}")
         self._base_dir = base_dir
         self.enabled = enabled
+        self.backend = backend
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
         self._fingerprint_cache: dict[tuple[str, ...], str] = {}
+        self._lock = threading.Lock()
+        self._table = SqliteLruTable(
+            base_dir / _SQLITE_FILE_NAME,
+            "entries",
+            (("payload", "TEXT NOT NULL"),),
+            max_bytes=max_bytes,
+            max_entries=max_entries,
+            max_age_seconds=max_age_seconds,
+        )
+        self._file_hashes: dict[str, dict[str, Any]] | None = None
+        self._file_hashes_dirty = False
+        self._stats: dict[str, int] = {"files_hashed": 0, "files_reused": 0}
+        self._counters: dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
 
     @property
     def base_dir(self) -> Path:
         return self._base_dir
 
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def counters(self) -> dict[str, int | str]:
+        with self._lock:
+            return {"backend": self.backend, **self._counters}
+
+    def close(self) -> None:
+        with self._lock:
+            self._table.close()
+
     def compute_repo_fingerprint(self, repo_root: Path, changed_paths: tuple[str, ...]) -> str:
         scope = tuple(changed_paths) if changed_paths else ("__repo__",)
-        cached = self._fingerprint_cache.get(scope)
-        if cached is not None:
-            return cached
+        with self._lock:
+            cached = self._fingerprint_cache.get(scope)
+            if cached is not None:
+                return cached
 
-        digest = hashlib.sha256()
-        paths = list(self._iter_paths(repo_root, changed_paths))
-        for path in paths:
-            rel = path.relative_to(repo_root).as_posix()
-            digest.update(rel.encode("utf-8"))
-            digest.update(b"\\0")
-            digest.update(path.read_bytes())
-            digest.update(b"\\0")
-        fingerprint = digest.hexdigest()
-        self._fingerprint_cache[scope] = fingerprint
-        return fingerprint
+            index = self._load_file_hashes()
+            visited: set[str] = set()
+            now_ns = time.time_ns()
+            digest = hashlib.sha256()
+            paths = list(self._iter_paths(repo_root, changed_paths))
+            for path in paths:
+                rel = path.relative_to(repo_root).as_posix()
+                digest.update(rel.encode("utf-8"))
+                digest.update(b"\\0")
+                digest.update(self._file_digest(path, index, visited, now_ns).encode("ascii"))
+                digest.update(b"\\0")
+            if not changed_paths:
+                prefix = os.path.abspath(repo_root) + os.sep
+                for stale in [k for k in index if k.startswith(prefix) and k not in visited]:
+                    del index[stale]
+                    self._file_hashes_dirty = True
+            self._save_file_hashes()
+            fingerprint = digest.hexdigest()
+            self._fingerprint_cache[scope] = fingerprint
+            return fingerprint
+
+    def _file_digest(
+        self, path: Path, index: dict[str, dict[str, Any]], visited: set[str], now_ns: int
+    ) -> str:
+        key = os.path.abspath(path)
+        visited.add(key)
+        st = path.stat()
+        stat_sig = [int(st.st_mtime_ns), int(st.st_size), int(st.st_ino)]
+        entry = index.get(key)
+        if entry is not None and entry.get("stat") == stat_sig:
+            self._stats["files_reused"] += 1
+            return str(entry["sha256"])
+
+        h = hashlib.sha256()
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
+                h.update(chunk)
+        self._stats["files_hashed"] += 1
+        content_hash = h.hexdigest()
+        if now_ns - stat_sig[0] >= _RACY_WINDOW_NS:
+            index[key] = {"stat": stat_sig, "sha256": content_hash}
+            self._file_hashes_dirty = True
+        elif key in index:
+            del index[key]
+            self._file_hashes_dirty = True
+        return content_hash
+
+    def _load_file_hashes(self) -> dict[str, dict[str, Any]]:
+        if self._file_hashes is not None:
+            return self._file_hashes
+        entries: dict[str, dict[str, Any]] = {}
+        if self.enabled:
+            try:
+                raw = json.loads(
+                    (self._base_dir / _FILE_HASH_INDEX_NAME).read_text(encoding="utf-8")
+                )
+            except (OSError, ValueError):
+                raw = None
+            if isinstance(raw, dict) and raw.get("schema_version") == _FILE_HASH_INDEX_SCHEMA:
+                for key, entry in dict(raw.get("files", {})).items():
+                    if (
+                        isinstance(entry, dict)
+                        and isinstance(entry.get("sha256"), str)
+                        and isinstance(entry.get("stat"), list)
+                    ):
+                        entries[str(key)] = {"stat": entry["stat"], "sha256": entry["sha256"]}
+        self._file_hashes = entries
+        return entries
+
+    def _save_file_hashes(self) -> None:
+        if not self.enabled or not self._file_hashes_dirty or self._file_hashes is None:
+            return
+        payload = {"schema_version": _FILE_HASH_INDEX_SCHEMA, "files": self._file_hashes}
+        try:
+            self._base_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(
+                self._base_dir / _FILE_HASH_INDEX_NAME,
+                json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n",
+            )
+        except OSError:
+            return
+        self._file_hashes_dirty = False
 
     def key_for(
         self,
@@ -75,10 +211,16 @@ class CheckCache:
     def load(self, key: str) -> CheckRecord | None:
         if not self.enabled:
             return None
-        path = self._entry_path(key)
-        if not path.exists():
+        if self.backend == "sqlite":
+            raw = self._sqlite_load(key)
+        else:
+            path = self._entry_path(key)
+            raw = path.read_text(encoding="utf-8") if path.exists() else None
+        with self._lock:
+            self._counters["hits" if raw is not None else "misses"] += 1
+        if raw is None:
             return None
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = json.loads(raw)
         metadata = dict(payload.get("metadata", {}))
         metadata["cache"] = {"status": "hit", "key": key}
         payload["metadata"] = metadata
@@ -89,16 +231,34 @@ class CheckCache:
     def save(self, key: str, record: CheckRecord) -> None:
         if not self.enabled:
             return
-        path = self._entry_path(key)
-        path.parent.mkdir(parents=True, exist_ok=True)
         payload = asdict(record)
         payload["advisory"] = list(record.advisory)
         payload["evidence_paths"] = list(record.evidence_paths)
-        path.write_text(json.dumps(payload, sort_keys=True, indent=2) + "\n", encoding="utf-8")
+        if self.backend == "sqlite":
+            self._sqlite_save(key, json.dumps(payload, sort_keys=True, separators=(",", ":")))
+        else:
+            path = self._entry_path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(payload, sort_keys=True, indent=2) + "\n", encoding="utf-8")
+        with self._lock:
+            self._counters["writes"] += 1
 
     def _entry_path(self, key: str) -> Path:
         return self._base_dir / f"{key}.json"
 
+    def _connection(self) -> sqlite3.Connection:
+        return self._table.connection()
+
+    def _sqlite_load(self, key: str) -> str | None:
+        with self._lock:
+            row = self._table.get(key)
+        return None if row is None else str(row[0])
+
+    def _sqlite_save(self, key: str, payload: str) -> None:
+        size = len(payload.encode("utf-8"))
+        with self._lock:
+            self._counters["evictions"] += self._table.put(key, {"payload": payload}, size)
+
     def _is_ignored_path(self, repo_root: Path, path: Path) -> bool:
         try:
             parts = set(path.relative_to(repo_root).parts)
@@ -15,6 +15,7 @@ from .artifacts import (
     render_report_artifacts,
 )
 from .base import CheckStatus, PlannerHint
+from .cache import CACHE_BACKENDS
 from .planner import CheckPlanner
 from .registry import default_registry
 from .results import CheckRecord
@@ -57,6 +58,9 @@ def _build_parser() -> argparse.ArgumentParser:
         if name == "run":
             command.add_argument("--no-cache", action="store_true")
             command.add_argument("--max-workers", type=int, default=None)
+            command.add_argument("--cache-backend", choices=list(CACHE_BACKENDS), default="files")
+            command.add_argument("--cache-max-bytes", type=int, default=None)
+            command.add_argument("--cache-max-age-days", type=float, default=None)
     return parser
 
 
@@ -246,6 +250,11 @@ def main(argv: list[str] | None = None) -> int:
         python_executable=sys.executable,
         use_cache=not ns.no_cache,
         max_workers=ns.max_workers,
+        cache_backend=ns.cache_backend,
+        cache_max_bytes=ns.cache_max_bytes,
+        cache_max_age_seconds=(
+            ns.cache_max_age_days * 86400 if ns.cache_max_age_days is not None else None
+        ),
     )
     verdict_payload = report.as_dict()
     assert output_paths is not None
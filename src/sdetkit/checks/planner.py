@@ -6,7 +6,15 @@ import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
-from .base import CheckDefinition, CheckProfileName, CheckTargetMode, PlannerHint, RegistrySnapshot
+from .base import (
+    CheckCost,
+    CheckDefinition,
+    CheckProfileName,
+    CheckResourceClass,
+    CheckTargetMode,
+    PlannerHint,
+    RegistrySnapshot,
+)
 
 
 @dataclass(frozen=True)
@@ -23,6 +31,8 @@ class PlannedCheck:
     targeting_reason: str = ""
     changed_evidence: tuple[str, ...] = ()
     selected_targets: tuple[str, ...] = ()
+    resource_class: CheckResourceClass = "light"
+    cost: CheckCost = "cheap"
 
 
 @dataclass(frozen=True)
@@ -196,6 +206,8 @@ class CheckPlanner:
                     targeting_reason=target_reason,
                     changed_evidence=changed_files,
                     selected_targets=selected_targets,
+                    resource_class=check.resource_class,
+                    cost=check.cost,
                 )
             )
             if target_reason:
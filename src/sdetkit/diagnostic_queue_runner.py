@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import contextlib
 import copy
-from collections.abc import Mapping
+from collections import deque
+from collections.abc import Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
@@ -10,7 +13,8 @@ from sdetkit.job_queue import (
     COMPLETED,
     FAILED,
     PENDING,
-    load_queue,
+    JobNotPendingError,
+    JournaledJobQueue,
 )
 from sdetkit.queued_diagnostic_worker import run_queued_diagnostic_job
 
@@ -76,6 +80,65 @@ def _decision_boundary() -> JsonObject:
     }
 
 
+_WORKER_QUEUE: JournaledJobQueue | None = None
+
+
+def _init_worker_queue(queue_path: Path) -> None:
+    """Give each pool process one queue view that it syncs from the journal offset."""
+    global _WORKER_QUEUE
+    _WORKER_QUEUE = JournaledJobQueue(queue_path)
+
+
+def _run_isolated_job(kwargs: Mapping[str, Any]) -> JsonObject:
+    """Run one queued job and fold any exception into a picklable outcome."""
+    if "queue" not in kwargs and _WORKER_QUEUE is not None:
+        kwargs = {**kwargs, "queue": _WORKER_QUEUE}
+    try:
+        result = run_queued_diagnostic_job(**kwargs)
+    except JobNotPendingError:
+        # Another runner claimed the job after our view of the queue was taken.
+        return {"ok": False, "skipped": True}
+    except Exception as exc:
+        return {
+            "ok": False,
+            "exception_type": type(exc).__name__,
+            "message": _string(exc) or type(exc).__name__,
+        }
+    return {"ok": True, "result": result}
+
+
+@contextlib.contextmanager
+def _job_pool(workers: int, queue_path: Path) -> Iterator[ProcessPoolExecutor | None]:
+    if workers == 1:
+        yield None
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker_queue,
+        initargs=(queue_path,),
+    ) as pool:
+        yield pool
+
+
+def _submit(pool: ProcessPoolExecutor | None, kwargs: Mapping[str, Any]) -> Future[JsonObject]:
+    if pool is not None:
+        return pool.submit(_run_isolated_job, dict(kwargs))
+    future: Future[JsonObject] = Future()
+    future.set_result(_run_isolated_job(kwargs))
+    return future
+
+
+def _outcome(future: Future[JsonObject]) -> JsonObject:
+    try:
+        return future.result()
+    except Exception as exc:
+        return {
+            "ok": False,
+            "exception_type": type(exc).__name__,
+            "message": _string(exc) or type(exc).__name__,
+        }
+
+
 def run_bounded_diagnostic_queue(
     queue_path: Path,
     *,
@@ -84,69 +147,126 @@ def run_bounded_diagnostic_queue(
     finished_at: str,
     out_root: Path,
     input_root: Path = Path("."),
+    workers: int = 1,
 ) -> JsonObject:
     if isinstance(max_jobs, bool) or not isinstance(max_jobs, int) or max_jobs < 1:
         raise ValueError("bounded diagnostic queue runner requires a positive integer max_jobs")
 
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        raise ValueError("bounded diagnostic queue runner requires a positive integer workers")
+
     if not _string(claimed_at):
         raise ValueError("bounded diagnostic queue runner requires claimed_at")
 
     if not _string(finished_at):
         raise ValueError("bounded diagnostic queue runner requires finished_at")
 
-    successful_results: list[JsonObject] = []
-    failure: JsonObject = {}
+    # Jobs are dispatched by explicit id from one in-memory view of the queue; the
+    # queue file is only re-read when that view runs out of pending jobs or a job
+    # in it turns out to have been claimed by another runner already. Workers
+    # append their transitions to the queue journal through one long-lived queue
+    # view per process, which is compacted back into the snapshot once the run ends.
+    queue = JournaledJobQueue(queue_path)
+    pending: deque[str] = deque(_pending_job_ids(queue.snapshot()))
+    dispatched: set[str] = set()
+    outcomes: dict[int, tuple[str, JsonObject]] = {}
+    in_flight: dict[Future[JsonObject], tuple[int, str]] = {}
     jobs_attempted = 0
-    stop_reason = "max_jobs_reached"
-
-    for _ in range(max_jobs):
-        queue_before = load_queue(queue_path)
-        pending_before = _pending_job_ids(queue_before)
-
-        if not pending_before:
-            stop_reason = "no_pending_jobs"
-            break
-
-        jobs_attempted += 1
-
-        try:
-            result = run_queued_diagnostic_job(
-                queue_path,
-                claimed_at=claimed_at,
-                finished_at=finished_at,
-                out_root=out_root,
-                input_root=input_root,
+    dispatch_index = 0
+    drained = False
+    failed = False
+
+    def next_job_id() -> str:
+        nonlocal pending
+        while True:
+            while pending:
+                job_id = pending.popleft()
+                if job_id not in dispatched:
+                    return job_id
+            if in_flight:
+                return ""
+            pending = deque(
+                job_id for job_id in _pending_job_ids(queue.snapshot()) if job_id not in dispatched
             )
-        except Exception as exc:
-            queue_after = load_queue(queue_path)
-
-            failed_job_ids = [
-                job_id for job_id in pending_before if _record_state(queue_after, job_id) == FAILED
-            ]
-
-            failure = {
-                "job_id": (failed_job_ids[0] if len(failed_job_ids) == 1 else ""),
-                "exception_type": type(exc).__name__,
-                "message": _string(exc) or type(exc).__name__,
+            if not pending:
+                return ""
+
+    with _job_pool(workers, queue_path) as pool:
+        while True:
+            while not failed and len(in_flight) < workers and jobs_attempted < max_jobs:
+                job_id = next_job_id()
+                if not job_id:
+                    drained = not in_flight
+                    break
+                dispatched.add(job_id)
+                kwargs: JsonObject = {
+                    "queue_path": queue_path,
+                    "claimed_at": claimed_at,
+                    "finished_at": finished_at,
+                    "out_root": out_root,
+                    "input_root": input_root,
+                    "job_id": job_id,
+                    "journaled": True,
+                }
+                if pool is None:
+                    # In-process jobs share the runner's view; pool processes each
+                    # keep their own, created by the pool initializer.
+                    kwargs["queue"] = queue
+                future = _submit(pool, kwargs)
+                in_flight[future] = (dispatch_index, job_id)
+                dispatch_index += 1
+                jobs_attempted += 1
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, job_id = in_flight.pop(future)
+                outcome = _outcome(future)
+                if outcome.get("skipped"):
+                    jobs_attempted -= 1
+                    pending.clear()
+                    continue
+                outcomes[index] = (job_id, outcome)
+                failed = failed or not outcome["ok"]
+
+    final_queue = queue.compact()
+    successful_results: list[JsonObject] = []
+    failures: list[JsonObject] = []
+
+    for index in sorted(outcomes):
+        job_id, outcome = outcomes[index]
+        if outcome["ok"]:
+            successful_results.append(copy.deepcopy(_as_dict(outcome.get("result"))))
+            continue
+        failures.append(
+            {
+                "job_id": job_id if _record_state(final_queue, job_id) == FAILED else "",
+                "exception_type": outcome["exception_type"],
+                "message": outcome["message"],
             }
-            stop_reason = "job_failed"
-            break
-
-        successful_results.append(copy.deepcopy(result))
+        )
 
-    final_queue = load_queue(queue_path)
-    jobs_failed = 1 if failure else 0
+    if failures:
+        stop_reason = "job_failed"
+    elif drained and jobs_attempted < max_jobs:
+        stop_reason = "no_pending_jobs"
+    else:
+        stop_reason = "max_jobs_reached"
 
     return {
         "schema_version": SCHEMA_VERSION,
-        "status": "failed" if failure else "completed",
+        "status": "failed" if failures else "completed",
         "stop_reason": stop_reason,
         "max_jobs": max_jobs,
+        "workers": workers,
         "jobs_attempted": jobs_attempted,
         "jobs_completed": len(successful_results),
-        "jobs_failed": jobs_failed,
+        "jobs_failed": len(failures),
         "successful_results": successful_results,
-        "failure": failure,
+        "failure": copy.deepcopy(failures[0]) if failures else {},
+        "failures": failures,
         "queue_state_counts": _state_counts(final_queue),
         "decision_boundary": _decision_boundary(),
         "execution": {
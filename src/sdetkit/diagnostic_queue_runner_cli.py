@@ -15,18 +15,22 @@ SCHEMA_VERSION = "sdetkit.diagnostic_queue_runner_cli.v1"
 JsonObject = dict[str, Any]
 
 
-def _positive_integer(value: str) -> int:
+def _positive_integer(value: str, *, name: str = "max-jobs") -> int:
     try:
         parsed = int(value)
     except ValueError as exc:
-        raise argparse.ArgumentTypeError("max-jobs must be a positive integer") from exc
+        raise argparse.ArgumentTypeError(f"{name} must be a positive integer") from exc
 
     if parsed < 1:
-        raise argparse.ArgumentTypeError("max-jobs must be a positive integer")
+        raise argparse.ArgumentTypeError(f"{name} must be a positive integer")
 
     return parsed
 
 
+def _worker_count(value: str) -> int:
+    return _positive_integer(value, name="workers")
+
+
 def parse_args(
     argv: Sequence[str] | None = None,
 ) -> argparse.Namespace:
@@ -57,6 +61,12 @@ def parse_args(
         type=_positive_integer,
         help="Maximum number of pending jobs to attempt.",
     )
+    parser.add_argument(
+        "--workers",
+        type=_worker_count,
+        default=1,
+        help="Number of queued jobs to run concurrently in worker processes (default: 1).",
+    )
     parser.add_argument(
         "--claimed-at",
         required=True,
@@ -117,6 +127,7 @@ def main(
             finished_at=args.finished_at,
             out_root=Path(args.out_root),
             input_root=Path(args.input_root),
+            workers=args.workers,
         )
     except Exception as exc:
         print(
@@ -38,6 +38,10 @@ def main(argv: list[str] | None = None) -> int:
         checks_json=args.checks_json,
         out_dir=args.out_dir,
         write_script=not bool(args.no_script),
+        download=bool(args.download),
+        repository=args.repository,
+        api_url=args.api_url,
+        download_concurrency=args.download_concurrency,
     )
     sys.stdout.write(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
     return 0
@@ -0,0 +1,353 @@
+"""In-process GitHub evidence collector for failed-check log manifests.
+
+Performs the downloads of the generated ``download-failed-check-logs.sh`` script
+(workflow run and job metadata, job logs, check run annotations) over one pooled
+async HTTP client with bounded concurrency, instead of one ``gh`` process per
+call. Targets that already hold content are skipped, exactly like the script.
+
+Job logs follow ``gh run view --log-failed``: each run's log archive is downloaded
+once and only the steps whose conclusion is a failure are written, every line
+prefixed with the job and step name. When none of those steps has a log in the
+archive, all step logs of the job are written instead, like the script's ``--log``
+fallback.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tempfile
+import zipfile
+from collections.abc import Awaitable, Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from sdetkit._failed_check_log_collection_core import sanitize_check_run_annotations
+from sdetkit.netclient import (
+    RetryPolicy,
+    SdetAsyncHttpClient,
+    backoff_delay,
+    httpx,
+    retry_after_seconds,
+)
+
+SCHEMA_VERSION = "sdetkit.pr_quality.failed_check_log_download.v1"
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RETRIES = 3
+_CHUNK_SIZE = 64 * 1024
+_FAILED_CONCLUSIONS = frozenset({"failure", "timed_out", "cancelled", "action_required"})
+
+JsonObject = dict[str, Any]
+
+
+def _as_dict(value: Any) -> JsonObject:
+    return value if isinstance(value, dict) else {}
+
+
+def _as_list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else []
+
+
+def _string(value: Any) -> str:
+    return str(value).strip() if value is not None else ""
+
+
+def _has_content(path: Path) -> bool:
+    return path.exists() and path.stat().st_size > 0
+
+
+def _tmp_path(target: Path) -> Path:
+    return target.with_name(target.name + ".tmp")
+
+
+def _write_json_atomically(target: Path, payload: Any) -> None:
+    tmp = _tmp_path(target)
+    tmp.parent.mkdir(parents=True, exist_ok=True)
+    tmp.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, target)
+
+
+def _step_members(zf: zipfile.ZipFile) -> dict[tuple[str, int], str]:
+    """Map ``(job directory, step number)`` to the ``<job>/<number>_<step>.txt`` member."""
+    members: dict[tuple[str, int], str] = {}
+    for name in zf.namelist():
+        job_dir, sep, file_name = name.rpartition("/")
+        number, _, _ = file_name.partition("_")
+        if sep and number.isdigit() and file_name.endswith(".txt"):
+            members[(job_dir, int(number))] = name
+    return members
+
+
+def _job_steps(
+    members: dict[tuple[str, int], str], jobs: list[JsonObject], *, failed_only: bool
+) -> list[tuple[str, str, str]]:
+    selected: list[tuple[str, str, str]] = []
+    for job in jobs:
+        job_name = _string(job.get("name"))
+        # The archive drops "/" from job directory names, as gh does when matching.
+        job_dir = job_name.replace("/", "")
+        for step in (_as_dict(value) for value in _as_list(job.get("steps"))):
+            if failed_only and _string(step.get("conclusion")) not in _FAILED_CONCLUSIONS:
+                continue
+            number = step.get("number")
+            member = members.get((job_dir, number)) if isinstance(number, int) else None
+            if member is not None:
+                selected.append((job_name, _string(step.get("name")), member))
+    return selected
+
+
+def _archive_to_text(archive: Path, target: Path, jobs: list[JsonObject]) -> None:
+    """Write the failed-step logs of *jobs* from a run log archive into *target*."""
+    with zipfile.ZipFile(archive) as zf:
+        members = _step_members(zf)
+        if jobs:
+            selected = _job_steps(members, jobs, failed_only=True) or _job_steps(
+                members, jobs, failed_only=False
+            )
+        else:
+            selected = [
+                (job_dir, name.rpartition("/")[2].partition("_")[2].removesuffix(".txt"), name)
+                for (job_dir, _number), name in sorted(members.items())
+            ]
+        with target.open("wb") as out:
+            for job_name, step_name, member in selected:
+                prefix = f"{job_name}\t{step_name}\t".encode()
+                with zf.open(member) as fh:
+                    for line in fh:
+                        out.write(prefix + (line if line.endswith(b"\n") else line + b"\n"))
+
+
+class _Collector:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        repository: str,
+        api_url: str,
+        concurrency: int,
+        retries: int,
+        sleep: Callable[[float], Awaitable[None]],
+        scratch: Path,
+    ) -> None:
+        self._client = client
+        self._api = SdetAsyncHttpClient(
+            client,
+            retry=RetryPolicy(retries=retries, retry_on_429=True, backoff_base=0.5),
+            sleep=sleep,
+        )
+        self._base = f"{api_url.rstrip('/')}/repos/{repository}"
+        self._gate = asyncio.Semaphore(concurrency)
+        self._retries = retries
+        self._sleep = sleep
+        self._scratch = scratch
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._documents: dict[str, JsonObject] = {}
+        self._archives: dict[str, Path] = {}
+        self.requests = 0
+        self.downloaded: list[str] = []
+        self.skipped: list[str] = []
+        self.errors: list[JsonObject] = []
+
+    async def _guarded(self, kind: str, target: Path, work: Awaitable[None]) -> None:
+        try:
+            async with self._gate:
+                await work
+        except Exception as exc:
+            _tmp_path(target).unlink(missing_ok=True)
+            self.errors.append(
+                {
+                    "kind": kind,
+                    "target": target.as_posix(),
+                    "error": f"{type(exc).__name__}: {exc}",
+                }
+            )
+            return
+        if _has_content(target):
+            self.downloaded.append(target.as_posix())
+
+    async def _document(self, endpoint: str) -> JsonObject:
+        """Fetch a metadata document once, however many log items share it."""
+        async with self._locks.setdefault(endpoint, asyncio.Lock()):
+            if endpoint not in self._documents:
+                self.requests += 1
+                self._documents[endpoint] = await self._api.get_json_dict(
+                    f"{self._base}/{endpoint}"
+                )
+        return self._documents[endpoint]
+
+    async def _archive(self, run_id: str) -> Path:
+        """Download a run's log archive once, however many failed jobs it holds."""
+        async with self._locks.setdefault(f"archive:{run_id}", asyncio.Lock()):
+            if run_id not in self._archives:
+                archive = self._scratch / f"run-{run_id}-logs.zip"
+                await self._stream(f"{self._base}/actions/runs/{run_id}/logs", archive)
+                self._archives[run_id] = archive
+        return self._archives[run_id]
+
+    async def _metadata(self, endpoint: str, target: Path) -> None:
+        _write_json_atomically(target, await self._document(endpoint))
+
+    async def _annotations(self, check_run_id: str, log_target: Path, json_target: Path) -> None:
+        self.requests += 1
+        payload = await self._api.get_json_list(
+            f"{self._base}/check-runs/{check_run_id}/annotations?per_page=100"
+        )
+        raw = log_target.with_name(f".check-run-{check_run_id}-annotations.raw.json")
+        _write_json_atomically(raw, payload)
+        try:
+            sanitize_check_run_annotations(
+                raw_annotations_json=raw,
+                annotation_log_target=log_target,
+                annotation_json_target=json_target,
+            )
+        finally:
+            raw.unlink(missing_ok=True)
+
+    async def _stream(self, url: str, tmp: Path) -> None:
+        for attempt in range(self._retries):
+            self.requests += 1
+            async with self._client.stream("GET", url, follow_redirects=True) as resp:
+                if resp.status_code == 429 and attempt < self._retries - 1:
+                    delay = retry_after_seconds(resp.headers)
+                    await self._sleep(
+                        delay if delay is not None else backoff_delay(attempt, 0.5, 2.0, 0.0)
+                    )
+                    continue
+                if resp.status_code < 200 or resp.status_code >= 300:
+                    raise RuntimeError(f"log download returned HTTP {resp.status_code}")
+                tmp.parent.mkdir(parents=True, exist_ok=True)
+                with tmp.open("wb") as fh:
+                    async for chunk in resp.aiter_bytes(_CHUNK_SIZE):
+                        fh.write(chunk)
+                return
+        raise RuntimeError("log download retries exhausted")
+
+    async def _log(self, run_id: str, job_id: str, target: Path) -> None:
+        if job_id:
+            jobs = [await self._document(f"actions/jobs/{job_id}")]
+        else:
+            runs_jobs = await self._document(f"actions/runs/{run_id}/jobs?per_page=100")
+            jobs = [_as_dict(job) for job in _as_list(runs_jobs.get("jobs"))]
+        archive = await self._archive(run_id)
+        tmp = _tmp_path(target)
+        tmp.parent.mkdir(parents=True, exist_ok=True)
+        _archive_to_text(archive, tmp, jobs)
+        os.replace(tmp, target)
+        if not _has_content(target):
+            target.unlink(missing_ok=True)
+
+    def tasks(self, manifest: JsonObject) -> list[Awaitable[None]]:
+        pending: list[Awaitable[None]] = []
+        claimed: set[str] = set()
+
+        def claim(kind: str, target: Path, work: Callable[[], Awaitable[None]]) -> None:
+            key = target.as_posix()
+            if key in claimed:
+                return
+            claimed.add(key)
+            if _has_content(target):
+                self.skipped.append(key)
+                return
+            pending.append(self._guarded(kind, target, work()))
+
+        for item in (_as_dict(value) for value in _as_list(manifest.get("logs"))):
+            run_id = _string(item.get("run_id"))
+            job_id = _string(item.get("job_id"))
+            check_run_id = _string(item.get("check_run_id"))
+            log_path = _string(item.get("log_path"))
+            annotation_path = _string(item.get("annotation_path"))
+            run_path = _string(item.get("workflow_run_path"))
+            job_path = _string(item.get("workflow_job_path"))
+
+            if run_id and run_path:
+                claim(
+                    "workflow_run",
+                    Path(run_path),
+                    partial(self._metadata, f"actions/runs/{run_id}", Path(run_path)),
+                )
+            if job_id and job_path:
+                claim(
+                    "workflow_job",
+                    Path(job_path),
+                    partial(self._metadata, f"actions/jobs/{job_id}", Path(job_path)),
+                )
+            if not log_path or bool(item.get("collected", False)):
+                continue
+            if run_id:
+                claim("log", Path(log_path), partial(self._log, run_id, job_id, Path(log_path)))
+            elif check_run_id and annotation_path:
+                claim(
+                    "annotations",
+                    Path(log_path),
+                    partial(self._annotations, check_run_id, Path(log_path), Path(annotation_path)),
+                )
+        return pending
+
+
+async def collect_failed_check_evidence_async(
+    manifest: JsonObject,
+    *,
+    repository: str,
+    token: str | None = None,
+    api_url: str = DEFAULT_API_URL,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = DEFAULT_RETRIES,
+    transport: httpx.AsyncBaseTransport | None = None,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> JsonObject:
+    """Download the evidence a failed-check manifest still lacks; never raises per item."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if retries < 1:
+        raise ValueError("retries must be >= 1")
+    repository = repository.strip().strip("/")
+    if not repository or "/" not in repository:
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "status": "skipped",
+            "reason": "repository_unavailable",
+        }
+
+    headers = {"Accept": "application/vnd.github+json", "X-GitHub-Api-Version": "2022-11-28"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    client_kwargs: JsonObject = {"headers": headers, "limits": limits, "timeout": 60.0}
+    if transport is not None:
+        client_kwargs["transport"] = transport
+
+    with tempfile.TemporaryDirectory(prefix="sdetkit-run-logs-") as scratch:
+        async with httpx.AsyncClient(**client_kwargs) as client:
+            collector = _Collector(
+                client,
+                repository=repository,
+                api_url=api_url,
+                concurrency=concurrency,
+                retries=retries,
+                sleep=sleep,
+                scratch=Path(scratch),
+            )
+            await asyncio.gather(*collector.tasks(manifest))
+
+    if not collector.errors:
+        status = "completed"
+    else:
+        status = "partial" if collector.downloaded else "failed"
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "status": status,
+        "repository": repository,
+        "concurrency": concurrency,
+        "requests": collector.requests,
+        "downloaded": sorted(collector.downloaded),
+        "skipped_present": sorted(collector.skipped),
+        "errors": collector.errors,
+    }
+
+
+def collect_failed_check_evidence(manifest: JsonObject, **kwargs: Any) -> JsonObject:
+    return asyncio.run(collect_failed_check_evidence_async(manifest, **kwargs))
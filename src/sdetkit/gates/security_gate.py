@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import argparse
 import ast
+import bisect
 import difflib
 import hashlib
+import heapq
+import itertools
 import json
 import math
 import os
@@ -12,10 +15,14 @@ import shlex
 import shutil
 import subprocess
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any
 
+from ..utils.atomicio import atomic_write_text
+
 SEVERITY_RANK = {"info": 1, "warn": 2, "error": 3}
 FAIL_ON_TO_SEVERITY = {
     "none": 99,
@@ -29,6 +36,9 @@ FAIL_ON_TO_SEVERITY = {
 SEVERITY_TO_FAIL_LEVEL = {"info": 1, "warn": 2, "error": 3}
 DEFAULT_ALLOWLIST_PATH = Path("tools/security_allowlist.json")
 DEFAULT_BASELINE_PATH = Path("tools/security.baseline.json")
+SCAN_CACHE_FILE = "security-scan.json"
+# Bump when a rule's detection logic changes without a change to RULES or SECRET_PATTERNS.
+SCAN_ENGINE_VERSION = 1
 INLINE_ALLOW_PREFIX = "# sdetkit: allow-security"
 
 SKIP_DIRS = {
@@ -523,23 +533,40 @@ def _normalized_message(message: str) -> str:
     return re.sub(r"\s+", " ", message.strip()).lower()
 
 
-def _fingerprint(rule_id: str, path: str, line: int, message: str) -> str:
-    try:
-        lines = Path(path).read_text(encoding="utf-8", errors="replace").splitlines()
-    except Exception:
-        lines = []
+def _scope_table(lines: list[str]) -> list[str]:
+    """``table[i]`` is the nearest ``def``/``class`` header among ``lines[:i]``."""
+    table = [""]
+    scope = ""
+    for text in lines:
+        s = text.lstrip()
+        if s.startswith("def ") or s.startswith("class "):
+            scope = s.split("(", 1)[0].split(":", 1)[0].strip()
+        table.append(scope)
+    return table
+
+
+def _fingerprint(
+    rule_id: str,
+    path: str,
+    line: int,
+    message: str,
+    *,
+    lines: list[str] | None = None,
+    scopes: list[str] | None = None,
+) -> str:
+    if lines is None:
+        try:
+            lines = Path(path).read_text(encoding="utf-8", errors="replace").splitlines()
+        except Exception:
+            lines = []
 
     line_text = ""
+    scope = ""
     if 1 <= line <= len(lines):
         line_text = lines[line - 1].strip()
-
-    scope = ""
-    if lines and 1 <= line <= len(lines):
-        for k in range(line - 2, -1, -1):
-            s = lines[k].lstrip()
-            if s.startswith("def ") or s.startswith("class "):
-                scope = s.split("(", 1)[0].split(":", 1)[0].strip()
-                break
+        if scopes is None:
+            scopes = _scope_table(lines[: line - 1])
+        scope = scopes[line - 1]
 
     raw = f"{rule_id}\n{path}\n{scope}\n{line_text}\n{message}"
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
@@ -578,20 +605,41 @@ def _inline_allowed(lines: list[str], finding: Finding) -> bool:
     return False
 
 
-def _repo_allowed(entries: list[dict[str, Any]], finding: Finding) -> bool:
+AllowlistIndex = frozenset[tuple[str, str, int | None, str | None]]
+
+
+def _index_allowlist(entries: list[dict[str, Any]]) -> AllowlistIndex:
+    """Key allowlist entries by (rule_id, path, line, fingerprint).
+
+    ``line`` and ``fingerprint`` are ``None`` when the entry leaves them unset, so an
+    entry acts as a wildcard for whichever of the two it does not pin.
+    """
+    keys: set[tuple[str, str, int | None, str | None]] = set()
     for item in entries:
-        if str(item.get("rule_id", "")) != finding.rule_id:
-            continue
-        if str(item.get("path", "")) != finding.path:
-            continue
         line = item.get("line")
-        if isinstance(line, int) and line != finding.line:
-            continue
         fp = item.get("fingerprint")
-        if isinstance(fp, str) and fp and fp != finding.fingerprint:
-            continue
-        return True
-    return False
+        keys.add(
+            (
+                str(item.get("rule_id", "")),
+                str(item.get("path", "")),
+                line if isinstance(line, int) else None,
+                fp if isinstance(fp, str) and fp else None,
+            )
+        )
+    return frozenset(keys)
+
+
+def _repo_allowed(entries: AllowlistIndex | list[dict[str, Any]], finding: Finding) -> bool:
+    index = entries if isinstance(entries, frozenset) else _index_allowlist(entries)
+    if not index:
+        return False
+    rule_id, path = finding.rule_id, finding.path
+    return (
+        (rule_id, path, None, None) in index
+        or (rule_id, path, finding.line, None) in index
+        or (rule_id, path, None, finding.fingerprint) in index
+        or (rule_id, path, finding.line, finding.fingerprint) in index
+    )
 
 
 def _looks_like_slug(token: str) -> bool:
@@ -664,105 +712,348 @@ def _is_test_fixture_secret(rel_path: str, line: str) -> bool:
     return any(token in upper_line for token in marker_tokens)
 
 
+# Lowercase literals, one of which occurs in every SECRET_PATTERNS match (case-insensitively).
+# Kept free of groups and flags so the alternation compiles with a first-character prefilter.
+SECRET_PATTERN_ANCHORS = (
+    "akia",
+    "gh[pousr]_",
+    "api[_-]?key",
+    "token",
+    "secret",
+    "password",
+    "-----begin ",
+)
+SECRET_ANCHOR_PATTERN = re.compile("|".join(SECRET_PATTERN_ANCHORS))
+SECRET_ANCHOR_PATTERN_NOCASE = re.compile("|".join(SECRET_PATTERN_ANCHORS), re.IGNORECASE)
+# Non-ASCII characters that re.IGNORECASE equates with ASCII letters.
+_ANCHOR_FOLD = (("\u0130", "i"), ("\u0131", "i"), ("\u017f", "s"), ("\u212a", "k"))
+QUOTED_TOKEN_PATTERN = re.compile(r"['\"]([A-Za-z0-9+/=_\-]{20,})['\"]")
+
+
+def _line_starts(text: str) -> list[int]:
+    """Offset in *text* of each line ``str.splitlines`` yields."""
+    return [0, *itertools.accumulate(map(len, text.splitlines(keepends=True)))][:-1]
+
+
+def _anchor_text(text: str) -> str | None:
+    """Lowercased *text* with unchanged offsets, or None when folding would shift them."""
+    if text.isascii():
+        return text.lower()
+    folded = text
+    for char, ascii_char in _ANCHOR_FOLD:
+        if char in folded:
+            folded = folded.replace(char, ascii_char)
+    folded = folded.lower()
+    return folded if len(folded) == len(text) else None
+
+
 def _scan_text_patterns(rel_path: str, text: str) -> list[Finding]:
-    findings: list[Finding] = []
+    # Whole-text passes locate candidate lines; SECRET_PATTERNS are then checked per line.
+    folded = _anchor_text(text)
+    if folded is not None:
+        anchors = SECRET_ANCHOR_PATTERN.finditer(folded)
+    else:
+        anchors = SECRET_ANCHOR_PATTERN_NOCASE.finditer(text)
+    anchor_offsets = [match.start() for match in anchors]
+    tokens = list(QUOTED_TOKEN_PATTERN.finditer(text))
+    if not anchor_offsets and not tokens:
+        return []
     lines = text.splitlines()
-    for i, line in enumerate(lines, start=1):
+    starts = _line_starts(text)
+
+    by_line: dict[int, list[Finding]] = {}
+    for idx in sorted({bisect.bisect_right(starts, pos) - 1 for pos in anchor_offsets}):
+        line = lines[idx]
         for rule_id, pattern, msg in SECRET_PATTERNS:
             if pattern.search(line):
                 if _is_test_fixture_secret(rel_path, line):
                     continue
-                findings.append(
+                by_line.setdefault(idx, []).append(
                     Finding(
                         rule_id=rule_id,
                         severity=RULES[rule_id].severity,
                         path=rel_path,
-                        line=i,
+                        line=idx + 1,
                         column=0,
                         message=msg,
                     )
                 )
-        # quoted token-like strings
-        for match in re.finditer(r"['\"]([A-Za-z0-9+/=_\-]{20,})['\"]", line):
-            token = match.group(1)
-            if any(ch.isspace() for ch in token):
-                continue
-            if _looks_like_path(token):
-                continue
-            if _looks_like_slug(token):
-                continue
-            if _looks_like_snake_identifier(token):
-                continue
-            if _looks_like_uuid(token):
-                continue
-            if _looks_like_hex_digest(token):
-                continue
-            if _looks_like_boolean_assignment(token):
-                continue
-            if _entropy(token) >= 4.0 and not token.isdigit():
-                findings.append(
-                    Finding(
-                        rule_id="SEC_HIGH_ENTROPY_STRING",
-                        severity=RULES["SEC_HIGH_ENTROPY_STRING"].severity,
-                        path=rel_path,
-                        line=i,
-                        column=match.start(1),
-                        message="High-entropy string literal detected.",
-                    )
+
+    # quoted token-like strings; the token class excludes quotes and line breaks, so matches
+    # over the whole text are exactly the per-line matches
+    for match in tokens:
+        token = match.group(1)
+        if _looks_like_path(token):
+            continue
+        if _looks_like_slug(token):
+            continue
+        if _looks_like_snake_identifier(token):
+            continue
+        if _looks_like_uuid(token):
+            continue
+        if _looks_like_hex_digest(token):
+            continue
+        if _looks_like_boolean_assignment(token):
+            continue
+        if _entropy(token) >= 4.0 and not token.isdigit():
+            idx = bisect.bisect_right(starts, match.start(1)) - 1
+            by_line.setdefault(idx, []).append(
+                Finding(
+                    rule_id="SEC_HIGH_ENTROPY_STRING",
+                    severity=RULES["SEC_HIGH_ENTROPY_STRING"].severity,
+                    path=rel_path,
+                    line=idx + 1,
+                    column=match.start(1) - starts[idx],
+                    message="High-entropy string literal detected.",
                 )
-    return findings
+            )
+    return [finding for idx in sorted(by_line) for finding in by_line[idx]]
 
 
 def _entropy(text: str) -> float:
     if not text:
         return 0.0
-    counts: dict[str, int] = {}
-    for ch in text:
-        counts[ch] = counts.get(ch, 0) + 1
     total = len(text)
-    return -sum((v / total) * math.log2(v / total) for v in counts.values())
+    return -sum((v / total) * math.log2(v / total) for v in Counter(text).values())
+
+
+def _ruleset_version() -> str:
+    parts: list[str] = [str(SCAN_ENGINE_VERSION)]
+    parts.extend(f"{rid}:{meta.severity}" for rid, meta in sorted(RULES.items()))
+    parts.extend(f"{rid}:{pattern.pattern}:{msg}" for rid, pattern, msg in SECRET_PATTERNS)
+    parts.extend(sorted(SUSPICIOUS_INPUT_NAMES))
+    parts.extend(PRINT_ALLOWED_MODULE_SUFFIXES)
+    parts.extend(sorted(PRINT_ALLOWED_PATHS))
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class SecurityScanCache:
+    """Per-file raw findings keyed by content hash and rule-set version.
+
+    Only files seen during the last scan are kept, so deleted files drop out on save.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.ruleset = _ruleset_version()
+        self.hits = 0
+        self.misses = 0
+        self._previous: dict[str, Any] = {}
+        self._current: dict[str, Any] = {}
+        if path is None or not path.exists():
+            return
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(payload, dict) and payload.get("ruleset") == self.ruleset:
+            files = payload.get("files")
+            self._previous = files if isinstance(files, dict) else {}
+
+    def get(self, rel_path: str, digest: str) -> list[Finding] | None:
+        entry = self._previous.get(rel_path)
+        if not isinstance(entry, dict) or entry.get("sha256") != digest:
+            self.misses += 1
+            return None
+        try:
+            findings = [Finding(**item) for item in entry.get("findings", [])]
+        except TypeError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._current[rel_path] = entry
+        return findings
+
+    def known(self, rel_path: str) -> tuple[str, bool] | None:
+        """Return the cached ``(sha256, has_findings)`` for *rel_path* without counting it."""
+        entry = self._previous.get(rel_path)
+        if not isinstance(entry, dict) or not isinstance(entry.get("sha256"), str):
+            return None
+        return entry["sha256"], bool(entry.get("findings"))
+
+    def put(self, rel_path: str, digest: str, findings: list[Finding]) -> None:
+        self._current[rel_path] = {"sha256": digest, "findings": [asdict(f) for f in findings]}
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        payload = {
+            "version": 1,
+            "ruleset": self.ruleset,
+            "files": dict(sorted(self._current.items())),
+        }
+        atomic_write_text(self.path, json.dumps(payload, ensure_ascii=True, sort_keys=True) + "\n")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "ruleset": self.ruleset,
+            "files": self.hits + self.misses,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def _raw_file_findings(rel: str, text: str) -> list[Finding]:
+    file_findings: list[Finding] = []
+    if PurePosixPath(rel).suffix == ".py":
+        try:
+            tree = ast.parse(text)
+        except SyntaxError:
+            tree = None
+        if tree is not None:
+            visitor = _RuleVisitor(rel, text.splitlines())
+            visitor.visit(tree)
+            file_findings.extend(visitor.findings)
+    file_findings.extend(_scan_text_patterns(rel, text))
+    return file_findings
+
+
+def _read_scan_text(path: Path) -> tuple[bytes, str] | None:
+    """Return raw bytes and newline-normalised text, or ``None`` for non-UTF-8 files."""
+    raw = path.read_bytes()
+    try:
+        text = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    except UnicodeDecodeError:
+        return None
+    return raw, text
+
+
+def _scan_chunk(
+    root: str, hashed: bool, chunk: list[tuple[str, int, tuple[str, bool] | None]]
+) -> list[tuple[str, str, list[Finding] | None, list[str] | None]]:
+    """Process-pool worker: read, hash and scan each (rel_path, size, cached) entry.
+
+    ``cached`` is the cache's ``(sha256, has_findings)`` for the path. A file whose
+    digest still matches is not rescanned and comes back with ``None`` findings.
+    Lines are returned only for files with findings, so the parent never holds
+    the text of clean files.
+    """
+    results: list[tuple[str, str, list[Finding] | None, list[str] | None]] = []
+    for rel, _size, cached in chunk:
+        loaded = _read_scan_text(Path(root) / rel)
+        if loaded is None:
+            continue
+        raw, text = loaded
+        digest = hashlib.sha256(raw).hexdigest() if hashed else ""
+        if cached is not None and cached[0] == digest:
+            results.append((rel, digest, None, text.splitlines() if cached[1] else None))
+            continue
+        file_findings = _raw_file_findings(rel, text)
+        results.append((rel, digest, file_findings, text.splitlines() if file_findings else None))
+    return results
+
+
+def _balanced_chunks(
+    items: list[tuple[str, int, tuple[str, bool] | None]], count: int
+) -> list[list[tuple[str, int, tuple[str, bool] | None]]]:
+    """Split (rel_path, size, cached) items into up to *count* chunks of similar total size."""
+    heap: list[tuple[int, int]] = [(0, idx) for idx in range(max(1, min(count, len(items))))]
+    chunks: list[list[tuple[str, int, tuple[str, bool] | None]]] = [[] for _ in heap]
+    for item in sorted(items, key=lambda x: x[1], reverse=True):
+        size, idx = heapq.heappop(heap)
+        chunks[idx].append(item)
+        heapq.heappush(heap, (size + item[1], idx))
+    return [chunk for chunk in chunks if chunk]
+
+
+def _filter_file_findings(
+    raw_findings: list[Finding], lines: list[str], allow_index: AllowlistIndex
+) -> list[Finding]:
+    kept: list[Finding] = []
+    scopes = _scope_table(lines) if raw_findings else []
+    for finding in raw_findings:
+        with_fp = Finding(
+            **{
+                **asdict(finding),
+                "fingerprint": _fingerprint(
+                    finding.rule_id,
+                    finding.path,
+                    finding.line,
+                    finding.message,
+                    lines=lines,
+                    scopes=scopes,
+                ),
+            }
+        )
+        if _inline_allowed(lines, with_fp):
+            continue
+        if _repo_allowed(allow_index, with_fp):
+            continue
+        file_line = lines[with_fp.line - 1] if 0 < with_fp.line <= len(lines) else ""
+        if with_fp.rule_id == "SEC_WEAK_HASH" and INLINE_ALLOW_PREFIX in file_line:
+            continue
+        kept.append(with_fp)
+    return kept
 
 
-def scan_repo(root: Path, *, allowlist_path: Path | None = None) -> list[Finding]:
-    allow_entries = _load_repo_allowlist(allowlist_path or DEFAULT_ALLOWLIST_PATH)
+def scan_repo(
+    root: Path,
+    *,
+    allowlist_path: Path | None = None,
+    cache: SecurityScanCache | None = None,
+    jobs: int = 1,
+) -> list[Finding]:
+    """Scan *root*; with ``jobs > 1`` uncached files are parsed in a process pool."""
+    if jobs < 1:
+        raise SecurityScanError("jobs must be >= 1")
+    allow_index = _index_allowlist(_load_repo_allowlist(allowlist_path or DEFAULT_ALLOWLIST_PATH))
     findings: list[Finding] = []
+    pending: list[tuple[str, int, tuple[str, bool] | None]] = []
+    # A cache directory outside SKIP_DIRS must not have its own findings file scanned.
+    cache_rel: str | None = None
+    if cache is not None and cache.path is not None:
+        try:
+            cache_rel = cache.path.resolve().relative_to(root.resolve()).as_posix()
+        except ValueError:
+            cache_rel = None
     for file_path in _iter_files(root):
         rel = file_path.relative_to(root).as_posix()
-        try:
-            text = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
+        if rel == cache_rel:
             continue
-        lines = text.splitlines()
-        file_findings: list[Finding] = []
-        if file_path.suffix == ".py":
-            try:
-                tree = ast.parse(text)
-            except SyntaxError:
-                tree = None
-            if tree is not None:
-                visitor = _RuleVisitor(rel, lines)
-                visitor.visit(tree)
-                file_findings.extend(visitor.findings)
-        file_findings.extend(_scan_text_patterns(rel, text))
-
-        for finding in file_findings:
-            with_fp = Finding(
-                **{
-                    **asdict(finding),
-                    "fingerprint": _fingerprint(
-                        finding.rule_id, finding.path, finding.line, finding.message
-                    ),
-                }
-            )
-            if _inline_allowed(lines, with_fp):
-                continue
-            if _repo_allowed(allow_entries, with_fp):
-                continue
-            file_line = lines[with_fp.line - 1] if 0 < with_fp.line <= len(lines) else ""
-            if with_fp.rule_id == "SEC_WEAK_HASH" and INLINE_ALLOW_PREFIX in file_line:
-                continue
-            findings.append(with_fp)
-
+        if jobs > 1:
+            # Workers read their own files; the parent only plans by size.
+            known = cache.known(rel) if cache is not None else None
+            pending.append((rel, file_path.stat().st_size, known))
+            continue
+        loaded = _read_scan_text(file_path)
+        if loaded is None:
+            continue
+        raw, text = loaded
+        digest = hashlib.sha256(raw).hexdigest() if cache is not None else ""
+        file_findings = cache.get(rel, digest) if cache is not None else None
+        if file_findings is None:
+            file_findings = _raw_file_findings(rel, text)
+            if cache is not None:
+                cache.put(rel, digest, file_findings)
+        findings.extend(_filter_file_findings(file_findings, text.splitlines(), allow_index))
+
+    if pending:
+        # Several chunks per worker keep the pool busy when one chunk runs long.
+        chunks = _balanced_chunks(pending, jobs * 4)
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+            for results in pool.map(
+                _scan_chunk,
+                itertools.repeat(str(root)),
+                itertools.repeat(cache is not None),
+                chunks,
+            ):
+                for rel, digest, scanned, lines in results:
+                    file_findings = cache.get(rel, digest) if cache is not None else None
+                    if file_findings is None:
+                        if scanned is None:
+                            # The cached entry matched by digest but could not be loaded.
+                            loaded = _read_scan_text(root / rel)
+                            if loaded is None:
+                                continue
+                            lines = loaded[1].splitlines()
+                            scanned = _raw_file_findings(rel, loaded[1])
+                        file_findings = scanned
+                        if cache is not None:
+                            cache.put(rel, digest, file_findings)
+                    findings.extend(_filter_file_findings(file_findings, lines or [], allow_index))
+
+    if cache is not None:
+        cache.save()
     findings.sort(key=lambda x: (x.path, x.line, x.column, x.rule_id, x.message))
     return findings
 
@@ -787,6 +1078,8 @@ def _scan_dependency_vulns_offline(root: Path) -> list[Finding]:
         path = root / rel
         if not path.exists() or not path.is_file():
             continue
+        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        scopes = _scope_table(lines)
         for name, version, line_no in _parse_pinned_dependencies(path):
             advisories = OFFLINE_VULN_RULES.get(name, {})
             for vulnerable_prefix, reason in sorted(advisories.items()):
@@ -801,7 +1094,12 @@ def _scan_dependency_vulns_offline(root: Path) -> list[Finding]:
                             message=f"{name}=={version} matches offline vulnerability rule ({reason})",
                             suggestion="Upgrade to a patched dependency version.",
                             fingerprint=_fingerprint(
-                                "SEC_DEP_VULN", rel, line_no, f"{name}=={version}|{reason}"
+                                "SEC_DEP_VULN",
+                                rel,
+                                line_no,
+                                f"{name}=={version}|{reason}",
+                                lines=lines,
+                                scopes=scopes,
                             ),
                         )
                     )
@@ -861,8 +1159,10 @@ def run_security_scan(
     allowlist_path: Path,
     online: bool,
     sbom_output: Path | None,
+    cache: SecurityScanCache | None = None,
+    jobs: int = 1,
 ) -> tuple[list[Finding], dict[str, Any]]:
-    findings = scan_repo(root, allowlist_path=allowlist_path)
+    findings = scan_repo(root, allowlist_path=allowlist_path, cache=cache, jobs=jobs)
     findings.extend(_scan_dependency_vulns_offline(root))
     if online:
         findings.extend(_maybe_online_dep_scan(root))
@@ -881,6 +1181,7 @@ def _to_json_payload(
     *,
     new_only: list[Finding] | None = None,
     sbom: dict[str, Any] | None = None,
+    cache_stats: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     counts = {"info": 0, "warn": 0, "error": 0}
     for f in findings:
@@ -895,6 +1196,8 @@ def _to_json_payload(
     }
     if sbom is not None:
         payload["sbom"] = sbom
+    if cache_stats is not None:
+        payload["cache"] = cache_stats
     return payload
 
 
@@ -914,7 +1217,9 @@ def _to_text(findings: list[Finding], *, sbom_components: int = 0) -> str:
     return "\n".join(lines) + "\n"
 
 
-def _to_sarif(findings: list[Finding]) -> dict[str, Any]:
+def _to_sarif(
+    findings: list[Finding], *, cache_stats: dict[str, Any] | None = None
+) -> dict[str, Any]:
     rules = []
     for rid in sorted({f.rule_id for f in findings}):
         meta = RULES[rid]
@@ -950,15 +1255,16 @@ def _to_sarif(findings: list[Finding]) -> dict[str, Any]:
                 ],
             }
         )
+    run: dict[str, Any] = {
+        "tool": {"driver": {"name": "sdetkit-security-gate", "rules": rules}},
+        "results": results,
+    }
+    if cache_stats is not None:
+        run["properties"] = {"cache": cache_stats}
     return {
         "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
         "version": "2.1.0",
-        "runs": [
-            {
-                "tool": {"driver": {"name": "sdetkit-security-gate", "rules": rules}},
-                "results": results,
-            }
-        ],
+        "runs": [run],
     }
 
 
@@ -1143,6 +1449,7 @@ def _render(
     new_only: list[Finding] | None = None,
     sbom: dict[str, Any] | None = None,
     include_info: bool = True,
+    cache_stats: dict[str, Any] | None = None,
 ) -> str:
     if fmt == "text":
         target = findings if new_only is None else new_only
@@ -1151,7 +1458,7 @@ def _render(
     if fmt == "json":
         return (
             json.dumps(
-                _to_json_payload(findings, new_only=new_only, sbom=sbom),
+                _to_json_payload(findings, new_only=new_only, sbom=sbom, cache_stats=cache_stats),
                 ensure_ascii=True,
                 sort_keys=True,
                 indent=2,
@@ -1162,7 +1469,8 @@ def _render(
         target = findings if new_only is None else new_only
         if not include_info:
             target = [item for item in target if item.severity != "info"]
-        return json.dumps(_to_sarif(target), ensure_ascii=True, sort_keys=True, indent=2) + "\n"
+        sarif = _to_sarif(target, cache_stats=cache_stats)
+        return json.dumps(sarif, ensure_ascii=True, sort_keys=True, indent=2) + "\n"
     raise SecurityScanError(f"unsupported format: {fmt}")
 
 
@@ -1286,14 +1594,34 @@ def main(argv: list[str] | None = None) -> int:
     )
     common.add_argument("--online", action="store_true", help="Enable optional online scanning")
     common.add_argument("--sbom-output", default=None, help="Write CycloneDX SBOM JSON to file")
+    common.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Keep a per-file findings cache in this directory (relative to --root); off by default",
+    )
+    common.add_argument(
+        "--no-cache", action="store_true", help="Ignore --cache-dir and rescan every file"
+    )
+    common.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Include findings-cache hit/miss counts in JSON and SARIF output",
+    )
+    scanning = argparse.ArgumentParser(add_help=False)
+    scanning.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for reading and scanning files",
+    )
 
-    scan = sub.add_parser("scan", parents=[common])
+    scan = sub.add_parser("scan", parents=[common, scanning])
     scan.add_argument(
         "--include-info",
         action="store_true",
         help="Include info-level findings when rendering SARIF output.",
     )
-    rpt = sub.add_parser("report", parents=[common])
+    rpt = sub.add_parser("report", parents=[common, scanning])
     rpt.add_argument("--scan-json", default=None)
     rpt.add_argument(
         "--include-info",
@@ -1301,7 +1629,7 @@ def main(argv: list[str] | None = None) -> int:
         help="Include info-level findings when rendering SARIF output.",
     )
 
-    chk = sub.add_parser("check", parents=[common])
+    chk = sub.add_parser("check", parents=[common, scanning])
     chk.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH))
     chk.add_argument("--scan-json", default=None)
 
@@ -1311,7 +1639,7 @@ def main(argv: list[str] | None = None) -> int:
         help="Include info-level findings in new_findings and SARIF/text summaries.",
     )
 
-    enf = sub.add_parser("enforce", parents=[common])
+    enf = sub.add_parser("enforce", parents=[common, scanning])
     enf.add_argument("--scan-json", default=None)
     enf.add_argument("--max-total", type=int, default=None)
     enf.add_argument("--max-info", type=int, default=0)
@@ -1324,7 +1652,7 @@ def main(argv: list[str] | None = None) -> int:
         metavar="RULE=COUNT",
         help="Per-rule budget (repeatable), e.g. --max-rule SEC_OS_SYSTEM=0",
     )
-    base = sub.add_parser("baseline", parents=[common])
+    base = sub.add_parser("baseline", parents=[common, scanning])
     base.add_argument(
         "--include-info",
         action="store_true",
@@ -1344,6 +1672,9 @@ def main(argv: list[str] | None = None) -> int:
         allowlist = Path(ns.allowlist)
         findings: list[Finding] = []
         sbom: dict[str, Any] | None = None
+        cache: SecurityScanCache | None = None
+        if ns.cmd != "fix" and ns.cache_dir and not ns.no_cache:
+            cache = SecurityScanCache(root / ns.cache_dir / SCAN_CACHE_FILE)
 
         if ns.cmd == "baseline":
             findings, _ = run_security_scan(
@@ -1351,6 +1682,8 @@ def main(argv: list[str] | None = None) -> int:
                 allowlist_path=allowlist,
                 online=bool(getattr(ns, "online", False)),
                 sbom_output=None,
+                cache=cache,
+                jobs=ns.jobs,
             )
             baseline_findings = (
                 findings if ns.include_info else [f for f in findings if f.severity != "info"]
@@ -1427,13 +1760,17 @@ def main(argv: list[str] | None = None) -> int:
                     json.dumps(sbom, ensure_ascii=True, sort_keys=True, indent=2) + "\n",
                     encoding="utf-8",
                 )
+            cache = None
         else:
             findings, sbom = run_security_scan(
                 root,
                 allowlist_path=allowlist,
                 online=bool(getattr(ns, "online", False)),
                 sbom_output=sbom_output,
+                cache=cache,
+                jobs=ns.jobs,
             )
+        cache_stats = cache.stats() if cache is not None and ns.cache_stats else None
 
         if ns.cmd == "check":
             baseline_path = Path(ns.baseline)
@@ -1450,6 +1787,7 @@ def main(argv: list[str] | None = None) -> int:
                 new_only=new_findings,
                 sbom=sbom,
                 include_info=ns.include_info,
+                cache_stats=cache_stats,
             )
             _write_output(rendered, ns.output)
             return 1 if _severity_trips(new_findings, ns.fail_on) else 0
@@ -1496,11 +1834,19 @@ def main(argv: list[str] | None = None) -> int:
             return 0 if ok else 1
 
         if ns.cmd == "report":
-            rendered = _render(findings, ns.format, sbom=sbom, include_info=ns.include_info)
+            rendered = _render(
+                findings,
+                ns.format,
+                sbom=sbom,
+                include_info=ns.include_info,
+                cache_stats=cache_stats,
+            )
             _write_output(rendered, ns.output)
             return 0
 
-        rendered = _render(findings, ns.format, sbom=sbom, include_info=ns.include_info)
+        rendered = _render(
+            findings, ns.format, sbom=sbom, include_info=ns.include_info, cache_stats=cache_stats
+        )
         _write_output(rendered, ns.output)
         return 1 if _severity_trips(findings, ns.fail_on) else 0
     except SecurityScanError as exc:
@@ -8,12 +8,18 @@ import io
 import json
 import subprocess
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from .. import doctor, inspect_project, readiness
+from ..adaptive_memory import explain_path, init_db
+from ..adaptive_memory import history_payload as adaptive_history_payload
+from ..boost import build_scan
 from ..evidence_workspace import load_workspace_manifest, record_workspace_run
+from ..index import inspect_index
 from ..inspect_compare import run_compare
 from ..inspect_data import run_inspect
 from ..security import SecurityError, safe_path
@@ -543,6 +549,7 @@ def run_review(
     adaptive_learn: bool = False,
     adaptive_db: Path | None = None,
     adaptive_evidence_dir: Path | None = None,
+    adaptive_helper_mode: str = "in-process",
 ) -> tuple[int, dict[str, Any], Path, Path]:
     try:
         target = safe_path(Path.cwd(), target.as_posix(), allow_absolute=True).resolve()
@@ -1244,6 +1251,7 @@ def run_review(
             learn=adaptive_learn,
             db_path=adaptive_db or Path(".sdetkit/adaptive.db"),
             evidence_dir=adaptive_evidence_dir,
+            helper_mode=adaptive_helper_mode,
         )
     top5_actions = [
         str(item.get("action", ""))
@@ -2355,6 +2363,9 @@ def _render_release_readiness_markdown(contract: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+ADAPTIVE_HELPER_MODES = ("in-process", "subprocess")
+
+
 def _run_json_cmd(args: list[str]) -> dict[str, Any]:
     proc = subprocess.run(
         args,
@@ -2366,6 +2377,7 @@ def _run_json_cmd(args: list[str]) -> dict[str, Any]:
     )
     diagnostics = {
         "command": args,
+        "mode": "subprocess",
         "rc": int(proc.returncode),
         "stderr": (proc.stderr or "").strip()[:500],
         "stdout_present": bool((proc.stdout or "").strip()),
@@ -2384,6 +2396,45 @@ def _run_json_cmd(args: list[str]) -> dict[str, Any]:
     return loaded
 
 
+def _run_json_call(args: list[str], build: Callable[[], Any]) -> dict[str, Any]:
+    """In-process twin of ``_run_json_cmd`` returning the same payload/diagnostics shape."""
+    diagnostics: dict[str, Any] = {
+        "command": args,
+        "mode": "in-process",
+        "rc": 0,
+        "stderr": "",
+        "stdout_present": True,
+    }
+    try:
+        # Round-trip through JSON so payloads match what the CLI would have printed.
+        loaded = json.loads(json.dumps(build(), sort_keys=True))
+    except SystemExit as exc:
+        diagnostics.update(
+            rc=exc.code if isinstance(exc.code, int) and exc.code else 1,
+            stderr=str(exc.code or "")[:500],
+            stdout_present=False,
+        )
+        return {"_diagnostics": diagnostics}
+    except Exception as exc:
+        diagnostics.update(rc=1, stderr=f"{type(exc).__name__}: {exc}"[:500], stdout_present=False)
+        return {"_diagnostics": diagnostics}
+    if not isinstance(loaded, dict):
+        diagnostics["parse_error"] = "json root not object"
+        return {"_diagnostics": diagnostics}
+    loaded.setdefault("_diagnostics", diagnostics)
+    return loaded
+
+
+def _adaptive_history(db_path: Path) -> dict[str, object]:
+    init_db(db_path)
+    return adaptive_history_payload(db_path)
+
+
+def _adaptive_explain(db_path: Path, target: Path) -> dict[str, object]:
+    init_db(db_path)
+    return explain_path(db_path, str(target))
+
+
 def _build_adaptive_review_v2(
     *,
     target: Path,
@@ -2392,57 +2443,23 @@ def _build_adaptive_review_v2(
     learn: bool,
     db_path: Path,
     evidence_dir: Path | None,
+    helper_mode: str = "in-process",
 ) -> dict[str, Any]:
-    index_payload = (
-        _run_json_cmd(
-            [
-                "python",
-                "-m",
-                "sdetkit",
-                "index",
-                "inspect",
-                str(target),
-                "--format",
-                "operator-json",
-            ]
-        )
-        if deep
-        else {}
-    )
-    if learn and deep:
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        _run_json_cmd(["python", "-m", "sdetkit", "adaptive", "init", "--db", str(db_path)])
-    history_payload = _run_json_cmd(
-        [
-            "python",
-            "-m",
-            "sdetkit",
-            "adaptive",
-            "history",
-            "--db",
-            str(db_path),
-            "--format",
-            "operator-json",
-        ]
-    )
-    explain_payload = _run_json_cmd(
-        [
-            "python",
-            "-m",
-            "sdetkit",
-            "adaptive",
-            "explain",
-            str(target),
-            "--db",
-            str(db_path),
-            "--format",
-            "operator-json",
-        ]
-    )
+    if helper_mode not in ADAPTIVE_HELPER_MODES:
+        raise ValueError(f"review: unsupported adaptive helper mode '{helper_mode}'")
+
+    index_args = ["index", "inspect", str(target), "--format", "operator-json"]
+    history_args = ["adaptive", "history", "--db", str(db_path), "--format", "operator-json"]
+    explain_args = [
+        "adaptive",
+        "explain",
+        str(target),
+        "--db",
+        str(db_path),
+        "--format",
+        "operator-json",
+    ]
     boost_args = [
-        "python",
-        "-m",
-        "sdetkit",
         "boost",
         "scan",
         str(target),
@@ -2453,12 +2470,64 @@ def _build_adaptive_review_v2(
         "--format",
         "operator-json",
     ]
+    boost_evidence_dir: Path | None = None
     if evidence_dir:
         evidence_dir.mkdir(parents=True, exist_ok=True)
         boost_evidence_dir = safe_path(evidence_dir, "boost", allow_absolute=False)
         boost_evidence_dir.mkdir(parents=True, exist_ok=True)
         boost_args.extend(["--evidence-dir", str(boost_evidence_dir)])
-    boost_payload = _run_json_cmd(boost_args)
+
+    def helper(args: list[str], build: Callable[[], Any]) -> dict[str, Any]:
+        command = ["python", "-m", "sdetkit", *args]
+        if helper_mode == "subprocess":
+            return _run_json_cmd(command)
+        return _run_json_call(command, build)
+
+    def run_index() -> dict[str, Any]:
+        return helper(index_args, lambda: inspect_index(target)) if deep else {}
+
+    def run_boost() -> dict[str, Any]:
+        return helper(
+            boost_args,
+            lambda: build_scan(
+                target,
+                5,
+                100,
+                deep=True,
+                learn=True,
+                db=str(db_path),
+                evidence_dir=str(boost_evidence_dir or ""),
+            ),
+        )
+
+    if learn and deep:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        helper(["adaptive", "init", "--db", str(db_path)], lambda: init_db(db_path) or {})
+
+    if helper_mode == "subprocess":
+        index_payload = run_index()
+        history_payload = helper(history_args, lambda: _adaptive_history(db_path))
+        explain_payload = helper(explain_args, lambda: _adaptive_explain(db_path, target))
+        boost_payload = run_boost()
+    else:
+        # The memory reads must observe the database before boost ingests this run, and
+        # boost rebuilds the index where ``index inspect`` would when both resolve to
+        # the same directory; everything else runs side by side.
+        shared_index_dir = (Path("build") / "sdetkit-index").resolve() == (
+            target.resolve() / "build" / "sdetkit-index"
+        )
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            index_future = pool.submit(run_index)
+            history_future = pool.submit(helper, history_args, lambda: _adaptive_history(db_path))
+            explain_future = pool.submit(
+                helper, explain_args, lambda: _adaptive_explain(db_path, target)
+            )
+            history_payload = history_future.result()
+            explain_payload = explain_future.result()
+            if shared_index_dir:
+                index_future.result()
+            boost_payload = run_boost()
+            index_payload = index_future.result()
     findings = [row for row in payload.get("top_matters", []) if isinstance(row, dict)]
     recommendations = list(
         dict.fromkeys(
@@ -2858,6 +2927,15 @@ def _build_arg_parser() -> argparse.ArgumentParser:
     p.add_argument(
         "--evidence-dir", default=None, help="Optional adaptive evidence output directory."
     )
+    p.add_argument(
+        "--adaptive-helpers",
+        choices=ADAPTIVE_HELPER_MODES,
+        default="in-process",
+        help=(
+            "Run adaptive index/memory/boost helpers in-process (default) or as isolated "
+            "`python -m sdetkit` subprocesses."
+        ),
+    )
     return p
 
 
@@ -2903,6 +2981,7 @@ def main(argv: list[str] | None = None) -> int:
             adaptive_learn=bool(ns.learn),
             adaptive_db=Path(ns.db) if ns.db else None,
             adaptive_evidence_dir=Path(ns.evidence_dir) if ns.evidence_dir else None,
+            adaptive_helper_mode=str(ns.adaptive_helpers),
         )
     except ValueError as exc:
         sys.stderr.write(str(exc) + "\n")
@@ -33,4 +33,6 @@ def build_review_forwarded_args(ns: argparse.Namespace) -> list[str]:
         forwarded.extend(["--db", ns.db])
     if getattr(ns, "evidence_dir", None):
         forwarded.extend(["--evidence-dir", ns.evidence_dir])
+    if getattr(ns, "adaptive_helpers", None):
+        forwarded.extend(["--adaptive-helpers", ns.adaptive_helpers])
     return forwarded
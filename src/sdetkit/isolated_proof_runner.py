@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import hashlib
 import json
 import os
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
-from collections.abc import Mapping
+import time
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -38,6 +41,15 @@ EVIDENCE_JSON = "verification-evidence.json"
 EVIDENCE_MD = "verification-evidence.md"
 DEFAULT_TIMEOUT_SECONDS = 120
 MAX_CAPTURE_CHARS = 8000
+DEFAULT_WORKSPACE_POOL_SIZE = 2
+# Files changed this recently may still change within one filesystem timestamp tick,
+# so their stat metadata is never trusted in place of a content hash.
+STAT_RACY_WINDOW_NS = 2_000_000_000
+_HASH_CHUNK_BYTES = 1024 * 1024
+_WORKSPACE_STATE_SCHEMA = 1
+_BASELINE_INDEX = "baseline-index"
+_BASELINE_DATE = "2000-01-01T00:00:00+0000"
+_FICLONE = 0x40049409
 
 JsonObject = dict[str, Any]
 
@@ -132,28 +144,93 @@ def _capture_text(value: str | bytes | None) -> str:
     return rendered[:MAX_CAPTURE_CHARS] + "\n... output truncated ...\n"
 
 
-def _ignored_relative_path(relative: Path) -> bool:
-    return any(part in IGNORED_NAMES for part in relative.parts) or relative.name in IGNORED_FILES
+StatKey = tuple[int, int, int, int]
 
 
-def _copy_ignore(_directory: str, names: list[str]) -> set[str]:
-    return {name for name in names if name in IGNORED_NAMES or name in IGNORED_FILES}
+def _stat_key(st: os.stat_result) -> StatKey:
+    return (int(st.st_size), int(st.st_mtime_ns), int(st.st_ctime_ns), int(st.st_ino))
 
 
-def _snapshot_workspace(workspace: Path) -> dict[str, str]:
-    snapshot: dict[str, str] = {}
-    for path in sorted(workspace.rglob("*")):
-        relative = path.relative_to(workspace)
-        if _ignored_relative_path(relative) or path.is_dir():
-            continue
+def _stored_stat_key(value: Any) -> StatKey:
+    if not isinstance(value, list) or len(value) != 4:
+        raise ValueError("stored stat key must be a list of four integers")
+    size, mtime_ns, ctime_ns, inode = value
+    if not all(type(item) is int for item in value):
+        raise ValueError("stored stat key must be a list of four integers")
+    return (size, mtime_ns, ctime_ns, inode)
 
-        digest = hashlib.sha256()
-        if path.is_symlink():
-            digest.update(os.readlink(path).encode("utf-8", errors="replace"))
-        else:
-            digest.update(path.read_bytes())
-        snapshot[relative.as_posix()] = digest.hexdigest()
-    return snapshot
+
+def _stat_is_settled(st: os.stat_result, *, horizon_ns: int) -> bool:
+    return max(int(st.st_mtime_ns), int(st.st_ctime_ns)) < horizon_ns
+
+
+def _walk_tree(root: Path) -> Iterator[tuple[str, os.stat_result]]:
+    """Yield ``(relative_posix, lstat)`` for every non-ignored entry under ``root``."""
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.name in IGNORED_NAMES or entry.name in IGNORED_FILES:
+                continue
+            relative = f"{prefix}{entry.name}"
+            st = entry.stat(follow_symlinks=False)
+            yield relative, st
+            if stat.S_ISDIR(st.st_mode):
+                stack.append((Path(entry.path), f"{relative}/"))
+
+
+def _hash_entry(path: Path, st: os.stat_result) -> str:
+    digest = hashlib.sha256()
+    if stat.S_ISLNK(st.st_mode):
+        digest.update(os.readlink(path).encode("utf-8", errors="replace"))
+    else:
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _WorkspaceSnapshotter:
+    """Content snapshots of a workspace that only rehash files whose metadata changed.
+
+    A digest is reused when the file's ``(size, mtime_ns, ctime_ns, inode)`` matches
+    the previous snapshot and the file had settled outside the racy window at that
+    time; every other file is hashed.
+    """
+
+    def __init__(self, hashes: Mapping[str, tuple[StatKey, str]] | None = None) -> None:
+        self._hashes: dict[str, tuple[StatKey, str]] = dict(hashes or {})
+        self.files_hashed = 0
+        self.files_reused = 0
+
+    @property
+    def hashes(self) -> dict[str, tuple[StatKey, str]]:
+        return dict(self._hashes)
+
+    def snapshot(self, workspace: Path) -> dict[str, str]:
+        horizon_ns = time.time_ns() - STAT_RACY_WINDOW_NS
+        snapshot: dict[str, str] = {}
+        settled: dict[str, tuple[StatKey, str]] = {}
+        for relative, st in _walk_tree(workspace):
+            if stat.S_ISDIR(st.st_mode):
+                continue
+            key = _stat_key(st)
+            cached = self._hashes.get(relative)
+            if cached is not None and cached[0] == key:
+                digest = cached[1]
+                self.files_reused += 1
+            else:
+                digest = _hash_entry(workspace / relative, st)
+                self.files_hashed += 1
+            if _stat_is_settled(st, horizon_ns=horizon_ns):
+                settled[relative] = (key, digest)
+            snapshot[relative] = digest
+        self._hashes = settled
+        return dict(sorted(snapshot.items()))
 
 
 def _snapshot_reserved_evidence(workspace: Path) -> dict[str, str]:
@@ -218,16 +295,130 @@ def _run_setup_command(
         raise RuntimeError(f"isolated workspace setup failed: {message}")
 
 
-def _prepare_isolated_workspace(source_root: Path, workspace: Path) -> None:
-    shutil.copytree(
-        source_root,
-        workspace,
-        symlinks=True,
-        ignore=_copy_ignore,
-    )
+def _clone_file(source: Path, destination: Path) -> None:
+    """Copy ``source`` with a copy-on-write reflink where the filesystem allows it."""
+    try:
+        import fcntl
+
+        with source.open("rb") as src, destination.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except (ImportError, OSError):
+        shutil.copyfile(source, destination, follow_symlinks=False)
+    shutil.copystat(source, destination, follow_symlinks=False)
 
+
+def _remove_entry(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _sync_workspace(
+    source_root: Path,
+    workspace: Path,
+    synced: Mapping[str, tuple[StatKey, StatKey]],
+) -> tuple[dict[str, tuple[StatKey, StatKey]], int, int]:
+    """Make ``workspace`` match ``source_root`` without recopying unchanged files.
+
+    ``synced`` maps a relative path to the ``(source, workspace)`` stat keys recorded
+    by the previous sync. A file is reused only when both keys still match; the
+    copy keeps the source mtime, so any write inside the workspace changes its key.
+    Ignored names (tool caches, ``build`` and so on) are removed from the workspace,
+    including its ``.git`` directory: a proof could have left hooks, config or
+    ``info/exclude`` entries there that the next baseline commit would honour.
+    """
+    horizon_ns = time.time_ns() - STAT_RACY_WINDOW_NS
+    source_entries = dict(_walk_tree(source_root))
+    workspace.mkdir(parents=True, exist_ok=True)
+
+    stack = [workspace]
+    while stack:
+        directory = stack.pop()
+        for entry in os.scandir(directory):
+            path = Path(entry.path)
+            if entry.name in IGNORED_NAMES or entry.name in IGNORED_FILES:
+                _remove_entry(path)
+                continue
+            relative = path.relative_to(workspace).as_posix()
+            source_st = source_entries.get(relative)
+            kind = stat.S_IFMT(entry.stat(follow_symlinks=False).st_mode)
+            if source_st is None or stat.S_IFMT(source_st.st_mode) != kind:
+                _remove_entry(path)
+            elif stat.S_ISDIR(kind):
+                stack.append(path)
+
+    records: dict[str, tuple[StatKey, StatKey]] = {}
+    copied = 0
+    reused = 0
+    for relative, source_st in sorted(source_entries.items()):
+        source = source_root / relative
+        target = workspace / relative
+        if stat.S_ISDIR(source_st.st_mode):
+            target.mkdir(exist_ok=True)
+            continue
+        if stat.S_ISLNK(source_st.st_mode):
+            link = os.readlink(source)
+            if not target.is_symlink() or os.readlink(target) != link:
+                _remove_entry(target)
+                os.symlink(link, target)
+                copied += 1
+            else:
+                reused += 1
+            continue
+
+        source_key = _stat_key(source_st)
+        try:
+            target_key: StatKey | None = _stat_key(target.lstat())
+        except FileNotFoundError:
+            target_key = None
+        if target_key is not None and synced.get(relative) == (source_key, target_key):
+            reused += 1
+        else:
+            _remove_entry(target)
+            _clone_file(source, target)
+            target_key = _stat_key(target.lstat())
+            copied += 1
+        if _stat_is_settled(source_st, horizon_ns=horizon_ns):
+            records[relative] = (source_key, target_key)
+    return records, copied, reused
+
+
+def _commit_workspace_baseline(workspace: Path, store: Path | None = None) -> None:
+    """Create a fresh single-commit git repository for ``workspace``.
+
+    With ``store``, a bare repository kept outside the workspace, objects are written
+    there and the workspace repository reads them through ``objects/info/alternates``.
+    The index saved in the store after the previous baseline lets ``git add`` skip
+    files whose stat is unchanged, so only changed blobs are hashed and written and a
+    proof's own ``.git`` writes never reach the next baseline.
+    """
     environment = _execution_environment()
     _run_setup_command(["git", "init", "--quiet"], cwd=workspace, environment=environment)
+    git_dir = workspace / ".git"
+    saved_index: Path | None = None
+    if store is not None:
+        if not (store / "objects").is_dir():
+            shutil.rmtree(store, ignore_errors=True)
+            _run_setup_command(
+                ["git", "init", "--bare", "--quiet", str(store)],
+                cwd=workspace,
+                environment=environment,
+            )
+        objects = (store / "objects").resolve()
+        alternates = git_dir / "objects" / "info" / "alternates"
+        alternates.parent.mkdir(parents=True, exist_ok=True)
+        alternates.write_text(f"{objects}\n", encoding="utf-8")
+        saved_index = store / _BASELINE_INDEX
+        if saved_index.is_file():
+            shutil.copyfile(saved_index, git_dir / "index")
+        # A fixed date keeps an unchanged tree's baseline commit object identical.
+        environment = {
+            **environment,
+            "GIT_OBJECT_DIRECTORY": str(objects),
+            "GIT_AUTHOR_DATE": _BASELINE_DATE,
+            "GIT_COMMITTER_DATE": _BASELINE_DATE,
+        }
     _run_setup_command(["git", "add", "-A"], cwd=workspace, environment=environment)
     _run_setup_command(
         [
@@ -236,15 +427,169 @@ def _prepare_isolated_workspace(source_root: Path, workspace: Path) -> None:
             "user.name=SDETKit Proof Runner",
             "-c",
             "user.email=proof-runner@invalid.local",
+            "-c",
+            "core.logAllRefUpdates=false",
             "commit",
             "--quiet",
             "--no-verify",
+            "--allow-empty",
             "-m",
             "isolated proof baseline",
         ],
         cwd=workspace,
         environment=environment,
     )
+    if saved_index is not None and (git_dir / "index").is_file():
+        temporary = saved_index.with_name(saved_index.name + ".tmp")
+        shutil.copyfile(git_dir / "index", temporary)
+        os.replace(temporary, saved_index)
+
+
+def _prepare_isolated_workspace(source_root: Path, workspace: Path) -> None:
+    _sync_workspace(source_root, workspace, {})
+    _commit_workspace_baseline(workspace)
+
+
+@dataclass
+class IsolatedWorkspace:
+    path: Path
+    snapshotter: _WorkspaceSnapshotter
+    pooled: bool = False
+
+
+class IsolatedWorkspacePool:
+    """Pre-warmed proof workspaces under ``root`` that are reset between proofs.
+
+    Each source root gets ``size`` slots. A slot is held under an exclusive file lock
+    while a proof runs. On acquire it is resynced with the source tree, copying only
+    files whose stat metadata changed since the last sync, and the slot's git
+    repository is recreated with a single fresh baseline commit, so nothing a proof
+    wrote under ``.git`` survives into the next one. The baseline's objects live in
+    the slot's ``objects.git`` store outside the workspace, so a new baseline only
+    writes blobs that changed. Stat keys and content digests persist in the slot's
+    ``state.json`` so warm proofs only hash what moved.
+    """
+
+    def __init__(self, root: Path, *, size: int = DEFAULT_WORKSPACE_POOL_SIZE) -> None:
+        if size < 1:
+            raise ValueError("workspace pool size must be at least 1")
+        self.root = root
+        self.size = size
+        self._stats = {"acquired": 0, "files_copied": 0, "files_reused": 0}
+
+    def stats(self) -> dict[str, int]:
+        return dict(self._stats)
+
+    def _slots(self, source_root: Path) -> list[Path]:
+        key = hashlib.sha256(str(source_root).encode("utf-8")).hexdigest()[:16]
+        return [self.root / key / f"slot-{index}" for index in range(self.size)]
+
+    @staticmethod
+    def _try_lock(fd: int, *, blocking: bool) -> bool:
+        try:
+            import fcntl
+        except ImportError:  # pragma: no cover - Windows
+            import msvcrt
+
+            mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+            try:
+                msvcrt.locking(fd, mode, 1)
+            except OSError:
+                return False
+            return True
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(fd, flags)
+        except BlockingIOError:
+            return False
+        return True
+
+    @contextlib.contextmanager
+    def _lock_slot(self, source_root: Path) -> Iterator[Path]:
+        slots = self._slots(source_root)
+        for slot in slots:
+            slot.mkdir(parents=True, exist_ok=True)
+        for attempt, slot in enumerate([*slots, slots[os.getpid() % len(slots)]]):
+            fd = os.open(slot / "lock", os.O_RDWR | os.O_CREAT, 0o644)
+            if self._try_lock(fd, blocking=attempt == len(slots)):
+                try:
+                    yield slot
+                finally:
+                    os.close(fd)
+                return
+            os.close(fd)
+        raise RuntimeError(f"could not lock an isolated workspace pool slot for {source_root}")
+
+    @staticmethod
+    def _load_state(
+        path: Path, source_root: Path
+    ) -> tuple[dict[str, tuple[StatKey, StatKey]], dict[str, tuple[StatKey, str]]]:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}, {}
+        if (
+            not isinstance(payload, dict)
+            or payload.get("schema") != _WORKSPACE_STATE_SCHEMA
+            or payload.get("source_root") != str(source_root)
+        ):
+            return {}, {}
+        try:
+            synced = {
+                relative: (_stored_stat_key(keys[0]), _stored_stat_key(keys[1]))
+                for relative, keys in _as_dict(payload.get("synced")).items()
+            }
+            hashes = {
+                relative: (_stored_stat_key(entry[0]), str(entry[1]))
+                for relative, entry in _as_dict(payload.get("hashes")).items()
+            }
+        except (IndexError, KeyError, TypeError, ValueError):
+            return {}, {}
+        return synced, hashes
+
+    @staticmethod
+    def _store_state(
+        path: Path,
+        source_root: Path,
+        synced: Mapping[str, tuple[StatKey, StatKey]],
+        hashes: Mapping[str, tuple[StatKey, str]],
+    ) -> None:
+        payload = {
+            "schema": _WORKSPACE_STATE_SCHEMA,
+            "source_root": str(source_root),
+            "synced": {relative: [list(a), list(b)] for relative, (a, b) in synced.items()},
+            "hashes": {relative: [list(key), digest] for relative, (key, digest) in hashes.items()},
+        }
+        temporary = path.with_name(path.name + ".tmp")
+        temporary.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(temporary, path)
+
+    @contextlib.contextmanager
+    def acquire(self, source_root: Path) -> Iterator[IsolatedWorkspace]:
+        source_root = source_root.resolve()
+        with self._lock_slot(source_root) as slot:
+            state_path = slot / "state.json"
+            synced, hashes = self._load_state(state_path, source_root)
+            # Drop the state before touching the workspace so an interrupted proof
+            # can never leave stale stat keys that vouch for a half-reset tree.
+            state_path.unlink(missing_ok=True)
+            workspace = slot / "workspace"
+            synced, copied, reused = _sync_workspace(source_root, workspace, synced)
+            _commit_workspace_baseline(workspace, slot / "objects.git")
+            self._stats["acquired"] += 1
+            self._stats["files_copied"] += copied
+            self._stats["files_reused"] += reused
+            snapshotter = _WorkspaceSnapshotter(hashes)
+            yield IsolatedWorkspace(path=workspace, snapshotter=snapshotter, pooled=True)
+            self._store_state(state_path, source_root, synced, snapshotter.hashes)
+
+
+@contextlib.contextmanager
+def _temporary_workspace(source_root: Path) -> Iterator[IsolatedWorkspace]:
+    with tempfile.TemporaryDirectory(prefix="sdetkit-proof-") as temp_dir:
+        workspace = Path(temp_dir) / "workspace"
+        _prepare_isolated_workspace(source_root, workspace)
+        yield IsolatedWorkspace(path=workspace, snapshotter=_WorkspaceSnapshotter())
 
 
 def _profile_result(
@@ -254,8 +599,12 @@ def _profile_result(
     timeout_seconds: int,
     expected_changed_files: list[str],
     network_boundary: Mapping[str, Any],
+    snapshotter: _WorkspaceSnapshotter | None = None,
+    before: Mapping[str, str] | None = None,
 ) -> JsonObject:
-    before = _snapshot_workspace(workspace)
+    snapshotter = snapshotter or _WorkspaceSnapshotter()
+    if before is None:
+        before = snapshotter.snapshot(workspace)
     reserved_before = _snapshot_reserved_evidence(workspace)
     profile_argv = [sys.executable, *profile.argv_suffix]
     network_required = network_boundary.get(NETWORK_ISOLATION_REQUIRED) is True
@@ -287,7 +636,7 @@ def _profile_result(
         stdout = _capture_text(exc.stdout)
         stderr = _capture_text(exc.stderr)
 
-    after = _snapshot_workspace(workspace)
+    after = snapshotter.snapshot(workspace)
     reserved_after = _snapshot_reserved_evidence(workspace)
     mutated_files = _changed_paths(before, after)
     reserved_shadowed_files = _changed_paths(reserved_before, reserved_after)
@@ -323,6 +672,7 @@ def _profile_result(
         "runtime_guard": runtime_guard,
         "stdout": stdout,
         "stderr": stderr,
+        "_workspace_snapshot": after,
     }
 
 
@@ -337,6 +687,7 @@ def run_isolated_proof(
     head_ref: str = "HEAD",
     require_network_isolation: bool = False,
     blocked_network_probe_report: Mapping[str, Any] | None = None,
+    workspace_pool: IsolatedWorkspacePool | None = None,
 ) -> JsonObject:
     if timeout_seconds < 1:
         raise ValueError("timeout_seconds must be at least 1")
@@ -399,20 +750,27 @@ def run_isolated_proof(
     results: list[JsonObject] = []
 
     if proof_execution_allowed:
-        with tempfile.TemporaryDirectory(prefix="sdetkit-proof-") as temp_dir:
-            workspace = Path(temp_dir) / "workspace"
-            _prepare_isolated_workspace(source_root, workspace)
-
+        provider = (
+            workspace_pool.acquire(source_root)
+            if workspace_pool is not None
+            else _temporary_workspace(source_root)
+        )
+        with provider as workspace:
+            # Nothing runs between two profiles, so one profile's after-snapshot is
+            # the next profile's before-snapshot.
+            previous: Mapping[str, str] | None = None
             for profile_id in requested_profiles:
-                results.append(
-                    _profile_result(
-                        profile=PROOF_PROFILES[profile_id],
-                        workspace=workspace,
-                        timeout_seconds=timeout_seconds,
-                        expected_changed_files=effective_changed_files,
-                        network_boundary=network_boundary,
-                    )
+                result = _profile_result(
+                    profile=PROOF_PROFILES[profile_id],
+                    workspace=workspace.path,
+                    timeout_seconds=timeout_seconds,
+                    expected_changed_files=effective_changed_files,
+                    network_boundary=network_boundary,
+                    snapshotter=workspace.snapshotter,
+                    before=previous,
                 )
+                previous = result.pop("_workspace_snapshot")
+                results.append(result)
 
     guard_status_counts: dict[str, int] = {}
     runtime_guard_violation_count = 0
@@ -503,7 +861,11 @@ def run_isolated_proof(
             "failed_count": failed_count,
         },
         "isolation": {
-            "mode": "temporary_workspace_copy",
+            "mode": (
+                "pooled_workspace_copy"
+                if workspace_pool is not None
+                else "temporary_workspace_copy"
+            ),
             "shell_enabled": False,
             "allowlisted_profiles_only": True,
             "timeout_seconds": timeout_seconds,
@@ -665,6 +1027,13 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--timeout-seconds", type=int, default=DEFAULT_TIMEOUT_SECONDS)
     parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR)
     parser.add_argument("--format", choices=["text", "json"], default="text")
+    parser.add_argument(
+        "--workspace-pool",
+        type=Path,
+        default=None,
+        help="Reuse pre-warmed proof workspaces under this directory instead of a fresh copy.",
+    )
+    parser.add_argument("--workspace-pool-size", type=int, default=DEFAULT_WORKSPACE_POOL_SIZE)
     return parser
 
 
@@ -681,6 +1050,11 @@ def main(argv: list[str] | None = None) -> int:
             base_ref=args.base_ref,
             head_ref=args.head_ref,
             require_network_isolation=args.require_network_isolation,
+            workspace_pool=(
+                IsolatedWorkspacePool(args.workspace_pool, size=args.workspace_pool_size)
+                if args.workspace_pool is not None
+                else None
+            ),
         )
         artifacts = write_evidence(evidence, out_dir=args.out_dir)
     except (OSError, RuntimeError, ValueError, subprocess.SubprocessError) as exc:
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import json
 import sys
 from importlib import metadata
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Protocol
 
+from .notify_dispatch import NotifyDispatcher, NotifySpool, flush_spool
 from .notify_plugins import StdoutAdapter, TelegramAdapter, WhatsAppAdapter
+from .optional_httpx import load_httpx
 from .plugin_system import discover
 
+httpx = load_httpx(feature="sdetkit notify")
+
 
 def _entrypoint_adapters() -> dict[str, NotifyAdapter]:
     out: dict[str, NotifyAdapter] = {}
@@ -61,9 +67,64 @@ def _build_parser() -> argparse.ArgumentParser:
         "--timeout", type=float, default=10.0, help="Network timeout for live adapter sends"
     )
     p.add_argument("--list", action="store_true", help="List discovered adapters")
+    p.add_argument(
+        "--messages-file",
+        default=None,
+        help="Send each line of FILE, coalesced into as few messages as possible",
+    )
+    p.add_argument(
+        "--spool", default=None, help="Directory where undelivered messages are kept for retry"
+    )
+    p.add_argument(
+        "--flush-spool", action="store_true", help="Resend messages kept in the --spool directory"
+    )
+    p.add_argument(
+        "--concurrency", type=int, default=4, help="Maximum concurrent sends for batched delivery"
+    )
     return p
 
 
+async def _dispatch_async(adapter: Any, ns: argparse.Namespace) -> dict[str, Any] | None:
+    spool = NotifySpool(Path(ns.spool)) if ns.spool else None
+    async with httpx.AsyncClient(timeout=ns.timeout) as client:
+        sender = adapter.async_sender(client)
+        if sender is None:
+            return None
+        senders = {str(adapter.name): sender}
+        if ns.flush_spool:
+            assert spool is not None
+            return await flush_spool(spool, senders, concurrency=ns.concurrency)
+        lines = Path(ns.messages_file).read_text(encoding="utf-8").splitlines()
+        async with NotifyDispatcher(
+            senders, window_seconds=0.0, concurrency=ns.concurrency, spool=spool
+        ) as dispatcher:
+            for line in lines:
+                if line.strip():
+                    await dispatcher.submit(adapter.channel(), line)
+        return dispatcher.report()
+
+
+def _dispatch(adapter: NotifyAdapter, ns: argparse.Namespace) -> int:
+    if not callable(getattr(adapter, "async_sender", None)):
+        sys.stdout.write(f"Adapter '{ns.adapter}' does not support batched delivery.\n")
+        return 2
+    if ns.flush_spool and not ns.spool:
+        sys.stdout.write("--flush-spool requires --spool DIR.\n")
+        return 2
+    if ns.concurrency < 1:
+        sys.stdout.write("--concurrency must be >= 1.\n")
+        return 2
+    if not ns.real_send:
+        sys.stdout.write("batched delivery sends live messages; add --real-send.\n")
+        return 2
+    report = asyncio.run(_dispatch_async(adapter, ns))
+    if report is None:
+        sys.stdout.write(f"{ns.adapter} adapter not configured for live sends.\n")
+        return 2
+    sys.stdout.write(json.dumps(report, sort_keys=True) + "\n")
+    return 0 if report["failed"] == 0 else 2
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = _build_parser()
     ns = parser.parse_args(argv)
@@ -86,4 +147,7 @@ def main(argv: list[str] | None = None) -> int:
         sys.stdout.write(f"[dry-run] adapter={ns.adapter} message={ns.message}\n")
         return 0
 
+    if ns.flush_spool or ns.messages_file:
+        return _dispatch(adapter, ns)
+
     return int(adapter.send(ns))
@@ -4,8 +4,16 @@ import argparse
 import json
 import os
 import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib import parse, request
 
+from .notify_dispatch import ChannelSender, NotifySpool, SpooledMessage, telegram_sender
+
+if TYPE_CHECKING:
+    import httpx
+
 
 class StdoutAdapter:
     name = "stdout"
@@ -33,9 +41,27 @@ def _post_form_json(url: str, data: dict[str, str], *, timeout: float) -> dict[s
     return payload
 
 
+def _spool_failed(args: argparse.Namespace, channel: str, message: str, error: str) -> None:
+    spool_dir = getattr(args, "spool", None)
+    if not spool_dir:
+        return
+    NotifySpool(Path(spool_dir)).append([SpooledMessage(channel, message, 1, error, time.time())])
+    sys.stdout.write(f"message spooled to {spool_dir} for a later --flush-spool.\n")
+
+
 class TelegramAdapter:
     name = "telegram"
 
+    def channel(self) -> str | None:
+        chat_id = os.environ.get("SDETKIT_TELEGRAM_CHAT_ID")
+        return f"{self.name}:{chat_id}" if chat_id else None
+
+    def async_sender(self, client: httpx.AsyncClient) -> ChannelSender | None:
+        token = os.environ.get("SDETKIT_TELEGRAM_TOKEN")
+        if not token or not self.channel():
+            return None
+        return telegram_sender(token, client=client)
+
     def send(self, args: argparse.Namespace) -> int:
         token = os.environ.get("SDETKIT_TELEGRAM_TOKEN")
         chat_id = os.environ.get("SDETKIT_TELEGRAM_CHAT_ID")
@@ -68,6 +94,7 @@ class TelegramAdapter:
             )
         except Exception as exc:
             sys.stdout.write(f"telegram send failed: {type(exc).__name__}: {exc}\n")
+            _spool_failed(args, f"{self.name}:{chat_id}", message, f"{type(exc).__name__}: {exc}")
             return 2
 
         if payload.get("ok") is True:
@@ -76,6 +103,7 @@ class TelegramAdapter:
 
         description = payload.get("description", "unknown telegram error")
         sys.stdout.write(f"telegram send failed: {description}\n")
+        _spool_failed(args, f"{self.name}:{chat_id}", message, str(description))
         return 2
 
 
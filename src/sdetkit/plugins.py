@@ -186,6 +186,26 @@ TEMPLATE_REPO_AUDIT_WORKFLOW = (
 )
 
 
+def _repo_files(repo_root: Path, exec_ctx: Any) -> tuple[str, ...]:
+    if exec_ctx is not None and hasattr(exec_ctx, "iter_files"):
+        return tuple(exec_ctx.iter_files())
+    out: list[str] = []
+    for path in sorted(repo_root.rglob("*"), key=lambda p: p.as_posix()):
+        if not path.is_file():
+            continue
+        rel = path.relative_to(repo_root).as_posix()
+        if rel.startswith(".git/"):
+            continue
+        out.append(rel)
+    return tuple(out)
+
+
+def _repo_read_text(repo_root: Path, rel: str, exec_ctx: Any) -> str:
+    if exec_ctx is not None and hasattr(exec_ctx, "read_text"):
+        return str(exec_ctx.read_text(rel, encoding="utf-8", errors="ignore"))
+    return (repo_root / rel).read_text(encoding="utf-8", errors="ignore")
+
+
 @dataclass(frozen=True)
 class _MissingFileRule:
     meta: RuleMeta
@@ -223,16 +243,10 @@ class _SecuritySecretsRule:
         allow_fixture_prefixes = ("tests/fixtures/", "test/fixtures/")
         key_names = {"id_rsa", "id_dsa"}
         key_suffixes = (".pem", ".key")
-        for path in sorted(repo_root.rglob("*"), key=lambda p: p.as_posix()):
-            if not path.is_file():
-                continue
-            rel = path.relative_to(repo_root).as_posix()
-            if rel.startswith(".git/"):
-                continue
+        for rel in _repo_files(repo_root, exec_ctx):
             if exec_ctx is not None and hasattr(exec_ctx, "track_file"):
                 exec_ctx.track_file(rel)
-            name = path.name
-            lower = name.lower()
+            lower = rel.rsplit("/", 1)[-1].lower()
             is_fixture = any(rel.startswith(prefix) for prefix in allow_fixture_prefixes)
 
             env_like = (
@@ -287,15 +301,12 @@ class _SecurityFixtureAllowlistRule:
         allow_fixture_prefixes = ("tests/fixtures/", "test/fixtures/")
         key_names = {"id_rsa", "id_dsa"}
         key_suffixes = (".pem", ".key")
-        for path in sorted(repo_root.rglob("*"), key=lambda p: p.as_posix()):
-            if not path.is_file():
-                continue
-            rel = path.relative_to(repo_root).as_posix()
+        for rel in _repo_files(repo_root, exec_ctx):
             if exec_ctx is not None and hasattr(exec_ctx, "track_file"):
                 exec_ctx.track_file(rel)
             if not any(rel.startswith(prefix) for prefix in allow_fixture_prefixes):
                 continue
-            lower = path.name.lower()
+            lower = rel.rsplit("/", 1)[-1].lower()
             if lower in key_names or lower.endswith(key_suffixes):
                 findings.append(
                     Finding(
@@ -360,7 +371,7 @@ class _SecurityWorkflowRule:
             rel = wf.relative_to(repo_root).as_posix()
             if exec_ctx is not None and hasattr(exec_ctx, "track_file"):
                 exec_ctx.track_file(rel)
-            lines = wf.read_text(encoding="utf-8", errors="ignore").splitlines()
+            lines = _repo_read_text(repo_root, rel, exec_ctx).splitlines()
             saw_permissions = False
             for idx, raw in enumerate(lines, start=1):
                 stripped = raw.strip()
@@ -416,7 +427,9 @@ class _SecurityPythonHygieneRule:
         if exec_ctx is not None and hasattr(exec_ctx, "track_file"):
             exec_ctx.track_file("pyproject.toml")
         has_pyproject = (repo_root / "pyproject.toml").exists()
-        has_python = has_pyproject or any(repo_root.rglob("*.py"))
+        has_python = has_pyproject or any(
+            rel.endswith(".py") for rel in _repo_files(repo_root, exec_ctx)
+        )
         if self.meta.id == "SEC_PY_DEPENDENCY_FILES_MISSING":
             req_candidates = [
                 p.relative_to(repo_root).as_posix()
@@ -467,7 +480,7 @@ class _SecurityPythonHygieneRule:
                 or (repo_root / "bandit.yml").exists()
             )
             if not has_bandit and has_pyproject:
-                text = (repo_root / "pyproject.toml").read_text(encoding="utf-8", errors="ignore")
+                text = _repo_read_text(repo_root, "pyproject.toml", exec_ctx)
                 has_bandit = "[tool.bandit" in text
             if not has_python or has_bandit:
                 return []
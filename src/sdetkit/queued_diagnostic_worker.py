@@ -19,7 +19,7 @@ from sdetkit.diagnostic_worker_trajectory import (
 from sdetkit.diagnostic_worker_trajectory import (
     write_artifacts as write_worker_trajectory_artifacts,
 )
-from sdetkit.job_queue import claim_job, complete_job, fail_job
+from sdetkit.job_queue import JournaledJobQueue, claim_job, complete_job, fail_job
 from sdetkit.patch_scorer import SCHEMA_VERSION as PATCH_SCORE_SCHEMA_VERSION
 from sdetkit.safety_gate import SCHEMA_VERSION as SAFETY_GATE_SCHEMA_VERSION
 
@@ -308,6 +308,8 @@ def run_queued_diagnostic_job(
     out_root: Path,
     input_root: Path = Path("."),
     job_id: str = "",
+    journaled: bool = False,
+    queue: JournaledJobQueue | None = None,
 ) -> JsonObject:
     if not _string(claimed_at):
         raise ValueError("queued diagnostic worker requires claimed_at")
@@ -315,11 +317,32 @@ def run_queued_diagnostic_job(
     if not _string(finished_at):
         raise ValueError("queued diagnostic worker requires finished_at")
 
-    claimed = claim_job(
-        queue_path,
-        claimed_at=claimed_at,
-        job_id=job_id,
-    )
+    if queue is not None and queue.path != queue_path:
+        raise ValueError("queued diagnostic worker queue does not match queue_path")
+
+    # Journaled transitions append to the queue journal; the caller compacts it.
+    # Callers running many jobs pass one long-lived ``queue`` so each claim only
+    # replays the journal lines written since its previous sync.
+    journal = queue if queue is not None else JournaledJobQueue(queue_path) if journaled else None
+
+    def _complete(job_id: str, **kwargs: Any) -> JsonObject:
+        if journal is not None:
+            return journal.complete(job_id, **kwargs)
+        return complete_job(queue_path, job_id, **kwargs)
+
+    def _fail(job_id: str, **kwargs: Any) -> JsonObject:
+        if journal is not None:
+            return journal.fail(job_id, **kwargs)
+        return fail_job(queue_path, job_id, **kwargs)
+
+    if journal is not None:
+        claimed = journal.claim(claimed_at=claimed_at, job_id=job_id)
+    else:
+        claimed = claim_job(
+            queue_path,
+            claimed_at=claimed_at,
+            job_id=job_id,
+        )
 
     claimed_job_id = _string(claimed.get("job_id"))
     job = _as_dict(claimed.get("job"))
@@ -357,8 +380,7 @@ def run_queued_diagnostic_job(
             out_dir=out_dir,
         )
 
-        completed = complete_job(
-            queue_path,
+        completed = _complete(
             claimed_job_id,
             result_artifacts=_result_artifacts(
                 worker_result,
@@ -370,8 +392,7 @@ def run_queued_diagnostic_job(
 
     except Exception as exc:
         try:
-            fail_job(
-                queue_path,
+            _fail(
                 claimed_job_id,
                 reason=f"{type(exc).__name__}: {exc}",
                 failed_at=finished_at,
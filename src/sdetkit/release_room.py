@@ -5,7 +5,7 @@ import json
 import subprocess
 from pathlib import Path
 
-from .adaptive_memory import _history_payload, explain_path, init_db
+from .adaptive_memory import explain_path, history_payload, init_db
 from .boost import build_scan
 from .index import inspect_index
 from .intelligence.review import run_review
@@ -73,7 +73,7 @@ def build_plan(
         return {"rc": rc, "operator": payload.get("operator_summary", {})}
 
     review = _call("review", _review_payload)
-    mem_hist = _call("memory_history", lambda: _history_payload(Path(db)))
+    mem_hist = _call("memory_history", lambda: history_payload(Path(db)))
     mem_exp = _call("memory_explain", lambda: explain_path(Path(db), "."))
     repo = _call("repo_check", lambda: run_checks(resolved))
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import ast
+import collections
 import concurrent.futures
 import datetime as dt
 import difflib
@@ -16,6 +17,7 @@ import re
 import subprocess
 import sys
 import tempfile
+import threading
 import urllib.error
 import urllib.parse
 import urllib.request
@@ -74,6 +76,8 @@ SKIP_FILES: frozenset[str] = frozenset({".coverage"})
 INVENTORY_STRICT_MAX_FILES_DEFAULT = 5000
 INVENTORY_STRICT_MAX_FILES_ENV = "SDETKIT_INVENTORY_STRICT_MAX_FILES"
 
+REPO_CONTENT_CACHE_MAX_BYTES_DEFAULT = 64 * 1024 * 1024
+
 BIDI_HIDDEN_CODEPOINTS: frozenset[str] = frozenset(
     {
         "\u200b",  # zero width space
@@ -417,10 +421,19 @@ def _inventory_for_root(repo_root: Path) -> list[FileInfo]:
 
 
 class _FileInventoryCache:
-    def __init__(self, root: Path, *, strict_max_files: int | None = None) -> None:
+    def __init__(
+        self,
+        root: Path,
+        *,
+        strict_max_files: int | None = None,
+        tree_snapshot: _RepoTreeSnapshot | None = None,
+    ) -> None:
         self.root = root
         self.strict_max_files = strict_max_files
+        self.tree_snapshot = tree_snapshot
         self._stats: dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "invalidations": 0}
+        self._index_lock = threading.Lock()
+        self._path_indexes: dict[Path, dict[str, FileInfo]] = {}
 
     def stats(self) -> dict[str, int]:
         return dict(self._stats)
@@ -612,9 +625,24 @@ class _FileInventoryCache:
 
         inventory = _inventory_for_root(repo_root)
         inventory = sorted(inventory, key=lambda f: f.path)
+        with self._index_lock:
+            self._path_indexes.pop(repo_root, None)
         self.save(repo_root, inventory)
         return inventory
 
+    def _path_index(self, repo_root: Path) -> dict[str, FileInfo]:
+        with self._index_lock:
+            index = self._path_indexes.get(repo_root)
+            if index is not None:
+                return index
+        try:
+            files = self.get_inventory(repo_root)
+        except Exception:
+            files = []
+        index = {f.path: f for f in files}
+        with self._index_lock:
+            return self._path_indexes.setdefault(repo_root, index)
+
     def digest_for(self, repo_root: Path, rel: str | Path | None = None) -> str:
         if rel is None:
             files = self.get_inventory(repo_root)
@@ -626,28 +654,22 @@ class _FileInventoryCache:
 
         rel_s = str(rel).replace("\\", "/")
         if rel_s == "__repo_tree__":
+            snapshot = self.tree_snapshot
+            if snapshot is not None and snapshot.repo_root == repo_root:
+                return snapshot.signature()
             return _repo_audit_tree_sig(repo_root, self.root)
-        try:
-            files = self.get_inventory(repo_root)
-        except Exception:
-            files = []
-
-        mtime_ns = None
-        size = None
-        ctime_ns = None
-        for f in files:
-            fp = getattr(f, "path", None) or getattr(f, "rel_path", None)
-            if fp == rel_s:
-                mtime_ns = int(getattr(f, "mtime_ns", 0))
-                size = int(getattr(f, "size", 0))
-                ctime_ns = int(getattr(f, "ctime_ns", -1))
-                break
+        info = self._path_index(repo_root).get(rel_s)
 
         payload: dict[str, object]
-        if mtime_ns is None:
+        if info is None:
             payload = {"path": rel_s, "missing": True}
         else:
-            payload = {"path": rel_s, "mtime_ns": mtime_ns, "size": size, "ctime_ns": ctime_ns}
+            payload = {
+                "path": rel_s,
+                "mtime_ns": int(info.mtime_ns),
+                "size": int(info.size),
+                "ctime_ns": int(getattr(info, "ctime_ns", -1)),
+            }
 
         b = json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(",", ":")).encode(
             "utf-8"
@@ -655,12 +677,120 @@ class _FileInventoryCache:
         return hashlib.sha256(b).hexdigest()
 
 
+class _RepoFileIndex:
+    """Run-scoped file inventory and content cache shared by repo-audit rules.
+
+    The directory walk happens once (``.git`` is pruned before descending) and
+    file contents are read at most once while they fit in the byte budget, so
+    selecting more rules does not multiply disk I/O. Concurrent callers asking
+    for a file that is already being read wait for that read instead of
+    issuing their own.
+    """
+
+    def __init__(
+        self, root: Path, *, max_bytes: int = REPO_CONTENT_CACHE_MAX_BYTES_DEFAULT
+    ) -> None:
+        self.root = root
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._files: tuple[str, ...] | None = None
+        self._bytes: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+        self._inflight: dict[str, concurrent.futures.Future[bytes]] = {}
+        self._texts: dict[tuple[str, str, str], str] = {}
+        self._cached_bytes = 0
+        self._stats: dict[str, int] = {"walks": 0, "reads": 0, "hits": 0, "evictions": 0}
+
+    def files(self) -> tuple[str, ...]:
+        with self._lock:
+            if self._files is None:
+                self._files = self._walk()
+                self._stats["walks"] += 1
+            return self._files
+
+    def _walk(self) -> tuple[str, ...]:
+        out: list[str] = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            base = Path(dirpath)
+            if base == self.root:
+                dirnames[:] = [d for d in dirnames if d != ".git"]
+            for fname in filenames:
+                fp = base / fname
+                if fp.is_file():
+                    out.append(fp.relative_to(self.root).as_posix())
+        out.sort()
+        return tuple(out)
+
+    def read_bytes(self, rel: str) -> bytes:
+        with self._lock:
+            cached = self._bytes.get(rel)
+            if cached is not None:
+                self._bytes.move_to_end(rel)
+                self._stats["hits"] += 1
+                return cached
+            pending = self._inflight.get(rel)
+            if pending is not None:
+                self._stats["hits"] += 1
+            else:
+                reader: concurrent.futures.Future[bytes] = concurrent.futures.Future()
+                self._inflight[rel] = reader
+        if pending is not None:
+            # Another rule thread is reading this file; wait for its bytes.
+            return pending.result()
+        try:
+            data = (self.root / rel).read_bytes()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[rel]
+            reader.set_exception(exc)
+            raise
+        with self._lock:
+            del self._inflight[rel]
+            self._stats["reads"] += 1
+            if rel not in self._bytes and len(data) <= self.max_bytes:
+                self._bytes[rel] = data
+                self._cached_bytes += len(data)
+                while self._cached_bytes > self.max_bytes and self._bytes:
+                    evicted, blob = self._bytes.popitem(last=False)
+                    self._cached_bytes -= len(blob)
+                    self._stats["evictions"] += 1
+                    for text_key in [k for k in self._texts if k[0] == evicted]:
+                        del self._texts[text_key]
+        reader.set_result(data)
+        return data
+
+    def read_text(self, rel: str, *, encoding: str = "utf-8", errors: str = "strict") -> str:
+        key = (rel, encoding, errors)
+        with self._lock:
+            text = self._texts.get(key)
+            if text is not None:
+                self._bytes.move_to_end(rel)
+                self._stats["hits"] += 1
+                return text
+        text = self.read_bytes(rel).decode(encoding, errors)
+        with self._lock:
+            if rel in self._bytes:
+                self._texts[key] = text
+        return text
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            out = dict(self._stats)
+            out["cached_bytes"] = self._cached_bytes
+            return out
+
+
 class RepoRuleExecutionContext:
     def __init__(
-        self, root: Path, inventory: _FileInventoryCache, changed: set[str] | None = None
+        self,
+        root: Path,
+        inventory: _FileInventoryCache,
+        changed: set[str] | None = None,
+        *,
+        file_index: _RepoFileIndex | None = None,
     ) -> None:
         self._root = root
         self._inventory = inventory
+        self._files = file_index if file_index is not None else _RepoFileIndex(root)
         self._deps: set[str] = set()
         self.changed_files = set(changed or set())
 
@@ -672,11 +802,25 @@ class RepoRuleExecutionContext:
     def track_repo_tree(self) -> None:
         self._deps.add("__repo_tree__")
 
-    def read_text(self, path: str | Path, *, encoding: str = "utf-8") -> str:
+    def iter_files(self) -> tuple[str, ...]:
+        """Return every regular file outside ``.git/`` as sorted repo-relative paths."""
+        return self._files.files()
+
+    def read_bytes(self, path: str | Path) -> bytes:
         rel = Path(path).as_posix() if not isinstance(path, Path) else path.as_posix()
         self.track_file(rel)
         target = safe_path(self._root, rel, allow_absolute=False)
-        return target.read_text(encoding=encoding)
+        return self._files.read_bytes(target.relative_to(self._root.resolve()).as_posix())
+
+    def read_text(
+        self, path: str | Path, *, encoding: str = "utf-8", errors: str = "strict"
+    ) -> str:
+        rel = Path(path).as_posix() if not isinstance(path, Path) else path.as_posix()
+        self.track_file(rel)
+        target = safe_path(self._root, rel, allow_absolute=False)
+        return self._files.read_text(
+            target.relative_to(self._root.resolve()).as_posix(), encoding=encoding, errors=errors
+        )
 
     def dependency_manifest(self) -> dict[str, str | None]:
         manifest: dict[str, str | None] = {}
@@ -2278,6 +2422,35 @@ def _repo_audit_tree_sig(repo_root: Path, ignore_dir: Path | None = None) -> str
     return hashlib.sha256(b).hexdigest()
 
 
+class _RepoTreeSnapshot:
+    """Run-scoped memo of ``_repo_audit_tree_sig``.
+
+    The signature is computed lazily on first use and then shared by every rule
+    worker (including the ``jobs > 1`` thread pool), so one audit performs at most
+    one ``git ls-files`` + stat walk regardless of how many rules are selected.
+    """
+
+    def __init__(self, repo_root: Path, ignore_dir: Path | None = None) -> None:
+        self.repo_root = repo_root
+        self.ignore_dir = ignore_dir
+        self._lock = threading.Lock()
+        self._sig: str | None = None
+        self._stats: dict[str, int] = {"computed": 0, "reused": 0}
+
+    def signature(self) -> str:
+        with self._lock:
+            if self._sig is None:
+                self._sig = _repo_audit_tree_sig(self.repo_root, self.ignore_dir)
+                self._stats["computed"] += 1
+            else:
+                self._stats["reused"] += 1
+            return self._sig
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
 def _load_cached_rule(cache_dir: Path, key: str) -> dict[str, Any] | None:
     target = _rule_cache_file(cache_dir, key)
     if not target.exists():
@@ -2354,7 +2527,11 @@ def run_repo_audit(
 
     cache_enabled = not no_cache
     cache_root = root / cache_dir
-    inventory = _FileInventoryCache(cache_root, strict_max_files=inventory_strict_max_files)
+    tree_snapshot = _RepoTreeSnapshot(root, cache_root)
+    file_index = _RepoFileIndex(root)
+    inventory = _FileInventoryCache(
+        cache_root, strict_max_files=inventory_strict_max_files, tree_snapshot=tree_snapshot
+    )
     changed_tree = (
         _changed_tree(changed_files) if changed_only and incremental_used else changed_files
     )
@@ -2369,7 +2546,7 @@ def run_repo_audit(
         )
         if cache_strategy == "tree":
             key = hashlib.sha256(
-                (base_key + ":" + _repo_audit_tree_sig(root, cache_root)).encode("utf-8")
+                (base_key + ":" + tree_snapshot.signature()).encode("utf-8")
             ).hexdigest()
         elif cache_strategy == "deps":
             key = base_key
@@ -2417,7 +2594,7 @@ def run_repo_audit(
                 }
                 return rule_id, check, cached_findings, 1, 0
 
-        exec_ctx = RepoRuleExecutionContext(root, inventory, changed_files)
+        exec_ctx = RepoRuleExecutionContext(root, inventory, changed_files, file_index=file_index)
         context: dict[str, Any] = {
             "profile": profile,
             "packs": selected_packs,
@@ -2497,6 +2674,8 @@ def run_repo_audit(
         summary["cache"] = {
             "hits": {k: cache_hits[k] for k in sorted(cache_hits)},
             "misses": {k: cache_misses[k] for k in sorted(cache_misses)},
+            "tree_signature": tree_snapshot.stats(),
+            "files": file_index.stats(),
         }
     return {
         "schema_version": "1.1.0",
@@ -15,6 +15,7 @@ from pathlib import Path
 
 from ._toml import loads as toml_loads
 from .bools import coerce_bool
+from .pypi_metadata import DEFAULT_INDEX_URL, PyPIMetadataClient
 
 REQ_NAME_RE = re.compile(r"^\s*([A-Za-z0-9_.-]+)")
 PINNED_VERSION_RE = re.compile(r"==\s*([A-Za-z0-9_.!+-]+)")
@@ -305,18 +306,43 @@ def _latest_pypi_metadata(
     package: str,
     timeout_s: float,
     *,
+    client: PyPIMetadataClient,
+    etag: str | None,
+    etag_api: str = "simple",
     project_python_requires: str | None,
     include_prereleases: bool,
-) -> tuple[str, str | None, str | None, str | None, str]:
-    url = f"https://pypi.org/pypi/{package}/json"
-    request = urllib.request.Request(url, headers={"User-Agent": "sdetkit-upgrade-audit/2.1"})
-    with urllib.request.urlopen(request, timeout=timeout_s) as response:  # noqa: S310
-        payload = json.loads(response.read().decode("utf-8"))
+) -> tuple[tuple[str, str | None, str | None, str | None, str], str | None, str] | None:
+    """Release metadata for *package*, its ETag and the API that served it.
 
-    info = payload.get("info", {})
-    version = str(info.get("version") or "unknown")
-    release_date: str | None = None
+    None when *etag*, revalidated against the *etag_api* endpoint, is still current.
+    """
+    document = client.fetch(package, timeout_s=timeout_s, etag=etag, api=etag_api)
+    if document is None:
+        return None
+    metadata = _metadata_from_payload(
+        document.payload,
+        project_python_requires=project_python_requires,
+        include_prereleases=include_prereleases,
+    )
+    return metadata, document.etag, document.api
+
+
+def _metadata_from_payload(
+    payload: dict[str, object],
+    *,
+    project_python_requires: str | None,
+    include_prereleases: bool,
+) -> tuple[str, str | None, str | None, str | None, str]:
+    info = payload.get("info")
     releases = payload.get("releases", {})
+    if isinstance(info, dict) and info.get("version"):
+        version = str(info["version"])
+    elif isinstance(releases, dict):
+        version = _latest_final_release(releases)
+        payload = {**payload, "info": {"version": version}}
+    else:
+        version = "unknown"
+    release_date: str | None = None
     if isinstance(releases, dict):
         release_files = releases.get(version) or []
         if isinstance(release_files, list):
@@ -332,6 +358,24 @@ def _latest_pypi_metadata(
     return version, release_date, compatible_version, compatible_release_date, compatibility_status
 
 
+def _latest_final_release(releases: dict[object, object]) -> str:
+    """Newest non-prerelease with an unyanked file, matching PyPI's ``info.version``."""
+    available = [
+        str(version)
+        for version, files in releases.items()
+        if isinstance(files, list)
+        and any(
+            isinstance(item, dict) and not coerce_bool(item.get("yanked"), default=False)
+            for item in files
+        )
+    ]
+    final = [version for version in available if not _is_prerelease_version(version)]
+    candidates = final or available
+    if not candidates:
+        return "unknown"
+    return max(candidates, key=_version_key)
+
+
 def _load_cache(cache_path: Path) -> dict[str, dict[str, str | float | None]]:
     if not cache_path.exists():
         return {}
@@ -375,6 +419,26 @@ def _cache_entry_fresh(
     return age_s <= max(ttl_hours, 0) * 3600
 
 
+def _revalidation_etag(
+    entry: dict[str, str | float | None] | None,
+    *,
+    project_python_requires: str | None,
+    include_prereleases: bool,
+) -> tuple[str, str] | None:
+    """ETag and its API to revalidate *entry* with, when a 304 keeps its fields valid."""
+    if not entry:
+        return None
+    etag = entry.get("etag")
+    if not isinstance(etag, str) or not etag:
+        return None
+    if entry.get("include_prereleases") is not include_prereleases:
+        return None
+    if entry.get("python_requires") != project_python_requires:
+        return None
+    api = entry.get("etag_api")
+    return etag, api if api in {"simple", "json"} else "simple"
+
+
 def _metadata_from_cache(entry: dict[str, str | float | None], *, source: str) -> PackageMetadata:
     latest_version = entry.get("latest_version")
     release_date = entry.get("release_date")
@@ -404,6 +468,7 @@ def _metadata_from_cache(entry: dict[str, str | float | None], *, source: str) -
 def _fetch_package_metadata(
     package: str,
     *,
+    client: PyPIMetadataClient,
     timeout_s: float,
     cache: dict[str, dict[str, str | float | None]],
     cache_ttl_hours: float,
@@ -440,25 +505,46 @@ def _fetch_package_metadata(
             source="offline",
         )
 
+    validator = _revalidation_etag(
+        cached_entry,
+        project_python_requires=project_python_requires,
+        include_prereleases=include_prereleases,
+    )
+    etag, etag_api = validator if validator is not None else (None, "simple")
     try:
-        (
-            latest_version,
-            release_date,
-            compatible_version,
-            compatible_release_date,
-            compatibility_status,
-        ) = _latest_pypi_metadata(
+        fetched = _latest_pypi_metadata(
             package,
             timeout_s=timeout_s,
+            client=client,
+            etag=etag,
+            etag_api=etag_api,
             project_python_requires=project_python_requires,
             include_prereleases=include_prereleases,
         )
+        if fetched is None and cached_entry is not None:
+            cache[package] = {**cached_entry, "fetched_at": dt.datetime.now(DT_UTC).timestamp()}
+            return _metadata_from_cache(cached_entry, source="pypi")
+        if fetched is None:
+            raise urllib.error.URLError("unexpected 304 without a cached entry")
+        (
+            (
+                latest_version,
+                release_date,
+                compatible_version,
+                compatible_release_date,
+                compatibility_status,
+            ),
+            etag,
+            etag_api,
+        ) = fetched
     except urllib.error.HTTPError as exc:
+        etag = None
         latest_version, release_date = f"http-{exc.code}", None
         compatible_version, compatible_release_date, compatibility_status = None, None, "unknown"
     except urllib.error.URLError:
         if cached_entry:
             return _metadata_from_cache(cached_entry, source="cache-stale")
+        etag = None
         latest_version, release_date = "network-error", None
         compatible_version, compatible_release_date, compatibility_status = None, None, "unknown"
 
@@ -470,6 +556,9 @@ def _fetch_package_metadata(
         "compatible_version": compatible_version,
         "compatible_release_date": compatible_release_date,
         "compatibility_status": compatibility_status,
+        "python_requires": project_python_requires,
+        "etag": etag,
+        "etag_api": etag_api,
     }
     return PackageMetadata(
         latest_version=latest_version,
@@ -491,38 +580,46 @@ def _collect_package_metadata(
     max_workers: int,
     project_python_requires: str | None,
     include_prereleases: bool,
+    index_url: str = DEFAULT_INDEX_URL,
 ) -> dict[str, PackageMetadata]:
     cache = _load_cache(cache_path)
+    # One keep-alive connection per metadata worker thread, closed with the collection.
+    client = PyPIMetadataClient(index_url)
     metadata: dict[str, PackageMetadata] = {}
     worker_count = max(1, min(max_workers, len(packages)))
-    if worker_count == 1:
-        for package in packages:
-            metadata[package] = _fetch_package_metadata(
-                package,
-                timeout_s=timeout_s,
-                cache=cache,
-                cache_ttl_hours=cache_ttl_hours,
-                offline=offline,
-                project_python_requires=project_python_requires,
-                include_prereleases=include_prereleases,
-            )
-    else:
-        with ThreadPoolExecutor(max_workers=worker_count) as executor:
-            futures = {
-                executor.submit(
-                    _fetch_package_metadata,
+    try:
+        if worker_count == 1:
+            for package in packages:
+                metadata[package] = _fetch_package_metadata(
                     package,
+                    client=client,
                     timeout_s=timeout_s,
                     cache=cache,
                     cache_ttl_hours=cache_ttl_hours,
                     offline=offline,
                     project_python_requires=project_python_requires,
                     include_prereleases=include_prereleases,
-                ): package
-                for package in packages
-            }
-            for future in as_completed(futures):
-                metadata[futures[future]] = future.result()
+                )
+        else:
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                futures = {
+                    executor.submit(
+                        _fetch_package_metadata,
+                        package,
+                        client=client,
+                        timeout_s=timeout_s,
+                        cache=cache,
+                        cache_ttl_hours=cache_ttl_hours,
+                        offline=offline,
+                        project_python_requires=project_python_requires,
+                        include_prereleases=include_prereleases,
+                    ): package
+                    for package in packages
+                }
+                for future in as_completed(futures):
+                    metadata[futures[future]] = future.result()
+    finally:
+        client.close()
 
     if not offline:
         _persist_cache(cache_path, cache)
@@ -6,6 +6,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+from sdetkit import adaptive_memory
+
 
 def _run(*args: str) -> subprocess.CompletedProcess[str]:
     return subprocess.run([sys.executable, "-m", "sdetkit", *args], text=True, capture_output=True)
@@ -167,3 +169,22 @@ def test_adaptive_learn_record_and_summarize_cli(tmp_path: Path) -> None:
     )
     assert payload["calibration_summary"]["promote"] == 1
     assert payload["weakest_lanes"][0]["lane"] == "quality"
+
+
+def test_init_db_is_serialised_across_threads(tmp_path: Path, monkeypatch) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    db_path = tmp_path / "adaptive.db"
+    original_connect = adaptive_memory._connect
+    held: list[bool] = []
+
+    def checking_connect(path: Path):
+        held.append(adaptive_memory._INIT_LOCK.locked())
+        return original_connect(path)
+
+    monkeypatch.setattr(adaptive_memory, "_connect", checking_connect)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(adaptive_memory.init_db, [db_path] * 8))
+
+    assert held == [True] * 8
+    assert adaptive_memory.history_payload(db_path)["run_count"] == 0
@@ -53,3 +53,54 @@ def test_fetch_json_list_paginated_detects_cycle():
             fetch_json_list_paginated(client, "/items?page=1", max_pages=10)
 
     assert calls >= 2
+
+
+def _last_page_handler(last: int, calls: list[str]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        page = int(request.url.params.get("page", "1"))
+        links = []
+        if page < last:
+            links.append(f'</items?per_page=2&page={page + 1}>; rel="next"')
+            links.append(f'</items?per_page=2&page={last}>; rel="last"')
+        return httpx.Response(200, headers={"Link": ", ".join(links)}, json=[page])
+
+    return handler
+
+
+def test_fetch_json_list_paginated_prefetches_known_pages_in_order():
+    calls: list[str] = []
+    transport = httpx.MockTransport(_last_page_handler(12, calls))
+    with httpx.Client(transport=transport, base_url="https://example.test") as client:
+        out = fetch_json_list_paginated(
+            client, "/items?per_page=2&page=1", max_pages=12, page_concurrency=4
+        )
+        assert out == list(range(1, 13))
+        assert len(calls) == 12
+
+        calls.clear()
+        with pytest.raises(RuntimeError, match="pagination limit exceeded"):
+            fetch_json_list_paginated(
+                client, "/items?per_page=2&page=1", max_pages=11, page_concurrency=4
+            )
+        assert len(calls) == 1
+
+        with pytest.raises(ValueError):
+            fetch_json_list_paginated(client, "/items?page=1", page_concurrency=0)
+
+
+def test_fetch_json_list_paginated_concurrency_falls_back_without_last_link():
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        page = int(request.url.params.get("page", "1"))
+        headers = {"Link": f'</items?page={page + 1}>; rel="next"'} if page < 3 else {}
+        return httpx.Response(200, headers=headers, json=[page])
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, base_url="https://example.test") as client:
+        out = fetch_json_list_paginated(client, "/items?page=1", page_concurrency=8)
+
+    assert out == [1, 2, 3]
+    assert len(calls) == 3
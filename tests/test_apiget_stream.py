@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+
+import httpx
+import pytest
+
+from sdetkit import apiget, cli, netclient
+
+_REAL_HTTPX_CLIENT = httpx.Client
+
+
+def _client_factory(transport: httpx.MockTransport):
+    def _factory(*args, **kwargs):
+        if kwargs.get("transport") is not None:
+            return _REAL_HTTPX_CLIENT(*args, **kwargs)
+        return _REAL_HTTPX_CLIENT(transport=transport)
+
+    return _factory
+
+
+def test_apiget_stream_writes_raw_body_to_out_with_digest(tmp_path, monkeypatch, capsys):
+    body = b'{"artifacts": [' + b",".join(b'{"id": %d}' % i for i in range(5000)) + b"]}"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+    monkeypatch.setattr(apiget.httpx, "Client", _client_factory(httpx.MockTransport(handler)))
+    monkeypatch.chdir(tmp_path)
+
+    rc = cli.main(["apiget", "https://example.test/artifacts", "--stream", "--out", "dump.json"])
+    err = capsys.readouterr().err
+
+    assert rc == 0
+    assert (tmp_path / "dump.json").read_bytes() == body
+    assert f"sha256: {hashlib.sha256(body).hexdigest()}" in err
+    assert f"bytes: {len(body)}" in err
+    assert [p.name for p in tmp_path.iterdir()] == ["dump.json"]
+
+
+def test_apiget_stream_paginates_as_ndjson(monkeypatch, capsys):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        headers = {}
+        if page < 3:
+            headers["Link"] = f'<https://example.test/items?page={page + 1}>; rel="next"'
+        return httpx.Response(200, json=[{"page": page, "n": i} for i in range(2)], headers=headers)
+
+    monkeypatch.setattr(apiget.httpx, "Client", _client_factory(httpx.MockTransport(handler)))
+
+    rc = cli.main(["apiget", "https://example.test/items", "--paginate", "--stream"])
+    out = capsys.readouterr()
+
+    assert rc == 0
+    lines = out.out.splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"page": p, "n": i} for p in (1, 2, 3) for i in range(2)
+    ]
+    expected = "".join(line + "\n" for line in lines).encode("utf-8")
+    assert f"sha256: {hashlib.sha256(expected).hexdigest()}" in out.err
+
+
+def test_apiget_stream_http_error_leaves_no_partial_output(tmp_path, monkeypatch, capsys):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503, json={"error": "down"})
+
+    monkeypatch.setattr(apiget.httpx, "Client", _client_factory(httpx.MockTransport(handler)))
+    monkeypatch.chdir(tmp_path)
+
+    rc = cli.main(["apiget", "https://example.test/x", "--stream", "--out", "dump.json"])
+
+    assert rc == 1
+    assert "http error: 503" in capsys.readouterr().err
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_retries_429_before_writing_and_emits_bytes() -> None:
+    calls = {"n": 0}
+    events: list[netclient.ClientEvent] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, content=b"slow down")
+        return httpx.Response(200, content=b"x" * 1000)
+
+    sink = io.BytesIO()
+    pol = netclient.RetryPolicy(retries=2, retry_on_429=True)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        c = netclient.SdetHttpClient(raw, retry=pol, hook=events.append, sleep=lambda d: None)
+        res = c.download("https://example.test/blob", sink, chunk_size=128)
+
+    assert sink.getvalue() == b"x" * 1000
+    assert res.bytes_written == 1000
+    assert res.sha256 == hashlib.sha256(b"x" * 1000).hexdigest()
+    responses = [e for e in events if e.type == "attempt_response"]
+    assert [(e.status_code, e.response_bytes) for e in responses] == [(429, 9), (200, 1000)]
+
+
+def test_download_retries_errors_only_before_the_first_body_byte() -> None:
+    class _Body(httpx.SyncByteStream):
+        def __iter__(self):
+            yield b"partial"
+            raise httpx.ReadError("reset")
+
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, stream=_Body())
+
+    sink = io.BytesIO()
+    pol = netclient.RetryPolicy(retries=3)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        c = netclient.SdetHttpClient(raw, retry=pol, sleep=lambda d: None)
+        with pytest.raises(RuntimeError, match="request failed"):
+            c.download("https://example.test/blob", sink, chunk_size=4)
+
+    assert calls["n"] == 2
+    assert sink.getvalue() == b"part"
+
+
+def test_iter_json_list_pages_yields_one_page_at_a_time() -> None:
+    requested: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        requested.append(page)
+        link = f'<https://example.test/l?page={page + 1}>; rel="next"' if page < 3 else ""
+        return httpx.Response(200, json=[page], headers={"Link": link} if link else {})
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        pages = netclient.SdetHttpClient(raw).iter_json_list_pages("https://example.test/l")
+        assert next(pages) == [1]
+        assert requested == [1]
+        assert list(pages) == [[2], [3]]
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        c = netclient.SdetHttpClient(raw)
+        with pytest.raises(RuntimeError, match="pagination limit exceeded"):
+            list(c.iter_json_list_pages("https://example.test/l", max_pages=2))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 from pathlib import Path
 
 import httpx
@@ -9,8 +11,11 @@ from sdetkit.cassette import (
     AsyncCassetteRecordTransport,
     AsyncCassetteReplayTransport,
     Cassette,
+    CassetteMatcher,
     CassetteRecordTransport,
     CassetteReplayTransport,
+    CassetteWriter,
+    iter_interactions,
 )
 from sdetkit.netclient import SdetAsyncHttpClient, SdetHttpClient
 from sdetkit.security import SecurityError
@@ -143,3 +148,203 @@ def test_cassette_save_and_load_block_traversal(tmp_path: Path, monkeypatch) ->
     escaped.write_text('{"version": 1, "interactions": []}', encoding="utf-8")
     with pytest.raises(SecurityError):
         Cassette.load("../escape.json")
+
+
+def _record(urls: list[str]) -> Cassette:
+    counter = {"n": 0}
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        counter["n"] += 1
+        return httpx.Response(200, json={"url": str(req.url), "n": counter["n"]})
+
+    cassette = Cassette()
+    rec = CassetteRecordTransport(cassette, httpx.MockTransport(handler))
+    with httpx.Client(transport=rec) as c:
+        for url in urls:
+            c.get(url)
+    return cassette
+
+
+def test_indexed_replay_is_order_independent_and_fifo_per_key() -> None:
+    cassette = _record(
+        ["https://example.test/a", "https://example.test/b", "https://example.test/a"]
+    )
+    rep = CassetteReplayTransport(cassette, match="indexed")
+
+    with httpx.Client(transport=rep) as c:
+        assert c.get("https://example.test/b").json()["n"] == 2
+        assert c.get("https://example.test/a").json()["n"] == 1
+        with pytest.raises(AssertionError, match="played=2 total=3"):
+            rep.assert_exhausted()
+        assert c.get("https://example.test/a").json()["n"] == 3
+        with pytest.raises(RuntimeError, match="no more recorded interactions"):
+            c.get("https://example.test/a")
+
+    rep = CassetteReplayTransport(cassette, match="indexed")
+    with pytest.raises(RuntimeError, match="no recorded interaction for GET"):
+        rep.handle_request(httpx.Request("GET", "https://example.test/c"))
+    with pytest.raises(AssertionError, match="played=0 total=3"):
+        rep.close()
+
+    with pytest.raises(ValueError):
+        CassetteReplayTransport(cassette, match="random")
+
+
+@pytest.mark.asyncio
+async def test_indexed_async_replay_serves_concurrent_fan_out() -> None:
+    urls = [f"https://example.test/items/{i}" for i in range(20)]
+    cassette = _record(urls)
+    rep = AsyncCassetteReplayTransport(cassette, match="indexed")
+
+    async with httpx.AsyncClient(transport=rep) as raw:
+        client = SdetAsyncHttpClient(raw)
+        got = await asyncio.gather(*(client.get_json_dict(u) for u in reversed(urls)))
+
+    assert [item["url"] for item in got] == list(reversed(urls))
+    rep.assert_exhausted()
+
+
+def test_matcher_ignores_query_params_and_headers() -> None:
+    cassette = _record(["https://example.test/s?q=1&ts=100"])
+
+    strict = CassetteReplayTransport(cassette)
+    with httpx.Client(transport=strict) as c:
+        with pytest.raises(RuntimeError, match="cassette mismatch: expected"):
+            c.get("https://example.test/s?q=1&ts=200")
+
+    loose = CassetteReplayTransport(
+        cassette,
+        match="indexed",
+        matcher=CassetteMatcher(ignore_query_params=frozenset({"ts"})),
+    )
+    with httpx.Client(transport=loose) as c:
+        assert c.get("https://example.test/s?q=1&ts=200").status_code == 200
+    loose.assert_exhausted()
+
+    anyquery = CassetteReplayTransport(cassette, matcher=CassetteMatcher(ignore_query=True))
+    with httpx.Client(transport=anyquery) as c:
+        assert c.get("https://example.test/s").status_code == 200
+
+    headed = CassetteMatcher(
+        ignore_query=True, match_headers=True, ignore_headers=frozenset({"X-Trace"})
+    )
+    rep = CassetteReplayTransport(cassette, match="indexed", matcher=headed)
+    with httpx.Client(transport=rep) as c:
+        with pytest.raises(RuntimeError, match="no recorded interaction"):
+            c.get("https://example.test/s", headers={"X-Tenant": "a"})
+        assert c.get("https://example.test/s", headers={"X-Trace": "t1"}).status_code == 200
+
+
+def test_lines_cassette_records_append_only_with_deduplicated_blobs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    big = b"x" * 70_000
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        if req.url.path == "/small":
+            return httpx.Response(200, json={"ok": True})
+        return httpx.Response(200, content=big)
+
+    cassette = Cassette()
+    rec = CassetteRecordTransport(cassette, httpx.MockTransport(handler), path="rec.jsonl.gz")
+    with httpx.Client(transport=rec) as c:
+        c.get("https://example.test/big/1")
+        c.get("https://example.test/small")
+        lines = list(iter_interactions(tmp_path / "rec.jsonl.gz"))
+        assert len(lines) == 2
+        c.get("https://example.test/big/2")
+
+    blobs = sorted((tmp_path / "rec.jsonl.gz.blobs").iterdir())
+    assert len(blobs) == 1
+    assert blobs[0].read_bytes() == big
+    assert "body_b64" not in cassette.interactions[0]["response"]
+
+    loaded = Cassette.load("rec.jsonl.gz")
+    assert loaded.interactions[2]["response"]["body_ref"].startswith("sha256:")
+    rep = CassetteReplayTransport(loaded)
+    with httpx.Client(transport=rep) as c:
+        assert c.get("https://example.test/big/1").content == big
+        assert c.get("https://example.test/small").json() == {"ok": True}
+        assert c.get("https://example.test/big/2").content == big
+
+    loaded.save("flat.json")
+    flat = Cassette.load("flat.json")
+    assert "body_ref" not in flat.interactions[0]["response"]
+    assert flat.response_body(flat.interactions[2]["response"]) == big
+
+
+def test_lines_cassette_recording_keeps_no_interactions_in_memory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    cassette = Cassette()
+    rec = CassetteRecordTransport(
+        cassette,
+        httpx.MockTransport(lambda req: httpx.Response(200, text=req.url.path)),
+        path="rec.jsonl",
+    )
+    with httpx.Client(transport=rec) as c:
+        for i in range(5):
+            c.get(f"https://example.test/{i}")
+            assert cassette._interactions is None
+
+    assert cassette.source == tmp_path / "rec.jsonl"
+    assert [it["request"]["url"] for it in cassette.iter_recorded()] == [
+        f"https://example.test/{i}" for i in range(5)
+    ]
+
+
+def test_lines_cassette_ignores_truncated_tail_and_rejects_missing_header(
+    tmp_path: Path,
+) -> None:
+    cassette = _record(["https://example.test/a", "https://example.test/b"])
+    path = tmp_path / "c.jsonl"
+    cassette.save(path, allow_absolute=True)
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write('{"request": {"method": "GET"')
+
+    assert len(Cassette.load(path, allow_absolute=True).interactions) == 2
+
+    path.write_text('{"interactions": []}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="line-delimited header"):
+        Cassette.load(path, allow_absolute=True)
+
+
+def test_lines_cassette_replay_streams_without_materializing(tmp_path: Path) -> None:
+    urls = [f"https://example.test/{i}" for i in range(4)]
+    path = tmp_path / "c.jsonl"
+    _record(urls).save(path, allow_absolute=True)
+
+    for match in ("sequential", "indexed"):
+        loaded = Cassette.load(path, allow_absolute=True)
+        rep = CassetteReplayTransport(loaded, match=match)
+        with httpx.Client(transport=rep) as c:
+            for url in reversed(urls) if match == "indexed" else urls:
+                assert c.get(url).status_code == 200
+        assert loaded._interactions is None
+
+
+def test_cassette_writer_keeps_lines_intact_across_threads(tmp_path: Path) -> None:
+    writer = CassetteWriter(tmp_path / "t.jsonl", blob_threshold=1 << 30)
+    body = "y" * 50_000
+
+    def work(n: int) -> None:
+        for i in range(20):
+            writer.write(
+                {
+                    "request": {"method": "GET", "url": f"https://example.test/{n}/{i}"},
+                    "response": {"status_code": 200, "headers": {}, "body_b64": body},
+                }
+            )
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    writer.close()
+
+    recorded = list(iter_interactions(tmp_path / "t.jsonl"))
+    assert len(recorded) == 80
+    assert all(it["response"]["body_b64"] == body for it in recorded)
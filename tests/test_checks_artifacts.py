@@ -78,7 +78,16 @@ def test_render_record_artifacts_writes_stable_schema_outputs(tmp_path: Path) ->
             "adaptive_reason": "small code change set keeps adaptive on standard validation",
             "changed_files": ["src/sdetkit/example.py"],
             "changed_areas": ["source", "tests"],
-            "execution": {"mode": "parallel", "workers": 2},
+            "execution": {
+                "mode": "parallel",
+                "workers": 2,
+                "scheduler": "critical-path",
+                "wall_seconds": 1.5,
+                "busy_seconds": 2.4,
+                "parallelism": 1.6,
+                "idle_worker_seconds": 0.6,
+                "peak_concurrency": 2,
+            },
             "checks_recorded": 3,
             "cache_enabled": True,
         },
@@ -102,6 +111,12 @@ def test_render_record_artifacts_writes_stable_schema_outputs(tmp_path: Path) ->
     assert verdict["profile"]["adaptive_resolved"] is True
     assert verdict["targeting"]["used_targeted_execution"] is True
     assert verdict["cache"]["used_cache_hits"] is True
+    assert verdict["execution"]["scheduler"] == "critical-path"
+    assert verdict["execution"]["wall_seconds"] == 1.5
+    assert verdict["execution"]["busy_seconds"] == 2.4
+    assert verdict["execution"]["parallelism"] == 1.6
+    assert verdict["execution"]["idle_worker_seconds"] == 0.6
+    assert verdict["execution"]["peak_concurrency"] == 2
     assert verdict["check_results_summary"]["target_modes"] == {
         "full": 1,
         "smoke": 1,
@@ -240,6 +255,7 @@ def test_render_ledger_cli_writes_artifacts_for_shell_wrappers(tmp_path: Path) -
     )
     assert verdict["profile"]["requested"] == "adaptive"
     assert verdict["execution"]["source"] == "premium-gate.sh"
+    assert "wall_seconds" not in verdict["execution"]
     assert (tmp_path / ".sdetkit" / "out" / "fix-plan.json").exists()
     assert (tmp_path / ".sdetkit" / "out" / "risk-summary.json").exists()
     assert (tmp_path / ".sdetkit" / "out" / "evidence.zip").exists()
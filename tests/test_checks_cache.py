@@ -91,3 +91,131 @@ def test_compute_repo_fingerprint_ignores_absolute_outside_repo_hint_paths(tmp_p
     )
 
     assert inside_only == with_outside_hint
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    import os
+    import time
+
+    past = time.time_ns() - seconds * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+def test_compute_repo_fingerprint_reuses_persisted_stat_index(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (repo_root / name).write_text(f"{name}\n", encoding="utf-8")
+        _age(repo_root / name)
+
+    cache_dir = tmp_path / ".sdetkit-cache"
+    first = CheckCache(cache_dir)
+    before = first.compute_repo_fingerprint(repo_root, ())
+    assert first.stats() == {"files_hashed": 3, "files_reused": 0}
+    assert (cache_dir / "file-hashes.json").is_file()
+
+    second = CheckCache(cache_dir)
+    assert second.compute_repo_fingerprint(repo_root, ()) == before
+    assert second.stats() == {"files_hashed": 0, "files_reused": 3}
+
+    (repo_root / "b.txt").write_text("changed\n", encoding="utf-8")
+    third = CheckCache(cache_dir)
+    after = third.compute_repo_fingerprint(repo_root, ())
+    assert after != before
+    assert third.stats() == {"files_hashed": 1, "files_reused": 2}
+
+
+def test_compute_repo_fingerprint_disabled_cache_does_not_persist_index(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    (repo_root / "a.txt").write_text("a\n", encoding="utf-8")
+    _age(repo_root / "a.txt")
+
+    cache_dir = tmp_path / ".sdetkit-cache"
+    CheckCache(cache_dir, enabled=False).compute_repo_fingerprint(repo_root, ())
+    assert not (cache_dir / "file-hashes.json").exists()
+
+
+def test_sqlite_backend_packs_entries_and_counts_hits_and_misses(tmp_path: Path) -> None:
+    from sdetkit.checks.results import CheckRecord
+
+    cache_dir = tmp_path / "checks"
+    cache = CheckCache(cache_dir, backend="sqlite")
+    assert cache.load("missing") is None
+    cache.save("k1", CheckRecord(id="lint", title="Lint", status="passed", advisory=("a",)))
+    loaded = cache.load("k1")
+    cache.close()
+
+    assert loaded is not None
+    assert loaded.advisory == ("a",)
+    assert loaded.metadata["cache"] == {"status": "hit", "key": "k1"}
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["checks.sqlite3"]
+    assert cache.counters() == {
+        "backend": "sqlite",
+        "hits": 1,
+        "misses": 1,
+        "writes": 1,
+        "evictions": 0,
+    }
+
+
+def test_sqlite_backend_evicts_least_recently_used_over_size_cap(tmp_path: Path) -> None:
+    import time
+
+    from sdetkit.checks.results import CheckRecord
+
+    probe = CheckCache(tmp_path / "probe", backend="sqlite")
+    probe.save("p", CheckRecord(id="x0", title="X", status="passed"))
+    one_entry = probe._connection().execute("SELECT size FROM entries").fetchone()[0]
+    probe.close()
+
+    cache = CheckCache(tmp_path / "checks", backend="sqlite", max_bytes=one_entry * 2)
+    cache.save("a", CheckRecord(id="x1", title="X", status="passed"))
+    time.sleep(0.01)
+    cache.save("b", CheckRecord(id="x2", title="X", status="passed"))
+    time.sleep(0.01)
+    assert cache.load("a") is not None
+    time.sleep(0.01)
+    cache.save("c", CheckRecord(id="x3", title="X", status="passed"))
+
+    assert cache.load("b") is None
+    assert cache.load("a") is not None
+    assert cache.load("c") is not None
+    assert cache.counters()["evictions"] == 1
+    cache.close()
+
+
+def test_sqlite_backend_evicts_entries_past_max_age(tmp_path: Path) -> None:
+    from sdetkit.checks.results import CheckRecord
+
+    cache = CheckCache(tmp_path / "checks", backend="sqlite", max_age_seconds=60)
+    cache.save("old", CheckRecord(id="x", title="X", status="passed"))
+    cache._connection().execute("UPDATE entries SET created_at = created_at - 3600")
+    cache.save("new", CheckRecord(id="y", title="Y", status="passed"))
+
+    assert cache.load("old") is None
+    assert cache.load("new") is not None
+    assert cache.counters()["evictions"] == 1
+    cache.close()
+
+
+def test_unknown_cache_backend_is_rejected(tmp_path: Path) -> None:
+    import pytest
+
+    with pytest.raises(ValueError):
+        CheckCache(tmp_path, backend="redis")
+
+
+def test_sqlite_backend_load_treats_expired_entry_as_miss(tmp_path: Path) -> None:
+    from sdetkit.checks.results import CheckRecord
+
+    writer = CheckCache(tmp_path / "checks", backend="sqlite")
+    writer.save("old", CheckRecord(id="x", title="X", status="passed"))
+    writer._connection().execute("UPDATE entries SET created_at = created_at - 3600")
+    writer._connection().commit()
+    writer.close()
+
+    cache = CheckCache(tmp_path / "checks", backend="sqlite", max_age_seconds=60)
+    assert cache.load("old") is None
+    assert cache._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
+    cache.close()
@@ -281,6 +281,7 @@ def test_runner_cache_records_hit_and_miss(tmp_path: Path) -> None:
     assert calls["count"] == 1
     assert first.records[0].metadata["cache"]["status"] == "fresh"
     assert second.records[0].metadata["cache"]["status"] == "hit"
+    assert second.verdict.metadata["cache_counters"]["hits"] == 1
 
 
 def test_runner_parallelizes_safe_independent_checks_and_keeps_order(tmp_path: Path) -> None:
@@ -337,6 +338,136 @@ def test_runner_parallelizes_safe_independent_checks_and_keeps_order(tmp_path: P
     assert report.verdict.metadata["execution"]["mode"] == "parallel"
 
 
+def _scheduler_snapshot(specs: dict[str, dict], runner_for) -> RegistrySnapshot:
+    return RegistrySnapshot(
+        profiles={
+            "quick": CheckProfile(
+                name="quick",
+                description="",
+                default_truth_level="smoke",
+                merge_truth=False,
+                check_ids=tuple(specs),
+            )
+        },
+        checks={
+            key: CheckDefinition(
+                id=key,
+                title=key,
+                category="repo",
+                cost=spec.get("cost", "cheap"),
+                truth_level="smoke",
+                dependencies=spec.get("dependencies", ()),
+                resource_class=spec.get("resource_class", "light"),
+                cacheable=False,
+                run=runner_for(key),
+            )
+            for key, spec in specs.items()
+        },
+    )
+
+
+def test_runner_resource_classes_overlap_heavy_with_light_but_not_heavy_with_heavy(
+    tmp_path: Path,
+) -> None:
+    active: dict[str, int] = {"heavy": 0, "light": 0, "heavy_peak": 0, "mixed": 0}
+    lock = threading.Lock()
+    specs = {
+        "pytest_a": {"resource_class": "heavy"},
+        "pytest_b": {"resource_class": "heavy"},
+        "ruff": {},
+    }
+
+    def runner_for(name: str):
+        klass = specs[name].get("resource_class", "light")
+
+        def _run(_ctx: object) -> CheckRecord:
+            with lock:
+                active[klass] += 1
+                active["heavy_peak"] = max(active["heavy_peak"], active["heavy"])
+                if active["heavy"] and active["light"]:
+                    active["mixed"] = 1
+            time.sleep(0.05)
+            with lock:
+                active[klass] -= 1
+            return CheckRecord(id=name, title=name, status="passed")
+
+        return _run
+
+    snapshot = _scheduler_snapshot(specs, runner_for)
+    plan = CheckPlanner(snapshot).plan("quick", repo_root=tmp_path)
+    report = CheckRunner(snapshot).run(
+        plan,
+        repo_root=tmp_path,
+        out_dir=tmp_path / "out",
+        env={},
+        python_executable="python",
+        use_cache=False,
+        max_workers=3,
+    )
+
+    assert active["heavy_peak"] == 1
+    assert active["mixed"] == 1
+    assert [record.status for record in report.records] == ["passed"] * 3
+    execution = report.verdict.metadata["execution"]
+    assert execution["scheduler"] == "critical-path"
+    assert execution["peak_concurrency"] == 2
+    assert execution["parallelism"] > 0
+    assert execution["idle_worker_seconds"] >= 0
+
+
+def test_runner_prioritizes_critical_path_from_persisted_durations(tmp_path: Path) -> None:
+    import json
+
+    started: list[str] = []
+    specs = {
+        "alpha": {},
+        "beta": {},
+        "gamma": {"dependencies": ("beta",)},
+    }
+
+    def runner_for(name: str):
+        def _run(_ctx: object) -> CheckRecord:
+            started.append(name)
+            return CheckRecord(id=name, title=name, status="passed")
+
+        return _run
+
+    out_dir = tmp_path / "out"
+    durations = out_dir / "cache" / "check-durations.json"
+    durations.parent.mkdir(parents=True)
+    durations.write_text(
+        json.dumps({"schema_version": 1, "checks": {"alpha": 1.0, "beta": 2.0, "gamma": 50.0}}),
+        encoding="utf-8",
+    )
+
+    snapshot = _scheduler_snapshot(specs, runner_for)
+    plan = CheckPlanner(snapshot).plan("quick", repo_root=tmp_path)
+
+    def run(*, use_cache: bool):
+        return CheckRunner(snapshot).run(
+            plan,
+            repo_root=tmp_path,
+            out_dir=out_dir,
+            env={},
+            python_executable="python",
+            use_cache=use_cache,
+            max_workers=1,
+        )
+
+    seeded = durations.read_bytes()
+    report = run(use_cache=False)
+    assert started == ["beta", "gamma", "alpha"]
+    assert [record.id for record in report.records] == ["alpha", "beta", "gamma"]
+    assert durations.read_bytes() == seeded
+
+    started.clear()
+    run(use_cache=True)
+    assert started == ["beta", "gamma", "alpha"]
+    history = json.loads(durations.read_text(encoding="utf-8"))["checks"]
+    assert set(history) == {"alpha", "beta", "gamma"}
+    assert history["gamma"] < 50.0
+
+
 def test_final_verdict_contract_separates_run_skipped_and_failures() -> None:
     verdict = build_final_verdict(
         profile="quick",
@@ -6,6 +6,7 @@ import sys
 from pathlib import Path
 
 import httpx
+import pytest
 
 from sdetkit.cassette import Cassette, CassetteRecordTransport
 
@@ -75,3 +76,55 @@ def test_cli_cassette_get_replay_mismatch(tmp_path: Path) -> None:
 
     assert r.returncode != 0
     assert (r.stderr + r.stdout).strip()
+
+
+def test_cassette_get_converts_between_formats(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from sdetkit.cassette_get import cassette_get
+
+    monkeypatch.chdir(tmp_path)
+    url = "https://example.test/hello"
+    _make_cassette(tmp_path / "cassette.json", url)
+
+    assert cassette_get(["--convert", "cassette.json", "cassette.jsonl.gz"]) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["interactions"] == 1
+    assert summary["format"] == "jsonl"
+    assert cassette_get(["--convert", "cassette.jsonl.gz", "cassette.json"]) == 2
+    assert cassette_get(["--convert", "cassette.jsonl.gz", "back.json"]) == 0
+
+    before = json.loads((tmp_path / "cassette.json").read_text(encoding="utf-8"))
+    after = json.loads((tmp_path / "back.json").read_text(encoding="utf-8"))
+    assert after == before
+    assert Cassette.load("cassette.jsonl.gz").interactions == before["interactions"]
+
+
+def test_cassette_get_converts_lines_cassette_onto_itself(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from sdetkit.cassette_get import cassette_get
+
+    monkeypatch.chdir(tmp_path)
+    _make_cassette(tmp_path / "cassette.json", "https://example.test/hello")
+    assert cassette_get(["--convert", "cassette.json", "a.jsonl"]) == 0
+    capsys.readouterr()
+    before = list(Cassette.load("a.jsonl").iter_recorded())
+
+    assert cassette_get(["--convert", "a.jsonl", "a.jsonl", "--force"]) == 0
+
+    assert json.loads(capsys.readouterr().out)["interactions"] == 1
+    assert list(Cassette.load("a.jsonl").iter_recorded()) == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.jsonl", "cassette.json"]
+
+
+def test_lines_cassette_save_streams_without_materializing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    _make_cassette(tmp_path / "cassette.json", "https://example.test/hello")
+    assert Cassette.load("cassette.json").save("a.jsonl.gz") == 1
+
+    loaded = Cassette.load("a.jsonl.gz")
+    assert loaded.save("b.jsonl") == 1
+    assert loaded._interactions is None
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -14,6 +15,7 @@ from sdetkit.job_queue import (
     COMPLETED,
     FAILED,
     PENDING,
+    claim_job,
     enqueue_job,
     load_queue,
 )
@@ -333,3 +335,243 @@ def test_runner_stops_after_first_failed_job_without_retry(
     assert result["execution"]["proof_commands_executed"] is False
     assert result["execution"]["patch_attempted"] is False
     assert result["execution"]["merge_authorized"] is False
+
+
+def test_worker_pool_runs_jobs_concurrently_with_isolated_failures(
+    tmp_path: Path,
+) -> None:
+    queue_path = tmp_path / "queue.json"
+    valid_input = tmp_path / "valid.json"
+
+    valid_input.write_text(
+        json.dumps(_formatting_intelligence()),
+        encoding="utf-8",
+    )
+
+    jobs = [
+        _job(
+            head_sha=f"head{index}",
+            created_at=f"2026-06-14T0{index}:00:00Z",
+            input_artifacts={
+                "check_intelligence": ("missing.json" if index == 2 else str(valid_input)),
+            },
+        )
+        for index in range(1, 6)
+    ]
+
+    for job in reversed(jobs):
+        enqueue_job(queue_path, job)
+
+    result = run_bounded_diagnostic_queue(
+        queue_path,
+        max_jobs=3,
+        claimed_at="2026-06-14T06:00:00Z",
+        finished_at="2026-06-14T07:00:00Z",
+        out_root=tmp_path / "worker",
+        input_root=tmp_path,
+        workers=3,
+    )
+
+    assert result["workers"] == 3
+    assert result["status"] == "failed"
+    assert result["stop_reason"] == "job_failed"
+    assert result["jobs_attempted"] == 3
+    assert result["jobs_completed"] == 2
+    assert result["jobs_failed"] == 1
+    assert [item["job_id"] for item in result["successful_results"]] == [
+        jobs[0]["job_id"],
+        jobs[2]["job_id"],
+    ]
+    assert result["failure"]["job_id"] == jobs[1]["job_id"]
+    assert result["failures"] == [result["failure"]]
+
+    states = _states(queue_path)
+
+    assert [states[job["job_id"]] for job in jobs] == [
+        COMPLETED,
+        FAILED,
+        COMPLETED,
+        PENDING,
+        PENDING,
+    ]
+    assert result["queue_state_counts"] == {
+        "pending": 2,
+        "claimed": 0,
+        "completed": 2,
+        "failed": 1,
+    }
+
+
+def test_runner_reads_queue_once_per_view_not_per_job(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import sdetkit.diagnostic_queue_runner as runner
+
+    queue_path = tmp_path / "queue.json"
+    input_path = tmp_path / "check-intelligence.json"
+
+    input_path.write_text(
+        json.dumps(_formatting_intelligence()),
+        encoding="utf-8",
+    )
+
+    for index in range(1, 5):
+        enqueue_job(
+            queue_path,
+            _job(
+                head_sha=f"head{index}",
+                created_at=f"2026-06-14T0{index}:00:00Z",
+                input_artifacts={"check_intelligence": str(input_path)},
+            ),
+        )
+
+    loads: list[str] = []
+
+    class CountingQueue(runner.JournaledJobQueue):
+        def snapshot(self) -> dict:
+            loads.append("snapshot")
+            return super().snapshot()
+
+        def compact(self) -> dict:
+            loads.append("compact")
+            return super().compact()
+
+    monkeypatch.setattr(runner, "JournaledJobQueue", CountingQueue)
+
+    result = run_bounded_diagnostic_queue(
+        queue_path,
+        max_jobs=10,
+        claimed_at="2026-06-14T06:00:00Z",
+        finished_at="2026-06-14T07:00:00Z",
+        out_root=tmp_path / "worker",
+    )
+
+    assert result["stop_reason"] == "no_pending_jobs"
+    assert result["jobs_completed"] == 4
+    assert loads == ["snapshot", "snapshot", "compact"]
+    assert not queue_path.with_name("queue.json.journal").exists()
+    assert json.loads(queue_path.read_text(encoding="utf-8")) == load_queue(queue_path)
+
+
+@pytest.mark.parametrize("workers", [0, -2, True])
+def test_runner_rejects_invalid_workers(tmp_path: Path, workers: object) -> None:
+    with pytest.raises(ValueError, match="positive integer workers"):
+        run_bounded_diagnostic_queue(
+            tmp_path / "queue.json",
+            max_jobs=1,
+            claimed_at="2026-06-14T06:00:00Z",
+            finished_at="2026-06-14T07:00:00Z",
+            out_root=tmp_path / "worker",
+            workers=workers,  # type: ignore[arg-type]
+        )
+
+
+def test_runner_skips_job_claimed_by_another_runner(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import sdetkit.diagnostic_queue_runner as runner
+
+    queue_path = tmp_path / "queue.json"
+    input_path = tmp_path / "check-intelligence.json"
+
+    input_path.write_text(
+        json.dumps(_formatting_intelligence()),
+        encoding="utf-8",
+    )
+
+    for index in range(1, 4):
+        enqueue_job(
+            queue_path,
+            _job(
+                head_sha=f"head{index}",
+                created_at=f"2026-06-14T0{index}:00:00Z",
+                input_artifacts={"check_intelligence": str(input_path)},
+            ),
+        )
+
+    real_run = runner.run_queued_diagnostic_job
+    stolen: list[str] = []
+
+    def racing_run(**kwargs: Any) -> dict:
+        if not stolen:
+            stolen.append(str(kwargs["job_id"]))
+            claim_job(queue_path, claimed_at="2026-06-14T05:00:00Z", job_id=stolen[0])
+        return real_run(**kwargs)
+
+    monkeypatch.setattr(runner, "run_queued_diagnostic_job", racing_run)
+
+    result = run_bounded_diagnostic_queue(
+        queue_path,
+        max_jobs=10,
+        claimed_at="2026-06-14T06:00:00Z",
+        finished_at="2026-06-14T07:00:00Z",
+        out_root=tmp_path / "worker",
+    )
+
+    assert result["status"] == "completed"
+    assert result["stop_reason"] == "no_pending_jobs"
+    assert result["jobs_attempted"] == 2
+    assert result["jobs_completed"] == 2
+    assert result["failures"] == []
+    assert stolen[0] not in [item["job_id"] for item in result["successful_results"]]
+    assert result["queue_state_counts"] == {
+        "pending": 0,
+        "claimed": 1,
+        "completed": 2,
+        "failed": 0,
+    }
+
+
+def test_runner_reuses_one_queue_view_per_worker_process(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import sdetkit.diagnostic_queue_runner as runner
+    import sdetkit.queued_diagnostic_worker as worker
+
+    queue_path = tmp_path / "queue.json"
+    input_path = tmp_path / "check-intelligence.json"
+
+    input_path.write_text(
+        json.dumps(_formatting_intelligence()),
+        encoding="utf-8",
+    )
+
+    for index in range(1, 4):
+        enqueue_job(
+            queue_path,
+            _job(
+                head_sha=f"head{index}",
+                created_at=f"2026-06-14T0{index}:00:00Z",
+                input_artifacts={"check_intelligence": str(input_path)},
+            ),
+        )
+
+    def no_per_job_queue(path: Path) -> None:
+        raise AssertionError("worker built its own queue view for one job")
+
+    monkeypatch.setattr(worker, "JournaledJobQueue", no_per_job_queue)
+
+    result = run_bounded_diagnostic_queue(
+        queue_path,
+        max_jobs=10,
+        claimed_at="2026-06-14T06:00:00Z",
+        finished_at="2026-06-14T07:00:00Z",
+        out_root=tmp_path / "worker",
+    )
+    assert result["jobs_completed"] == 3
+
+    monkeypatch.setattr(runner, "_WORKER_QUEUE", None)
+    runner._init_worker_queue(queue_path)
+    seen: list[object] = []
+
+    def recording_run(**kwargs: Any) -> dict:
+        seen.append(kwargs["queue"])
+        return {}
+
+    monkeypatch.setattr(runner, "run_queued_diagnostic_job", recording_run)
+    for job_id in ("a", "b"):
+        assert runner._run_isolated_job({"queue_path": queue_path, "job_id": job_id})["ok"]
+    assert seen[0] is seen[1] is runner._WORKER_QUEUE
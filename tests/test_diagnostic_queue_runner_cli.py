@@ -93,9 +93,11 @@ def test_cli_passes_explicit_arguments_to_runner(
         finished_at: str,
         out_root: Path,
         input_root: Path,
+        workers: int,
     ) -> dict[str, Any]:
         captured.update(
             {
+                "workers": workers,
                 "queue_path": queue_path,
                 "max_jobs": max_jobs,
                 "claimed_at": claimed_at,
@@ -127,6 +129,7 @@ def test_cli_passes_explicit_arguments_to_runner(
         "finished_at": "2026-06-15T02:00:00Z",
         "out_root": tmp_path / "worker",
         "input_root": tmp_path / "inputs",
+        "workers": 1,
     }
 
     payload = json.loads(capsys.readouterr().out)
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import http.server
+import io
+import json
+import threading
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from sdetkit import failed_check_log_collection as logs
+
+_JOB_LOG = "2026-10-01T00:00:00Z ##[error]tests failed\n" * 200
+_SETUP_LOG = "2026-10-01T00:00:00Z Current runner version\n"
+
+
+def _run_archive() -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("0_tests.txt", _SETUP_LOG + _JOB_LOG)
+        zf.writestr("tests/1_Set up job.txt", _SETUP_LOG)
+        zf.writestr("tests/3_pytest.txt", _JOB_LOG)
+    return buf.getvalue()
+
+
+class _FakeGitHub(http.server.BaseHTTPRequestHandler):
+    hits: list[str] = []
+    throttled: set[str] = set()
+
+    def _json(self, payload: object) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self.hits.append(self.path)
+        if self.path == "/repos/acme/project/actions/runs/123456":
+            self._json({"id": 123456, "name": "CI", "run_attempt": 1})
+        elif self.path == "/repos/acme/project/actions/jobs/789":
+            self._json(
+                {
+                    "id": 789,
+                    "run_id": 123456,
+                    "name": "tests",
+                    "steps": [
+                        {"name": "pytest", "number": 3, "conclusion": "failure"},
+                        {"name": "Set up job", "number": 1, "conclusion": "success"},
+                    ],
+                }
+            )
+        elif self.path == "/repos/acme/project/actions/runs/123456/logs":
+            if self.path not in self.throttled:
+                self.throttled.add(self.path)
+                self.send_response(429)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(302)
+            self.send_header("Location", "/blobs/run-123456.zip")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/blobs/run-123456.zip":
+            body = _run_archive()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/zip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path == "/repos/acme/project/check-runs/555/annotations?per_page=100":
+            self._json(
+                [
+                    {
+                        "annotation_level": "failure",
+                        "path": "src/app.py",
+                        "start_line": 7,
+                        "title": "lint failed",
+                        "message": "raw message",
+                    }
+                ]
+            )
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+@pytest.fixture()
+def fake_github() -> Iterator[str]:
+    _FakeGitHub.hits = []
+    _FakeGitHub.throttled = set()
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _FakeGitHub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_native_download_fills_manifest_and_skips_present_targets(
+    tmp_path: Path, fake_github: str
+) -> None:
+    checks = tmp_path / "check-runs.json"
+    checks.write_text(
+        json.dumps(
+            {
+                "check_runs": [
+                    {
+                        "name": "tests",
+                        "status": "completed",
+                        "conclusion": "failure",
+                        "html_url": "https://github.com/acme/project/actions/runs/123456/job/789",
+                    },
+                    {
+                        "name": "lint",
+                        "status": "completed",
+                        "conclusion": "failure",
+                        "url": "https://api.github.com/repos/acme/project/check-runs/555",
+                    },
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    def collect() -> dict:
+        return logs.write_failed_check_log_artifacts(
+            checks_json=checks,
+            out_dir=tmp_path / "check-logs",
+            download=True,
+            repository="acme/project",
+            api_url=fake_github,
+            download_concurrency=2,
+        )
+
+    manifest = collect()
+    report = manifest["native_download"]
+    assert report["status"] == "completed"
+    assert report["errors"] == []
+    assert manifest["collected_log_count"] == 2
+    assert manifest["annotation_collected_count"] == 1
+
+    job_item, lint_item = manifest["logs"]
+    assert job_item["collected"] is True
+    failed_step_log = "".join(f"tests\tpytest\t{line}\n" for line in _JOB_LOG.splitlines())
+    assert Path(job_item["log_path"]).read_text(encoding="utf-8") == failed_step_log
+    assert job_item["workflow_metadata_status"] == "confirmed"
+    assert job_item["workflow_job"]["steps"][0]["name"] == "pytest"
+    assert lint_item["evidence_source"] == "github_check_run_annotations"
+    assert "lint failed at src/app.py:7" in Path(lint_item["log_path"]).read_text(encoding="utf-8")
+    assert _FakeGitHub.hits.count("/repos/acme/project/actions/runs/123456/logs") == 2
+    assert _FakeGitHub.hits.count("/repos/acme/project/actions/jobs/789") == 1
+    assert not list((tmp_path / "check-logs").rglob("*.tmp"))
+
+    script = Path(manifest["download_script"]).read_text(encoding="utf-8")
+    assert "gh run view" not in script
+    assert "check-runs/555/annotations" not in script
+
+    again = collect()["native_download"]
+    assert again["requests"] == 0
+    assert len(again["skipped_present"]) == 2
+
+
+def test_native_download_without_repository_is_skipped(tmp_path: Path, monkeypatch) -> None:
+    from sdetkit.failed_check_log_download import collect_failed_check_evidence
+
+    monkeypatch.delenv("GITHUB_REPOSITORY", raising=False)
+    report = collect_failed_check_evidence({"logs": []}, repository="")
+    assert report["status"] == "skipped"
+    assert report["reason"] == "repository_unavailable"
+
+
+def test_run_archive_falls_back_to_every_step_without_failed_step_logs(tmp_path: Path) -> None:
+    from sdetkit.failed_check_log_download import _archive_to_text
+
+    archive = tmp_path / "run.zip"
+    archive.write_bytes(_run_archive())
+    target = tmp_path / "job.log"
+    job = {
+        "name": "tests",
+        "steps": [
+            {"name": "Set up job", "number": 1, "conclusion": "success"},
+            {"name": "pytest", "number": 3, "conclusion": "success"},
+        ],
+    }
+
+    _archive_to_text(archive, target, [job])
+
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == f"tests\tSet up job\t{_SETUP_LOG.strip()}"
+    assert len(lines) == 1 + len(_JOB_LOG.splitlines())
+    assert all(line.startswith("tests\tpytest\t") for line in lines[1:])
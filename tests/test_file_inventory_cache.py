@@ -344,3 +344,99 @@ def test_cache_validate_and_digest_variants(tmp_path: Path) -> None:
     tree_digest = cache.digest_for(repo_root, "__repo_tree__")
     assert isinstance(tree_digest, str)
     assert len(tree_digest) == 64
+
+
+def test_dependency_manifest_builds_path_index_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdetkit import repo as repo_mod
+
+    class _CountingInventory(list):
+        iterations = 0
+
+        def __iter__(self):
+            type(self).iterations += 1
+            return super().__iter__()
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    synthetic = _CountingInventory(
+        repo_mod.FileInfo(path=f"pkg/m{i:04d}.py", mtime_ns=i, size=i % 97, ctime_ns=i)
+        for i in range(500)
+    )
+    cache = repo_mod._FileInventoryCache(tmp_path / "cache")
+    calls = {"count": 0}
+
+    def _inventory(_root: Path) -> list[repo_mod.FileInfo]:
+        calls["count"] += 1
+        return synthetic
+
+    monkeypatch.setattr(cache, "get_inventory", _inventory)
+
+    ctx = repo_mod.RepoRuleExecutionContext(repo, cache)
+    for info in list.__iter__(synthetic):
+        ctx.track_file(info.path)
+    ctx.track_file("pkg/missing.py")
+    _CountingInventory.iterations = 0
+
+    manifest = ctx.dependency_manifest()
+
+    assert len(manifest) == 501
+    assert calls["count"] == 1
+    assert _CountingInventory.iterations == 1
+    assert list(cache._path_indexes) == [repo]
+    assert manifest["pkg/missing.py"] == cache.digest_for(repo, "pkg/missing.py")
+    assert _CountingInventory.iterations == 1
+
+
+@pytest.mark.benchmark
+def test_dependency_manifest_for_50k_dependencies_uses_path_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import time
+
+    from sdetkit import repo as repo_mod
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    synthetic = [
+        repo_mod.FileInfo(path=f"pkg/m{i:05d}.py", mtime_ns=i, size=i % 97, ctime_ns=i)
+        for i in range(50_000)
+    ]
+    cache = repo_mod._FileInventoryCache(tmp_path / "cache")
+    calls = {"count": 0}
+
+    def _inventory(_root: Path) -> list[repo_mod.FileInfo]:
+        calls["count"] += 1
+        return synthetic
+
+    monkeypatch.setattr(cache, "get_inventory", _inventory)
+
+    ctx = repo_mod.RepoRuleExecutionContext(repo, cache)
+    for info in synthetic:
+        ctx.track_file(info.path)
+    ctx.track_file("pkg/missing.py")
+
+    started = time.perf_counter()
+    manifest = ctx.dependency_manifest()
+    elapsed = time.perf_counter() - started
+
+    assert len(manifest) == 50_001
+    assert calls["count"] == 1
+    assert manifest["pkg/m00007.py"] == cache.digest_for(repo, "pkg/m00007.py")
+    print(f"dependency manifest for 50k files: {elapsed:.3f}s")
+    assert elapsed < 10.0
+
+
+def test_path_index_invalidated_when_inventory_reloads(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _write(repo / "a.py", "print('a')\n")
+
+    c = _FileInventoryCache(tmp_path / "cache")
+    before = c.digest_for(repo, "a.py")
+    assert c.digest_for(repo, "a.py") == before
+
+    _write(repo / "a.py", "print('changed')\n")
+    c.get_inventory(repo)
+    assert c.digest_for(repo, "a.py") != before
@@ -7,11 +7,13 @@ from typing import Any
 
 import pytest
 
+import sdetkit.isolated_proof_runner as runner
 from sdetkit.isolated_proof_runner import (
     EXECUTION_ARGV_DISPLAY,
     NETWORK_BACKEND_COMMAND_WRAPPED,
     PROOF_PROFILES,
     WORKSPACE_MUTATED_DURING_EXECUTION,
+    IsolatedWorkspacePool,
     main,
     render_markdown,
     run_isolated_proof,
@@ -687,3 +689,207 @@ def test_isolated_runner_negative_probe_cannot_authorize_execution(
             require_network_isolation=True,
             blocked_network_probe_report=build_blocked_network_probe_report(),
         )
+
+
+def _age_tree(root: Path, seconds: int = 60) -> None:
+    import os
+    import time
+
+    past = time.time_ns() - seconds * 1_000_000_000
+    for path in root.rglob("*"):
+        if path.is_file():
+            os.utime(path, ns=(past, past))
+
+
+def test_workspace_snapshot_only_rehashes_files_whose_metadata_changed(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    workspace = _repo(tmp_path)
+    _age_tree(workspace)
+
+    racy = runner._WorkspaceSnapshotter()
+    racy.snapshot(workspace)
+    racy.snapshot(workspace)
+    assert (racy.files_hashed, racy.files_reused) == (4, 0)
+
+    monkeypatch.setattr(runner, "STAT_RACY_WINDOW_NS", -60 * 1_000_000_000)
+    snapshotter = runner._WorkspaceSnapshotter()
+    before = snapshotter.snapshot(workspace)
+    assert snapshotter.snapshot(workspace) == before
+    assert (snapshotter.files_hashed, snapshotter.files_reused) == (2, 2)
+
+    (workspace / "src" / "sdetkit" / "example.py").write_text("VALUE = 2\n", encoding="utf-8")
+    after = snapshotter.snapshot(workspace)
+    assert (snapshotter.files_hashed, snapshotter.files_reused) == (3, 3)
+    assert runner._changed_paths(before, after) == ["src/sdetkit/example.py"]
+
+
+def test_workspace_pool_resets_slot_and_recopies_only_changed_files(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root = _repo(tmp_path)
+    (root / "README.md").write_text("readme\n", encoding="utf-8")
+    _age_tree(root)
+    monkeypatch.setattr(runner, "STAT_RACY_WINDOW_NS", -60 * 1_000_000_000)
+    workspaces: list[Path] = []
+
+    def fake_run(args: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        if args[0] != "git":
+            workspace = Path(kwargs["cwd"])
+            workspaces.append(workspace)
+            assert not (workspace / "build").exists()
+            (workspace / "src" / "sdetkit" / "example.py").write_text(
+                "VALUE = 2\n", encoding="utf-8"
+            )
+            (workspace / "src" / "sdetkit" / "injected.py").write_text("X = 1\n", encoding="utf-8")
+            (workspace / "build").mkdir()
+        return subprocess.CompletedProcess(args, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    pool = IsolatedWorkspacePool(tmp_path / "pool", size=1)
+
+    first = run_isolated_proof(
+        repo_root=root,
+        changed_files=["src/sdetkit/example.py"],
+        profile_ids=["pre_commit_all"],
+        workspace_pool=pool,
+    )
+    assert pool.stats() == {"acquired": 1, "files_copied": 3, "files_reused": 0}
+
+    second = run_isolated_proof(
+        repo_root=root,
+        changed_files=["src/sdetkit/example.py"],
+        profile_ids=["pre_commit_all"],
+        workspace_pool=pool,
+    )
+
+    assert workspaces[0] == workspaces[1]
+    assert pool.stats() == {"acquired": 2, "files_copied": 4, "files_reused": 2}
+    for evidence in (first, second):
+        assert evidence["isolation"]["mode"] == "pooled_workspace_copy"
+        assert evidence["proof_results"][0]["workspace_mutated_files"] == [
+            "src/sdetkit/example.py",
+            "src/sdetkit/injected.py",
+        ]
+    assert (root / "src" / "sdetkit" / "example.py").read_text(encoding="utf-8") == "VALUE = 1\n"
+    assert not (root / "src" / "sdetkit" / "injected.py").exists()
+
+
+def test_workspace_pool_keeps_single_baseline_commit(tmp_path: Path) -> None:
+    root = _repo(tmp_path)
+    pool = IsolatedWorkspacePool(tmp_path / "pool", size=1)
+
+    for value in range(3):
+        (root / "src" / "sdetkit" / "example.py").write_text(f"VALUE = {value}\n", encoding="utf-8")
+        with pool.acquire(root) as workspace:
+            history = subprocess.run(
+                ["git", "rev-list", "--count", "HEAD"],
+                cwd=workspace.path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            status = subprocess.run(
+                ["git", "status", "--porcelain"],
+                cwd=workspace.path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        assert history.stdout.strip() == "1"
+        assert status.stdout == ""
+
+
+def test_workspace_pool_baseline_reuses_unchanged_objects(tmp_path: Path) -> None:
+    root = _repo(tmp_path)
+    _age_tree(root)
+    pool = IsolatedWorkspacePool(tmp_path / "pool", size=1)
+
+    def store_objects() -> dict[str, int]:
+        objects = next((tmp_path / "pool").glob("*/slot-0/objects.git/objects"))
+        return {
+            path.relative_to(objects).as_posix(): path.stat().st_ino
+            for path in objects.glob("??/*")
+        }
+
+    with pool.acquire(root) as workspace:
+        assert not list((workspace.path / ".git" / "objects").glob("??/*"))
+    first = store_objects()
+    assert first
+
+    with pool.acquire(root):
+        pass
+    assert store_objects() == first
+
+    (root / "src" / "sdetkit" / "example.py").write_text("VALUE = 9\n", encoding="utf-8")
+    with pool.acquire(root) as workspace:
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=workspace.path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    third = store_objects()
+    assert status.stdout == ""
+    assert {name: third[name] for name in first} == first
+    # The new blob, the root, src and src/sdetkit trees, and the commit.
+    assert len(third) - len(first) == 5
+
+
+def test_workspace_pool_recreates_git_dir_poisoned_by_previous_proof(tmp_path: Path) -> None:
+    root = _repo(tmp_path)
+    pool = IsolatedWorkspacePool(tmp_path / "pool", size=1)
+    marker = tmp_path / "hook-ran"
+
+    with pool.acquire(root) as workspace:
+        git_dir = workspace.path / ".git"
+        hooks = tmp_path / "evil-hooks"
+        hooks.mkdir()
+        hook = hooks / "post-commit"
+        hook.write_text(f"#!/bin/sh\ntouch {marker}\n", encoding="utf-8")
+        hook.chmod(0o755)
+        with (git_dir / "config").open("a", encoding="utf-8") as config:
+            config.write(f"[core]\n\thooksPath = {hooks}\n\tfsmonitor = {hook}\n")
+        (git_dir / "info").mkdir(exist_ok=True)
+        (git_dir / "info" / "exclude").write_text("example.py\n", encoding="utf-8")
+
+    with pool.acquire(root) as workspace:
+        config = (workspace.path / ".git" / "config").read_text(encoding="utf-8")
+        tracked = subprocess.run(
+            ["git", "ls-files"],
+            cwd=workspace.path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    assert not marker.exists()
+    assert "hooksPath" not in config
+    assert "src/sdetkit/example.py" in tracked.stdout.splitlines()
+
+
+def test_workspace_pool_rejects_malformed_state_and_unlockable_slots(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    state = tmp_path / "state.json"
+    state.write_text(
+        json.dumps(
+            {
+                "schema": runner._WORKSPACE_STATE_SCHEMA,
+                "source_root": str(tmp_path),
+                "synced": {"a.py": [[1, 2, 3, "4"], [1, 2, 3, 4]]},
+                "hashes": {},
+            }
+        ),
+        encoding="utf-8",
+    )
+    assert IsolatedWorkspacePool._load_state(state, tmp_path) == ({}, {})
+
+    monkeypatch.setattr(IsolatedWorkspacePool, "_try_lock", staticmethod(lambda fd, **_: False))
+    pool = IsolatedWorkspacePool(tmp_path / "pool", size=2)
+    with pytest.raises(RuntimeError, match="could not lock"):
+        with pool.acquire(tmp_path):
+            pass
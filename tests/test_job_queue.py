@@ -12,6 +12,7 @@ from sdetkit.job_queue import (
     FAILED,
     PENDING,
     SCHEMA_VERSION,
+    JournaledJobQueue,
     claim_job,
     complete_job,
     enqueue_job,
@@ -257,3 +258,171 @@ def test_queue_never_executes_diagnostic_worker(
     )
 
     assert load_queue(path)["jobs"][0]["state"] == COMPLETED
+
+
+def test_journaled_queue_appends_and_compacts_to_deterministic_snapshot(tmp_path: Path) -> None:
+    journaled_path = tmp_path / "journaled" / "queue.json"
+    snapshot_path = tmp_path / "snapshot" / "queue.json"
+    jobs = [
+        _job(head_sha="head-b", created_at="2026-06-14T00:00:02Z"),
+        _job(head_sha="head-a", created_at="2026-06-14T00:00:01Z"),
+    ]
+
+    queue = JournaledJobQueue(journaled_path)
+    for job in jobs:
+        queue.enqueue(job)
+        enqueue_job(snapshot_path, job)
+    claimed = queue.claim(claimed_at="2026-06-14T00:01:00Z")
+    queue.complete(
+        claimed["job_id"],
+        result_artifacts={"diagnostic": "build/diagnostic.json"},
+        completed_at="2026-06-14T00:02:00Z",
+    )
+    expected = claim_job(snapshot_path, claimed_at="2026-06-14T00:01:00Z")
+    complete_job(
+        snapshot_path,
+        expected["job_id"],
+        result_artifacts={"diagnostic": "build/diagnostic.json"},
+        completed_at="2026-06-14T00:02:00Z",
+    )
+
+    journal = journaled_path.with_name("queue.json.journal")
+    assert not journaled_path.exists()
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 4
+    assert claimed["job_id"] == expected["job_id"]
+    assert load_queue(journaled_path) == load_queue(snapshot_path)
+
+    queue.compact()
+    assert not journal.exists()
+    assert journaled_path.read_bytes() == snapshot_path.read_bytes()
+
+    assert queue.compact() == load_queue(journaled_path)
+    assert not JournaledJobQueue(tmp_path / "missing" / "queue.json").compact()["jobs"]
+    assert not (tmp_path / "missing" / "queue.json").exists()
+
+    reopened = JournaledJobQueue(journaled_path)
+    assert reopened.claim(claimed_at="2026-06-14T00:03:00Z")["job_id"] != claimed["job_id"]
+    with pytest.raises(ValueError, match="no pending jobs"):
+        reopened.claim(claimed_at="2026-06-14T00:04:00Z")
+
+
+def test_journaled_queue_failed_append_leaves_view_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import sdetkit.job_queue as job_queue
+
+    path = tmp_path / "queue.json"
+    queue = JournaledJobQueue(path)
+    first = queue.enqueue(_job(head_sha="head-a", created_at="2026-06-14T00:00:00Z"))
+
+    def disk_full(journal: Path, op: object) -> None:
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(job_queue, "_append_journal", disk_full)
+    with pytest.raises(OSError, match="No space left"):
+        queue.claim(claimed_at="2026-06-14T00:01:00Z")
+    with pytest.raises(OSError, match="No space left"):
+        queue.enqueue(_job(head_sha="head-b", created_at="2026-06-14T00:00:01Z"))
+    monkeypatch.undo()
+
+    assert [job["state"] for job in load_queue(path)["jobs"]] == [PENDING]
+    claimed = queue.claim(claimed_at="2026-06-14T00:02:00Z")
+    assert claimed["job_id"] == first["job_id"]
+    assert claimed["claimed_at"] == "2026-06-14T00:02:00Z"
+    assert JournaledJobQueue(path).compact()["jobs"] == [claimed]
+
+
+def test_journaled_queue_instances_never_double_claim(tmp_path: Path) -> None:
+    import threading
+
+    path = tmp_path / "queue.json"
+    seed = JournaledJobQueue(path)
+    for index in range(40):
+        seed.enqueue(_job(head_sha=f"head{index:03d}", created_at="2026-06-14T00:00:00Z"))
+
+    claimed: list[str] = []
+    claimed_lock = threading.Lock()
+
+    def worker() -> None:
+        queue = JournaledJobQueue(path)
+        while True:
+            try:
+                record = queue.claim(claimed_at="2026-06-14T00:01:00Z")
+            except ValueError:
+                return
+            with claimed_lock:
+                claimed.append(record["job_id"])
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(claimed) == 40
+    assert len(set(claimed)) == 40
+    assert {job["state"] for job in load_queue(path)["jobs"]} == {CLAIMED}
+
+    fail_job(path, claimed[0], reason="boom", failed_at="2026-06-14T00:02:00Z")
+    assert not path.with_name("queue.json.journal").exists()
+    with pytest.raises(ValueError, match="only complete from claimed state"):
+        complete_job(
+            path,
+            claimed[0],
+            result_artifacts={"diagnostic": "build/diagnostic.json"},
+            completed_at="2026-06-14T00:02:00Z",
+        )
+
+
+def test_queue_survives_crash_around_snapshot_replace(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdetkit import job_queue
+
+    path = tmp_path / "queue.json"
+    journal = path.with_name("queue.json.journal")
+    queue = JournaledJobQueue(path)
+    for index in range(3):
+        queue.enqueue(_job(head_sha=f"head{index}", created_at="2026-06-14T00:00:00Z"))
+    claimed = queue.claim(claimed_at="2026-06-14T00:01:00Z")
+
+    real_unlink = Path.unlink
+
+    def crash_before_journal_unlink(self: Path, missing_ok: bool = False) -> None:
+        if self == journal:
+            raise KeyboardInterrupt("crash after snapshot replace")
+        real_unlink(self, missing_ok=missing_ok)
+
+    with monkeypatch.context() as patched:
+        patched.setattr(Path, "unlink", crash_before_journal_unlink)
+        with pytest.raises(KeyboardInterrupt):
+            queue.compact()
+    assert path.exists() and journal.exists()
+
+    states = {job["job_id"]: job["state"] for job in load_queue(path)["jobs"]}
+    assert states[claimed["job_id"]] == CLAIMED
+    assert sorted(states.values()) == [CLAIMED, PENDING, PENDING]
+
+    reopened = JournaledJobQueue(path)
+    second = reopened.claim(claimed_at="2026-06-14T00:02:00Z")
+    assert second["job_id"] != claimed["job_id"]
+
+    def crash_on_replace(source: object, target: object) -> None:
+        raise KeyboardInterrupt("crash before snapshot replace")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(job_queue.os, "replace", crash_on_replace)
+        with pytest.raises(KeyboardInterrupt):
+            fail_job(path, second["job_id"], reason="boom", failed_at="2026-06-14T00:03:00Z")
+
+    states = {job["job_id"]: job["state"] for job in load_queue(path)["jobs"]}
+    assert sorted(states.values()) == [CLAIMED, CLAIMED, PENDING]
+    complete_job(
+        path,
+        claimed["job_id"],
+        result_artifacts={"diagnostic": "build/diagnostic.json"},
+        completed_at="2026-06-14T00:04:00Z",
+    )
+    assert not journal.exists()
+    states = {job["job_id"]: job["state"] for job in load_queue(path)["jobs"]}
+    assert sorted(states.values()) == [CLAIMED, COMPLETED, PENDING]
@@ -46,3 +46,31 @@ async def test_async_paginated_list_detects_cycle_back_to_origin_without_extra_f
             await c.get_json_list_paginated("https://example.test/p")
 
     assert calls["n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_paginated_list_prefetches_pages_with_bounded_concurrency() -> None:
+    import asyncio
+
+    state = {"in_flight": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01 * (page % 3))
+        state["in_flight"] -= 1
+        headers = {}
+        if page < 9:
+            headers["Link"] = (
+                f'<https://example.test/p?page={page + 1}>; rel="next", '
+                '<https://example.test/p?page=9>; rel="last"'
+            )
+        return httpx.Response(200, json=[page], headers=headers, request=request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+        c = netclient.SdetAsyncHttpClient(raw)
+        out = await c.get_json_list_paginated("https://example.test/p?page=1", page_concurrency=3)
+
+    assert out == list(range(1, 10))
+    assert 1 < state["peak"] <= 3
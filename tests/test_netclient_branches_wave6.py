@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 
 import httpx
@@ -243,3 +244,24 @@ def test_get_json_any_rejects_scalar_json() -> None:
         c = SdetHttpClient(client)
         with pytest.raises(ValueError, match="expected json object or array"):
             c.get_json_any("https://example.test/a")
+
+
+def _unknown_step_attempts():
+    yield "emitt", None
+    return None, None
+
+
+def test_drive_rejects_unknown_attempt_step() -> None:
+    client = SdetHttpClient(httpx.Client())
+    with pytest.raises(RuntimeError, match="unknown attempt step: 'emitt'"):
+        client._drive(_unknown_step_attempts(), lambda: None, None)
+
+
+def test_async_drive_rejects_unknown_attempt_step() -> None:
+    async def run() -> None:
+        async with httpx.AsyncClient() as raw:
+            client = netclient.SdetAsyncHttpClient(raw)
+            await client._drive(_unknown_step_attempts(), None, None)
+
+    with pytest.raises(RuntimeError, match="unknown attempt step: 'emitt'"):
+        asyncio.run(run())
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sdetkit import apiget, netclient
+from sdetkit.netclient_metrics import NetclientMetrics, route_template
+
+
+def test_route_template_elides_ids_and_prefers_explicit_templates() -> None:
+    assert route_template("https://h/repos/1234/commits/0a1b2c3d4e") == "/repos/{id}/commits/{sha}"
+    assert (
+        route_template("https://h/jobs/123e4567-e89b-12d3-a456-426614174000/logs?x=1")
+        == "/jobs/{uuid}/logs"
+    )
+    assert route_template("https://h/repos/acme/project") == "/repos/acme/project"
+
+    metrics = NetclientMetrics(templates=["/repos/{owner}/{repo}"])
+    metrics(netclient.ClientEvent(type="complete", url="https://h/repos/a/b", attempt=0, retries=1))
+    assert metrics.snapshot()["routes"][0]["route"] == "/repos/{owner}/{repo}"
+
+
+def test_sync_client_metrics_count_retries_bytes_and_latency() -> None:
+    now = {"t": 0.0}
+    calls = {"n": 0}
+    latency = iter([0.1, 0.2, 0.02, 0.04])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        now["t"] += next(latency)
+        if calls["n"] == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, request=request)
+        return httpx.Response(200, json={"id": calls["n"]}, request=request)
+
+    metrics = NetclientMetrics()
+    pol = netclient.RetryPolicy(retries=2, retry_on_429=True)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        c = netclient.SdetHttpClient(
+            raw, retry=pol, hook=metrics, clock=lambda: now["t"], sleep=lambda d: None
+        )
+        c.get_json_dict("https://api.test/items/1")
+        c.get_json_dict("https://api.test/items/2")
+        c.get_json_dict("https://api.test/items/3")
+
+    snap = metrics.snapshot()
+    (route,) = snap["routes"]
+    assert route["host"] == "api.test"
+    assert route["route"] == "/items/{id}"
+    assert route["requests"] == 3
+    assert route["retries"] == 1
+    assert route["status"] == {"200": 3, "429": 1}
+    assert route["response_bytes"] == 3 * len(b'{"id":2}')
+    assert route["latency_seconds"]["count"] == 3
+    assert route["latency_seconds"]["max"] == pytest.approx(0.3)
+    assert 0.025 < route["latency_seconds"]["p50"] <= 0.05
+    assert route["latency_seconds"]["p99"] <= 0.3
+    assert snap["hosts"][0]["requests"] == 3
+
+
+@pytest.mark.asyncio
+async def test_async_client_counts_breaker_rejections() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, json={}, request=request)
+
+    metrics = NetclientMetrics()
+    breaker = netclient.CircuitBreaker(failure_threshold=1, reset_seconds=60.0)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+        c = netclient.SdetAsyncHttpClient(raw, breaker=breaker, hook=metrics)
+        with pytest.raises(RuntimeError):
+            await c.get_json_dict("https://api.test/x")
+        with pytest.raises(netclient.CircuitOpenError):
+            await c.get_json_dict("https://api.test/x")
+
+    (route,) = metrics.snapshot()["routes"]
+    assert route["breaker_open"] == 1
+    assert route["errors"] == 1
+
+
+def test_prometheus_export_is_cumulative_and_escapes_labels() -> None:
+    metrics = NetclientMetrics()
+    for elapsed in (0.004, 0.2, 7.0):
+        metrics(
+            netclient.ClientEvent(
+                type="complete",
+                url='https://h/a"b',
+                attempt=0,
+                retries=1,
+                ok=True,
+                elapsed_seconds=elapsed,
+            )
+        )
+    text = metrics.to_prometheus()
+    assert "# TYPE sdetkit_http_request_duration_seconds histogram" in text
+    bucket = "sdetkit_http_request_duration_seconds_bucket"
+    assert f'{bucket}{{host="h",route="/a\\"b",le="0.005"}} 1' in text
+    assert 'le="0.25"} 2' in text
+    assert 'le="+Inf"} 3' in text
+    assert 'sdetkit_http_requests_total{host="h",route="/a\\"b"} 3' in text
+
+
+def test_apiget_metrics_out_writes_json_summary(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True}, request=request)
+
+    real_client = httpx.Client
+
+    def client_factory(*args: object, **kwargs: object) -> httpx.Client:
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return real_client(*args, **kwargs)
+
+    monkeypatch.setattr(apiget.httpx, "Client", client_factory)
+    monkeypatch.chdir(tmp_path)
+    rc = apiget.main(["https://api.test/users/42", "--expect", "dict", "--metrics-out", "m.json"])
+    assert rc == 0
+
+    data = json.loads((tmp_path / "m.json").read_text(encoding="utf-8"))
+    assert data["schema_version"] == "sdetkit.netclient.metrics.v1"
+    assert data["routes"][0]["route"] == "/users/{id}"
+    assert data["routes"][0]["requests"] == 1
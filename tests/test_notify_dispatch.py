@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import http.server
+import json
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from sdetkit import cli, notify_dispatch
+from sdetkit.notify_dispatch import (
+    NotifyDispatcher,
+    NotifySpool,
+    coalesce,
+    flush_spool,
+    telegram_sender,
+)
+
+
+class _FakeTelegram(http.server.BaseHTTPRequestHandler):
+    lock = threading.Lock()
+    received: list[tuple[str, str]] = []
+    fail_chats: set[str] = set()
+    throttle_once: set[str] = set()
+    active = 0
+    peak = 0
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", "0"))
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        chat_id, text = form["chat_id"][0], form["text"][0]
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.active -= 1
+            if chat_id in cls.throttle_once:
+                cls.throttle_once.discard(chat_id)
+                status, payload = 429, {"ok": False, "parameters": {"retry_after": 0}}
+            elif chat_id in cls.fail_chats:
+                status, payload = 400, {"ok": False, "description": "Bad Request: chat not found"}
+            else:
+                cls.received.append((chat_id, text))
+                status, payload = 200, {"ok": True, "result": {"message_id": 1}}
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+@pytest.fixture()
+def telegram_url() -> Iterator[str]:
+    _FakeTelegram.received = []
+    _FakeTelegram.fail_chats = set()
+    _FakeTelegram.throttle_once = set()
+    _FakeTelegram.active = 0
+    _FakeTelegram.peak = 0
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _FakeTelegram)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+async def _no_sleep(delay: float) -> None:
+    return None
+
+
+def test_coalesce_packs_lines_and_splits_oversized_messages() -> None:
+    assert coalesce(["a", "b", "c"], 10) == ["a\nb\nc"]
+    assert coalesce(["aaaa", "bbbb", "cc"], 9) == ["aaaa\nbbbb", "cc"]
+    assert coalesce(["x" * 12], 5) == ["xxxxx", "xxxxx", "xx"]
+
+
+def test_burst_is_coalesced_per_channel_with_bounded_concurrency(telegram_url: str) -> None:
+    async def run() -> dict[str, object]:
+        async with httpx.AsyncClient() as client:
+            sender = telegram_sender("t", client=client, api_url=telegram_url)
+            async with NotifyDispatcher(
+                {"telegram": sender}, window_seconds=0.05, concurrency=2, sleep=_no_sleep
+            ) as dispatcher:
+                for repo in range(20):
+                    for chat in ("1", "2", "3", "4"):
+                        await dispatcher.submit(f"telegram:{chat}", f"repo-{repo} gate failed")
+            return dispatcher.report()
+
+    report = asyncio.run(run())
+
+    assert report == {"submitted": 80, "sends": 4, "delivered": 4, "failed": 0, "spooled": 0}
+    assert sorted(chat for chat, _text in _FakeTelegram.received) == ["1", "2", "3", "4"]
+    assert all(text.count("\n") == 19 for _chat, text in _FakeTelegram.received)
+    assert _FakeTelegram.peak <= 2
+
+
+def test_failed_sends_are_spooled_and_flushed_later(telegram_url: str, tmp_path: Path) -> None:
+    _FakeTelegram.fail_chats = {"9"}
+    _FakeTelegram.throttle_once = {"1"}
+    spool = NotifySpool(tmp_path / "spool")
+
+    async def send_burst() -> dict[str, object]:
+        async with httpx.AsyncClient() as client:
+            sender = telegram_sender("t", client=client, api_url=telegram_url)
+            async with NotifyDispatcher(
+                {"telegram": sender}, window_seconds=0.0, retries=2, spool=spool, sleep=_no_sleep
+            ) as dispatcher:
+                await dispatcher.submit("telegram:1", "throttled then delivered")
+                await dispatcher.submit("telegram:9", "undeliverable for now")
+            return dispatcher.report()
+
+    report = asyncio.run(send_burst())
+    assert report["delivered"] == 1
+    assert report["spooled"] == 1
+    (line,) = spool.path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(line)["error"] == "RuntimeError: Bad Request: chat not found"
+
+    _FakeTelegram.fail_chats = set()
+    spool.append([notify_dispatch.SpooledMessage("pager:1", "no sender", 1, "", 0.0)])
+
+    async def flush() -> dict[str, object]:
+        async with httpx.AsyncClient() as client:
+            sender = telegram_sender("t", client=client, api_url=telegram_url)
+            return await flush_spool(spool, {"telegram": sender}, sleep=_no_sleep)
+
+    flushed = asyncio.run(flush())
+    assert flushed["drained"] == 2
+    assert flushed["delivered"] == 1
+    assert flushed["orphaned"] == 1
+    assert ("9", "undeliverable for now") in _FakeTelegram.received
+    assert [m.channel for m in spool.drain()] == ["pager:1"]
+
+
+def test_interrupted_flush_keeps_claimed_messages_for_the_next_one(tmp_path: Path) -> None:
+    import subprocess
+    import sys
+
+    spool = NotifySpool(tmp_path / "spool")
+    spool.append(
+        [notify_dispatch.SpooledMessage(f"chat:{i}", "hello", 1, "", 0.0) for i in range(2)]
+    )
+    sent: list[str] = []
+
+    async def recording_sender(channel: str, text: str) -> None:
+        sent.append(channel)
+
+    async def interrupted_flush() -> None:
+        with spool.claim() as records:
+            assert len(records) == 2
+            await recording_sender(records[0].channel, records[0].text)
+            raise KeyboardInterrupt("killed mid-flush")
+
+    with pytest.raises(KeyboardInterrupt):
+        asyncio.run(interrupted_flush())
+    assert not spool.path.exists()
+
+    killed = (
+        "import os, sys; from pathlib import Path; "
+        "from sdetkit.notify_dispatch import NotifySpool; "
+        "spool = NotifySpool(Path(sys.argv[1])); "
+        "claim = spool.claim(); records = claim.__enter__(); "
+        "print(len(records), flush=True); os._exit(1)"
+    )
+    spool.append([notify_dispatch.SpooledMessage("chat:2", "later", 1, "", 0.0)])
+    crashed = subprocess.run(
+        [sys.executable, "-c", killed, str(spool.directory)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert crashed.stdout.strip() == "3"
+
+    report = asyncio.run(flush_spool(spool, {"chat": recording_sender}, sleep=_no_sleep))
+    assert report["drained"] == 3
+    assert report["delivered"] == 3
+    assert sorted(spool.directory.iterdir()) == []
+    assert sorted(sent) == ["chat:0", "chat:0", "chat:1", "chat:2"]
+
+
+def test_notify_cli_spools_failed_send_and_flushes_it(
+    telegram_url: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys
+) -> None:
+    monkeypatch.setenv("SDETKIT_TELEGRAM_TOKEN", "t")
+    monkeypatch.setenv("SDETKIT_TELEGRAM_CHAT_ID", "5")
+    monkeypatch.setattr(notify_dispatch, "TELEGRAM_API_URL", telegram_url)
+    messages = tmp_path / "messages.txt"
+    messages.write_text("repo-a failed\n\nrepo-b failed\n", encoding="utf-8")
+    spool_dir = str(tmp_path / "spool")
+
+    _FakeTelegram.fail_chats = {"5"}
+    rc = cli.main(
+        ["notify", "telegram", "--real-send", "--messages-file", str(messages)]
+        + ["--spool", spool_dir]
+    )
+    assert rc == 2
+    assert json.loads(capsys.readouterr().out)["spooled"] == 1
+
+    _FakeTelegram.fail_chats = set()
+    rc = cli.main(["notify", "telegram", "--real-send", "--flush-spool", "--spool", spool_dir])
+    assert rc == 0
+    assert json.loads(capsys.readouterr().out)["delivered"] == 1
+    assert _FakeTelegram.received == [("5", "repo-a failed\nrepo-b failed")]
+
+    rc = cli.main(["notify", "stdout", "--flush-spool", "--spool", spool_dir])
+    assert rc == 2
+    assert "does not support batched delivery" in capsys.readouterr().out
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import gzip
+import http.server
+import json
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from sdetkit import upgrade_audit
+from sdetkit.pypi_metadata import PyPIMetadataClient, version_from_filename
+
+_SIMPLE = {
+    "meta": {"api-version": "1.1"},
+    "name": "demo-pkg",
+    "versions": ["1.0.0", "2.0.0", "2.1.0rc1", "3.0.0"],
+    "files": [
+        {
+            "filename": "demo_pkg-1.0.0-py3-none-any.whl",
+            "requires-python": ">=3.8",
+            "upload-time": "2025-01-01T00:00:00Z",
+            "yanked": False,
+        },
+        {
+            "filename": "demo-pkg-2.0.0.tar.gz",
+            "requires-python": ">=3.9",
+            "upload-time": "2025-06-01T00:00:00Z",
+            "yanked": False,
+        },
+        {
+            "filename": "demo_pkg-2.1.0rc1-py3-none-any.whl",
+            "requires-python": ">=3.9",
+            "upload-time": "2025-07-01T00:00:00Z",
+        },
+        {
+            "filename": "demo_pkg-3.0.0-py3-none-any.whl",
+            "requires-python": ">=3.9",
+            "upload-time": "2025-08-01T00:00:00Z",
+            "yanked": "broken build",
+        },
+    ],
+}
+
+
+class _Index(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen: list[tuple[str, str | None, int]] = []
+    html_only = False
+
+    def do_GET(self) -> None:
+        self.seen.append((self.path, self.headers.get("If-None-Match"), self.client_address[1]))
+        if self.path == "/simple/demo-pkg/" and self.html_only:
+            self._send(200, b"<html></html>", {"Content-Type": "text/html"})
+        elif self.path == "/simple/demo-pkg/":
+            if self.headers.get("If-None-Match") == '"s1"':
+                self._send(304, b"", {"ETag": '"s1"'})
+                return
+            body = gzip.compress(json.dumps(_SIMPLE).encode("utf-8"))
+            self._send(
+                200,
+                body,
+                {
+                    "Content-Type": "application/vnd.pypi.simple.v1+json",
+                    "Content-Encoding": "gzip",
+                    "ETag": '"s1"',
+                },
+            )
+        elif self.path == "/pypi/demo-pkg/json":
+            if self.headers.get("If-None-Match") == '"j1"':
+                self._send(304, b"", {"ETag": '"j1"'})
+                return
+            payload = {
+                "info": {"version": "2.0.0"},
+                "releases": {"2.0.0": [{"upload_time_iso_8601": "2025-06-01T00:00:00Z"}]},
+            }
+            body = json.dumps(payload).encode("utf-8")
+            self._send(200, body, {"Content-Type": "application/json", "ETag": '"j1"'})
+        else:
+            self._send(404, b"", {})
+
+    def _send(self, status: int, body: bytes, headers: dict[str, str]) -> None:
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+@pytest.fixture()
+def index_url() -> Iterator[str]:
+    _Index.seen = []
+    _Index.html_only = False
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Index)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _collect(index_url: str, cache_path: Path) -> upgrade_audit.PackageMetadata:
+    return upgrade_audit._collect_package_metadata(
+        ["demo-pkg"],
+        timeout_s=5.0,
+        cache_path=cache_path,
+        cache_ttl_hours=0,
+        offline=False,
+        max_workers=1,
+        project_python_requires=">=3.10",
+        include_prereleases=False,
+        index_url=index_url,
+    )["demo-pkg"]
+
+
+def test_simple_index_metadata_is_revalidated_with_etag(index_url: str, tmp_path: Path) -> None:
+    cache_path = tmp_path / "upgrade-audit-cache.json"
+
+    first = _collect(index_url, cache_path)
+    assert first.latest_version == "2.0.0"
+    assert first.release_date == "2025-06-01T00:00:00Z"
+    assert first.compatible_version == "2.0.0"
+    assert first.compatibility_status == "compatible-latest"
+    entry = json.loads(cache_path.read_text(encoding="utf-8"))["packages"]["demo-pkg"]
+    assert entry["etag"] == '"s1"'
+
+    second = _collect(index_url, cache_path)
+    assert second == first
+    assert [(path, inm) for path, inm, _port in _Index.seen] == [
+        ("/simple/demo-pkg/", None),
+        ("/simple/demo-pkg/", '"s1"'),
+    ]
+
+
+def test_legacy_json_etag_is_revalidated_against_the_json_api(
+    index_url: str, tmp_path: Path
+) -> None:
+    _Index.html_only = True
+    cache_path = tmp_path / "upgrade-audit-cache.json"
+
+    first = _collect(index_url, cache_path)
+    assert first.latest_version == "2.0.0"
+    entry = json.loads(cache_path.read_text(encoding="utf-8"))["packages"]["demo-pkg"]
+    assert (entry["etag"], entry["etag_api"]) == ('"j1"', "json")
+
+    second = _collect(index_url, cache_path)
+    assert second == first
+    assert [(path, inm) for path, inm, _port in _Index.seen] == [
+        ("/simple/demo-pkg/", None),
+        ("/pypi/demo-pkg/json", None),
+        ("/pypi/demo-pkg/json", '"j1"'),
+    ]
+
+
+def test_client_reuses_connection_and_falls_back_to_json_api(index_url: str) -> None:
+    client = PyPIMetadataClient(index_url)
+    try:
+        doc = client.fetch("demo-pkg", timeout_s=5.0)
+        assert doc is not None and doc.api == "simple"
+        assert client.fetch("demo-pkg", timeout_s=5.0, etag='"s1"') is None
+
+        _Index.html_only = True
+        doc = client.fetch("Demo_Pkg", timeout_s=5.0)
+        assert doc is not None and doc.api == "json"
+        assert doc.payload["info"]["version"] == "2.0.0"
+    finally:
+        client.close()
+
+    assert len({port for _path, _inm, port in _Index.seen}) == 1
+    assert client.requests == 4
+
+
+def test_missing_project_surfaces_as_http_error(index_url: str, tmp_path: Path) -> None:
+    metadata = upgrade_audit._collect_package_metadata(
+        ["nope"],
+        timeout_s=5.0,
+        cache_path=tmp_path / "cache.json",
+        cache_ttl_hours=24,
+        offline=False,
+        max_workers=1,
+        project_python_requires=None,
+        include_prereleases=False,
+        index_url=index_url,
+    )
+    assert metadata["nope"].latest_version == "http-404"
+
+
+def test_version_from_filename() -> None:
+    assert version_from_filename("boto3-1.34.0-py3-none-any.whl") == "1.34.0"
+    assert version_from_filename("python-dateutil-2.8.2.tar.gz") == "2.8.2"
+    assert version_from_filename("pkg-1.0.zip") == "1.0"
+    assert version_from_filename("pkg-1.0.win32.exe") is None
@@ -24,8 +24,8 @@ def test_quality_truth_baseline_matches_current_repository_configuration() -> No
 
     assert payload["ok"] is True, payload["mismatches"]
     assert all(payload["checks"].values())
-    assert payload["observed"]["source_module_count"] == 538
-    assert payload["observed"]["typing_debt_module_count"] == 489
+    assert payload["observed"]["source_module_count"] == 545
+    assert payload["observed"]["typing_debt_module_count"] == 496
     checked = payload["observed"]["explicitly_type_checked_modules"]
     assert len(checked) == 49
     assert "sdetkit._formatter_policy_proposal_observation_records" in checked
@@ -59,8 +59,8 @@ def test_quality_truth_baseline_matches_current_repository_configuration() -> No
     assert "sdetkit.workflow_permission_review_worklist" in checked
     assert "sdetkit.workspace_failure_ownership" in checked
     inventory = payload["typing_debt_inventory"]
-    assert inventory["module_count"] == 489
-    assert len(inventory["modules"]) == 489
+    assert inventory["module_count"] == 496
+    assert len(inventory["modules"]) == 496
     assert "sdetkit.remediation_research_contract" in inventory["modules"]
     assert "sdetkit._formatter_policy_proposal_observation_records" not in inventory["modules"]
     assert "sdetkit._formatter_policy_proposal_observation_schema" not in inventory["modules"]
@@ -109,7 +109,7 @@ def test_quality_truth_baseline_reports_machine_readable_mismatches(tmp_path: Pa
             "check": "source_module_count_matches",
             "metric": "source_module_count",
             "expected": 0,
-            "actual": 538,
+            "actual": 545,
         }
     ]
 
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sdetkit import netclient
+from sdetkit.rate_limit import RateLimiter
+
+
+class _Clock:
+    def __init__(self, now: float = 2_000_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_reserves_increasing_waits_and_refills() -> None:
+    clock = _Clock()
+    lim = RateLimiter(2.0, burst=2, clock=clock)
+    assert [lim.acquire() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    clock.now += 2.0
+    assert lim.acquire() == 0.0
+
+
+def test_headers_spread_remaining_quota_and_block_until_reset() -> None:
+    clock = _Clock()
+    lim = RateLimiter(clock=clock)
+    assert lim.acquire() == 0.0
+
+    lim.observe(
+        httpx.Headers({"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": str(clock.now + 20)})
+    )
+    assert lim.acquire() == 0.0
+    assert lim.acquire() == pytest.approx(2.0)
+
+    lim.observe(httpx.Headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}))
+    assert lim.acquire() == pytest.approx(30.0)
+    assert lim.acquire() == pytest.approx(32.0)
+
+
+def test_waiters_are_spaced_out_after_a_header_block_ends() -> None:
+    clock = _Clock()
+    lim = RateLimiter(clock=clock)
+    lim.observe(
+        httpx.Headers(
+            {
+                "X-RateLimit-Limit": "20",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": "10",
+            }
+        )
+    )
+    assert [lim.acquire() for _ in range(4)] == pytest.approx([10.0, 10.5, 11.0, 11.5])
+
+    clock.now += 30.0
+    assert lim.acquire() == 0.0
+
+    unknown = RateLimiter(clock=clock)
+    unknown.observe(httpx.Headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "5"}))
+    assert [unknown.acquire() for _ in range(2)] == pytest.approx([5.0, 5.0])
+
+
+def test_file_state_is_shared_between_limiters(tmp_path: Path) -> None:
+    clock = _Clock()
+    state = tmp_path / "limits.sqlite3"
+    a = RateLimiter(1.0, state_path=state, clock=clock)
+    b = RateLimiter(1.0, state_path=state, clock=clock)
+    other = RateLimiter(1.0, state_path=state, name="other", clock=clock)
+    try:
+        assert a.acquire() == 0.0
+        assert b.acquire() == pytest.approx(1.0)
+        assert a.acquire() == pytest.approx(2.0)
+        assert other.acquire() == 0.0
+    finally:
+        for lim in (a, b, other):
+            lim.close()
+
+
+def test_limiter_is_thread_safe() -> None:
+    lim = RateLimiter(10.0, clock=_Clock())
+    waits: list[float] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        for _ in range(25):
+            d = lim.acquire()
+            with lock:
+                waits.append(d)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(waits) == pytest.approx([i / 10 for i in range(100)])
+
+
+def test_sync_client_emits_sleep_events_for_limiter_waits() -> None:
+    clock = _Clock()
+    lim = RateLimiter(1.0, clock=clock)
+    slept: list[float] = []
+    events: list[netclient.ClientEvent] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True}, request=request)
+
+    def sleep(d: float) -> None:
+        slept.append(d)
+        clock.now += d
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        c = netclient.SdetHttpClient(raw, rate_limiter=lim, sleep=sleep, hook=events.append)
+        for _ in range(3):
+            assert c.get_json_dict("https://example.test/a") == {"ok": True}
+
+    assert slept == [1.0, 1.0]
+    assert [e.sleep_seconds for e in events if e.type == "sleep"] == [1.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_limiter_and_observes_headers() -> None:
+    clock = _Clock()
+    lim = RateLimiter(clock=clock)
+    slept: list[float] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json=[1],
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(clock.now + 5)},
+            request=request,
+        )
+
+    async def sleep(d: float) -> None:
+        slept.append(d)
+        clock.now += d
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+        c = netclient.SdetAsyncHttpClient(raw, rate_limiter=lim, sleep=sleep)
+        assert await c.get_json_list("https://example.test/l") == [1]
+        assert await c.get_json_list("https://example.test/l") == [1]
+
+    assert slept == [pytest.approx(5.0)]
+
+
+@pytest.mark.asyncio
+async def test_async_client_acquires_limiter_off_the_event_loop() -> None:
+    loop_thread = threading.get_ident()
+    acquired_on: list[int] = []
+
+    class _Recording(RateLimiter):
+        def acquire(self) -> float:
+            acquired_on.append(threading.get_ident())
+            return super().acquire()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[1], request=request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+        c = netclient.SdetAsyncHttpClient(raw, rate_limiter=_Recording())
+        assert await c.get_json_list("https://example.test/l") == [1]
+
+    assert len(acquired_on) == 1
+    assert acquired_on[0] != loop_thread
+
+
+def test_apiget_rejects_non_positive_rate_limit(capsys: pytest.CaptureFixture[str]) -> None:
+    from sdetkit import apiget
+
+    with pytest.raises(SystemExit) as exc:
+        apiget.main(["https://example.test/a", "--rate-limit", "0"])
+    assert exc.value.code == 2
+    assert "rate-limit must be > 0" in capsys.readouterr().err
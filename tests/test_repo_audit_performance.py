@@ -200,3 +200,102 @@ def test_deps_cache_survives_tracked_change_that_is_not_a_dependency(tmp_path: P
     assert rc4 in {0, 1}
     assert tree["summary"]["cache"]["misses"]
     assert not tree["summary"]["cache"]["hits"]
+
+
+def test_tree_signature_computed_once_per_run(tmp_path: Path, monkeypatch) -> None:
+    from sdetkit import repo as repo_mod
+
+    _seed_repo(tmp_path)
+    calls = {"count": 0}
+    original = repo_mod._repo_audit_tree_sig
+
+    def _counting(repo_root: Path, ignore_dir: Path | None = None) -> str:
+        calls["count"] += 1
+        return original(repo_root, ignore_dir)
+
+    monkeypatch.setattr(repo_mod, "_repo_audit_tree_sig", _counting)
+
+    payload = repo_mod.run_repo_audit(tmp_path, cache_stats=True, jobs=4)
+    assert payload["summary"]["checks"] > 1
+    assert calls["count"] == 1
+    stats = payload["summary"]["cache"]["tree_signature"]
+    assert stats["computed"] == 1
+    assert stats["reused"] >= payload["summary"]["checks"] - 1
+
+
+def test_rules_share_single_file_walk_and_content_cache(tmp_path: Path, monkeypatch) -> None:
+    from sdetkit import repo as repo_mod
+
+    _seed_repo(tmp_path)
+    wf = tmp_path / ".github" / "workflows"
+    wf.mkdir(parents=True)
+    (wf / "ci.yml").write_text("on: push\njobs: {}\n", encoding="utf-8")
+    (tmp_path / "pyproject.toml").write_text("[project]\nname='x'\n", encoding="utf-8")
+
+    walks = {"count": 0}
+    original_walk = repo_mod._RepoFileIndex._walk
+
+    def _counting_walk(self):
+        walks["count"] += 1
+        return original_walk(self)
+
+    monkeypatch.setattr(repo_mod._RepoFileIndex, "_walk", _counting_walk)
+
+    payload = repo_mod.run_repo_audit(
+        tmp_path, packs=("core", "security"), no_cache=True, cache_stats=True, jobs=4
+    )
+    assert walks["count"] == 1
+    files = payload["summary"]["cache"]["files"]
+    assert files["walks"] == 1
+    assert files["reads"] <= 2
+    assert files["hits"] >= 1
+
+
+def test_repo_file_index_prunes_git_and_bounds_content_cache(tmp_path: Path) -> None:
+    from sdetkit import repo as repo_mod
+
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref\n", encoding="utf-8")
+    (tmp_path / "a.txt").write_bytes(b"a" * 8)
+    (tmp_path / "b.txt").write_bytes(b"b" * 8)
+
+    index = repo_mod._RepoFileIndex(tmp_path, max_bytes=10)
+    assert index.files() == ("a.txt", "b.txt")
+    assert index.read_text("a.txt") == "a" * 8
+    assert index.read_bytes("a.txt") == b"a" * 8
+    assert index.read_bytes("b.txt") == b"b" * 8
+    stats = index.stats()
+    assert stats == {"walks": 1, "reads": 2, "hits": 1, "evictions": 1, "cached_bytes": 8}
+
+
+def test_repo_file_index_concurrent_readers_share_one_read(tmp_path: Path, monkeypatch) -> None:
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from sdetkit import repo as repo_mod
+
+    (tmp_path / "a.txt").write_bytes(b"payload")
+    index = repo_mod._RepoFileIndex(tmp_path)
+    started = threading.Event()
+    release = threading.Event()
+    original = Path.read_bytes
+
+    def _slow_read(self: Path) -> bytes:
+        started.set()
+        assert release.wait(5)
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", _slow_read)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        first = pool.submit(index.read_bytes, "a.txt")
+        assert started.wait(5)
+        others = [pool.submit(index.read_bytes, "a.txt") for _ in range(3)]
+        deadline = time.monotonic() + 5
+        while index.stats()["hits"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        results = [first.result(), *(f.result() for f in others)]
+
+    assert results == [b"payload"] * 4
+    assert index.stats()["reads"] == 1
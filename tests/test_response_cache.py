@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import http.server
+import json
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sdetkit import netclient
+from sdetkit.response_cache import CachedResponse, DiskResponseCache, cacheable_entry
+
+
+class _EtagHandler(http.server.BaseHTTPRequestHandler):
+    body = json.dumps({"version": 1}).encode("utf-8")
+    seen: list[tuple[str, str | None]] = []
+
+    def do_GET(self) -> None:
+        inm = self.headers.get("If-None-Match")
+        self.seen.append((self.path, inm))
+        if inm == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+@pytest.fixture()
+def etag_server() -> Iterator[str]:
+    _EtagHandler.seen = []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _EtagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_sync_client_revalidates_against_local_server(etag_server: str, tmp_path: Path) -> None:
+    cache = DiskResponseCache(tmp_path / "http-cache")
+    events: list[str] = []
+
+    def hook(ev: netclient.ClientEvent) -> None:
+        if ev.type.startswith("cache_"):
+            events.append(ev.type)
+
+    for _ in range(2):
+        with httpx.Client() as raw:
+            c = netclient.SdetHttpClient(raw, cache=cache, hook=hook)
+            assert c.get_json_dict(f"{etag_server}/repo") == {"version": 1}
+
+    assert events == ["cache_miss", "cache_hit"]
+    assert _EtagHandler.seen == [("/repo", None), ("/repo", '"v1"')]
+    assert cache.counters() == {"hits": 1, "misses": 1, "writes": 1, "evictions": 0}
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_serves_304_from_cache(tmp_path: Path) -> None:
+    cache = DiskResponseCache(tmp_path / "http-cache")
+    events: list[str] = []
+
+    async def hook(ev: netclient.ClientEvent) -> None:
+        events.append(ev.type)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-Modified-Since") == "Tue, 01 Sep 2026 00:00:00 GMT":
+            return httpx.Response(304, request=request)
+        return httpx.Response(
+            200,
+            json=[1, 2],
+            headers={"Last-Modified": "Tue, 01 Sep 2026 00:00:00 GMT"},
+            request=request,
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+        c = netclient.SdetAsyncHttpClient(raw, cache=cache, hook=hook)
+        assert await c.get_json_list("https://example.test/l") == [1, 2]
+        assert await c.get_json_list("https://example.test/l") == [1, 2]
+
+    assert [e for e in events if e.startswith("cache_")] == ["cache_miss", "cache_hit"]
+    cache.close()
+
+
+def test_disk_cache_evicts_least_recently_used_over_size_cap(tmp_path: Path) -> None:
+    entry = CachedResponse(200, (("ETag", '"x"'),), b"x" * 100, etag='"x"')
+    probe = DiskResponseCache(tmp_path / "probe")
+    probe.put("p", entry)
+    one = probe._connection().execute("SELECT size FROM responses").fetchone()[0]
+    probe.close()
+
+    cache = DiskResponseCache(tmp_path / "cache", max_bytes=one * 2)
+    cache.put("a", entry)
+    cache.put("b", entry)
+    assert cache.get("a") is not None
+    cache._connection().execute("UPDATE responses SET last_used = 0 WHERE key = 'b'")
+    cache.put("c", entry)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == entry
+    assert cache.counters()["evictions"] == 1
+    cache.close()
+
+
+def test_cacheable_entry_requires_validator_and_respects_no_store() -> None:
+    assert cacheable_entry(200, [("Content-Type", "text/plain")], b"x") is None
+    assert cacheable_entry(200, [("ETag", '"a"'), ("Cache-Control", "no-store")], b"x") is None
+    assert cacheable_entry(404, [("ETag", '"a"')], b"x") is None
+    entry = cacheable_entry(200, [("ETag", '"a"'), ("Content-Encoding", "gzip")], b"x")
+    assert entry is not None
+    assert entry.headers == (("ETag", '"a"'),)
+    assert entry.validators() == {"If-None-Match": '"a"'}
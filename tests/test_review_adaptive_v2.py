@@ -142,9 +142,62 @@ def test_adaptive_helper_failure_degrades_with_diagnostics(
         learn=True,
         db_path=tmp_path / "adaptive.db",
         evidence_dir=None,
+        helper_mode="subprocess",
     )
     assert out["confidence"] == "degraded"
     assert out["boost_summary"]["missing_signal"] == "boost unavailable"
     assert out["index_summary"]["missing_signal"] == "index unavailable"
     assert out["signals"]["helpers"]["boost"]["rc"] == 8
     assert out["signals"]["helpers"]["index"]["rc"] == 7
+    assert out["signals"]["helpers"]["boost"]["mode"] == "subprocess"
+
+
+def test_adaptive_helpers_run_in_process_without_spawning(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.py").write_text("print('ok')\n", encoding="utf-8")
+    monkeypatch.chdir(repo)
+
+    def _no_spawn(args):
+        raise AssertionError(f"in-process adaptive helpers must not spawn: {args}")
+
+    monkeypatch.setattr(review_mod, "_run_json_cmd", _no_spawn)
+    out = review_mod._build_adaptive_review_v2(
+        target=repo,
+        payload={"status": "attention", "top_matters": [], "five_heads": {"heads": {}}},
+        deep=True,
+        learn=True,
+        db_path=tmp_path / "adaptive.db",
+        evidence_dir=tmp_path / "evidence",
+    )
+    assert out["confidence"] == "normal"
+    assert out["memory_summary"]["run_count"] == 0
+    assert out["boost_summary"]["adaptive_memory"]["run_count"] == 1
+    assert out["index_summary"]["schema_version"] == "sdetkit.index.v1"
+    helpers = out["signals"]["helpers"]
+    assert {helpers[name]["mode"] for name in ("index", "boost", "history")} == {"in-process"}
+    assert helpers["boost"]["command"][:5] == ["python", "-m", "sdetkit", "boost", "scan"]
+    assert (tmp_path / "evidence" / "boost" / "boost-scan.json").exists()
+
+
+def test_adaptive_in_process_helper_failure_degrades_with_diagnostics(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def _boom(*args, **kwargs):
+        raise RuntimeError("boost failed")
+
+    monkeypatch.setattr(review_mod, "build_scan", _boom)
+    out = review_mod._build_adaptive_review_v2(
+        target=tmp_path,
+        payload={"status": "attention", "top_matters": [], "five_heads": {"heads": {}}},
+        deep=False,
+        learn=False,
+        db_path=tmp_path / "adaptive.db",
+        evidence_dir=None,
+    )
+    assert out["confidence"] == "degraded"
+    assert out["boost_summary"]["missing_signal"] == "boost unavailable"
+    assert out["signals"]["helpers"]["boost"]["rc"] == 1
+    assert out["signals"]["helpers"]["boost"]["stderr"] == "RuntimeError: boost failed"
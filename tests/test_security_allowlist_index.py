@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import random
+import time
+from typing import Any
+
+import pytest
+
+from sdetkit.gates import security_gate as sg
+
+
+def _linear_allowed(entries: list[dict[str, Any]], finding: sg.Finding) -> bool:
+    """Entry-by-entry match the indexed lookup must reproduce."""
+    for item in entries:
+        if str(item.get("rule_id", "")) != finding.rule_id:
+            continue
+        if str(item.get("path", "")) != finding.path:
+            continue
+        line = item.get("line")
+        if isinstance(line, int) and line != finding.line:
+            continue
+        fp = item.get("fingerprint")
+        if isinstance(fp, str) and fp and fp != finding.fingerprint:
+            continue
+        return True
+    return False
+
+
+_RULES = ("SEC_OS_SYSTEM", "SEC_DANGEROUS_EVAL", "SEC_WEAK_HASH")
+
+
+def _findings(rng: random.Random, count: int, files: int) -> list[sg.Finding]:
+    return [
+        sg.Finding(
+            rng.choice(_RULES),
+            "error",
+            f"src/m{rng.randrange(files)}.py",
+            rng.randint(1, 40),
+            0,
+            "m",
+            fingerprint=f"fp{rng.randrange(count * 2)}",
+        )
+        for _ in range(count)
+    ]
+
+
+def _entries(rng: random.Random, count: int, files: int) -> list[dict[str, Any]]:
+    entries: list[dict[str, Any]] = []
+    for _ in range(count):
+        item: dict[str, Any] = {
+            "rule_id": rng.choice(_RULES),
+            "path": f"src/m{rng.randrange(files)}.py",
+        }
+        roll = rng.random()
+        if roll < 0.5:
+            item["line"] = rng.choice([rng.randint(1, 40), None, "3", True])
+        if roll > 0.3:
+            item["fingerprint"] = rng.choice([f"fp{rng.randrange(count * 2)}", "", None, 7])
+        entries.append(item)
+    return entries
+
+
+def test_indexed_allowlist_matches_linear_scan() -> None:
+    rng = random.Random(25)
+    entries = _entries(rng, 400, 30)
+    index = sg._index_allowlist(entries)
+
+    findings = _findings(rng, 2000, 30)
+    expected = [_linear_allowed(entries, f) for f in findings]
+
+    assert any(expected) and not all(expected)
+    assert [sg._repo_allowed(index, f) for f in findings] == expected
+    assert [sg._repo_allowed(entries, f) for f in findings[:200]] == expected[:200]
+
+
+def test_allowlist_optional_fields_act_as_wildcards() -> None:
+    finding = sg.Finding("SEC_OS_SYSTEM", "error", "src/a.py", 5, 0, "m", fingerprint="abc")
+
+    def allowed(**extra: Any) -> bool:
+        entry = {"rule_id": "SEC_OS_SYSTEM", "path": "src/a.py", **extra}
+        return sg._repo_allowed(sg._index_allowlist([entry]), finding)
+
+    assert allowed()
+    assert allowed(line=5, fingerprint="abc")
+    assert allowed(line="7", fingerprint="")
+    assert not allowed(line=6)
+    assert not allowed(fingerprint="other")
+    assert not allowed(line=5, fingerprint="other")
+    assert not sg._repo_allowed(sg._index_allowlist([]), finding)
+
+
+@pytest.mark.benchmark
+def test_benchmark_allowlist_10k_findings_by_10k_entries() -> None:
+    rng = random.Random(10_000)
+    entries = _entries(rng, 10_000, 2_000)
+    findings = _findings(rng, 10_000, 2_000)
+
+    started = time.perf_counter()
+    index = sg._index_allowlist(entries)
+    indexed = [sg._repo_allowed(index, f) for f in findings]
+    indexed_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    linear = [_linear_allowed(entries, f) for f in findings]
+    linear_s = time.perf_counter() - started
+
+    print(f"allowlist 10k x 10k: indexed {indexed_s:.3f}s, linear {linear_s:.2f}s")
+    assert indexed == linear
+    assert indexed_s < linear_s
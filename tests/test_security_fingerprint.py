@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from sdetkit.gates import security_gate as sg
+
+_SOURCE = '''import os
+os.system("top")
+
+
+class Runner:
+    def run(self):
+        os.system("method")
+
+        def inner():
+            return eval("1")
+
+        return inner
+
+    async def later(self):
+        os.system("async")
+
+
+DOC = """
+def looks_like_a_def(
+"""
+os.system("after docstring")
+'''
+
+
+def _legacy_fingerprint(rule_id: str, path: str, line: int, message: str) -> str:
+    try:
+        lines = Path(path).read_text(encoding="utf-8", errors="replace").splitlines()
+    except Exception:
+        lines = []
+    line_text = ""
+    if 1 <= line <= len(lines):
+        line_text = lines[line - 1].strip()
+    scope = ""
+    if lines and 1 <= line <= len(lines):
+        for k in range(line - 2, -1, -1):
+            s = lines[k].lstrip()
+            if s.startswith("def ") or s.startswith("class "):
+                scope = s.split("(", 1)[0].split(":", 1)[0].strip()
+                break
+    raw = f"{rule_id}\n{path}\n{scope}\n{line_text}\n{message}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
+
+
+def test_fingerprints_match_legacy_file_reads(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "app.py").write_text(_SOURCE, encoding="utf-8")
+    (tmp_path / "requirements.txt").write_text("pyyaml==5.4.1\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    findings, _ = sg.run_security_scan(
+        tmp_path, allowlist_path=tmp_path / "none.json", online=False, sbom_output=None
+    )
+
+    assert len(findings) >= 6
+    for f in findings:
+        message = f.message
+        if f.rule_id == "SEC_DEP_VULN":
+            message = f"pyyaml==5.4.1|{sg.OFFLINE_VULN_RULES['pyyaml']['5.4']}"
+        assert f.fingerprint == _legacy_fingerprint(f.rule_id, f.path, f.line, message)
+
+
+def test_scan_fingerprints_do_not_depend_on_cwd_or_reread_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "repo"
+    root.mkdir()
+    (root / "app.py").write_text(_SOURCE, encoding="utf-8")
+    monkeypatch.chdir(root)
+    expected = sg.scan_repo(root, allowlist_path=root / "none.json")
+
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    reads: list[Path] = []
+    original = Path.read_text
+
+    def counting_read_text(self: Path, *args: object, **kwargs: object) -> str:
+        reads.append(self)
+        return original(self, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    assert sg.scan_repo(root, allowlist_path=root / "none.json") == expected
+    assert reads == []
+
+
+def test_scope_table_tracks_nearest_preceding_header() -> None:
+    lines = ["x = 1", "class A(Base):", "    def f(self):", "        pass", "  async def g():"]
+
+    assert sg._scope_table(lines) == ["", "", "class A", "def f", "def f", "def f"]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import sdetkit.cli as cli
+from sdetkit.gates import security_gate as sg
+
+
+def _scan(root: Path, *extra: str, capsys, cache_dir: str = ".sdetkit/cache") -> dict:
+    rc = cli.main(
+        ["security", "scan", "--root", str(root), "--format", "json", "--fail-on", "none"]
+        + ["--cache-stats", "--cache-dir", cache_dir, *extra]
+    )
+    assert rc == 0
+    return json.loads(capsys.readouterr().out)
+
+
+def _write_repo(root: Path) -> None:
+    src = root / "src"
+    src.mkdir()
+    (src / "a.py").write_text("import os\nos.system('a')\n", encoding="utf-8")
+    (src / "b.py").write_text("value = eval('1+1')\n", encoding="utf-8")
+
+
+def test_unchanged_files_reuse_cached_findings(tmp_path: Path, capsys) -> None:
+    _write_repo(tmp_path)
+
+    first = _scan(tmp_path, capsys=capsys)
+    assert (first["cache"]["hits"], first["cache"]["misses"]) == (0, 2)
+    assert (tmp_path / ".sdetkit" / "cache" / sg.SCAN_CACHE_FILE).is_file()
+
+    second = _scan(tmp_path, capsys=capsys)
+    assert (second["cache"]["hits"], second["cache"]["misses"]) == (2, 0)
+    assert second["findings"] == first["findings"]
+
+    (tmp_path / "src" / "b.py").write_text("value = 2\n", encoding="utf-8")
+    third = _scan(tmp_path, capsys=capsys)
+    assert (third["cache"]["hits"], third["cache"]["misses"]) == (1, 1)
+    assert {f["path"] for f in third["findings"]} == {"src/a.py"}
+
+    rc = cli.main(
+        ["security", "scan", "--root", str(tmp_path), "--format", "sarif", "--fail-on", "none"]
+        + ["--cache-stats", "--cache-dir", ".sdetkit/cache"]
+    )
+    assert rc == 0
+    sarif = json.loads(capsys.readouterr().out)
+    assert sarif["runs"][0]["properties"]["cache"]["hits"] == 2
+
+
+def test_allowlist_is_applied_to_cached_findings(tmp_path: Path, capsys) -> None:
+    _write_repo(tmp_path)
+    allowlist = tmp_path / "allow.json"
+    _scan(tmp_path, "--allowlist", str(allowlist), capsys=capsys)
+
+    allowlist.write_text(
+        json.dumps({"entries": [{"rule_id": "SEC_OS_SYSTEM", "path": "src/a.py"}]}),
+        encoding="utf-8",
+    )
+    payload = _scan(tmp_path, "--allowlist", str(allowlist), capsys=capsys)
+
+    assert payload["cache"]["hits"] == 2
+    assert {f["rule_id"] for f in payload["findings"]} == {"SEC_DANGEROUS_EVAL"}
+
+
+def test_ruleset_change_invalidates_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys
+) -> None:
+    _write_repo(tmp_path)
+    _scan(tmp_path, capsys=capsys)
+
+    monkeypatch.setattr(sg, "SCAN_ENGINE_VERSION", sg.SCAN_ENGINE_VERSION + 1)
+    payload = _scan(tmp_path, capsys=capsys)
+
+    assert (payload["cache"]["hits"], payload["cache"]["misses"]) == (0, 2)
+
+
+def test_no_cache_scans_from_scratch_without_writing(tmp_path: Path, capsys) -> None:
+    _write_repo(tmp_path)
+
+    payload = _scan(tmp_path, "--no-cache", capsys=capsys)
+
+    assert "cache" not in payload
+    assert len(payload["findings"]) == 2
+    assert not (tmp_path / ".sdetkit").exists()
+
+
+def test_cache_is_off_unless_a_cache_dir_is_given(tmp_path: Path, capsys) -> None:
+    _write_repo(tmp_path)
+
+    rc = cli.main(
+        ["security", "scan", "--root", str(tmp_path), "--format", "json", "--fail-on", "none"]
+        + ["--cache-stats"]
+    )
+
+    assert rc == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert "cache" not in payload
+    assert len(payload["findings"]) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["src"]
+
+
+def test_cache_file_outside_skip_dirs_is_not_scanned(tmp_path: Path, capsys) -> None:
+    _write_repo(tmp_path)
+
+    first = _scan(tmp_path, capsys=capsys, cache_dir="scan-cache")
+    second = _scan(tmp_path, capsys=capsys, cache_dir="scan-cache")
+
+    assert (tmp_path / "scan-cache" / sg.SCAN_CACHE_FILE).is_file()
+    assert (second["cache"]["hits"], second["cache"]["misses"]) == (2, 0)
+    assert second["findings"] == first["findings"]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import sdetkit.cli as cli
+from sdetkit.gates import security_gate as sg
+
+_TEMPLATES = (
+    "import os\nos.system('run {i}')\n",
+    "import hashlib\n\n\ndef digest_{i}(data):\n    return hashlib.md5(data).hexdigest()\n",
+    "API_KEY = 'k{i:04d}abcdefgh'\nvalue = eval('{i}')\n",
+    "def ok_{i}(x):\n    return x + {i}\n",
+    '# notes {i}\ntoken = "Zx9Qw2Er7Ty4Ui1Op3As5Df{i}"\n',
+)
+
+
+def _generate_tree(root: Path, count: int) -> None:
+    for i in range(count):
+        pkg = root / "src" / f"pkg{i % 50:02d}"
+        pkg.mkdir(parents=True, exist_ok=True)
+        suffix = ".py" if i % 7 else ".md"
+        (pkg / f"m{i:05d}{suffix}").write_text(
+            _TEMPLATES[i % len(_TEMPLATES)].format(i=i), encoding="utf-8"
+        )
+
+
+def test_parallel_scan_matches_serial_scan(tmp_path: Path) -> None:
+    _generate_tree(tmp_path, 120)
+
+    serial = sg.scan_repo(tmp_path, allowlist_path=tmp_path / "none.json")
+    parallel = sg.scan_repo(tmp_path, allowlist_path=tmp_path / "none.json", jobs=3)
+
+    assert serial
+    assert parallel == serial
+
+
+def test_parallel_scan_fills_cache_for_next_run(tmp_path: Path) -> None:
+    _generate_tree(tmp_path, 30)
+    cache_path = tmp_path / ".sdetkit" / "cache.json"
+
+    first_cache = sg.SecurityScanCache(cache_path)
+    first = sg.scan_repo(tmp_path, cache=first_cache, jobs=2)
+    second_cache = sg.SecurityScanCache(cache_path)
+    second = sg.scan_repo(tmp_path, cache=second_cache, jobs=2)
+
+    assert (first_cache.misses, second_cache.hits, second_cache.misses) == (30, 30, 0)
+    assert second == first
+
+
+def test_balanced_chunks_spread_file_size() -> None:
+    items = [(f"f{i}", size, None) for i, size in enumerate([90, 10, 50, 50, 40, 60])]
+
+    chunks = sg._balanced_chunks(items, 3)
+
+    assert sorted(item[0] for chunk in chunks for item in chunk) == sorted(i[0] for i in items)
+    assert sorted(sum(item[1] for item in chunk) for chunk in chunks) == [100, 100, 100]
+    assert sg._balanced_chunks(items[:1], 8) == [items[:1]]
+
+
+def test_scan_chunk_returns_lines_only_for_files_with_findings(tmp_path: Path) -> None:
+    (tmp_path / "clean.py").write_text("def ok(x):\n    return x\n", encoding="utf-8")
+    (tmp_path / "dirty.py").write_text("import os\nos.system('x')\n", encoding="utf-8")
+    (tmp_path / "binary.dat").write_bytes(b"\xff\xfe\x00")
+    chunk = [("clean.py", 0, None), ("dirty.py", 0, None), ("binary.dat", 0, None)]
+
+    results = {rel: rest for rel, *rest in sg._scan_chunk(str(tmp_path), True, chunk)}
+
+    assert sorted(results) == ["clean.py", "dirty.py"]
+    _, clean_findings, clean_lines = results["clean.py"]
+    assert clean_findings == [] and clean_lines is None
+    digest, dirty_findings, dirty_lines = results["dirty.py"]
+    assert dirty_findings and dirty_lines == ["import os", "os.system('x')"]
+
+    cached = sg._scan_chunk(str(tmp_path), True, [("dirty.py", 0, (digest, True))])
+    assert cached == [("dirty.py", digest, None, ["import os", "os.system('x')"])]
+
+
+def test_security_scan_jobs_option(tmp_path: Path, capsys) -> None:
+    _generate_tree(tmp_path, 20)
+    args = ["security", "scan", "--root", str(tmp_path), "--format", "json", "--no-cache"]
+
+    assert cli.main([*args, "--fail-on", "none"]) == 0
+    serial = capsys.readouterr().out
+    assert cli.main([*args, "--fail-on", "none", "--jobs", "4"]) == 0
+    assert capsys.readouterr().out == serial
+    assert json.loads(serial)["findings"]
+
+    assert cli.main([*args, "--jobs", "0"]) == 2
+    assert "jobs must be >= 1" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        sg.main(["fix", "--root", str(tmp_path), "--jobs", "2"])
+    assert "unrecognized arguments: --jobs" in capsys.readouterr().err
+
+
+@pytest.mark.benchmark
+def test_benchmark_parallel_scan_20k_files(tmp_path: Path) -> None:
+    _generate_tree(tmp_path, 20_000)
+    allowlist = tmp_path / "none.json"
+    timings: dict[int, float] = {}
+    results: dict[int, list[sg.Finding]] = {}
+    for jobs in (1, 4, 8):
+        started = time.perf_counter()
+        results[jobs] = sg.scan_repo(tmp_path, allowlist_path=allowlist, jobs=jobs)
+        timings[jobs] = time.perf_counter() - started
+
+    print("security scan 20k files: " + ", ".join(f"jobs={j} {t:.2f}s" for j, t in timings.items()))
+    assert results[4] == results[1]
+    assert results[8] == results[1]
+    if (os.cpu_count() or 1) >= 4:
+        assert timings[4] < timings[1]
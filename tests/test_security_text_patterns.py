@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import math
+import random
+import re
+import time
+
+import pytest
+
+from sdetkit.gates import security_gate as sg
+
+
+def _reference_scan(rel_path: str, text: str) -> list[sg.Finding]:
+    """Line-by-line scan the combined matcher must reproduce exactly."""
+    findings: list[sg.Finding] = []
+    for i, line in enumerate(text.splitlines(), start=1):
+        for rule_id, pattern, msg in sg.SECRET_PATTERNS:
+            if pattern.search(line) and not sg._is_test_fixture_secret(rel_path, line):
+                findings.append(
+                    sg.Finding(rule_id, sg.RULES[rule_id].severity, rel_path, i, 0, msg)
+                )
+        for match in re.finditer(r"['\"]([A-Za-z0-9+/=_\-]{20,})['\"]", line):
+            token = match.group(1)
+            if (
+                sg._looks_like_path(token)
+                or sg._looks_like_slug(token)
+                or sg._looks_like_snake_identifier(token)
+                or sg._looks_like_uuid(token)
+                or sg._looks_like_hex_digest(token)
+                or sg._looks_like_boolean_assignment(token)
+            ):
+                continue
+            counts: dict[str, int] = {}
+            for ch in token:
+                counts[ch] = counts.get(ch, 0) + 1
+            entropy = -sum((v / len(token)) * math.log2(v / len(token)) for v in counts.values())
+            if entropy >= 4.0 and not token.isdigit():
+                findings.append(
+                    sg.Finding(
+                        "SEC_HIGH_ENTROPY_STRING",
+                        "warn",
+                        rel_path,
+                        i,
+                        match.start(1),
+                        "High-entropy string literal detected.",
+                    )
+                )
+    return findings
+
+
+_SNIPPETS = [
+    "token = AKIA1234567890ABCDEFGH",
+    "password=\nabcdefgh12345 ghp_abcdefghijklmnopqrstuvwxyz",
+    "API_KEY: 'abcd1234efgh' and secret = 'zzzzzzzzzz'",
+    "-----BEGIN RSA KEY-----",
+    "x = 'Zx9Qw2Er7Ty4Ui1Op3As5Df' + \"Qm8Nb6Vc4Xz2Lk0Jh9Gf\"",
+    "path = 'docs/artifacts/some/long/path/file.json'",
+    "digest = 'a3f5c9e1b7d2468013579bdf2468ace0'",
+    "feature\x0ctoken: abcdefghij\x0bAKIAABCDEFGHIJKLMNOP",
+    "nothing to see here",
+    "password = 'example-fixture-value'",
+    "na\u00efve \u017fecret = abcdefghijk",
+    "\u0130 pASSWORD: abcdefghij \u212aey",
+    "",
+]
+
+
+def _corpus(seed: int, lines: int) -> str:
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+/=_-"
+    out: list[str] = []
+    for _ in range(lines):
+        roll = rng.random()
+        if roll < 0.15:
+            out.append(rng.choice(_SNIPPETS))
+        elif roll < 0.3:
+            token = "".join(rng.choice(alphabet) for _ in range(rng.randint(18, 40)))
+            quote = rng.choice(["'", '"'])
+            out.append(f"value = {quote}{token}{quote}")
+        else:
+            out.append(f"    result_{rng.randint(0, 999)} = compute(item, {rng.randint(1, 9)})")
+    return "\n".join(out) + "\n"
+
+
+@pytest.mark.parametrize("rel_path", ["src/app.py", "tests/test_app.py"])
+def test_combined_matcher_matches_line_by_line_scan(rel_path: str) -> None:
+    for seed in range(5):
+        text = _corpus(seed, 400)
+        assert sg._scan_text_patterns(rel_path, text) == _reference_scan(rel_path, text)
+    snippets = "\n".join(_SNIPPETS)
+    assert sg._scan_text_patterns(rel_path, snippets) == _reference_scan(rel_path, snippets)
+
+
+def test_overlapping_patterns_on_one_line_are_all_reported() -> None:
+    findings = sg._scan_text_patterns("src/a.py", "token = AKIA1234567890ABCDEFGH\n")
+
+    assert [f.message for f in findings] == [
+        "Potential AWS access key",
+        "Potential hardcoded credential",
+    ]
+
+
+def test_entropy_kernel() -> None:
+    assert sg._entropy("") == 0.0
+    assert sg._entropy("aaaa") == 0.0
+    assert sg._entropy("0123456789abcdef") == 4.0
+
+
+@pytest.mark.benchmark
+def test_benchmark_text_pattern_throughput() -> None:
+    text = _corpus(2024, 200_000)
+    size_mb = len(text.encode("utf-8")) / 1_000_000
+    timings = {}
+    for name, scan in (("combined", sg._scan_text_patterns), ("per-line", _reference_scan)):
+        started = time.perf_counter()
+        scan("src/corpus.py", text)
+        timings[name] = time.perf_counter() - started
+
+    print(
+        f"text-pattern corpus {size_mb:.1f} MB: "
+        + ", ".join(f"{name} {size_mb / t:.1f} MB/s" for name, t in timings.items())
+    )
+    assert timings["combined"] < timings["per-line"]
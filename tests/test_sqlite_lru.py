@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from sdetkit.sqlite_lru import SqliteLruTable
+
+
+def test_table_keeps_most_recently_used_entries_under_entry_cap(tmp_path: Path) -> None:
+    table = SqliteLruTable(
+        tmp_path / "t.sqlite3", "items", (("value", "TEXT NOT NULL"),), max_entries=2
+    )
+    assert table.put("a", {"value": "1"}, 1) == 0
+    assert table.put("b", {"value": "2"}, 1) == 0
+    table.connection().execute("UPDATE items SET last_used = 0 WHERE key = 'b'")
+    assert table.get("a") == ("1",)
+
+    assert table.put("c", {"value": "3"}, 1) == 1
+    assert table.get("b") is None
+    assert table.get("a") == ("1",)
+    assert table.get("c") == ("3",)
+    table.close()
+
+
+def test_get_treats_expired_entry_as_miss_without_a_prior_write(tmp_path: Path) -> None:
+    path = tmp_path / "t.sqlite3"
+    writer = SqliteLruTable(path, "items", (("value", "TEXT NOT NULL"),))
+    writer.put("old", {"value": "1"}, 1)
+    writer.put("fresh", {"value": "2"}, 1)
+    writer.connection().execute("UPDATE items SET created_at = 0 WHERE key = 'old'")
+    writer.connection().commit()
+    writer.close()
+
+    table = SqliteLruTable(path, "items", (("value", "TEXT NOT NULL"),), max_age_seconds=60)
+    assert table.get("old") is None
+    assert table.get("fresh") == ("2",)
+    remaining = table.connection().execute("SELECT key FROM items ORDER BY key").fetchall()
+    assert remaining == [("fresh",)]
+    table.close()
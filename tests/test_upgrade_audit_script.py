@@ -3,7 +3,9 @@ from __future__ import annotations
 import json
 import subprocess
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from sdetkit import upgrade_audit
 
@@ -45,6 +47,21 @@ def _report(**overrides: object) -> upgrade_audit.PackageReport:
     return upgrade_audit.PackageReport(**payload)
 
 
+def _fresh(fake: Callable[..., tuple[str, str | None, str | None, str | None, str]]):
+    """Adapt a fake returning release fields to ``_latest_pypi_metadata`` (no ETag)."""
+
+    def fetch(package: str, timeout_s: float, **kwargs: Any):
+        fields = fake(
+            package,
+            timeout_s,
+            project_python_requires=kwargs["project_python_requires"],
+            include_prereleases=kwargs["include_prereleases"],
+        )
+        return fields, None, "simple"
+
+    return fetch
+
+
 def test_load_dependencies_collects_pyproject_and_requirements(tmp_path: Path) -> None:
     pyproject = tmp_path / "pyproject.toml"
     pyproject.write_text(
@@ -465,12 +482,14 @@ dependencies = ["httpx>=0.27,<1"]
     monkeypatch.setattr(
         upgrade_audit,
         "_latest_pypi_metadata",
-        lambda package, timeout_s, project_python_requires=None, include_prereleases=False: (
-            "0.29.0",
-            "2026-01-01T00:00:00Z",
-            "0.29.0",
-            "2026-01-01T00:00:00Z",
-            "compatible-latest",
+        _fresh(
+            lambda package, timeout_s, project_python_requires=None, include_prereleases=False: (
+                "0.29.0",
+                "2026-01-01T00:00:00Z",
+                "0.29.0",
+                "2026-01-01T00:00:00Z",
+                "compatible-latest",
+            )
         ),
     )
 
@@ -527,12 +546,14 @@ dependencies = ["httpx>=0.27,<1"]
     monkeypatch.setattr(
         upgrade_audit,
         "_latest_pypi_metadata",
-        lambda package, timeout_s, project_python_requires=None, include_prereleases=False: (
-            "1.0.0",
-            "2026-01-01T00:00:00Z",
-            "1.0.0",
-            "2026-01-01T00:00:00Z",
-            "compatible-latest",
+        _fresh(
+            lambda package, timeout_s, project_python_requires=None, include_prereleases=False: (
+                "1.0.0",
+                "2026-01-01T00:00:00Z",
+                "1.0.0",
+                "2026-01-01T00:00:00Z",
+                "compatible-latest",
+            )
         ),
     )
 
@@ -806,7 +827,7 @@ dependencies = ["httpx>=0.27,<1", "ruff==0.15.6"]
             "compatible-latest",
         )
 
-    monkeypatch.setattr(upgrade_audit, "_latest_pypi_metadata", _fake_metadata)
+    monkeypatch.setattr(upgrade_audit, "_latest_pypi_metadata", _fresh(_fake_metadata))
 
     rc = upgrade_audit.run(
         pyproject,
@@ -1109,7 +1130,7 @@ dependencies = ["httpx==0.28.1", "ruff==0.15.6"]
             "compatible-latest",
         )
 
-    monkeypatch.setattr(upgrade_audit, "_latest_pypi_metadata", _fake_metadata)
+    monkeypatch.setattr(upgrade_audit, "_latest_pypi_metadata", _fresh(_fake_metadata))
 
     rc = upgrade_audit.run(
         pyproject,